@@ -6,6 +6,7 @@ Usage:
     python scripts/analyze.py AAPL --earnings-date 2025-01-31 --expiration 2025-02-01
 """
 
+import atexit
 import sys
 import argparse
 import logging
@@ -94,6 +95,7 @@ Notes:
 
         # Create container
         container = Container(config)
+        atexit.register(container.close)  # return shared rate limit leases
 
         # Use the analyzer service
         analyzer = container.analyzer
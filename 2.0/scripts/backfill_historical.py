@@ -14,25 +14,42 @@ Usage:
     python scripts/backfill_historical.py MU ORCL AVGO
     python scripts/backfill_historical.py --file tickers.txt --start-date 2025-01-01
     python scripts/backfill_historical.py ARM COHR LITE --discover --start-date 2023-01-01
+    python scripts/backfill_historical.py --file tickers.txt --start-date 2025-01-01 --resume
+
+Each finished ticker is checkpointed in the scan_checkpoints table; --resume
+skips tickers an interrupted run with the same date range already finished.
 """
 
 import sys
 import os
 import argparse
+import json
 import logging
-import sqlite3
 import time
-import requests
 from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import List, Optional, Dict, Tuple
-from dataclasses import dataclass
-from enum import Enum
+from typing import List, Optional, Dict
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from dotenv import load_dotenv
+from src.application.services.earnings_backfill import (  # noqa: F401 (re-exported)
+    DailyPrice,
+    EarningsEvent,
+    EarningsMove,
+    EarningsTiming,
+    calculate_earnings_move,
+    discover_earnings_from_yahoo,
+    get_db_earnings,
+    get_twelve_data_prices,
+    load_events,
+    save_moves,
+)
+from src.infrastructure.database.migrations import MigrationManager
+from src.infrastructure.database.repositories.scan_checkpoint_repository import (
+    ScanCheckpointRepository,
+)
 from src.utils.logging import setup_logging
 
 # Load .env from project root (2.0/)
@@ -46,474 +63,8 @@ TWELVE_DATA_KEY = os.environ.get("TWELVE_DATA_KEY", "")
 # Rate limiting (Twelve Data free tier: 8/min, 800/day)
 TWELVE_DATA_CALLS_PER_MINUTE = 8
 
-
-class EarningsTiming(Enum):
-    BMO = "bmo"  # Before Market Open
-    AMC = "amc"  # After Market Close
-    UNKNOWN = ""
-
-
-@dataclass
-class EarningsEvent:
-    """Earnings event with timing information."""
-    ticker: str
-    date: date
-    timing: EarningsTiming
-    eps_actual: Optional[float] = None
-    eps_estimate: Optional[float] = None
-
-
-@dataclass
-class DailyPrice:
-    """Daily OHLCV price data."""
-    date: date
-    open: float
-    high: float
-    low: float
-    close: float
-    volume: int
-
-
-@dataclass
-class EarningsMove:
-    """Calculated earnings move."""
-    ticker: str
-    earnings_date: date
-    timing: EarningsTiming
-    prev_close: float
-    reaction_open: float
-    reaction_high: float
-    reaction_low: float
-    reaction_close: float
-    gap_move_pct: float
-    intraday_move_pct: float
-    close_move_pct: float
-    volume_before: int
-    volume_reaction: int
-
-
-def get_db_earnings(
-    ticker: str,
-    db_path: Path,
-    start_date: Optional[date] = None,
-    end_date: Optional[date] = None,
-) -> List[EarningsEvent]:
-    """
-    Get earnings dates with timing from existing database.
-
-    Args:
-        ticker: Stock symbol
-        db_path: Path to database
-        start_date: Optional start date filter
-        end_date: Optional end date filter
-
-    Returns:
-        List of EarningsEvent with timing info
-    """
-    try:
-        conn = sqlite3.connect(str(db_path), timeout=30.0)
-        cursor = conn.cursor()
-
-        query = """
-            SELECT ticker, earnings_date, timing
-            FROM earnings_calendar
-            WHERE ticker = ?
-        """
-        params = [ticker]
-
-        if start_date:
-            query += " AND earnings_date >= ?"
-            params.append(str(start_date))
-        if end_date:
-            query += " AND earnings_date <= ?"
-            params.append(str(end_date))
-
-        query += " ORDER BY earnings_date"
-
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-        conn.close()
-
-        events = []
-        for row in rows:
-            _, date_str, timing_str = row
-            event_date = date.fromisoformat(date_str)
-
-            # Parse timing
-            timing_str = (timing_str or "").lower()
-            if timing_str == "bmo":
-                timing = EarningsTiming.BMO
-            elif timing_str == "amc":
-                timing = EarningsTiming.AMC
-            else:
-                timing = EarningsTiming.UNKNOWN
-
-            events.append(EarningsEvent(
-                ticker=ticker,
-                date=event_date,
-                timing=timing,
-            ))
-
-        return events
-
-    except Exception as e:
-        logger.error(f"Error reading earnings from DB: {e}")
-        return []
-
-
-def discover_earnings_from_yahoo(
-    ticker: str,
-    db_path: Path,
-    start_date: Optional[date] = None,
-) -> int:
-    """
-    Discover historical earnings dates from Yahoo Finance and insert into earnings_calendar.
-
-    Yahoo Finance's earnings_dates DataFrame includes historical earnings with timestamps
-    that indicate BMO vs AMC timing. Dates with Reported EPS (not NaN) are confirmed past events.
-
-    Args:
-        ticker: Stock symbol
-        db_path: Path to database
-        start_date: Only insert dates on or after this date
-
-    Returns:
-        Number of new dates inserted
-    """
-    try:
-        import yfinance as yf
-    except ImportError:
-        logger.error("yfinance not installed - run: pip install yfinance")
-        return 0
-
-    try:
-        t = yf.Ticker(ticker)
-        ed = t.earnings_dates
-
-        if ed is None or ed.empty:
-            logger.warning(f"  No Yahoo Finance earnings_dates for {ticker}")
-            return 0
-
-        conn = sqlite3.connect(str(db_path), timeout=30.0)
-        cursor = conn.cursor()
-
-        import math
-
-        inserted = 0
-        for idx, row in ed.iterrows():
-            # Skip future/unconfirmed dates (no Reported EPS)
-            reported_eps = row.get("Reported EPS")
-            if reported_eps is None:
-                continue
-            try:
-                if math.isnan(reported_eps):
-                    continue
-            except (TypeError, ValueError):
-                continue
-
-            # Parse date from timezone-aware index
-            earnings_dt = idx.to_pydatetime()
-            earnings_d = earnings_dt.date()
-
-            # Apply start_date filter
-            if start_date and earnings_d < start_date:
-                continue
-
-            # Determine timing from hour
-            hour = earnings_dt.hour
-            if hour < 10:  # Before 10 AM = BMO
-                timing = "BMO"
-            elif hour >= 16:  # 4 PM or later = AMC
-                timing = "AMC"
-            else:
-                timing = ""  # UNKNOWN
-
-            # Insert if not already present
-            cursor.execute(
-                "SELECT 1 FROM earnings_calendar WHERE ticker = ? AND earnings_date = ?",
-                (ticker, str(earnings_d)),
-            )
-            if cursor.fetchone() is None:
-                cursor.execute(
-                    """INSERT INTO earnings_calendar (ticker, earnings_date, timing, confirmed)
-                       VALUES (?, ?, ?, 1)""",
-                    (ticker, str(earnings_d), timing),
-                )
-                inserted += 1
-                logger.info(f"  📅 Discovered: {earnings_d} {timing or 'UNKNOWN'}")
-
-        conn.commit()
-        conn.close()
-
-        if inserted > 0:
-            logger.info(f"  ✓ Yahoo Finance: discovered {inserted} new earnings dates for {ticker}")
-        else:
-            logger.info(f"  Yahoo Finance: no new dates to add for {ticker}")
-
-        return inserted
-
-    except Exception as e:
-        logger.error(f"  Yahoo Finance discovery error for {ticker}: {e}")
-        return 0
-
-
-def get_twelve_data_prices(
-    ticker: str,
-    start_date: Optional[date] = None,
-    end_date: Optional[date] = None,
-) -> List[DailyPrice]:
-    """
-    Get historical daily prices from Twelve Data.
-
-    Args:
-        ticker: Stock symbol
-        start_date: Start date for data
-        end_date: End date for data
-
-    Returns:
-        List of DailyPrice sorted by date descending
-    """
-    if not TWELVE_DATA_KEY:
-        logger.error("TWELVE_DATA_KEY not set")
-        return []
-
-    try:
-        url = "https://api.twelvedata.com/time_series"
-        params = {
-            "symbol": ticker,
-            "interval": "1day",
-            "apikey": TWELVE_DATA_KEY,
-            "outputsize": 5000,  # Max available
-        }
-
-        if start_date:
-            params["start_date"] = start_date.isoformat()
-        if end_date:
-            params["end_date"] = end_date.isoformat()
-
-        response = requests.get(url, params=params, timeout=30)
-        response.raise_for_status()
-
-        data = response.json()
-
-        # Check for errors
-        if data.get("status") == "error":
-            logger.error(f"Twelve Data error: {data.get('message', 'Unknown error')}")
-            return []
-
-        values = data.get("values", [])
-        if not values:
-            logger.warning(f"No price data for {ticker}")
-            return []
-
-        prices = []
-        for v in values:
-            try:
-                prices.append(DailyPrice(
-                    date=date.fromisoformat(v["datetime"]),
-                    open=float(v["open"]),
-                    high=float(v["high"]),
-                    low=float(v["low"]),
-                    close=float(v["close"]),
-                    volume=int(v["volume"]),
-                ))
-            except (KeyError, ValueError) as ex:
-                logger.debug(f"Skipping malformed price: {ex}")
-                continue
-
-        # Sort by date descending
-        prices.sort(key=lambda x: x.date, reverse=True)
-        return prices
-
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Twelve Data API error: {e}")
-        return []
-
-
-def calculate_earnings_move(
-    event: EarningsEvent,
-    prices: List[DailyPrice],
-) -> Optional[EarningsMove]:
-    """
-    Calculate earnings move with correct BMO/AMC handling.
-
-    BMO (Before Market Open):
-        - Earnings announced before market opens
-        - Stock reacts on earnings day
-        - Move = prev_day close -> earnings_day open
-
-    AMC (After Market Close):
-        - Earnings announced after market closes
-        - Stock reacts NEXT day
-        - Move = earnings_day close -> next_day open
-
-    UNKNOWN:
-        - Infer from price action by comparing gap magnitudes
-        - If next-day gap > same-day gap, likely AMC
-    """
-    # Build price lookup by date
-    price_map: Dict[date, DailyPrice] = {p.date: p for p in prices}
-    today = date.today()
-
-    earnings_date = event.date
-
-    # Safety check: Don't process same-day AMC or UNKNOWN earnings
-    # The reaction day hasn't happened yet (or is incomplete intraday)
-    if earnings_date >= today:
-        if event.timing == EarningsTiming.AMC:
-            logger.warning(f"  ⏳ Skipping {earnings_date} - AMC earnings, reaction day not complete")
-            return None
-        elif event.timing == EarningsTiming.UNKNOWN:
-            logger.warning(f"  ⏳ Skipping {earnings_date} - UNKNOWN timing, wait for reaction day")
-            return None
-        # BMO on today is OK if market has closed, but we'll let it proceed
-        # and fail naturally if next-day data isn't available
-
-    # Find trading days around earnings
-    sorted_dates = sorted(price_map.keys())
-
-    # Find earnings day index
-    if earnings_date not in price_map:
-        # Find closest trading day
-        closest = min(sorted_dates, key=lambda d: abs((d - earnings_date).days))
-        if abs((closest - earnings_date).days) > 3:
-            logger.warning(f"  No price data near {earnings_date}")
-            return None
-        earnings_date = closest
-        logger.debug(f"  Adjusted earnings date to {earnings_date}")
-
-    earnings_idx = sorted_dates.index(earnings_date)
-
-    # Get prev day (for BMO) or earnings day close (for AMC)
-    if earnings_idx == 0:
-        logger.warning(f"  No previous day data for {earnings_date}")
-        return None
-
-    prev_date = sorted_dates[earnings_idx - 1]
-    prev_price = price_map[prev_date]
-    earnings_price = price_map[earnings_date]
-
-    # Determine reaction day based on timing
-    effective_timing = event.timing
-
-    # For UNKNOWN timing, infer from price action
-    if event.timing == EarningsTiming.UNKNOWN and earnings_idx < len(sorted_dates) - 1:
-        next_date = sorted_dates[earnings_idx + 1]
-        next_price = price_map[next_date]
-
-        # Calculate gap magnitude for both scenarios
-        # BMO scenario: prev_close -> earnings_open
-        bmo_gap = abs((earnings_price.open - prev_price.close) / prev_price.close * 100) if prev_price.close else 0
-        # AMC scenario: earnings_close -> next_open
-        amc_gap = abs((next_price.open - earnings_price.close) / earnings_price.close * 100) if earnings_price.close else 0
-
-        # If next-day gap is significantly larger (>2x), likely AMC
-        # Also if next-day gap > 3% and same-day gap < 1%, likely AMC
-        if amc_gap > bmo_gap * 2 or (amc_gap > 3.0 and bmo_gap < 1.0):
-            effective_timing = EarningsTiming.AMC
-            logger.info(f"  📊 Inferred AMC timing: same-day gap {bmo_gap:.1f}% vs next-day gap {amc_gap:.1f}%")
-        else:
-            effective_timing = EarningsTiming.BMO
-            logger.debug(f"  📊 Inferred BMO timing: same-day gap {bmo_gap:.1f}% vs next-day gap {amc_gap:.1f}%")
-
-    if effective_timing == EarningsTiming.AMC:
-        # AMC: reaction is next trading day
-        if earnings_idx >= len(sorted_dates) - 1:
-            logger.warning(f"  No next day data for AMC earnings {earnings_date}")
-            return None
-
-        next_date = sorted_dates[earnings_idx + 1]
-        reaction_price = price_map[next_date]
-
-        # For AMC: prev_close is earnings_day close, reaction is next_day
-        reference_close = earnings_price.close
-        volume_before = earnings_price.volume
-
-        logger.debug(f"  AMC: {earnings_date} close ${reference_close:.2f} -> {next_date} open ${reaction_price.open:.2f}")
-
-    else:
-        # BMO: reaction is earnings day
-        reaction_price = earnings_price
-
-        # For BMO: prev_close is prev_day close
-        reference_close = prev_price.close
-        volume_before = prev_price.volume
-
-        logger.debug(f"  BMO: {prev_date} close ${reference_close:.2f} -> {earnings_date} open ${reaction_price.open:.2f}")
-
-    # Calculate moves
-    if reference_close == 0:
-        logger.warning(f"  Reference close is zero")
-        return None
-
-    # Gap move: reference close -> reaction open (preserves sign)
-    gap_move_pct = (reaction_price.open - reference_close) / reference_close * 100
-
-    # Intraday move: high-low range as % (always positive)
-    intraday_move_pct = abs((reaction_price.high - reaction_price.low) / reference_close * 100)
-
-    # Close move: reference close -> reaction close (preserves sign)
-    close_move_pct = (reaction_price.close - reference_close) / reference_close * 100
-
-    return EarningsMove(
-        ticker=event.ticker,
-        earnings_date=event.date,  # Original earnings date
-        timing=effective_timing,  # Use inferred timing if UNKNOWN was resolved
-        prev_close=reference_close,
-        reaction_open=reaction_price.open,
-        reaction_high=reaction_price.high,
-        reaction_low=reaction_price.low,
-        reaction_close=reaction_price.close,
-        gap_move_pct=gap_move_pct,
-        intraday_move_pct=intraday_move_pct,
-        close_move_pct=close_move_pct,
-        volume_before=volume_before,
-        volume_reaction=reaction_price.volume,
-    )
-
-
-def save_to_database(db_path: Path, move: EarningsMove) -> bool:
-    """Save earnings move to database."""
-    try:
-        conn = sqlite3.connect(str(db_path), timeout=30.0)
-        cursor = conn.cursor()
-
-        # Update earnings_calendar with timing
-        cursor.execute('''
-            INSERT OR REPLACE INTO earnings_calendar
-            (ticker, earnings_date, timing, confirmed)
-            VALUES (?, ?, ?, 1)
-        ''', (move.ticker, str(move.earnings_date), move.timing.name))
-
-        # Update historical_moves
-        cursor.execute('''
-            INSERT OR REPLACE INTO historical_moves
-            (ticker, earnings_date, prev_close, earnings_open, earnings_high,
-             earnings_low, earnings_close, intraday_move_pct, gap_move_pct,
-             close_move_pct, volume_before, volume_earnings)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            move.ticker,
-            str(move.earnings_date),
-            move.prev_close,
-            move.reaction_open,
-            move.reaction_high,
-            move.reaction_low,
-            move.reaction_close,
-            move.intraday_move_pct,
-            move.gap_move_pct,
-            move.close_move_pct,
-            move.volume_before,
-            move.volume_reaction,
-        ))
-
-        conn.commit()
-        conn.close()
-        return True
-
-    except Exception as e:
-        logger.error(f"  Database error: {e}")
-        return False
+# --resume skips tickers backfilled this recently (history does not change intraday)
+CHECKPOINT_FRESHNESS_HOURS = 24
 
 
 def backfill_ticker(
@@ -540,17 +91,9 @@ def backfill_ticker(
     logger.info(f"Backfilling {ticker}")
     logger.info(f"{'=' * 60}")
 
-    # Step 1: Get earnings dates with timing from database
+    # Step 1: Get earnings dates with timing from database (Yahoo Finance fallback)
     logger.info(f"📅 Fetching earnings dates from database...")
-    events = get_db_earnings(ticker, db_path, start_date, end_date)
-
-    # Auto-discover from Yahoo Finance when insufficient data or forced
-    if force_discover or len(events) < 4:
-        reason = "forced" if force_discover else f"only {len(events)} events in DB"
-        logger.info(f"🔍 Discovering earnings from Yahoo Finance ({reason})...")
-        discovered = discover_earnings_from_yahoo(ticker, db_path, start_date)
-        if discovered > 0:
-            events = get_db_earnings(ticker, db_path, start_date, end_date)
+    events = load_events(ticker, db_path, start_date, end_date, force_discover)
 
     if not events:
         logger.warning(f"No earnings found for {ticker} in database or Yahoo Finance")
@@ -579,8 +122,8 @@ def backfill_ticker(
 
     logger.info(f"✓ Fetched {len(prices)} days of price data")
 
-    # Step 3: Calculate and save moves
-    moves_saved = 0
+    # Step 3: Calculate moves, then save them in one transaction
+    moves = []
 
     for event in events:
         logger.info(f"  Processing {event.date} ({event.timing.value or 'unknown'})...")
@@ -591,20 +134,54 @@ def backfill_ticker(
             logger.warning(f"  ❌ Could not calculate move")
             continue
 
-        if save_to_database(db_path, move):
-            direction = "+" if move.gap_move_pct >= 0 else ""
-            logger.info(
-                f"  ✓ Saved: {direction}{move.gap_move_pct:.2f}% gap, "
-                f"{move.close_move_pct:.2f}% close ({event.timing.value})"
-            )
-            moves_saved += 1
-        else:
-            logger.error(f"  ❌ Failed to save")
+        direction = "+" if move.gap_move_pct >= 0 else ""
+        logger.info(
+            f"  ✓ {direction}{move.gap_move_pct:.2f}% gap, "
+            f"{move.close_move_pct:.2f}% close ({event.timing.value})"
+        )
+        moves.append(move)
+
+    moves_saved = save_moves(db_path, moves)
+    if moves and not moves_saved:
+        logger.error(f"  ❌ Failed to save")
 
     logger.info(f"\n✓ Backfilled {moves_saved}/{len(events)} moves for {ticker}")
     return moves_saved
 
 
+def checkpoint_key(
+    start_date: Optional[date], end_date: Optional[date], force_discover: bool
+) -> str:
+    """Run key for a backfill: only runs with the same range and discovery share checkpoints."""
+    key = f"{start_date or 'all'}:{end_date or 'all'}"
+    if force_discover:
+        key += ":discover"
+    return key
+
+
+def load_checkpoints(
+    repository: ScanCheckpointRepository, run_key: str
+) -> Dict[str, int]:
+    """
+    Tickers a recent run with the same key already backfilled.
+
+    Returns:
+        Dict mapping ticker -> moves saved by that run
+    """
+    result = repository.get_completed('backfill', run_key, CHECKPOINT_FRESHNESS_HOURS)
+    if result.is_err:
+        logger.warning(f"Cannot resume, checkpoints unavailable: {result.error}")
+        return {}
+
+    completed: Dict[str, int] = {}
+    for ticker, (_, payload) in result.value.items():
+        try:
+            completed[ticker] = json.loads(payload or "{}").get("moves", 0)
+        except ValueError:
+            continue
+    return completed
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -666,6 +243,12 @@ Data sources:
         action="store_true",
         help="Force Yahoo Finance discovery of historical earnings dates for all tickers",
     )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help=f"Skip tickers an interrupted run with the same dates finished "
+             f"in the last {CHECKPOINT_FRESHNESS_HOURS}h",
+    )
     parser.add_argument(
         "--log-level",
         type=str,
@@ -737,11 +320,27 @@ Data sources:
         logger.error(f"Database not found: {db_path}")
         return 1
 
+    # Checkpoint journal (scan_checkpoints) - created by migration 011
+    MigrationManager(db_path).migrate()
+    checkpoints = ScanCheckpointRepository(db_path)
+    run_key = checkpoint_key(start_date, end_date, args.discover)
+    completed = load_checkpoints(checkpoints, run_key) if args.resume else {}
+    if completed:
+        logger.info(
+            f"♻️  Resuming: {len(completed)} tickers already backfilled "
+            f"in the last {CHECKPOINT_FRESHNESS_HOURS}h"
+        )
+
     # Backfill each ticker
     total_moves = 0
     failed_tickers = []
 
     for i, ticker in enumerate(tickers, 1):
+        if ticker in completed:
+            total_moves += completed[ticker]
+            logger.info(f"[{i}/{len(tickers)}] {ticker}: resumed from checkpoint ({completed[ticker]} moves)")
+            continue
+
         logger.info(f"\n[{i}/{len(tickers)}] Processing {ticker}")
 
         try:
@@ -756,6 +355,12 @@ Data sources:
 
             if moves == 0:
                 failed_tickers.append(ticker)
+            else:
+                save_result = checkpoints.save(
+                    'backfill', run_key, ticker, 'success', json.dumps({"moves": moves})
+                )
+                if save_result.is_err:
+                    logger.debug(f"{ticker}: Could not save checkpoint: {save_result.error}")
 
             # Rate limiting - Twelve Data is 8 calls/min on free tier
             if i < len(tickers):
@@ -776,6 +381,8 @@ Data sources:
     logger.info("Backfill Complete!")
     logger.info("=" * 80)
     logger.info(f"Total tickers processed: {len(tickers) - len(failed_tickers)}/{len(tickers)}")
+    if completed:
+        logger.info(f"  (including {len(completed)} resumed from checkpoints)")
     logger.info(f"Total moves saved: {total_moves}")
 
     if failed_tickers:
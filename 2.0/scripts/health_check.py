@@ -12,6 +12,7 @@ Usage:
 """
 
 import asyncio
+import atexit
 import logging
 import sys
 from pathlib import Path
@@ -38,6 +39,7 @@ async def main():
 
         # Create container
         container = Container(config)
+        atexit.register(container.close)  # return shared rate limit leases
 
         # Get health check service
         health_service = container.health_check_service
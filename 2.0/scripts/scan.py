@@ -41,7 +41,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.utils.logging import setup_logging
 from src.utils.shutdown import register_shutdown_callback
-from src.container import Container, reset_container
+from src.container import Container
 from src.config.config import Config
 
 # Import everything from the scan package for backward compatibility.
@@ -148,7 +148,7 @@ def main():
         # Register graceful shutdown callbacks
         def shutdown_cleanup():
             """Cleanup on shutdown."""
-            reset_container()
+            container.close()
 
         register_shutdown_callback(shutdown_cleanup)
 
@@ -161,7 +161,10 @@ def main():
             return scanning_mode(
                 container, scan_date, args.expiration_offset,
                 parallel=use_parallel,
-                skip_weekly_filter=args.skip_weekly_filter
+                skip_weekly_filter=args.skip_weekly_filter,
+                threaded=args.threaded,
+                top_k=args.top,
+                resume=args.resume
             )
         elif args.whisper_week is not None:
             # whisper_week can be '' (empty string) for current week or a date string
@@ -172,14 +175,20 @@ def main():
                 fallback_image=args.fallback_image,
                 expiration_offset=args.expiration_offset,
                 parallel=use_parallel,
-                skip_weekly_filter=args.skip_weekly_filter
+                skip_weekly_filter=args.skip_weekly_filter,
+                threaded=args.threaded,
+                top_k=args.top,
+                resume=args.resume
             )
         else:
             tickers = [t.strip().upper() for t in args.tickers.split(',')]
             return ticker_mode(
                 container, tickers, args.expiration_offset,
                 parallel=use_parallel,
-                skip_weekly_filter=args.skip_weekly_filter
+                skip_weekly_filter=args.skip_weekly_filter,
+                threaded=args.threaded,
+                top_k=args.top,
+                resume=args.resume
             )
 
     except KeyboardInterrupt:
@@ -7,10 +7,15 @@ Decomposed from the monolithic scan.py into focused modules:
 - date_utils: Trading day calculations, expiration date logic
 - market_data: Market cap lookups, stock price fetching, liquidity checks
 - filters: Ticker filtering logic
+- prefilter: Bulk SQL checks that drop tickers before any API call
 - quality_scorer: Composite quality scoring (VRP + liquidity + difficulty)
 - formatters: Result display/formatting (tables, colors, summaries)
 - earnings_fetcher: Earnings source aggregation (AlphaVantage, Yahoo, DB)
 - workflows: Sequential and parallel scan orchestration
+- analysis_common: Per-ticker result dicts, backfill and logging shared by both engines
+- async_pipeline: Asyncio scan engine (default for parallel modes)
+- live_table: Live re-ranked leaderboard for streaming scans
+- checkpoint: Journal of finished tickers for --resume
 """
 
 # Re-export public API for backward compatibility
@@ -95,6 +100,12 @@ from .filters import (
     filter_ticker_concurrent,
 )
 
+# SQL prefilter (before any API call)
+from .prefilter import (
+    PrefilterResult,
+    prefilter_tickers,
+)
+
 # Earnings fetcher
 from .earnings_fetcher import (
     fetch_earnings_for_date,
@@ -115,5 +126,11 @@ from .workflows import (
     whisper_mode_parallel,
 )
 
+# Asyncio scan pipeline (default parallel engine)
+from .async_pipeline import (
+    AsyncScanPipeline,
+    run_async_scan,
+)
+
 # CLI
 from .cli import parse_args
@@ -0,0 +1,175 @@
+"""
+Shared per-ticker analysis helpers - result dicts, backfill, liquidity logging.
+
+Used by both the synchronous analyze_ticker() in workflows and the asyncio
+pipeline, so every scan engine logs and reports a ticker identically.
+"""
+
+import logging
+from datetime import date
+from typing import Dict, Optional
+
+from src.container import Container
+
+from .constants import BACKFILL_TIMEOUT_SECONDS
+
+logger = logging.getLogger(__name__)
+
+
+def backfill_error_status(error: BaseException) -> str:
+    """Result status for a failed backfill future."""
+    if isinstance(error, TimeoutError):
+        return 'BACKFILL_TIMEOUT'
+    return 'BACKFILL_FAILED'
+
+
+def wait_for_backfill(container: Container, ticker: str) -> str:
+    """
+    Backfill ticker's earnings history through the container's BackfillQueue.
+
+    Returns 'SUCCESS' or a BACKFILL_* status. A ticker queued earlier (see
+    PrefilterResult.needs_backfill) is usually finished by the time it is
+    analyzed.
+    """
+    logger.info(f"📊 Auto-backfilling historical earnings data for {ticker}...")
+    try:
+        future = container.backfill_queue.submit(ticker)
+    except Exception as e:
+        logger.warning(f"✗ Backfill error for {ticker}: {e}")
+        return 'BACKFILL_ERROR'
+
+    try:
+        moves = future.result(timeout=BACKFILL_TIMEOUT_SECONDS)
+    except Exception as e:
+        status = backfill_error_status(e)
+        outcome = 'timeout' if status == 'BACKFILL_TIMEOUT' else 'failed'
+        logger.warning(f"✗ Backfill {outcome} for {ticker}: {e}")
+        return status
+
+    logger.info(f"✓ Backfill complete for {ticker} ({moves} moves)")
+    return 'SUCCESS'
+
+
+def unscored_result(
+    ticker: str,
+    company_name: Optional[str],
+    earnings_date: date,
+    expiration_date: date,
+    implied_move,
+    status: str,
+) -> dict:
+    """Result for a ticker with an implied move but no VRP (e.g. NO_HISTORICAL_DATA)."""
+    return {
+        'ticker': ticker,
+        'ticker_name': company_name,
+        'earnings_date': str(earnings_date),
+        'expiration_date': str(expiration_date),
+        'implied_move_pct': str(implied_move.implied_move_pct),
+        'stock_price': float(implied_move.stock_price.amount),
+        'status': status,
+        'tradeable': False
+    }
+
+
+def analysis_result(
+    ticker: str,
+    company_name: Optional[str],
+    earnings_date: date,
+    expiration_date: date,
+    implied_move,
+    vrp,
+    liquidity_tier: str,
+    hybrid_details: Optional[Dict],
+    directional_bias: str,
+) -> dict:
+    """Result for a fully analyzed ticker (status SUCCESS)."""
+    # Build hybrid liquidity info for result
+    oi_ratio = None
+    if hybrid_details and hybrid_details.get('oi_ratio'):
+        oi_ratio = hybrid_details['oi_ratio']
+
+    return {
+        'ticker': ticker,
+        'ticker_name': company_name,
+        'earnings_date': str(earnings_date),
+        'expiration_date': str(expiration_date),
+        'stock_price': float(implied_move.stock_price.amount),
+        'implied_move_pct': str(vrp.implied_move_pct),
+        'historical_mean_pct': str(vrp.historical_mean_move_pct),
+        'vrp_ratio': float(vrp.vrp_ratio),
+        'edge_score': float(vrp.edge_score),
+        'recommendation': vrp.recommendation.value,
+        'is_tradeable': vrp.is_tradeable,
+        'liquidity_tier': liquidity_tier,  # CRITICAL ADDITION
+        'liquidity_oi_ratio': oi_ratio,  # NEW: OI/Position ratio from hybrid check
+        'directional_bias': directional_bias,  # NEW: Directional bias from skew
+        'status': 'SUCCESS'
+    }
+
+
+def log_vrp(vrp) -> None:
+    """Log the VRP summary for a ticker."""
+    logger.info(f"✓ VRP Ratio: {vrp.vrp_ratio:.2f}x")
+    logger.info(f"  Implied Move: {vrp.implied_move_pct}")
+    logger.info(f"  Historical Mean: {vrp.historical_mean_move_pct}")
+    logger.info(f"  Edge Score: {vrp.edge_score:.2f}")
+    logger.info(f"  Recommendation: {vrp.recommendation.value.upper()}")
+
+
+def log_liquidity(ticker: str, liquidity_tier: str, hybrid_details: Optional[Dict]) -> None:
+    """Log the hybrid liquidity check and its 4-tier warning for a ticker."""
+    hybrid_details = hybrid_details or {}
+
+    # Log hybrid liquidity details
+    if hybrid_details and hybrid_details.get('method') not in ('NO_CHAIN', 'ERROR', 'FAILED'):
+        thresholds = hybrid_details.get('thresholds', {})
+        oi_ratio = hybrid_details.get('oi_ratio')
+        oi_tier = hybrid_details.get('oi_tier', 'N/A')
+        spread_tier = hybrid_details.get('spread_tier', 'N/A')
+        price_tier = thresholds.get('price_tier', 'N/A')
+        spread_width = thresholds.get('spread_width', 'N/A')
+        contracts = thresholds.get('contracts', 'N/A')
+        max_spread = max(hybrid_details.get('call_spread_pct', 0), hybrid_details.get('put_spread_pct', 0))
+        logger.info(f"  Liquidity Tier: {liquidity_tier} (Hybrid {hybrid_details['method']})")
+        logger.info(f"    Call ${hybrid_details['call_strike']:.0f} OI={hybrid_details['call_oi']:,}, "
+                   f"Put ${hybrid_details['put_strike']:.0f} OI={hybrid_details['put_oi']:,}")
+        logger.info(f"    Position: {contracts} contracts × ${spread_width} spread ({price_tier} tier)")
+        # Show tier breakdown
+        oi_icon = {'EXCELLENT': '✓', 'GOOD': '✓', 'WARNING': '⚠️', 'REJECT': '❌'}.get(oi_tier, '?')
+        spread_icon = {'EXCELLENT': '✓', 'GOOD': '✓', 'WARNING': '⚠️', 'REJECT': '❌'}.get(spread_tier, '?')
+        logger.info(f"    OI: {oi_ratio:.1f}x → {oi_tier} {oi_icon} | Spread: {max_spread:.0f}% → {spread_tier} {spread_icon}")
+    else:
+        logger.info(f"  Liquidity Tier: {liquidity_tier}")
+
+    # 4-Tier Warning Messages
+    tier_clean = liquidity_tier.replace('*', '')
+    if tier_clean == "GOOD":
+        logger.info(f"\n✓ GOOD liquidity for {ticker}")
+        oi_tier = hybrid_details.get('oi_tier', 'N/A')
+        spread_tier = hybrid_details.get('spread_tier', 'N/A')
+        if oi_tier == "GOOD":
+            oi_ratio = hybrid_details.get('oi_ratio', 0)
+            logger.info(f"   OI/Position ratio {oi_ratio:.1f}x (2-5x) - adequate for full size")
+        if spread_tier == "GOOD":
+            max_spread = max(hybrid_details.get('call_spread_pct', 0), hybrid_details.get('put_spread_pct', 0))
+            logger.info(f"   Bid/ask spread {max_spread:.0f}% (8-12%) - acceptable slippage")
+    elif tier_clean == "WARNING":
+        logger.warning(f"\n⚠️  WARNING: Low liquidity detected for {ticker}")
+        oi_tier = hybrid_details.get('oi_tier', 'N/A')
+        spread_tier = hybrid_details.get('spread_tier', 'N/A')
+        if oi_tier == "WARNING":
+            oi_ratio = hybrid_details.get('oi_ratio', 0)
+            logger.warning(f"   OI/Position ratio {oi_ratio:.1f}x (1-2x) - consider reducing size")
+        if spread_tier == "WARNING":
+            max_spread = max(hybrid_details.get('call_spread_pct', 0), hybrid_details.get('put_spread_pct', 0))
+            logger.warning(f"   Bid/ask spread {max_spread:.0f}% (>12%) - expect slippage")
+    elif tier_clean == "REJECT":
+        logger.warning(f"\n❌ CRITICAL: Very low liquidity for {ticker}")
+        oi_tier = hybrid_details.get('oi_tier', 'N/A')
+        spread_tier = hybrid_details.get('spread_tier', 'N/A')
+        if oi_tier == "REJECT":
+            oi_ratio = hybrid_details.get('oi_ratio', 0)
+            logger.warning(f"   OI/Position ratio {oi_ratio:.1f}x (<1x) - DO NOT TRADE at full size")
+        if spread_tier == "REJECT":
+            max_spread = max(hybrid_details.get('call_spread_pct', 0), hybrid_details.get('put_spread_pct', 0))
+            logger.warning(f"   Bid/ask spread {max_spread:.0f}% (>15%) - DO NOT TRADE")
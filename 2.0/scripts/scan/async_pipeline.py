@@ -0,0 +1,615 @@
+"""
+Asyncio scan pipeline - one event loop for scan, ticker and whisper modes.
+
+Replaces the thread-pool ConcurrentScanner as the default parallel engine.
+Per ticker:
+
+1. Market cap and company name (ticker metadata cache, else AsyncYFinance) -
+   market cap filter
+2. Expirations, fetched once (AsyncTradierAPI) - weekly options filter and
+   both nearest-expiration lookups
+3. Option chains for the implied-move and trading expirations, concurrently
+   (one fetch when they are the same date)
+4. Historical moves (PricesRepository, in a worker thread)
+5. VRP, hybrid liquidity and skew computed from the chains already fetched
+
+The threaded path makes separate Tradier calls for the filter's mid-chain
+liquidity check (discarded - liquidity no longer filters), the implied move,
+the hybrid liquidity check and the skew fit, and paces them through a
+2 req/s scanner lock. Here each chain is fetched once and HTTP concurrency
+is bounded by AsyncTradierAPI's adaptive limiter.
+
+Results, filters, formatting and BatchScanResult statistics are the same as
+the threaded engine, so workflows display both identically.
+
+stream() yields each ticker's ScanResult as soon as it completes. With
+top_k, tickers are admitted in order of their best possible quality score
+(from the historical mean alone, see quality_score_upper_bound), and no
+further ticker is analyzed once the current K-th best score is at least
+the next ticker's bound.
+
+Usage:
+    batch = run_async_scan(container, earnings_lookup, expiration_offset=None)
+
+    async with AsyncScanPipeline(container) as pipeline:
+        async for result in pipeline.stream(earnings_lookup, top_k=10):
+            ...
+"""
+
+import asyncio
+import heapq
+import logging
+import time
+from collections import deque
+from datetime import date
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from src.application.filters.weekly_options import has_weekly_options
+from src.application.metrics.implied_move_common import calculate_from_atm_chain
+from src.container import Container
+from src.domain.errors import Result
+from src.domain.enums import EarningsTiming
+from src.infrastructure.api.tradier_async import AsyncTradierAPI
+from src.infrastructure.api.yfinance_async import AsyncYFinance
+from src.utils.concurrent_scanner import BatchScanResult, ScanResult
+
+from .analysis_common import (
+    analysis_result,
+    backfill_error_status,
+    log_liquidity,
+    log_vrp,
+    unscored_result,
+)
+from .constants import BACKFILL_TIMEOUT_SECONDS
+from .date_utils import (
+    calculate_expiration_date,
+    calculate_implied_move_expiration,
+    validate_expiration_date,
+)
+from .earnings_fetcher import fetch_earnings_for_ticker
+from .market_data import check_liquidity_hybrid
+from .prefilter import record_weekly_options
+from .quality_scorer import calculate_scan_quality_score, quality_score_upper_bound
+
+logger = logging.getLogger(__name__)
+
+# Ceiling for concurrent Tradier requests (the adaptive limiter starts at half)
+ASYNC_MAX_CONCURRENT = 16
+
+# Concurrent yfinance lookups (thread pool inside AsyncYFinance)
+ASYNC_YF_WORKERS = 5
+
+
+def nearest_expiration(expirations: List[date], target: date) -> Optional[date]:
+    """
+    Nearest expiration >= target, else the latest one (same rule as
+    find_nearest_expiration, without refetching the expiration list).
+    """
+    if not expirations:
+        return None
+    ordered = sorted(expirations)
+    for exp in ordered:
+        if exp >= target:
+            return exp
+    return ordered[-1]
+
+
+class AsyncScanPipeline:
+    """
+    Analyzes many tickers concurrently on one event loop.
+
+    Must be used as an async context manager (opens the aiohttp session and
+    yfinance thread pool).
+    """
+
+    def __init__(
+        self,
+        container: Container,
+        skip_weekly_filter: bool = False,
+        auto_backfill: bool = False,
+        max_concurrent: int = ASYNC_MAX_CONCURRENT,
+        adaptive: bool = True,
+        hedge: bool = False,
+    ):
+        """
+        Initialize async scan pipeline.
+
+        Args:
+            container: DI container (config, repositories, calculators)
+            skip_weekly_filter: If True, skip weekly options filter
+            auto_backfill: If True, backfill missing history (BackfillQueue)
+            max_concurrent: Maximum concurrent Tradier requests
+            adaptive: Adapt Tradier concurrency below max_concurrent (AIMD)
+            hedge: Hedge Tradier requests still pending at p95
+        """
+        self.container = container
+        self.skip_weekly_filter = skip_weekly_filter
+        self.auto_backfill = auto_backfill
+        self.max_concurrent = max_concurrent
+        # Historical moves fetched ahead of analysis (top-K bounds), by ticker
+        self._history: Dict[str, Result] = {}
+        self.tradier = AsyncTradierAPI(
+            api_key=container.config.api.tradier_api_key,
+            base_url=container.config.api.tradier_base_url,
+            max_concurrent=max_concurrent,
+            adaptive=adaptive,
+            hedge=hedge,
+            # Same limiter as the sync client: shares its per-minute budget
+            # (and, when enabled, the cross-process one in rate_limits)
+            rate_limiter=container.tradier.rate_limiter,
+        )
+        self.yf = AsyncYFinance(max_workers=ASYNC_YF_WORKERS)
+
+    async def __aenter__(self) -> 'AsyncScanPipeline':
+        await self.tradier.__aenter__()
+        await self.yf.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.yf.__aexit__(exc_type, exc_val, exc_tb)
+        await self.tradier.__aexit__(exc_type, exc_val, exc_tb)
+
+    # ------------------------------------------------------------------ #
+    #  Per-ticker analysis
+    # ------------------------------------------------------------------ #
+
+    async def _backfill(self, ticker: str) -> Tuple[bool, str]:
+        """Backfill via the BackfillQueue without blocking the loop. Returns (ok, status)."""
+        logger.info(f"📊 Auto-backfilling historical earnings data for {ticker}...")
+        try:
+            future = self.container.backfill_queue.submit(ticker)
+        except Exception as e:
+            logger.warning(f"✗ Backfill error for {ticker}: {e}")
+            return (False, 'BACKFILL_ERROR')
+
+        try:
+            # Shielded: other tickers' waiters may share the queue's future
+            moves = await asyncio.wait_for(
+                asyncio.shield(asyncio.wrap_future(future)), timeout=BACKFILL_TIMEOUT_SECONDS
+            )
+        except Exception as e:
+            status = backfill_error_status(e)
+            outcome = 'timeout' if status == 'BACKFILL_TIMEOUT' else 'failed'
+            logger.warning(f"✗ Backfill {outcome} for {ticker}: {e}")
+            return (False, status)
+
+        logger.info(f"✓ Backfill complete for {ticker} ({moves} moves)")
+        return (True, 'SUCCESS')
+
+    async def analyze_ticker(
+        self,
+        ticker: str,
+        earnings_date: date,
+        expiration_date: date,
+        company_name: Optional[str] = None,
+    ) -> Optional[dict]:
+        """
+        Analyze a single ticker (async counterpart of workflows.analyze_ticker).
+
+        Returns dict with analysis results or None if analysis failed.
+        """
+        container = self.container
+        logger.info(f"Analyzing {ticker} (earnings {earnings_date}, expiration {expiration_date})")
+
+        expirations_result = await self.tradier.get_expirations(ticker)
+        if expirations_result.is_err:
+            logger.warning(f"✗ Failed to fetch expirations for {ticker}: {expirations_result.error}")
+            return None
+        expirations = expirations_result.value
+
+        # Check for weekly options (opt-in filter via REQUIRE_WEEKLY_OPTIONS)
+        if container.config.thresholds.require_weekly_options and not self.skip_weekly_filter:
+            has_weeklies, weekly_reason = has_weekly_options(
+                [exp.isoformat() for exp in expirations],
+                earnings_date.isoformat()
+            )
+            await asyncio.to_thread(record_weekly_options, container, ticker, has_weeklies)
+            if not has_weeklies:
+                logger.info(f"✗ {ticker}: No weekly options - {weekly_reason}")
+                return None
+
+        # Validate expiration date
+        validation_error = validate_expiration_date(expiration_date, earnings_date, ticker)
+        if validation_error:
+            logger.error(f"✗ Invalid expiration date: {validation_error}")
+            return None
+
+        # Implied move uses the first post-earnings expiration; trading uses the requested one
+        implied_move_exp = calculate_implied_move_expiration(earnings_date)
+        actual_im_expiration = nearest_expiration(expirations, implied_move_exp)
+        actual_expiration = nearest_expiration(expirations, expiration_date)
+        if actual_im_expiration != implied_move_exp:
+            logger.info(f"  {ticker} implied move expiration: {implied_move_exp} → {actual_im_expiration}")
+        if actual_expiration != expiration_date:
+            logger.info(f"  {ticker} trading expiration: {expiration_date} → {actual_expiration}")
+            expiration_date = actual_expiration
+
+        if actual_im_expiration < date.today():
+            logger.warning(f"✗ {ticker}: Expiration {actual_im_expiration} is in the past")
+            return None
+
+        # Both chains (one request when the expirations match) plus history, concurrently
+        prices_repo = container.prices_repository
+        chain_fetches = [self.tradier.get_option_chain(ticker, actual_im_expiration)]
+        if actual_expiration != actual_im_expiration:
+            chain_fetches.append(self.tradier.get_option_chain(ticker, actual_expiration))
+        hist_result = self._history.pop(ticker, None)
+        if hist_result is None:
+            hist_result, *chain_results = await asyncio.gather(
+                asyncio.to_thread(prices_repo.get_historical_moves, ticker, 12),
+                *chain_fetches,
+            )
+        else:
+            chain_results = await asyncio.gather(*chain_fetches)
+
+        im_chain_result = chain_results[0]
+        if im_chain_result.is_err:
+            logger.warning(f"✗ Failed to calculate implied move for {ticker}: {im_chain_result.error}")
+            return None
+        implied_result = calculate_from_atm_chain(
+            im_chain_result.value, ticker, actual_im_expiration, validate_straddle_cost=True
+        )
+        if implied_result.is_err:
+            logger.warning(f"✗ Failed to calculate implied move for {ticker}: {implied_result.error}")
+            return None
+        implied_move = implied_result.value
+        logger.info(f"✓ {ticker} Implied Move: {implied_move.implied_move_pct}")
+
+        if hist_result.is_err:
+            logger.warning(f"✗ {ticker}: No historical data: {hist_result.error}")
+            if not self.auto_backfill:
+                logger.info("   Run: python scripts/backfill_historical.py " + ticker)
+                return unscored_result(
+                    ticker, company_name, earnings_date, expiration_date,
+                    implied_move, 'NO_HISTORICAL_DATA'
+                )
+            ok, status = await self._backfill(ticker)
+            if not ok:
+                return unscored_result(
+                    ticker, company_name, earnings_date, expiration_date, implied_move, status
+                )
+            hist_result = await asyncio.to_thread(prices_repo.get_historical_moves, ticker, 12)
+            if hist_result.is_err:
+                logger.warning(f"✗ Still no historical data after backfill: {hist_result.error}")
+                return unscored_result(
+                    ticker, company_name, earnings_date, expiration_date,
+                    implied_move, 'NO_HISTORICAL_DATA'
+                )
+
+        vrp_result = container.vrp_calculator.calculate(
+            ticker=ticker,
+            expiration=expiration_date,
+            implied_move=implied_move,
+            historical_moves=hist_result.value,
+        )
+        if vrp_result.is_err:
+            logger.warning(f"✗ Failed to calculate VRP for {ticker}: {vrp_result.error}")
+            return None
+        vrp = vrp_result.value
+        log_vrp(vrp)
+
+        # Hybrid liquidity and skew on the trading chain already in hand
+        trading_chain_result = chain_results[-1]
+        trading_chain = trading_chain_result.value if trading_chain_result.is_ok else None
+        implied_move_pct = float(str(implied_move.implied_move_pct).rstrip('%'))
+        if trading_chain is None:
+            liquidity_tier = "REJECT"
+            hybrid_details = {'method': 'NO_CHAIN', 'error': str(trading_chain_result.error)}
+        else:
+            _, liquidity_tier, hybrid_details = check_liquidity_hybrid(
+                ticker=ticker,
+                expiration=expiration_date,
+                implied_move_pct=implied_move_pct,
+                container=container,
+                max_loss_budget=20000.0,
+                use_dynamic_thresholds=True,
+                chain=trading_chain,
+            )
+        log_liquidity(ticker, liquidity_tier, hybrid_details)
+
+        directional_bias = "NEUTRAL"  # Default if skew analysis unavailable
+        skew_analyzer = container.skew_analyzer
+        if skew_analyzer and trading_chain is not None:
+            skew_result = skew_analyzer.analyze_chain(ticker, expiration_date, trading_chain)
+            if skew_result.is_ok:
+                directional_bias = skew_result.value.directional_bias.value.replace('_', ' ').upper()
+
+        return analysis_result(
+            ticker, company_name, earnings_date, expiration_date, implied_move,
+            vrp, liquidity_tier, hybrid_details, directional_bias
+        )
+
+    async def _ticker_info(self, ticker: str) -> Tuple[Optional[float], Optional[str]]:
+        """Market cap and name from the persistent metadata cache, else yfinance."""
+        metadata = self.container.ticker_metadata
+        cached = metadata.get(ticker)
+        if cached is not None:
+            return cached
+        market_cap_millions, company_name = await self.yf.get_ticker_info(ticker)
+        await asyncio.to_thread(metadata.put, ticker, market_cap_millions, company_name)
+        return market_cap_millions, company_name
+
+    async def scan_ticker(
+        self,
+        ticker: str,
+        earnings_date: date,
+        expiration_date: date,
+    ) -> ScanResult:
+        """Filter then analyze one ticker; never raises."""
+        start_time = time.perf_counter()
+
+        def elapsed_ms() -> float:
+            return (time.perf_counter() - start_time) * 1000
+
+        try:
+            # Market cap filter (liquidity is display-only and comes from the analysis)
+            market_cap_millions, company_name = await self._ticker_info(ticker)
+            min_market_cap = self.container.config.thresholds.min_market_cap_millions
+            if market_cap_millions is not None and market_cap_millions < min_market_cap:
+                reason = f"Market cap ${market_cap_millions:.0f}M < ${min_market_cap:.0f}M"
+                logger.info(f"⏭️  {ticker}: Filtered ({reason})")
+                return ScanResult(ticker=ticker, status='filtered', error=reason,
+                                  duration_ms=elapsed_ms())
+
+            result = await self.analyze_ticker(ticker, earnings_date, expiration_date, company_name)
+            if result:
+                return ScanResult(
+                    ticker=ticker,
+                    status='success' if result.get('status') == 'SUCCESS' else 'skip',
+                    data=result,
+                    duration_ms=elapsed_ms(),
+                )
+            return ScanResult(ticker=ticker, status='error', error='No result returned',
+                              duration_ms=elapsed_ms())
+
+        except Exception as e:
+            logger.error(f"✗ Error analyzing {ticker}: {e}", exc_info=True)
+            return ScanResult(ticker=ticker, status='error', error=str(e),
+                              duration_ms=elapsed_ms())
+
+    # ------------------------------------------------------------------ #
+    #  Batch
+    # ------------------------------------------------------------------ #
+
+    def _jobs(
+        self,
+        earnings_lookup: Dict[str, Tuple[date, str]],
+        expiration_offset: Optional[int],
+    ) -> List[Tuple[str, date, date]]:
+        """(ticker, earnings_date, expiration_date) for every ticker."""
+        min_dte = self.container.config.thresholds.min_dte
+        jobs = []
+        for ticker, (earnings_date, timing) in earnings_lookup.items():
+            try:
+                timing_enum = EarningsTiming(timing)
+            except ValueError:
+                timing_enum = EarningsTiming.UNKNOWN
+            expiration_date = calculate_expiration_date(
+                earnings_date, timing_enum, expiration_offset, min_dte=min_dte
+            )
+            jobs.append((ticker, earnings_date, expiration_date))
+        return jobs
+
+    async def _score_bounds(self, tickers: List[str]) -> Dict[str, Optional[float]]:
+        """
+        Best possible quality score per ticker, from historical moves alone.
+
+        None means the ticker cannot be scored at all (no usable history and
+        no auto-backfill). The fetched moves are kept for analyze_ticker().
+        """
+        prices_repo = self.container.prices_repository
+        histories = await asyncio.gather(*(
+            asyncio.to_thread(prices_repo.get_historical_moves, ticker, 12)
+            for ticker in tickers
+        ))
+        bounds: Dict[str, Optional[float]] = {}
+        for ticker, hist_result in zip(tickers, histories):
+            self._history[ticker] = hist_result
+            mean = (
+                self.container.vrp_calculator.historical_mean(hist_result.value)
+                if hist_result.is_ok else None
+            )
+            if mean is not None:
+                bounds[ticker] = quality_score_upper_bound(mean)
+            else:
+                bounds[ticker] = float('inf') if self.auto_backfill else None
+        return bounds
+
+    async def stream(
+        self,
+        earnings_lookup: Dict[str, Tuple[date, str]],
+        expiration_offset: Optional[int] = None,
+        top_k: Optional[int] = None,
+    ) -> AsyncIterator[ScanResult]:
+        """
+        Yield each ticker's ScanResult as soon as its analysis completes.
+
+        Args:
+            earnings_lookup: Dict mapping ticker -> (earnings_date, timing value)
+            expiration_offset: Custom expiration offset in days
+            top_k: If set, stop analyzing tickers that cannot reach the top K
+                tradeable results by quality score; they are yielded as 'skip'
+
+        Yields:
+            ScanResult per ticker, in completion order
+        """
+        jobs = self._jobs(earnings_lookup, expiration_offset)
+        # Load the metadata index off the loop; only these tickers hit yfinance
+        uncached = await asyncio.to_thread(
+            self.container.ticker_metadata.stale, [ticker for ticker, _, _ in jobs]
+        )
+        logger.info(f"Ticker metadata: {len(jobs) - len(uncached)}/{len(jobs)} cached")
+        if top_k is None:
+            tasks = [asyncio.ensure_future(self.scan_ticker(*job)) for job in jobs]
+            try:
+                for next_result in asyncio.as_completed(tasks):
+                    yield await next_result
+            finally:
+                for task in tasks:
+                    task.cancel()
+            return
+
+        bounds = await self._score_bounds([ticker for ticker, _, _ in jobs])
+        for ticker, _, _ in jobs:
+            if bounds[ticker] is None:
+                self._history.pop(ticker, None)
+                yield ScanResult(ticker=ticker, status='skip',
+                                 error=f"No historical data - cannot reach top {top_k}")
+        queue = deque(sorted(
+            (job for job in jobs if bounds[job[0]] is not None),
+            key=lambda job: bounds[job[0]],
+            reverse=True,
+        ))
+
+        # Min-heap of the best top_k quality scores so far
+        top_scores: List[float] = []
+        pending = set()
+        try:
+            while queue or pending:
+                # Admit tickers, best bound first, while one could still make the top K
+                while queue and len(pending) < self.max_concurrent:
+                    if len(top_scores) == top_k and bounds[queue[0][0]] <= top_scores[0]:
+                        break
+                    pending.add(asyncio.ensure_future(self.scan_ticker(*queue.popleft())))
+                if not pending:
+                    break
+
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    result = task.result()
+                    if result.data and result.data.get('is_tradeable'):
+                        score = calculate_scan_quality_score(result.data)
+                        if len(top_scores) < top_k:
+                            heapq.heappush(top_scores, score)
+                        elif score > top_scores[0]:
+                            heapq.heapreplace(top_scores, score)
+                    yield result
+        finally:
+            for task in pending:
+                task.cancel()
+
+        if queue:
+            logger.info(
+                f"Top {top_k} settled: skipped {len(queue)} tickers that cannot beat "
+                f"score {top_scores[0]:.1f}"
+            )
+        for ticker, _, _ in queue:
+            self._history.pop(ticker, None)
+            yield ScanResult(
+                ticker=ticker, status='skip',
+                error=f"Cannot reach top {top_k} (best possible score {bounds[ticker]:.1f})",
+            )
+
+    async def scan(
+        self,
+        earnings_lookup: Dict[str, Tuple[date, str]],
+        expiration_offset: Optional[int] = None,
+        progress_callback: Optional[Callable[[str, int, int], None]] = None,
+        top_k: Optional[int] = None,
+        result_callback: Optional[Callable[[ScanResult], None]] = None,
+    ) -> BatchScanResult:
+        """
+        Scan every ticker in earnings_lookup concurrently.
+
+        Args:
+            earnings_lookup: Dict mapping ticker -> (earnings_date, timing value)
+            expiration_offset: Custom expiration offset in days
+            progress_callback: Optional callback(ticker, completed, total)
+            top_k: Stop early once the top K tradeable results are settled
+            result_callback: Optional callback(scan_result) as each ticker completes
+
+        Returns:
+            BatchScanResult with all results and statistics
+        """
+        start_time = time.perf_counter()
+        total_count = len(earnings_lookup)
+
+        results: List[ScanResult] = []
+        async for result in self.stream(earnings_lookup, expiration_offset, top_k):
+            results.append(result)
+            if result_callback:
+                result_callback(result)
+            if progress_callback:
+                progress_callback(result.ticker, len(results), total_count)
+
+        total_duration = (time.perf_counter() - start_time) * 1000
+        success_count = sum(1 for r in results if r.status == 'success')
+        error_count = sum(1 for r in results if r.status == 'error')
+        skip_count = sum(1 for r in results if r.status == 'skip')
+        filtered_count = sum(1 for r in results if r.status == 'filtered')
+        avg_duration = total_duration / len(results) if results else 0
+
+        stats = self.tradier.get_stats()
+        logger.info(
+            f"Async scan complete: {success_count} success, {error_count} errors, "
+            f"{skip_count} skipped, {filtered_count} filtered in {total_duration:.0f}ms "
+            f"({stats['request_count']} Tradier requests, "
+            f"concurrency limit {stats['concurrency_limit']})"
+        )
+
+        return BatchScanResult(
+            results=results,
+            success_count=success_count,
+            error_count=error_count,
+            skip_count=skip_count,
+            filtered_count=filtered_count,
+            total_duration_ms=total_duration,
+            avg_duration_ms=avg_duration,
+        )
+
+
+def run_async_scan(
+    container: Container,
+    earnings_lookup: Dict[str, Tuple[date, str]],
+    expiration_offset: Optional[int] = None,
+    skip_weekly_filter: bool = False,
+    progress_callback: Optional[Callable[[str, int, int], None]] = None,
+    top_k: Optional[int] = None,
+    result_callback: Optional[Callable[[ScanResult], None]] = None,
+    **pipeline_options,
+) -> BatchScanResult:
+    """
+    Run the async pipeline from synchronous workflow code.
+
+    Args:
+        container: DI container
+        earnings_lookup: Dict mapping ticker -> (earnings_date, timing value)
+        expiration_offset: Custom expiration offset in days
+        skip_weekly_filter: If True, skip weekly options filter
+        progress_callback: Optional callback(ticker, completed, total)
+        top_k: Stop early once the top K tradeable results are settled
+        result_callback: Optional callback(scan_result) as each ticker completes
+        **pipeline_options: Passed to AsyncScanPipeline (max_concurrent, hedge, ...)
+
+    Returns:
+        BatchScanResult, same shape as ConcurrentScanner.scan_tickers()
+    """
+    async def scan() -> BatchScanResult:
+        async with AsyncScanPipeline(
+            container, skip_weekly_filter=skip_weekly_filter, **pipeline_options
+        ) as pipeline:
+            return await pipeline.scan(
+                earnings_lookup, expiration_offset, progress_callback,
+                top_k=top_k, result_callback=result_callback,
+            )
+
+    return asyncio.run(scan())
+
+
+def fetch_earnings_lookup(container: Container, tickers: List[str]) -> Dict[str, Tuple[date, str]]:
+    """Concurrent earnings lookup for ticker and whisper modes."""
+    async def fetch() -> Dict[str, Tuple[date, str]]:
+        infos = await asyncio.gather(*(
+            asyncio.to_thread(fetch_earnings_for_ticker, container, ticker)
+            for ticker in tickers
+        ))
+        lookup: Dict[str, Tuple[date, str]] = {}
+        for ticker, earnings_info in zip(tickers, infos):
+            if earnings_info:
+                earnings_date, timing = earnings_info
+                lookup[ticker] = (earnings_date, timing.value)
+            else:
+                logger.info(f"⏭️  {ticker}: No upcoming earnings found")
+        return lookup
+
+    return asyncio.run(fetch())
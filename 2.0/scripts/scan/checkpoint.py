@@ -0,0 +1,161 @@
+"""
+Scan checkpoints - journal finished tickers so an interrupted scan can resume.
+
+Every engine records each analyzed or filtered ticker in the scan_checkpoints
+table as soon as it completes. A run restarted with --resume reuses entries
+younger than CHECKPOINT_FRESHNESS_HOURS instead of spending API calls on them
+again, and merges them into the summary alongside the new results. Only
+tickers the resumed run asked for are reused: a ticker-mode run shares one
+key across ticker lists, so its journal can hold tickers from other runs.
+
+Errors and skips are not journaled: errors are retried, and skips are either
+resolved for free by the prefilter or top-K cutoffs a resumed run may need.
+"""
+
+import json
+import logging
+from typing import Dict, Iterable, List, Optional
+
+from src.container import Container
+from src.utils.concurrent_scanner import BatchScanResult, ScanResult
+
+from .constants import CHECKPOINT_FRESHNESS_HOURS, CHECKPOINT_RETENTION_DAYS
+
+logger = logging.getLogger(__name__)
+
+
+def checkpoint_key(
+    base: str,
+    expiration_offset: Optional[int] = None,
+    skip_weekly_filter: bool = False,
+) -> str:
+    """
+    Run key for a scan: results are only reused by a run with the same options.
+
+    Args:
+        base: Scan date, whisper week or 'tickers'
+        expiration_offset: Custom expiration offset in days
+        skip_weekly_filter: Whether the weekly options filter is skipped
+    """
+    key = base
+    if expiration_offset:
+        key += f":offset={expiration_offset}"
+    if skip_weekly_filter:
+        key += ":no-weekly-filter"
+    return key
+
+
+class ScanCheckpoint:
+    """
+    Per-run journal of completed tickers.
+
+    completed holds the results reused on --resume (empty otherwise); new
+    results are always recorded so a later run can resume from this one.
+    """
+
+    def __init__(
+        self,
+        container: Container,
+        run_kind: str,
+        run_key: str,
+        resume: bool = False,
+        tickers: Optional[Iterable[str]] = None,
+    ):
+        """
+        Initialize checkpoint.
+
+        Args:
+            container: DI container
+            run_kind: Scan mode ('scan', 'ticker', 'whisper')
+            run_key: Run identity, see checkpoint_key()
+            resume: If True, load tickers completed within the freshness window
+            tickers: Tickers this run scans; other journaled tickers are not
+                resumed (None reuses every ticker of the run)
+        """
+        self.repository = container.scan_checkpoint_repository
+        self.run_kind = run_kind
+        self.run_key = run_key
+        self.recorded = 0
+        requested = {t.upper() for t in tickers} if tickers is not None else None
+        self.completed: Dict[str, ScanResult] = self._load(requested) if resume else {}
+
+    def _load(self, requested: Optional[set] = None) -> Dict[str, ScanResult]:
+        """Read fresh checkpoints of this run (and prune old ones)."""
+        self.repository.prune(CHECKPOINT_RETENTION_DAYS)
+        result = self.repository.get_completed(
+            self.run_kind, self.run_key, CHECKPOINT_FRESHNESS_HOURS
+        )
+        if result.is_err:
+            logger.warning(f"Cannot resume, checkpoints unavailable: {result.error}")
+            return {}
+
+        completed: Dict[str, ScanResult] = {}
+        for ticker, (status, payload) in result.value.items():
+            if requested is not None and ticker.upper() not in requested:
+                continue
+            try:
+                entry = json.loads(payload) if payload else {}
+            except ValueError:
+                logger.debug(f"{ticker}: Ignoring unreadable checkpoint")
+                continue
+            completed[ticker] = ScanResult(
+                ticker=ticker,
+                status=status,
+                data=entry.get('data'),
+                error=entry.get('error'),
+            )
+        return completed
+
+    def pending(self, tickers: List[str]) -> List[str]:
+        """Tickers without a reusable checkpoint, in input order."""
+        return [t for t in tickers if t.upper() not in self.completed]
+
+    def record(self, result: ScanResult) -> None:
+        """Journal a finished ticker (best effort; errors and skips are ignored)."""
+        if result.status != 'filtered' and result.data is None:
+            return
+        payload = json.dumps({'data': result.data, 'error': result.error}, default=str)
+        save_result = self.repository.save(
+            self.run_kind, self.run_key, result.ticker, result.status, payload
+        )
+        if save_result.is_err:
+            logger.debug(f"{result.ticker}: Could not save checkpoint: {save_result.error}")
+            return
+        self.recorded += 1
+
+    def record_analysis(self, ticker: str, result: dict) -> None:
+        """Journal an analyze_ticker() result dict."""
+        status = 'success' if result.get('status') == 'SUCCESS' else 'skip'
+        self.record(ScanResult(ticker=ticker, status=status, data=result))
+
+    def record_filtered(self, ticker: str, reason: Optional[str]) -> None:
+        """Journal a ticker rejected by the network filters."""
+        self.record(ScanResult(ticker=ticker, status='filtered', error=reason))
+
+    def merge_into(self, batch: BatchScanResult) -> BatchScanResult:
+        """Add the resumed tickers to this run's batch result."""
+        if not self.completed:
+            return batch
+        resumed = list(self.completed.values())
+        results = resumed + batch.results
+
+        def count(status: str) -> int:
+            return sum(1 for r in resumed if r.status == status)
+
+        return BatchScanResult(
+            results=results,
+            success_count=batch.success_count + count('success'),
+            error_count=batch.error_count,
+            skip_count=batch.skip_count + count('skip'),
+            filtered_count=batch.filtered_count + count('filtered'),
+            total_duration_ms=batch.total_duration_ms,
+            avg_duration_ms=batch.total_duration_ms / len(results) if results else 0,
+        )
+
+    def log_summary(self) -> None:
+        """Log how many tickers were reused from an earlier run."""
+        if self.completed:
+            logger.info(
+                f"♻️  Resumed {len(self.completed)} tickers from checkpoints "
+                f"(completed within {CHECKPOINT_FRESHNESS_HOURS}h)"
+            )
@@ -40,6 +40,12 @@ Examples:
     # Ticker mode with custom expiration offset
     python scripts/scan.py --tickers AAPL --expiration-offset 1
 
+    # Scanning mode, stopping once the 10 best opportunities are settled
+    python scripts/scan.py --scan-date 2025-01-31 --top 10
+
+    # Resume an interrupted scan, reusing tickers it already finished
+    python scripts/scan.py --scan-date 2025-01-31 --resume
+
 Expiration Date Calculation:
     - BMO (before market open): Same day if Friday, otherwise next Friday
     - AMC (after market close): Next day if Thursday, otherwise next Friday
@@ -90,6 +96,22 @@ Notes:
         action="store_true",
         help="Disable parallel processing (use sequential mode for debugging)"
     )
+    parser.add_argument(
+        "--threaded",
+        action="store_true",
+        help="Run parallel mode on the legacy thread pool instead of the asyncio pipeline"
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        metavar="K",
+        help="Show the K best opportunities; stops analyzing tickers that cannot reach them"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Reuse tickers an interrupted run of the same scan finished recently (checkpoints)"
+    )
     parser.add_argument(
         "--log-level",
         type=str,
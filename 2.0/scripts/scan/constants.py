@@ -16,7 +16,7 @@ CACHE_L2_TTL_SECONDS = 518400    # 6 days persistent cache (until next Monday)
 CACHE_MAX_L1_SIZE = 100          # Max items in L1 memory cache
 
 # Backfill configuration
-BACKFILL_TIMEOUT_SECONDS = 120   # 2 minutes timeout for backfill subprocess
+BACKFILL_TIMEOUT_SECONDS = 120   # 2 minutes max wait for a queued ticker's backfill
 BACKFILL_YEARS = 3               # Years of historical data to backfill
 
 # Trading day adjustment
@@ -25,6 +25,20 @@ MAX_TRADING_DAY_ITERATIONS = 10  # Max iterations to find next trading day (hand
 # API rate limiting
 API_CALL_DELAY = 0.2             # Delay between API calls to respect rate limits
 
+# Prefilter (bulk SQL checks before any API call)
+PREFILTER_WEEKLY_FLAG_TTL_DAYS = 7     # Trust a cached "no weekly options" flag this long
+# Network calls a ticker makes before the network stage reaches the same verdict
+# (yfinance info; + Tradier expirations; + implied-move option chain)
+PREFILTER_CALLS_AVOIDED = {
+    'market_cap': 1,
+    'weekly_options': 2,
+    'history': 3,
+}
+
+# Scan checkpoints (--resume)
+CHECKPOINT_FRESHNESS_HOURS = 4   # Reuse a checkpointed ticker result this long (quotes go stale)
+CHECKPOINT_RETENTION_DAYS = 7    # Prune journal entries older than this
+
 # Composite quality scoring constants (Dec 2025)
 # OPTIMIZED via A/B testing with Monte Carlo simulation (100 iterations)
 # Key findings:
@@ -80,6 +94,12 @@ SCORE_MOVE_CHALLENGING_POINTS = 11          # Points for challenging difficulty
 SCORE_MOVE_EXTREME_POINTS = 4               # Points for extreme difficulty (>15%)
 SCORE_DEFAULT_MOVE_POINTS = 12.5            # Default when implied move is missing (middle)
 
+# Top-K early cutoff (scan --top K)
+# Implied moves above the straddle sanity ceiling (implied_move_common warns
+# above 30% as suspect data) are scored as if at the ceiling, so score bounds
+# computed up to it hold for every ticker
+TOP_K_MAX_IMPLIED_MOVE_PCT = 30.0
+
 # Liquidity tier priority for sorting (lower number = higher priority)
 # 4-Tier System: EXCELLENT > GOOD > WARNING > REJECT
 LIQUIDITY_PRIORITY_ORDER = {
@@ -62,7 +62,7 @@ def should_filter_ticker(
 
     # Check market cap (still filters)
     if check_market_cap:
-        market_cap_millions = get_market_cap_millions(ticker)
+        market_cap_millions = get_market_cap_millions(ticker, container)
         if market_cap_millions is not None:
             min_market_cap = container.config.thresholds.min_market_cap_millions
             if market_cap_millions < min_market_cap:
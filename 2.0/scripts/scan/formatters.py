@@ -72,7 +72,8 @@ def _display_scan_results(
     scan_date: Optional[date] = None,
     total_events: int = 0,
     tickers: Optional[List[str]] = None,
-    week_range: Optional[Tuple[date, date]] = None
+    week_range: Optional[Tuple[date, date]] = None,
+    top_k: Optional[int] = None
 ) -> int:
     """
     Display scan results in a formatted table (shared by all modes).
@@ -91,6 +92,7 @@ def _display_scan_results(
         total_events: Total earnings events found
         tickers: List of tickers for ticker mode
         week_range: (start, end) dates for whisper mode
+        top_k: Show only the K best tradeable results
 
     Returns:
         Exit code (0 for success)
@@ -148,7 +150,7 @@ def _display_scan_results(
         # Check if any result has OI-only indicator (market closed)
         has_oi_only = any(r.get('liquidity_tier', '').endswith('*') for r in tradeable)
 
-        for i, r in enumerate(sorted(tradeable, key=sort_key), 1):
+        for i, r in enumerate(sorted(tradeable, key=sort_key)[:top_k], 1):
             ticker = r['ticker']
             full_name = r.get('ticker_name', '') or ''
             name = full_name[:20] if len(full_name) <= 20 else full_name[:full_name[:20].rfind(' ') or 20]
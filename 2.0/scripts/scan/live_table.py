@@ -0,0 +1,105 @@
+"""
+Live re-ranked results table for streaming scans.
+
+The async pipeline yields each ticker as it completes; LiveRankingTable keeps
+the tradeable ones ranked by quality score and redraws the leaderboard on
+stderr (like the sequential mode's progress bar), so the best opportunities
+are visible long before the last ticker finishes. The final summary is still
+printed by _display_scan_results() once the scan ends.
+
+When stderr is not a terminal, a line is printed only when a new result
+enters the leaderboard.
+"""
+
+import sys
+from typing import List, Optional, TextIO
+
+from src.utils.concurrent_scanner import ScanResult
+
+from .formatters import format_liquidity_display
+from .quality_scorer import calculate_scan_quality_score
+
+# Rows shown while the scan is running
+LIVE_TABLE_ROWS = 10
+
+# ANSI: cursor to start of line N lines up, clear to end of screen
+_CURSOR_UP = "\x1b[{}F"
+_CLEAR_DOWN = "\x1b[J"
+
+
+class LiveRankingTable:
+    """Leaderboard of tradeable results, updated per completed ticker."""
+
+    def __init__(
+        self,
+        total: int,
+        rows: int = LIVE_TABLE_ROWS,
+        stream: Optional[TextIO] = None,
+    ):
+        """
+        Initialize live table.
+
+        Args:
+            total: Number of tickers in the scan
+            rows: Leaderboard rows to show
+            stream: Output stream (default: stderr)
+        """
+        self.total = total
+        self.rows = rows
+        self.stream = stream or sys.stderr
+        self.interactive = self.stream.isatty()
+        self.completed = 0
+        self.ranked: List[dict] = []
+        self._drawn_lines = 0
+
+    def update(self, scan_result: ScanResult) -> None:
+        """Record one completed ticker and refresh the display."""
+        self.completed += 1
+        data = scan_result.data
+        entered_at = None
+        if data and data.get('is_tradeable', False):
+            data['_quality_score'] = calculate_scan_quality_score(data)
+            self.ranked.append(data)
+            self.ranked.sort(key=lambda r: -r['_quality_score'])
+            rank = self.ranked.index(data) + 1
+            if rank <= self.rows:
+                entered_at = rank
+
+        if self.interactive:
+            self._redraw()
+        elif entered_at is not None:
+            self.stream.write(
+                f"[{self.completed}/{self.total}] #{entered_at} {self._format_row(data)}\n"
+            )
+            self.stream.flush()
+
+    def close(self) -> None:
+        """Clear the live table (the final summary replaces it)."""
+        if self.interactive and self._drawn_lines:
+            self.stream.write(_CURSOR_UP.format(self._drawn_lines) + _CLEAR_DOWN)
+            self.stream.flush()
+            self._drawn_lines = 0
+
+    def _format_row(self, r: dict) -> str:
+        name = (r.get('ticker_name') or '')[:20]
+        vrp = f"{r['vrp_ratio']:.2f}x"
+        return (
+            f"{r['ticker']:<8} {name:<20} {r['_quality_score']:<7.1f} {vrp:<8} "
+            f"{str(r['implied_move_pct']):<9} "
+            f"{format_liquidity_display(r.get('liquidity_tier', 'UNKNOWN')):<12}"
+        )
+
+    def _redraw(self) -> None:
+        lines = [
+            f"Live ranking: {self.completed}/{self.total} tickers, "
+            f"{len(self.ranked)} tradeable",
+            f"   {'#':<3} {'Ticker':<8} {'Name':<20} {'Score':<7} {'VRP':<8} {'Implied':<9} {'Liquidity':<12}",
+        ]
+        for i, r in enumerate(self.ranked[:self.rows], 1):
+            lines.append(f"   {i:<3} {self._format_row(r)}")
+
+        if self._drawn_lines:
+            self.stream.write(_CURSOR_UP.format(self._drawn_lines) + _CLEAR_DOWN)
+        self.stream.write("\n".join(lines) + "\n")
+        self.stream.flush()
+        self._drawn_lines = len(lines)
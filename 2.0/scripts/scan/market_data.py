@@ -11,6 +11,7 @@ from datetime import date
 from typing import Dict, Optional, Tuple
 
 from src.container import Container
+from src.domain.types import OptionChain
 from src.infrastructure.cache.hybrid_cache import HybridCache
 
 from .constants import (
@@ -104,29 +105,43 @@ def clean_company_name(name: str) -> str:
     return cleaned.strip()
 
 
-def get_ticker_info(ticker: str) -> Tuple[Optional[float], Optional[str]]:
+def get_ticker_info(
+    ticker: str,
+    container: Optional[Container] = None,
+) -> Tuple[Optional[float], Optional[str]]:
     """
     Get market cap (in millions) and company name in a single API call (OPTIMIZED).
 
     This combines get_market_cap_millions() and get_ticker_name() to reduce
     API calls by 50% and improve performance.
 
+    With a container, the persistent ticker metadata cache is consulted first
+    and fetched values are written back, so tickers seen within its TTL never
+    reach yfinance.
+
     Args:
         ticker: Stock ticker symbol
+        container: DI container for the persistent metadata cache (optional)
 
     Returns:
         Tuple of (market_cap_millions, company_name) or (None, None) if unavailable
     """
-    if not _ensure_yfinance():
-        logger.debug(f"{ticker}: yfinance not available, skipping ticker info lookup")
-        return (None, None)
-
     # Check cache first
     if ticker in _ticker_info_cache:
         cached_value = _ticker_info_cache[ticker]
         logger.debug(f"{ticker}: Ticker info from cache: market_cap={cached_value[0]}, name={cached_value[1]}")
         return cached_value
 
+    if container is not None:
+        persisted = container.ticker_metadata.get(ticker)
+        if persisted is not None:
+            _ticker_info_cache[ticker] = persisted
+            return persisted
+
+    if not _ensure_yfinance():
+        logger.debug(f"{ticker}: yfinance not available, skipping ticker info lookup")
+        return (None, None)
+
     try:
         # Thread-safe API rate limiting - CRITICAL: Keep lock until API call completes
         with _api_call_lock:
@@ -155,6 +170,8 @@ def get_ticker_info(ticker: str) -> Tuple[Optional[float], Optional[str]]:
         # Cache the result
         result = (market_cap_millions, cleaned_name)
         _ticker_info_cache[ticker] = result
+        if container is not None:
+            container.ticker_metadata.put(ticker, market_cap_millions, cleaned_name)
         return result
 
     except Exception as e:
@@ -164,15 +181,15 @@ def get_ticker_info(ticker: str) -> Tuple[Optional[float], Optional[str]]:
         return result
 
 
-def get_market_cap_millions(ticker: str) -> Optional[float]:
+def get_market_cap_millions(ticker: str, container: Optional[Container] = None) -> Optional[float]:
     """Get market cap in millions (convenience wrapper)."""
-    market_cap, _ = get_ticker_info(ticker)
+    market_cap, _ = get_ticker_info(ticker, container)
     return market_cap
 
 
-def get_ticker_name(ticker: str) -> Optional[str]:
+def get_ticker_name(ticker: str, container: Optional[Container] = None) -> Optional[str]:
     """Get company name (convenience wrapper)."""
-    _, name = get_ticker_info(ticker)
+    _, name = get_ticker_info(ticker, container)
     return name
 
 
@@ -280,6 +297,7 @@ def check_liquidity_hybrid(
     container: Container,
     max_loss_budget: float = 20000.0,
     use_dynamic_thresholds: bool = True,
+    chain: Optional[OptionChain] = None,
 ) -> Tuple[bool, str, Dict]:
     """
     Hybrid liquidity check using C-then-B approach with dynamic thresholds.
@@ -303,6 +321,8 @@ def check_liquidity_hybrid(
         container: DI container for API access
         max_loss_budget: Maximum loss budget (default $20,000)
         use_dynamic_thresholds: Whether to use dynamic or static thresholds
+        chain: Option chain already fetched for this expiration (skips the
+            Tradier call; used by the async pipeline)
 
     Returns:
         Tuple of (has_liquidity, display_tier, details)
@@ -318,17 +338,17 @@ def check_liquidity_hybrid(
         return cached
 
     try:
-        # Get option chain
-        tradier = container.tradier
-        chain_result = tradier.get_option_chain(ticker, expiration)
+        # Get option chain (unless the caller already has it)
+        if chain is None:
+            chain_result = container.tradier.get_option_chain(ticker, expiration)
 
-        if chain_result.is_err:
-            logger.debug(f"{ticker}: No option chain available for hybrid check")
-            result = (False, "REJECT", {'method': 'NO_CHAIN', 'error': str(chain_result.error)})
-            _hybrid_liquidity_cache[cache_key] = result
-            return result
+            if chain_result.is_err:
+                logger.debug(f"{ticker}: No option chain available for hybrid check")
+                result = (False, "REJECT", {'method': 'NO_CHAIN', 'error': str(chain_result.error)})
+                _hybrid_liquidity_cache[cache_key] = result
+                return result
 
-        chain = chain_result.value
+            chain = chain_result.value
 
         # Use LiquidityScorer's hybrid classification
         liquidity_scorer = container.liquidity_scorer
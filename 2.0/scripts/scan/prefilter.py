@@ -0,0 +1,173 @@
+"""
+Cheap-first prefilter - resolve a whole candidate list in bulk SQL before any API call.
+
+Every scan engine otherwise spends yfinance and Tradier calls on a ticker
+before learning it is below the market cap threshold, lacks weekly options
+or has too little history to score. Three queries answer those up front:
+
+1. historical_moves counts per ticker (tracked tickers and history depth)
+2. Cached ticker_metadata market caps
+3. Cached ticker_metadata weekly options flags
+
+Only cached facts reject a ticker. A ticker without a fresh cached value
+survives and is checked by the network stage as before.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+from src.application.services.ticker_metadata import METADATA_TTL_DAYS
+from src.container import Container
+from src.utils.concurrent_scanner import BatchScanResult, ScanResult
+
+from .constants import (
+    PREFILTER_CALLS_AVOIDED,
+    PREFILTER_WEEKLY_FLAG_TTL_DAYS,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PrefilterResult:
+    """
+    Outcome of the SQL prefilter.
+
+    rejected maps ticker -> (status, reason) where status is 'filtered'
+    (market cap, weekly options) or 'skip' (insufficient history), matching
+    ScanResult statuses. needs_backfill lists survivors without any history
+    (auto_backfill only), so callers can queue their backfill early.
+    """
+    survivors: List[str]
+    rejected: Dict[str, Tuple[str, str]] = field(default_factory=dict)
+    api_calls_avoided: int = 0
+    needs_backfill: List[str] = field(default_factory=list)
+
+    def scan_results(self) -> List[ScanResult]:
+        """ScanResult for every rejected ticker."""
+        return [
+            ScanResult(ticker=ticker, status=status, error=reason)
+            for ticker, (status, reason) in self.rejected.items()
+        ]
+
+    def merge_into(self, batch: BatchScanResult) -> BatchScanResult:
+        """Add the rejected tickers to a network-stage batch result."""
+        results = self.scan_results() + batch.results
+        return BatchScanResult(
+            results=results,
+            success_count=batch.success_count,
+            error_count=batch.error_count,
+            skip_count=batch.skip_count + sum(
+                1 for status, _ in self.rejected.values() if status == 'skip'
+            ),
+            filtered_count=batch.filtered_count + sum(
+                1 for status, _ in self.rejected.values() if status == 'filtered'
+            ),
+            total_duration_ms=batch.total_duration_ms,
+            avg_duration_ms=batch.total_duration_ms / len(results) if results else 0,
+        )
+
+    def log_summary(self) -> None:
+        """Log how many tickers were resolved without the network."""
+        if self.rejected:
+            logger.info(
+                f"🔍 Prefilter: {len(self.rejected)} of "
+                f"{len(self.rejected) + len(self.survivors)} tickers resolved from the database "
+                f"(~{self.api_calls_avoided} API calls avoided)"
+            )
+
+
+def _is_fresh(timestamp: Optional[str], ttl_days: int) -> bool:
+    """True if a SQLite CURRENT_TIMESTAMP value (UTC) is within ttl_days."""
+    if not timestamp:
+        return False
+    try:
+        recorded = datetime.fromisoformat(timestamp)
+    except ValueError:
+        return False
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return now - recorded <= timedelta(days=ttl_days)
+
+
+def prefilter_tickers(
+    container: Container,
+    tickers: List[str],
+    auto_backfill: bool = False,
+    skip_weekly_filter: bool = False,
+) -> PrefilterResult:
+    """
+    Reject tickers the database already proves will not produce a result.
+
+    Args:
+        container: DI container
+        tickers: Candidate tickers
+        auto_backfill: If True, tickers with no history survive (the network
+            stage backfills them); partial history is still rejected
+        skip_weekly_filter: If True, ignore cached weekly options flags
+
+    Returns:
+        PrefilterResult with survivors in input order
+    """
+    result = PrefilterResult(survivors=[])
+    if not tickers:
+        return result
+
+    counts_result = container.prices_repository.count_moves_batch(tickers)
+    metadata_result = container.ticker_metadata_repository.get_many(tickers)
+    if counts_result.is_err or metadata_result.is_err:
+        # Prefilter is an optimization - on DB errors let the network stage decide
+        logger.debug("Prefilter unavailable, checking every ticker over the network")
+        result.survivors = list(tickers)
+        return result
+
+    counts = counts_result.value
+    metadata = metadata_result.value
+    thresholds = container.config.thresholds
+    min_market_cap = thresholds.min_market_cap_millions
+    check_weekly = thresholds.require_weekly_options and not skip_weekly_filter
+    min_quarters = container.vrp_calculator.min_quarters
+
+    for ticker in tickers:
+        symbol = ticker.upper()
+        row = metadata.get(symbol, {})
+
+        # Same freshness window TickerMetadataService trusts its cache for
+        market_cap = row.get('market_cap')
+        if market_cap and _is_fresh(row.get('updated_at'), METADATA_TTL_DAYS):
+            market_cap_millions = market_cap / 1_000_000
+            if market_cap_millions < min_market_cap:
+                reason = f"Market cap ${market_cap_millions:.0f}M < ${min_market_cap:.0f}M"
+                result.rejected[ticker] = ('filtered', reason)
+                result.api_calls_avoided += PREFILTER_CALLS_AVOIDED['market_cap']
+                continue
+
+        if (check_weekly and row.get('has_weekly_options') is False
+                and _is_fresh(row.get('weekly_options_checked_at'), PREFILTER_WEEKLY_FLAG_TTL_DAYS)):
+            result.rejected[ticker] = ('filtered', "No weekly options")
+            result.api_calls_avoided += PREFILTER_CALLS_AVOIDED['weekly_options']
+            continue
+
+        count = counts.get(symbol, 0)
+        if count < min_quarters and not (auto_backfill and count == 0):
+            if count == 0:
+                reason = "No historical data"
+            else:
+                reason = f"Insufficient history ({count} < {min_quarters} quarters)"
+            result.rejected[ticker] = ('skip', reason)
+            result.api_calls_avoided += PREFILTER_CALLS_AVOIDED['history']
+            continue
+
+        if count == 0:
+            result.needs_backfill.append(ticker)
+        result.survivors.append(ticker)
+
+    return result
+
+
+def record_weekly_options(container: Container, ticker: str, has_weeklies: bool) -> None:
+    """Cache a weekly options check for the next prefilter run (best effort)."""
+    save_result = container.ticker_metadata_repository.save_weekly_options(ticker, has_weeklies)
+    if save_result.is_err:
+        logger.debug(f"{ticker}: Could not cache weekly options flag: {save_result.error}")
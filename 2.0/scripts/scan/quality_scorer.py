@@ -5,7 +5,7 @@ Multi-factor scoring that weighs risk-adjusted returns, not just VRP.
 """
 
 import logging
-from typing import List
+from typing import List, Optional
 
 from .constants import (
     SCORE_VRP_MAX_POINTS,
@@ -27,6 +27,7 @@ from .constants import (
     SCORE_MOVE_CHALLENGING_POINTS,
     SCORE_MOVE_EXTREME_POINTS,
     SCORE_DEFAULT_MOVE_POINTS,
+    TOP_K_MAX_IMPLIED_MOVE_PCT,
 )
 from .formatters import parse_liquidity_tier
 
@@ -111,6 +112,13 @@ def calculate_scan_quality_score(result: dict) -> float:
         logger.warning(f"Invalid vrp_ratio '{vrp_ratio}': {e}. Using 0.0")
         vrp_ratio = 0.0
 
+    # Implied moves above the straddle sanity ceiling are suspect data: score
+    # the VRP as if the move were at the ceiling. This also keeps
+    # quality_score_upper_bound() a true bound for scan --top K.
+    implied_ceiling_pct = _implied_pct(result.get('implied_move_pct'))
+    if implied_ceiling_pct is not None and implied_ceiling_pct > TOP_K_MAX_IMPLIED_MOVE_PCT:
+        vrp_ratio *= TOP_K_MAX_IMPLIED_MOVE_PCT / implied_ceiling_pct
+
     if SCORE_VRP_USE_LINEAR:
         # Continuous scaling: VRP 4.0 = 45pts, VRP 5.0 = 56pts, VRP 6.0 = 67pts
         # No hard cap - allows high VRP to differentiate from medium VRP
@@ -186,6 +194,62 @@ def calculate_scan_quality_score(result: dict) -> float:
     return round(total, 1)
 
 
+def _implied_pct(implied_move_pct) -> Optional[float]:
+    """Implied move as a float percentage, or None if missing or unparseable."""
+    if implied_move_pct is None:
+        return None
+    try:
+        if hasattr(implied_move_pct, 'value'):
+            return float(implied_move_pct.value)
+        return float(str(implied_move_pct).rstrip('%'))
+    except (TypeError, ValueError):
+        return None
+
+
+def quality_score_upper_bound(
+    historical_mean_pct: float,
+    max_implied_move_pct: float = TOP_K_MAX_IMPLIED_MOVE_PCT,
+) -> float:
+    """
+    Highest quality score a ticker can reach, knowing only its historical mean move.
+
+    The score depends on the unknown implied move I through VRP (I / mean,
+    non-decreasing in I) and move difficulty (non-increasing in I), plus at
+    most EXCELLENT liquidity. Each factor is piecewise linear or constant
+    between the scoring breakpoints, so the maximum over 0 <= I <= max lies
+    at a breakpoint or at the ends; those are the only points evaluated.
+
+    Used by scan --top K to stop analyzing tickers that cannot displace the
+    current top K. Larger implied moves score as if at max_implied_move_pct
+    (see calculate_scan_quality_score), so they stay within the bound.
+
+    Args:
+        historical_mean_pct: Mean historical move on the VRP metric (> 0)
+        max_implied_move_pct: Largest implied move considered possible
+
+    Returns:
+        Upper bound on calculate_scan_quality_score() for this ticker
+    """
+    breakpoints = {
+        0.0,
+        max_implied_move_pct,
+        SCORE_MOVE_BASELINE_PCT,
+        SCORE_MOVE_EASY_THRESHOLD,
+        SCORE_MOVE_MODERATE_THRESHOLD,
+        SCORE_MOVE_CHALLENGING_THRESHOLD,
+        SCORE_VRP_TARGET * historical_mean_pct,
+    }
+    return max(
+        calculate_scan_quality_score({
+            'vrp_ratio': implied_pct / historical_mean_pct,
+            'implied_move_pct': f"{implied_pct}%",
+            'liquidity_tier': 'EXCELLENT',
+        })
+        for implied_pct in breakpoints
+        if 0.0 <= implied_pct <= max_implied_move_pct
+    )
+
+
 def _precalculate_quality_scores(tradeable_results: List[dict]) -> None:
     """
     Pre-calculate quality scores for all tradeable results.
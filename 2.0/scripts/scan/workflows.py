@@ -6,10 +6,8 @@ Contains the main workflow functions that coordinate analysis across multiple ti
 
 import functools
 import logging
-import subprocess
 import sys
 from datetime import date, datetime, timedelta
-from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 from tqdm import tqdm
@@ -21,12 +19,23 @@ from src.infrastructure.data_sources.earnings_whisper_scraper import (
     get_week_monday
 )
 from src.application.filters.weekly_options import has_weekly_options
+from src.utils.concurrent_scanner import BatchScanResult
+
+from . import async_pipeline
+from .checkpoint import ScanCheckpoint, checkpoint_key
+from .live_table import LiveRankingTable
+from .prefilter import PrefilterResult, prefilter_tickers, record_weekly_options
 
 from .constants import (
-    BACKFILL_TIMEOUT_SECONDS,
-    BACKFILL_YEARS,
     LIQUIDITY_PRIORITY_ORDER,
 )
+from .analysis_common import (
+    analysis_result,
+    log_liquidity,
+    log_vrp,
+    unscored_result,
+    wait_for_backfill,
+)
 from .date_utils import (
     calculate_expiration_date,
     calculate_implied_move_expiration,
@@ -87,7 +96,7 @@ def analyze_ticker(
         logger.info(f"Expiration: {expiration_date}")
 
         # Fetch company name early (for result dictionaries)
-        company_name = get_ticker_name(ticker)
+        company_name = get_ticker_name(ticker, container)
 
         # Check for weekly options (opt-in filter via REQUIRE_WEEKLY_OPTIONS)
         has_weeklies = True  # Default: permissive
@@ -101,6 +110,7 @@ def analyze_ticker(
                     expirations_list,
                     earnings_date.isoformat()
                 )
+                record_weekly_options(container, ticker, has_weeklies)
                 if not has_weeklies:
                     logger.info(f"\u2717 {ticker}: No weekly options - {weekly_reason}")
                     return None
@@ -167,97 +177,30 @@ def analyze_ticker(
 
             # Auto-backfill if enabled (for ticker mode/list mode)
             if auto_backfill:
-                logger.info(f"\U0001f4ca Auto-backfilling historical earnings data for {ticker}...")
-
-                # Calculate start date (3 years ago)
-                start_date = (date.today() - timedelta(days=BACKFILL_YEARS*365)).isoformat()
-                end_date = (date.today() - timedelta(days=1)).isoformat()
-
-                try:
-                    # Call backfill script
-                    result = subprocess.run(
-                        [
-                            sys.executable,
-                            "scripts/backfill_historical.py",
-                            ticker,
-                            "--start-date", start_date,
-                            "--end-date", end_date
-                        ],
-                        cwd=Path(__file__).parent.parent.parent,
-                        capture_output=True,
-                        text=True,
-                        timeout=BACKFILL_TIMEOUT_SECONDS
+                status = wait_for_backfill(container, ticker)
+                if status != 'SUCCESS':
+                    return unscored_result(
+                        ticker, company_name, earnings_date, expiration_date,
+                        implied_move, status
                     )
 
-                    if result.returncode == 0:
-                        logger.info(f"\u2713 Backfill complete for {ticker}")
-
-                        # Retry fetching historical moves
-                        logger.info("\U0001f4ca Retrying historical data fetch...")
-                        hist_result = prices_repo.get_historical_moves(ticker, limit=12)
-
-                        if hist_result.is_err:
-                            logger.warning(f"\u2717 Still no historical data after backfill: {hist_result.error}")
-                            return {
-                                'ticker': ticker,
-                                'ticker_name': company_name,
-                                'earnings_date': str(earnings_date),
-                                'expiration_date': str(expiration_date),
-                                'implied_move_pct': str(implied_move.implied_move_pct),
-                                'stock_price': float(implied_move.stock_price.amount),
-                                'status': 'NO_HISTORICAL_DATA',
-                                'tradeable': False
-                            }
-                    else:
-                        logger.warning(f"\u2717 Backfill failed for {ticker}: {result.stderr}")
-                        return {
-                            'ticker': ticker,
-                            'ticker_name': company_name,
-                            'earnings_date': str(earnings_date),
-                            'expiration_date': str(expiration_date),
-                            'implied_move_pct': str(implied_move.implied_move_pct),
-                            'stock_price': float(implied_move.stock_price.amount),
-                            'status': 'BACKFILL_FAILED',
-                            'tradeable': False
-                        }
-
-                except subprocess.TimeoutExpired:
-                    logger.warning(f"\u2717 Backfill timeout for {ticker}")
-                    return {
-                        'ticker': ticker,
-                        'ticker_name': company_name,
-                        'earnings_date': str(earnings_date),
-                        'expiration_date': str(expiration_date),
-                        'implied_move_pct': str(implied_move.implied_move_pct),
-                        'stock_price': float(implied_move.stock_price.amount),
-                        'status': 'BACKFILL_TIMEOUT',
-                        'tradeable': False
-                    }
-                except Exception as e:
-                    logger.warning(f"\u2717 Backfill error for {ticker}: {e}")
-                    return {
-                        'ticker': ticker,
-                        'ticker_name': company_name,
-                        'earnings_date': str(earnings_date),
-                        'expiration_date': str(expiration_date),
-                        'implied_move_pct': str(implied_move.implied_move_pct),
-                        'stock_price': float(implied_move.stock_price.amount),
-                        'status': 'BACKFILL_ERROR',
-                        'tradeable': False
-                    }
+                # Retry fetching historical moves
+                logger.info("\U0001f4ca Retrying historical data fetch...")
+                hist_result = prices_repo.get_historical_moves(ticker, limit=12)
+
+                if hist_result.is_err:
+                    logger.warning(f"\u2717 Still no historical data after backfill: {hist_result.error}")
+                    return unscored_result(
+                        ticker, company_name, earnings_date, expiration_date,
+                        implied_move, 'NO_HISTORICAL_DATA'
+                    )
             else:
                 # No auto-backfill - suggest manual backfill
                 logger.info("   Run: python scripts/backfill_historical.py " + ticker)
-                return {
-                    'ticker': ticker,
-                    'ticker_name': company_name,
-                    'earnings_date': str(earnings_date),
-                    'expiration_date': str(expiration_date),
-                    'implied_move_pct': str(implied_move.implied_move_pct),
-                    'stock_price': float(implied_move.stock_price.amount),
-                    'status': 'NO_HISTORICAL_DATA',
-                    'tradeable': False
-                }
+                return unscored_result(
+                    ticker, company_name, earnings_date, expiration_date,
+                    implied_move, 'NO_HISTORICAL_DATA'
+                )
 
         historical_moves = hist_result.value
         logger.info(f"\u2713 Found {len(historical_moves)} historical moves")
@@ -276,12 +219,7 @@ def analyze_ticker(
             return None
 
         vrp = vrp_result.value
-
-        logger.info(f"\u2713 VRP Ratio: {vrp.vrp_ratio:.2f}x")
-        logger.info(f"  Implied Move: {vrp.implied_move_pct}")
-        logger.info(f"  Historical Mean: {vrp.historical_mean_move_pct}")
-        logger.info(f"  Edge Score: {vrp.edge_score:.2f}")
-        logger.info(f"  Recommendation: {vrp.recommendation.value.upper()}")
+        log_vrp(vrp)
 
         # CRITICAL: Check liquidity tier using HYBRID approach (C-then-B with dynamic thresholds)
         implied_move_pct = float(str(implied_move.implied_move_pct).rstrip('%'))
@@ -293,60 +231,7 @@ def analyze_ticker(
             max_loss_budget=20000.0,
             use_dynamic_thresholds=True,
         )
-
-        # Log hybrid liquidity details
-        if hybrid_details and hybrid_details.get('method') not in ('NO_CHAIN', 'ERROR', 'FAILED'):
-            thresholds = hybrid_details.get('thresholds', {})
-            oi_ratio = hybrid_details.get('oi_ratio')
-            oi_tier = hybrid_details.get('oi_tier', 'N/A')
-            spread_tier = hybrid_details.get('spread_tier', 'N/A')
-            price_tier = thresholds.get('price_tier', 'N/A')
-            spread_width = thresholds.get('spread_width', 'N/A')
-            contracts = thresholds.get('contracts', 'N/A')
-            max_spread = max(hybrid_details.get('call_spread_pct', 0), hybrid_details.get('put_spread_pct', 0))
-            logger.info(f"  Liquidity Tier: {liquidity_tier} (Hybrid {hybrid_details['method']})")
-            logger.info(f"    Call ${hybrid_details['call_strike']:.0f} OI={hybrid_details['call_oi']:,}, "
-                       f"Put ${hybrid_details['put_strike']:.0f} OI={hybrid_details['put_oi']:,}")
-            logger.info(f"    Position: {contracts} contracts \u00d7 ${spread_width} spread ({price_tier} tier)")
-            # Show tier breakdown
-            oi_icon = {'EXCELLENT': '\u2713', 'GOOD': '\u2713', 'WARNING': '\u26a0\ufe0f', 'REJECT': '\u274c'}.get(oi_tier, '?')
-            spread_icon = {'EXCELLENT': '\u2713', 'GOOD': '\u2713', 'WARNING': '\u26a0\ufe0f', 'REJECT': '\u274c'}.get(spread_tier, '?')
-            logger.info(f"    OI: {oi_ratio:.1f}x \u2192 {oi_tier} {oi_icon} | Spread: {max_spread:.0f}% \u2192 {spread_tier} {spread_icon}")
-        else:
-            logger.info(f"  Liquidity Tier: {liquidity_tier}")
-
-        # 4-Tier Warning Messages
-        tier_clean = liquidity_tier.replace('*', '')
-        if tier_clean == "GOOD":
-            logger.info(f"\n\u2713 GOOD liquidity for {ticker}")
-            oi_tier = hybrid_details.get('oi_tier', 'N/A')
-            spread_tier = hybrid_details.get('spread_tier', 'N/A')
-            if oi_tier == "GOOD":
-                oi_ratio = hybrid_details.get('oi_ratio', 0)
-                logger.info(f"   OI/Position ratio {oi_ratio:.1f}x (2-5x) - adequate for full size")
-            if spread_tier == "GOOD":
-                max_spread = max(hybrid_details.get('call_spread_pct', 0), hybrid_details.get('put_spread_pct', 0))
-                logger.info(f"   Bid/ask spread {max_spread:.0f}% (8-12%) - acceptable slippage")
-        elif tier_clean == "WARNING":
-            logger.warning(f"\n\u26a0\ufe0f  WARNING: Low liquidity detected for {ticker}")
-            oi_tier = hybrid_details.get('oi_tier', 'N/A')
-            spread_tier = hybrid_details.get('spread_tier', 'N/A')
-            if oi_tier == "WARNING":
-                oi_ratio = hybrid_details.get('oi_ratio', 0)
-                logger.warning(f"   OI/Position ratio {oi_ratio:.1f}x (1-2x) - consider reducing size")
-            if spread_tier == "WARNING":
-                max_spread = max(hybrid_details.get('call_spread_pct', 0), hybrid_details.get('put_spread_pct', 0))
-                logger.warning(f"   Bid/ask spread {max_spread:.0f}% (>12%) - expect slippage")
-        elif tier_clean == "REJECT":
-            logger.warning(f"\n\u274c CRITICAL: Very low liquidity for {ticker}")
-            oi_tier = hybrid_details.get('oi_tier', 'N/A')
-            spread_tier = hybrid_details.get('spread_tier', 'N/A')
-            if oi_tier == "REJECT":
-                oi_ratio = hybrid_details.get('oi_ratio', 0)
-                logger.warning(f"   OI/Position ratio {oi_ratio:.1f}x (<1x) - DO NOT TRADE at full size")
-            if spread_tier == "REJECT":
-                max_spread = max(hybrid_details.get('call_spread_pct', 0), hybrid_details.get('put_spread_pct', 0))
-                logger.warning(f"   Bid/ask spread {max_spread:.0f}% (>15%) - DO NOT TRADE")
+        log_liquidity(ticker, liquidity_tier, hybrid_details)
 
         if vrp.is_tradeable:
             logger.info("\n\u2705 TRADEABLE OPPORTUNITY")
@@ -363,28 +248,10 @@ def analyze_ticker(
                 directional_bias = skew_result.value.directional_bias.value.replace('_', ' ').upper()
                 logger.info(f"  Directional Bias: {directional_bias}")
 
-        # Build hybrid liquidity info for result
-        oi_ratio = None
-        if hybrid_details and hybrid_details.get('oi_ratio'):
-            oi_ratio = hybrid_details['oi_ratio']
-
-        return {
-            'ticker': ticker,
-            'ticker_name': company_name,
-            'earnings_date': str(earnings_date),
-            'expiration_date': str(expiration_date),
-            'stock_price': float(implied_move.stock_price.amount),
-            'implied_move_pct': str(vrp.implied_move_pct),
-            'historical_mean_pct': str(vrp.historical_mean_move_pct),
-            'vrp_ratio': float(vrp.vrp_ratio),
-            'edge_score': float(vrp.edge_score),
-            'recommendation': vrp.recommendation.value,
-            'is_tradeable': vrp.is_tradeable,
-            'liquidity_tier': liquidity_tier,  # CRITICAL ADDITION
-            'liquidity_oi_ratio': oi_ratio,  # NEW: OI/Position ratio from hybrid check
-            'directional_bias': directional_bias,  # NEW: Directional bias from skew
-            'status': 'SUCCESS'
-        }
+        return analysis_result(
+            ticker, company_name, earnings_date, expiration_date, implied_move,
+            vrp, liquidity_tier, hybrid_details, directional_bias
+        )
 
     except Exception as e:
         logger.error(f"\u2717 Error analyzing {ticker}: {e}", exc_info=True)
@@ -424,16 +291,193 @@ def analyze_ticker_concurrent(
     )
 
 
+def _fetch_earnings_lookup(
+    container: Container,
+    tickers: List[str],
+    threaded: bool = False
+) -> Dict[str, Tuple[date, str]]:
+    """
+    Build ticker -> (earnings_date, timing value) for the parallel modes.
+
+    Lookups run concurrently on the async engine and one by one otherwise.
+    """
+    if not threaded:
+        return async_pipeline.fetch_earnings_lookup(container, tickers)
+
+    earnings_lookup: Dict[str, Tuple[date, str]] = {}
+    for ticker in tickers:
+        earnings_info = fetch_earnings_for_ticker(container, ticker)
+        if earnings_info:
+            earnings_date, timing = earnings_info
+            earnings_lookup[ticker] = (earnings_date, timing.value)
+        else:
+            logger.info(f"\u23ed\ufe0f  {ticker}: No upcoming earnings found")
+    return earnings_lookup
+
+
+def _skip_prefiltered(prefilter: PrefilterResult, ticker: str, pbar) -> Optional[str]:
+    """
+    Log and report a ticker the SQL prefilter rejected.
+
+    Returns:
+        'filtered' or 'skip' if the ticker was rejected, else None
+    """
+    if ticker not in prefilter.rejected:
+        return None
+    status, reason = prefilter.rejected[ticker]
+    label = "Filtered" if status == 'filtered' else "Skipped"
+    logger.info(f"\u23ed\ufe0f  {ticker}: {label} ({reason})")
+    pbar.set_postfix_str(f"{ticker}: {label}")
+    sys.stderr.flush()
+    return status
+
+
+def _queue_backfill(container: Container, prefilter: PrefilterResult) -> None:
+    """
+    Start backfilling every survivor without history in the background.
+
+    analyze_ticker() later waits on the same BackfillQueue futures, so the
+    scan keeps analyzing other tickers while these batches download.
+    """
+    if not prefilter.needs_backfill:
+        return
+    logger.info(
+        f"\U0001f4ca Queued background backfill for {len(prefilter.needs_backfill)} "
+        f"tickers without history"
+    )
+    container.backfill_queue.submit_many(prefilter.needs_backfill)
+
+
+def _resume_checkpointed(
+    checkpoint: ScanCheckpoint, ticker: str, results: List[dict], pbar
+) -> Optional[str]:
+    """
+    Reuse a ticker completed by an earlier run (--resume).
+
+    Appends its analysis result, if any, to results.
+
+    Returns:
+        The checkpointed status ('success', 'filtered' or 'skip'), else None
+    """
+    resumed = checkpoint.completed.get(ticker.upper())
+    if resumed is None:
+        return None
+    if resumed.data:
+        results.append(resumed.data)
+    logger.info(f"\u267b\ufe0f  {ticker}: Resumed from checkpoint ({resumed.status})")
+    pbar.set_postfix_str(f"{ticker}: Resumed")
+    sys.stderr.flush()
+    return resumed.status
+
+
+def _run_parallel_scan(
+    container: Container,
+    earnings_lookup: Dict[str, Tuple[date, str]],
+    expiration_offset: Optional[int],
+    skip_weekly_filter: bool,
+    progress_callback,
+    threaded: bool = False,
+    top_k: Optional[int] = None,
+    checkpoint: Optional[ScanCheckpoint] = None
+) -> Tuple[BatchScanResult, str]:
+    """
+    Analyze every ticker in earnings_lookup on the selected parallel engine.
+
+    Args:
+        container: DI container
+        earnings_lookup: Dict mapping ticker -> (earnings_date, timing value)
+        expiration_offset: Custom expiration offset in days
+        skip_weekly_filter: If True, skip weekly options filter
+        progress_callback: Callback(ticker, completed, total)
+        threaded: If True, use the legacy ConcurrentScanner thread pool
+            instead of the asyncio pipeline
+        top_k: Stop analyzing tickers that cannot reach the top K (asyncio only)
+        checkpoint: Journal for finished tickers; its resumed tickers are not
+            analyzed again and are merged into the result
+
+    Returns:
+        Tuple of (BatchScanResult, engine name for logging)
+    """
+    if checkpoint is not None:
+        checkpoint.log_summary()
+        earnings_lookup = {
+            ticker: earnings_lookup[ticker] for ticker in checkpoint.pending(list(earnings_lookup))
+        }
+
+    def merge(batch_result: BatchScanResult) -> BatchScanResult:
+        merged = prefilter.merge_into(batch_result)
+        return checkpoint.merge_into(merged) if checkpoint is not None else merged
+
+    def on_result(result) -> None:
+        if checkpoint is not None:
+            checkpoint.record(result)
+
+    # Resolve what the database already knows before any API call
+    prefilter = prefilter_tickers(
+        container, list(earnings_lookup), skip_weekly_filter=skip_weekly_filter
+    )
+    prefilter.log_summary()
+    earnings_lookup = {ticker: earnings_lookup[ticker] for ticker in prefilter.survivors}
+
+    if not threaded:
+        # Results stream into a live leaderboard instead of progress lines
+        table = LiveRankingTable(total=len(earnings_lookup))
+
+        def update_table(result) -> None:
+            table.update(result)
+            on_result(result)
+
+        try:
+            batch_result = async_pipeline.run_async_scan(
+                container,
+                earnings_lookup,
+                expiration_offset=expiration_offset,
+                skip_weekly_filter=skip_weekly_filter,
+                top_k=top_k,
+                result_callback=update_table,
+            )
+        finally:
+            table.close()
+        return merge(batch_result), "asyncio"
+
+    if top_k is not None:
+        logger.warning("--top is only supported by the asyncio engine; scanning every ticker")
+
+    # Create filter function with container closure
+    def filter_func(ticker: str, expiration: date) -> Tuple[bool, Optional[str]]:
+        return filter_ticker_concurrent(ticker, expiration, container)
+
+    # Bind skip_weekly_filter to analyze function for weekly options filter
+    analyze_func = functools.partial(analyze_ticker_concurrent, skip_weekly_filter=skip_weekly_filter)
+    scanner = container.concurrent_scanner
+    batch_result = scanner.scan_tickers(
+        tickers=list(earnings_lookup.keys()),
+        earnings_lookup=earnings_lookup,
+        analyze_func=analyze_func,
+        filter_func=filter_func,
+        expiration_offset=expiration_offset or 0,
+        progress_callback=progress_callback,
+        result_callback=on_result,
+    )
+    return merge(batch_result), "threaded"
+
+
 def scanning_mode_parallel(
     container: Container,
     scan_date: date,
     expiration_offset: Optional[int] = None,
-    skip_weekly_filter: bool = False
+    skip_weekly_filter: bool = False,
+    threaded: bool = False,
+    top_k: Optional[int] = None,
+    resume: bool = False
 ) -> int:
     """
-    Parallel scanning mode: Scan earnings using ConcurrentScanner.
+    Parallel scanning mode: Scan earnings on the asyncio pipeline.
 
-    Uses thread pool for ~5x speedup on multi-ticker scans.
+    Set threaded=True for the legacy ConcurrentScanner thread pool. With top_k,
+    only the K best tradeable results are shown and, on the asyncio engine,
+    tickers that cannot reach them are not analyzed. With resume, tickers
+    checkpointed by an interrupted run of the same scan are reused.
     Returns exit code (0 for success, 1 for error)
     """
     logger.info("=" * 80)
@@ -455,30 +499,21 @@ def scanning_mode_parallel(
     for ticker, earnings_date, timing in earnings_events:
         earnings_lookup[ticker] = (earnings_date, timing.value)
 
-    tickers = list(earnings_lookup.keys())
-
-    logger.info(f"Starting parallel scan of {len(tickers)} tickers...")
-
-    # Create filter function with container closure
-    def filter_func(ticker: str, expiration: date) -> Tuple[bool, Optional[str]]:
-        return filter_ticker_concurrent(ticker, expiration, container)
+    logger.info(f"Starting parallel scan of {len(earnings_lookup)} tickers...")
 
     # Progress callback for logging
     def progress_callback(ticker: str, completed: int, total: int):
         if completed % 5 == 0 or completed == total:
             logger.info(f"Progress: {completed}/{total} ({completed*100//total}%)")
 
-    # Run concurrent scan
-    # Bind skip_weekly_filter to analyze function for weekly options filter
-    analyze_func = functools.partial(analyze_ticker_concurrent, skip_weekly_filter=skip_weekly_filter)
-    scanner = container.concurrent_scanner
-    batch_result = scanner.scan_tickers(
-        tickers=tickers,
-        earnings_lookup=earnings_lookup,
-        analyze_func=analyze_func,
-        filter_func=filter_func,
-        expiration_offset=expiration_offset or 0,
-        progress_callback=progress_callback,
+    checkpoint = ScanCheckpoint(
+        container, 'scan',
+        checkpoint_key(str(scan_date), expiration_offset, skip_weekly_filter),
+        resume=resume,
+    )
+    batch_result, engine = _run_parallel_scan(
+        container, earnings_lookup, expiration_offset, skip_weekly_filter,
+        progress_callback, threaded, top_k, checkpoint
     )
 
     # Extract results
@@ -488,7 +523,7 @@ def scanning_mode_parallel(
             results.append(scan_result.data)
 
     # Log statistics
-    logger.info(f"\n\U0001f4ca Parallel Scan Complete:")
+    logger.info(f"\n\U0001f4ca Parallel Scan Complete ({engine}):")
     logger.info(f"   Total time: {batch_result.total_duration_ms:.0f}ms")
     logger.info(f"   Avg per ticker: {batch_result.avg_duration_ms:.0f}ms")
     logger.info(f"   Success: {batch_result.success_count}")
@@ -505,7 +540,8 @@ def scanning_mode_parallel(
         filtered_count=batch_result.filtered_count,
         mode_name="SCAN MODE",
         scan_date=scan_date,
-        total_events=len(earnings_events)
+        total_events=len(earnings_events),
+        top_k=top_k
     )
 
 
@@ -514,7 +550,10 @@ def scanning_mode(
     scan_date: date,
     expiration_offset: Optional[int] = None,
     parallel: bool = False,
-    skip_weekly_filter: bool = False
+    skip_weekly_filter: bool = False,
+    threaded: bool = False,
+    top_k: Optional[int] = None,
+    resume: bool = False
 ) -> int:
     """
     Scanning mode: Scan earnings for a specific date.
@@ -525,12 +564,20 @@ def scanning_mode(
         expiration_offset: Custom expiration offset in days
         parallel: If True, use parallel processing (5x speedup)
         skip_weekly_filter: If True, skip weekly options filter
+        threaded: If True, parallel mode uses the legacy thread pool instead of asyncio
+        top_k: Show only the K best tradeable results (parallel asyncio mode
+            also stops analyzing tickers that cannot reach them)
+        resume: Reuse tickers checkpointed within CHECKPOINT_FRESHNESS_HOURS
+            by an interrupted run with the same options
 
     Returns exit code (0 for success, 1 for error)
     """
     # Use parallel mode if requested
     if parallel:
-        return scanning_mode_parallel(container, scan_date, expiration_offset, skip_weekly_filter)
+        return scanning_mode_parallel(
+            container, scan_date, expiration_offset, skip_weekly_filter, threaded, top_k,
+            resume
+        )
 
     logger.info("=" * 80)
     logger.info("SCANNING MODE: Earnings Date Scan")
@@ -565,10 +612,38 @@ def scanning_mode(
 
     min_dte = container.config.thresholds.min_dte
 
+    checkpoint = ScanCheckpoint(
+        container, 'scan',
+        checkpoint_key(str(scan_date), expiration_offset, skip_weekly_filter),
+        resume=resume,
+    )
+    checkpoint.log_summary()
+
+    # Resolve what the database already knows before any API call
+    prefilter = prefilter_tickers(
+        container, checkpoint.pending([ticker for ticker, _, _ in earnings_events]),
+        skip_weekly_filter=skip_weekly_filter
+    )
+    prefilter.log_summary()
+
     for ticker, earnings_date, timing in pbar:
         pbar.set_postfix_str(f"Current: {ticker}")
         sys.stderr.flush()  # Force flush after each update
 
+        resolved = (
+            _resume_checkpointed(checkpoint, ticker, results, pbar)
+            or _skip_prefiltered(prefilter, ticker, pbar)
+        )
+        if resolved == 'success':
+            success_count += 1
+            continue
+        if resolved == 'filtered':
+            filtered_count += 1
+            continue
+        if resolved == 'skip':
+            skip_count += 1
+            continue
+
         # Calculate expiration date
         expiration_date = calculate_expiration_date(
             earnings_date, timing, expiration_offset, min_dte=min_dte
@@ -582,6 +657,7 @@ def scanning_mode(
         )
 
         if filter_result:
+            checkpoint.record_filtered(ticker, filter_reason)
             filtered_count += 1
             logger.info(f"\u23ed\ufe0f  {ticker}: Filtered ({filter_reason})")
             pbar.set_postfix_str(f"{ticker}: Filtered")
@@ -599,6 +675,7 @@ def scanning_mode(
         )
 
         if result:
+            checkpoint.record_analysis(ticker, result)
             results.append(result)
             if result['status'] == 'SUCCESS':
                 success_count += 1
@@ -652,7 +729,7 @@ def scanning_mode(
         has_oi_only = any(r.get('liquidity_tier', '').endswith('*') for r in tradeable)
 
         # Table rows
-        for i, r in enumerate(sorted(tradeable, key=sort_key_scan), 1):
+        for i, r in enumerate(sorted(tradeable, key=sort_key_scan)[:top_k], 1):
             ticker = r['ticker']
             # Truncate ticker name to 20 chars at word boundary (don't split words)
             full_name = r.get('ticker_name', '') if r.get('ticker_name') else ''
@@ -704,12 +781,18 @@ def ticker_mode_parallel(
     container: Container,
     tickers: List[str],
     expiration_offset: Optional[int] = None,
-    skip_weekly_filter: bool = False
+    skip_weekly_filter: bool = False,
+    threaded: bool = False,
+    top_k: Optional[int] = None,
+    resume: bool = False
 ) -> int:
     """
-    Parallel ticker mode: Analyze tickers using ConcurrentScanner.
+    Parallel ticker mode: Analyze tickers on the asyncio pipeline.
 
-    Uses thread pool for ~5x speedup on multi-ticker analysis.
+    Set threaded=True for the legacy ConcurrentScanner thread pool. With top_k,
+    only the K best tradeable results are shown and, on the asyncio engine,
+    tickers that cannot reach them are not analyzed. With resume, tickers
+    checkpointed by an interrupted run are reused.
     Returns exit code (0 for success, 1 for error)
     """
     logger.info("=" * 80)
@@ -718,43 +801,30 @@ def ticker_mode_parallel(
     logger.info(f"Tickers: {', '.join(tickers)}")
     logger.info("")
 
-    # Build earnings lookup for each ticker
-    earnings_lookup: Dict[str, Tuple[date, str]] = {}
+    checkpoint = ScanCheckpoint(
+        container, 'ticker',
+        checkpoint_key('tickers', expiration_offset, skip_weekly_filter),
+        resume=resume, tickers=tickers,
+    )
+    pending = checkpoint.pending(tickers)
 
+    # Build earnings lookup for each ticker
     logger.info("Fetching earnings dates...")
-    for ticker in tickers:
-        earnings_info = fetch_earnings_for_ticker(container, ticker)
-        if earnings_info:
-            earnings_date, timing = earnings_info
-            earnings_lookup[ticker] = (earnings_date, timing.value)
-        else:
-            logger.info(f"\u23ed\ufe0f  {ticker}: No upcoming earnings found")
+    earnings_lookup = _fetch_earnings_lookup(container, pending, threaded)
 
-    if not earnings_lookup:
+    if not earnings_lookup and not checkpoint.completed:
         logger.warning("No earnings found for any requested tickers")
         return 0
 
     logger.info(f"Starting parallel analysis of {len(earnings_lookup)} tickers...")
 
-    # Create filter function with container closure
-    def filter_func(ticker: str, expiration: date) -> Tuple[bool, Optional[str]]:
-        return filter_ticker_concurrent(ticker, expiration, container)
-
     # Progress callback for logging
     def progress_callback(ticker: str, completed: int, total: int):
         logger.info(f"Progress: {completed}/{total} - {ticker}")
 
-    # Run concurrent scan
-    # Bind skip_weekly_filter to analyze function for weekly options filter
-    analyze_func = functools.partial(analyze_ticker_concurrent, skip_weekly_filter=skip_weekly_filter)
-    scanner = container.concurrent_scanner
-    batch_result = scanner.scan_tickers(
-        tickers=list(earnings_lookup.keys()),
-        earnings_lookup=earnings_lookup,
-        analyze_func=analyze_func,
-        filter_func=filter_func,
-        expiration_offset=expiration_offset or 0,
-        progress_callback=progress_callback,
+    batch_result, engine = _run_parallel_scan(
+        container, earnings_lookup, expiration_offset, skip_weekly_filter,
+        progress_callback, threaded, top_k, checkpoint
     )
 
     # Extract results
@@ -764,7 +834,7 @@ def ticker_mode_parallel(
             results.append(scan_result.data)
 
     # Log statistics
-    logger.info(f"\n\U0001f4ca Parallel Analysis Complete:")
+    logger.info(f"\n\U0001f4ca Parallel Analysis Complete ({engine}):")
     logger.info(f"   Total time: {batch_result.total_duration_ms:.0f}ms")
     logger.info(f"   Avg per ticker: {batch_result.avg_duration_ms:.0f}ms")
     logger.info(f"   Success: {batch_result.success_count}")
@@ -777,10 +847,11 @@ def ticker_mode_parallel(
         results=results,
         success_count=batch_result.success_count,
         error_count=batch_result.error_count,
-        skip_count=batch_result.skip_count + (len(tickers) - len(earnings_lookup)),
+        skip_count=batch_result.skip_count + (len(pending) - len(earnings_lookup)),
         filtered_count=batch_result.filtered_count,
         mode_name="TICKER MODE",
-        tickers=tickers
+        tickers=tickers,
+        top_k=top_k
     )
 
 
@@ -789,7 +860,10 @@ def ticker_mode(
     tickers: List[str],
     expiration_offset: Optional[int] = None,
     parallel: bool = False,
-    skip_weekly_filter: bool = False
+    skip_weekly_filter: bool = False,
+    threaded: bool = False,
+    top_k: Optional[int] = None,
+    resume: bool = False
 ) -> int:
     """
     Ticker mode: Analyze specific tickers from command line.
@@ -800,12 +874,20 @@ def ticker_mode(
         expiration_offset: Custom expiration offset in days
         parallel: If True, use parallel processing (5x speedup)
         skip_weekly_filter: If True, skip weekly options filter
+        threaded: If True, parallel mode uses the legacy thread pool instead of asyncio
+        top_k: Show only the K best tradeable results (parallel asyncio mode
+            also stops analyzing tickers that cannot reach them)
+        resume: Reuse tickers checkpointed within CHECKPOINT_FRESHNESS_HOURS
+            by an interrupted run with the same options
 
     Returns exit code (0 for success, 1 for error)
     """
     # Use parallel mode if requested and we have multiple tickers
     if parallel and len(tickers) > 1:
-        return ticker_mode_parallel(container, tickers, expiration_offset, skip_weekly_filter)
+        return ticker_mode_parallel(
+            container, tickers, expiration_offset, skip_weekly_filter, threaded, top_k,
+            resume
+        )
 
     logger.info("=" * 80)
     logger.info("TICKER MODE: Command Line Tickers")
@@ -833,10 +915,39 @@ def ticker_mode(
 
     min_dte = container.config.thresholds.min_dte
 
+    checkpoint = ScanCheckpoint(
+        container, 'ticker',
+        checkpoint_key('tickers', expiration_offset, skip_weekly_filter),
+        resume=resume, tickers=tickers,
+    )
+    checkpoint.log_summary()
+
+    # Resolve what the database already knows before any API call
+    prefilter = prefilter_tickers(
+        container, checkpoint.pending(tickers), auto_backfill=True,
+        skip_weekly_filter=skip_weekly_filter
+    )
+    prefilter.log_summary()
+    _queue_backfill(container, prefilter)
+
     for ticker in pbar:
         pbar.set_postfix_str(f"Current: {ticker}")
         sys.stderr.flush()  # Force flush after each update
 
+        resolved = (
+            _resume_checkpointed(checkpoint, ticker, results, pbar)
+            or _skip_prefiltered(prefilter, ticker, pbar)
+        )
+        if resolved == 'success':
+            success_count += 1
+            continue
+        if resolved == 'filtered':
+            filtered_count += 1
+            continue
+        if resolved == 'skip':
+            skip_count += 1
+            continue
+
         # Fetch earnings date for ticker (DB first, API fallback)
         earnings_info = fetch_earnings_for_ticker(container, ticker)
 
@@ -861,6 +972,7 @@ def ticker_mode(
         )
 
         if filter_result:
+            checkpoint.record_filtered(ticker, filter_reason)
             filtered_count += 1
             logger.info(f"\u23ed\ufe0f  {ticker}: Filtered ({filter_reason})")
             pbar.set_postfix_str(f"{ticker}: Filtered")
@@ -882,6 +994,7 @@ def ticker_mode(
         )
 
         if result:
+            checkpoint.record_analysis(ticker, result)
             results.append(result)
             if result['status'] == 'SUCCESS':
                 success_count += 1
@@ -935,7 +1048,7 @@ def ticker_mode(
         has_oi_only = any(r.get('liquidity_tier', '').endswith('*') for r in tradeable)
 
         # Table rows
-        for i, r in enumerate(sorted(tradeable, key=sort_key_ticker), 1):
+        for i, r in enumerate(sorted(tradeable, key=sort_key_ticker)[:top_k], 1):
             ticker = r['ticker']
             # Truncate ticker name to 20 chars at word boundary (don't split words)
             full_name = r.get('ticker_name', '') if r.get('ticker_name') else ''
@@ -990,12 +1103,15 @@ def whisper_mode_parallel(
     monday: date,
     week_end: date,
     expiration_offset: Optional[int] = None,
-    skip_weekly_filter: bool = False
+    skip_weekly_filter: bool = False,
+    threaded: bool = False,
+    top_k: Optional[int] = None,
+    resume: bool = False
 ) -> int:
     """
-    Parallel whisper mode: Analyze anticipated earnings using ConcurrentScanner.
+    Parallel whisper mode: Analyze anticipated earnings on the asyncio pipeline.
 
-    Uses thread pool for ~5x speedup on multi-ticker analysis.
+    Like the sequential mode, tickers reporting outside the target week are skipped.
 
     Args:
         container: DI container
@@ -1004,6 +1120,9 @@ def whisper_mode_parallel(
         week_end: End of week (Sunday)
         expiration_offset: Custom expiration offset in days
         skip_weekly_filter: If True, skip weekly options filter
+        threaded: If True, use the legacy ConcurrentScanner thread pool
+        top_k: Show only the K best tradeable results, stopping early on asyncio
+        resume: Reuse tickers checkpointed by an interrupted run of this week
 
     Returns:
         Exit code (0 = success, 1 = error)
@@ -1011,44 +1130,37 @@ def whisper_mode_parallel(
     logger.info("")
     logger.info("\U0001f680 Using PARALLEL processing for faster analysis...")
 
-    # Build earnings lookup for each ticker
-    earnings_lookup: Dict[str, Tuple[date, str]] = {}
+    checkpoint = ScanCheckpoint(
+        container, 'whisper',
+        checkpoint_key(monday.strftime('%Y-%m-%d'), expiration_offset, skip_weekly_filter),
+        resume=resume, tickers=tickers,
+    )
+    pending = checkpoint.pending(tickers)
 
+    # Build earnings lookup for each ticker
     logger.info("Fetching earnings dates...")
-    for ticker in tickers:
-        earnings_info = fetch_earnings_for_ticker(container, ticker)
-        if earnings_info:
-            earnings_date, timing = earnings_info
-            earnings_lookup[ticker] = (earnings_date, timing.value)
-        else:
-            logger.info(f"\u23ed\ufe0f  {ticker}: No upcoming earnings found")
+    earnings_lookup = _fetch_earnings_lookup(container, pending, threaded)
+
+    # Check if earnings date is within target week
+    for ticker, (earnings_date, _) in list(earnings_lookup.items()):
+        if not (monday.date() <= earnings_date <= week_end.date()):
+            logger.info(f"\u23ed\ufe0f  {ticker}: Earnings {earnings_date} outside target week ({monday.date()} to {week_end.date()})")
+            del earnings_lookup[ticker]
 
-    if not earnings_lookup:
+    if not earnings_lookup and not checkpoint.completed:
         logger.warning("No earnings found for any anticipated tickers")
         return 0
 
     logger.info(f"Starting parallel analysis of {len(earnings_lookup)} tickers...")
 
-    # Create filter function with container closure
-    def filter_func(ticker: str, expiration: date) -> Tuple[bool, Optional[str]]:
-        return filter_ticker_concurrent(ticker, expiration, container)
-
     # Progress callback for logging
     def progress_callback(ticker: str, completed: int, total: int):
         if completed % 5 == 0 or completed == total:
             logger.info(f"Progress: {completed}/{total} ({completed*100//total}%)")
 
-    # Run concurrent scan
-    # Bind skip_weekly_filter to analyze function for weekly options filter
-    analyze_func = functools.partial(analyze_ticker_concurrent, skip_weekly_filter=skip_weekly_filter)
-    scanner = container.concurrent_scanner
-    batch_result = scanner.scan_tickers(
-        tickers=list(earnings_lookup.keys()),
-        earnings_lookup=earnings_lookup,
-        analyze_func=analyze_func,
-        filter_func=filter_func,
-        expiration_offset=expiration_offset or 0,
-        progress_callback=progress_callback,
+    batch_result, engine = _run_parallel_scan(
+        container, earnings_lookup, expiration_offset, skip_weekly_filter,
+        progress_callback, threaded, top_k, checkpoint
     )
 
     # Extract results
@@ -1063,7 +1175,7 @@ def whisper_mode_parallel(
         validate_tradeable_earnings_dates(tradeable, container)
 
     # Log statistics
-    logger.info(f"\n\U0001f4ca Parallel Analysis Complete:")
+    logger.info(f"\n\U0001f4ca Parallel Analysis Complete ({engine}):")
     logger.info(f"   Total time: {batch_result.total_duration_ms:.0f}ms")
     logger.info(f"   Avg per ticker: {batch_result.avg_duration_ms:.0f}ms")
     logger.info(f"   Success: {batch_result.success_count}")
@@ -1076,10 +1188,11 @@ def whisper_mode_parallel(
         results=results,
         success_count=batch_result.success_count,
         error_count=batch_result.error_count,
-        skip_count=batch_result.skip_count + (len(tickers) - len(earnings_lookup)),
+        skip_count=batch_result.skip_count + (len(pending) - len(earnings_lookup)),
         filtered_count=batch_result.filtered_count,
         mode_name="WHISPER MODE",
-        week_range=(monday, week_end)
+        week_range=(monday, week_end),
+        top_k=top_k
     )
 
 
@@ -1089,7 +1202,10 @@ def whisper_mode(
     fallback_image: Optional[str] = None,
     expiration_offset: Optional[int] = None,
     parallel: bool = False,
-    skip_weekly_filter: bool = False
+    skip_weekly_filter: bool = False,
+    threaded: bool = False,
+    top_k: Optional[int] = None,
+    resume: bool = False
 ) -> int:
     """
     Whisper mode: Analyze most anticipated earnings.
@@ -1103,6 +1219,11 @@ def whisper_mode(
         expiration_offset: Custom expiration offset in days
         parallel: If True, use parallel processing (5x speedup)
         skip_weekly_filter: If True, skip weekly options filter
+        threaded: If True, parallel mode uses the legacy thread pool instead of asyncio
+        top_k: Show only the K best tradeable results (parallel asyncio mode
+            also stops analyzing tickers that cannot reach them)
+        resume: Reuse tickers checkpointed within CHECKPOINT_FRESHNESS_HOURS
+            by an interrupted run with the same options
 
     Returns:
         Exit code (0 = success, 1 = error)
@@ -1168,7 +1289,8 @@ def whisper_mode(
     # Use parallel mode if requested
     if parallel:
         return whisper_mode_parallel(
-            container, tickers, monday, week_end, expiration_offset, skip_weekly_filter
+            container, tickers, monday, week_end, expiration_offset, skip_weekly_filter,
+            threaded, top_k, resume
         )
 
     # Analyze each ticker
@@ -1191,10 +1313,39 @@ def whisper_mode(
 
     min_dte = container.config.thresholds.min_dte
 
+    checkpoint = ScanCheckpoint(
+        container, 'whisper',
+        checkpoint_key(monday.strftime('%Y-%m-%d'), expiration_offset, skip_weekly_filter),
+        resume=resume, tickers=tickers,
+    )
+    checkpoint.log_summary()
+
+    # Resolve what the database already knows before any API call
+    prefilter = prefilter_tickers(
+        container, checkpoint.pending(tickers), auto_backfill=True,
+        skip_weekly_filter=skip_weekly_filter
+    )
+    prefilter.log_summary()
+    _queue_backfill(container, prefilter)
+
     for ticker in pbar:
         pbar.set_postfix_str(f"Current: {ticker}")
         sys.stderr.flush()  # Force flush after each update
 
+        resolved = (
+            _resume_checkpointed(checkpoint, ticker, results, pbar)
+            or _skip_prefiltered(prefilter, ticker, pbar)
+        )
+        if resolved == 'success':
+            success_count += 1
+            continue
+        if resolved == 'filtered':
+            filtered_count += 1
+            continue
+        if resolved == 'skip':
+            skip_count += 1
+            continue
+
         # Fetch earnings date for ticker (DB first, API fallback)
         earnings_info = fetch_earnings_for_ticker(container, ticker)
 
@@ -1227,6 +1378,7 @@ def whisper_mode(
         )
 
         if filter_result:
+            checkpoint.record_filtered(ticker, filter_reason)
             filtered_count += 1
             logger.info(f"\u23ed\ufe0f  {ticker}: Filtered ({filter_reason})")
             pbar.set_postfix_str(f"{ticker}: Filtered")
@@ -1248,6 +1400,7 @@ def whisper_mode(
         )
 
         if result:
+            checkpoint.record_analysis(ticker, result)
             results.append(result)
             if result['status'] == 'SUCCESS':
                 success_count += 1
@@ -1309,7 +1462,7 @@ def whisper_mode(
 
         # Table rows with day separators
         prev_earnings_date = None
-        for i, r in enumerate(sorted(tradeable, key=sort_key), 1):
+        for i, r in enumerate(sorted(tradeable, key=sort_key)[:top_k], 1):
             ticker = r['ticker']
             # Truncate ticker name to 20 chars at word boundary (don't split words)
             full_name = r.get('ticker_name', '') if r.get('ticker_name') else ''
@@ -16,6 +16,7 @@ Usage:
     python scripts/store_bias_prediction.py --start 2025-12-01 --end 2025-12-07
 """
 
+import atexit
 import sys
 import argparse
 import logging
@@ -238,6 +239,7 @@ def main():
     # Initialize container
     config = Config.from_env()
     container = Container(config)
+    atexit.register(container.close)  # return shared rate limit leases
     db_path = str(config.database.path)
 
     print("=" * 70)
@@ -29,6 +29,7 @@ Usage:
     python scripts/sync_earnings_calendar.py --cleanup-dupes --dry-run
 """
 
+import atexit
 import sys
 import argparse
 import logging
@@ -941,9 +942,11 @@ def main():
     logger.info("=" * 80)
 
     # Initialize data sources
+    rate_limiter = create_alpha_vantage_limiter(db_path)
+    atexit.register(rate_limiter.close)  # return shared rate limit leases
     alpha_vantage = AlphaVantageAPI(
         api_key=os.getenv("ALPHA_VANTAGE_KEY", ""),
-        rate_limiter=create_alpha_vantage_limiter(),
+        rate_limiter=rate_limiter,
     )
     yahoo_finance = YahooFinanceEarnings()
 
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Warm the persistent ticker metadata cache (market cap, company name).
+
+Scans read market cap and company name from the ticker_metadata table and
+only call yfinance for entries older than the TTL (7 days). Run this
+overnight so the next day's scans never wait on yfinance: it refreshes
+every stale entry for upcoming earnings (and optionally every ticker with
+history) concurrently, then writes them in one transaction.
+
+Designed to run as a nightly cron job (recommended: after the 8 PM ET
+earnings calendar sync).
+
+Usage:
+    # Refresh stale entries for tickers reporting in the next 14 days
+    python scripts/warm_ticker_metadata.py
+
+    # Longer horizon, plus every ticker with historical moves
+    python scripts/warm_ticker_metadata.py --days 30 --all
+
+    # Show what would be refreshed
+    python scripts/warm_ticker_metadata.py --dry-run
+"""
+
+import argparse
+import asyncio
+import atexit
+import logging
+import sqlite3
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import List
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config.config import Config
+from src.container import Container
+from src.infrastructure.api.yfinance_async import AsyncYFinance
+from src.utils.logging import setup_logging
+
+logger = logging.getLogger(__name__)
+
+# Default horizon for upcoming earnings
+DEFAULT_DAYS = 14
+
+# Concurrent yfinance lookups
+DEFAULT_WORKERS = 5
+
+
+def candidate_tickers(db_path: Path, days: int, include_history: bool) -> List[str]:
+    """Tickers reporting within `days` (and, optionally, every ticker with history)."""
+    today = date.today()
+    conn = sqlite3.connect(str(db_path), timeout=30)
+    try:
+        tickers = [row[0] for row in conn.execute(
+            """
+            SELECT DISTINCT ticker FROM earnings_calendar
+            WHERE earnings_date BETWEEN ? AND ?
+            ORDER BY ticker
+            """,
+            (today.isoformat(), (today + timedelta(days=days)).isoformat()),
+        )]
+        if include_history:
+            seen = set(tickers)
+            tickers.extend(
+                row[0] for row in conn.execute(
+                    "SELECT DISTINCT ticker FROM historical_moves ORDER BY ticker"
+                )
+                if row[0] not in seen
+            )
+    finally:
+        conn.close()
+    return tickers
+
+
+async def refresh(container: Container, tickers: List[str], workers: int) -> int:
+    """Fetch ticker info concurrently and persist it. Returns entries written."""
+    async with AsyncYFinance(max_workers=workers) as yf:
+        infos = await yf.get_ticker_infos(tickers)
+    return container.ticker_metadata.put_many(infos)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Refresh stale ticker metadata (market cap, company name) ahead of scans"
+    )
+    parser.add_argument(
+        "--days", type=int, default=DEFAULT_DAYS,
+        help=f"Upcoming earnings horizon in days (default: {DEFAULT_DAYS})",
+    )
+    parser.add_argument(
+        "--all", action="store_true",
+        help="Also refresh every ticker with historical moves",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=DEFAULT_WORKERS,
+        help=f"Concurrent yfinance lookups (default: {DEFAULT_WORKERS})",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="List stale tickers only")
+    args = parser.parse_args()
+
+    setup_logging()
+    container = Container(Config.from_env(), skip_validation=True)
+    atexit.register(container.close)  # return shared rate limit leases
+
+    tickers = candidate_tickers(container.config.database.path, args.days, args.all)
+    stale = container.ticker_metadata.stale(tickers)
+    logger.info(f"Ticker metadata: {len(tickers) - len(stale)}/{len(tickers)} fresh, {len(stale)} stale")
+
+    if not stale:
+        return 0
+    if args.dry_run:
+        logger.info(f"Would refresh: {', '.join(stale)}")
+        return 0
+
+    start = time.perf_counter()
+    written = asyncio.run(refresh(container, stale, args.workers))
+    elapsed = time.perf_counter() - start
+    logger.info(f"✓ Refreshed {written}/{len(stale)} tickers in {elapsed:.1f}s")
+    if written < len(stale):
+        logger.info(f"  {len(stale) - written} tickers returned no data (retried next run)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
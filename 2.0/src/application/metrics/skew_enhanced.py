@@ -116,7 +116,25 @@ class SkewAnalyzerEnhanced:
         if chain_result.is_err:
             return Err(chain_result.error)
 
-        chain = chain_result.value
+        return self.analyze_chain(ticker, expiration, chain_result.value)
+
+    def analyze_chain(
+        self,
+        ticker: str,
+        expiration: date,
+        chain: OptionChain
+    ) -> Result[SkewAnalysis, AppError]:
+        """
+        Analyze volatility skew of an option chain that is already fetched.
+
+        Args:
+            ticker: Stock symbol
+            expiration: Option expiration date
+            chain: Option chain for that expiration
+
+        Returns:
+            Result with SkewAnalysis or AppError
+        """
         stock_price = float(chain.stock_price.amount)
 
         # Collect skew points (distance from ATM, skew value)
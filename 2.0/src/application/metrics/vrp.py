@@ -27,7 +27,7 @@ Default: close_move_pct for apples-to-apples comparison with implied move.
 import logging
 import numpy as np
 from datetime import date
-from typing import List
+from typing import List, Optional
 from src.domain.types import (
     Percentage,
     VRPResult,
@@ -80,6 +80,27 @@ class VRPCalculator:
                 f"Must be 'close', 'intraday', or 'gap'"
             )
 
+    def historical_mean(self, historical_moves: List[HistoricalMove]) -> Optional[float]:
+        """
+        Mean historical move (%) on the configured metric.
+
+        The same mean calculate() divides the implied move by, so callers can
+        bound a ticker's VRP before fetching its option chain.
+
+        Args:
+            historical_moves: Past earnings moves
+
+        Returns:
+            Mean move percentage, or None if calculate() would reject the data
+        """
+        if len(historical_moves) < self.min_quarters:
+            return None
+        attribute = f"{self.move_metric}_move_pct"
+        mean_move = float(np.mean([float(getattr(move, attribute).value) for move in historical_moves]))
+        if mean_move <= 0 or np.isnan(mean_move) or np.isinf(mean_move):
+            return None
+        return mean_move
+
     def calculate(
         self,
         ticker: str,
@@ -0,0 +1,258 @@
+"""
+Backfill queue - in-process earnings history backfill for the scanners.
+
+Tickers without historical moves used to be backfilled by spawning
+scripts/backfill_historical.py once per ticker and waiting for it. They are
+now submitted to one background worker that drains the queue in batches:
+price histories in a batch are fetched concurrently under the Twelve Data
+rate limit, and all of the batch's moves are written in one executemany
+transaction.
+
+submit() returns a Future, so a scan can queue every ticker that needs
+history up front and keep analyzing others until it needs the result.
+Works for both engines: the threaded scanner blocks on Future.result(),
+the asyncio pipeline awaits asyncio.wrap_future().
+"""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from src.application.services.earnings_backfill import (
+    EarningsMove,
+    calculate_moves,
+    get_twelve_data_prices,
+    load_events,
+    save_moves,
+)
+from src.utils.rate_limiter import CompositeRateLimiter
+
+logger = logging.getLogger(__name__)
+
+# Concurrent Twelve Data requests per batch (the rate limiter still applies)
+DEFAULT_MAX_CONCURRENT = 4
+
+# How long the worker waits for more tickers before starting a batch
+DEFAULT_BATCH_WINDOW_SECONDS = 0.5
+
+DEFAULT_MAX_BATCH = 8
+
+# Price window padding around the earnings range (prev/next trading days)
+PRICE_PADDING_DAYS = 10
+
+# Longest wait for a rate limit token before a ticker fails
+RATE_LIMIT_TIMEOUT_SECONDS = 90.0
+
+
+class BackfillQueue:
+    """
+    Batched, rate-limited backfill of historical earnings moves.
+
+    Thread-safe. Each submitted ticker resolves to the number of moves
+    saved; a ticker already backfilled in this process is not fetched again
+    (a failed one is retried on the next submit).
+    """
+
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        rate_limiter: Optional[CompositeRateLimiter] = None,
+        years: Optional[int] = None,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+        batch_window: float = DEFAULT_BATCH_WINDOW_SECONDS,
+        max_batch: int = DEFAULT_MAX_BATCH,
+    ):
+        """
+        Initialize queue (the worker thread starts on first submit).
+
+        Args:
+            db_path: Path to SQLite database
+            rate_limiter: Twelve Data limiter (see create_twelve_data_limiter)
+            years: Years of history to backfill (default: BACKFILL_YEARS)
+            max_concurrent: Concurrent price fetches per batch
+            batch_window: Seconds to collect tickers into a batch
+            max_batch: Maximum tickers per batch
+        """
+        self.db_path = Path(db_path)
+        self.rate_limiter = rate_limiter
+        if years is None:
+            # Lazy import: scripts.scan imports the container, which imports us
+            from scripts.scan.constants import BACKFILL_YEARS
+            years = BACKFILL_YEARS
+        self.years = years
+        self.max_concurrent = max_concurrent
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self._queue: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._futures: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        self._batches = 0
+        self._moves_saved = 0
+        self._failures = 0
+
+    def submit(self, ticker: str) -> Future:
+        """
+        Queue ticker for backfill.
+
+        Args:
+            ticker: Stock ticker symbol
+
+        Returns:
+            Future resolving to the number of moves saved
+        """
+        ticker = ticker.upper()
+        with self._lock:
+            future = self._futures.get(ticker)
+            if future is not None and not self._failed(future):
+                return future
+
+            future = Future()
+            self._futures[ticker] = future
+            self._queue.put(ticker)
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run, name="backfill-queue", daemon=True
+                )
+                self._worker.start()
+            return future
+
+    @staticmethod
+    def _failed(future: Future) -> bool:
+        """True if future was cancelled or resolved with an error."""
+        return future.cancelled() or (future.done() and future.exception() is not None)
+
+    def submit_many(self, tickers: List[str]) -> Dict[str, Future]:
+        """Queue several tickers. Returns dict mapping ticker -> Future."""
+        return {ticker.upper(): self.submit(ticker) for ticker in tickers}
+
+    def _run(self) -> None:
+        """Worker loop: collect a batch, process it, repeat until closed."""
+        while True:
+            ticker = self._queue.get()
+            if ticker is None:
+                return
+
+            batch = [ticker]
+            deadline = time.monotonic() + self.batch_window
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    ticker = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if ticker is None:
+                    self._queue.put(None)  # Finish this batch, then stop
+                    break
+                batch.append(ticker)
+
+            try:
+                self._process(batch)
+            except Exception as e:
+                # Never leave a waiter hanging on an unexpected failure
+                logger.error(f"Backfill batch failed: {e}")
+                for ticker in batch:
+                    future = self._futures[ticker]
+                    if not future.done():
+                        future.set_exception(e)
+
+    def _fetch(self, ticker: str) -> List[EarningsMove]:
+        """Events and prices for one ticker, turned into moves (not saved)."""
+        end_date = date.today() - timedelta(days=1)
+        start_date = date.today() - timedelta(days=self.years * 365)
+
+        events = load_events(ticker, self.db_path, start_date, end_date)
+        if not events:
+            logger.warning(f"{ticker}: No earnings events to backfill")
+            return []
+
+        if self.rate_limiter is not None and not self.rate_limiter.wait_for_token(
+            timeout=RATE_LIMIT_TIMEOUT_SECONDS
+        ):
+            raise TimeoutError("Twelve Data rate limit exhausted")
+
+        prices = get_twelve_data_prices(
+            ticker,
+            min(e.date for e in events) - timedelta(days=PRICE_PADDING_DAYS),
+            max(e.date for e in events) + timedelta(days=PRICE_PADDING_DAYS),
+        )
+        if not prices:
+            raise RuntimeError("No price data")
+
+        return calculate_moves(events, prices)
+
+    def _process(self, batch: List[str]) -> None:
+        """Fetch a batch concurrently, save it in one transaction, resolve futures."""
+        # A ticker cancelled and resubmitted is queued twice; resolve it once
+        futures: Dict[str, Future] = {}
+        with self._lock:
+            for ticker in dict.fromkeys(batch):
+                future = self._futures[ticker]
+                if not (future.done() or future.running()):
+                    future.set_running_or_notify_cancel()
+                    futures[ticker] = future
+        batch = list(futures)
+        if not batch:
+            return
+
+        start = time.perf_counter()
+        moves_by_ticker: Dict[str, List[EarningsMove]] = {}
+        errors: Dict[str, Exception] = {}
+
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrent, len(batch))) as executor:
+            pending = {ticker: executor.submit(self._fetch, ticker) for ticker in batch}
+            for ticker, fetch in pending.items():
+                try:
+                    moves_by_ticker[ticker] = fetch.result()
+                except Exception as e:
+                    logger.warning(f"✗ Backfill error for {ticker}: {e}")
+                    errors[ticker] = e
+
+        all_moves = [m for moves in moves_by_ticker.values() for m in moves]
+        saved = save_moves(self.db_path, all_moves)
+        if all_moves and not saved:
+            write_error = RuntimeError("Failed to save historical moves")
+            errors.update({ticker: write_error for ticker in moves_by_ticker})
+            moves_by_ticker.clear()
+
+        with self._lock:
+            self._batches += 1
+            self._moves_saved += saved
+            self._failures += len(errors)
+
+        for ticker, future in futures.items():
+            if ticker in errors:
+                future.set_exception(errors[ticker])
+            else:
+                future.set_result(len(moves_by_ticker[ticker]))
+
+        logger.info(
+            f"📊 Backfilled {len(batch) - len(errors)}/{len(batch)} tickers "
+            f"({saved} moves, one transaction) in {time.perf_counter() - start:.1f}s"
+        )
+
+    def get_stats(self) -> dict:
+        """Batches processed, moves saved, failed tickers and queue depth."""
+        with self._lock:
+            return {
+                'batches': self._batches,
+                'moves_saved': self._moves_saved,
+                'failures': self._failures,
+                'queued': self._queue.qsize(),
+            }
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Stop the worker after queued tickers are processed."""
+        with self._lock:
+            worker = self._worker
+            self._worker = None
+        if worker is not None and worker.is_alive():
+            self._queue.put(None)
+            worker.join(timeout)
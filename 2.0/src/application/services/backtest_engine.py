@@ -6,7 +6,7 @@ would have performed best.
 """
 
 import logging
-import sqlite3
+import sys
 import uuid
 from dataclasses import dataclass, asdict
 from datetime import date, timedelta
@@ -14,8 +14,14 @@ from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 import statistics
 
-from src.config.scoring_config import ScoringConfig
-from src.application.services.scorer import TickerScorer, TickerScore
+# Ensure common/ is importable (for production code outside pytest)
+_root = str(Path(__file__).resolve().parent.parent.parent.parent.parent)
+if _root not in sys.path:
+    sys.path.insert(0, _root)
+
+from common.db import connect  # noqa: E402
+from src.config.scoring_config import ScoringConfig  # noqa: E402
+from src.application.services.scorer import TickerScorer, TickerScore  # noqa: E402
 
 logger = logging.getLogger(__name__)
 
@@ -123,7 +129,7 @@ class BacktestEngine:
         Returns:
             List of (date, move_pct) tuples
         """
-        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        conn = connect(self.db_path, timeout=30)
         cursor = conn.cursor()
 
         cursor.execute(
@@ -267,7 +273,7 @@ class BacktestEngine:
         Returns:
             List of (ticker, earnings_date, actual_move) tuples
         """
-        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        conn = connect(self.db_path, timeout=30)
         cursor = conn.cursor()
 
         cursor.execute(
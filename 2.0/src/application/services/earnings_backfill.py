@@ -0,0 +1,550 @@
+"""
+Earnings backfill core - historical earnings moves from Twelve Data prices.
+
+Shared by scripts/backfill_historical.py (batch CLI) and the in-process
+BackfillQueue the scanners use for tickers without history. Handles BMO vs
+AMC timing correctly:
+- BMO: prev_day close -> earnings_day open
+- AMC: earnings_day close -> next_day open
+"""
+
+import logging
+import os
+import sqlite3
+from dataclasses import dataclass
+from datetime import date
+from enum import Enum
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+TWELVE_DATA_URL = "https://api.twelvedata.com/time_series"
+
+# Events needed before Yahoo Finance discovery is skipped
+MIN_DB_EVENTS = 4
+
+
+class EarningsTiming(Enum):
+    BMO = "bmo"  # Before Market Open
+    AMC = "amc"  # After Market Close
+    UNKNOWN = ""
+
+
+@dataclass
+class EarningsEvent:
+    """Earnings event with timing information."""
+    ticker: str
+    date: date
+    timing: EarningsTiming
+    eps_actual: Optional[float] = None
+    eps_estimate: Optional[float] = None
+
+
+@dataclass
+class DailyPrice:
+    """Daily OHLCV price data."""
+    date: date
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: int
+
+
+@dataclass
+class EarningsMove:
+    """Calculated earnings move."""
+    ticker: str
+    earnings_date: date
+    timing: EarningsTiming
+    prev_close: float
+    reaction_open: float
+    reaction_high: float
+    reaction_low: float
+    reaction_close: float
+    gap_move_pct: float
+    intraday_move_pct: float
+    close_move_pct: float
+    volume_before: int
+    volume_reaction: int
+
+
+def get_db_earnings(
+    ticker: str,
+    db_path: Path,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+) -> List[EarningsEvent]:
+    """
+    Get earnings dates with timing from existing database.
+
+    Args:
+        ticker: Stock symbol
+        db_path: Path to database
+        start_date: Optional start date filter
+        end_date: Optional end date filter
+
+    Returns:
+        List of EarningsEvent with timing info
+    """
+    try:
+        conn = sqlite3.connect(str(db_path), timeout=30.0)
+        cursor = conn.cursor()
+
+        query = """
+            SELECT ticker, earnings_date, timing
+            FROM earnings_calendar
+            WHERE ticker = ?
+        """
+        params = [ticker]
+
+        if start_date:
+            query += " AND earnings_date >= ?"
+            params.append(str(start_date))
+        if end_date:
+            query += " AND earnings_date <= ?"
+            params.append(str(end_date))
+
+        query += " ORDER BY earnings_date"
+
+        cursor.execute(query, params)
+        rows = cursor.fetchall()
+        conn.close()
+
+        events = []
+        for row in rows:
+            _, date_str, timing_str = row
+            event_date = date.fromisoformat(date_str)
+
+            # Parse timing
+            timing_str = (timing_str or "").lower()
+            if timing_str == "bmo":
+                timing = EarningsTiming.BMO
+            elif timing_str == "amc":
+                timing = EarningsTiming.AMC
+            else:
+                timing = EarningsTiming.UNKNOWN
+
+            events.append(EarningsEvent(
+                ticker=ticker,
+                date=event_date,
+                timing=timing,
+            ))
+
+        return events
+
+    except Exception as e:
+        logger.error(f"Error reading earnings from DB: {e}")
+        return []
+
+
+def discover_earnings_from_yahoo(
+    ticker: str,
+    db_path: Path,
+    start_date: Optional[date] = None,
+) -> int:
+    """
+    Discover historical earnings dates from Yahoo Finance and insert into earnings_calendar.
+
+    Yahoo Finance's earnings_dates DataFrame includes historical earnings with timestamps
+    that indicate BMO vs AMC timing. Dates with Reported EPS (not NaN) are confirmed past events.
+
+    Args:
+        ticker: Stock symbol
+        db_path: Path to database
+        start_date: Only insert dates on or after this date
+
+    Returns:
+        Number of new dates inserted
+    """
+    try:
+        import yfinance as yf
+    except ImportError:
+        logger.error("yfinance not installed - run: pip install yfinance")
+        return 0
+
+    try:
+        t = yf.Ticker(ticker)
+        ed = t.earnings_dates
+
+        if ed is None or ed.empty:
+            logger.warning(f"  No Yahoo Finance earnings_dates for {ticker}")
+            return 0
+
+        conn = sqlite3.connect(str(db_path), timeout=30.0)
+        cursor = conn.cursor()
+
+        import math
+
+        inserted = 0
+        for idx, row in ed.iterrows():
+            # Skip future/unconfirmed dates (no Reported EPS)
+            reported_eps = row.get("Reported EPS")
+            if reported_eps is None:
+                continue
+            try:
+                if math.isnan(reported_eps):
+                    continue
+            except (TypeError, ValueError):
+                continue
+
+            # Parse date from timezone-aware index
+            earnings_dt = idx.to_pydatetime()
+            earnings_d = earnings_dt.date()
+
+            # Apply start_date filter
+            if start_date and earnings_d < start_date:
+                continue
+
+            # Determine timing from hour
+            hour = earnings_dt.hour
+            if hour < 10:  # Before 10 AM = BMO
+                timing = "BMO"
+            elif hour >= 16:  # 4 PM or later = AMC
+                timing = "AMC"
+            else:
+                timing = ""  # UNKNOWN
+
+            # Insert if not already present
+            cursor.execute(
+                "SELECT 1 FROM earnings_calendar WHERE ticker = ? AND earnings_date = ?",
+                (ticker, str(earnings_d)),
+            )
+            if cursor.fetchone() is None:
+                cursor.execute(
+                    """INSERT INTO earnings_calendar (ticker, earnings_date, timing, confirmed)
+                       VALUES (?, ?, ?, 1)""",
+                    (ticker, str(earnings_d), timing),
+                )
+                inserted += 1
+                logger.info(f"  📅 Discovered: {earnings_d} {timing or 'UNKNOWN'}")
+
+        conn.commit()
+        conn.close()
+
+        if inserted > 0:
+            logger.info(f"  ✓ Yahoo Finance: discovered {inserted} new earnings dates for {ticker}")
+        else:
+            logger.info(f"  Yahoo Finance: no new dates to add for {ticker}")
+
+        return inserted
+
+    except Exception as e:
+        logger.error(f"  Yahoo Finance discovery error for {ticker}: {e}")
+        return 0
+
+
+def get_twelve_data_prices(
+    ticker: str,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    api_key: Optional[str] = None,
+) -> List[DailyPrice]:
+    """
+    Get historical daily prices from Twelve Data.
+
+    Args:
+        ticker: Stock symbol
+        start_date: Start date for data
+        end_date: End date for data
+        api_key: Twelve Data key (defaults to TWELVE_DATA_KEY env var)
+
+    Returns:
+        List of DailyPrice sorted by date descending
+    """
+    api_key = api_key or os.environ.get("TWELVE_DATA_KEY", "")
+    if not api_key:
+        logger.error("TWELVE_DATA_KEY not set")
+        return []
+
+    try:
+        url = TWELVE_DATA_URL
+        params = {
+            "symbol": ticker,
+            "interval": "1day",
+            "apikey": api_key,
+            "outputsize": 5000,  # Max available
+        }
+
+        if start_date:
+            params["start_date"] = start_date.isoformat()
+        if end_date:
+            params["end_date"] = end_date.isoformat()
+
+        response = requests.get(url, params=params, timeout=30)
+        response.raise_for_status()
+
+        data = response.json()
+
+        # Check for errors
+        if data.get("status") == "error":
+            logger.error(f"Twelve Data error: {data.get('message', 'Unknown error')}")
+            return []
+
+        values = data.get("values", [])
+        if not values:
+            logger.warning(f"No price data for {ticker}")
+            return []
+
+        prices = []
+        for v in values:
+            try:
+                prices.append(DailyPrice(
+                    date=date.fromisoformat(v["datetime"]),
+                    open=float(v["open"]),
+                    high=float(v["high"]),
+                    low=float(v["low"]),
+                    close=float(v["close"]),
+                    volume=int(v["volume"]),
+                ))
+            except (KeyError, ValueError) as ex:
+                logger.debug(f"Skipping malformed price: {ex}")
+                continue
+
+        # Sort by date descending
+        prices.sort(key=lambda x: x.date, reverse=True)
+        return prices
+
+    except requests.exceptions.RequestException as e:
+        logger.error(f"Twelve Data API error: {e}")
+        return []
+
+
+def calculate_earnings_move(
+    event: EarningsEvent,
+    prices: List[DailyPrice],
+) -> Optional[EarningsMove]:
+    """
+    Calculate earnings move with correct BMO/AMC handling.
+
+    BMO (Before Market Open):
+        - Earnings announced before market opens
+        - Stock reacts on earnings day
+        - Move = prev_day close -> earnings_day open
+
+    AMC (After Market Close):
+        - Earnings announced after market closes
+        - Stock reacts NEXT day
+        - Move = earnings_day close -> next_day open
+
+    UNKNOWN:
+        - Infer from price action by comparing gap magnitudes
+        - If next-day gap > same-day gap, likely AMC
+    """
+    # Build price lookup by date
+    price_map: Dict[date, DailyPrice] = {p.date: p for p in prices}
+    today = date.today()
+
+    earnings_date = event.date
+
+    # Safety check: Don't process same-day AMC or UNKNOWN earnings
+    # The reaction day hasn't happened yet (or is incomplete intraday)
+    if earnings_date >= today:
+        if event.timing == EarningsTiming.AMC:
+            logger.warning(f"  ⏳ Skipping {earnings_date} - AMC earnings, reaction day not complete")
+            return None
+        elif event.timing == EarningsTiming.UNKNOWN:
+            logger.warning(f"  ⏳ Skipping {earnings_date} - UNKNOWN timing, wait for reaction day")
+            return None
+        # BMO on today is OK if market has closed, but we'll let it proceed
+        # and fail naturally if next-day data isn't available
+
+    # Find trading days around earnings
+    sorted_dates = sorted(price_map.keys())
+
+    # Find earnings day index
+    if earnings_date not in price_map:
+        # Find closest trading day
+        closest = min(sorted_dates, key=lambda d: abs((d - earnings_date).days))
+        if abs((closest - earnings_date).days) > 3:
+            logger.warning(f"  No price data near {earnings_date}")
+            return None
+        earnings_date = closest
+        logger.debug(f"  Adjusted earnings date to {earnings_date}")
+
+    earnings_idx = sorted_dates.index(earnings_date)
+
+    # Get prev day (for BMO) or earnings day close (for AMC)
+    if earnings_idx == 0:
+        logger.warning(f"  No previous day data for {earnings_date}")
+        return None
+
+    prev_date = sorted_dates[earnings_idx - 1]
+    prev_price = price_map[prev_date]
+    earnings_price = price_map[earnings_date]
+
+    # Determine reaction day based on timing
+    effective_timing = event.timing
+
+    # For UNKNOWN timing, infer from price action
+    if event.timing == EarningsTiming.UNKNOWN and earnings_idx < len(sorted_dates) - 1:
+        next_date = sorted_dates[earnings_idx + 1]
+        next_price = price_map[next_date]
+
+        # Calculate gap magnitude for both scenarios
+        # BMO scenario: prev_close -> earnings_open
+        bmo_gap = abs((earnings_price.open - prev_price.close) / prev_price.close * 100) if prev_price.close else 0
+        # AMC scenario: earnings_close -> next_open
+        amc_gap = abs((next_price.open - earnings_price.close) / earnings_price.close * 100) if earnings_price.close else 0
+
+        # If next-day gap is significantly larger (>2x), likely AMC
+        # Also if next-day gap > 3% and same-day gap < 1%, likely AMC
+        if amc_gap > bmo_gap * 2 or (amc_gap > 3.0 and bmo_gap < 1.0):
+            effective_timing = EarningsTiming.AMC
+            logger.info(f"  📊 Inferred AMC timing: same-day gap {bmo_gap:.1f}% vs next-day gap {amc_gap:.1f}%")
+        else:
+            effective_timing = EarningsTiming.BMO
+            logger.debug(f"  📊 Inferred BMO timing: same-day gap {bmo_gap:.1f}% vs next-day gap {amc_gap:.1f}%")
+
+    if effective_timing == EarningsTiming.AMC:
+        # AMC: reaction is next trading day
+        if earnings_idx >= len(sorted_dates) - 1:
+            logger.warning(f"  No next day data for AMC earnings {earnings_date}")
+            return None
+
+        next_date = sorted_dates[earnings_idx + 1]
+        reaction_price = price_map[next_date]
+
+        # For AMC: prev_close is earnings_day close, reaction is next_day
+        reference_close = earnings_price.close
+        volume_before = earnings_price.volume
+
+        logger.debug(f"  AMC: {earnings_date} close ${reference_close:.2f} -> {next_date} open ${reaction_price.open:.2f}")
+
+    else:
+        # BMO: reaction is earnings day
+        reaction_price = earnings_price
+
+        # For BMO: prev_close is prev_day close
+        reference_close = prev_price.close
+        volume_before = prev_price.volume
+
+        logger.debug(f"  BMO: {prev_date} close ${reference_close:.2f} -> {earnings_date} open ${reaction_price.open:.2f}")
+
+    # Calculate moves
+    if reference_close == 0:
+        logger.warning("  Reference close is zero")
+        return None
+
+    # Gap move: reference close -> reaction open (preserves sign)
+    gap_move_pct = (reaction_price.open - reference_close) / reference_close * 100
+
+    # Intraday move: high-low range as % (always positive)
+    intraday_move_pct = abs((reaction_price.high - reaction_price.low) / reference_close * 100)
+
+    # Close move: reference close -> reaction close (preserves sign)
+    close_move_pct = (reaction_price.close - reference_close) / reference_close * 100
+
+    return EarningsMove(
+        ticker=event.ticker,
+        earnings_date=event.date,  # Original earnings date
+        timing=effective_timing,  # Use inferred timing if UNKNOWN was resolved
+        prev_close=reference_close,
+        reaction_open=reaction_price.open,
+        reaction_high=reaction_price.high,
+        reaction_low=reaction_price.low,
+        reaction_close=reaction_price.close,
+        gap_move_pct=gap_move_pct,
+        intraday_move_pct=intraday_move_pct,
+        close_move_pct=close_move_pct,
+        volume_before=volume_before,
+        volume_reaction=reaction_price.volume,
+    )
+
+
+def save_moves(db_path: Path, moves: List[EarningsMove]) -> int:
+    """
+    Save earnings moves (and their confirmed timing) in one transaction.
+
+    Args:
+        db_path: Path to database
+        moves: Moves for any number of tickers
+
+    Returns:
+        Number of moves saved (0 on database error)
+    """
+    if not moves:
+        return 0
+
+    try:
+        conn = sqlite3.connect(str(db_path), timeout=30.0)
+        try:
+            with conn:
+                # Update earnings_calendar with timing
+                conn.executemany('''
+                    INSERT OR REPLACE INTO earnings_calendar
+                    (ticker, earnings_date, timing, confirmed)
+                    VALUES (?, ?, ?, 1)
+                ''', [(m.ticker, str(m.earnings_date), m.timing.name) for m in moves])
+
+                # Update historical_moves
+                conn.executemany('''
+                    INSERT OR REPLACE INTO historical_moves
+                    (ticker, earnings_date, prev_close, earnings_open, earnings_high,
+                     earnings_low, earnings_close, intraday_move_pct, gap_move_pct,
+                     close_move_pct, volume_before, volume_earnings)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', [
+                    (
+                        m.ticker,
+                        str(m.earnings_date),
+                        m.prev_close,
+                        m.reaction_open,
+                        m.reaction_high,
+                        m.reaction_low,
+                        m.reaction_close,
+                        m.intraday_move_pct,
+                        m.gap_move_pct,
+                        m.close_move_pct,
+                        m.volume_before,
+                        m.volume_reaction,
+                    )
+                    for m in moves
+                ])
+        finally:
+            conn.close()
+        return len(moves)
+
+    except Exception as e:
+        logger.error(f"  Database error: {e}")
+        return 0
+
+
+def load_events(
+    ticker: str,
+    db_path: Path,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    force_discover: bool = False,
+) -> List[EarningsEvent]:
+    """
+    Earnings events for ticker, discovering dates from Yahoo Finance when the
+    database has fewer than MIN_DB_EVENTS (or when forced).
+    """
+    events = get_db_earnings(ticker, db_path, start_date, end_date)
+
+    if force_discover or len(events) < MIN_DB_EVENTS:
+        reason = "forced" if force_discover else f"only {len(events)} events in DB"
+        logger.info(f"🔍 Discovering earnings from Yahoo Finance ({reason})...")
+        discovered = discover_earnings_from_yahoo(ticker, db_path, start_date)
+        if discovered > 0:
+            events = get_db_earnings(ticker, db_path, start_date, end_date)
+
+    return events
+
+
+def calculate_moves(
+    events: List[EarningsEvent], prices: List[DailyPrice]
+) -> List[EarningsMove]:
+    """Calculate every event's move, dropping events without usable prices."""
+    moves = []
+    for event in events:
+        move = calculate_earnings_move(event, prices)
+        if move is None:
+            logger.warning(f"  ❌ Could not calculate move for {event.ticker} {event.date}")
+            continue
+        moves.append(move)
+    return moves
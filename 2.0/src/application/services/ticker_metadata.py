@@ -0,0 +1,131 @@
+"""
+Ticker metadata service - market cap and company name without blocking on yfinance.
+
+yfinance is slow and throttles us, yet market cap and company name change
+rarely. Entries persist in the ticker_metadata table with a TTL; the first
+lookup in a process loads every fresh row into an in-memory index with one
+query, so scans only call yfinance for tickers not seen within the TTL.
+
+The overnight warm-up (scripts/warm_ticker_metadata.py) refreshes stale
+entries in bulk so daytime scans start with a full index.
+"""
+
+import logging
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from src.infrastructure.database.repositories.ticker_metadata_repository import (
+    TickerMetadataRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+# Entries younger than this are served without calling yfinance
+METADATA_TTL_DAYS = 7
+
+# (market_cap_millions, company_name), as returned by get_ticker_info()
+TickerInfo = Tuple[Optional[float], Optional[str]]
+
+
+class TickerMetadataService:
+    """
+    Read-through cache of market cap and company name.
+
+    Thread-safe: the threaded scanner and the async pipeline's worker
+    threads share one instance via the container.
+    """
+
+    def __init__(self, repository: TickerMetadataRepository, ttl_days: int = METADATA_TTL_DAYS):
+        """
+        Initialize service.
+
+        Args:
+            repository: ticker_metadata persistence
+            ttl_days: Age after which an entry is refetched
+        """
+        self.repository = repository
+        self.ttl_days = ttl_days
+        self._index: Optional[Dict[str, TickerInfo]] = None
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def _load(self) -> Dict[str, TickerInfo]:
+        """Build the in-memory index from every fresh row (once per process)."""
+        with self._lock:
+            if self._index is None:
+                result = self.repository.get_fresh_info(self.ttl_days)
+                index: Dict[str, TickerInfo] = {}
+                if result.is_ok:
+                    for ticker, (market_cap, name) in result.value.items():
+                        index[ticker] = (
+                            market_cap / 1_000_000 if market_cap else None,
+                            name,
+                        )
+                else:
+                    logger.debug(f"Ticker metadata index unavailable: {result.error}")
+                self._index = index
+                logger.debug(f"Loaded {len(index)} fresh ticker metadata entries")
+            return self._index
+
+    def get(self, ticker: str) -> Optional[TickerInfo]:
+        """
+        Cached (market_cap_millions, company_name), or None if missing or stale.
+        """
+        info = self._load().get(ticker.upper())
+        with self._lock:
+            if info is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return info
+
+    def put(self, ticker: str, market_cap_millions: Optional[float], company_name: Optional[str]) -> None:
+        """
+        Record freshly fetched info. Empty lookups are not persisted so a
+        transient yfinance failure is retried on the next scan.
+        """
+        if market_cap_millions is None and company_name is None:
+            return
+        index = self._load()
+        with self._lock:
+            index[ticker.upper()] = (market_cap_millions, company_name)
+        market_cap = market_cap_millions * 1_000_000 if market_cap_millions else None
+        save_result = self.repository.save_info(ticker, market_cap, company_name)
+        if save_result.is_err:
+            logger.debug(f"{ticker}: Could not persist ticker metadata: {save_result.error}")
+
+    def put_many(self, infos: Dict[str, TickerInfo]) -> int:
+        """
+        Record many fetched infos in one transaction (warm-up).
+
+        Returns:
+            Number of entries persisted
+        """
+        rows = [
+            (ticker, market_cap * 1_000_000 if market_cap else None, name)
+            for ticker, (market_cap, name) in infos.items()
+            if market_cap is not None or name is not None
+        ]
+        index = self._load()
+        with self._lock:
+            for ticker, market_cap, name in rows:
+                index[ticker.upper()] = (market_cap / 1_000_000 if market_cap else None, name)
+        save_result = self.repository.save_info_many(rows)
+        if save_result.is_err:
+            logger.warning(f"Could not persist ticker metadata: {save_result.error}")
+            return 0
+        return save_result.value
+
+    def stale(self, tickers: List[str]) -> List[str]:
+        """Tickers without a fresh entry, in input order."""
+        index = self._load()
+        return [t for t in tickers if t.upper() not in index]
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get statistics."""
+        return {
+            'hits': self._hits,
+            'misses': self._misses,
+            'index_size': len(self._index or {}),
+        }
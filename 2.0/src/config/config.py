@@ -269,6 +269,9 @@ class RateLimitConfig:
     tradier_per_second: int = 10
     tradier_per_minute: int = 120
 
+    # Share limits with other local processes via the rate_limits table
+    shared: bool = True
+
 
 @dataclass(frozen=True)
 class ResilienceConfig:
@@ -463,6 +466,7 @@ class Config:
             alpha_vantage_per_day=int(os.getenv("ALPHA_VANTAGE_PER_DAY", "500")),
             tradier_per_second=int(os.getenv("TRADIER_PER_SECOND", "10")),
             tradier_per_minute=int(os.getenv("TRADIER_PER_MINUTE", "120")),
+            shared=os.getenv("SHARED_RATE_LIMITS", "true").lower() == "true",
         )
 
         # Resilience (Phase 1)
@@ -22,6 +22,12 @@ from src.infrastructure.database.repositories.earnings_repository import (
 from src.infrastructure.database.repositories.prices_repository import (
     PricesRepository,
 )
+from src.infrastructure.database.repositories.ticker_metadata_repository import (
+    TickerMetadataRepository,
+)
+from src.infrastructure.database.repositories.scan_checkpoint_repository import (
+    ScanCheckpointRepository,
+)
 from src.application.metrics.implied_move import ImpliedMoveCalculator
 from src.application.metrics.vrp import VRPCalculator
 from src.application.metrics.liquidity_scorer import LiquidityScorer
@@ -30,11 +36,14 @@ from src.application.metrics.adaptive_thresholds import AdaptiveThresholdCalcula
 from src.application.services.analyzer import TickerAnalyzer
 from src.application.services.strategy_generator import StrategyGenerator
 from src.application.services.health import HealthCheckService
+from src.application.services.ticker_metadata import TickerMetadataService
+from src.application.services.backfill_queue import BackfillQueue
 from src.application.async_metrics.vrp_analyzer_async import AsyncTickerAnalyzer
 from src.infrastructure.database.repositories.analysis_repository import AnalysisRepository
 from src.utils.rate_limiter import (
     create_alpha_vantage_limiter,
     create_tradier_limiter,
+    create_twelve_data_limiter,
 )
 from src.utils.circuit_breaker import CircuitBreaker
 from src.utils.concurrent_scanner import ConcurrentScanner
@@ -91,21 +100,50 @@ class Container:
         self._analyzer: Optional[TickerAnalyzer] = None
         self._async_analyzer: Optional[AsyncTickerAnalyzer] = None
         self._analysis_repo: Optional[AnalysisRepository] = None
+        self._ticker_metadata_repo: Optional[TickerMetadataRepository] = None
+        self._scan_checkpoint_repo: Optional[ScanCheckpointRepository] = None
+        self._ticker_metadata: Optional[TickerMetadataService] = None
+        self._backfill_queue: Optional[BackfillQueue] = None
         self._health_check_service: Optional[HealthCheckService] = None
         self._tradier_breaker: Optional[CircuitBreaker] = None
         self._alpha_vantage_breaker: Optional[CircuitBreaker] = None
         self._db_pool: Optional[ConnectionPool] = None
         self._concurrent_scanner: Optional[ConcurrentScanner] = None
 
+    def close(self) -> None:
+        """
+        Release resources created so far.
+
+        Stops the backfill worker, returns unused shared rate limit leases
+        to rate_limits (otherwise they stay counted until the window ends)
+        and closes the connection pool. CLI entry points register this to
+        run at exit.
+        """
+        if self._backfill_queue:
+            self._backfill_queue.close(timeout=5.0)
+        limiters = [
+            client.rate_limiter
+            for client in (self._tradier, self._alphavantage, self._backfill_queue)
+            if client is not None and client.rate_limiter is not None
+        ]
+        for limiter in limiters:
+            limiter.close()
+        if self._db_pool:
+            self._db_pool.close_all()
+
     # ========================================================================
     # Infrastructure Layer
     # ========================================================================
 
+    def _shared_limit_db(self) -> Optional[Path]:
+        """DB holding cross-process rate limit counters, or None for per-process limits."""
+        return self.config.database.path if self.config.rate_limits.shared else None
+
     @property
     def tradier(self) -> TradierAPI:
         """Get Tradier API client."""
         if self._tradier is None:
-            rate_limiter = create_tradier_limiter()
+            rate_limiter = create_tradier_limiter(self._shared_limit_db())
             self._tradier = TradierAPI(
                 api_key=self.config.api.tradier_api_key,
                 base_url=self.config.api.tradier_base_url,
@@ -157,7 +195,7 @@ class Container:
     def alphavantage(self) -> AlphaVantageAPI:
         """Get Alpha Vantage API client."""
         if self._alphavantage is None:
-            rate_limiter = create_alpha_vantage_limiter()
+            rate_limiter = create_alpha_vantage_limiter(self._shared_limit_db())
             self._alphavantage = AlphaVantageAPI(
                 api_key=self.config.api.alpha_vantage_key,
                 base_url=self.config.api.alpha_vantage_base_url,
@@ -201,6 +239,47 @@ class Container:
             logger.debug("Created PricesRepository with connection pool")
         return self._prices_repo
 
+    @property
+    def ticker_metadata_repository(self) -> TickerMetadataRepository:
+        """Get ticker metadata repository with connection pooling."""
+        if self._ticker_metadata_repo is None:
+            self._ticker_metadata_repo = TickerMetadataRepository(
+                db_path=str(self.config.database.path),
+                pool=self.db_pool
+            )
+            logger.debug("Created TickerMetadataRepository with connection pool")
+        return self._ticker_metadata_repo
+
+    @property
+    def scan_checkpoint_repository(self) -> ScanCheckpointRepository:
+        """Get scan checkpoint repository (journal for --resume) with connection pooling."""
+        if self._scan_checkpoint_repo is None:
+            self._scan_checkpoint_repo = ScanCheckpointRepository(
+                db_path=str(self.config.database.path),
+                pool=self.db_pool
+            )
+            logger.debug("Created ScanCheckpointRepository with connection pool")
+        return self._scan_checkpoint_repo
+
+    @property
+    def ticker_metadata(self) -> TickerMetadataService:
+        """Get ticker metadata service (persistent market cap / name cache)."""
+        if self._ticker_metadata is None:
+            self._ticker_metadata = TickerMetadataService(self.ticker_metadata_repository)
+            logger.debug("Created TickerMetadataService")
+        return self._ticker_metadata
+
+    @property
+    def backfill_queue(self) -> BackfillQueue:
+        """Get in-process earnings history backfill queue (Twelve Data rate limited)."""
+        if self._backfill_queue is None:
+            self._backfill_queue = BackfillQueue(
+                db_path=self.config.database.path,
+                rate_limiter=create_twelve_data_limiter(self._shared_limit_db()),
+            )
+            logger.debug("Created BackfillQueue")
+        return self._backfill_queue
+
     # ========================================================================
     # Application Layer - Calculators
     # ========================================================================
@@ -608,11 +687,11 @@ def reset_container() -> None:
     """
     Reset global container (useful for testing).
 
-    Closes connection pool if exists.
+    Closes the container's resources (see Container.close).
     Thread-safe via lock.
     """
     global _container
     with _container_lock:
-        if _container and _container._db_pool:
-            _container._db_pool.close_all()
+        if _container:
+            _container.close()
         _container = None
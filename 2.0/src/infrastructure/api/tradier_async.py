@@ -1,14 +1,15 @@
 """
 Async Tradier API client for high-performance parallel scanning.
 
-Uses aiohttp for non-blocking HTTP requests and asyncio.Semaphore
-for rate limiting without blocking other coroutines.
+Uses aiohttp for non-blocking HTTP requests and an AIMD concurrency
+limiter that finds the fastest safe number of in-flight requests.
 
 Performance Benefits:
 - Parallel API calls across multiple tickers
 - Non-blocking I/O - no thread pool overhead
 - Connection pooling via aiohttp TCPConnector
-- Graceful rate limiting with semaphores
+- Adaptive concurrency: grows while latency is healthy, halves on 429/timeout
+- Optional hedging: re-sends a GET still pending at p95, first response wins
 
 Usage:
     async with AsyncTradierAPI(api_key) as api:
@@ -19,8 +20,9 @@ Usage:
 import aiohttp
 import asyncio
 import logging
+import time
 from datetime import date
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 from src.domain.types import (
     Money,
@@ -31,6 +33,9 @@ from src.domain.types import (
     MAX_API_RESPONSE_SIZE,
 )
 from src.domain.errors import Result, AppError, Ok, Err, ErrorCode
+from src.utils.adaptive_concurrency import AdaptiveConcurrencyLimiter
+from src.utils.hedging import HedgedRequestPolicy
+from src.utils.rate_limiter import TokenBucketRateLimiter
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +61,10 @@ class AsyncTradierAPI:
         max_retries: int = 3,
         base_delay: float = 1.0,
         timeout: float = 10.0,
+        adaptive: bool = True,
+        latency_target: float = 2.0,
+        hedge: bool = False,
+        rate_limiter: Optional[TokenBucketRateLimiter] = None,
     ):
         """
         Initialize async Tradier API client.
@@ -63,10 +72,17 @@ class AsyncTradierAPI:
         Args:
             api_key: Tradier API key
             base_url: API base URL
-            max_concurrent: Maximum concurrent requests (respects rate limits)
+            max_concurrent: Maximum concurrent requests (ceiling when adaptive)
             max_retries: Maximum retry attempts on failure
             base_delay: Base delay for exponential backoff
             timeout: Request timeout in seconds
+            adaptive: Start at half of max_concurrent and adjust (AIMD);
+                False keeps a fixed limit of max_concurrent
+            latency_target: Seconds; slower responses stop the limit growing
+            hedge: Re-send requests still pending at the observed p95
+                (capped at 5% of requests); first response wins
+            rate_limiter: Requests-per-minute limiter (e.g. the sync client's
+                shared limiter); one token is taken before each request
         """
         self.api_key = api_key
         self.base_url = base_url
@@ -78,8 +94,17 @@ class AsyncTradierAPI:
         self.max_retries = max_retries
         self.base_delay = base_delay
 
-        # Semaphore for rate limiting - limits concurrent requests
-        self.semaphore = asyncio.Semaphore(max_concurrent)
+        # Concurrency limiter - limits in-flight requests
+        self.max_concurrent = max_concurrent
+        self.limiter = AdaptiveConcurrencyLimiter(
+            initial_limit=max(1, max_concurrent // 2) if adaptive else max_concurrent,
+            min_limit=1 if adaptive else max_concurrent,
+            max_limit=max_concurrent,
+            latency_target=latency_target,
+            name="tradier",
+        )
+        self.hedging = HedgedRequestPolicy(name="tradier") if hedge else None
+        self.rate_limiter = rate_limiter
         self._session: Optional[aiohttp.ClientSession] = None
 
         # Statistics
@@ -89,8 +114,8 @@ class AsyncTradierAPI:
     async def __aenter__(self) -> 'AsyncTradierAPI':
         """Async context manager entry - creates session with connection pool."""
         connector = aiohttp.TCPConnector(
-            limit=self.semaphore._value,  # Match semaphore limit
-            limit_per_host=self.semaphore._value,
+            limit=self.max_concurrent,  # Match concurrency ceiling
+            limit_per_host=self.max_concurrent,
             ttl_dns_cache=300,  # Cache DNS for 5 minutes
             enable_cleanup_closed=True,
         )
@@ -111,6 +136,41 @@ class AsyncTradierAPI:
         """Mask API key in repr to prevent leaking in logs."""
         return f"AsyncTradierAPI(base_url={self.base_url}, key=***)"
 
+    async def _acquire(self) -> float:
+        """Wait for a rate limit token, then a concurrency slot; returns the slot's start time."""
+        if self.rate_limiter is not None:
+            # Blocking wait (a DB lease or the next window) runs off the event loop
+            await asyncio.to_thread(self.rate_limiter.acquire, 1, True)
+        return await self.limiter.acquire()
+
+    async def _get_json(self, url: str, params: Dict) -> Dict:
+        """Single GET under the rate and concurrency limiters (one retry attempt)."""
+        return await self._send_json(url, params, await self._acquire())
+
+    async def _send_json(self, url: str, params: Dict, started: float) -> Dict:
+        """GET holding the limiter slot granted at `started`; releases it."""
+        try:
+            self._request_count += 1
+            async with self._session.get(url, params=params) as response:
+                # Check response size before reading
+                content_length = response.headers.get('Content-Length')
+                if content_length and int(content_length) > MAX_API_RESPONSE_SIZE:
+                    raise ValueError(f"Response too large: {content_length} bytes")
+
+                response.raise_for_status()
+                data = await response.json()
+            self.limiter.on_success(time.monotonic() - started)
+            return data
+        except asyncio.TimeoutError:
+            self.limiter.on_overload(started)
+            raise
+        except aiohttp.ClientResponseError as e:
+            if e.status == 429:
+                self.limiter.on_overload(started)
+            raise
+        finally:
+            self.limiter.release()
+
     async def _request_with_retry(
         self,
         url: str,
@@ -120,8 +180,10 @@ class AsyncTradierAPI:
         """
         Make request with retry logic and rate limiting.
 
-        Uses semaphore to limit concurrent requests and exponential
-        backoff on failures.
+        Uses the adaptive limiter to bound concurrent requests and
+        exponential backoff on failures. 429s and timeouts also shrink
+        the concurrency limit.
+        With hedging on, each attempt may race a second copy of itself.
         """
         if not self._session:
             raise RuntimeError("API must be used as async context manager")
@@ -129,17 +191,13 @@ class AsyncTradierAPI:
         last_exception = None
         for attempt in range(self.max_retries + 1):
             try:
-                # Acquire semaphore slot (rate limiting)
-                async with self.semaphore:
-                    self._request_count += 1
-                    async with self._session.get(url, params=params) as response:
-                        # Check response size before reading
-                        content_length = response.headers.get('Content-Length')
-                        if content_length and int(content_length) > MAX_API_RESPONSE_SIZE:
-                            raise ValueError(f"Response too large: {content_length} bytes")
-
-                        response.raise_for_status()
-                        return await response.json()
+                if self.hedging is not None:
+                    # Slot waits are not latency: each copy's clock starts once it holds one
+                    return await self.hedging.run(
+                        lambda started: self._send_json(url, params, started),
+                        acquire=self._acquire,
+                    )
+                return await self._get_json(url, params)
 
             except aiohttp.ClientConnectorCertificateError as e:
                 # SSL/TLS certificate errors should not be retried (may indicate MITM)
@@ -445,9 +503,11 @@ class AsyncTradierAPI:
             logger.error(f"Unexpected error fetching chain for {ticker}: {e}")
             return Err(AppError(ErrorCode.EXTERNAL, str(e)))
 
-    def get_stats(self) -> Dict[str, int]:
-        """Get API call statistics."""
+    def get_stats(self) -> Dict[str, Any]:
+        """Get API call and concurrency statistics."""
         return {
             'request_count': self._request_count,
             'error_count': self._error_count,
+            **self.limiter.stats,
+            **(self.hedging.stats if self.hedging is not None else {}),
         }
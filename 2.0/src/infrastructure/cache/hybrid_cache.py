@@ -10,13 +10,20 @@ arbitrary code execution vulnerabilities.
 import sqlite3
 import logging
 import json
+import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional, Any, Dict
 from threading import Lock
 from collections import OrderedDict
 
-from src.utils.serialization import serialize, deserialize
+# Ensure common/ is importable (for production code outside pytest)
+_root = str(Path(__file__).resolve().parent.parent.parent.parent.parent)
+if _root not in sys.path:
+    sys.path.insert(0, _root)
+
+from common.db import connect  # noqa: E402
+from src.utils.serialization import serialize, deserialize  # noqa: E402
 
 logger = logging.getLogger(__name__)
 
@@ -81,10 +88,7 @@ class HybridCache:
     def _init_db(self) -> None:
         """Initialize SQLite schema for L2 cache with migration support."""
         try:
-            with sqlite3.connect(str(self.db_path), timeout=CONNECTION_TIMEOUT) as conn:
-                # Enable WAL mode for better write concurrency
-                conn.execute('PRAGMA journal_mode=WAL')
-
+            with connect(self.db_path, timeout=CONNECTION_TIMEOUT) as conn:
                 # Create table with expiration column for per-key TTL
                 conn.execute('''
                     CREATE TABLE IF NOT EXISTS cache (
@@ -147,7 +151,7 @@ class HybridCache:
 
         # L2 check (SQLite)
         try:
-            with sqlite3.connect(str(self.db_path), timeout=CONNECTION_TIMEOUT) as conn:
+            with connect(self.db_path, timeout=CONNECTION_TIMEOUT) as conn:
                 row = conn.execute(
                     'SELECT value, timestamp, expiration FROM cache WHERE key = ?',
                     (key,)
@@ -186,12 +190,12 @@ class HybridCache:
                     except (json.JSONDecodeError, ValueError, KeyError) as e:
                         logger.warning(f"Failed to deserialize cached value for {key}: {e}")
                         # Delete corrupted entry
-                        with sqlite3.connect(str(self.db_path), timeout=CONNECTION_TIMEOUT) as conn:
+                        with connect(self.db_path, timeout=CONNECTION_TIMEOUT) as conn:
                             conn.execute('DELETE FROM cache WHERE key = ?', (key,))
                 else:
                     # Expired in L2
                     logger.debug(f"Cache L2 EXPIRED: {key} (age: {elapsed:.1f}s)")
-                    with sqlite3.connect(str(self.db_path), timeout=CONNECTION_TIMEOUT) as conn:
+                    with connect(self.db_path, timeout=CONNECTION_TIMEOUT) as conn:
                         conn.execute('DELETE FROM cache WHERE key = ?', (key,))
 
         except sqlite3.Error as e:
@@ -239,7 +243,7 @@ class HybridCache:
             # Calculate expiration timestamp for per-key TTL
             expiration = (now + timedelta(seconds=effective_l2_ttl)).isoformat()
 
-            with sqlite3.connect(str(self.db_path), timeout=CONNECTION_TIMEOUT) as conn:
+            with connect(self.db_path, timeout=CONNECTION_TIMEOUT) as conn:
                 conn.execute(
                     '''
                     INSERT OR REPLACE INTO cache (key, value, timestamp, version, expiration)
@@ -265,7 +269,7 @@ class HybridCache:
 
         # Delete from L2
         try:
-            with sqlite3.connect(str(self.db_path), timeout=CONNECTION_TIMEOUT) as conn:
+            with connect(self.db_path, timeout=CONNECTION_TIMEOUT) as conn:
                 conn.execute('DELETE FROM cache WHERE key = ?', (key,))
                 conn.commit()
             logger.debug(f"Cache DELETE: {key} (L1+L2)")
@@ -282,7 +286,7 @@ class HybridCache:
 
         # Clear L2
         try:
-            with sqlite3.connect(str(self.db_path), timeout=CONNECTION_TIMEOUT) as conn:
+            with connect(self.db_path, timeout=CONNECTION_TIMEOUT) as conn:
                 cursor = conn.execute('SELECT COUNT(*) FROM cache')
                 count_l2 = cursor.fetchone()[0]
                 conn.execute('DELETE FROM cache')
@@ -304,7 +308,7 @@ class HybridCache:
         try:
             now = datetime.now().isoformat()
             cutoff = (datetime.now() - timedelta(seconds=self.l2_ttl)).isoformat()
-            with sqlite3.connect(str(self.db_path), timeout=CONNECTION_TIMEOUT) as conn:
+            with connect(self.db_path, timeout=CONNECTION_TIMEOUT) as conn:
                 # Delete entries with explicit expiration that has passed,
                 # OR entries without expiration that exceed the default TTL
                 cursor = conn.execute(
@@ -349,7 +353,7 @@ class HybridCache:
             l1_count = len(self._l1_cache)
 
         try:
-            with sqlite3.connect(str(self.db_path), timeout=CONNECTION_TIMEOUT) as conn:
+            with connect(self.db_path, timeout=CONNECTION_TIMEOUT) as conn:
                 cursor = conn.execute('SELECT COUNT(*) FROM cache')
                 l2_count = cursor.fetchone()[0]
         except sqlite3.Error:
@@ -7,12 +7,21 @@ and health checks. Prevents connection exhaustion and reduces overhead.
 
 import sqlite3
 import logging
+import sys
 import threading
+import time
 from pathlib import Path
 from typing import Optional
 from contextlib import contextmanager
 from queue import Queue, Empty, Full
 
+# Ensure common/ is importable (for production code outside pytest)
+_root = str(Path(__file__).resolve().parent.parent.parent.parent.parent)
+if _root not in sys.path:
+    sys.path.insert(0, _root)
+
+from common.db import DEFAULT_PROFILE, PoolMetrics, SQLiteProfile, connect  # noqa: E402
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,8 +36,9 @@ class ConnectionPool:
     - Thread-safe connection checkout/checkin
     - Automatic connection health checks
     - Configurable pool size
-    - WAL mode support for concurrent reads
+    - Shared PRAGMA profile from common.db (WAL, cache, mmap, statement cache)
     - Connection timeout handling
+    - Checkout wait-time metrics (see stats())
     """
 
     def __init__(
@@ -38,6 +48,7 @@ class ConnectionPool:
         max_overflow: int = 10,
         connection_timeout: int = 30,
         pool_timeout: int = 5.0,
+        profile: SQLiteProfile = DEFAULT_PROFILE,
     ):
         """
         Initialize connection pool.
@@ -48,12 +59,15 @@ class ConnectionPool:
             max_overflow: Additional connections allowed beyond pool_size
             connection_timeout: SQLite connection timeout in seconds
             pool_timeout: Max seconds to wait for available connection
+            profile: PRAGMA profile applied to each connection
         """
         self.db_path = db_path
         self.pool_size = pool_size
         self.max_overflow = max_overflow
         self.connection_timeout = connection_timeout
         self.pool_timeout = pool_timeout
+        self.profile = profile
+        self.metrics = PoolMetrics()
 
         # Connection queue (thread-safe)
         self._pool: Queue = Queue(maxsize=pool_size + max_overflow)
@@ -85,23 +99,17 @@ class ConnectionPool:
             New connection or None on error
         """
         try:
-            conn = sqlite3.connect(
-                str(self.db_path),
+            conn = connect(
+                self.db_path,
+                self.profile,
                 timeout=self.connection_timeout,
                 check_same_thread=False,  # Allow connection sharing across threads
+                row_factory=sqlite3.Row,  # Dict-like access
             )
 
-            # Enable WAL mode for better concurrency
-            conn.execute('PRAGMA journal_mode=WAL')
-
-            # Enable foreign keys
-            conn.execute('PRAGMA foreign_keys=ON')
-
-            # Row factory for dict-like access
-            conn.row_factory = sqlite3.Row
-
             with self._lock:
                 self._total_connections += 1
+            self.metrics.record_created()
 
             logger.debug(
                 f"Created connection #{self._total_connections} to {self.db_path}"
@@ -152,6 +160,7 @@ class ConnectionPool:
             RuntimeError: If unable to create connection
         """
         conn = None
+        wait_start = time.perf_counter()
         try:
             # Try to get existing connection from pool
             try:
@@ -159,14 +168,17 @@ class ConnectionPool:
             except Empty:
                 # Pool exhausted - try to create overflow connection
                 with self._lock:
-                    if self._total_connections < (self.pool_size + self.max_overflow):
-                        conn = self._create_connection()
-                        if not conn:
-                            raise RuntimeError("Failed to create database connection")
-                    else:
-                        raise TimeoutError(
-                            f"Connection pool exhausted (max={self.pool_size + self.max_overflow})"
-                        )
+                    can_overflow = self._total_connections < (
+                        self.pool_size + self.max_overflow
+                    )
+                if not can_overflow:
+                    self.metrics.record_timeout()
+                    raise TimeoutError(
+                        f"Connection pool exhausted (max={self.pool_size + self.max_overflow})"
+                    )
+                conn = self._create_connection()
+                if not conn:
+                    raise RuntimeError("Failed to create database connection")
 
             # Health check
             if not self._is_connection_healthy(conn):
@@ -176,6 +188,7 @@ class ConnectionPool:
                 if not conn:
                     raise RuntimeError("Failed to create replacement connection")
 
+            self.metrics.record_checkout(time.perf_counter() - wait_start)
             yield conn
 
         finally:
@@ -235,16 +248,18 @@ class ConnectionPool:
         Get pool statistics.
 
         Returns:
-            Dict with pool stats
+            Dict with pool stats plus checkout/wait-time metrics
         """
         with self._lock:
-            return {
+            stats = {
                 'pool_size': self.pool_size,
                 'max_overflow': self.max_overflow,
                 'total_connections': self._total_connections,
                 'available': self._pool.qsize(),
                 'in_use': self._total_connections - self._pool.qsize(),
             }
+        stats.update(self.metrics.snapshot())
+        return stats
 
 
 # Global connection pool (initialized by container)
@@ -16,12 +16,14 @@ def init_database(db_path: Path) -> None:
     """
     Initialize database schema.
 
-    Creates 5 tables:
+    Creates 7 tables:
     1. earnings_calendar - Earnings events
     2. historical_moves - Historical price movements
     3. ticker_metadata - Ticker info (sector, market cap)
     4. analysis_log - Analysis results log
     5. rate_limits - API rate limit tracking
+    6. cache - L2 persistent cache
+    7. scan_checkpoints - Completed tickers of scan/backfill runs (--resume)
 
     Args:
         db_path: Path to SQLite database file
@@ -103,11 +105,19 @@ def init_database(db_path: Path) -> None:
                 UNIQUE(ticker, earnings_date)
             )
         ''')
+        # Covering indexes for hot per-ticker and date-range reads (migration 009).
+        # Ticker-only lookups use the UNIQUE(ticker, earnings_date) autoindex.
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_moves_ticker_date_cover
+            ON historical_moves(
+                ticker, earnings_date DESC,
+                intraday_move_pct, gap_move_pct, close_move_pct,
+                prev_close, earnings_close
+            )
+        ''')
         cursor.execute(
-            'CREATE INDEX IF NOT EXISTS idx_moves_ticker ON historical_moves(ticker)'
-        )
-        cursor.execute(
-            'CREATE INDEX IF NOT EXISTS idx_moves_date ON historical_moves(earnings_date)'
+            'CREATE INDEX IF NOT EXISTS idx_moves_date_ticker_cover '
+            'ON historical_moves(earnings_date, ticker, close_move_pct)'
         )
 
         # Table 3: Ticker Metadata
@@ -119,6 +129,8 @@ def init_database(db_path: Path) -> None:
                 industry TEXT,
                 market_cap REAL,
                 avg_volume INTEGER,
+                has_weekly_options BOOLEAN,
+                weekly_options_checked_at DATETIME,
                 updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
             )
         ''')
@@ -199,6 +211,22 @@ def init_database(db_path: Path) -> None:
             'CREATE INDEX IF NOT EXISTS idx_cache_timestamp ON cache(timestamp)'
         )
 
+        # Table 7: Scan Checkpoints (per-ticker journal for resumable runs)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS scan_checkpoints (
+                run_kind TEXT NOT NULL,
+                run_key TEXT NOT NULL,
+                ticker TEXT NOT NULL,
+                status TEXT NOT NULL,
+                result TEXT,
+                completed_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (run_kind, run_key, ticker)
+            )
+        ''')
+        cursor.execute(
+            'CREATE INDEX IF NOT EXISTS idx_scan_checkpoints_completed ON scan_checkpoints(completed_at)'
+        )
+
         conn.commit()
         logger.info(f"✓ Database initialized: {db_path}")
 
@@ -267,6 +295,7 @@ def drop_all_tables(db_path: Path) -> None:
         'analysis_log',
         'rate_limits',
         'cache',
+        'scan_checkpoints',
     ])
 
     conn = sqlite3.connect(str(db_path))
@@ -217,6 +217,66 @@ class MigrationManager:
             sql_down=None
         ))
 
+        # Migration 009: Covering indices for historical_moves hot queries.
+        # Per-ticker lookups (ORDER BY earnings_date DESC LIMIT n) and the
+        # backtest date-range loader read only a few move columns, so serving
+        # them from the index avoids table lookups and temp B-tree sorts.
+        # Single-column idx_moves_ticker/idx_moves_date become redundant
+        # prefixes of the UNIQUE(ticker, earnings_date) and new date index.
+        self.migrations.append(Migration(
+            version=9,
+            name="add_historical_moves_covering_indices",
+            sql_up="""
+                -- Handled in _apply_migration_009
+            """,
+            sql_down="""
+                DROP INDEX IF EXISTS idx_moves_ticker_date_cover;
+                DROP INDEX IF EXISTS idx_moves_date_ticker_cover;
+                CREATE INDEX IF NOT EXISTS idx_moves_ticker ON historical_moves(ticker);
+                CREATE INDEX IF NOT EXISTS idx_moves_date ON historical_moves(earnings_date)
+            """
+        ))
+
+        # Migration 010: Cache weekly options checks in ticker_metadata.
+        # The scan prefilter drops tickers known to lack weeklies from SQL
+        # instead of refetching their expirations from Tradier.
+        self.migrations.append(Migration(
+            version=10,
+            name="add_ticker_metadata_weekly_options",
+            sql_up="""
+                -- Handled in _apply_migration_010
+            """,
+            sql_down="""
+                ALTER TABLE ticker_metadata DROP COLUMN has_weekly_options;
+                ALTER TABLE ticker_metadata DROP COLUMN weekly_options_checked_at
+            """
+        ))
+
+        # Migration 011: Journal of completed per-ticker scan/backfill results.
+        # Long scans and backfills checkpoint each ticker as it finishes so an
+        # interrupted run can be resumed with --resume instead of starting over.
+        self.migrations.append(Migration(
+            version=11,
+            name="add_scan_checkpoints",
+            sql_up="""
+                CREATE TABLE IF NOT EXISTS scan_checkpoints (
+                    run_kind TEXT NOT NULL,
+                    run_key TEXT NOT NULL,
+                    ticker TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    result TEXT,
+                    completed_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (run_kind, run_key, ticker)
+                );
+                CREATE INDEX IF NOT EXISTS idx_scan_checkpoints_completed
+                ON scan_checkpoints(completed_at)
+            """,
+            sql_down="""
+                DROP INDEX IF EXISTS idx_scan_checkpoints_completed;
+                DROP TABLE IF EXISTS scan_checkpoints
+            """
+        ))
+
         # Sort migrations by version (safety check)
         self.migrations.sort(key=lambda m: m.version)
 
@@ -346,6 +406,10 @@ class MigrationManager:
                     self._apply_migration_007(cursor)
                 elif migration.version == 8:
                     self._apply_migration_008(cursor)
+                elif migration.version == 9:
+                    self._apply_migration_009(cursor)
+                elif migration.version == 10:
+                    self._apply_migration_010(cursor)
                 else:
                     # Execute statements individually (safer than executescript)
                     for statement in migration.sql_up.split(';'):
@@ -667,6 +731,77 @@ class MigrationManager:
         cursor.execute("ANALYZE")
         logger.info("Recreated trade_journal with account_type in UNIQUE constraint")
 
+    def _apply_migration_009(self, cursor: sqlite3.Cursor):
+        """
+        Apply migration 009: Covering indices for historical_moves hot queries.
+
+        - idx_moves_ticker_date_cover serves WHERE ticker = ? ORDER BY
+          earnings_date DESC LIMIT n (5.0 get_moves/get_moves_batch, backtest
+          loader) without touching the table or sorting
+        - idx_moves_date_ticker_cover serves the backtest date-range scan
+          ordered by (earnings_date, ticker)
+        - DROP idx_moves_ticker (prefix of UNIQUE(ticker, earnings_date))
+        - DROP idx_moves_date (prefix of idx_moves_date_ticker_cover)
+        """
+        cursor.execute("""
+            SELECT name FROM sqlite_master
+            WHERE type='table' AND name='historical_moves'
+        """)
+        if not cursor.fetchone():
+            logger.debug("historical_moves table doesn't exist, skipping migration")
+            return
+
+        # Column order matches init_schema.py
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_moves_ticker_date_cover
+            ON historical_moves(
+                ticker, earnings_date DESC,
+                intraday_move_pct, gap_move_pct, close_move_pct,
+                prev_close, earnings_close
+            )
+        """)
+        logger.info("Created covering index idx_moves_ticker_date_cover")
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_moves_date_ticker_cover
+            ON historical_moves(earnings_date, ticker, close_move_pct)
+        """)
+        logger.info("Created covering index idx_moves_date_ticker_cover")
+
+        for idx_name in ("idx_moves_ticker", "idx_moves_date"):
+            cursor.execute(f"DROP INDEX IF EXISTS [{idx_name}]")
+            logger.info(f"Dropped redundant {idx_name} index")
+
+        cursor.execute("ANALYZE historical_moves")
+        logger.info("Updated query planner statistics for historical_moves")
+
+    def _apply_migration_010(self, cursor: sqlite3.Cursor):
+        """
+        Apply migration 010: Weekly options flag columns on ticker_metadata.
+
+        New databases get them from init_schema.py; this adds them to
+        existing ones.
+        """
+        cursor.execute("""
+            SELECT name FROM sqlite_master
+            WHERE type='table' AND name='ticker_metadata'
+        """)
+        if not cursor.fetchone():
+            logger.debug("ticker_metadata table doesn't exist, skipping migration")
+            return
+
+        cursor.execute("PRAGMA table_info(ticker_metadata)")
+        columns = [row[1] for row in cursor.fetchall()]
+        for column, column_type in (
+            ('has_weekly_options', 'BOOLEAN'),
+            ('weekly_options_checked_at', 'DATETIME'),
+        ):
+            if column not in columns:
+                cursor.execute(f"ALTER TABLE ticker_metadata ADD COLUMN {column} {column_type}")
+                logger.info(f"Added {column} column to ticker_metadata")
+            else:
+                logger.debug(f"ticker_metadata already has {column} column")
+
     def rollback(self, target_version: int) -> int:
         """
         Rollback migrations to target version.
@@ -7,6 +7,8 @@ Provides data access abstractions using the Repository pattern:
 - EarningsRepository: Earnings calendar data
 - PricesRepository: Historical price movements
 - AnalysisRepository: Analysis run logging for meta-analysis
+- TickerMetadataRepository: Cached per-ticker facts (market cap, weekly options)
+- ScanCheckpointRepository: Completed tickers of scan/backfill runs (--resume)
 """
 
 from src.infrastructure.database.repositories.base_repository import (
@@ -16,6 +18,12 @@ from src.infrastructure.database.repositories.base_repository import (
 from src.infrastructure.database.repositories.earnings_repository import EarningsRepository
 from src.infrastructure.database.repositories.prices_repository import PricesRepository
 from src.infrastructure.database.repositories.analysis_repository import AnalysisRepository
+from src.infrastructure.database.repositories.ticker_metadata_repository import (
+    TickerMetadataRepository,
+)
+from src.infrastructure.database.repositories.scan_checkpoint_repository import (
+    ScanCheckpointRepository,
+)
 
 __all__ = [
     "BaseRepository",
@@ -23,4 +31,6 @@ __all__ = [
     "EarningsRepository",
     "PricesRepository",
     "AnalysisRepository",
+    "TickerMetadataRepository",
+    "ScanCheckpointRepository",
 ]
@@ -187,7 +187,7 @@ class AnalysisRepository(ResilientRepository):
             List of analysis records as dictionaries
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._get_connection() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
 
@@ -228,7 +228,7 @@ class AnalysisRepository(ResilientRepository):
             Dict mapping regime name to statistics
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._get_connection() as conn:
                 cursor = conn.cursor()
 
                 cursor.execute(
@@ -273,7 +273,7 @@ class AnalysisRepository(ResilientRepository):
             Dict mapping strategy type to count
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._get_connection() as conn:
                 cursor = conn.cursor()
 
                 cursor.execute(
@@ -12,12 +12,19 @@ consistent connection handling and error management.
 
 import sqlite3
 import logging
+import sys
 from abc import ABC
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional, List, Any
 
-from src.domain.errors import Result, AppError, Ok, Err, ErrorCode
+# Ensure common/ is importable (for production code outside pytest)
+_root = str(Path(__file__).resolve().parent.parent.parent.parent.parent.parent)
+if _root not in sys.path:
+    sys.path.insert(0, _root)
+
+from common.db import connect  # noqa: E402
+from src.domain.errors import Result, AppError, Ok, Err, ErrorCode  # noqa: E402
 
 # TYPE_CHECKING import to avoid circular dependency
 from typing import TYPE_CHECKING
@@ -93,8 +100,9 @@ class BaseRepository(ABC):
             with self.pool.get_connection() as conn:
                 yield conn
         else:
-            # Fallback to direct connection (testing/development)
-            conn = sqlite3.connect(self.db_path, timeout=self.timeout)
+            # Fallback to direct connection (testing/development), same
+            # PRAGMA profile as pooled connections
+            conn = connect(self.db_path, timeout=self.timeout)
             try:
                 yield conn
             finally:
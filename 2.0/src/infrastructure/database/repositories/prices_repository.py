@@ -295,14 +295,52 @@ class PricesRepository(BaseRepository):
             logger.error(f"Failed to count moves: {e}")
             return Err(AppError(ErrorCode.DBERROR, str(e)))
 
+    def count_moves_batch(self, tickers: List[str]) -> Result[dict[str, int], AppError]:
+        """
+        Count historical moves for multiple tickers in a single query.
+
+        Args:
+            tickers: List of stock ticker symbols
+
+        Returns:
+            Result with dict mapping ticker -> move count (0 if none)
+        """
+        if not tickers:
+            return Ok({})
+
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                placeholders = ",".join("?" for _ in tickers)
+                upper_tickers = [t.upper() for t in tickers]
+                cursor.execute(
+                    f'''
+                    SELECT ticker, COUNT(*) FROM historical_moves
+                    WHERE ticker IN ({placeholders})
+                    GROUP BY ticker
+                    ''',
+                    upper_tickers,
+                )
+                counts = {t: 0 for t in upper_tickers}
+                counts.update(dict(cursor.fetchall()))
+
+            return Ok(counts)
+
+        except sqlite3.Error as e:
+            logger.error(f"Failed to count batch moves: {e}")
+            return Err(AppError(ErrorCode.DBERROR, str(e)))
+
     def get_historical_moves_batch(
         self, tickers: List[str], limit: int = 12
     ) -> Result[dict[str, List[HistoricalMove]], AppError]:
         """
         Get historical moves for multiple tickers in a single query.
 
-        Eliminates N+1 pattern: fetches all tickers in 1 query using
-        a window function instead of N separate queries.
+        Eliminates N+1 pattern: fetches all tickers in 1 query instead of
+        N separate queries. Each ticker's cutoff date (its limit-th most
+        recent move) comes from a correlated subquery on the
+        UNIQUE(ticker, earnings_date) index, so rows are read in index
+        order with no window-function sort.
 
         Args:
             tickers: List of stock ticker symbols
@@ -313,6 +351,9 @@ class PricesRepository(BaseRepository):
         """
         if not tickers:
             return Ok({})
+        if limit <= 0:
+            # OFFSET -1 would be read as OFFSET 0 and return one move per ticker
+            return Ok({t.upper(): [] for t in tickers})
 
         try:
             with self._get_connection() as conn:
@@ -324,24 +365,19 @@ class PricesRepository(BaseRepository):
 
                 cursor.execute(
                     f'''
-                    WITH ranked AS (
-                        SELECT ticker, earnings_date, prev_close, earnings_open,
-                               earnings_high, earnings_low, earnings_close,
-                               intraday_move_pct, gap_move_pct, close_move_pct,
-                               volume_before, volume_earnings,
-                               ROW_NUMBER() OVER (
-                                   PARTITION BY ticker ORDER BY earnings_date DESC
-                               ) as rn
-                        FROM historical_moves
-                        WHERE ticker IN ({placeholders})
-                    )
                     SELECT ticker, earnings_date, prev_close, earnings_open,
                            earnings_high, earnings_low, earnings_close,
                            intraday_move_pct, gap_move_pct, close_move_pct,
                            volume_before, volume_earnings
-                    FROM ranked
-                    WHERE rn <= ?
-                    ORDER BY ticker, earnings_date DESC
+                    FROM historical_moves AS hm
+                    WHERE hm.ticker IN ({placeholders})
+                      AND hm.earnings_date >= COALESCE((
+                          SELECT earnings_date FROM historical_moves
+                          WHERE ticker = hm.ticker
+                          ORDER BY earnings_date DESC
+                          LIMIT 1 OFFSET ? - 1
+                      ), '')
+                    ORDER BY hm.ticker, hm.earnings_date DESC
                     ''',
                     (*upper_tickers, limit),
                 )
@@ -0,0 +1,132 @@
+"""
+Scan checkpoint repository - journal of completed tickers for resumable runs.
+
+Long scans and backfills record each ticker as it finishes; a run restarted
+with --resume reads the journal and skips tickers completed recently.
+
+Supports both connection pooling (for production) and direct connections (for testing).
+"""
+
+import sqlite3
+import logging
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from src.domain.errors import Result, AppError, Ok
+from src.infrastructure.database.repositories.base_repository import BaseRepository
+
+# TYPE_CHECKING import to avoid circular dependency
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from src.infrastructure.database.connection_pool import ConnectionPool
+
+logger = logging.getLogger(__name__)
+
+
+class ScanCheckpointRepository(BaseRepository):
+    """
+    Repository for the scan_checkpoints table.
+
+    A run is identified by (run_kind, run_key), e.g. ('scan', '2025-01-31')
+    or ('backfill', '2023-01-01:2025-12-31'). result holds the serialized
+    per-ticker outcome; its format is owned by the caller.
+
+    Inherits connection management from BaseRepository.
+    """
+
+    def __init__(self, db_path: str | Path, pool: Optional['ConnectionPool'] = None):
+        """
+        Initialize repository.
+
+        Args:
+            db_path: Path to SQLite database
+            pool: Optional connection pool (uses direct connections if None)
+        """
+        super().__init__(db_path, pool)
+
+    def save(
+        self,
+        run_kind: str,
+        run_key: str,
+        ticker: str,
+        status: str,
+        result: Optional[str] = None,
+    ) -> Result[None, AppError]:
+        """
+        Record a completed ticker (replaces an earlier entry for the same run).
+
+        Args:
+            run_kind: Kind of run ('scan', 'ticker', 'whisper', 'backfill')
+            run_key: Run identity within its kind (scan date, week, date range)
+            ticker: Stock ticker symbol
+            status: Outcome status
+            result: Serialized outcome (JSON), or None
+
+        Returns:
+            Result with None on success or AppError on failure
+        """
+        return self._execute_insert(
+            '''
+            INSERT OR REPLACE INTO scan_checkpoints
+            (run_kind, run_key, ticker, status, result, completed_at)
+            VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+            ''',
+            (run_kind, run_key, ticker.upper(), status, result),
+            operation="save scan checkpoint",
+        )
+
+    def get_completed(
+        self, run_kind: str, run_key: str, max_age_hours: float
+    ) -> Result[Dict[str, Tuple[str, Optional[str]]], AppError]:
+        """
+        Get tickers of a run completed within max_age_hours.
+
+        Args:
+            run_kind: Kind of run
+            run_key: Run identity within its kind
+            max_age_hours: Maximum age of completed_at
+
+        Returns:
+            Result with dict mapping ticker -> (status, result)
+        """
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    '''
+                    SELECT ticker, status, result
+                    FROM scan_checkpoints
+                    WHERE run_kind = ? AND run_key = ?
+                      AND completed_at >= datetime('now', ?)
+                    ''',
+                    (run_kind, run_key, f"-{max_age_hours} hours"),
+                )
+                rows = cursor.fetchall()
+
+            return Ok({row[0]: (row[1], row[2]) for row in rows})
+
+        except sqlite3.Error as e:
+            return self._db_error(e, "get scan checkpoints")
+
+    def prune(self, max_age_days: int) -> Result[int, AppError]:
+        """
+        Delete checkpoints older than max_age_days (all runs).
+
+        Args:
+            max_age_days: Age after which entries are dropped
+
+        Returns:
+            Result with count of deleted rows
+        """
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "DELETE FROM scan_checkpoints WHERE completed_at < datetime('now', ?)",
+                    (f"-{max_age_days} days",),
+                )
+                conn.commit()
+                return Ok(cursor.rowcount)
+
+        except sqlite3.Error as e:
+            return self._db_error(e, "prune scan checkpoints")
@@ -0,0 +1,186 @@
+"""
+Ticker metadata repository - cached per-ticker facts (market cap, weekly options).
+
+Supports both connection pooling (for production) and direct connections (for testing).
+"""
+
+import sqlite3
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.domain.errors import Result, AppError, Ok
+from src.infrastructure.database.repositories.base_repository import BaseRepository
+
+# TYPE_CHECKING import to avoid circular dependency
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from src.infrastructure.database.connection_pool import ConnectionPool
+
+logger = logging.getLogger(__name__)
+
+# Market cap is stored in dollars; weekly options columns are left untouched
+_UPSERT_INFO_SQL = '''
+    INSERT INTO ticker_metadata (ticker, market_cap, company_name, updated_at)
+    VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(ticker) DO UPDATE SET
+        market_cap = excluded.market_cap,
+        company_name = excluded.company_name,
+        updated_at = excluded.updated_at
+'''
+
+
+class TickerMetadataRepository(BaseRepository):
+    """
+    Repository for the ticker_metadata table.
+
+    Inherits connection management from BaseRepository.
+    """
+
+    def __init__(self, db_path: str | Path, pool: Optional['ConnectionPool'] = None):
+        """
+        Initialize repository.
+
+        Args:
+            db_path: Path to SQLite database
+            pool: Optional connection pool (uses direct connections if None)
+        """
+        super().__init__(db_path, pool)
+
+    def get_many(self, tickers: List[str]) -> Result[Dict[str, Dict[str, Any]], AppError]:
+        """
+        Get cached metadata for multiple tickers in a single query.
+
+        Args:
+            tickers: List of stock ticker symbols
+
+        Returns:
+            Result with dict mapping ticker -> row dict (market_cap,
+            company_name, has_weekly_options, weekly_options_checked_at,
+            updated_at). Tickers without a row are omitted.
+        """
+        if not tickers:
+            return Ok({})
+
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                placeholders = ",".join("?" for _ in tickers)
+                cursor.execute(
+                    f'''
+                    SELECT ticker, market_cap, company_name, has_weekly_options,
+                           weekly_options_checked_at, updated_at
+                    FROM ticker_metadata
+                    WHERE ticker IN ({placeholders})
+                    ''',
+                    [t.upper() for t in tickers],
+                )
+                rows = cursor.fetchall()
+
+            return Ok({
+                row[0]: {
+                    'market_cap': row[1],
+                    'company_name': row[2],
+                    'has_weekly_options': None if row[3] is None else bool(row[3]),
+                    'weekly_options_checked_at': row[4],
+                    'updated_at': row[5],
+                }
+                for row in rows
+            })
+
+        except sqlite3.Error as e:
+            return self._db_error(e, "get ticker metadata")
+
+    def get_fresh_info(
+        self, max_age_days: int
+    ) -> Result[Dict[str, Tuple[Optional[float], Optional[str]]], AppError]:
+        """
+        Get every market cap / company name updated within max_age_days.
+
+        Rows that only carry a weekly options flag are skipped.
+
+        Args:
+            max_age_days: Maximum age of updated_at
+
+        Returns:
+            Result with dict mapping ticker -> (market_cap, company_name)
+        """
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    '''
+                    SELECT ticker, market_cap, company_name
+                    FROM ticker_metadata
+                    WHERE updated_at >= datetime('now', ?)
+                      AND (market_cap IS NOT NULL OR company_name IS NOT NULL)
+                    ''',
+                    (f"-{max_age_days} days",),
+                )
+                rows = cursor.fetchall()
+
+            return Ok({row[0]: (row[1], row[2]) for row in rows})
+
+        except sqlite3.Error as e:
+            return self._db_error(e, "get fresh ticker info")
+
+    def save_info(
+        self, ticker: str, market_cap: Optional[float], company_name: Optional[str]
+    ) -> Result[None, AppError]:
+        """
+        Upsert market cap and company name for one ticker.
+
+        Args:
+            ticker: Stock ticker symbol
+            market_cap: Market cap in dollars (None if unknown)
+            company_name: Display name (None if unknown)
+
+        Returns:
+            Result with None on success or AppError on failure
+        """
+        return self._execute_insert(
+            _UPSERT_INFO_SQL,
+            (ticker.upper(), market_cap, company_name),
+            operation="save ticker metadata",
+        )
+
+    def save_info_many(
+        self, infos: List[Tuple[str, Optional[float], Optional[str]]]
+    ) -> Result[int, AppError]:
+        """
+        Upsert market cap and company name for many tickers in one transaction.
+
+        Args:
+            infos: List of (ticker, market_cap in dollars, company_name)
+
+        Returns:
+            Result with count of rows written or AppError
+        """
+        return self._execute_batch(
+            _UPSERT_INFO_SQL,
+            [(ticker.upper(), market_cap, name) for ticker, market_cap, name in infos],
+            operation="ticker metadata upsert",
+        )
+
+    def save_weekly_options(self, ticker: str, has_weeklies: bool) -> Result[None, AppError]:
+        """
+        Record the outcome of a weekly options check for ticker.
+
+        Args:
+            ticker: Stock ticker symbol
+            has_weeklies: Whether the ticker lists weekly expirations
+
+        Returns:
+            Result with None on success or AppError on failure
+        """
+        return self._execute_insert(
+            '''
+            INSERT INTO ticker_metadata (ticker, has_weekly_options, weekly_options_checked_at)
+            VALUES (?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT(ticker) DO UPDATE SET
+                has_weekly_options = excluded.has_weekly_options,
+                weekly_options_checked_at = excluded.weekly_options_checked_at
+            ''',
+            (ticker.upper(), int(has_weeklies)),
+            operation="save weekly options flag",
+        )
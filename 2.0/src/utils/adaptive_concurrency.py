@@ -0,0 +1,191 @@
+"""
+Adaptive (AIMD) concurrency limiting for async API clients.
+
+A fixed semaphore forces a choice between a safe limit that leaves
+throughput on the table and a fast one that trips 429s. This limiter finds
+the limit at runtime the way TCP congestion control does:
+
+- Additive increase: once a full window of requests (one per slot) has
+  completed with healthy latency, the limit grows by one.
+- Multiplicative decrease: a 429 or timeout cuts the limit by
+  `decrease_factor`. Requests already in flight when the cut happened don't
+  cut it again, so a burst of failures from one overload counts once.
+
+Slow but successful responses neither grow nor shrink the limit.
+
+Usage:
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=20)
+
+    started = await limiter.acquire()
+    try:
+        response = await session.get(url)
+        limiter.on_success(time.monotonic() - started)
+    except asyncio.TimeoutError:
+        limiter.on_overload(started)
+        raise
+    finally:
+        limiter.release()
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict
+
+from src.infrastructure.monitoring.metrics import get_global_collector
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Async concurrency limiter with additive-increase/multiplicative-decrease.
+
+    Takes the place of a fixed asyncio.Semaphore; the number of slots tracks
+    what the provider can currently absorb. The current limit is published as the
+    `<name>.concurrency.limit` gauge on the global metrics collector.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 20,
+        latency_target: float = 2.0,
+        decrease_factor: float = 0.5,
+        name: str = "api",
+    ):
+        """
+        Initialize adaptive concurrency limiter.
+
+        Args:
+            initial_limit: Starting number of concurrent requests
+            min_limit: Minimum limit (floor)
+            max_limit: Maximum limit (ceiling)
+            latency_target: Seconds; slower successes don't grow the limit
+            decrease_factor: Multiply limit by this on 429 or timeout
+            name: Metric prefix (e.g., "tradier")
+        """
+        if not 1 <= min_limit <= max_limit:
+            raise ValueError("Require 1 <= min_limit <= max_limit")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_target = latency_target
+        self.decrease_factor = decrease_factor
+        self.name = name
+
+        self._limit = max(min_limit, min(initial_limit, max_limit))
+        self._in_flight = 0
+        self._healthy = 0
+        self._last_decrease = 0.0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+        # Stats
+        self._peak_limit = self._limit
+        self._increases = 0
+        self._decreases = 0
+
+        self._publish()
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _publish(self) -> None:
+        get_global_collector().gauge(f"{self.name}.concurrency.limit", self._limit)
+
+    async def acquire(self) -> float:
+        """
+        Wait for a free slot and take it.
+
+        Returns:
+            time.monotonic() when the slot was granted (pass to on_overload)
+        """
+        if self._in_flight < self._limit and not self._waiters:
+            self._in_flight += 1
+        else:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # Slot was handed over as we were cancelled; pass it on
+                    self.release()
+                else:
+                    self._waiters.remove(waiter)
+                raise
+        return time.monotonic()
+
+    def release(self) -> None:
+        """Free a slot taken by acquire()."""
+        self._in_flight -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        # Hand free slots to waiters in arrival order
+        while self._waiters and self._in_flight < self._limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
+
+    def on_success(self, latency: float) -> None:
+        """
+        Report a completed request.
+
+        Args:
+            latency: Seconds the request took
+        """
+        if latency > self.latency_target:
+            return
+
+        self._healthy += 1
+        if self._healthy >= self._limit and self._limit < self.max_limit:
+            self._healthy = 0
+            self._limit += 1
+            self._increases += 1
+            self._peak_limit = max(self._peak_limit, self._limit)
+            logger.debug(f"{self.name} concurrency increased: {self._limit - 1} -> {self._limit}")
+            self._publish()
+            self._wake()
+
+    def on_overload(self, started_at: float) -> None:
+        """
+        Report a 429 or timeout.
+
+        Args:
+            started_at: Value returned by acquire() for the failed request
+        """
+        if started_at < self._last_decrease:
+            # Sent before the last cut; that overload was already counted
+            return
+
+        old_limit = self._limit
+        self._limit = max(self.min_limit, int(self._limit * self.decrease_factor))
+        self._healthy = 0
+        self._last_decrease = time.monotonic()
+        self._decreases += 1
+        if self._limit != old_limit:
+            logger.warning(f"{self.name} overloaded! Concurrency: {old_limit} -> {self._limit}")
+            self._publish()
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Get limiter statistics."""
+        return {
+            'concurrency_limit': self._limit,
+            'peak_concurrency_limit': self._peak_limit,
+            'in_flight': self._in_flight,
+            'limit_increases': self._increases,
+            'limit_decreases': self._decreases,
+        }
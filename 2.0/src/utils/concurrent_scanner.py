@@ -202,6 +202,7 @@ class ConcurrentScanner:
         filter_func: Optional[Callable] = None,
         expiration_offset: int = 0,
         progress_callback: Optional[Callable[[str, int, int], None]] = None,
+        result_callback: Optional[Callable[[ScanResult], None]] = None,
     ) -> BatchScanResult:
         """
         Scan multiple tickers concurrently.
@@ -213,6 +214,7 @@ class ConcurrentScanner:
             filter_func: Optional filter function
             expiration_offset: Days to add to base expiration
             progress_callback: Optional callback(ticker, completed, total)
+            result_callback: Optional callback(scan_result) as each ticker completes
 
         Returns:
             BatchScanResult with all results and statistics
@@ -263,15 +265,17 @@ class ConcurrentScanner:
                 ticker = future_to_ticker[future]
                 try:
                     result = future.result()
-                    results.append(result)
                 except Exception as e:
                     # Log with traceback for debugging
                     logger.error(f"Future error for {ticker}: {e}", exc_info=True)
-                    results.append(ScanResult(
+                    result = ScanResult(
                         ticker=ticker,
                         status='error',
                         error=str(e)
-                    ))
+                    )
+                results.append(result)
+                if result_callback:
+                    result_callback(result)
 
                 completed += 1
                 if progress_callback:
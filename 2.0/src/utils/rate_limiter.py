@@ -6,8 +6,9 @@ Prevents exceeding API rate limits by controlling request frequency.
 
 import time
 import logging
+from pathlib import Path
 from threading import Lock
-from typing import Optional
+from typing import Optional, Union
 
 logger = logging.getLogger(__name__)
 
@@ -160,6 +161,9 @@ class TokenBucketRateLimiter:
             self.last_refill = time.time()
         logger.debug("Rate limiter reset")
 
+    def close(self) -> None:
+        """No-op: in-memory tokens hold nothing (matches SharedRateLimiter)."""
+
 
 class CompositeRateLimiter:
     """
@@ -219,15 +223,35 @@ class CompositeRateLimiter:
         for limiter in self.limiters:
             limiter.reset()
 
+    def close(self) -> None:
+        """Close all limiters (returns shared leases)."""
+        for limiter in self.limiters:
+            limiter.close()
+
 
-def create_alpha_vantage_limiter() -> CompositeRateLimiter:
+def create_alpha_vantage_limiter(
+    db_path: Optional[Union[str, Path]] = None,
+) -> CompositeRateLimiter:
     """
     Create rate limiter for Alpha Vantage API.
 
     Alpha Vantage free tier limits:
     - 5 calls per minute
     - 500 calls per day
+
+    Args:
+        db_path: If given, share the limits with every local process using
+            this database (see SharedRateLimiter); otherwise per-process.
     """
+    if db_path is not None:
+        from src.utils.shared_rate_limiter import SharedRateLimiter
+
+        return CompositeRateLimiter(
+            [
+                SharedRateLimiter(db_path, "alpha_vantage", limit=5, window_type="minute"),
+                SharedRateLimiter(db_path, "alpha_vantage", limit=500, window_type="day", lease_size=5),
+            ]
+        )
     return CompositeRateLimiter(
         [
             TokenBucketRateLimiter(rate=5, per_seconds=60),  # 5/min
@@ -236,10 +260,51 @@ def create_alpha_vantage_limiter() -> CompositeRateLimiter:
     )
 
 
-def create_tradier_limiter() -> TokenBucketRateLimiter:
+def create_tradier_limiter(
+    db_path: Optional[Union[str, Path]] = None,
+) -> TokenBucketRateLimiter:
     """
     Create rate limiter for Tradier API.
 
     Tradier is more permissive: ~120 calls/minute typical.
+
+    Args:
+        db_path: If given, share the limit with every local process using
+            this database (see SharedRateLimiter); otherwise per-process.
     """
+    if db_path is not None:
+        from src.utils.shared_rate_limiter import SharedRateLimiter
+
+        return SharedRateLimiter(db_path, "tradier", limit=120, window_type="minute", lease_size=10)
     return TokenBucketRateLimiter(rate=120, per_seconds=60, burst=150)
+
+
+def create_twelve_data_limiter(
+    db_path: Optional[Union[str, Path]] = None,
+) -> CompositeRateLimiter:
+    """
+    Create rate limiter for Twelve Data API (historical prices for backfill).
+
+    Twelve Data free tier limits:
+    - 8 calls per minute
+    - 800 calls per day
+
+    Args:
+        db_path: If given, share the limits with every local process using
+            this database (see SharedRateLimiter); otherwise per-process.
+    """
+    if db_path is not None:
+        from src.utils.shared_rate_limiter import SharedRateLimiter
+
+        return CompositeRateLimiter(
+            [
+                SharedRateLimiter(db_path, "twelve_data", limit=8, window_type="minute"),
+                SharedRateLimiter(db_path, "twelve_data", limit=800, window_type="day", lease_size=8),
+            ]
+        )
+    return CompositeRateLimiter(
+        [
+            TokenBucketRateLimiter(rate=8, per_seconds=60),  # 8/min
+            TokenBucketRateLimiter(rate=800, per_seconds=86400),  # 800/day
+        ]
+    )
@@ -0,0 +1,378 @@
+"""
+Cross-process rate limiter backed by the rate_limits table.
+
+2.0 CLI scans, 6.0 agents and local scripts share the same Tradier and
+Alpha Vantage keys. An in-memory TokenBucketRateLimiter only sees its own
+process, so running two of them together exceeds the provider limit. This
+limiter keeps the count in ivcrush.db instead, where every local process
+sees it.
+
+The rate_limits table (created by init_schema.py) is a fixed-window counter:
+one row per (service, window_start, window_type) with a request_count. A
+process never updates it per request. It leases a batch of the window's
+budget in one short BEGIN IMMEDIATE transaction, then hands tokens out of
+the lease from memory. Lease size trades accuracy for overhead: a lease of
+10 costs one write per 10 requests, and at worst strands 10 requests of
+budget per process when the window ends.
+
+If the database is unavailable the limiter falls back to an in-memory
+TokenBucketRateLimiter with the same limit, so a locked or missing DB never
+stops a scan. The shared path is retried every FALLBACK_RETRY_SECONDS, so a
+transient error (one busy timeout) doesn't leave the process on
+per-process limits for good. Both switches are logged and counted as
+`<service>.shared_limiter.fallback` / `.restored` metrics.
+"""
+
+import logging
+import sqlite3
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from threading import Lock
+from typing import Optional, Union
+
+# Ensure common/ is importable (for production code outside pytest)
+_root = str(Path(__file__).resolve().parent.parent.parent.parent)
+if _root not in sys.path:
+    sys.path.insert(0, _root)
+
+from common.db import connect  # noqa: E402
+
+from src.infrastructure.monitoring.metrics import get_global_collector  # noqa: E402
+from src.utils.rate_limiter import TokenBucketRateLimiter  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+WINDOW_SECONDS = {"minute": 60, "hour": 3600, "day": 86400}
+
+# Windows older than this are deleted when a new window is opened
+RETENTION_DAYS = 7
+
+# While falling back to per-process limits, retry the DB this often
+FALLBACK_RETRY_SECONDS = 30.0
+
+_CREATE_TABLE = """
+    CREATE TABLE IF NOT EXISTS rate_limits (
+        service TEXT NOT NULL,
+        window_start DATETIME NOT NULL,
+        window_type TEXT NOT NULL CHECK(window_type IN ('minute', 'hour', 'day')),
+        request_count INTEGER DEFAULT 0,
+        PRIMARY KEY (service, window_start, window_type)
+    )
+"""
+
+
+class SharedRateLimiter:
+    """
+    Fixed-window rate limiter shared by every process using the same DB.
+
+    Drop-in replacement for TokenBucketRateLimiter (acquire, wait_for_token,
+    get_tokens, reset), so it can be passed to TradierAPI, AlphaVantageAPI
+    or a CompositeRateLimiter.
+
+    Example:
+        limiter = SharedRateLimiter("data/ivcrush.db", "tradier", limit=120,
+                                    window_type="minute", lease_size=10)
+        if limiter.acquire(blocking=True):
+            make_api_call()
+    """
+
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        service: str,
+        limit: int,
+        window_type: str = "minute",
+        lease_size: int = 1,
+    ):
+        """
+        Initialize shared limiter.
+
+        Args:
+            db_path: Path to the shared SQLite database
+            service: Provider name (row key in rate_limits)
+            limit: Requests allowed per window across all processes
+            window_type: 'minute', 'hour' or 'day'
+            lease_size: Tokens claimed from the DB per write
+        """
+        if window_type not in WINDOW_SECONDS:
+            raise ValueError(f"window_type must be one of {sorted(WINDOW_SECONDS)}")
+        if limit <= 0 or lease_size <= 0:
+            raise ValueError("limit and lease_size must be positive")
+
+        self.db_path = str(db_path)
+        self.service = service
+        self.limit = limit
+        self.window_type = window_type
+        self.window_seconds = WINDOW_SECONDS[window_type]
+        self.lease_size = min(lease_size, limit)
+
+        self.lock = Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lease_window: Optional[str] = None
+        self._leased = 0
+        self._fallback: Optional[TokenBucketRateLimiter] = None
+        self._retry_shared_at = 0.0
+
+        # Stats
+        self.lease_writes = 0
+        self.tokens_granted = 0
+        self.fallbacks = 0
+
+        logger.debug(
+            f"Shared rate limiter: {service} {limit}/{window_type} "
+            f"(lease: {self.lease_size}, db: {self.db_path})"
+        )
+
+    # ------------------------------------------------------------------ #
+    #  Windows
+    # ------------------------------------------------------------------ #
+
+    def _window_start(self, now: Optional[float] = None) -> datetime:
+        """UTC start of the window containing `now`."""
+        now = time.time() if now is None else now
+        start = int(now // self.window_seconds) * self.window_seconds
+        return datetime.fromtimestamp(start, tz=timezone.utc)
+
+    @staticmethod
+    def _window_key(start: datetime) -> str:
+        return start.strftime("%Y-%m-%d %H:%M:%S")
+
+    def _seconds_until_next_window(self) -> float:
+        now = time.time()
+        return self.window_seconds - (now % self.window_seconds)
+
+    # ------------------------------------------------------------------ #
+    #  Database
+    # ------------------------------------------------------------------ #
+
+    def _get_conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            # Autocommit mode so BEGIN IMMEDIATE controls the transaction
+            self._conn = connect(
+                self.db_path, timeout=5.0, check_same_thread=False, isolation_level=None
+            )
+            self._conn.execute(_CREATE_TABLE)
+        return self._conn
+
+    def _lease(self, window: str, wanted: int) -> int:
+        """
+        Claim up to `wanted` tokens of `window`'s budget.
+
+        Returns:
+            Tokens granted (0 if the window is exhausted)
+        """
+        conn = self._get_conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO rate_limits "
+                "(service, window_start, window_type, request_count) VALUES (?, ?, ?, 0)",
+                (self.service, window, self.window_type),
+            )
+            if cursor.rowcount:
+                # First lease in a new window: prune old rows for this service
+                cutoff = self._window_start() - timedelta(days=RETENTION_DAYS)
+                conn.execute(
+                    "DELETE FROM rate_limits WHERE service = ? AND window_start < ?",
+                    (self.service, self._window_key(cutoff)),
+                )
+            used = conn.execute(
+                "SELECT request_count FROM rate_limits "
+                "WHERE service = ? AND window_start = ? AND window_type = ?",
+                (self.service, window, self.window_type),
+            ).fetchone()[0]
+            granted = max(0, min(wanted, self.limit - used))
+            if granted:
+                conn.execute(
+                    "UPDATE rate_limits SET request_count = request_count + ? "
+                    "WHERE service = ? AND window_start = ? AND window_type = ?",
+                    (granted, self.service, window, self.window_type),
+                )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        self.lease_writes += 1
+        return granted
+
+    def _active_fallback(self) -> Optional[TokenBucketRateLimiter]:
+        """The fallback limiter, or None when the shared path is (re)tried."""
+        if self._fallback is not None and time.monotonic() >= self._retry_shared_at:
+            return None
+        return self._fallback
+
+    def _use_fallback(self, error: Exception) -> TokenBucketRateLimiter:
+        """Switch to (or stay on) per-process limiting until the next retry."""
+        self._retry_shared_at = time.monotonic() + FALLBACK_RETRY_SECONDS
+        self._leased = 0
+        if self._conn is not None:
+            # Reopen on retry in case the connection itself is the problem
+            try:
+                self._conn.close()
+            except sqlite3.Error:
+                pass
+            self._conn = None
+        if self._fallback is None:
+            logger.warning(
+                f"Shared rate limiter for {self.service} unavailable ({error}); "
+                f"falling back to per-process limiting, retrying in {FALLBACK_RETRY_SECONDS:.0f}s"
+            )
+            self.fallbacks += 1
+            get_global_collector().increment(f"{self.service}.shared_limiter.fallback")
+            self._fallback = TokenBucketRateLimiter(
+                rate=self.limit, per_seconds=self.window_seconds
+            )
+        else:
+            logger.debug(f"Shared rate limiter for {self.service} still unavailable: {error}")
+        return self._fallback
+
+    def _leave_fallback(self) -> None:
+        """The shared path worked again: stop using the per-process limiter."""
+        if self._fallback is not None:
+            logger.info(f"Shared rate limiter for {self.service} restored")
+            get_global_collector().increment(f"{self.service}.shared_limiter.restored")
+            self._fallback = None
+
+    # ------------------------------------------------------------------ #
+    #  TokenBucketRateLimiter interface
+    # ------------------------------------------------------------------ #
+
+    def _try_acquire(self, tokens: int) -> bool:
+        """Take tokens from the local lease, topping it up from the DB."""
+        window = self._window_key(self._window_start())
+        if window != self._lease_window:
+            # Unused tokens from the previous window expire with it
+            self._lease_window = window
+            self._leased = 0
+
+        if self._leased < tokens:
+            self._leased += self._lease(window, max(tokens - self._leased, self.lease_size))
+
+        if self._leased >= tokens:
+            self._leased -= tokens
+            self.tokens_granted += tokens
+            return True
+        return False
+
+    def acquire(self, tokens: int = 1, blocking: bool = False) -> bool:
+        """
+        Attempt to acquire tokens.
+
+        Args:
+            tokens: Number of tokens to acquire
+            blocking: If True, wait for the next window when exhausted
+
+        Returns:
+            True if tokens acquired, False if rate limit exceeded
+        """
+        if tokens > self.limit:
+            return False
+
+        while True:
+            with self.lock:
+                fallback = self._active_fallback()
+                if fallback is None:
+                    try:
+                        acquired = self._try_acquire(tokens)
+                    except sqlite3.Error as e:
+                        fallback = self._use_fallback(e)
+                    else:
+                        self._leave_fallback()
+                        if acquired:
+                            return True
+
+                if fallback is None:
+                    if not blocking:
+                        logger.warning(
+                            f"Shared rate limit exceeded for {self.service} "
+                            f"({self.limit}/{self.window_type})"
+                        )
+                        return False
+                    wait_time = self._seconds_until_next_window()
+
+            if fallback is not None:
+                return fallback.acquire(tokens, blocking=blocking)
+
+            # Wait outside the lock (don't block other threads' leased tokens)
+            logger.info(f"Shared rate limit: waiting {wait_time:.2f}s for {self.service} window")
+            time.sleep(wait_time)
+
+    def wait_for_token(self, tokens: int = 1, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until tokens are available or timeout.
+
+        Args:
+            tokens: Number of tokens needed
+            timeout: Maximum seconds to wait (None = wait forever)
+
+        Returns:
+            True if tokens acquired, False if timeout
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        while True:
+            if self.acquire(tokens, blocking=False):
+                return True
+            remaining = None if deadline is None else deadline - time.time()
+            if remaining is not None and remaining <= 0:
+                logger.warning(f"Shared rate limit wait timeout for {self.service}")
+                return False
+            sleep_time = self._seconds_until_next_window()
+            time.sleep(sleep_time if remaining is None else min(sleep_time, remaining))
+
+    def get_tokens(self) -> float:
+        """Tokens left in the current window across all processes (for monitoring)."""
+        with self.lock:
+            if self._fallback is not None:
+                return self._fallback.get_tokens()
+            window = self._window_key(self._window_start())
+            try:
+                row = self._get_conn().execute(
+                    "SELECT request_count FROM rate_limits "
+                    "WHERE service = ? AND window_start = ? AND window_type = ?",
+                    (self.service, window, self.window_type),
+                ).fetchone()
+            except sqlite3.Error:
+                return 0.0
+            leased = self._leased if window == self._lease_window else 0
+            return float(self.limit - (row[0] if row else 0) + leased)
+
+    def release(self) -> None:
+        """Return this process's unused lease to the current window."""
+        with self.lock:
+            window = self._window_key(self._window_start())
+            if not self._leased or window != self._lease_window or self._fallback is not None:
+                self._leased = 0
+                return
+            try:
+                self._get_conn().execute(
+                    "UPDATE rate_limits SET request_count = MAX(0, request_count - ?) "
+                    "WHERE service = ? AND window_start = ? AND window_type = ?",
+                    (self._leased, self.service, window, self.window_type),
+                )
+            except sqlite3.Error as e:
+                logger.debug(f"Failed to release lease for {self.service}: {e}")
+            self._leased = 0
+
+    def reset(self) -> None:
+        """Clear this service's window counters (for testing)."""
+        with self.lock:
+            self._leased = 0
+            self._lease_window = None
+            if self._fallback is not None:
+                self._fallback.reset()
+                return
+            self._get_conn().execute(
+                "DELETE FROM rate_limits WHERE service = ? AND window_type = ?",
+                (self.service, self.window_type),
+            )
+        logger.debug(f"Shared rate limiter reset: {self.service}")
+
+    def close(self) -> None:
+        """Release the unused lease and close the DB connection."""
+        self.release()
+        with self.lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,141 @@
+"""
+Tests for the AIMD adaptive concurrency limiter.
+"""
+
+import asyncio
+import time
+from unittest.mock import MagicMock
+
+import aiohttp
+import pytest
+
+from src.infrastructure.api.tradier_async import AsyncRetryError, AsyncTradierAPI
+from src.infrastructure.monitoring.metrics import get_global_collector
+from src.utils.adaptive_concurrency import AdaptiveConcurrencyLimiter
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Tests for AdaptiveConcurrencyLimiter."""
+
+    def test_initial_limit_clamped(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=50, max_limit=8)
+        assert limiter.limit == 8
+
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyLimiter(min_limit=5, max_limit=2)
+
+    async def test_bounds_in_flight_to_limit(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=3, max_limit=3)
+        peak = 0
+
+        async def request():
+            nonlocal peak
+            await limiter.acquire()
+            try:
+                peak = max(peak, limiter.in_flight)
+                await asyncio.sleep(0.01)
+            finally:
+                limiter.release()
+
+        await asyncio.gather(*(request() for _ in range(12)))
+        assert peak == 3
+        assert limiter.in_flight == 0
+
+    async def test_additive_increase_after_healthy_window(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=4, name="test_aimd")
+
+        for _ in range(2):
+            await limiter.acquire()
+            limiter.on_success(0.05)
+            limiter.release()
+        assert limiter.limit == 3
+
+        # Next increase needs a full window of 3
+        for _ in range(2):
+            limiter.on_success(0.05)
+        assert limiter.limit == 3
+        limiter.on_success(0.05)
+        assert limiter.limit == 4
+
+        # Never past the ceiling
+        for _ in range(10):
+            limiter.on_success(0.05)
+        assert limiter.limit == 4
+        assert get_global_collector().get_gauge("test_aimd.concurrency.limit") == 4
+
+    def test_slow_success_does_not_increase(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=10, latency_target=1.0)
+        for _ in range(10):
+            limiter.on_success(1.5)
+        assert limiter.limit == 2
+
+    async def test_multiplicative_decrease_counts_once_per_overload(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8, max_limit=8)
+        started = [await limiter.acquire() for _ in range(4)]
+
+        # Four in-flight requests all hit the same 429 burst
+        for s in started:
+            limiter.on_overload(s)
+            limiter.release()
+        assert limiter.limit == 4
+        assert limiter.stats['limit_decreases'] == 1
+
+        # A request sent after the cut can cut again
+        limiter.on_overload(await limiter.acquire())
+        limiter.release()
+        assert limiter.limit == 2
+
+    async def test_decrease_respects_floor(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, min_limit=2, max_limit=4)
+        limiter.on_overload(time.monotonic())
+        assert limiter.limit == 2
+
+    async def test_increase_wakes_waiters(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=2)
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        limiter.on_success(0.01)  # Window of 1 complete -> limit 2
+        await asyncio.wait_for(waiter, timeout=1)
+        assert limiter.in_flight == 2
+
+    async def test_cancelled_waiter_frees_its_place(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        limiter.release()
+        assert limiter.in_flight == 0
+        await asyncio.wait_for(limiter.acquire(), timeout=1)
+
+
+class TestAsyncTradierAPIConcurrency:
+    """AsyncTradierAPI feeds 429s into its limiter."""
+
+    async def test_429_shrinks_limit(self):
+        api = AsyncTradierAPI("key", max_concurrent=8, max_retries=0)
+        assert api.limiter.limit == 4
+
+        response = MagicMock()
+        response.headers = {}
+        response.raise_for_status.side_effect = aiohttp.ClientResponseError(
+            MagicMock(), (), status=429
+        )
+        context = MagicMock()
+        context.__aenter__ = lambda *_: asyncio.sleep(0, response)
+        context.__aexit__ = lambda *_: asyncio.sleep(0, False)
+        api._session = MagicMock()
+        api._session.get.return_value = context
+
+        with pytest.raises(AsyncRetryError):
+            await api._request_with_retry("https://example.test", {}, "quote")
+
+        stats = api.get_stats()
+        assert stats['concurrency_limit'] == 2
+        assert stats['in_flight'] == 0
@@ -0,0 +1,383 @@
+"""
+Tests for the asyncio scan pipeline (scripts/scan/async_pipeline.py).
+
+Tradier and yfinance are replaced by in-memory fakes that sleep for a fixed
+latency, so the benchmark compares engines by how they schedule provider
+calls rather than by network conditions.
+"""
+
+import asyncio
+import io
+import time
+from datetime import date, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from scripts.scan import async_pipeline
+from scripts.scan.async_pipeline import AsyncScanPipeline, nearest_expiration
+from scripts.scan.live_table import LiveRankingTable
+from scripts.scan.quality_scorer import calculate_scan_quality_score, quality_score_upper_bound
+from src.application.metrics.vrp import VRPCalculator
+from src.domain.errors import AppError, Err, ErrorCode, Ok
+from src.domain.types import Money, OptionChain, OptionQuote, Percentage, Strike
+from src.utils.concurrent_scanner import ConcurrentScanner, ScanResult
+from src.utils.shared_rate_limiter import SharedRateLimiter
+
+LATENCY = 0.01
+
+
+def make_chain(ticker: str, expiration: date) -> OptionChain:
+    """ATM straddle around $100 with one strike either side."""
+    quotes = {
+        Strike(95): OptionQuote(bid=Money(6), ask=Money(6.10), implied_volatility=Percentage(30),
+                                open_interest=1000, volume=100),
+        Strike(100): OptionQuote(bid=Money(3), ask=Money(3.10), implied_volatility=Percentage(28),
+                                 open_interest=2000, volume=200),
+        Strike(105): OptionQuote(bid=Money(1), ask=Money(1.10), implied_volatility=Percentage(32),
+                                 open_interest=1000, volume=100),
+    }
+    return OptionChain(ticker=ticker, expiration=expiration, stock_price=Money(100),
+                       calls=dict(quotes), puts=dict(quotes))
+
+
+class FakeTradier:
+    """AsyncTradierAPI stand-in: fixed latency, at most max_concurrent in flight."""
+
+    def __init__(self, expirations, max_concurrent: int = 16):
+        self.expirations = expirations
+        self.chain_requests = []
+        self._slots = asyncio.Semaphore(max_concurrent)
+        self._requests = 0
+
+    async def _call(self):
+        async with self._slots:
+            self._requests += 1
+            await asyncio.sleep(LATENCY)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return None
+
+    async def get_expirations(self, ticker):
+        await self._call()
+        return Ok(list(self.expirations))
+
+    async def get_option_chain(self, ticker, expiration):
+        await self._call()
+        self.chain_requests.append((ticker, expiration))
+        return Ok(make_chain(ticker, expiration))
+
+    def get_stats(self):
+        return {'request_count': self._requests, 'concurrency_limit': 16}
+
+
+class FakeYFinance:
+    def __init__(self, market_caps=None):
+        self.market_caps = market_caps or {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return None
+
+    async def get_ticker_info(self, ticker):
+        await asyncio.sleep(LATENCY)
+        return self.market_caps.get(ticker, 50_000.0), f"{ticker} Inc"
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self.headers = {}
+        self._payload = payload
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    async def json(self):
+        return self._payload
+
+
+class FakeSession:
+    """aiohttp.ClientSession stand-in answering every GET with `payload`."""
+
+    def __init__(self, payload):
+        self.payload = payload
+
+    def get(self, url, params=None):
+        return FakeResponse(self.payload)
+
+
+def make_container(has_history: bool = True):
+    vrp = SimpleNamespace(
+        vrp_ratio=2.0, edge_score=1.5, implied_move_pct=Percentage(6.1),
+        historical_mean_move_pct=Percentage(3.0),
+        recommendation=SimpleNamespace(value='excellent'), is_tradeable=True,
+    )
+    container = MagicMock()
+    container.config = SimpleNamespace(
+        api=SimpleNamespace(tradier_api_key='key', tradier_base_url='https://example.test'),
+        thresholds=SimpleNamespace(require_weekly_options=False, min_market_cap_millions=1000,
+                                   min_dte=3),
+    )
+    if has_history:
+        container.prices_repository.get_historical_moves.return_value = Ok([MagicMock()] * 8)
+    else:
+        container.prices_repository.get_historical_moves.return_value = Err(
+            AppError(ErrorCode.NODATA, "no history")
+        )
+    container.vrp_calculator.calculate.return_value = Ok(vrp)
+    container.skew_analyzer = None
+    container.ticker_metadata.get.return_value = None
+    container.ticker_metadata.stale.side_effect = lambda tickers: list(tickers)
+    return container
+
+
+def make_ranked_container(means):
+    """Container with a real VRPCalculator and `means[ticker]`% historical moves."""
+    container = make_container()
+    container.vrp_calculator = VRPCalculator()
+    container.prices_repository.get_historical_moves.side_effect = lambda ticker, limit: Ok(
+        [SimpleNamespace(close_move_pct=Percentage(means[ticker]))] * 8
+    )
+    return container
+
+
+def next_weekday(weekday: int) -> date:
+    """Next date (at least a week out) falling on weekday (0=Monday)."""
+    day = date.today() + timedelta(days=7)
+    return day + timedelta(days=(weekday - day.weekday()) % 7)
+
+
+def weekdays_after(start: date, days: int = 35):
+    return [start + timedelta(days=i) for i in range(days) if (start + timedelta(days=i)).weekday() < 5]
+
+
+def make_pipeline(container, expirations, market_caps=None) -> AsyncScanPipeline:
+    pipeline = AsyncScanPipeline(container)
+    pipeline.tradier = FakeTradier(expirations)
+    pipeline.yf = FakeYFinance(market_caps)
+    return pipeline
+
+
+@pytest.fixture(autouse=True)
+def hybrid_liquidity():
+    with patch.object(async_pipeline, 'check_liquidity_hybrid',
+                      return_value=(True, 'GOOD', {'method': 'NO_CHAIN'})) as check:
+        yield check
+
+
+class TestNearestExpiration:
+    def test_first_on_or_after_target(self):
+        exps = [date(2026, 1, 16), date(2026, 1, 9), date(2026, 1, 23)]
+        assert nearest_expiration(exps, date(2026, 1, 10)) == date(2026, 1, 16)
+        assert nearest_expiration(exps, date(2026, 1, 9)) == date(2026, 1, 9)
+
+    def test_falls_back_to_latest(self):
+        assert nearest_expiration([date(2026, 1, 9)], date(2026, 2, 1)) == date(2026, 1, 9)
+        assert nearest_expiration([], date(2026, 2, 1)) is None
+
+
+class TestAsyncScanPipeline:
+    async def test_scan_analyzes_and_filters(self):
+        monday = next_weekday(0)
+        container = make_container()
+        pipeline = make_pipeline(container, weekdays_after(monday), market_caps={'TINY': 200.0})
+
+        async with pipeline:
+            batch = await pipeline.scan({'AAA': (monday, 'AMC'), 'TINY': (monday, 'AMC')})
+
+        by_ticker = {r.ticker: r for r in batch.results}
+        assert by_ticker['TINY'].status == 'filtered'
+        assert by_ticker['AAA'].status == 'success'
+        assert by_ticker['AAA'].data['ticker_name'] == 'AAA Inc'
+        assert by_ticker['AAA'].data['liquidity_tier'] == 'GOOD'
+        assert batch.success_count == 1 and batch.filtered_count == 1
+
+        # Implied move (Tuesday) and trading (Friday) chains fetched once each
+        assert sorted(exp for _, exp in pipeline.tradier.chain_requests) == [
+            monday + timedelta(days=1), monday + timedelta(days=4)
+        ]
+
+    async def test_shared_expiration_fetched_once(self, hybrid_liquidity):
+        monday = next_weekday(0)
+        fridays = [d for d in weekdays_after(monday) if d.weekday() == 4]
+        pipeline = make_pipeline(make_container(), fridays)
+
+        async with pipeline:
+            result = await pipeline.scan_ticker('AAA', monday, monday + timedelta(days=4))
+
+        assert result.status == 'success'
+        assert pipeline.tradier.chain_requests == [('AAA', monday + timedelta(days=4))]
+        assert hybrid_liquidity.call_args.kwargs['chain'].expiration == monday + timedelta(days=4)
+
+    async def test_missing_history_is_unscored(self):
+        monday = next_weekday(0)
+        pipeline = make_pipeline(make_container(has_history=False), weekdays_after(monday))
+
+        async with pipeline:
+            result = await pipeline.scan_ticker('AAA', monday, monday + timedelta(days=4))
+
+        assert result.status == 'skip'
+        assert result.data['status'] == 'NO_HISTORICAL_DATA'
+        assert result.data['implied_move_pct']
+
+    async def test_tradier_requests_take_shared_limiter_tokens(self, tmp_path):
+        limiter = SharedRateLimiter(tmp_path / "limits.db", "tradier", limit=120,
+                                    window_type="minute", lease_size=10)
+        container = make_container()
+        container.tradier.rate_limiter = limiter
+        pipeline = AsyncScanPipeline(container)
+        pipeline.tradier._session = FakeSession({'expirations': {'date': ['2026-01-16']}})
+
+        for _ in range(3):
+            assert (await pipeline.tradier.get_expirations('AAA')).is_ok
+
+        assert limiter.tokens_granted == 3
+        assert limiter.get_tokens() == 117
+        limiter.close()
+
+
+class TestStreaming:
+    async def test_stream_yields_in_completion_order(self):
+        monday = next_weekday(0)
+        pipeline = make_pipeline(make_container(), weekdays_after(monday), market_caps={'TINY': 200.0})
+
+        async with pipeline:
+            seen = [r.ticker async for r in pipeline.stream({
+                'AAA': (monday, 'AMC'), 'TINY': (monday, 'AMC'),
+            })]
+
+        # TINY is filtered before any Tradier call, so it finishes first
+        assert seen == ['TINY', 'AAA']
+
+    async def test_top_k_stops_before_unreachable_tickers(self):
+        monday = next_weekday(0)
+        means = {'HI1': 1.0, 'HI2': 1.2, 'LOW1': 20.0, 'LOW2': 25.0}
+        pipeline = make_pipeline(make_ranked_container(means), weekdays_after(monday))
+        pipeline.max_concurrent = 1
+
+        async with pipeline:
+            batch = await pipeline.scan({t: (monday, 'AMC') for t in means}, top_k=2)
+
+        by_ticker = {r.ticker: r for r in batch.results}
+        assert by_ticker['HI1'].status == by_ticker['HI2'].status == 'success'
+        assert by_ticker['LOW1'].status == by_ticker['LOW2'].status == 'skip'
+        assert 'top 2' in by_ticker['LOW1'].error
+        assert {t for t, _ in pipeline.tradier.chain_requests} == {'HI1', 'HI2'}
+        # History fetched for the bounds is reused, not fetched again
+        assert pipeline.container.prices_repository.get_historical_moves.call_count == 4
+
+    async def test_top_k_analyzes_everything_when_bounds_overlap(self):
+        monday = next_weekday(0)
+        means = {'A': 1.0, 'B': 1.1, 'C': 1.2}
+        pipeline = make_pipeline(make_ranked_container(means), weekdays_after(monday))
+
+        async with pipeline:
+            batch = await pipeline.scan({t: (monday, 'AMC') for t in means}, top_k=1)
+
+        assert batch.success_count == 3
+
+
+class TestQualityScoreUpperBound:
+    @pytest.mark.parametrize("mean", [0.5, 1.0, 2.5, 5.0, 12.0, 30.0])
+    def test_bounds_every_reachable_score(self, mean):
+        bound = quality_score_upper_bound(mean)
+        for implied in [x / 4 for x in range(0, 121)]:
+            for tier in ('EXCELLENT', 'GOOD', 'WARNING', 'REJECT'):
+                score = calculate_scan_quality_score({
+                    'vrp_ratio': implied / mean,
+                    'implied_move_pct': f"{implied}%",
+                    'liquidity_tier': tier,
+                })
+                assert score <= bound
+
+    @pytest.mark.parametrize("mean", [1.0, 5.0])
+    def test_implied_move_above_ceiling_stays_within_bound(self, mean):
+        """A 40% implied move (suspect data, no hard cap upstream) cannot beat the bound."""
+        score = calculate_scan_quality_score({
+            'vrp_ratio': 40.0 / mean,
+            'implied_move_pct': '40.0%',
+            'liquidity_tier': 'EXCELLENT',
+        })
+        assert score <= quality_score_upper_bound(mean)
+        assert score == calculate_scan_quality_score({
+            'vrp_ratio': 30.0 / mean,
+            'implied_move_pct': '30.0%',
+            'liquidity_tier': 'EXCELLENT',
+        })
+
+    def test_bound_is_attained(self):
+        assert quality_score_upper_bound(20.0) == calculate_scan_quality_score({
+            'vrp_ratio': 0.0, 'implied_move_pct': '0%', 'liquidity_tier': 'EXCELLENT',
+        })
+
+
+class TestLiveRankingTable:
+    def test_non_interactive_prints_leaderboard_entries(self):
+        out = io.StringIO()
+        table = LiveRankingTable(total=3, rows=1, stream=out)
+        row = {'ticker': 'AAA', 'vrp_ratio': 5.0, 'implied_move_pct': '6.0%',
+               'liquidity_tier': 'GOOD', 'is_tradeable': True}
+
+        table.update(ScanResult(ticker='AAA', status='success', data=dict(row)))
+        table.update(ScanResult(ticker='BBB', status='filtered'))
+        table.update(ScanResult(ticker='CCC', status='success',
+                                data=dict(row, ticker='CCC', vrp_ratio=1.0)))
+        table.close()
+
+        lines = out.getvalue().splitlines()
+        assert len(lines) == 1  # CCC ranks below the single visible row
+        assert lines[0].startswith('[1/3] #1 AAA')
+
+
+@pytest.mark.performance
+class TestScanEngineBenchmark:
+    """Threaded ConcurrentScanner vs the asyncio pipeline on 120 tickers."""
+
+    TICKERS = 120
+
+    # Provider calls the threaded path makes per ticker, one after another:
+    # filter (market cap, liquidity chain), then analyze_ticker (IM expiration
+    # lookup, IM chain, trading expiration lookup, hybrid liquidity chain, skew chain)
+    THREADED_CALLS_PER_TICKER = 7
+
+    async def test_async_pipeline_beats_thread_pool(self):
+        monday = next_weekday(0)
+        earnings_lookup = {f"T{i:03d}": (monday, 'AMC') for i in range(self.TICKERS)}
+
+        def filter_func(ticker, expiration):
+            time.sleep(2 * LATENCY)
+            return False, None
+
+        def analyze_func(container, ticker, earnings_date, expiration_date):
+            time.sleep((self.THREADED_CALLS_PER_TICKER - 2) * LATENCY)
+            return {'status': 'SUCCESS'}
+
+        scanner = ConcurrentScanner(MagicMock(), max_workers=5, rate_limit_per_second=10_000)
+        threaded_batch = await asyncio.to_thread(
+            scanner.scan_tickers,
+            tickers=list(earnings_lookup),
+            earnings_lookup=earnings_lookup,
+            analyze_func=analyze_func,
+            filter_func=filter_func,
+        )
+
+        pipeline = make_pipeline(make_container(), weekdays_after(monday))
+        async with pipeline:
+            async_batch = await pipeline.scan(earnings_lookup)
+
+        assert async_batch.success_count == self.TICKERS
+        assert threaded_batch.success_count == self.TICKERS
+        speedup = threaded_batch.total_duration_ms / async_batch.total_duration_ms
+        assert speedup > 3, f"async pipeline only {speedup:.1f}x faster"
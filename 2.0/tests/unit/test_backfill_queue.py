@@ -0,0 +1,127 @@
+"""
+Tests for the in-process BackfillQueue and the scanners' backfill helper.
+"""
+
+import sqlite3
+import threading
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from src.application.services import backfill_queue as bq
+from src.application.services.backfill_queue import BackfillQueue
+from src.application.services.earnings_backfill import (
+    DailyPrice,
+    EarningsEvent,
+    EarningsTiming,
+)
+from src.infrastructure.database.init_schema import init_database
+from scripts.scan import analysis_common
+
+EARNINGS_DAY = date.today() - timedelta(days=60)
+
+
+def _prices():
+    """Three trading days around EARNINGS_DAY with a 10% gap on earnings day."""
+    days = [EARNINGS_DAY - timedelta(days=1), EARNINGS_DAY, EARNINGS_DAY + timedelta(days=1)]
+    return [
+        DailyPrice(date=d, open=o, high=o + 1, low=o - 1, close=c, volume=1000)
+        for d, o, c in zip(days, [100.0, 110.0, 111.0], [100.0, 110.0, 111.0])
+    ]
+
+
+@pytest.fixture
+def fake_sources(monkeypatch):
+    """Stub event and price sources; records which tickers hit Twelve Data."""
+    fetched = []
+    lock = threading.Lock()
+
+    def load_events(ticker, db_path, start_date=None, end_date=None):
+        if ticker == "NOEVENTS":
+            return []
+        return [EarningsEvent(ticker=ticker, date=EARNINGS_DAY, timing=EarningsTiming.BMO)]
+
+    def get_prices(ticker, start_date=None, end_date=None):
+        with lock:
+            fetched.append(ticker)
+        return [] if ticker == "NOPRICES" else _prices()
+
+    monkeypatch.setattr(bq, "load_events", load_events)
+    monkeypatch.setattr(bq, "get_twelve_data_prices", get_prices)
+    return fetched
+
+
+@pytest.fixture
+def queue(test_db_path):
+    init_database(test_db_path)
+    backfill = BackfillQueue(test_db_path, batch_window=0.2)
+    yield backfill
+    backfill.close(timeout=5)
+
+
+def _moves_in_db(db_path):
+    with sqlite3.connect(db_path) as conn:
+        return {row[0] for row in conn.execute("SELECT ticker FROM historical_moves")}
+
+
+class TestBackfillQueue:
+
+    def test_batch_saves_all_moves(self, queue, fake_sources, test_db_path):
+        futures = queue.submit_many(["AAA", "BBB", "CCC"])
+
+        assert [f.result(timeout=5) for f in futures.values()] == [1, 1, 1]
+        assert _moves_in_db(test_db_path) == {"AAA", "BBB", "CCC"}
+        stats = queue.get_stats()
+        assert stats['batches'] == 1
+        assert stats['moves_saved'] == 3
+
+    def test_duplicate_submit_fetches_once(self, queue, fake_sources):
+        first = queue.submit("aaa")
+        second = queue.submit("AAA")
+
+        assert first is second
+        first.result(timeout=5)
+        assert queue.submit("AAA") is first
+        assert fake_sources == ["AAA"]
+
+    def test_failures_resolve_per_ticker(self, queue, fake_sources, test_db_path):
+        futures = queue.submit_many(["NOPRICES", "NOEVENTS", "GOOD"])
+
+        with pytest.raises(RuntimeError):
+            futures["NOPRICES"].result(timeout=5)
+        assert futures["NOEVENTS"].result(timeout=5) == 0
+        assert futures["GOOD"].result(timeout=5) == 1
+        assert _moves_in_db(test_db_path) == {"GOOD"}
+
+        # A failed ticker is retried on the next submit
+        assert queue.submit("NOPRICES") is not futures["NOPRICES"]
+
+    def test_rate_limit_exhausted_is_timeout(self, test_db_path, fake_sources, monkeypatch):
+        init_database(test_db_path)
+        limiter = SimpleNamespace(wait_for_token=lambda timeout=None: False)
+        backfill = BackfillQueue(test_db_path, rate_limiter=limiter, batch_window=0)
+        try:
+            future = backfill.submit("AAA")
+            with pytest.raises(TimeoutError):
+                future.result(timeout=5)
+        finally:
+            backfill.close(timeout=5)
+        assert fake_sources == []
+
+
+class TestWaitForBackfill:
+
+    def test_statuses(self, queue, fake_sources):
+        container = SimpleNamespace(backfill_queue=queue)
+
+        assert analysis_common.wait_for_backfill(container, "AAA") == 'SUCCESS'
+        assert analysis_common.wait_for_backfill(container, "NOPRICES") == 'BACKFILL_FAILED'
+
+    def test_queue_unavailable_is_error(self):
+        class Broken:
+            @property
+            def backfill_queue(self):
+                raise RuntimeError("no database")
+
+        assert analysis_common.wait_for_backfill(Broken(), "AAA") == 'BACKFILL_ERROR'
@@ -0,0 +1,94 @@
+"""
+Tests for ConnectionPool and the shared SQLite profile from common.db.
+"""
+
+import pytest
+
+from common.db import BASELINE_PROFILE, DEFAULT_PROFILE, connect
+from src.infrastructure.database.connection_pool import ConnectionPool
+
+
+def _pragma(conn, name):
+    return conn.execute(f"PRAGMA {name}").fetchone()[0]
+
+
+class TestSQLiteProfile:
+    """connect() applies the shared PRAGMA profile."""
+
+    def test_default_profile_pragmas(self, test_db_path):
+        conn = connect(test_db_path)
+        try:
+            assert _pragma(conn, "journal_mode") == "wal"
+            assert _pragma(conn, "synchronous") == 1  # NORMAL
+            assert _pragma(conn, "cache_size") == -DEFAULT_PROFILE.cache_size_kib
+            assert _pragma(conn, "temp_store") == 2  # MEMORY
+            assert _pragma(conn, "busy_timeout") == DEFAULT_PROFILE.busy_timeout_ms
+            assert _pragma(conn, "foreign_keys") == 1
+        finally:
+            conn.close()
+
+    def test_explicit_timeout_sets_busy_timeout(self, test_db_path):
+        conn = connect(test_db_path, timeout=30)
+        try:
+            assert _pragma(conn, "busy_timeout") == 30000
+            assert _pragma(conn, "journal_mode") == "wal"
+        finally:
+            conn.close()
+
+    def test_baseline_profile_matches_sqlite_defaults(self, test_db_path):
+        conn = connect(test_db_path, BASELINE_PROFILE)
+        try:
+            assert _pragma(conn, "journal_mode") == "delete"
+            assert _pragma(conn, "synchronous") == 2  # FULL
+            assert _pragma(conn, "foreign_keys") == 0
+        finally:
+            conn.close()
+
+
+class TestConnectionPool:
+    """Pool connections use the profile and report checkout metrics."""
+
+    def test_pool_connections_use_profile(self, test_db_path):
+        pool = ConnectionPool(test_db_path, pool_size=2, max_overflow=0)
+        try:
+            with pool.get_connection() as conn:
+                assert _pragma(conn, "journal_mode") == "wal"
+                assert _pragma(conn, "temp_store") == 2
+        finally:
+            pool.close_all()
+
+    def test_stats_include_checkout_metrics(self, test_db_path):
+        pool = ConnectionPool(test_db_path, pool_size=2, max_overflow=0)
+        try:
+            for _ in range(3):
+                with pool.get_connection() as conn:
+                    conn.execute("SELECT 1")
+
+            stats = pool.stats()
+            assert stats["checkouts"] == 3
+            assert stats["checkout_timeouts"] == 0
+            assert stats["connections_created"] == 2
+            assert stats["wait_ms_avg"] >= 0
+        finally:
+            pool.close_all()
+
+    def test_overflow_connection_created_when_pool_empty(self, test_db_path):
+        pool = ConnectionPool(test_db_path, pool_size=1, max_overflow=1, pool_timeout=0.05)
+        try:
+            with pool.get_connection():
+                with pool.get_connection() as overflow:
+                    assert overflow.execute("SELECT 1").fetchone()[0] == 1
+            assert pool.stats()["connections_created"] == 2
+        finally:
+            pool.close_all()
+
+    def test_exhausted_pool_records_timeout(self, test_db_path):
+        pool = ConnectionPool(test_db_path, pool_size=1, max_overflow=0, pool_timeout=0.05)
+        try:
+            with pool.get_connection():
+                with pytest.raises(TimeoutError):
+                    with pool.get_connection():
+                        pass
+            assert pool.stats()["checkout_timeouts"] == 1
+        finally:
+            pool.close_all()
@@ -12,6 +12,7 @@ Tests the bidirectional sync functions for:
 
 import pytest
 import sqlite3
+import subprocess
 import tempfile
 from pathlib import Path
 from datetime import datetime, date, timedelta
@@ -30,7 +31,9 @@ from sync_databases import (
     sync_earnings_calendar,
     sync_trade_journal,
     _validate_gcs_name,
+    apply_cloud_changesets,
     backup_to_gdrive,
+    upload_cloud_db,
 )
 
 
@@ -468,5 +471,41 @@ class TestTransactionRollback:
         assert cloud_count == 2
 
 
+
+# ============================================================================
+# GCS Generation Tests
+# ============================================================================
+
+
+def _gsutil_result(stdout="", stderr="", returncode=0):
+    return subprocess.CompletedProcess([], returncode, stdout=stdout, stderr=stderr)
+
+
+class TestCloudGenerations:
+    """The merge only lands on the generation it was downloaded from."""
+
+    def test_upload_is_conditional_on_downloaded_generation(self, tmp_path):
+        src = tmp_path / "cloud.db"
+        src.write_bytes(b"db")
+        conflict = _gsutil_result(stderr="PreconditionException: 412", returncode=1)
+        with patch("sync_databases.run_gsutil", return_value=conflict) as gsutil:
+            assert upload_cloud_db(src, 7) is None
+        assert gsutil.call_args.args[0][:2] == ["-h", "x-goog-if-generation-match:7"]
+
+    def test_replaced_snapshot_skips_changesets(self, tmp_path):
+        listing = _gsutil_result(stdout="gs://b/ivcrush.db.changes/2.json.gz\n"
+                                        "gs://b/ivcrush.db.changes/3.json.gz\n")
+        manifest = {"epoch": "e", "snapshot_generation": 5, "snapshot_seq": 1}
+        with patch("sync_databases.run_gsutil", return_value=listing):
+            assert apply_cloud_changesets(tmp_path / "cloud.db", 6, manifest) == (0, 3)
+
+    def test_missing_changeset_aborts(self, tmp_path):
+        listing = _gsutil_result(stdout="gs://b/ivcrush.db.changes/3.json.gz\n")
+        manifest = {"epoch": "e", "snapshot_generation": 5, "snapshot_seq": 1}
+        with patch("sync_databases.run_gsutil", return_value=listing):
+            with pytest.raises(RuntimeError, match="Changeset 2 missing"):
+                apply_cloud_changesets(tmp_path / "cloud.db", 5, manifest)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,76 @@
+"""
+Tests for hedged async requests.
+"""
+
+import asyncio
+
+import pytest
+
+from src.utils.hedging import HedgedRequestPolicy
+
+
+def make_policy(delay: float = 0.005, **kwargs) -> HedgedRequestPolicy:
+    """Policy that treats anything slower than `delay` as a tail request."""
+    policy = HedgedRequestPolicy(min_delay=0.0, **kwargs)
+    policy._latencies.extend([delay] * policy.min_samples)
+    policy.requests = 100
+    return policy
+
+
+class TestHedgedRequestPolicy:
+    """Tests for HedgedRequestPolicy."""
+
+    async def test_unhedged_until_warm(self):
+        policy = HedgedRequestPolicy(min_samples=3)
+        assert policy.hedge_delay() is None
+
+        async def attempt():
+            return 1
+
+        assert await policy.run(attempt) == 1
+        assert policy.stats['hedged_requests'] == 0
+
+    async def test_hedge_wins_and_slow_copy_cancelled(self):
+        policy = make_policy()
+        started = []
+
+        async def attempt():
+            started.append(len(started))
+            if len(started) == 1:
+                await asyncio.sleep(5)
+                return "slow"
+            return "fast"
+
+        assert await asyncio.wait_for(policy.run(attempt), timeout=1) == "fast"
+        assert policy.stats['hedged_requests'] == 1
+        assert policy.stats['hedge_wins'] == 1
+
+    async def test_both_fail_raises_primary_error(self):
+        policy = make_policy()
+        count = 0
+
+        async def attempt():
+            nonlocal count
+            count += 1
+            n = count
+            await asyncio.sleep(0.02 if n == 1 else 0)
+            raise ValueError(f"attempt {n}")
+
+        with pytest.raises(ValueError, match="attempt 1"):
+            await policy.run(attempt)
+
+    async def test_budget_limits_hedges(self):
+        policy = HedgedRequestPolicy(budget=0.1)
+        policy.hedge_delay = lambda: 0.001
+        count = 0
+
+        async def attempt():
+            nonlocal count
+            count += 1
+            await asyncio.sleep(0.01)
+            return "ok"
+
+        for _ in range(20):
+            await policy.run(attempt)
+        assert policy.stats['hedged_requests'] == 2
+        assert count == 22
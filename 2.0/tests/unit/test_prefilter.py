@@ -0,0 +1,144 @@
+"""
+Tests for the bulk SQL prefilter that runs before any scan API call.
+"""
+
+import sqlite3
+from types import SimpleNamespace
+
+import pytest
+
+from src.infrastructure.database.init_schema import init_database
+from src.infrastructure.database.migrations import MigrationManager
+from src.infrastructure.database.repositories.prices_repository import PricesRepository
+from src.infrastructure.database.repositories.ticker_metadata_repository import (
+    TickerMetadataRepository,
+)
+from src.utils.concurrent_scanner import BatchScanResult, ScanResult
+from scripts.scan.constants import PREFILTER_CALLS_AVOIDED
+from scripts.scan.prefilter import prefilter_tickers
+
+
+@pytest.fixture
+def db(test_db_path):
+    init_database(test_db_path)
+    return test_db_path
+
+
+def _seed(db_path, moves_per_ticker, market_caps=None, stale=()):
+    """moves_per_ticker: ticker -> count; market_caps: ticker -> dollars."""
+    with sqlite3.connect(db_path) as conn:
+        for ticker, count in moves_per_ticker.items():
+            conn.executemany(
+                '''
+                INSERT INTO historical_moves
+                (ticker, earnings_date, prev_close, earnings_open, earnings_high,
+                 earnings_low, earnings_close, intraday_move_pct, gap_move_pct,
+                 close_move_pct)
+                VALUES (?, ?, 100, 101, 103, 99, 102, 3.0, 1.5, 2.0)
+                ''',
+                [(ticker, f"{2020 + q // 4}-{(q % 4) * 3 + 1:02d}-15") for q in range(count)],
+            )
+        for ticker, market_cap in (market_caps or {}).items():
+            updated_at = "2020-01-01 00:00:00" if ticker in stale else None
+            conn.execute(
+                "INSERT INTO ticker_metadata (ticker, market_cap, updated_at) "
+                "VALUES (?, ?, COALESCE(?, CURRENT_TIMESTAMP))",
+                (ticker, market_cap, updated_at),
+            )
+        conn.commit()
+
+
+def make_container(db_path, require_weekly_options=False):
+    return SimpleNamespace(
+        prices_repository=PricesRepository(db_path),
+        ticker_metadata_repository=TickerMetadataRepository(db_path),
+        config=SimpleNamespace(thresholds=SimpleNamespace(
+            min_market_cap_millions=1000.0,
+            require_weekly_options=require_weekly_options,
+        )),
+        vrp_calculator=SimpleNamespace(min_quarters=4),
+    )
+
+
+class TestPrefilterTickers:
+
+    def test_history_depth(self, db):
+        _seed(db, {"FULL": 8, "THIN": 2})
+        result = prefilter_tickers(make_container(db), ["FULL", "THIN", "NONE"])
+
+        assert result.survivors == ["FULL"]
+        assert result.rejected["THIN"] == ('skip', "Insufficient history (2 < 4 quarters)")
+        assert result.rejected["NONE"] == ('skip', "No historical data")
+        assert result.api_calls_avoided == 2 * PREFILTER_CALLS_AVOIDED['history']
+
+    def test_auto_backfill_keeps_untracked_tickers(self, db):
+        _seed(db, {"THIN": 2})
+        result = prefilter_tickers(make_container(db), ["THIN", "NEW"], auto_backfill=True)
+
+        # Backfill only runs when there is no history at all
+        assert result.survivors == ["NEW"]
+        assert "THIN" in result.rejected
+
+    def test_cached_market_cap(self, db):
+        _seed(
+            db, {"BIG": 8, "SMALL": 8, "OLD": 8},
+            market_caps={"BIG": 5e9, "SMALL": 2e8, "OLD": 2e8},
+            stale=("OLD",),
+        )
+        result = prefilter_tickers(make_container(db), ["BIG", "SMALL", "OLD"])
+
+        assert result.rejected["SMALL"] == ('filtered', "Market cap $200M < $1000M")
+        # A stale cached market cap is rechecked over the network
+        assert result.survivors == ["BIG", "OLD"]
+
+    def test_cached_weekly_options_flag(self, db):
+        _seed(db, {"MONTHLY": 8, "WEEKLY": 8})
+        repo = TickerMetadataRepository(db)
+        repo.save_weekly_options("MONTHLY", False)
+        repo.save_weekly_options("WEEKLY", True)
+
+        result = prefilter_tickers(
+            make_container(db, require_weekly_options=True), ["MONTHLY", "WEEKLY"]
+        )
+        assert result.survivors == ["WEEKLY"]
+        assert result.rejected["MONTHLY"] == ('filtered', "No weekly options")
+
+        skipped = prefilter_tickers(
+            make_container(db, require_weekly_options=True), ["MONTHLY"],
+            skip_weekly_filter=True,
+        )
+        assert skipped.survivors == ["MONTHLY"]
+
+    def test_database_error_passes_everything_through(self, tmp_path):
+        result = prefilter_tickers(make_container(tmp_path / "missing.db"), ["AAPL"])
+        assert result.survivors == ["AAPL"]
+        assert not result.rejected
+
+    def test_merge_into_batch(self, db):
+        _seed(db, {"FULL": 8, "THIN": 2}, market_caps={"SMALL": 2e8})
+        result = prefilter_tickers(make_container(db), ["FULL", "THIN", "SMALL"])
+        batch = BatchScanResult(
+            results=[ScanResult(ticker="FULL", status='success', data={})],
+            success_count=1, error_count=0, skip_count=0, filtered_count=0,
+            total_duration_ms=30.0, avg_duration_ms=30.0,
+        )
+
+        merged = result.merge_into(batch)
+        assert {r.ticker for r in merged.results} == {"FULL", "THIN", "SMALL"}
+        assert (merged.success_count, merged.skip_count, merged.filtered_count) == (1, 1, 1)
+        assert merged.avg_duration_ms == pytest.approx(10.0)
+
+
+class TestMigration010:
+
+    def test_adds_weekly_columns_to_existing_table(self, test_db_path):
+        with sqlite3.connect(test_db_path) as conn:
+            conn.execute(
+                "CREATE TABLE ticker_metadata (ticker TEXT PRIMARY KEY, company_name TEXT, "
+                "market_cap REAL, updated_at DATETIME DEFAULT CURRENT_TIMESTAMP)"
+            )
+        manager = MigrationManager(test_db_path)
+        with sqlite3.connect(test_db_path) as conn:
+            manager._apply_migration_010(conn.cursor())
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(ticker_metadata)")}
+        assert {"has_weekly_options", "weekly_options_checked_at"} <= columns
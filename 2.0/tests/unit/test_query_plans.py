@@ -0,0 +1,234 @@
+"""
+Query-plan regression tests for historical_moves hot queries.
+
+Each test runs a real repository/backtest read with sqlite3 tracing enabled,
+then feeds the captured SQL through EXPLAIN QUERY PLAN. A plan that scans the
+whole table or builds a temp B-tree for ORDER BY/window sorting fails the
+test, so index regressions (dropped indices, rewritten queries) are caught
+before they reach production.
+"""
+
+import sqlite3
+from datetime import date
+
+import pytest
+
+from src.application.services.backtest_engine import BacktestEngine
+from src.infrastructure.database.init_schema import init_database
+from src.infrastructure.database.migrations import MigrationManager
+from src.infrastructure.database.repositories.prices_repository import PricesRepository
+
+NUM_TICKERS = 50
+QUARTERS_PER_TICKER = 16
+
+
+def _seed_moves(db_path):
+    """Insert enough rows that the planner prefers indices over scans."""
+    rows = []
+    for t in range(NUM_TICKERS):
+        ticker = f"T{t:03d}"
+        for q in range(QUARTERS_PER_TICKER):
+            year = 2020 + q // 4
+            month = (q % 4) * 3 + 1
+            rows.append((
+                ticker, f"{year}-{month:02d}-15",
+                100.0, 101.0, 103.0, 99.0, 102.0,
+                3.0 + t % 5, 1.5, 2.0,
+            ))
+
+    with sqlite3.connect(db_path) as conn:
+        conn.executemany(
+            '''
+            INSERT INTO historical_moves
+            (ticker, earnings_date, prev_close, earnings_open, earnings_high,
+             earnings_low, earnings_close, intraday_move_pct, gap_move_pct,
+             close_move_pct)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''',
+            rows,
+        )
+        conn.execute("ANALYZE")
+        conn.commit()
+
+
+def _stamp_version(db_path, version):
+    """Mark migrations up to version as applied (production DB baseline).
+
+    Migrations 007/008 alter journal tables that init_database doesn't
+    create, so tests start from an already-migrated v8 database.
+    """
+    manager = MigrationManager(db_path)
+    with sqlite3.connect(db_path) as conn:
+        manager._ensure_migrations_table(conn)
+        conn.executemany(
+            "INSERT INTO schema_migrations (version, name, applied_at) "
+            "VALUES (?, ?, datetime('now'))",
+            [(m.version, m.name) for m in manager.migrations if m.version <= version],
+        )
+        conn.commit()
+
+
+@pytest.fixture
+def migrated_db(test_db_path):
+    """Schema from init_database plus all migrations, seeded with moves."""
+    init_database(test_db_path)
+    _stamp_version(test_db_path, 8)
+    MigrationManager(test_db_path).migrate()
+    _seed_moves(test_db_path)
+    return test_db_path
+
+
+@pytest.fixture
+def captured_sql(monkeypatch):
+    """Record every statement executed on connections opened during a test."""
+    statements = []
+    real_connect = sqlite3.connect
+
+    def tracing_connect(*args, **kwargs):
+        conn = real_connect(*args, **kwargs)
+        conn.set_trace_callback(statements.append)
+        return conn
+
+    monkeypatch.setattr(sqlite3, "connect", tracing_connect)
+    return statements
+
+
+def _plan_for_captured(db_path, statements):
+    """EXPLAIN QUERY PLAN the single captured SELECT on historical_moves."""
+    selects = [
+        s for s in statements
+        if s.lstrip().upper().startswith(("SELECT", "WITH"))
+        and "historical_moves" in s
+    ]
+    assert len(selects) == 1, f"expected one hot query, captured: {selects}"
+
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute(f"EXPLAIN QUERY PLAN {selects[0]}").fetchall()
+    return [row[3] for row in rows]
+
+
+def _assert_indexed(plan):
+    """Fail on full table scans or temp B-tree sorts."""
+    for detail in plan:
+        assert not (
+            detail.startswith("SCAN historical_moves")
+            or detail.startswith("SCAN hm")
+        ), f"full table scan in plan: {plan}"
+        assert "TEMP B-TREE" not in detail, f"temp B-tree sort in plan: {plan}"
+    assert any("INDEX" in detail for detail in plan), f"no index used: {plan}"
+
+
+class TestMigration009:
+    """Covering indices are created and redundant ones are dropped."""
+
+    def test_indices_present_after_migration(self, migrated_db):
+        with sqlite3.connect(migrated_db) as conn:
+            names = {
+                row[0] for row in conn.execute(
+                    "SELECT name FROM sqlite_master "
+                    "WHERE type='index' AND tbl_name='historical_moves'"
+                )
+            }
+        assert "idx_moves_ticker_date_cover" in names
+        assert "idx_moves_date_ticker_cover" in names
+        assert "idx_moves_ticker" not in names
+        assert "idx_moves_date" not in names
+
+    def test_upgrades_legacy_indices(self, test_db_path):
+        """Existing DBs with the old single-column indices are upgraded."""
+        init_database(test_db_path)
+        with sqlite3.connect(test_db_path) as conn:
+            conn.execute("DROP INDEX idx_moves_ticker_date_cover")
+            conn.execute("DROP INDEX idx_moves_date_ticker_cover")
+            conn.execute("CREATE INDEX idx_moves_ticker ON historical_moves(ticker)")
+            conn.execute("CREATE INDEX idx_moves_date ON historical_moves(earnings_date)")
+            conn.commit()
+        _stamp_version(test_db_path, 8)
+
+        manager = MigrationManager(test_db_path)
+        assert manager.migrate(target_version=9) == 1
+
+        with sqlite3.connect(test_db_path) as conn:
+            names = {
+                row[0] for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type='index'"
+                )
+            }
+        assert {"idx_moves_ticker_date_cover", "idx_moves_date_ticker_cover"} <= names
+        assert "idx_moves_ticker" not in names
+        assert manager.get_current_version() == 9
+
+    def test_rollback_restores_single_column_indices(self, migrated_db):
+        manager = MigrationManager(migrated_db)
+        manager.rollback(8)
+
+        with sqlite3.connect(migrated_db) as conn:
+            names = {
+                row[0] for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type='index'"
+                )
+            }
+        assert "idx_moves_ticker" in names
+        assert "idx_moves_date" in names
+        assert "idx_moves_ticker_date_cover" not in names
+
+
+class TestHistoricalMovesQueryPlans:
+    """EXPLAIN QUERY PLAN checks for each hot historical_moves read."""
+
+    def test_prices_repository_get_historical_moves(self, migrated_db, captured_sql):
+        repo = PricesRepository(migrated_db)
+        result = repo.get_historical_moves("T001", limit=12)
+        assert result.is_ok and len(result.value) == 12
+
+        _assert_indexed(_plan_for_captured(migrated_db, captured_sql))
+
+    def test_prices_repository_batch(self, migrated_db, captured_sql):
+        repo = PricesRepository(migrated_db)
+        result = repo.get_historical_moves_batch(["T001", "T002", "T003"], limit=4)
+        assert result.is_ok
+        moves = result.value
+        assert all(len(m) == 4 for m in moves.values())
+        # Most recent first within each ticker
+        dates = [m.earnings_date for m in moves["T002"]]
+        assert dates == sorted(dates, reverse=True)
+
+        _assert_indexed(_plan_for_captured(migrated_db, captured_sql))
+
+    def test_prices_repository_batch_short_history(self, migrated_db):
+        """Tickers with fewer moves than the limit return all their moves."""
+        repo = PricesRepository(migrated_db)
+        result = repo.get_historical_moves_batch(["T001", "NONE"], limit=50)
+        assert result.is_ok
+        assert len(result.value["T001"]) == QUARTERS_PER_TICKER
+        assert result.value["NONE"] == []
+
+    def test_prices_repository_batch_zero_limit(self, migrated_db):
+        repo = PricesRepository(migrated_db)
+        result = repo.get_historical_moves_batch(["T001"], limit=0)
+        assert result.is_ok
+        assert result.value == {"T001": []}
+
+    def test_prices_repository_count_moves(self, migrated_db, captured_sql):
+        repo = PricesRepository(migrated_db)
+        assert repo.count_moves("T001").value == QUARTERS_PER_TICKER
+
+        _assert_indexed(_plan_for_captured(migrated_db, captured_sql))
+
+    def test_backtest_loader(self, migrated_db, captured_sql):
+        engine = BacktestEngine(migrated_db)
+        moves = engine.get_historical_moves("T001", date(2023, 6, 1), num_quarters=4)
+        assert len(moves) == 4
+
+        plan = _plan_for_captured(migrated_db, captured_sql)
+        _assert_indexed(plan)
+        assert any("COVERING INDEX" in detail for detail in plan), plan
+
+    def test_backtest_events_in_period(self, migrated_db, captured_sql):
+        engine = BacktestEngine(migrated_db)
+        events = engine.get_all_earnings_in_period(date(2021, 1, 1), date(2021, 12, 31))
+        assert len(events) == NUM_TICKERS * 4
+
+        plan = _plan_for_captured(migrated_db, captured_sql)
+        _assert_indexed(plan)
+        assert any("COVERING INDEX" in detail for detail in plan), plan
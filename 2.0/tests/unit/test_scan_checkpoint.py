@@ -0,0 +1,168 @@
+"""
+Tests for scan checkpoints (--resume) and the scan_checkpoints journal.
+"""
+
+import sqlite3
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+
+from src.infrastructure.database.init_schema import init_database
+from src.infrastructure.database.migrations import MigrationManager
+from src.infrastructure.database.repositories.scan_checkpoint_repository import (
+    ScanCheckpointRepository,
+)
+from src.utils.concurrent_scanner import BatchScanResult, ScanResult
+from scripts.scan import workflows
+from scripts.scan.checkpoint import ScanCheckpoint, checkpoint_key
+from scripts.scan.prefilter import PrefilterResult
+
+
+@pytest.fixture
+def repo(test_db_path):
+    init_database(test_db_path)
+    return ScanCheckpointRepository(test_db_path)
+
+
+def _age_checkpoint(db_path, ticker, hours):
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "UPDATE scan_checkpoints SET completed_at = datetime('now', ?) WHERE ticker = ?",
+            (f"-{hours} hours", ticker),
+        )
+
+
+def _analysis(ticker, vrp=2.0):
+    return {'ticker': ticker, 'vrp_ratio': vrp, 'is_tradeable': True, 'status': 'SUCCESS'}
+
+
+class FakeScanner:
+    """Stands in for ConcurrentScanner: every ticker succeeds."""
+
+    def __init__(self):
+        self.scanned = []
+
+    def scan_tickers(self, tickers, earnings_lookup, analyze_func, filter_func,
+                     expiration_offset, progress_callback, result_callback=None):
+        results = []
+        for ticker in tickers:
+            self.scanned.append(ticker)
+            result = ScanResult(ticker=ticker, status='success', data=_analysis(ticker),
+                                duration_ms=10.0)
+            results.append(result)
+            if result_callback:
+                result_callback(result)
+        return BatchScanResult(
+            results=results, success_count=len(results), error_count=0,
+            skip_count=0, filtered_count=0,
+            total_duration_ms=10.0 * len(results), avg_duration_ms=10.0,
+        )
+
+
+class TestScanCheckpoint:
+
+    def test_resume_reuses_recorded_results(self, repo):
+        container = SimpleNamespace(scan_checkpoint_repository=repo)
+        first = ScanCheckpoint(container, 'scan', '2025-01-31')
+        first.record_analysis("AAPL", _analysis("AAPL"))
+        first.record_filtered("TINY", "Market cap $200M < $1000M")
+        assert first.recorded == 2
+
+        resumed = ScanCheckpoint(container, 'scan', '2025-01-31', resume=True)
+        assert resumed.completed["AAPL"].data == _analysis("AAPL")
+        assert resumed.completed["TINY"].status == 'filtered'
+        assert resumed.pending(["AAPL", "TINY", "MSFT"]) == ["MSFT"]
+
+    def test_without_resume_nothing_is_reused(self, repo):
+        container = SimpleNamespace(scan_checkpoint_repository=repo)
+        ScanCheckpoint(container, 'scan', '2025-01-31').record_analysis("AAPL", _analysis("AAPL"))
+
+        fresh = ScanCheckpoint(container, 'scan', '2025-01-31')
+        assert fresh.pending(["AAPL"]) == ["AAPL"]
+
+    def test_errors_and_skips_are_not_journaled(self, repo):
+        container = SimpleNamespace(scan_checkpoint_repository=repo)
+        checkpoint = ScanCheckpoint(container, 'scan', '2025-01-31')
+        checkpoint.record(ScanResult(ticker="ERR", status='error', error="timeout"))
+        checkpoint.record(ScanResult(ticker="CUT", status='skip', error="Cannot reach top 5"))
+
+        assert ScanCheckpoint(container, 'scan', '2025-01-31', resume=True).completed == {}
+
+    def test_stale_and_other_runs_are_ignored(self, repo, test_db_path):
+        container = SimpleNamespace(scan_checkpoint_repository=repo)
+        checkpoint = ScanCheckpoint(container, 'scan', '2025-01-31')
+        checkpoint.record_analysis("OLD", _analysis("OLD"))
+        checkpoint.record_analysis("NEW", _analysis("NEW"))
+        _age_checkpoint(test_db_path, "OLD", 5)
+
+        assert set(ScanCheckpoint(container, 'scan', '2025-01-31', resume=True).completed) == {"NEW"}
+        assert ScanCheckpoint(container, 'scan', '2025-02-07', resume=True).completed == {}
+
+    def test_resume_with_other_tickers_ignores_the_rest(self, repo):
+        container = SimpleNamespace(scan_checkpoint_repository=repo)
+        key = checkpoint_key('tickers')
+        first = ScanCheckpoint(container, 'ticker', key, tickers=["AAPL", "MSFT"])
+        first.record_analysis("AAPL", _analysis("AAPL"))
+        first.record_analysis("MSFT", _analysis("MSFT"))
+
+        resumed = ScanCheckpoint(container, 'ticker', key, resume=True, tickers=["msft", "NVDA"])
+        assert set(resumed.completed) == {"MSFT"}
+        assert resumed.pending(["msft", "NVDA"]) == ["NVDA"]
+
+        batch = resumed.merge_into(BatchScanResult(
+            results=[], success_count=0, error_count=0, skip_count=0,
+            filtered_count=0, total_duration_ms=0.0, avg_duration_ms=0.0,
+        ))
+        assert [r.ticker for r in batch.results] == ["MSFT"]
+
+    def test_key_depends_on_options(self):
+        assert checkpoint_key('2025-01-31') == '2025-01-31'
+        assert len({
+            checkpoint_key('2025-01-31'),
+            checkpoint_key('2025-01-31', expiration_offset=1),
+            checkpoint_key('2025-01-31', skip_weekly_filter=True),
+        }) == 3
+
+
+class TestResumeParallelScan:
+
+    def test_resumed_tickers_are_merged_not_rescanned(self, repo, monkeypatch):
+        monkeypatch.setattr(
+            workflows, "prefilter_tickers",
+            lambda container, tickers, **kwargs: PrefilterResult(survivors=list(tickers)),
+        )
+        scanner = FakeScanner()
+        container = SimpleNamespace(scan_checkpoint_repository=repo, concurrent_scanner=scanner)
+        lookup = {"AAA": (date(2025, 1, 31), 'AMC'), "BBB": (date(2025, 1, 31), 'AMC')}
+
+        # Interrupted run finished AAA only
+        ScanCheckpoint(container, 'scan', '2025-01-31').record_analysis("AAA", _analysis("AAA"))
+
+        checkpoint = ScanCheckpoint(container, 'scan', '2025-01-31', resume=True)
+        batch, engine = workflows._run_parallel_scan(
+            container, lookup, None, False, None, threaded=True, checkpoint=checkpoint,
+        )
+
+        assert engine == "threaded"
+        assert scanner.scanned == ["BBB"]
+        assert {r.ticker for r in batch.results} == {"AAA", "BBB"}
+        assert batch.success_count == 2
+        # BBB was journaled as it completed
+        assert set(ScanCheckpoint(container, 'scan', '2025-01-31', resume=True).completed) == {
+            "AAA", "BBB"
+        }
+
+
+class TestMigration011:
+
+    def test_creates_journal_table(self, test_db_path):
+        manager = MigrationManager(test_db_path)
+        manager._ensure_migrations_table(sqlite3.connect(test_db_path))
+        manager._apply_migration(next(m for m in manager.migrations if m.version == 11))
+
+        with sqlite3.connect(test_db_path) as conn:
+            tables = {row[0] for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='table'"
+            )}
+        assert "scan_checkpoints" in tables
@@ -0,0 +1,162 @@
+"""
+Tests for SharedRateLimiter (cross-process limits in the rate_limits table).
+"""
+
+import multiprocessing
+import sqlite3
+import sys
+from dataclasses import replace
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.container import Container
+from src.utils.rate_limiter import (
+    CompositeRateLimiter,
+    create_alpha_vantage_limiter,
+    create_tradier_limiter,
+)
+from src.utils.shared_rate_limiter import SharedRateLimiter
+
+
+def _count(db_path, service="svc"):
+    conn = sqlite3.connect(db_path)
+    try:
+        row = conn.execute(
+            "SELECT SUM(request_count) FROM rate_limits WHERE service = ?", (service,)
+        ).fetchone()
+        return row[0] or 0
+    finally:
+        conn.close()
+
+
+def _grab(db_path, attempts, results):
+    """Child process: try `attempts` non-blocking acquires, report successes."""
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    from src.utils.shared_rate_limiter import SharedRateLimiter as Limiter
+
+    limiter = Limiter(db_path, "svc", limit=50, window_type="day", lease_size=5)
+    results.put(sum(limiter.acquire() for _ in range(attempts)))
+
+
+class TestSharedRateLimiter:
+
+    def test_limit_is_shared_between_instances(self, test_db_path):
+        a = SharedRateLimiter(test_db_path, "svc", limit=5, window_type="day")
+        b = SharedRateLimiter(test_db_path, "svc", limit=5, window_type="day")
+
+        assert all(a.acquire() for _ in range(3))
+        assert all(b.acquire() for _ in range(2))
+        assert not a.acquire()
+        assert not b.acquire()
+        assert _count(test_db_path) == 5
+
+    def test_leases_batch_db_writes(self, test_db_path):
+        limiter = SharedRateLimiter(test_db_path, "svc", limit=100, window_type="day", lease_size=10)
+
+        for _ in range(25):
+            assert limiter.acquire()
+
+        assert limiter.lease_writes == 3
+        assert _count(test_db_path) == 30  # Three leases of 10
+        assert limiter.get_tokens() == 75
+
+    def test_release_returns_unused_lease(self, test_db_path):
+        limiter = SharedRateLimiter(test_db_path, "svc", limit=100, window_type="day", lease_size=10)
+        limiter.acquire()
+        limiter.release()
+        assert _count(test_db_path) == 1
+
+    def test_partial_lease_when_window_nearly_full(self, test_db_path):
+        a = SharedRateLimiter(test_db_path, "svc", limit=12, window_type="day", lease_size=10)
+        b = SharedRateLimiter(test_db_path, "svc", limit=12, window_type="day", lease_size=10)
+        assert a.acquire()
+        assert b.acquire()  # Only 2 left: b leases 2
+        assert b.acquire()
+        assert not b.acquire()
+
+    def test_new_window_resets_budget(self, test_db_path):
+        limiter = SharedRateLimiter(test_db_path, "svc", limit=1, window_type="minute")
+        with patch("src.utils.shared_rate_limiter.time.time", return_value=1_000_040.0):
+            assert limiter.acquire()
+            assert not limiter.acquire()
+        with patch("src.utils.shared_rate_limiter.time.time", return_value=1_000_080.0):
+            assert limiter.acquire()
+
+    def test_blocking_waits_for_next_window(self, test_db_path):
+        limiter = SharedRateLimiter(test_db_path, "svc", limit=1, window_type="minute")
+        clock = {"now": 1_000_040.0}
+
+        def fake_sleep(seconds):
+            clock["now"] += seconds
+
+        with patch("src.utils.shared_rate_limiter.time.time", side_effect=lambda: clock["now"]), \
+             patch("src.utils.shared_rate_limiter.time.sleep", side_effect=fake_sleep) as sleep:
+            assert limiter.acquire(blocking=True)
+            assert limiter.acquire(blocking=True)
+        sleep.assert_called_once_with(pytest.approx(40.0))
+
+    def test_falls_back_to_local_limiter_when_db_unusable(self, tmp_path):
+        limiter = SharedRateLimiter(tmp_path / "missing" / "x.db", "svc", limit=2, window_type="minute")
+        assert limiter.acquire()
+        assert limiter.acquire()
+        assert not limiter.acquire()
+        assert limiter._fallback is not None
+
+    def test_transient_error_falls_back_then_recovers(self, test_db_path):
+        limiter = SharedRateLimiter(test_db_path, "svc", limit=10, window_type="minute")
+        limiter._get_conn()  # Creates the table
+        with patch.object(limiter, "_lease", side_effect=sqlite3.OperationalError("database is locked")):
+            assert limiter.acquire()
+        assert limiter._fallback is not None and limiter.fallbacks == 1
+        assert _count(test_db_path) == 0
+
+        # Within the cooldown the per-process limiter is used; after it the DB again
+        assert limiter.acquire()
+        assert _count(test_db_path) == 0
+        limiter._retry_shared_at = 0.0
+        assert limiter.acquire()
+        assert limiter._fallback is None
+        assert _count(test_db_path) == 1
+
+    def test_limit_holds_across_processes(self, test_db_path):
+        ctx = multiprocessing.get_context("spawn")
+        results = ctx.Queue()
+        procs = [ctx.Process(target=_grab, args=(str(test_db_path), 30, results)) for _ in range(3)]
+        for p in procs:
+            p.start()
+        for p in procs:
+            p.join(timeout=60)
+
+        granted = sum(results.get(timeout=5) for _ in procs)
+        assert granted == 50
+        assert _count(test_db_path) == 50
+
+
+class TestFactories:
+
+    def test_per_process_by_default(self):
+        assert not isinstance(create_tradier_limiter(), SharedRateLimiter)
+
+    def test_shared_when_db_given(self, test_db_path):
+        assert isinstance(create_tradier_limiter(test_db_path), SharedRateLimiter)
+        av = create_alpha_vantage_limiter(test_db_path)
+        assert isinstance(av, CompositeRateLimiter)
+        assert [l.window_type for l in av.limiters] == ["minute", "day"]
+
+
+class TestContainerClose:
+
+    def test_close_returns_unused_leases(self, config, test_db_path):
+        config = replace(
+            config,
+            database=replace(config.database, path=test_db_path),
+            rate_limits=replace(config.rate_limits, shared=True),
+        )
+        container = Container(config, skip_validation=True, run_migrations=False)
+        assert container.tradier.rate_limiter.acquire()
+        assert _count(test_db_path, "tradier") == 10
+
+        container.close()
+        assert _count(test_db_path, "tradier") == 1
@@ -0,0 +1,102 @@
+"""
+Tests for the persistent ticker metadata cache (TickerMetadataService).
+"""
+
+import sqlite3
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from scripts.scan import market_data
+from src.application.services.ticker_metadata import TickerMetadataService
+from src.infrastructure.database.init_schema import init_database
+from src.infrastructure.database.repositories.ticker_metadata_repository import (
+    TickerMetadataRepository,
+)
+
+
+@pytest.fixture
+def repo(test_db_path):
+    init_database(test_db_path)
+    return TickerMetadataRepository(test_db_path)
+
+
+def _age_entry(db_path, ticker, days):
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "UPDATE ticker_metadata SET updated_at = datetime('now', ?) WHERE ticker = ?",
+            (f"-{days} days", ticker),
+        )
+
+
+class TestTickerMetadataService:
+
+    def test_put_persists_across_instances(self, repo):
+        TickerMetadataService(repo).put("AAPL", 3_000_000.0, "Apple")
+
+        fresh = TickerMetadataService(repo)
+        assert fresh.get("AAPL") == (3_000_000.0, "Apple")
+        assert fresh.get_stats()['hits'] == 1
+
+    def test_stale_entries_are_misses(self, repo, test_db_path):
+        TickerMetadataService(repo).put_many({
+            "AAPL": (3_000_000.0, "Apple"),
+            "OLD": (5_000.0, "Old Co"),
+        })
+        _age_entry(test_db_path, "OLD", 8)
+
+        service = TickerMetadataService(repo, ttl_days=7)
+        assert service.get("OLD") is None
+        assert service.stale(["AAPL", "OLD", "NEW"]) == ["OLD", "NEW"]
+
+    def test_empty_lookup_not_persisted(self, repo):
+        TickerMetadataService(repo).put("XYZ", None, None)
+        assert TickerMetadataService(repo).get("XYZ") is None
+
+    def test_put_many_skips_empty_and_counts_written(self, repo):
+        written = TickerMetadataService(repo).put_many({
+            "AAPL": (3_000_000.0, "Apple"),
+            "XYZ": (None, None),
+        })
+        assert written == 1
+
+    def test_weekly_flag_row_is_not_metadata(self, repo):
+        repo.save_weekly_options("MONTHLY", False)
+        assert TickerMetadataService(repo).get("MONTHLY") is None
+
+        # Saving info keeps the weekly flag
+        TickerMetadataService(repo).put("MONTHLY", 2_000.0, "Monthly Co")
+        row = repo.get_many(["MONTHLY"]).value["MONTHLY"]
+        assert row['has_weekly_options'] is False
+        assert row['market_cap'] == pytest.approx(2_000.0 * 1_000_000)
+
+
+class TestGetTickerInfoCache:
+
+    @pytest.fixture(autouse=True)
+    def clear_process_cache(self):
+        market_data._ticker_info_cache.clear()
+        yield
+        market_data._ticker_info_cache.clear()
+
+    def test_cached_ticker_skips_yfinance(self, repo):
+        TickerMetadataService(repo).put("AAPL", 3_000_000.0, "Apple")
+        container = SimpleNamespace(ticker_metadata=TickerMetadataService(repo))
+
+        with patch.object(market_data, "_ensure_yfinance") as ensure:
+            assert market_data.get_ticker_info("AAPL", container) == (3_000_000.0, "Apple")
+        ensure.assert_not_called()
+
+    def test_fetch_writes_through(self, repo):
+        container = SimpleNamespace(ticker_metadata=TickerMetadataService(repo))
+        fake_yf = SimpleNamespace(Ticker=lambda ticker: SimpleNamespace(
+            info={'marketCap': 2_500_000_000, 'shortName': 'Example Corp'}
+        ))
+
+        with patch.object(market_data, "_ensure_yfinance", return_value=True), \
+                patch.object(market_data, "yf", fake_yf), \
+                patch.object(market_data, "API_CALL_DELAY", 0):
+            assert market_data.get_ticker_info("EXM", container) == (2500.0, "Example")
+
+        assert TickerMetadataService(repo).get("EXM") == (2500.0, "Example")
@@ -343,7 +343,7 @@ ${BLUE}${BOLD}IV Crush 2.0 - Earnings IV Crush Trading${NC}
 ${BOLD}USAGE${NC}
     $0 TICKER YYYY-MM-DD             Single ticker analysis
     $0 list TICKERS YYYY-MM-DD       Multiple tickers (comma-separated)
-    $0 scan YYYY-MM-DD               Scan all earnings for date
+    $0 scan YYYY-MM-DD [--resume]    Scan all earnings for date
     $0 whisper [YYYY-MM-DD]          Most anticipated earnings
     $0 sync [--dry-run]              Sync earnings calendar
     $0 sync-cloud                    Sync DB with cloud + backup to GDrive
@@ -353,6 +353,7 @@ ${BOLD}EXAMPLES${NC}
     $0 TSLA 2025-11-25
     $0 list TSLA,NVDA,META 2025-11-27
     $0 scan 2025-11-25
+    $0 scan 2025-11-25 --resume      # Continue an interrupted scan
     $0 whisper
 
 ${BOLD}REQUIREMENTS${NC}
@@ -499,6 +500,10 @@ analyze_list() {
 
 scan_earnings() {
     local scan_date=$1
+    local resume_flag=""
+    if [ "${2:-}" = "--resume" ]; then
+        resume_flag="--resume"
+    fi
 
     # Validate date
     validate_date "$scan_date" || return 1
@@ -510,7 +515,7 @@ scan_earnings() {
 
     # Run scan mode with real-time output (unbuffered Python + direct piping)
     # Optimized: Single sed with multiple expressions (3-4x faster than chained sed)
-    if ! python -u scripts/scan.py --scan-date "$scan_date" 2>&1 | \
+    if ! python -u scripts/scan.py --scan-date "$scan_date" $resume_flag 2>&1 | \
         sed -u -e 's/^[0-9]\{4\}-[0-9][0-9]-[0-9][0-9] [0-9][0-9]:[0-9][0-9]:[0-9][0-9] - \[.*\] - [^ ]* - INFO - //' \
                 -e 's/^[0-9]\{4\}-[0-9][0-9]-[0-9][0-9] [0-9][0-9]:[0-9][0-9]:[0-9][0-9] - \[.*\] - [^ ]* - ERROR - /⚠️  /' \
                 -e 's/^[0-9]\{4\}-[0-9][0-9]-[0-9][0-9] [0-9][0-9]:[0-9][0-9]:[0-9][0-9] - \[.*\] - [^ ]* - WARNING - /⚠️  /' | \
@@ -603,7 +608,7 @@ case "${1:-}" in
             exit 1
         fi
         health_check
-        scan_earnings "$2"
+        scan_earnings "$2" "${3:-}"
         show_summary
         ;;
 
@@ -11,12 +11,20 @@ TTL: 3 hours (10800 seconds)
 import os
 import re
 import sqlite3
+import sys
 import threading
 from datetime import datetime, date as date_class, timedelta, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
+# Ensure common/ is importable
+_root = str(Path(__file__).resolve().parent.parent.parent.parent)
+if _root not in sys.path:
+    sys.path.insert(0, _root)
+
+from common.db import connect  # noqa: E402
+
 _db_lock = threading.Lock()
 
 
@@ -104,8 +112,7 @@ class SentimentCache:
     def _init_db(self):
         """Initialize database schema."""
         with _db_lock:
-            with sqlite3.connect(self.db_path, check_same_thread=False) as conn:
-                conn.execute("PRAGMA journal_mode=WAL")
+            with connect(self.db_path, check_same_thread=False) as conn:
                 conn.execute("""
                     CREATE TABLE IF NOT EXISTS sentiment_cache (
                         ticker TEXT NOT NULL,
@@ -150,7 +157,7 @@ class SentimentCache:
                 pass
 
         with _db_lock:
-            with sqlite3.connect(self.db_path, check_same_thread=False) as conn:
+            with connect(self.db_path, check_same_thread=False) as conn:
                 conn.row_factory = sqlite3.Row
 
                 # Get all entries for ticker+date, ordered by preference
@@ -201,7 +208,7 @@ class SentimentCache:
         cached_at = datetime.now(timezone.utc).isoformat()
 
         with _db_lock:
-            with sqlite3.connect(self.db_path, check_same_thread=False) as conn:
+            with connect(self.db_path, check_same_thread=False) as conn:
                 conn.execute("""
                     INSERT OR REPLACE INTO sentiment_cache
                     (ticker, date, source, sentiment, cached_at)
@@ -209,12 +216,100 @@ class SentimentCache:
                 """, (ticker, date, source, sentiment, cached_at))
                 conn.commit()
 
+    def get_many(self, keys: List[Tuple[str, str]]) -> Dict[Tuple[str, str], CachedSentiment]:
+        """
+        Get cached sentiment for many (ticker, date) pairs in one query.
+
+        Same preference as get() (council > perplexity > websearch, newest
+        first); pairs without a valid entry are left out.
+
+        Args:
+            keys: (ticker, date) pairs; tickers are uppercased and validated
+        """
+        wanted = set()
+        for ticker, date in keys:
+            ticker = ticker.upper()
+            if not ticker or not re.match(r'^[A-Z]{1,5}(\.[A-Z]{1,2})?$', ticker):
+                raise ValueError(f"Invalid ticker format: {ticker}")
+            wanted.add((ticker, date))
+        if not wanted:
+            return {}
+
+        tickers = sorted({ticker for ticker, _ in wanted})
+        placeholders = ",".join("?" for _ in tickers)
+        found: Dict[Tuple[str, str], CachedSentiment] = {}
+
+        with _db_lock:
+            with connect(self.db_path, check_same_thread=False) as conn:
+                conn.row_factory = sqlite3.Row
+                cursor = conn.execute(f"""
+                    SELECT ticker, date, source, sentiment, cached_at
+                    FROM sentiment_cache
+                    WHERE ticker IN ({placeholders})
+                    ORDER BY
+                        CASE source WHEN 'council' THEN 0 WHEN 'perplexity' THEN 1 ELSE 2 END,
+                        cached_at DESC
+                """, tickers)
+
+                for row in cursor:
+                    key = (row['ticker'], row['date'])
+                    if key not in wanted or key in found:
+                        continue
+                    entry = CachedSentiment(
+                        ticker=row['ticker'],
+                        date=row['date'],
+                        source=row['source'],
+                        sentiment=row['sentiment'],
+                        cached_at=datetime.fromisoformat(row['cached_at'])
+                    )
+                    if not entry.is_expired:
+                        found[key] = entry
+
+        return found
+
+    def set_many(self, entries: Dict[Tuple[str, str], str], source: str) -> int:
+        """
+        Store sentiment for many (ticker, date) pairs in one transaction.
+
+        Args:
+            entries: Dict mapping (ticker, date) -> sentiment text
+            source: "council", "perplexity", or "websearch"
+
+        Returns:
+            Number of entries stored
+
+        Raises:
+            ValueError: If source or a ticker is invalid
+        """
+        if source not in self.VALID_SOURCES:
+            raise ValueError(f"Invalid source '{source}'. Must be one of: {self.VALID_SOURCES}")
+
+        cached_at = datetime.now(timezone.utc).isoformat()
+        rows = []
+        for (ticker, date), sentiment in entries.items():
+            ticker = ticker.upper()
+            if not ticker or not re.match(r'^[A-Z]{1,5}(\.[A-Z]{1,2})?$', ticker):
+                raise ValueError(f"Invalid ticker format: {ticker}")
+            rows.append((ticker, date, source, sentiment, cached_at))
+        if not rows:
+            return 0
+
+        with _db_lock:
+            with connect(self.db_path, check_same_thread=False) as conn:
+                conn.executemany("""
+                    INSERT OR REPLACE INTO sentiment_cache
+                    (ticker, date, source, sentiment, cached_at)
+                    VALUES (?, ?, ?, ?, ?)
+                """, rows)
+                conn.commit()
+        return len(rows)
+
     def clear_expired(self) -> int:
         """Remove expired cache entries. Returns count of deleted entries."""
         cutoff = (datetime.now(timezone.utc) - timedelta(hours=self.DEFAULT_TTL_HOURS)).isoformat()
 
         with _db_lock:
-            with sqlite3.connect(self.db_path, check_same_thread=False) as conn:
+            with connect(self.db_path, check_same_thread=False) as conn:
                 cursor = conn.execute("""
                     DELETE FROM sentiment_cache
                     WHERE cached_at < ?
@@ -225,7 +320,7 @@ class SentimentCache:
     def clear_all(self) -> int:
         """Clear all cache entries. Returns count of deleted entries."""
         with _db_lock:
-            with sqlite3.connect(self.db_path, check_same_thread=False) as conn:
+            with connect(self.db_path, check_same_thread=False) as conn:
                 cursor = conn.execute("DELETE FROM sentiment_cache")
                 conn.commit()
                 return cursor.rowcount
@@ -233,7 +328,7 @@ class SentimentCache:
     def stats(self) -> dict:
         """Get cache statistics."""
         with _db_lock:
-            with sqlite3.connect(self.db_path, check_same_thread=False) as conn:
+            with connect(self.db_path, check_same_thread=False) as conn:
                 conn.row_factory = sqlite3.Row
 
                 total = conn.execute("SELECT COUNT(*) as cnt FROM sentiment_cache").fetchone()['cnt']
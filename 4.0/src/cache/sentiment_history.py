@@ -26,6 +26,7 @@ Schema:
 import os
 import re
 import sqlite3
+import sys
 import threading
 import logging
 from datetime import datetime, timezone
@@ -34,6 +35,13 @@ from typing import Optional, List, Dict, Any
 from dataclasses import dataclass
 from enum import Enum
 
+# Ensure common/ is importable
+_root = str(Path(__file__).resolve().parent.parent.parent.parent)
+if _root not in sys.path:
+    sys.path.insert(0, _root)
+
+from common.db import connect  # noqa: E402
+
 logger = logging.getLogger(__name__)
 
 _db_lock = threading.Lock()
@@ -163,8 +171,7 @@ class SentimentHistory:
     def _init_db(self):
         """Initialize database schema."""
         with _db_lock:
-            with sqlite3.connect(self.db_path, check_same_thread=False) as conn:
-                conn.execute("PRAGMA journal_mode=WAL")
+            with connect(self.db_path, check_same_thread=False) as conn:
                 conn.execute("""
                     CREATE TABLE IF NOT EXISTS sentiment_history (
                         ticker TEXT NOT NULL,
@@ -256,7 +263,7 @@ class SentimentHistory:
         size_mod = _get_size_modifier(sentiment_score) if sentiment_score is not None else 1.0
 
         with _db_lock:
-            with sqlite3.connect(self.db_path, check_same_thread=False) as conn:
+            with connect(self.db_path, check_same_thread=False) as conn:
                 conn.execute("""
                     INSERT OR REPLACE INTO sentiment_history
                     (ticker, earnings_date, collected_at, source, sentiment_text,
@@ -316,7 +323,7 @@ class SentimentHistory:
         now = datetime.now(timezone.utc).isoformat()
 
         with _db_lock:
-            with sqlite3.connect(self.db_path, check_same_thread=False) as conn:
+            with connect(self.db_path, check_same_thread=False) as conn:
                 # Get existing record to check prediction and implied move
                 row = conn.execute("""
                     SELECT sentiment_direction, implied_move_pct FROM sentiment_history
@@ -366,7 +373,7 @@ class SentimentHistory:
         ticker = ticker.upper()
 
         with _db_lock:
-            with sqlite3.connect(self.db_path, check_same_thread=False) as conn:
+            with connect(self.db_path, check_same_thread=False) as conn:
                 conn.row_factory = sqlite3.Row
                 row = conn.execute("""
                     SELECT * FROM sentiment_history
@@ -381,7 +388,7 @@ class SentimentHistory:
     def get_pending_outcomes(self, before_date: Optional[str] = None) -> List[SentimentRecord]:
         """Get records that need outcome data filled in."""
         with _db_lock:
-            with sqlite3.connect(self.db_path, check_same_thread=False) as conn:
+            with connect(self.db_path, check_same_thread=False) as conn:
                 conn.row_factory = sqlite3.Row
 
                 if before_date:
@@ -408,7 +415,7 @@ class SentimentHistory:
     ) -> List[SentimentRecord]:
         """Get records within a date range."""
         with _db_lock:
-            with sqlite3.connect(self.db_path, check_same_thread=False) as conn:
+            with connect(self.db_path, check_same_thread=False) as conn:
                 conn.row_factory = sqlite3.Row
 
                 if with_outcomes_only:
@@ -435,7 +442,7 @@ class SentimentHistory:
             Dictionary with accuracy metrics
         """
         with _db_lock:
-            with sqlite3.connect(self.db_path, check_same_thread=False) as conn:
+            with connect(self.db_path, check_same_thread=False) as conn:
                 conn.row_factory = sqlite3.Row
 
                 # Overall stats
@@ -546,7 +553,7 @@ class SentimentHistory:
     def stats(self) -> Dict[str, Any]:
         """Get basic statistics about the history table."""
         with _db_lock:
-            with sqlite3.connect(self.db_path, check_same_thread=False) as conn:
+            with connect(self.db_path, check_same_thread=False) as conn:
                 conn.row_factory = sqlite3.Row
 
                 row = conn.execute("""
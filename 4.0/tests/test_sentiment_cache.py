@@ -355,6 +355,34 @@ class TestSentimentCache:
         assert stats['expired'] == 1
         assert stats['valid'] == 1
 
+    def test_get_many_returns_valid_entries(self, temp_cache):
+        """get_many returns unexpired entries keyed by (ticker, date), preferring perplexity."""
+        temp_cache.set("NVDA", "2025-12-09", "websearch", "WebSearch NVDA")
+        temp_cache.set("NVDA", "2025-12-09", "perplexity", "Perplexity NVDA")
+        temp_cache.set("AAPL", "2025-12-09", "perplexity", "Perplexity AAPL")
+        temp_cache.set("AMD", "2025-12-10", "perplexity", "Other date")
+
+        result = temp_cache.get_many([
+            ("nvda", "2025-12-09"), ("AAPL", "2025-12-09"),
+            ("AMD", "2025-12-09"), ("TSLA", "2025-12-09"),
+        ])
+
+        assert set(result) == {("NVDA", "2025-12-09"), ("AAPL", "2025-12-09")}
+        assert result[("NVDA", "2025-12-09")].sentiment == "Perplexity NVDA"
+        assert temp_cache.get_many([]) == {}
+
+    def test_set_many_stores_in_one_call(self, temp_cache):
+        """set_many writes every entry and rejects bad sources."""
+        count = temp_cache.set_many(
+            {("nvda", "2025-12-09"): "A", ("AAPL", "2025-12-09"): "B"}, "perplexity"
+        )
+        assert count == 2
+        assert temp_cache.get("NVDA", "2025-12-09").sentiment == "A"
+        assert temp_cache.get("AAPL", "2025-12-09").sentiment == "B"
+
+        with pytest.raises(ValueError, match="Invalid source"):
+            temp_cache.set_many({("NVDA", "2025-12-09"): "A"}, "invalid")
+
     def test_valid_sources_constant(self, temp_cache):
         """VALID_SOURCES should contain council, perplexity, and websearch."""
         assert "council" in temp_cache.VALID_SOURCES
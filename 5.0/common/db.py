@@ -0,0 +1,160 @@
+"""Shared SQLite connection factory for Trading Desk subsystems.
+
+Every subsystem opens the same ivcrush.db, so every connection should use the
+same PRAGMA settings. Pools and direct connections in 2.0, 4.0, 5.0 and 6.0
+go through connect() to get one tuned performance profile:
+
+- WAL journal + synchronous=NORMAL (durable across app crashes, fewer fsyncs)
+- Sized page cache and memory-mapped I/O for the read-heavy historical data
+- In-memory temp store for sorts/GROUP BY
+- Larger prepared-statement cache (sqlite3 default is 128)
+
+PoolMetrics tracks checkout counts and wait time so pool sizing can be
+tuned from real numbers instead of guesses.
+"""
+
+import sqlite3
+import threading
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+
+@dataclass(frozen=True)
+class SQLiteProfile:
+    """PRAGMA settings applied to every new connection."""
+
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"      # Safe with WAL
+    cache_size_kib: int = 64 * 1024  # 64 MiB page cache per connection
+    mmap_size: int = 256 * 1024 * 1024
+    temp_store: str = "MEMORY"
+    busy_timeout_ms: int = 5000
+    foreign_keys: bool = True
+    cached_statements: int = 256
+
+    def pragmas(self) -> list[str]:
+        """PRAGMA statements in application order."""
+        return [
+            f"PRAGMA journal_mode={self.journal_mode}",
+            f"PRAGMA synchronous={self.synchronous}",
+            # Negative cache_size is in KiB rather than pages
+            f"PRAGMA cache_size=-{self.cache_size_kib}",
+            f"PRAGMA mmap_size={self.mmap_size}",
+            f"PRAGMA temp_store={self.temp_store}",
+            f"PRAGMA busy_timeout={self.busy_timeout_ms}",
+            f"PRAGMA foreign_keys={'ON' if self.foreign_keys else 'OFF'}",
+        ]
+
+
+DEFAULT_PROFILE = SQLiteProfile()
+
+# Plain sqlite3.connect() defaults, kept for before/after benchmarks
+BASELINE_PROFILE = SQLiteProfile(
+    journal_mode="DELETE",
+    synchronous="FULL",
+    cache_size_kib=2000,
+    mmap_size=0,
+    temp_store="DEFAULT",
+    busy_timeout_ms=0,
+    foreign_keys=False,
+    cached_statements=128,
+)
+
+
+def apply_profile(conn: sqlite3.Connection, profile: SQLiteProfile = DEFAULT_PROFILE) -> None:
+    """Apply profile PRAGMAs to an open connection."""
+    for pragma in profile.pragmas():
+        conn.execute(pragma)
+
+
+def connect(
+    db_path: Union[str, Path],
+    profile: SQLiteProfile = DEFAULT_PROFILE,
+    *,
+    timeout: Optional[float] = None,
+    check_same_thread: bool = True,
+    row_factory: Optional[Any] = None,
+    **kwargs: Any,
+) -> sqlite3.Connection:
+    """
+    Open a SQLite connection with the shared performance profile.
+
+    Drop-in replacement for sqlite3.connect(): extra keyword arguments
+    (uri, isolation_level, ...) are passed through unchanged.
+
+    Args:
+        db_path: Database file path (or ":memory:")
+        profile: PRAGMA profile to apply (default: DEFAULT_PROFILE)
+        timeout: Seconds to wait on a locked database. When given it
+            overrides the profile's busy_timeout_ms, so connect(path,
+            timeout=30) waits 30s as with sqlite3.connect()
+        check_same_thread: False for connections shared across threads (pools)
+        row_factory: Optional row factory (e.g. sqlite3.Row)
+
+    Returns:
+        Configured sqlite3.Connection
+    """
+    if timeout is None:
+        timeout = profile.busy_timeout_ms / 1000
+    else:
+        # PRAGMA busy_timeout runs after connect and would replace the timeout
+        profile = replace(profile, busy_timeout_ms=int(timeout * 1000))
+    conn = sqlite3.connect(
+        str(db_path),
+        timeout=timeout,
+        check_same_thread=check_same_thread,
+        cached_statements=profile.cached_statements,
+        **kwargs,
+    )
+    try:
+        apply_profile(conn, profile)
+    except sqlite3.Error:
+        conn.close()
+        raise
+    if row_factory is not None:
+        conn.row_factory = row_factory
+    return conn
+
+
+class PoolMetrics:
+    """Thread-safe checkout and wait-time counters for a connection pool."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._checkouts = 0
+        self._timeouts = 0
+        self._created = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    def record_checkout(self, wait_seconds: float) -> None:
+        """Record a successful checkout and how long it waited."""
+        with self._lock:
+            self._checkouts += 1
+            self._wait_total += wait_seconds
+            if wait_seconds > self._wait_max:
+                self._wait_max = wait_seconds
+
+    def record_timeout(self) -> None:
+        """Record a checkout that gave up waiting for a connection."""
+        with self._lock:
+            self._timeouts += 1
+
+    def record_created(self) -> None:
+        """Record a newly opened connection."""
+        with self._lock:
+            self._created += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current counters as a dict (wait times in milliseconds)."""
+        with self._lock:
+            avg = self._wait_total / self._checkouts if self._checkouts else 0.0
+            return {
+                "checkouts": self._checkouts,
+                "checkout_timeouts": self._timeouts,
+                "connections_created": self._created,
+                "wait_ms_total": round(self._wait_total * 1000, 3),
+                "wait_ms_avg": round(avg * 1000, 3),
+                "wait_ms_max": round(self._wait_max * 1000, 3),
+            }
@@ -0,0 +1,193 @@
+"""Hedged requests for idempotent async API calls, shared by 2.0 and 5.0.
+
+Most Tradier chain requests answer in a few hundred milliseconds, but a few
+hang for seconds and hold up every asyncio.gather waiting on them. A hedge
+sends a second copy of a request that has not answered by the provider's
+observed p95 latency; whichever copy answers first wins and the other is
+cancelled.
+
+- Hedges are capped by a budget (HEDGE_BUDGET of requests), so a provider
+  that is slow across the board never sees its traffic doubled.
+- Until HEDGE_MIN_SAMPLES latencies have been observed there is no p95 to
+  hedge at, and requests run unhedged.
+- Rate-limiter waits are not latency: pass the limiter's acquire to run()
+  and each copy's clock (and the hedge timer) starts once it holds its
+  token or slot.
+- A copy cancelled because the other won is recorded at its elapsed time.
+  Its real latency is at least that long, and dropping it would leave only
+  the fast winners in the window and pull the p95 down.
+
+Only use for idempotent requests: both copies may reach the provider.
+Metrics are reported through the on_event callback ("sent", "won"), so each
+subsystem can publish them to its own collector.
+
+Example Usage:
+    policy = HedgePolicy("tradier")
+    response = await policy.run(lambda: client.get(url))
+
+    # With a rate limiter: attempt receives acquire()'s result
+    response = await policy.run(lambda token: client.get(url), acquire=bucket.acquire)
+"""
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Most hedges allowed, as a fraction of requests
+HEDGE_BUDGET = 0.05
+
+# Latencies kept for the p95 estimate
+HEDGE_WINDOW = 200
+
+# Observations needed before hedging starts
+HEDGE_MIN_SAMPLES = 20
+
+# Never hedge sooner than this, however fast the p95
+HEDGE_MIN_DELAY_S = 0.05
+
+
+class HedgePolicy:
+    """Tracks a provider's latency and races a second attempt past p95."""
+
+    def __init__(
+        self,
+        name: str,
+        budget: float = HEDGE_BUDGET,
+        window: int = HEDGE_WINDOW,
+        min_samples: int = HEDGE_MIN_SAMPLES,
+        min_delay: float = HEDGE_MIN_DELAY_S,
+        on_event: Optional[Callable[[str], None]] = None,
+    ):
+        """
+        Initialize hedge policy.
+
+        Args:
+            name: Provider name (logging and metrics)
+            budget: Maximum hedges as a fraction of requests
+            window: Number of recent latencies used for p95
+            min_samples: Latencies needed before hedging starts
+            min_delay: Never hedge sooner than this many seconds
+            on_event: Called with "sent" per hedge and "won" per hedge win
+        """
+        self.name = name
+        self.budget = budget
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.on_event = on_event
+        self._latencies: Deque[float] = deque(maxlen=window)
+        # Stats
+        self.requests = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+
+    def hedge_delay(self) -> Optional[float]:
+        """Seconds to wait before hedging, or None while warming up."""
+        if len(self._latencies) < self.min_samples:
+            return None
+        ordered = sorted(self._latencies)
+        p95 = ordered[min(len(ordered) - 1, math.ceil(0.95 * len(ordered)) - 1)]
+        return max(self.min_delay, p95)
+
+    def _within_budget(self) -> bool:
+        return self.hedged + 1 <= self.budget * self.requests
+
+    def _emit(self, event: str) -> None:
+        if self.on_event is not None:
+            self.on_event(event)
+
+    async def _timed(
+        self,
+        attempt: Callable[..., Awaitable[T]],
+        acquire: Optional[Callable[[], Awaitable[Any]]],
+        holding: Optional[asyncio.Event] = None,
+    ) -> T:
+        if acquire is not None:
+            token = await acquire()
+            call = lambda: attempt(token)  # noqa: E731
+        else:
+            call = attempt
+        if holding is not None:
+            holding.set()
+        start = time.monotonic()
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            # Lost the race: a censored sample, the latency was at least this
+            self._latencies.append(time.monotonic() - start)
+            raise
+        self._latencies.append(time.monotonic() - start)
+        return result
+
+    async def run(
+        self,
+        attempt: Callable[..., Awaitable[T]],
+        acquire: Optional[Callable[[], Awaitable[Any]]] = None,
+    ) -> T:
+        """
+        Run `attempt`, starting a second copy if the first is slow.
+
+        Args:
+            attempt: Coroutine function making one request. Takes no
+                arguments, or acquire()'s result when acquire is given.
+            acquire: Optional rate-limiter wait run by each copy before its
+                request; time spent here is not counted as latency
+
+        Returns:
+            Result of the first copy to succeed. If both fail, the first
+            copy's exception is raised.
+        """
+        self.requests += 1
+        delay = self.hedge_delay()
+        holding = asyncio.Event()
+        primary = asyncio.ensure_future(self._timed(attempt, acquire, holding))
+        if delay is None:
+            return await primary
+
+        tasks = [primary]
+        try:
+            if acquire is not None:
+                # The hedge timer starts once the primary holds its token
+                waiter = asyncio.ensure_future(holding.wait())
+                try:
+                    await asyncio.wait([primary, waiter], return_when=asyncio.FIRST_COMPLETED)
+                finally:
+                    waiter.cancel()
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done or not self._within_budget():
+                return await primary
+
+            self.hedged += 1
+            self._emit("sent")
+            logger.debug(f"{self.name}: no response after {delay * 1000:.0f}ms, hedging")
+            tasks.append(asyncio.ensure_future(self._timed(attempt, acquire)))
+
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in tasks:
+                    if task in done and task.exception() is None:
+                        if task is not primary:
+                            self.hedge_wins += 1
+                            self._emit("won")
+                        return task.result()
+            return primary.result()  # Both failed: raise the original error
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        delay = self.hedge_delay()
+        return {
+            "requests": self.requests,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "hedge_after_ms": round(delay * 1000) if delay is not None else None,
+        }
@@ -4,6 +4,9 @@
 # Usage:
 #   ./deploy.sh          # Full deploy with DB sync
 #   ./deploy.sh --quick  # Deploy without DB sync (faster)
+#
+# CPU_ALWAYS_ON=1 deploys with --no-cpu-throttling, so the Telegram outbox
+# posts queued job messages between requests (billed for idle CPU).
 
 set -e
 
@@ -16,6 +19,11 @@ GCS_BUCKET="gs://trading-desk-data"
 
 cd "$SCRIPT_DIR"
 
+CPU_THROTTLING="--cpu-throttling"
+if [[ "${CPU_ALWAYS_ON:-}" == "1" ]]; then
+    CPU_THROTTLING="--no-cpu-throttling"
+fi
+
 # Parse args
 QUICK_MODE=false
 if [[ "$1" == "--quick" ]]; then
@@ -27,6 +35,9 @@ elif [[ "$1" == "--help" || "$1" == "-h" ]]; then
     echo "  --quick    Skip database sync (faster deploys)"
     echo "  --help     Show this help message"
     echo ""
+    echo "Environment:"
+    echo "  CPU_ALWAYS_ON=1  Deploy with --no-cpu-throttling"
+    echo ""
     echo "Examples:"
     echo "  ./deploy.sh          # Full deploy with DB sync"
     echo "  ./deploy.sh --quick  # Code-only deploy"
@@ -90,6 +101,7 @@ gcloud run deploy "$SERVICE" \
     --allow-unauthenticated \
     --timeout=300 \
     --memory=512Mi \
+    "$CPU_THROTTLING" \
     --min-instances=0 \
     --max-instances=1
 
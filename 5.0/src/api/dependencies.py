@@ -41,7 +41,7 @@ def _get_state() -> AppState:
         state = AppState(
             job_manager=JobManager(db_path=settings.DB_PATH),
             job_runner=JobRunner(twelvedata_client=twelvedata_client),
-            tradier=TradierClient(settings.tradier_api_key),
+            tradier=TradierClient(settings.tradier_api_key, hedge=settings.hedge_tradier_requests),
             alphavantage=AlphaVantageClient(settings.alpha_vantage_key),
             perplexity=PerplexityClient(
                 api_key=settings.perplexity_api_key,
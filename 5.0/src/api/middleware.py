@@ -1,7 +1,8 @@
 """
 HTTP middleware for Trading Desk 5.0.
 
-Provides rate limiting, security headers, and request ID tracking.
+Provides rate limiting, security headers, request ID tracking, and the
+cold-start gate that holds requests until the database is hydrated.
 """
 
 import ipaddress
@@ -11,6 +12,7 @@ from fastapi import Request
 from fastapi.responses import JSONResponse
 
 from src.core.logging import log, set_request_id
+from src.core.hydration import wait_for_database
 from src.api.state import rate_limiter
 
 
@@ -40,6 +42,21 @@ async def rate_limit_middleware(request: Request, call_next):
     return await call_next(request)
 
 
+# Paths served before the database is hydrated (startup/liveness probes)
+HYDRATION_EXEMPT_PATHS = {"/"}
+
+
+async def wait_for_database_hydration(request: Request, call_next):
+    """Hold requests until the background GCS pull has finished (lazy startup)."""
+    if request.url.path not in HYDRATION_EXEMPT_PATHS and not await wait_for_database():
+        return JSONResponse(
+            status_code=503,
+            content={"detail": "Database is still loading. Retry shortly."},
+            headers={"Retry-After": "5"},
+        )
+    return await call_next(request)
+
+
 async def limit_request_size(request: Request, call_next):
     """Reject requests with body larger than 1MB to prevent DoS."""
     max_size = 1_000_000  # 1MB
@@ -5,11 +5,13 @@ Provides VRP analysis, earnings scanning, and whisper (most anticipated) functio
 """
 
 import asyncio
+import json
 import re
 import time
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, AsyncIterator, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
 
 from src.core.config import now_et, today_et, settings
 from src.core.logging import log
@@ -23,6 +25,7 @@ from src.domain import (
     calculate_position_size,
     normalize_ticker,
     InvalidTickerError,
+    AsyncRepository,
     is_valid_ticker,
     has_weekly_options,
 )
@@ -35,6 +38,7 @@ from src.domain.skew import analyze_skew
 from src.domain.direction import get_direction
 from src.formatters.cli import format_digest_cli, format_analyze_cli, format_council_cli
 from src.api.state import _mask_sensitive
+from src.api.snapshots import scan_snapshots, snapshot_response
 from src.api.dependencies import (
     verify_api_key,
     get_tradier,
@@ -89,7 +93,10 @@ async def _analyze_single_ticker(
     async with semaphore:
         try:
             # Get historical data (use pre-fetched if available)
-            moves = prefetched_moves if prefetched_moves is not None else repo.get_moves(ticker)
+            if prefetched_moves is not None:
+                moves = prefetched_moves
+            else:
+                moves = await AsyncRepository(repo).get_moves(ticker)
             historical_count = len(moves)
 
             if historical_count < 4:
@@ -104,7 +111,7 @@ async def _analyze_single_ticker(
 
             # Check VRP cache first (reduces Tradier API calls by ~89%)
             # Skip cache if fresh=True (Telegram requests real-time data)
-            cached_vrp = None if fresh else vrp_cache.get_vrp(ticker, earnings_date)
+            cached_vrp = None if fresh else await AsyncRepository(vrp_cache).get_vrp(ticker, earnings_date)
             has_weekly = True  # Default: permissive on error
             weekly_reason = ""
             if cached_vrp:
@@ -154,7 +161,7 @@ async def _analyze_single_ticker(
                 vrp_tier = vrp_data["tier"]
 
                 # Cache the VRP data for future requests (includes weekly options status)
-                vrp_cache.save_vrp(ticker, earnings_date, {
+                await AsyncRepository(vrp_cache).save_vrp(ticker, earnings_date, {
                     "implied_move_pct": implied_move_pct,
                     "vrp_ratio": vrp_ratio,
                     "vrp_tier": vrp_tier,
@@ -194,7 +201,10 @@ async def _analyze_single_ticker(
             # Note: skew analysis not available in whisper (would require extra API calls)
             # so we pass skew_bias=None to let sentiment drive direction
             # Skip cache if fresh=True (Telegram requests real-time data)
-            sentiment = None if fresh else sentiment_cache.get_sentiment(ticker, earnings_date)
+            sentiment = (
+                None if fresh
+                else await AsyncRepository(sentiment_cache).get_sentiment(ticker, earnings_date)
+            )
             sentiment_score = sentiment.get("score") if sentiment else None
             sentiment_direction = sentiment.get("direction") if sentiment else None
             direction = get_direction(
@@ -255,15 +265,14 @@ async def _analyze_single_ticker(
             return None
 
 
-async def _scan_tickers_for_whisper(
+async def _iter_whisper_outcomes(
     upcoming: List[Dict],
     repo,
     tradier,
     fresh: bool = False,
-    partial_results: Optional[List[Dict[str, Any]]] = None,
-) -> List[Dict[str, Any]]:
+) -> AsyncIterator[Any]:
     """
-    Scan tickers for VRP opportunities using parallel execution.
+    Analyze upcoming earnings concurrently, yielding each outcome as it completes.
 
     Uses REAL implied move from Tradier options chains (ATM straddle pricing)
     to calculate accurate VRP ratios. Falls back to estimate only if options
@@ -274,25 +283,16 @@ async def _scan_tickers_for_whisper(
     - VRP caching - smart TTL reduces Tradier API calls by ~89%
     - Batch DB queries - single query for all historical moves (30 queries -> 1)
 
-    Target: 60s -> 15s for 30 tickers.
-
-    Extracted for asyncio.wait_for timeout support.
-    Results are accumulated into partial_results list as tasks complete,
-    so on timeout the caller can still access completed results.
+    Yields a result dict (qualified), None (not qualified) or the Exception a
+    ticker raised. Tasks still running when the consumer stops are cancelled.
 
     Args:
         fresh: If True, bypass VRP and sentiment caches (for Telegram real-time requests)
-        partial_results: Shared list that accumulates results as tasks complete.
-                        On timeout, this list contains all results completed before timeout.
     """
     sentiment_cache = get_sentiment_cache()
     vrp_cache = get_vrp_cache()
     semaphore = asyncio.Semaphore(MAX_CONCURRENT_ANALYSIS)
 
-    # Use provided list or create new one
-    if partial_results is None:
-        partial_results = []
-
     # Filter out invalid tickers (e.g., COF-PI preferred stocks, warrants)
     # These don't have options and can't be analyzed for IV crush
     valid_upcoming = [e for e in upcoming if is_valid_ticker(e["symbol"])]
@@ -306,7 +306,7 @@ async def _scan_tickers_for_whisper(
 
     # Batch fetch all historical moves in ONE query (30 queries -> 1)
     all_tickers = [e["symbol"] for e in tickers_to_scan]
-    batch_moves = repo.get_moves_batch(all_tickers, limit=12)
+    batch_moves = await AsyncRepository(repo).get_moves_batch(all_tickers, limit=12)
     log("debug", "Batch fetched historical moves", ticker_count=len(all_tickers))
 
     # Create parallel tasks for all tickers
@@ -336,18 +336,56 @@ async def _scan_tickers_for_whisper(
         )
         tasks.append(task)
 
-    # Execute all tasks in parallel with exception handling
-    results_raw = await asyncio.gather(*tasks, return_exceptions=True)
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            try:
+                yield await next_done
+            except Exception as ex:
+                yield ex
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def _scan_tickers_for_whisper(
+    upcoming: List[Dict],
+    repo,
+    tradier,
+    fresh: bool = False,
+    partial_results: Optional[List[Dict[str, Any]]] = None,
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Scan tickers for VRP opportunities using parallel execution.
+
+    Target: 60s -> 15s for 30 tickers.
+
+    Extracted for asyncio.wait_for timeout support.
+    Results are accumulated into partial_results list as tasks complete,
+    so on timeout the caller can still access completed results.
+
+    Args:
+        fresh: If True, bypass VRP and sentiment caches (for Telegram real-time requests)
+        partial_results: Shared list that accumulates results as tasks complete.
+                        On timeout, this list contains all results completed before timeout.
+    """
+    # Use provided list or create new one
+    if partial_results is None:
+        partial_results = []
+
+    error_types: Dict[str, int] = {}
+    total_tasks = 0
+    async for outcome in _iter_whisper_outcomes(upcoming, repo, tradier, fresh=fresh):
+        total_tasks += 1
+        if isinstance(outcome, Exception):
+            log("warning", "Task failed with exception", error=str(outcome))
+            err_type = type(outcome).__name__
+            error_types[err_type] = error_types.get(err_type, 0) + 1
+        elif outcome is not None:
+            partial_results.append(outcome)
 
     # Detect high error rates (possible API outage)
-    error_count = sum(1 for r in results_raw if isinstance(r, Exception))
-    total_tasks = len(results_raw)
+    error_count = sum(error_types.values())
     if total_tasks > 0 and error_count > total_tasks * 0.5:
-        error_types = {}
-        for r in results_raw:
-            if isinstance(r, Exception):
-                err_type = type(r).__name__
-                error_types[err_type] = error_types.get(err_type, 0) + 1
         log("error", "High error rate in whisper scan - possible API outage",
             total=total_tasks, errors=error_count,
             error_rate_pct=round(error_count / total_tasks * 100, 1),
@@ -356,28 +394,218 @@ async def _scan_tickers_for_whisper(
             "errors": str(error_count), "total": str(total_tasks)
         })
 
-    # Filter out None results and exceptions, accumulate into shared list
-    for result in results_raw:
-        if isinstance(result, Exception):
-            log("warning", "Task failed with exception", error=str(result))
-            continue
-        if result is not None:
-            partial_results.append(result)
-
     return partial_results, error_count
 
 
+async def _scan_earnings_entry(
+    e: Dict[str, Any],
+    moves: List[Dict[str, Any]],
+    tradier,
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Scan one earnings entry for /api/scan.
+
+    Returns:
+        ("qualified", ticker dict) or ("filtered", {"ticker", "reason", ...})
+    """
+    ticker = e["symbol"]
+    earnings_date = e["report_date"]
+
+    # Check historical data requirement
+    historical_count = len(moves)
+
+    if historical_count < 4:
+        return "filtered", {
+            "ticker": ticker,
+            "reason": f"Insufficient history ({historical_count} quarters)",
+        }
+
+    # Extract historical move percentages
+    historical_pcts = [abs(m["intraday_move_pct"]) for m in moves if m.get("intraday_move_pct")]
+    if not historical_pcts:
+        return "filtered", {
+            "ticker": ticker,
+            "reason": "No valid historical moves",
+        }
+
+    historical_avg = sum(historical_pcts) / len(historical_pcts)
+
+    # Fetch real implied move
+    im_result = await fetch_real_implied_move(tradier, ticker, earnings_date)
+
+    # Skip if we couldn't get a price
+    if im_result.get("error") == "No price available":
+        return "filtered", {
+            "ticker": ticker,
+            "reason": "No price available",
+        }
+
+    implied_move_pct, used_real_data = get_implied_move_with_fallback(
+        im_result, historical_avg
+    )
+    price = im_result.get("price")
+
+    # Calculate VRP
+    vrp_data = calculate_vrp(
+        implied_move_pct=implied_move_pct,
+        historical_moves=historical_pcts,
+    )
+
+    if vrp_data.get("error"):
+        return "filtered", {
+            "ticker": ticker,
+            "reason": f"VRP calculation failed: {vrp_data.get('error')}",
+        }
+
+    vrp_ratio = vrp_data.get("vrp_ratio", 0)
+    vrp_tier = vrp_data.get("tier", "SKIP")
+
+    # Get liquidity tier from options chain
+    liquidity_tier = "UNKNOWN"
+    if im_result.get("chain"):
+        chain = im_result["chain"]
+        total_oi = sum(opt.get("open_interest") or 0 for opt in chain)
+        avg_spread = 0
+        spread_count = 0
+        for opt in chain:
+            bid = opt.get("bid") or 0
+            ask = opt.get("ask") or 0
+            if bid > 0 and ask > 0:
+                spread_pct = (ask - bid) / ((ask + bid) / 2) * 100
+                avg_spread += spread_pct
+                spread_count += 1
+
+        if spread_count > 0:
+            avg_spread /= spread_count
+
+        liquidity_tier = classify_liquidity_tier(
+            oi=total_oi,
+            spread_pct=avg_spread,
+            position_size=settings.DEFAULT_POSITION_SIZE,
+        )
+
+    # Calculate score
+    score_data = calculate_score(
+        vrp_ratio=vrp_ratio,
+        vrp_tier=vrp_tier,
+        implied_move_pct=implied_move_pct,
+        liquidity_tier=liquidity_tier if liquidity_tier != "UNKNOWN" else "WARNING",
+    )
+
+    # Determine if qualified (VRP >= discovery threshold)
+    if vrp_ratio >= settings.VRP_DISCOVERY:
+        return "qualified", {
+            "ticker": ticker,
+            "name": e.get("name", ""),
+            "price": price,
+            "vrp_ratio": round(vrp_ratio, 2),
+            "vrp_tier": vrp_tier,
+            "implied_move_pct": round(implied_move_pct, 1),
+            "historical_mean": round(historical_avg, 1),
+            "historical_count": historical_count,
+            "liquidity_tier": liquidity_tier,
+            "score": round(score_data["total_score"], 1),
+            "real_data": used_real_data,
+        }
+    else:
+        return "filtered", {
+            "ticker": ticker,
+            "reason": f"Low VRP ({vrp_ratio:.2f}x < {settings.VRP_DISCOVERY}x)",
+            "vrp_ratio": round(vrp_ratio, 2),
+        }
+
+
+
+async def _iter_scan_outcomes(
+    target_earnings: List[Dict[str, Any]],
+    repo,
+    tradier,
+) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Scan earnings entries concurrently, yielding (kind, item) as each completes.
+
+    kind is "qualified", "filtered" or "error". Historical moves for every
+    ticker come from one batch query.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_ANALYSIS)
+    batch_moves = await AsyncRepository(repo).get_moves_batch(
+        [e["symbol"] for e in target_earnings], limit=12
+    )
+
+    async def scan_entry(e: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        async with semaphore:
+            try:
+                return await _scan_earnings_entry(e, batch_moves.get(e["symbol"], []), tradier)
+            except Exception as ex:
+                log("debug", "Scan failed for ticker", ticker=e["symbol"], error=str(ex))
+                return "error", {"ticker": e["symbol"], "error": str(ex)[:100]}
+
+    tasks = [asyncio.create_task(scan_entry(e)) for e in target_earnings]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+# Media types for ?stream= on /api/scan and /api/whisper
+STREAM_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "sse": "text/event-stream",
+}
+
+
+def _stream_response(stream: str, events: AsyncIterator[Tuple[str, Dict[str, Any]]]) -> StreamingResponse:
+    """
+    Stream (event, data) pairs as NDJSON lines or Server-Sent Events.
+
+    NDJSON lines carry the event name in an "event" field; SSE uses the
+    event: line.
+    """
+    async def body():
+        async for event, data in events:
+            if stream == "sse":
+                yield f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+            else:
+                yield json.dumps({"event": event, **data}, default=str) + "\n"
+
+    return StreamingResponse(
+        body(),
+        media_type=STREAM_MEDIA_TYPES[stream],
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _validate_stream(stream: Optional[str]) -> None:
+    if stream is not None and stream not in STREAM_MEDIA_TYPES:
+        raise HTTPException(400, f"Invalid stream format: {stream} (expected ndjson or sse)")
+
+
 @router.get("/scan")
-async def scan(date: str, format: str = "json", _: bool = Depends(verify_api_key)):
+async def scan(
+    date: str,
+    request: Request = None,
+    format: str = "json",
+    stream: Optional[str] = None,
+    fresh: bool = False,
+    _: bool = Depends(verify_api_key),
+):
     """
     Scan all earnings for a specific date.
 
     Returns all tickers with earnings on the given date, sorted by VRP score.
     Includes VRP analysis, liquidity tier, and basic metrics.
 
+    Concurrent requests for the same date share one scan, and the result is
+    served as a snapshot for SNAPSHOT_TTL_SECONDS (ETag, gzip).
+
     Args:
         date: Target date in YYYY-MM-DD format (required)
         format: Output format - "json" or "cli"
+        stream: "ndjson" or "sse" to stream a qualified/filtered/error event
+                per ticker as it completes, then a summary event
+        fresh: If True, bypass the response snapshot (the new result replaces it)
     """
     # Validate date format and actual validity
     if not re.match(r'^\d{4}-\d{2}-\d{2}$', date):
@@ -389,17 +617,50 @@ async def scan(date: str, format: str = "json", _: bool = Depends(verify_api_key
         dt.strptime(date, '%Y-%m-%d')
     except ValueError:
         raise HTTPException(400, f"Invalid date: {date}")
+    _validate_stream(stream)
 
-    log("info", "Scan request", date=date)
+    log("info", "Scan request", date=date, stream=stream, fresh=fresh)
     start_time = time.time()
 
-    try:
+    async def load_earnings():
         # Get earnings from database (populated by calendar-sync job)
         # This avoids rate-limiting issues with Alpha Vantage API
         repo = get_historical_repo()
-        target_earnings = repo.get_earnings_by_date(date)
+        target_earnings = await AsyncRepository(repo).get_earnings_by_date(date)
         log("debug", "Fetched earnings from database", date=date, count=len(target_earnings))
+        target_earnings = target_earnings[:50]  # Limit to 50 tickers
+        return repo, target_earnings, get_tradier()
+
+    if stream:
+        try:
+            repo, target_earnings, tradier = await load_earnings()
+        except Exception as e:
+            duration_ms = (time.time() - start_time) * 1000
+            metrics.request_error("scan", duration_ms)
+            log("error", "Scan failed", date=date, error=type(e).__name__, details=_mask_sensitive(str(e)))
+            raise HTTPException(500, "Scan failed")
 
+        async def events():
+            outcomes = {"qualified": [], "filtered": [], "error": []}
+            try:
+                if target_earnings:
+                    async for kind, item in _iter_scan_outcomes(target_earnings, repo, tradier):
+                        outcomes[kind].append(item)
+                        yield kind, item
+            except Exception as e:
+                metrics.request_error("scan", (time.time() - start_time) * 1000)
+                log("error", "Scan stream failed", date=date, error=type(e).__name__,
+                    details=_mask_sensitive(str(e)))
+                yield "error", {"error": "Scan failed"}
+                return
+            summary = _scan_summary(date, target_earnings, outcomes)
+            metrics.request_success("scan", (time.time() - start_time) * 1000)
+            yield "summary", summary
+
+        return _stream_response(stream, events())
+
+    async def produce():
+        repo, target_earnings, tradier = await load_earnings()
         if not target_earnings:
             return {
                 "status": "success",
@@ -409,177 +670,81 @@ async def scan(date: str, format: str = "json", _: bool = Depends(verify_api_key
                 "qualified": [],
                 "filtered": [],
                 "errors": [],
-            }
-
-        # Get dependencies (repo already created above)
-        tradier = get_tradier()
-
-        qualified = []
-        filtered = []
-        errors = []
-
-        for e in target_earnings[:50]:  # Limit to 50 tickers
-            ticker = e["symbol"]
-            earnings_date = e["report_date"]
-
-            try:
-                # Check historical data requirement
-                moves = repo.get_moves(ticker)
-                historical_count = len(moves)
-
-                if historical_count < 4:
-                    filtered.append({
-                        "ticker": ticker,
-                        "reason": f"Insufficient history ({historical_count} quarters)",
-                    })
-                    continue
-
-                # Extract historical move percentages
-                historical_pcts = [abs(m["intraday_move_pct"]) for m in moves if m.get("intraday_move_pct")]
-                if not historical_pcts:
-                    filtered.append({
-                        "ticker": ticker,
-                        "reason": "No valid historical moves",
-                    })
-                    continue
-
-                historical_avg = sum(historical_pcts) / len(historical_pcts)
-
-                # Fetch real implied move
-                im_result = await fetch_real_implied_move(tradier, ticker, earnings_date)
-
-                # Skip if we couldn't get a price
-                if im_result.get("error") == "No price available":
-                    filtered.append({
-                        "ticker": ticker,
-                        "reason": "No price available",
-                    })
-                    continue
-
-                implied_move_pct, used_real_data = get_implied_move_with_fallback(
-                    im_result, historical_avg
-                )
-                price = im_result.get("price")
-
-                # Calculate VRP
-                vrp_data = calculate_vrp(
-                    implied_move_pct=implied_move_pct,
-                    historical_moves=historical_pcts,
-                )
-
-                if vrp_data.get("error"):
-                    filtered.append({
-                        "ticker": ticker,
-                        "reason": f"VRP calculation failed: {vrp_data.get('error')}",
-                    })
-                    continue
-
-                vrp_ratio = vrp_data.get("vrp_ratio", 0)
-                vrp_tier = vrp_data.get("tier", "SKIP")
-
-                # Get liquidity tier from options chain
-                liquidity_tier = "UNKNOWN"
-                if im_result.get("chain"):
-                    chain = im_result["chain"]
-                    total_oi = sum(opt.get("open_interest") or 0 for opt in chain)
-                    avg_spread = 0
-                    spread_count = 0
-                    for opt in chain:
-                        bid = opt.get("bid") or 0
-                        ask = opt.get("ask") or 0
-                        if bid > 0 and ask > 0:
-                            spread_pct = (ask - bid) / ((ask + bid) / 2) * 100
-                            avg_spread += spread_pct
-                            spread_count += 1
-
-                    if spread_count > 0:
-                        avg_spread /= spread_count
-
-                    liquidity_tier = classify_liquidity_tier(
-                        oi=total_oi,
-                        spread_pct=avg_spread,
-                        position_size=settings.DEFAULT_POSITION_SIZE,
-                    )
-
-                # Calculate score
-                score_data = calculate_score(
-                    vrp_ratio=vrp_ratio,
-                    vrp_tier=vrp_tier,
-                    implied_move_pct=implied_move_pct,
-                    liquidity_tier=liquidity_tier if liquidity_tier != "UNKNOWN" else "WARNING",
-                )
+            }, True
 
-                # Determine if qualified (VRP >= discovery threshold)
-                if vrp_ratio >= settings.VRP_DISCOVERY:
-                    qualified.append({
-                        "ticker": ticker,
-                        "name": e.get("name", ""),
-                        "price": price,
-                        "vrp_ratio": round(vrp_ratio, 2),
-                        "vrp_tier": vrp_tier,
-                        "implied_move_pct": round(implied_move_pct, 1),
-                        "historical_mean": round(historical_avg, 1),
-                        "historical_count": historical_count,
-                        "liquidity_tier": liquidity_tier,
-                        "score": round(score_data["total_score"], 1),
-                        "real_data": used_real_data,
-                    })
-                else:
-                    filtered.append({
-                        "ticker": ticker,
-                        "reason": f"Low VRP ({vrp_ratio:.2f}x < {settings.VRP_DISCOVERY}x)",
-                        "vrp_ratio": round(vrp_ratio, 2),
-                    })
+        outcomes = {"qualified": [], "filtered": [], "error": []}
+        async for kind, item in _iter_scan_outcomes(target_earnings, repo, tradier):
+            outcomes[kind].append(item)
+        return _scan_summary(date, target_earnings, outcomes), True
 
-            except Exception as ex:
-                log("debug", "Scan failed for ticker", ticker=ticker, error=str(ex))
-                errors.append({
-                    "ticker": ticker,
-                    "error": str(ex)[:100],
-                })
-                continue
+    try:
+        snapshot = await scan_snapshots.get(("scan", date), produce, fresh=fresh)
+    except Exception as e:
+        duration_ms = (time.time() - start_time) * 1000
+        metrics.request_error("scan", duration_ms)
+        log("error", "Scan failed", date=date, error=type(e).__name__, details=_mask_sensitive(str(e)))
+        raise HTTPException(500, "Scan failed")
+    # Per request, whether the scan was run, joined or served from the snapshot
+    metrics.request_success("scan", (time.time() - start_time) * 1000)
 
-        # Sort qualified by score descending
-        qualified.sort(key=lambda x: x["score"], reverse=True)
+    build = _format_scan_cli if format == "cli" else _snapshot_payload
+    if request is None:
+        return build(snapshot.payload)
+    return snapshot_response(request, snapshot.render(format, build), snapshot)
 
-        duration_ms = (time.time() - start_time) * 1000
-        metrics.request_success("scan", duration_ms)
-        metrics.tickers_qualified(len(qualified))
 
-        result = {
-            "status": "success",
-            "date": date,
-            "total_found": len(target_earnings),
-            "analyzed": len(qualified) + len(filtered) + len(errors),
-            "qualified_count": len(qualified),
-            "filtered_count": len(filtered),
-            "error_count": len(errors),
-            "qualified": qualified,
-            "filtered": filtered[:10],  # Limit filtered output
-            "errors": errors[:5] if errors else None,
-        }
+def _snapshot_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON variant of a snapshot: the payload as-is."""
+    return payload
 
-        # Format for CLI if requested
-        if format == "cli":
-            lines = [f"📅 Scan Results for {date}", "=" * 40]
-            lines.append(f"Found: {len(target_earnings)} | Qualified: {len(qualified)} | Filtered: {len(filtered)}")
-            lines.append("")
-            if qualified:
-                lines.append("🎯 QUALIFIED OPPORTUNITIES:")
-                for t in qualified[:10]:
-                    tier_emoji = "🟢" if t["liquidity_tier"] in ["EXCELLENT", "GOOD"] else "🟡" if t["liquidity_tier"] == "WARNING" else "🔴"
-                    lines.append(f"  {tier_emoji} {t['ticker']}: VRP {t['vrp_ratio']}x ({t['vrp_tier']}) | Score {t['score']} | {t['liquidity_tier']}")
-            else:
-                lines.append("❌ No qualified opportunities found")
-            return {"output": "\n".join(lines)}
 
+def _format_scan_cli(result: Dict[str, Any]) -> Dict[str, Any]:
+    """CLI variant of a /api/scan payload."""
+    date = result["date"]
+    qualified = result["qualified"]
+    if not result["total_found"]:
         return result
 
-    except Exception as e:
-        duration_ms = (time.time() - start_time) * 1000
-        metrics.request_error("scan", duration_ms)
-        log("error", "Scan failed", date=date, error=type(e).__name__, details=_mask_sensitive(str(e)))
-        raise HTTPException(500, "Scan failed")
+    lines = [f"📅 Scan Results for {date}", "=" * 40]
+    lines.append(f"Found: {result['total_found']} | Qualified: {len(qualified)} | Filtered: {result['filtered_count']}")
+    lines.append("")
+    if qualified:
+        lines.append("🎯 QUALIFIED OPPORTUNITIES:")
+        for t in qualified[:10]:
+            tier_emoji = "🟢" if t["liquidity_tier"] in ["EXCELLENT", "GOOD"] else "🟡" if t["liquidity_tier"] == "WARNING" else "🔴"
+            lines.append(f"  {tier_emoji} {t['ticker']}: VRP {t['vrp_ratio']}x ({t['vrp_tier']}) | Score {t['score']} | {t['liquidity_tier']}")
+    else:
+        lines.append("❌ No qualified opportunities found")
+    return {"output": "\n".join(lines)}
+
+
+def _scan_summary(
+    date: str,
+    target_earnings: List[Dict[str, Any]],
+    outcomes: Dict[str, List[Dict[str, Any]]],
+) -> Dict[str, Any]:
+    """Final /api/scan payload; records the qualified count."""
+    qualified = outcomes["qualified"]
+    filtered = outcomes["filtered"]
+    errors = outcomes["error"]
+
+    # Sort qualified by score descending
+    qualified.sort(key=lambda x: x["score"], reverse=True)
+
+    metrics.tickers_qualified(len(qualified))
+
+    return {
+        "status": "success",
+        "date": date,
+        "total_found": len(target_earnings),
+        "analyzed": len(qualified) + len(filtered) + len(errors),
+        "qualified_count": len(qualified),
+        "filtered_count": len(filtered),
+        "error_count": len(errors),
+        "qualified": qualified,
+        "filtered": filtered[:10],  # Limit filtered output
+        "errors": errors[:5] if errors else None,
+    }
 
 
 @router.get("/analyze")
@@ -607,12 +772,12 @@ async def analyze(ticker: str, date: str = None, format: str = "json", fresh: bo
 
     try:
         # Get historical data
-        repo = get_historical_repo()
-        moves = repo.get_moves(ticker)
+        repo = AsyncRepository(get_historical_repo())
+        moves = await repo.get_moves(ticker)
         historical_count = len(moves)
 
         # Get position limits (TRR data) from precomputed table
-        position_limits = repo.get_position_limits(ticker)
+        position_limits = await repo.get_position_limits(ticker)
 
         if historical_count < 4:
             return {
@@ -625,7 +790,7 @@ async def analyze(ticker: str, date: str = None, format: str = "json", fresh: bo
         target_date = date
         earnings_timing = ""
         if not target_date:
-            earnings_info = repo.get_next_earnings(ticker)
+            earnings_info = await repo.get_next_earnings(ticker)
             if earnings_info:
                 target_date = earnings_info["earnings_date"]
                 earnings_timing = earnings_info.get("timing", "")
@@ -681,7 +846,7 @@ async def analyze(ticker: str, date: str = None, format: str = "json", fresh: bo
                             target_date = av_date
                             log("info", "Found earnings from Alpha Vantage", ticker=ticker, date=av_date)
                             # Store in calendar for future use
-                            repo.upsert_earnings_calendar(av_earnings)
+                            await repo.upsert_earnings_calendar(av_earnings)
                         else:
                             return {
                                 "ticker": ticker,
@@ -812,11 +977,11 @@ async def analyze(ticker: str, date: str = None, format: str = "json", fresh: bo
 
         # Get sentiment
         sentiment_data = None
-        cache = get_sentiment_cache()
+        cache = AsyncRepository(get_sentiment_cache())
 
         # Check cache first (unless fresh=True)
         if not fresh:
-            cached = cache.get_sentiment(ticker, target_date)
+            cached = await cache.get_sentiment(ticker, target_date)
             if cached:
                 sentiment_data = cached
 
@@ -825,7 +990,7 @@ async def analyze(ticker: str, date: str = None, format: str = "json", fresh: bo
             sentiment_data = await perplexity.get_sentiment(ticker, target_date)
             # Save to cache if successful
             if sentiment_data and not sentiment_data.get("error"):
-                cache.save_sentiment(ticker, target_date, sentiment_data)
+                await cache.save_sentiment(ticker, target_date, sentiment_data)
 
         # Apply sentiment modifier and determine direction
         # Uses 3-rule system: skew + sentiment -> adjusted direction
@@ -937,20 +1102,128 @@ async def analyze(ticker: str, date: str = None, format: str = "json", fresh: bo
         raise HTTPException(500, "Analysis failed")
 
 
+async def _refresh_whisper_sentiment(results: List[Dict[str, Any]]) -> None:
+    """Fetch real-time sentiment for the top 5 whisper results and update their direction."""
+    perplexity = get_perplexity()
+    cache = AsyncRepository(get_sentiment_cache())
+    top_n = min(5, len(results))
+
+    for i in range(top_n):
+        ticker = results[i]["ticker"]
+        earnings_date = results[i]["earnings_date"]
+
+        try:
+            sentiment_data = await perplexity.get_sentiment(ticker, earnings_date)
+            if sentiment_data and not sentiment_data.get("error"):
+                # Cache for future requests
+                await cache.save_sentiment(ticker, earnings_date, sentiment_data)
+
+                # Update direction using fresh sentiment
+                direction = get_direction(
+                    skew_bias=None,  # No skew in whisper
+                    sentiment_score=sentiment_data.get("score"),
+                    sentiment_direction=sentiment_data.get("direction"),
+                )
+                results[i]["direction"] = direction
+                results[i]["sentiment_score"] = sentiment_data.get("score", 0)
+                log("debug", "Fresh sentiment fetched",
+                    ticker=ticker, direction=direction,
+                    score=sentiment_data.get("score"))
+        except Exception as e:
+            log("warn", "Failed to fetch fresh sentiment",
+                ticker=ticker, error=type(e).__name__)
+
+
+async def _stream_whisper(
+    upcoming: List[Dict],
+    repo,
+    tradier,
+    target_dates: List[str],
+    fresh: bool,
+    start_time: float,
+) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Yield a "result" event per qualified ticker as it completes, then "summary".
+
+    Applies the same MAX_SCAN_TIME_SECONDS budget as the buffered response;
+    the summary carries the same payload /api/whisper returns as JSON.
+    """
+    results: List[Dict[str, Any]] = []
+    scan_errors = 0
+    deadline = time.monotonic() + MAX_SCAN_TIME_SECONDS
+    outcomes = _iter_whisper_outcomes(upcoming, repo, tradier, fresh=fresh)
+    try:
+        while True:
+            try:
+                outcome = await asyncio.wait_for(
+                    outcomes.__anext__(), timeout=max(0.0, deadline - time.monotonic())
+                )
+            except StopAsyncIteration:
+                break
+            except asyncio.TimeoutError:
+                log("warn", "Whisper stream timed out, summarizing partial results",
+                    timeout_seconds=MAX_SCAN_TIME_SECONDS, partial_count=len(results))
+                metrics.count("ivcrush.whisper.timeout", {"reason": "scan_timeout"})
+                break
+
+            if isinstance(outcome, Exception):
+                log("warning", "Task failed with exception", error=str(outcome))
+                scan_errors += 1
+            elif outcome is not None:
+                results.append(outcome)
+                yield "result", outcome
+
+        results.sort(key=lambda x: x["score"], reverse=True)
+        if fresh and results:
+            await _refresh_whisper_sentiment(results)
+    except Exception as e:
+        metrics.request_error("whisper", (time.time() - start_time) * 1000)
+        log("error", "Whisper stream failed", error=type(e).__name__, details=_mask_sensitive(str(e)))
+        yield "error", {"error": "Whisper failed"}
+        return
+    finally:
+        await outcomes.aclose()
+
+    metrics.request_success("whisper", (time.time() - start_time) * 1000)
+    metrics.tickers_qualified(len(results))
+    yield "summary", {
+        "status": "success",
+        "target_dates": target_dates,
+        "analyzed": len(upcoming),
+        "qualified_count": len(results),
+        "error_count": scan_errors,
+        "tickers": results[:10],  # Top 10
+    }
+
+
 @router.get("/whisper")
-async def whisper(date: str = None, format: str = "json", fresh: bool = False, _: bool = Depends(verify_api_key)):
+async def whisper(
+    request: Request = None,
+    date: str = None,
+    format: str = "json",
+    fresh: bool = False,
+    stream: Optional[str] = None,
+    _: bool = Depends(verify_api_key),
+):
     """
     Most anticipated earnings - find high-VRP opportunities.
 
     Scans upcoming earnings and returns qualified tickers sorted by score.
+    Concurrent requests share one scan, and a completed scan is served as a
+    snapshot for SNAPSHOT_TTL_SECONDS (ETag, gzip).
 
     Args:
-        fresh: If True, bypass VRP and sentiment caches (for Telegram real-time requests)
+        fresh: If True, bypass VRP and sentiment caches and the response
+               snapshot (for Telegram real-time requests); the new result
+               replaces the snapshot
+        stream: "ndjson" or "sse" to stream each qualified ticker as it completes,
+                followed by a summary event with the regular response
     """
-    log("info", "Whisper request", date=date, fresh=fresh)
+    _validate_stream(stream)
+    log("info", "Whisper request", date=date, fresh=fresh, stream=stream)
     start_time = time.time()
 
-    try:
+    async def load_upcoming():
         # Get earnings from database (populated by calendar-sync job)
         # This avoids rate-limiting issues with Alpha Vantage API
         repo = get_historical_repo()
@@ -967,15 +1240,20 @@ async def whisper(date: str = None, format: str = "json", fresh: bool = False, _
             target_dates = [date]
 
         # Get upcoming earnings from database (use ET date to avoid UTC mismatch)
-        upcoming = repo.get_upcoming_earnings(start_date=today, days=5)
+        upcoming = await AsyncRepository(repo).get_upcoming_earnings(start_date=today, days=5)
         if date:
             upcoming = [e for e in upcoming if e["report_date"] == date]
         else:
             upcoming = [e for e in upcoming if e["report_date"] in target_dates]
 
         log("debug", "Fetched upcoming earnings from database", count=len(upcoming), dates=target_dates)
+        return repo, tradier, target_dates, upcoming
+
+    async def produce():
+        repo, tradier, target_dates, upcoming = await load_upcoming()
 
         scan_errors = 0
+        complete = True
         # Shared list accumulates results as tasks complete
         # On timeout, this list contains all results completed before timeout
         partial_results = []
@@ -990,8 +1268,9 @@ async def whisper(date: str = None, format: str = "json", fresh: bool = False, _
                 timeout_seconds=MAX_SCAN_TIME_SECONDS,
                 partial_count=len(partial_results))
             metrics.count("ivcrush.whisper.timeout", {"reason": "scan_timeout"})
-            # Use whatever results completed before the timeout
+            # Use whatever results completed before the timeout (not snapshotted)
             results = partial_results
+            complete = False
 
         # Sort by score descending
         results.sort(key=lambda x: x["score"], reverse=True)
@@ -999,81 +1278,58 @@ async def whisper(date: str = None, format: str = "json", fresh: bool = False, _
         # If fresh=True, fetch real-time sentiment for top 5 tickers
         # This provides up-to-date direction for Telegram requests
         if fresh and results:
-            perplexity = get_perplexity()
-            cache = get_sentiment_cache()
-            top_n = min(5, len(results))
-
-            for i in range(top_n):
-                ticker = results[i]["ticker"]
-                earnings_date = results[i]["earnings_date"]
+            await _refresh_whisper_sentiment(results)
 
-                try:
-                    sentiment_data = await perplexity.get_sentiment(ticker, earnings_date)
-                    if sentiment_data and not sentiment_data.get("error"):
-                        # Cache for future requests
-                        cache.save_sentiment(ticker, earnings_date, sentiment_data)
-
-                        # Update direction using fresh sentiment
-                        direction = get_direction(
-                            skew_bias=None,  # No skew in whisper
-                            sentiment_score=sentiment_data.get("score"),
-                            sentiment_direction=sentiment_data.get("direction"),
-                        )
-                        results[i]["direction"] = direction
-                        results[i]["sentiment_score"] = sentiment_data.get("score", 0)
-                        log("debug", "Fresh sentiment fetched",
-                            ticker=ticker, direction=direction,
-                            score=sentiment_data.get("score"))
-                except Exception as e:
-                    log("warn", "Failed to fetch fresh sentiment",
-                        ticker=ticker, error=type(e).__name__)
+        metrics.tickers_qualified(len(results))
 
-        response = {
+        return {
             "status": "success",
             "target_dates": target_dates,
             "analyzed": len(upcoming),
             "qualified_count": len(results),
             "error_count": scan_errors,
             "tickers": results[:10],  # Top 10
-        }
+        }, complete
 
-        # Format for CLI if requested
-        if format == "cli":
-            ticker_data = [
-                {
-                    "ticker": t["ticker"],
-                    "earnings_date": t.get("earnings_date", ""),
-                    "vrp_ratio": t["vrp_ratio"],
-                    "score": t["score"],
-                    "direction": t.get("direction", "NEUTRAL"),
-                    "tailwinds": "",
-                    "headwinds": "",
-                    "strategy": t.get("strategy", f"VRP {t['vrp_tier']}"),
-                }
-                for t in results[:10]
-            ]
-            cli_output = format_digest_cli(
-                target_dates[0],
-                ticker_data,
+    try:
+        if stream:
+            repo, tradier, target_dates, upcoming = await load_upcoming()
+            return _stream_response(
+                stream, _stream_whisper(upcoming, repo, tradier, target_dates, fresh, start_time)
             )
-            # Record metrics
-            duration_ms = (time.time() - start_time) * 1000
-            metrics.request_success("whisper", duration_ms)
-            metrics.tickers_qualified(len(results))
-            return {"output": cli_output}
-
-        # Record metrics
-        duration_ms = (time.time() - start_time) * 1000
-        metrics.request_success("whisper", duration_ms)
-        metrics.tickers_qualified(len(results))
-
-        return response
 
+        key = ("whisper", date or "", today_et())
+        snapshot = await scan_snapshots.get(key, produce, fresh=fresh)
     except Exception as e:
         duration_ms = (time.time() - start_time) * 1000
         metrics.request_error("whisper", duration_ms)
         log("error", "Whisper failed", error=type(e).__name__, details=_mask_sensitive(str(e)))
         raise HTTPException(500, "Whisper failed")
+    # Per request, whether the scan was run, joined or served from the snapshot
+    metrics.request_success("whisper", (time.time() - start_time) * 1000)
+
+    build = _format_whisper_cli if format == "cli" else _snapshot_payload
+    if request is None:
+        return build(snapshot.payload)
+    return snapshot_response(request, snapshot.render(format, build), snapshot)
+
+
+def _format_whisper_cli(response: Dict[str, Any]) -> Dict[str, Any]:
+    """CLI variant of a /api/whisper payload."""
+    ticker_data = [
+        {
+            "ticker": t["ticker"],
+            "earnings_date": t.get("earnings_date", ""),
+            "vrp_ratio": t["vrp_ratio"],
+            "score": t["score"],
+            "direction": t.get("direction", "NEUTRAL"),
+            "tailwinds": "",
+            "headwinds": "",
+            "strategy": t.get("strategy", f"VRP {t['vrp_tier']}"),
+        }
+        for t in response["tickers"]
+    ]
+    return {"output": format_digest_cli(response["target_dates"][0], ticker_data)}
 
 
 @router.get("/council")
@@ -1083,6 +1339,9 @@ async def council(ticker: str, format: str = "json", fresh: bool = False, _: boo
 
     Aggregates Finnhub analysts, Finnhub news, Perplexity (quick + deep),
     options skew, and historical patterns into a weighted consensus.
+
+    Args:
+        fresh: If True, refetch every member instead of reusing cached ones
     """
     # Validate and normalize ticker
     try:
@@ -1103,7 +1362,7 @@ async def council(ticker: str, format: str = "json", fresh: bool = False, _: boo
         repo = get_historical_repo()
         cache = get_sentiment_cache()
 
-        result = await run_council(ticker, finnhub, perplexity, tradier, repo, cache)
+        result = await run_council(ticker, finnhub, perplexity, tradier, repo, cache, fresh=fresh)
 
         duration_ms = (time.time() - start_time) * 1000
         metrics.request_success("council", duration_ms)
@@ -4,10 +4,20 @@ Health check endpoints for Trading Desk 5.0.
 Provides system health and status information.
 """
 
+from pathlib import Path
+
 from fastapi import APIRouter, Depends
 
+from src.core import metrics
 from src.core.config import now_et
+from src.core.db_executor import executor_stats, run_db
+from src.core.hydration import hydration_status
+from src.core.loop_monitor import get_monitor, slow_callback_count
+from src.core.hedging import hedge_stats
+from src.core.rate_limit import rate_limit_stats
+from src.integrations.telegram_outbox import outbox_stats
 from src.api.dependencies import verify_api_key, get_job_manager
+from src.domain.repositories import get_pool_stats
 
 router = APIRouter(tags=["health"])
 
@@ -18,16 +28,51 @@ async def root():
     return {
         "service": "trading-desk",
         "timestamp_et": now_et().isoformat(),
-        "status": "healthy"
+        "status": "healthy",
+        "database": hydration_status()["state"],
     }
 
 
 @router.get("/api/health")
 async def health(format: str = "json", _: bool = Depends(verify_api_key)):
     """System health check."""
+    pools = get_pool_stats()
+    for db_path, stats in pools.items():
+        metrics.db_pool_stats(Path(db_path).stem, stats)
+
+    jobs = await run_db(get_job_manager().get_day_summary)
+
+    db_executor = executor_stats()
+    metrics.db_executor_stats(db_executor)
+
     data = {
         "status": "healthy",
         "timestamp_et": now_et().isoformat(),
-        "jobs": get_job_manager().get_day_summary(),
+        "jobs": jobs,
+        "db_pools": {Path(p).name: s for p, s in pools.items()},
+        "db_executor": db_executor,
+        "slow_callbacks": slow_callback_count(),
+        "hydration": hydration_status(),
+        "rate_limits": rate_limit_stats(),
+        "hedging": hedge_stats(),
+        "telegram_outbox": outbox_stats(),
     }
+    monitor = get_monitor()
+    if monitor is not None:
+        data["loop_lag"] = monitor.lag_stats()
     return data
+
+
+@router.get("/api/debug/loop")
+async def debug_loop(_: bool = Depends(verify_api_key)):
+    """
+    Event loop diagnostics: lag percentiles, recent stalls with the stack
+    that was blocking the loop, and recent slow callbacks.
+    """
+    monitor = get_monitor()
+    if monitor is None:
+        return {
+            "running": False,
+            "slow_callbacks": slow_callback_count(),
+        }
+    return monitor.snapshot()
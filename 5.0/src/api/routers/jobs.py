@@ -4,7 +4,7 @@ Job dispatching endpoints for Trading Desk 5.0.
 Handles Cloud Scheduler job routing and execution.
 """
 
-import sqlite3
+import functools
 import time
 import asyncio
 
@@ -14,7 +14,11 @@ from src.core.logging import log
 from src.core import metrics
 from src.core.job_manager import JobManager
 from src.core.config import settings
-from src.core.database import quick_upload
+from src.core.changeset_sync import push_changes
+from src.core.db_executor import run_db
+from src.domain.repositories import cleanup_all_pools
+from src.jobs import DagExecutor
+from src.jobs.dag import safe_record_status as _safe_record_status  # noqa: F401 (re-exported by main)
 from src.api.state import _mask_sensitive
 from src.api.dependencies import (
     verify_api_key,
@@ -34,29 +38,14 @@ def _fire_and_forget(coro) -> None:
     task.add_done_callback(_background_tasks.discard)
 
 
-def _safe_record_status(manager: JobManager, job: str, status: str) -> bool:
-    """
-    Safely record job status, handling database errors gracefully.
-
-    Returns:
-        True if status was recorded successfully, False if database error occurred
-    """
-    try:
-        manager.record_status(job, status)
-        return True
-    except sqlite3.Error as db_err:
-        log("error", "Failed to record job status",
-            job=job, status=status, error=str(db_err))
-        metrics.count("ivcrush.job_status.failed", {"job": job, "error": "sqlite3"})
-        return False
-
-
 async def _sync_status_to_gcs(db_path: str, bucket: str) -> None:
-    """Upload ivcrush.db to GCS after a job status write. Fire-and-forget."""
+    """Push rows changed by a job (and its status) to GCS. Fire-and-forget."""
     if not bucket:
         return
     loop = asyncio.get_running_loop()
-    await loop.run_in_executor(None, quick_upload, db_path, bucket)
+    # A push that re-bases on a newer snapshot replaces the file: close pools first
+    push = functools.partial(push_changes, db_path, bucket, before_swap=cleanup_all_pools)
+    await loop.run_in_executor(None, push)
 
 
 @router.post("/dispatch")
@@ -66,77 +55,64 @@ async def dispatch(
 ):
     """
     Dispatcher endpoint called by Cloud Scheduler every 15 min.
-    Routes to correct job based on current time.
+    Runs every job due now (see JobManager.get_due_jobs) as one DAG run:
+    independent jobs run concurrently and share fetched artifacts.
 
     Args:
-        force: Optional job name to force-run (bypasses time-based scheduling)
+        force: Optional job name, or comma-separated names, to force-run
+            (bypasses time-based scheduling, not dependencies)
     """
     start_time = time.time()
     try:
         manager = get_job_manager()
 
-        # Force-run specific job if requested (for testing)
+        # Force-run specific jobs if requested (for testing)
         if force:
-            job = force
-            log("info", "Force-running job", job=job)
+            jobs = [j.strip() for j in force.split(",") if j.strip()]
+            log("info", "Force-running jobs", jobs=jobs)
         else:
-            job = manager.get_current_job()
+            jobs = await run_db(manager.get_due_jobs)
 
-        if not job:
-            log("info", "No job scheduled for current time")
+        if not jobs:
             duration_ms = (time.time() - start_time) * 1000
             metrics.request_success("dispatch", duration_ms)
+            # Idempotency guard: Cloud Scheduler can fire the same trigger twice
+            job = manager.get_current_job()
+            if job:
+                log("info", "Job already ran successfully today, skipping", job=job)
+                return {"status": "already_run", "job": job}
+            log("info", "No job scheduled for current time")
             return {"status": "no_job", "message": "No job scheduled"}
 
-        # Idempotency guard: Cloud Scheduler can fire the same trigger twice
-        if not force and manager.has_run_today(job):
-            log("info", "Job already ran successfully today, skipping", job=job)
-            duration_ms = (time.time() - start_time) * 1000
-            metrics.request_success("dispatch", duration_ms)
-            return {"status": "already_run", "job": job}
-
-        # Check dependencies
-        can_run, reason = manager.check_dependencies(job)
-        if not can_run:
-            log("warn", "Job dependencies not met", job=job, reason=reason)
-            duration_ms = (time.time() - start_time) * 1000
-            metrics.request_success("dispatch", duration_ms)
-            return {"status": "skipped", "job": job, "reason": reason}
-
-        log("info", "Dispatching job", job=job)
-
-        # Run the job with error handling
-        runner = get_job_runner()
-        try:
-            result = await runner.run(job)
-        except Exception as e:
-            log("error", "Job execution failed", job=job, error=str(e))
-            status_recorded = _safe_record_status(manager, job, "failed")
-            if settings.gcs_bucket:
-                _fire_and_forget(_sync_status_to_gcs(manager.db_path, settings.gcs_bucket))
-            duration_ms = (time.time() - start_time) * 1000
-            metrics.request_error("dispatch", duration_ms, "job_failed")
-            response = {"status": "error", "job": job, "error": str(e)}
-            if not status_recorded:
-                response["status_recording"] = "failed"
-            return response
-
-        # Record status based on result
-        status = "success" if result.get("status") == "success" else "failed"
-        status_recorded = _safe_record_status(manager, job, status)
-        if settings.gcs_bucket:
+        log("info", "Dispatching jobs", jobs=jobs)
+        results = await DagExecutor(manager, get_job_runner()).run(jobs)
+        if settings.gcs_bucket and any(r["status"] != "skipped" for r in results.values()):
             _fire_and_forget(_sync_status_to_gcs(manager.db_path, settings.gcs_bucket))
 
         duration_ms = (time.time() - start_time) * 1000
-        if status == "success":
-            metrics.request_success("dispatch", duration_ms)
-        else:
+        statuses = {r["status"] for r in results.values()}
+        if "failed" in statuses:
             metrics.request_error("dispatch", duration_ms, "job_result_failed")
+        else:
+            metrics.request_success("dispatch", duration_ms)
 
-        response = {"status": status, "job": job, "result": result}
-        if not status_recorded:
-            response["status_recording"] = "failed"
-        return response
+        # Single job: same response shape as before DAG runs
+        if len(results) == 1:
+            job, entry = next(iter(results.items()))
+            if entry["status"] == "skipped":
+                return {"status": "skipped", "job": job, "reason": entry["reason"]}
+            response = {"status": entry["status"], "job": job, "result": entry["result"]}
+            if "status_recording" in entry:
+                response["status_recording"] = entry["status_recording"]
+            return response
+
+        if statuses == {"success"}:
+            status = "success"
+        elif "failed" in statuses:
+            status = "failed"
+        else:
+            status = "partial"
+        return {"status": status, "jobs": results}
 
     except Exception as e:
         duration_ms = (time.time() - start_time) * 1000
@@ -12,7 +12,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from src.core.config import now_et, today_et, settings
 from src.core.logging import log
 from src.core import metrics
-from src.domain import calculate_vrp
+from src.domain import AsyncRepository, calculate_vrp
 from src.domain.implied_move import (
     fetch_real_implied_move,
     get_implied_move_with_fallback,
@@ -62,9 +62,9 @@ async def prime(date: str = None, _: bool = Depends(verify_api_key)):
         upcoming = [e for e in earnings if e["report_date"] in target_dates]
 
         # Get dependencies
-        repo = get_historical_repo()
+        repo = AsyncRepository(get_historical_repo())
         tradier = get_tradier()
-        cache = get_sentiment_cache()
+        cache = AsyncRepository(get_sentiment_cache())
         perplexity = get_perplexity()
 
         primed_count = 0
@@ -78,13 +78,13 @@ async def prime(date: str = None, _: bool = Depends(verify_api_key)):
 
             try:
                 # Check if already cached
-                cached = cache.get_sentiment(ticker, earnings_date)
+                cached = await cache.get_sentiment(ticker, earnings_date)
                 if cached:
                     cached_count += 1
                     continue
 
                 # Check historical data requirement
-                moves = repo.get_moves(ticker)
+                moves = await repo.get_moves(ticker)
                 if len(moves) < 4:
                     skipped_count += 1
                     continue
@@ -114,7 +114,7 @@ async def prime(date: str = None, _: bool = Depends(verify_api_key)):
                 # Fetch and cache sentiment
                 sentiment_data = await perplexity.get_sentiment(ticker, earnings_date)
                 if sentiment_data and not sentiment_data.get("error"):
-                    cache.save_sentiment(ticker, earnings_date, sentiment_data)
+                    await cache.save_sentiment(ticker, earnings_date, sentiment_data)
                     primed_count += 1
                     log("info", "Primed sentiment", ticker=ticker, date=earnings_date)
                 else:
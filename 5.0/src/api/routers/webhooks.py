@@ -139,9 +139,9 @@ async def alerts_ingest(
 
 #ivcrush #alert #monitoring"""
 
-        # Send to Telegram
+        # Send to Telegram; "forwarded" means posted, not just queued
         telegram = get_telegram()
-        sent = await telegram.send_message(message)
+        sent = await telegram.send_message(message, await_delivery=True)
 
         duration_ms = (time.time() - start_time) * 1000
         if sent:
@@ -0,0 +1,171 @@
+"""
+Single-flight scans and response snapshots for /api/scan and /api/whisper.
+
+A whisper scan analyzes up to 100 tickers; several Telegram users or cron
+callers asking within a few seconds used to start one scan each. Requests
+for the same scan now attach to the one already running, and a completed
+scan is kept for SNAPSHOT_TTL_SECONDS so later requests are served from it.
+
+Snapshot responses carry an ETag (If-None-Match answers 304) and are
+gzip-compressed for clients that accept it. fresh=true skips the snapshot
+(it still coalesces with other fresh requests); its result, being the most
+recent, replaces the snapshot.
+"""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+from src.core.logging import log
+from src.core import metrics
+
+# How long a completed scan serves later requests
+SNAPSHOT_TTL_SECONDS = 60
+
+# Snapshots kept at once (oldest evicted first)
+MAX_SNAPSHOTS = 32
+
+# Bodies smaller than this are not worth compressing
+GZIP_MIN_BYTES = 1024
+
+
+class RenderedBody:
+    """One encoded response body with its ETag; gzip is computed on first use."""
+
+    def __init__(self, payload: Dict[str, Any]):
+        self.body = json.dumps(
+            jsonable_encoder(payload), ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+        self.etag = '"' + hashlib.sha1(self.body).hexdigest()[:16] + '"'
+        self._gzipped: Optional[bytes] = None
+
+    def gzipped(self) -> bytes:
+        if self._gzipped is None:
+            self._gzipped = gzip.compress(self.body, compresslevel=6)
+        return self._gzipped
+
+
+class Snapshot:
+    """A completed scan payload and its rendered variants (json, cli, ...)."""
+
+    def __init__(self, payload: Dict[str, Any]):
+        self.payload = payload
+        self.created = time.monotonic()
+        self._rendered: Dict[str, RenderedBody] = {}
+
+    def age_seconds(self) -> float:
+        return time.monotonic() - self.created
+
+    def render(
+        self, variant: str, build: Callable[[Dict[str, Any]], Dict[str, Any]]
+    ) -> RenderedBody:
+        """Encode build(payload) once per variant."""
+        rendered = self._rendered.get(variant)
+        if rendered is None:
+            rendered = self._rendered[variant] = RenderedBody(build(self.payload))
+        return rendered
+
+
+class ScanSnapshots:
+    """
+    In-flight request coalescing plus a short-TTL snapshot per scan key.
+
+    produce() returns (payload, complete); an incomplete payload (e.g. a scan
+    cut short by its deadline) is returned to every waiter but not kept.
+    Not shared across instances, like the rate limiter.
+    """
+
+    def __init__(self, ttl_seconds: float = SNAPSHOT_TTL_SECONDS, max_entries: int = MAX_SNAPSHOTS):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._snapshots: Dict[Hashable, Snapshot] = {}
+        self._inflight: Dict[Hashable, "asyncio.Future[Snapshot]"] = {}
+
+    async def get(
+        self,
+        key: Hashable,
+        produce: Callable[[], Awaitable[Tuple[Dict[str, Any], bool]]],
+        fresh: bool = False,
+    ) -> Snapshot:
+        """
+        Snapshot for key: cached, joined from a running scan, or produced now.
+
+        The scan runs as its own task, so a caller that disconnects does not
+        cancel it for the others.
+        """
+        endpoint = key[0] if isinstance(key, tuple) else str(key)
+        if not fresh:
+            snapshot = self._snapshots.get(key)
+            if snapshot is not None and snapshot.age_seconds() < self.ttl_seconds:
+                metrics.count("ivcrush.snapshot.request", {"endpoint": endpoint, "source": "snapshot"})
+                return snapshot
+
+        flight_key = (key, fresh)
+        task = self._inflight.get(flight_key)
+        if task is not None:
+            source = "coalesced"
+        else:
+            source = "computed"
+            task = asyncio.ensure_future(self._produce(key, produce))
+            self._inflight[flight_key] = task
+            task.add_done_callback(lambda _t: self._inflight.pop(flight_key, None))
+
+        metrics.count("ivcrush.snapshot.request", {"endpoint": endpoint, "source": source})
+        return await asyncio.shield(task)
+
+    async def _produce(
+        self,
+        key: Hashable,
+        produce: Callable[[], Awaitable[Tuple[Dict[str, Any], bool]]],
+    ) -> Snapshot:
+        payload, complete = await produce()
+        snapshot = Snapshot(payload)
+        if complete:
+            self._snapshots.pop(key, None)
+            self._snapshots[key] = snapshot
+            while len(self._snapshots) > self.max_entries:
+                self._snapshots.pop(next(iter(self._snapshots)))
+        else:
+            log("debug", "Incomplete scan not snapshotted", key=str(key))
+        return snapshot
+
+    def clear(self) -> None:
+        """Drop all snapshots (running scans are left alone)."""
+        self._snapshots.clear()
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """True if an If-None-Match header matches etag (weak comparison)."""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or any(
+        (tag[2:] if tag.startswith("W/") else tag) == etag for tag in candidates
+    )
+
+
+def snapshot_response(request: Request, rendered: RenderedBody, snapshot: Snapshot) -> Response:
+    """JSON response for a rendered snapshot: 304, gzip or plain."""
+    headers = {
+        "ETag": rendered.etag,
+        "Vary": "Accept-Encoding",
+        "X-Snapshot-Age": str(int(snapshot.age_seconds())),
+    }
+    if _etag_matches(request.headers.get("if-none-match"), rendered.etag):
+        return Response(status_code=304, headers=headers)
+
+    accept_encoding = request.headers.get("accept-encoding", "")
+    if len(rendered.body) >= GZIP_MIN_BYTES and "gzip" in accept_encoding.lower():
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=rendered.gzipped(), media_type="application/json", headers=headers)
+    return Response(content=rendered.body, media_type="application/json", headers=headers)
+
+
+# Shared by the analysis router
+scan_snapshots = ScanSnapshots()
@@ -5,21 +5,29 @@ Contains AppState dataclass, InMemoryRateLimiter, and the FastAPI lifespan
 context manager for proper resource lifecycle management.
 """
 
-import asyncio
 import collections
 import time
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import Optional, Dict
+from typing import Callable, Dict, Optional
 
 from fastapi import FastAPI
 
 from src.core.config import settings
 from src.core.logging import log
-from src.core.database import DatabaseSync
+from src.core.changeset_sync import ChangesetSync, GCSObjectStore
 from src.domain.repositories import cleanup_all_pools
 from src.core.job_manager import JobManager
 from src.core import metrics
+from src.core import db_executor
+from src.core.hydration import start_hydration, stop_hydration
+from src.integrations.telegram_outbox import start_outbox, stop_outbox
+from src.core.loop_monitor import (
+    install_slow_callback_detector,
+    uninstall_slow_callback_detector,
+    start_monitor,
+    stop_monitor,
+)
 from src.jobs import JobRunner
 from src.domain import (
     HistoricalMovesRepository,
@@ -54,57 +62,93 @@ def _mask_sensitive(text: str) -> str:
     return text
 
 
+# Most client IPs tracked at once; the least recently seen is evicted beyond this
+RATE_LIMIT_MAX_KEYS = 10_000
+
+
+class _WindowCounts:
+    """Request counts for one key: the current fixed window and the one before."""
+
+    __slots__ = ("window", "previous", "current")
+
+    def __init__(self, window: int):
+        self.window = window
+        self.previous = 0
+        self.current = 0
+
+
 class InMemoryRateLimiter:
     """
-    Simple in-memory rate limiter using sliding window per IP.
+    Sliding-window rate limiter per IP, using two fixed-window counters.
 
-    Tracks request timestamps per IP address and enforces a maximum
-    number of requests within a rolling time window.
+    The request rate over the last window_seconds is estimated as
+    previous_count * (unexpired fraction of the previous window) +
+    current_count, which is the usual sliding-window counter approximation
+    (exact for evenly spread traffic). Each IP costs three integers instead
+    of a deque of timestamps, and at most max_keys IPs are tracked; the
+    least recently seen is evicted first, so no cleanup task is needed.
+
+    is_allowed does not await, so each check runs atomically on the event
+    loop and no lock is taken.
 
     Not suitable for multi-instance deployments (each instance has its own state),
     but sufficient for single Cloud Run instance protection against abuse.
     """
 
-    def __init__(self, max_requests: int = 60, window_seconds: int = 60):
+    def __init__(
+        self,
+        max_requests: int = 60,
+        window_seconds: int = 60,
+        max_keys: int = RATE_LIMIT_MAX_KEYS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        # IP -> deque of request timestamps
-        self._requests: Dict[str, collections.deque] = {}
-        self._lock = asyncio.Lock()
-
-    async def is_allowed(self, client_ip: str) -> bool:
-        """Check if a request from client_ip is allowed."""
-        now = time.monotonic()
-        cutoff = now - self.window_seconds
-
-        async with self._lock:
-            if client_ip not in self._requests:
-                self._requests[client_ip] = collections.deque()
-
-            dq = self._requests[client_ip]
-
-            # Remove expired timestamps
-            while dq and dq[0] < cutoff:
-                dq.popleft()
+        self.max_keys = max_keys
+        self._clock = clock
+        # IP -> window counts, least recently seen first
+        self._counts: "collections.OrderedDict[str, _WindowCounts]" = collections.OrderedDict()
+        self.evictions = 0
+        self.rejections = 0
+
+    def check(self, client_ip: str) -> bool:
+        """Count a request from client_ip; False if it is over the limit."""
+        position = self._clock() / self.window_seconds
+        window = int(position)
+
+        counts = self._counts.get(client_ip)
+        if counts is None:
+            counts = self._counts[client_ip] = _WindowCounts(window)
+            if len(self._counts) > self.max_keys:
+                self._counts.popitem(last=False)
+                self.evictions += 1
+        else:
+            self._counts.move_to_end(client_ip)
+            if counts.window != window:
+                counts.previous = counts.current if counts.window == window - 1 else 0
+                counts.current = 0
+                counts.window = window
 
-            if len(dq) >= self.max_requests:
-                return False
+        estimate = counts.previous * (1.0 - (position - window)) + counts.current
+        if estimate >= self.max_requests:
+            self.rejections += 1
+            return False
 
-            dq.append(now)
-            return True
+        counts.current += 1
+        return True
 
-    async def cleanup_stale(self):
-        """Remove entries for IPs with no recent requests."""
-        now = time.monotonic()
-        cutoff = now - self.window_seconds
+    async def is_allowed(self, client_ip: str) -> bool:
+        """Check if a request from client_ip is allowed."""
+        return self.check(client_ip)
 
-        async with self._lock:
-            stale_ips = [
-                ip for ip, dq in self._requests.items()
-                if not dq or dq[-1] < cutoff
-            ]
-            for ip in stale_ips:
-                del self._requests[ip]
+    def stats(self) -> Dict[str, int]:
+        """Tracked keys, LRU evictions and rejected requests since startup."""
+        return {
+            "keys": len(self._counts),
+            "max_keys": self.max_keys,
+            "evictions": self.evictions,
+            "rejections": self.rejections,
+        }
 
 
 # Global rate limiter instance (60 requests per minute per IP)
@@ -151,6 +195,11 @@ def set_app_state(state: Optional[AppState]):
     _app_state = state
 
 
+def _pull_database(db_path: str, before_swap=None) -> Optional[Dict]:
+    """Pull ivcrush.db from GCS (snapshot + changesets). Blocking."""
+    return ChangesetSync(GCSObjectStore(settings.gcs_bucket)).pull(db_path, before_swap)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -161,6 +210,11 @@ async def lifespan(app: FastAPI):
     """
     log("info", "Starting Trading Desk 5.0")
 
+    # Log any callback that blocks the event loop (sync DB/CPU work in async code)
+    # and sample scheduling lag + stall stacks (served at /api/debug/loop)
+    install_slow_callback_detector()
+    start_monitor()
+
     # SECURITY FIX: Validate required config at startup - fail fast on misconfiguration
     config_errors = settings.validate_required_config()
     if config_errors:
@@ -175,34 +229,26 @@ async def lifespan(app: FastAPI):
     # Log warnings for optional but recommended config
     settings.validate_or_warn()
 
-    # Download latest database from GCS at startup (persistent storage)
-    # This ensures Cloud Run instances start with the most recent data
+    # Pull latest database from GCS (persistent storage) so Cloud Run
+    # instances start with the most recent data. In lazy mode the pull runs in
+    # the background after startup; requests other than GET / wait for it.
     db_path = settings.DB_PATH
-    if settings.is_production and settings.gcs_bucket:
+    pull_from_gcs = settings.is_production and settings.gcs_bucket
+    if pull_from_gcs and not settings.lazy_db_hydration:
         try:
-            log("info", "Downloading database from GCS", bucket=settings.gcs_bucket)
-            db_sync = DatabaseSync(bucket_name=settings.gcs_bucket)
-            gcs_db_path = db_sync.download()
-
-            # Copy GCS database to expected path using atomic write pattern
-            # Write to temp file first, then rename to avoid partial writes on failure
-            import shutil
-            from pathlib import Path
-            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
-            temp_db_path = db_path + ".tmp"
-            shutil.copy(gcs_db_path, temp_db_path)
-            shutil.move(temp_db_path, db_path)
-            log("info", "Database downloaded from GCS", path=db_path)
+            log("info", "Pulling database from GCS", bucket=settings.gcs_bucket)
+            pulled = _pull_database(db_path)
+            log("info", "Database pulled from GCS", path=db_path, **(pulled or {}))
         except Exception as e:
             log("warn", "Failed to download DB from GCS, using bundled DB",
-                error=type(e).__name__, message=str(e)[:100])
+                error=type(e).__name__, detail=str(e)[:100])
 
     # Initialize all components
     twelvedata_client = TwelveDataClient(settings.twelve_data_key)
     state = AppState(
         job_manager=JobManager(db_path=settings.DB_PATH),
         job_runner=JobRunner(twelvedata_client=twelvedata_client),
-        tradier=TradierClient(settings.tradier_api_key),
+        tradier=TradierClient(settings.tradier_api_key, hedge=settings.hedge_tradier_requests),
         alphavantage=AlphaVantageClient(settings.alpha_vantage_key),
         perplexity=PerplexityClient(
             api_key=settings.perplexity_api_key,
@@ -220,6 +266,17 @@ async def lifespan(app: FastAPI):
         finnhub=FinnhubClient(settings.finnhub_api_key) if settings.finnhub_api_key else None,
     )
 
+    if pull_from_gcs and settings.lazy_db_hydration:
+        log("info", "Hydrating database from GCS in background", bucket=settings.gcs_bucket)
+
+        def _on_hydrated():
+            # Re-create tables the hydrated copy may predate
+            state.job_manager = JobManager(db_path=db_path)
+
+        # Pools opened on the bundled file are closed before it is replaced
+        start_hydration(db_path, _pull_database, on_ready=_on_hydrated,
+                        before_swap=cleanup_all_pools)
+
     # Store in app.state for access via request.app.state
     app.state.services = state
     set_app_state(state)
@@ -228,24 +285,17 @@ async def lifespan(app: FastAPI):
     if settings.telegram_bot_token and not settings.telegram_webhook_secret:
         log("error", "TELEGRAM_WEBHOOK_SECRET not configured - Telegram bot will reject all webhooks")
 
-    log("info", "All services initialized")
-
-    # Start background task for rate limiter cleanup (prevents memory leak from stale IPs)
-    async def _rate_limiter_cleanup():
-        while True:
-            await asyncio.sleep(300)  # Every 5 minutes
-            await rate_limiter.cleanup_stale()
+    # Queue Telegram sends so jobs and webhooks don't wait on the Bot API
+    start_outbox()
 
-    cleanup_task = asyncio.create_task(_rate_limiter_cleanup())
+    log("info", "All services initialized")
 
     yield  # Application runs here
 
-    # Cancel the cleanup task on shutdown
-    cleanup_task.cancel()
-    try:
-        await cleanup_task
-    except asyncio.CancelledError:
-        pass
+    await stop_hydration()
+
+    # Deliver queued Telegram messages before the HTTP clients go away
+    await stop_outbox()
 
     # Cleanup on shutdown
     log("info", "Shutting down Trading Desk 5.0")
@@ -256,6 +306,9 @@ async def lifespan(app: FastAPI):
     if state.twelvedata:
         await state.twelvedata.close()
 
+    # Stop DB executor before closing the pools its workers use
+    db_executor.shutdown()
+
     # Close database connection pools
     cleanup_all_pools()
     log("info", "Database connection pools closed")
@@ -263,4 +316,6 @@ async def lifespan(app: FastAPI):
     # Shutdown metrics thread pool
     metrics.shutdown()
 
+    await stop_monitor()
+    uninstall_slow_callback_detector()
     set_app_state(None)
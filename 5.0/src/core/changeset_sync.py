@@ -0,0 +1,703 @@
+"""
+Incremental database sync with GCS using row-level changesets.
+
+DatabaseSync moves the whole ivcrush.db on every write, so a job that
+updates one job_status row still uploads the full database. ChangesetSync
+uploads only the rows that changed (captured by common.changesets triggers)
+and periodically folds them into a compacted snapshot.
+
+Remote layout (blob_name defaults to "ivcrush.db"):
+
+    ivcrush.db                      compacted snapshot - the same blob that
+                                    deploy.sh and sync_databases.py read/write
+    ivcrush.db.manifest.json        {"epoch", "snapshot_generation", "snapshot_seq"}
+    ivcrush.db.changes/<seq>.json.gz   one changeset per push
+
+Conflict detection still uses GCS generation numbers:
+
+- A changeset claims its sequence number with if_generation_match=0. If two
+  instances race for the same seq, the loser gets DatabaseSyncConflictError
+  internally, replays the winner's changes locally and retries at seq + 1.
+- Compaction uploads the snapshot with if_generation_match set to the
+  snapshot generation in the manifest, and the manifest with its own
+  generation.
+- If the snapshot generation no longer matches the manifest, the blob was
+  replaced outside this protocol (deploy.sh). The next pull adopts it as the
+  new base under a fresh epoch. sync_databases.py uploads conditionally on
+  the generation it merged and rewrites the manifest itself, also under a
+  fresh epoch.
+- A copy whose head is behind the snapshot, or that finds a changeset it
+  needs already deleted by compaction, re-bases on the snapshot (keeping its
+  unpushed rows) before it pushes, and is never compacted as is: the missing
+  rows would be dropped from the snapshot for every replica.
+
+ObjectStore abstracts the bucket so the protocol can be exercised against
+LocalObjectStore, a directory-backed stand-in with GCS-style generations.
+
+Example Usage:
+    sync = ChangesetSync(GCSObjectStore(settings.gcs_bucket))
+    sync.pull(settings.DB_PATH)       # startup
+    sync.push(settings.DB_PATH)       # after a job writes
+"""
+
+import json
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .database import DatabaseCorruptedError, DatabaseSyncConflictError
+from .logging import log
+
+# Ensure common/ is importable
+_root = str(Path(__file__).resolve().parent.parent.parent.parent)
+if _root not in sys.path:
+    sys.path.insert(0, _root)
+
+from common import changesets  # noqa: E402
+
+# Fold changesets into a new snapshot after this many pushes
+COMPACT_EVERY = 50
+
+# Attempts to claim a changeset sequence number before giving up
+MAX_PUSH_RETRIES = 5
+
+
+class ChangesetGapError(DatabaseSyncConflictError):
+    """A changeset the local copy needs was folded into a newer snapshot."""
+
+
+class ObjectStore:
+    """
+    Minimal generation-aware object store interface.
+
+    Generations follow GCS semantics: every write produces a new positive
+    integer, and if_generation_match=0 means "only if the object does not
+    exist". Precondition failures raise DatabaseSyncConflictError.
+    """
+
+    def stat(self, name: str) -> Optional[int]:
+        """Current generation of an object, or None if it doesn't exist."""
+        raise NotImplementedError
+
+    def read(self, name: str) -> Optional[Tuple[bytes, int]]:
+        """(data, generation), or None if the object doesn't exist."""
+        raise NotImplementedError
+
+    def download(self, name: str, path: str) -> Optional[int]:
+        """Download an object to a file. Returns its generation, or None if missing."""
+        raise NotImplementedError
+
+    def write(self, name: str, data: bytes, if_generation_match: Optional[int] = None) -> int:
+        """Write bytes. Returns the new generation."""
+        raise NotImplementedError
+
+    def upload(self, name: str, path: str, if_generation_match: Optional[int] = None) -> int:
+        """Upload a file. Returns the new generation."""
+        raise NotImplementedError
+
+    def list(self, prefix: str) -> List[str]:
+        """Object names starting with prefix."""
+        raise NotImplementedError
+
+    def delete(self, name: str) -> None:
+        """Delete an object (missing objects are ignored)."""
+        raise NotImplementedError
+
+
+class GCSObjectStore(ObjectStore):
+    """ObjectStore backed by a GCS bucket."""
+
+    TIMEOUT = 60
+
+    def __init__(self, bucket_name: str, client: Any = None):
+        from google.cloud import storage
+
+        self.bucket_name = bucket_name
+        self._client = client or storage.Client()
+        self._bucket = self._client.bucket(bucket_name)
+
+    def stat(self, name: str) -> Optional[int]:
+        blob = self._bucket.get_blob(name, timeout=self.TIMEOUT)
+        return blob.generation if blob is not None else None
+
+    def read(self, name: str) -> Optional[Tuple[bytes, int]]:
+        from google.api_core.exceptions import NotFound
+
+        blob = self._bucket.get_blob(name, timeout=self.TIMEOUT)
+        if blob is None:
+            return None
+        try:
+            data = blob.download_as_bytes(
+                if_generation_match=blob.generation, timeout=self.TIMEOUT
+            )
+        except NotFound:
+            return None
+        return data, blob.generation
+
+    def download(self, name: str, path: str) -> Optional[int]:
+        blob = self._bucket.get_blob(name, timeout=self.TIMEOUT)
+        if blob is None:
+            return None
+        blob.download_to_filename(
+            path, if_generation_match=blob.generation, timeout=self.TIMEOUT
+        )
+        return blob.generation
+
+    def _put(self, name: str, upload, if_generation_match: Optional[int]) -> int:
+        from google.api_core.exceptions import PreconditionFailed
+
+        blob = self._bucket.blob(name)
+        try:
+            upload(blob, if_generation_match=if_generation_match, timeout=self.TIMEOUT)
+        except PreconditionFailed:
+            raise DatabaseSyncConflictError(f"Generation mismatch writing {name}")
+        return blob.generation
+
+    def write(self, name: str, data: bytes, if_generation_match: Optional[int] = None) -> int:
+        return self._put(
+            name, lambda blob, **kw: blob.upload_from_string(data, **kw), if_generation_match
+        )
+
+    def upload(self, name: str, path: str, if_generation_match: Optional[int] = None) -> int:
+        return self._put(
+            name, lambda blob, **kw: blob.upload_from_filename(path, **kw), if_generation_match
+        )
+
+    def list(self, prefix: str) -> List[str]:
+        return [
+            blob.name for blob in
+            self._client.list_blobs(self.bucket_name, prefix=prefix, timeout=self.TIMEOUT)
+        ]
+
+    def delete(self, name: str) -> None:
+        from google.api_core.exceptions import NotFound
+
+        try:
+            self._bucket.blob(name).delete(timeout=self.TIMEOUT)
+        except NotFound:
+            pass
+
+
+class LocalObjectStore(ObjectStore):
+    """
+    Directory-backed ObjectStore for tests and local development.
+
+    Objects are files under root; generations live in a parallel
+    .generations/ tree. A process-local lock makes precondition checks
+    atomic, which is enough to model concurrent instances in one process.
+    """
+
+    _GEN_DIR = ".generations"
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._last_generation = 0
+
+    def _path(self, name: str) -> Path:
+        return self.root / name
+
+    def _gen_path(self, name: str) -> Path:
+        return self.root / self._GEN_DIR / name
+
+    def _next_generation(self) -> int:
+        self._last_generation = max(time.time_ns(), self._last_generation + 1)
+        return self._last_generation
+
+    def stat(self, name: str) -> Optional[int]:
+        gen_path = self._gen_path(name)
+        if not self._path(name).exists() or not gen_path.exists():
+            return None
+        return int(gen_path.read_text())
+
+    def read(self, name: str) -> Optional[Tuple[bytes, int]]:
+        with self._lock:
+            generation = self.stat(name)
+            if generation is None:
+                return None
+            return self._path(name).read_bytes(), generation
+
+    def download(self, name: str, path: str) -> Optional[int]:
+        with self._lock:
+            generation = self.stat(name)
+            if generation is None:
+                return None
+            shutil.copyfile(self._path(name), path)
+            return generation
+
+    def _put(self, name: str, write_file, if_generation_match: Optional[int]) -> int:
+        with self._lock:
+            current = self.stat(name)
+            if if_generation_match is not None and (current or 0) != if_generation_match:
+                raise DatabaseSyncConflictError(
+                    f"Generation mismatch writing {name}: "
+                    f"expected {if_generation_match}, found {current or 0}"
+                )
+            target = self._path(name)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp = target.with_name(target.name + ".tmp")
+            write_file(tmp)
+            os.replace(tmp, target)
+            generation = self._next_generation()
+            gen_path = self._gen_path(name)
+            gen_path.parent.mkdir(parents=True, exist_ok=True)
+            gen_path.write_text(str(generation))
+            return generation
+
+    def write(self, name: str, data: bytes, if_generation_match: Optional[int] = None) -> int:
+        return self._put(name, lambda tmp: tmp.write_bytes(data), if_generation_match)
+
+    def upload(self, name: str, path: str, if_generation_match: Optional[int] = None) -> int:
+        return self._put(name, lambda tmp: shutil.copyfile(path, tmp), if_generation_match)
+
+    def list(self, prefix: str) -> List[str]:
+        names = []
+        for path in self.root.rglob("*"):
+            name = path.relative_to(self.root).as_posix()
+            if path.is_file() and name.startswith(prefix) and not name.endswith(".tmp"):
+                if not name.startswith(self._GEN_DIR + "/"):
+                    names.append(name)
+        return sorted(names)
+
+    def delete(self, name: str) -> None:
+        with self._lock:
+            for path in (self._path(name), self._gen_path(name)):
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+
+
+def _remove_sidecars(db_path: str) -> None:
+    """Remove -wal/-shm files left by a database file that is being replaced."""
+    for suffix in ("-wal", "-shm"):
+        try:
+            os.unlink(db_path + suffix)
+        except FileNotFoundError:
+            pass
+
+
+class ChangesetSync:
+    """Push/pull ivcrush.db as row-level changesets plus compacted snapshots."""
+
+    def __init__(
+        self,
+        store: ObjectStore,
+        blob_name: str = "ivcrush.db",
+        compact_every: int = COMPACT_EVERY,
+    ):
+        self.store = store
+        self.blob_name = blob_name
+        self.manifest_name = f"{blob_name}.manifest.json"
+        self.changes_prefix = f"{blob_name}.changes/"
+        self.compact_every = compact_every
+
+    # -- remote helpers -------------------------------------------------
+
+    def _change_name(self, seq: int) -> str:
+        return f"{self.changes_prefix}{seq:010d}.json.gz"
+
+    def _remote_seqs(self) -> List[int]:
+        seqs = []
+        for name in self.store.list(self.changes_prefix):
+            stem = name[len(self.changes_prefix):].split(".", 1)[0]
+            if stem.isdigit():
+                seqs.append(int(stem))
+        return sorted(seqs)
+
+    def _read_manifest(self) -> Tuple[Optional[Dict[str, Any]], int]:
+        """(manifest, generation); (None, 0) when no manifest exists."""
+        found = self.store.read(self.manifest_name)
+        if found is None:
+            return None, 0
+        data, generation = found
+        return json.loads(data.decode("utf-8")), generation
+
+    def _write_manifest(self, manifest: Dict[str, Any], if_generation_match: int) -> int:
+        return self.store.write(
+            self.manifest_name,
+            json.dumps(manifest, sort_keys=True).encode("utf-8"),
+            if_generation_match=if_generation_match,
+        )
+
+    def _fetch_changeset(self, seq: int) -> Optional[Dict[str, Any]]:
+        found = self.store.read(self._change_name(seq))
+        if found is None:
+            return None
+        return changesets.decode_changeset(found[0])
+
+    def _apply_remote(self, conn: sqlite3.Connection, after_seq: int, seqs: List[int]) -> Tuple[int, int]:
+        """
+        Apply remote changesets newer than after_seq. Returns (head, rows applied).
+
+        Raises:
+            ChangesetGapError: If a changeset in the run was deleted by a
+                compaction; only the snapshot still has its rows
+        """
+        head = after_seq
+        applied = 0
+        for seq in seqs:
+            if seq <= after_seq:
+                continue
+            changeset = self._fetch_changeset(seq) if seq == head + 1 else None
+            if changeset is None:
+                raise ChangesetGapError(
+                    f"Changeset {head + 1} was compacted away; re-base on the snapshot"
+                )
+            applied += changesets.apply_changeset(conn, changeset)
+            head = seq
+        return head, applied
+
+    # -- pull -----------------------------------------------------------
+
+    def pull(
+        self,
+        db_path: str,
+        before_swap: Optional[Callable[[], None]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Bring the local database up to date with the remote.
+
+        Applies only the missing changesets when the local copy descends from
+        the current snapshot; otherwise downloads the snapshot (quick_check
+        validated) and replays changesets on top of it.
+
+        Args:
+            db_path: Local database path (replaced atomically on a snapshot pull)
+            before_swap: Called just before a snapshot pull replaces db_path,
+                to close connections still open on the old file
+
+        Returns:
+            Summary dict (mode, head, changes applied), or None if the bucket
+            has no database yet.
+        """
+        manifest, manifest_gen = self._read_manifest()
+        snapshot_gen = self.store.stat(self.blob_name)
+        if snapshot_gen is None:
+            log("warn", "No remote database snapshot", blob=self.blob_name)
+            return None
+
+        adopt = manifest is None or manifest.get("snapshot_generation") != snapshot_gen
+        seqs = self._remote_seqs()
+
+        local_state = None
+        if not adopt and os.path.exists(db_path):
+            conn = sqlite3.connect(db_path, timeout=30)
+            try:
+                local_state = changesets.get_state(conn)
+            finally:
+                conn.close()
+
+        if (
+            local_state is not None
+            and local_state["epoch"] == manifest["epoch"]
+            and local_state["head"] >= manifest["snapshot_seq"]
+        ):
+            conn = sqlite3.connect(db_path, timeout=30)
+            try:
+                changesets.install_tracking(conn)
+                head, applied = self._apply_remote(conn, local_state["head"], seqs)
+                changesets.set_state(conn, head=head)
+                conn.commit()
+                log("info", "Database pulled incrementally", head=head, applied=applied)
+                return {"mode": "incremental", "head": head, "applied": applied}
+            except ChangesetGapError as e:
+                # Compacted while we read: the new snapshot has the missing rows
+                conn.rollback()
+                log("info", "Incremental pull hit a compaction, pulling snapshot", detail=str(e))
+            finally:
+                conn.close()
+            manifest, manifest_gen = self._read_manifest()
+            adopt = manifest.get("snapshot_generation") != self.store.stat(self.blob_name)
+            seqs = self._remote_seqs()
+
+        return self._pull_snapshot(db_path, manifest, manifest_gen, adopt, seqs, before_swap)
+
+    def _pull_snapshot(
+        self,
+        db_path: str,
+        manifest: Optional[Dict[str, Any]],
+        manifest_gen: int,
+        adopt: bool,
+        seqs: List[int],
+        before_swap: Optional[Callable[[], None]] = None,
+        pending: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Replace db_path with the remote snapshot plus changesets since it.
+
+        pending: unpushed local changes to re-apply on top and keep pending
+        (push re-basing a copy that fell behind a compaction)
+        """
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = f"{db_path}.{uuid.uuid4().hex[:8]}.tmp"
+        try:
+            snapshot_gen = self.store.download(self.blob_name, tmp_path)
+            if snapshot_gen is None:
+                raise FileNotFoundError(self.blob_name)
+
+            conn = sqlite3.connect(tmp_path, timeout=30)
+            try:
+                # quick_check catches torn/truncated pages in O(N) without
+                # integrity_check's index cross-checks (seconds on a cold start)
+                result = conn.execute("PRAGMA quick_check").fetchone()[0]
+                if result != "ok":
+                    raise DatabaseCorruptedError(f"Database quick check failed: {result}")
+
+                changesets.install_tracking(conn)
+                changesets.clear_changes(conn, sys.maxsize)
+                if adopt:
+                    # Snapshot replaced outside the changeset protocol: it is
+                    # the new base, and older changesets no longer apply.
+                    base_seq = max([manifest["snapshot_seq"] if manifest else 0] + seqs[-1:])
+                    epoch = uuid.uuid4().hex
+                    head, applied = base_seq, 0
+                else:
+                    epoch = manifest["epoch"]
+                    head, applied = self._apply_remote(conn, manifest["snapshot_seq"], seqs)
+                    head = max(head, manifest["snapshot_seq"])
+                if pending is not None:
+                    changesets.restore_pending(conn, pending)
+                changesets.set_state(conn, epoch=epoch, head=head)
+                conn.commit()
+            finally:
+                conn.close()
+
+            if adopt:
+                try:
+                    self._write_manifest(
+                        {"epoch": epoch, "snapshot_generation": snapshot_gen, "snapshot_seq": head},
+                        if_generation_match=manifest_gen,
+                    )
+                    log("warn", "Adopted externally replaced database snapshot",
+                        blob=self.blob_name, head=head)
+                except DatabaseSyncConflictError:
+                    # Another instance adopted it first; our epoch won't match
+                    # and the next pull falls back to a snapshot download.
+                    log("info", "Snapshot adopted concurrently by another instance")
+
+            if before_swap is not None:
+                before_swap()
+            _remove_sidecars(db_path)
+            shutil.move(tmp_path, db_path)
+        finally:
+            if os.path.exists(tmp_path):
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+        log("info", "Database pulled from snapshot",
+            generation=snapshot_gen, head=head, applied=applied)
+        return {"mode": "snapshot", "head": head, "applied": applied}
+
+    # -- push -----------------------------------------------------------
+
+    def push(
+        self,
+        db_path: str,
+        before_swap: Optional[Callable[[], None]] = None,
+    ) -> Optional[int]:
+        """
+        Upload pending local changes as the next changeset.
+
+        If another instance claimed the sequence number first, its changes
+        are applied locally, ours are re-applied on top (last writer wins per
+        row) and the push retries at the next sequence number. If changesets
+        this copy lacks were already compacted away, the copy is first
+        replaced by the snapshot with our changes re-applied on top.
+
+        Args:
+            db_path: Local database path
+            before_swap: Called before a re-base replaces db_path (see pull)
+
+        Returns:
+            The changeset sequence number, or None if nothing was pending.
+
+        Raises:
+            DatabaseSyncConflictError: If no sequence number could be claimed
+                after MAX_PUSH_RETRIES attempts
+        """
+        conn = sqlite3.connect(db_path, timeout=30)
+        try:
+            changesets.install_tracking(conn)
+            changeset, last_seq = changesets.collect_changes(conn)
+            manifest, _ = self._read_manifest()
+            if changeset is None:
+                return None
+            if manifest is None:
+                # Nothing to append to yet: publish the whole database
+                head = self.compact(db_path, conn=conn)
+                changesets.clear_changes(conn, last_seq)
+                conn.commit()
+                return head
+
+            for _attempt in range(MAX_PUSH_RETRIES):
+                # List before reading the manifest: compaction writes the
+                # manifest before it deletes the changesets it folded
+                seqs = self._remote_seqs()
+                manifest, _ = self._read_manifest()
+                state = changesets.get_state(conn)
+                same_epoch = state["epoch"] == manifest["epoch"]
+                remote_head = max([manifest["snapshot_seq"]] + seqs[-1:])
+                if same_epoch and remote_head > state["head"]:
+                    try:
+                        if state["head"] < manifest["snapshot_seq"]:
+                            raise ChangesetGapError(
+                                f"Local head {state['head']} is behind snapshot "
+                                f"{manifest['snapshot_seq']}"
+                            )
+                        # Rebase: their changes, then ours again on top
+                        self._apply_remote(conn, state["head"], seqs)
+                        changesets.apply_changeset(conn, changeset)
+                        changesets.set_state(conn, head=remote_head)
+                        conn.commit()
+                    except ChangesetGapError as e:
+                        conn.rollback()
+                        conn.close()
+                        log("warn", "Local database behind a compaction, re-basing on snapshot",
+                            detail=str(e))
+                        self._rebase_on_snapshot(db_path, changeset, before_swap)
+                        conn = sqlite3.connect(db_path, timeout=30)
+                        changeset, last_seq = changesets.collect_changes(conn)
+                        continue
+                payload = changesets.encode_changeset(changeset)
+                seq = remote_head + 1
+                try:
+                    self.store.write(self._change_name(seq), payload, if_generation_match=0)
+                except DatabaseSyncConflictError:
+                    log("info", "Changeset sequence taken, retrying", seq=seq)
+                    continue
+
+                changesets.clear_changes(conn, last_seq)
+                changesets.set_state(conn, head=seq)
+                conn.commit()
+                log("info", "Changeset pushed", seq=seq,
+                    changes=len(changeset["changes"]), bytes=len(payload))
+
+                if same_epoch and seq - manifest["snapshot_seq"] >= self.compact_every:
+                    try:
+                        self.compact(db_path, conn=conn)
+                    except Exception as e:
+                        log("warn", "Snapshot compaction failed (non-fatal)",
+                            error=type(e).__name__)
+                return seq
+        finally:
+            conn.close()
+
+        raise DatabaseSyncConflictError(
+            f"Could not claim a changeset sequence after {MAX_PUSH_RETRIES} attempts"
+        )
+
+    def _rebase_on_snapshot(
+        self,
+        db_path: str,
+        pending: Dict[str, Any],
+        before_swap: Optional[Callable[[], None]],
+    ) -> None:
+        """Replace db_path with the current snapshot, keeping pending changes."""
+        manifest, manifest_gen = self._read_manifest()
+        adopt = manifest.get("snapshot_generation") != self.store.stat(self.blob_name)
+        self._pull_snapshot(
+            db_path, manifest, manifest_gen, adopt, self._remote_seqs(),
+            before_swap=before_swap, pending=pending,
+        )
+
+    # -- compaction -----------------------------------------------------
+
+    def compact(self, db_path: str, conn: Optional[sqlite3.Connection] = None) -> int:
+        """
+        Upload the local database as the new snapshot and drop folded changesets.
+
+        The local copy must be current (same epoch, all remote changesets
+        applied), which push() guarantees before calling this.
+
+        Returns:
+            The sequence number the snapshot includes
+
+        Raises:
+            ChangesetGapError: If the local copy is behind the current
+                snapshot (its upload would drop the rows it never saw)
+        """
+        own_conn = conn is None
+        if own_conn:
+            conn = sqlite3.connect(db_path, timeout=30)
+        tmp_path = os.path.join(tempfile.gettempdir(), f"ivcrush_snapshot_{uuid.uuid4().hex[:8]}.db")
+        try:
+            changesets.install_tracking(conn)
+            manifest, manifest_gen = self._read_manifest()
+            snapshot_gen = self.store.stat(self.blob_name)
+            state = changesets.get_state(conn)
+            head = state["head"]
+            fresh = manifest is None or manifest.get("snapshot_generation") != snapshot_gen
+            if not fresh and (state["epoch"] != manifest["epoch"] or head < manifest["snapshot_seq"]):
+                raise ChangesetGapError(
+                    f"Local copy (head {head}) is behind snapshot {manifest['snapshot_seq']}; "
+                    f"pull before compacting"
+                )
+            epoch = uuid.uuid4().hex if fresh else manifest["epoch"]
+
+            conn.execute("VACUUM INTO ?", (tmp_path,))
+            snap = sqlite3.connect(tmp_path)
+            try:
+                changesets.clear_changes(snap, sys.maxsize)
+                changesets.set_state(snap, epoch=epoch, head=head)
+                snap.commit()
+            finally:
+                snap.close()
+
+            new_gen = self.store.upload(
+                self.blob_name, tmp_path, if_generation_match=snapshot_gen or 0
+            )
+            self._write_manifest(
+                {"epoch": epoch, "snapshot_generation": new_gen, "snapshot_seq": head},
+                if_generation_match=manifest_gen,
+            )
+            if fresh:
+                changesets.set_state(conn, epoch=epoch)
+                conn.commit()
+
+            for seq in self._remote_seqs():
+                if seq <= head:
+                    self.store.delete(self._change_name(seq))
+            log("info", "Database snapshot compacted", head=head, generation=new_gen)
+            return head
+        finally:
+            if own_conn:
+                conn.close()
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+
+def push_changes(
+    db_path: str,
+    bucket_name: str,
+    blob_name: str = "ivcrush.db",
+    before_swap: Optional[Callable[[], None]] = None,
+) -> bool:
+    """
+    Push pending row changes to GCS. Never raises.
+
+    Replaces whole-file quick_upload() for post-job syncs: only rows written
+    since the last push are uploaded.
+
+    Returns:
+        True if changes were pushed (or none were pending), False on error
+    """
+    try:
+        seq = ChangesetSync(GCSObjectStore(bucket_name), blob_name).push(db_path, before_swap)
+        if seq is not None:
+            log("info", "Database changes synced to GCS", seq=seq)
+        return True
+    except Exception as e:
+        log("warn", "Failed to sync database changes to GCS (non-fatal)",
+            error=type(e).__name__, blob=blob_name)
+        return False
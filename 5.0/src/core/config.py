@@ -58,7 +58,9 @@ class Settings:
         2. SECRETS JSON blob (for Docker/Cloud Run)
         3. GCP Secret Manager (for production fallback)
         """
-        if self._secrets:
+        # Cache empty results too - otherwise every settings access retries
+        # Secret Manager (seconds per call when it's unreachable)
+        if self._secrets is not None:
             return
 
         # Priority 1: Check for individual env vars (local development)
@@ -228,6 +230,16 @@ class Settings:
     def gcs_bucket(self) -> str:
         return os.environ.get('GCS_BUCKET', 'your-gcs-bucket')
 
+    @property
+    def lazy_db_hydration(self) -> bool:
+        """Pull the GCS database in the background instead of blocking startup."""
+        return os.environ.get('LAZY_DB_HYDRATION', 'true').lower() in ('true', '1', 'yes')
+
+    @property
+    def hedge_tradier_requests(self) -> bool:
+        """Re-send Tradier GETs still pending at p95 (see src.core.hedging)."""
+        return os.environ.get('HEDGE_TRADIER_REQUESTS', 'false').lower() in ('true', '1', 'yes')
+
     @property
     def grafana_graphite_url(self) -> str:
         """Grafana Cloud Graphite metrics endpoint."""
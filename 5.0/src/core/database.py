@@ -5,8 +5,6 @@ CRITICAL: Uses GCS object generation numbers for optimistic locking.
 This prevents race conditions when multiple Cloud Run instances try to write.
 """
 
-from google.cloud import storage
-from google.api_core.exceptions import PreconditionFailed
 import sqlite3
 import tempfile
 import shutil
@@ -17,6 +15,19 @@ from pathlib import Path
 from .logging import log
 
 
+def _gcs():
+    """Import google.cloud.storage on first use (it adds ~0.3s to cold start)."""
+    from google.cloud import storage
+    return storage
+
+
+def __getattr__(name: str):
+    # Keeps `src.core.database.storage` resolvable (e.g. for patching)
+    if name == "storage":
+        return _gcs()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 class DatabaseCorruptedError(Exception):
     """Raised when database integrity check fails."""
     pass
@@ -41,7 +52,7 @@ class DatabaseSync:
         instance_id = str(uuid.uuid4())[:8]
         self.local_path = Path(tempfile.gettempdir()) / f"ivcrush_{instance_id}.db"
         self._generation: Optional[int] = None
-        self._client = storage.Client()
+        self._client = _gcs().Client()
 
     def download(self) -> str:
         """
@@ -175,10 +186,11 @@ class DatabaseSync:
             log("info", "Database uploaded", generation=self._generation)
             return True
 
-        except PreconditionFailed:
-            log("error", "Database upload conflict - another instance wrote first, local changes may be lost")
-            raise DatabaseSyncConflictError("Upload conflict - another instance modified the database")
         except Exception as e:
+            from google.api_core.exceptions import PreconditionFailed
+            if isinstance(e, PreconditionFailed):
+                log("error", "Database upload conflict - another instance wrote first, local changes may be lost")
+                raise DatabaseSyncConflictError("Upload conflict - another instance modified the database")
             error_msg = str(e).lower()
             if 'forbidden' in error_msg or '403' in error_msg or 'unauthorized' in error_msg or '401' in error_msg:
                 log("critical", "GCS authentication failed during upload",
@@ -267,7 +279,7 @@ def quick_upload(local_path: str, bucket_name: str, blob_name: str = "ivcrush.db
         finally:
             conn.close()
 
-        client = storage.Client()
+        client = _gcs().Client()
         bucket = client.bucket(bucket_name)
         blob = bucket.blob(blob_name)
         blob.upload_from_filename(local_path, timeout=60)
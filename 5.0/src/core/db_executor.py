@@ -0,0 +1,151 @@
+"""
+Dedicated thread pool for blocking SQLite work.
+
+Repositories and JobManager use synchronous sqlite3. Calling them directly
+from FastAPI routes or job handlers blocks the event loop for the duration of
+the query (or a WAL checkpoint, or JobManager's lock-retry backoff), stalling
+every concurrent request. run_db() moves that work onto a small, bounded
+executor so the loop keeps serving while SQLite is busy.
+
+The executor is separate from asyncio's default executor (used for GCS
+uploads and other slow I/O) so a long upload can't starve DB calls, and it is
+kept smaller than the repository connection pool so workers never queue on
+pool checkout.
+
+Example Usage:
+    moves = await run_db(repo.get_moves, "AAPL")
+    await run_db(manager.record_status, job, "success")
+"""
+
+import asyncio
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Worker threads for DB calls. Each worker holds at most one pooled
+# connection, so this must stay below ConnectionPool.max_connections (15).
+DB_EXECUTOR_WORKERS = 4
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+class _ExecutorStats:
+    """Thread-safe counters for queue depth and wait time."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.in_flight_max = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.run_max = 0.0
+
+    def submitted(self) -> None:
+        with self._lock:
+            self.in_flight += 1
+            if self.in_flight > self.in_flight_max:
+                self.in_flight_max = self.in_flight
+
+    def finished(self, wait_s: float, run_s: float, failed: bool) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            self.calls += 1
+            if failed:
+                self.errors += 1
+            self.wait_total += wait_s
+            self.wait_max = max(self.wait_max, wait_s)
+            self.run_max = max(self.run_max, run_s)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            avg = self.wait_total / self.calls if self.calls else 0.0
+            return {
+                "workers": DB_EXECUTOR_WORKERS,
+                "calls": self.calls,
+                "errors": self.errors,
+                "in_flight": self.in_flight,
+                "in_flight_max": self.in_flight_max,
+                "queue_wait_ms_avg": round(avg * 1000, 3),
+                "queue_wait_ms_max": round(self.wait_max * 1000, 3),
+                "run_ms_max": round(self.run_max * 1000, 3),
+            }
+
+
+_stats = _ExecutorStats()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Create the executor on first use (and again after shutdown())."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=DB_EXECUTOR_WORKERS,
+                    thread_name_prefix="db",
+                )
+    return _executor
+
+
+async def run_db(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run a blocking DB call on the DB executor and await its result.
+
+    Return values and exceptions (e.g. sqlite3.Error) propagate unchanged,
+    so callers keep their existing error handling.
+
+    Args:
+        func: Synchronous callable (repository method, JobManager method, ...)
+        *args, **kwargs: Passed through to func
+
+    Returns:
+        Whatever func returns
+    """
+    loop = asyncio.get_running_loop()
+    submitted_at = time.perf_counter()
+    call = functools.partial(func, *args, **kwargs)
+
+    def _timed_call():
+        started_at = time.perf_counter()
+        failed = False
+        try:
+            return call()
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            _stats.finished(
+                wait_s=started_at - submitted_at,
+                run_s=time.perf_counter() - started_at,
+                failed=failed,
+            )
+
+    _stats.submitted()
+    try:
+        future = loop.run_in_executor(_get_executor(), _timed_call)
+    except RuntimeError:
+        # Executor shut down - undo the in-flight count before re-raising
+        _stats.finished(0.0, 0.0, failed=True)
+        raise
+    return await future
+
+
+def executor_stats() -> Dict[str, Any]:
+    """Current DB executor counters (for /api/health and metrics)."""
+    return _stats.snapshot()
+
+
+def shutdown(wait: bool = True) -> None:
+    """Shut down the DB executor. Called from the app lifespan on exit."""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=wait)
+            _executor = None
@@ -0,0 +1,45 @@
+"""
+Process-wide hedge policies for idempotent provider GETs.
+
+The policy itself lives in common.hedging (shared with 2.0's async Tradier
+client): a request that has not answered by the provider's observed p95
+latency is sent a second time, and whichever copy answers first wins.
+This module keeps one policy per provider so the latency history is shared
+by every client in the process, and publishes hedge counts as
+ivcrush.hedge.sent / ivcrush.hedge.won metrics.
+
+Only use for idempotent requests: both copies may reach the provider.
+
+Example Usage:
+    policy = get_hedge_policy("tradier")
+    response = await policy.run(lambda token: client.get(url), acquire=bucket.acquire)
+"""
+
+from typing import Any, Dict
+
+from src.core import metrics
+
+from common.hedging import HEDGE_BUDGET, HedgePolicy  # noqa: F401 (re-exported)
+
+_policies: Dict[str, HedgePolicy] = {}
+
+
+def get_hedge_policy(provider: str) -> HedgePolicy:
+    """Process-wide hedge policy for a provider."""
+    policy = _policies.get(provider)
+    if policy is None:
+        policy = _policies[provider] = HedgePolicy(
+            provider,
+            on_event=lambda event: metrics.count(f"ivcrush.hedge.{event}", {"provider": provider}),
+        )
+    return policy
+
+
+def hedge_stats() -> Dict[str, Dict[str, Any]]:
+    """Stats for every policy created so far (for /api/health)."""
+    return {name: policy.stats() for name, policy in sorted(_policies.items())}
+
+
+def reset_hedge_policies() -> None:
+    """Drop all policies so latency history starts empty (tests)."""
+    _policies.clear()
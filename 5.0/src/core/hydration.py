@@ -0,0 +1,178 @@
+"""
+Background database hydration for fast Cloud Run cold starts.
+
+Pulling ivcrush.db from GCS at startup used to block the lifespan, so
+Cloud Run could not route even a health probe to the instance until the
+download and integrity check finished. With lazy hydration the lifespan
+starts the pull as a background task and returns immediately:
+
+- GET / answers straight away and reports the hydration state.
+- Every other request waits (up to HYDRATION_WAIT_S) for the pull to finish
+  before touching the database, so nothing reads the bundled image DB and
+  then has the file swapped underneath it. A request still waiting after
+  that gets a 503 with Retry-After rather than the bundled DB.
+- Connection pools are closed just before a snapshot pull replaces the file
+  (before_swap), so no pooled connection stays open on the old one; on_ready
+  runs once the hydrated file is in place.
+
+A failed pull falls back to the bundled DB, same as the eager path.
+
+Example Usage:
+    start_hydration(settings.DB_PATH, pull=ChangesetSync(store).pull,
+                    before_swap=cleanup_all_pools)
+    ...
+    await wait_for_database()
+"""
+
+import asyncio
+import time
+from typing import Any, Callable, Dict, Optional
+
+from src.core.logging import log
+from src.core import metrics
+
+# Longest a request waits for hydration before it is answered with a 503
+HYDRATION_WAIT_S = 60
+
+
+class DatabaseHydrator:
+    """Runs a blocking DB pull off the event loop and tracks its state."""
+
+    def __init__(
+        self,
+        db_path: str,
+        pull: Callable[..., Optional[Dict[str, Any]]],
+        on_ready: Optional[Callable[[], None]] = None,
+        before_swap: Optional[Callable[[], None]] = None,
+    ):
+        self.db_path = db_path
+        self._pull = pull
+        self._on_ready = on_ready
+        self._before_swap = before_swap
+        self.state = "pending"
+        self.error: Optional[str] = None
+        self.result: Optional[Dict[str, Any]] = None
+        self.duration_ms: Optional[float] = None
+        self._done = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the pull on the default executor."""
+        if self._task is None:
+            self.state = "hydrating"
+            self._task = asyncio.get_running_loop().create_task(
+                self._run(), name="db-hydration"
+            )
+
+    def _pull_and_prepare(self) -> Optional[Dict[str, Any]]:
+        if self._before_swap is not None:
+            result = self._pull(self.db_path, before_swap=self._before_swap)
+        else:
+            result = self._pull(self.db_path)
+        if self._on_ready is not None:
+            self._on_ready()
+        return result
+
+    async def _run(self) -> None:
+        start = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(None, self._pull_and_prepare)
+            self.result = result if isinstance(result, dict) else None
+            self.state = "ready"
+        except Exception as e:
+            self.state = "failed"
+            self.error = type(e).__name__
+            log("warn", "Failed to hydrate DB from GCS, using bundled DB",
+                error=type(e).__name__, detail=str(e)[:100])
+        finally:
+            self.duration_ms = round((time.perf_counter() - start) * 1000, 1)
+            self._done.set()
+            metrics.gauge("ivcrush.startup.hydration_ms", self.duration_ms,
+                          {"state": self.state})
+            log("info", "Database hydration finished",
+                state=self.state, duration_ms=self.duration_ms, **(self.result or {}))
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    async def wait(self, timeout: float = HYDRATION_WAIT_S) -> bool:
+        """Wait for the pull to finish. Returns False on timeout."""
+        if self._done.is_set():
+            return True
+        try:
+            await asyncio.wait_for(self._done.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def cancel(self) -> None:
+        """Cancel a pull still in flight (shutdown)."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    def status(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {"state": self.state}
+        if self.duration_ms is not None:
+            data["duration_ms"] = self.duration_ms
+        if self.result:
+            data.update(self.result)
+        if self.error:
+            data["error"] = self.error
+        return data
+
+
+# Process-wide hydrator, created by the app lifespan in lazy mode
+_hydrator: Optional[DatabaseHydrator] = None
+
+
+def get_hydrator() -> Optional[DatabaseHydrator]:
+    """The current hydrator, or None when the DB was loaded eagerly."""
+    return _hydrator
+
+
+def start_hydration(
+    db_path: str,
+    pull: Callable[..., Optional[Dict[str, Any]]],
+    on_ready: Optional[Callable[[], None]] = None,
+    before_swap: Optional[Callable[[], None]] = None,
+) -> DatabaseHydrator:
+    """Create and start the process-wide hydrator."""
+    global _hydrator
+    _hydrator = DatabaseHydrator(db_path, pull, on_ready, before_swap)
+    _hydrator.start()
+    return _hydrator
+
+
+async def stop_hydration() -> None:
+    """Cancel any in-flight pull and forget the hydrator."""
+    global _hydrator
+    if _hydrator is not None:
+        await _hydrator.cancel()
+        _hydrator = None
+
+
+def hydration_status() -> Dict[str, Any]:
+    """State for health endpoints ("eager" when no background pull was used)."""
+    return _hydrator.status() if _hydrator is not None else {"state": "eager"}
+
+
+async def wait_for_database(timeout: float = HYDRATION_WAIT_S) -> bool:
+    """
+    Block until the database is hydrated (no-op in eager mode).
+
+    Returns:
+        True if the DB is ready (or failed and fell back to the bundled copy),
+        False if the wait timed out (the middleware then answers 503).
+    """
+    if _hydrator is None or _hydrator.done:
+        return True
+    ready = await _hydrator.wait(timeout)
+    if not ready:
+        log("warn", "Timed out waiting for database hydration", timeout_s=timeout)
+    return ready
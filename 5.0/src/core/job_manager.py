@@ -3,13 +3,17 @@ Job dispatcher and dependency manager.
 
 Single dispatcher pattern: Cloud Scheduler calls /dispatch every 15 min,
 and this module routes to the correct job based on current time.
+get_due_jobs() widens the tick to everything that can run now (the
+scheduled job, never-attempted dependencies, pulled-forward maintenance
+jobs); src/jobs/dag.py runs that set as a dependency graph.
 """
 
 import sqlite3
-from typing import Optional, List, Dict
+from typing import Any, Optional, List, Dict
 
 from .config import now_et, today_et, settings
 from .logging import log
+from common.db import connect
 
 # Weekday schedule (Mon-Fri) - all times ET
 WEEKDAY_SCHEDULE = {
@@ -47,6 +51,26 @@ JOB_DEPENDENCIES: Dict[str, List[str]] = {
 }
 
 
+# Ordering-only edges for DAG runs (job -> jobs it must wait for when they
+# are in the same run, whether or not they succeed). calendar-sync writes
+# ivcrush.db, which weekly-backup copies file-by-file.
+RUN_AFTER: Dict[str, List[str]] = {
+    "calendar-sync": ["weekly-backup"],
+}
+
+# Maintenance jobs with no market-time constraint: a DAG run starts them
+# with the first due job of their day instead of waiting for their own slot
+PULL_FORWARD_JOBS = {"weekly-cleanup", "calendar-sync"}
+
+# Stage timing columns added to job_status after the table first shipped
+_TIMING_COLUMNS = {
+    "run_id": "TEXT",
+    "started_at": "TEXT",
+    "wait_ms": "INTEGER",
+    "duration_ms": "INTEGER",
+}
+
+
 def _validate_no_cycles():
     """Validate that job dependencies form a DAG (no circular dependencies)."""
     def find_cycle(job: str, visited: set, rec_stack: set, path: list) -> list:
@@ -55,7 +79,7 @@ def _validate_no_cycles():
         rec_stack.add(job)
         path.append(job)
 
-        for dep in JOB_DEPENDENCIES.get(job, []):
+        for dep in JOB_DEPENDENCIES.get(job, []) + RUN_AFTER.get(job, []):
             if dep not in visited:
                 cycle = find_cycle(dep, visited, rec_stack, path)
                 if cycle:
@@ -69,7 +93,7 @@ def _validate_no_cycles():
         rec_stack.remove(job)
         return []
 
-    for job in JOB_DEPENDENCIES:
+    for job in {**JOB_DEPENDENCIES, **RUN_AFTER}:
         cycle = find_cycle(job, set(), set(), [])
         if cycle:
             cycle_path = " -> ".join(cycle)
@@ -106,6 +130,15 @@ def get_scheduled_job(
         return WEEKDAY_SCHEDULE.get(time_str)
 
 
+def get_day_schedule(day_of_week: int) -> Dict[str, str]:
+    """Schedule (HH:MM -> job) for a day of week (0=Mon, 5=Sat, 6=Sun)."""
+    if day_of_week == 5:
+        return SATURDAY_SCHEDULE
+    if day_of_week == 6:
+        return SUNDAY_SCHEDULE
+    return WEEKDAY_SCHEDULE
+
+
 class JobManager:
     """Manages job dispatch and dependency checking with persistent storage."""
 
@@ -115,9 +148,8 @@ class JobManager:
 
     def _init_db(self):
         """Initialize job_status table."""
-        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn = connect(self.db_path, timeout=30)
         try:
-            conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS job_status (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -132,6 +164,10 @@ class JobManager:
                 CREATE INDEX IF NOT EXISTS idx_job_status_date
                 ON job_status(date)
             """)
+            existing = {row[1] for row in conn.execute("PRAGMA table_info(job_status)")}
+            for column, column_type in _TIMING_COLUMNS.items():
+                if column not in existing:
+                    conn.execute(f"ALTER TABLE job_status ADD COLUMN {column} {column_type}")
             conn.commit()
         finally:
             conn.close()
@@ -142,7 +178,7 @@ class JobManager:
 
     def _get_status(self, date: str, job_name: str) -> str:
         """Get job status from database."""
-        conn = sqlite3.connect(self.db_path)
+        conn = connect(self.db_path)
         try:
             cursor = conn.execute(
                 "SELECT status FROM job_status WHERE date = ? AND job_name = ?",
@@ -177,9 +213,17 @@ class JobManager:
 
         return True, ""
 
-    def record_status(self, job_name: str, status: str):
+    def record_status(
+        self, job_name: str, status: str, timing: Optional[Dict[str, Any]] = None
+    ):
         """Record job completion status to persistent storage.
 
+        Args:
+            job_name: Job name
+            status: "success" or "failed"
+            timing: Optional stage timing from a DAG run (run_id, started_at,
+                wait_ms, duration_ms); cleared when omitted
+
         Raises:
             sqlite3.Error: On database errors (don't swallow - caller should handle)
         """
@@ -187,20 +231,29 @@ class JobManager:
 
         today = today_et()
         timestamp = now_et().isoformat()
+        timing = timing or {}
+        timing_values = tuple(timing.get(column) for column in _TIMING_COLUMNS)
 
         # SQLITE_LOCKED (same-process contention) bypasses timeout=30 and fires
         # immediately, so we retry explicitly with backoff.
         last_err: Exception = RuntimeError("unreachable")
         for attempt in range(5):
-            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn = connect(self.db_path, timeout=30)
             try:
                 conn.execute("""
-                    INSERT INTO job_status (date, job_name, status, updated_at)
-                    VALUES (?, ?, ?, ?)
+                    INSERT INTO job_status (
+                        date, job_name, status, updated_at,
+                        run_id, started_at, wait_ms, duration_ms
+                    )
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
                     ON CONFLICT(date, job_name) DO UPDATE SET
                         status = excluded.status,
-                        updated_at = excluded.updated_at
-                """, (today, job_name, status, timestamp))
+                        updated_at = excluded.updated_at,
+                        run_id = excluded.run_id,
+                        started_at = excluded.started_at,
+                        wait_ms = excluded.wait_ms,
+                        duration_ms = excluded.duration_ms
+                """, (today, job_name, status, timestamp, *timing_values))
                 conn.commit()
                 log("info", "Job status recorded", job=job_name, status=status)
                 return
@@ -225,7 +278,7 @@ class JobManager:
         if date is None:
             date = today_et()
 
-        conn = sqlite3.connect(self.db_path)
+        conn = connect(self.db_path)
         try:
             cursor = conn.execute(
                 "SELECT job_name, status FROM job_status WHERE date = ?",
@@ -235,6 +288,66 @@ class JobManager:
         finally:
             conn.close()
 
+    def get_stage_timings(self, date: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """Per-job stage timings recorded by DAG runs for a given day."""
+        if date is None:
+            date = today_et()
+
+        conn = connect(self.db_path)
+        try:
+            cursor = conn.execute(
+                "SELECT job_name, status, run_id, started_at, wait_ms, duration_ms "
+                "FROM job_status WHERE date = ? AND run_id IS NOT NULL",
+                (date,)
+            )
+            return {
+                row[0]: {
+                    "status": row[1],
+                    "run_id": row[2],
+                    "started_at": row[3],
+                    "wait_ms": row[4],
+                    "duration_ms": row[5],
+                }
+                for row in cursor.fetchall()
+            }
+        finally:
+            conn.close()
+
+    def get_due_jobs(self) -> List[str]:
+        """
+        Jobs a dispatch tick should run now, in schedule order.
+
+        The job scheduled for this tick (unless it already succeeded today),
+        plus its dependencies that were never attempted today (e.g. after a
+        missed tick), plus PULL_FORWARD_JOBS later in the same day. Failed
+        jobs are not retried here; their dependents are skipped as before.
+        """
+        current = self.get_current_job()
+        if current is None:
+            return []
+
+        statuses = self.get_day_summary()
+        due: List[str] = []
+        if statuses.get(current) != "success":
+            due.append(current)
+
+        for job in get_day_schedule(now_et().weekday()).values():
+            if job in PULL_FORWARD_JOBS and job not in statuses and job not in due:
+                due.append(job)
+
+        pending = list(due)
+        while pending:
+            for dep in JOB_DEPENDENCIES.get(pending.pop(), []):
+                if dep not in statuses and dep not in due:
+                    due.append(dep)
+                    pending.append(dep)
+
+        order = {job: i for i, job in enumerate(
+            job for schedule in (WEEKDAY_SCHEDULE, SATURDAY_SCHEDULE, SUNDAY_SCHEDULE)
+            for _, job in sorted(schedule.items())
+        )}
+        return sorted(due, key=lambda job: order.get(job, len(order)))
+
     def get_current_job(self) -> Optional[str]:
         """
         Get job to run based on current time.
@@ -0,0 +1,336 @@
+"""
+Event loop health monitoring.
+
+Two complementary instruments:
+
+1. Slow callback detector: wraps asyncio.Handle._run so every callback the
+   loop executes is timed. Any callback that holds the loop longer than the
+   threshold (a sync DB call, CPU-heavy formatting, a blocking HTTP client)
+   is logged with the coroutine or function name. Only the stdlib asyncio
+   loop is instrumented; uvloop handles are implemented in C.
+
+2. LoopLagMonitor: a heartbeat task measures scheduling delay (how late
+   asyncio.sleep() wakes up) and a watchdog thread samples the loop thread's
+   stack while the loop is stalled. This works under any loop implementation
+   and shows *where* the loop was blocked, not just that it was.
+
+Both feed a bounded in-memory history served by GET /api/debug/loop and
+periodic ivcrush.loop.* gauges.
+
+Example Usage:
+    install_slow_callback_detector(threshold_ms=100)
+    monitor = LoopLagMonitor()
+    monitor.start()
+    ...
+    await monitor.stop()
+"""
+
+import asyncio
+import collections
+import sys
+import threading
+import time
+import traceback
+from typing import Any, Deque, Dict, List, Optional
+
+from src.core.logging import log
+from src.core import metrics
+
+# Callbacks holding the loop longer than this are reported
+SLOW_CALLBACK_THRESHOLD_MS = 100
+
+# Heartbeat interval and stall threshold for the lag monitor
+LAG_SAMPLE_INTERVAL_S = 0.25
+STALL_THRESHOLD_MS = 200
+WATCHDOG_POLL_S = 0.05
+
+# Lag samples kept for percentiles (~1 minute at the default interval)
+LAG_WINDOW = 240
+# Recent slow callbacks / stalls kept for the debug endpoint
+EVENT_HISTORY = 50
+# Innermost frames kept per stack sample
+STACK_DEPTH = 15
+# Push lag gauges this often (seconds)
+METRICS_INTERVAL_S = 30
+
+_original_handle_run = None
+_threshold_s = SLOW_CALLBACK_THRESHOLD_MS / 1000
+_slow_count = 0
+_recent_slow: Deque[Dict[str, Any]] = collections.deque(maxlen=EVENT_HISTORY)
+
+
+def _describe_callback(handle: asyncio.Handle) -> str:
+    """Human-readable name for the code a handle runs."""
+    callback = getattr(handle, "_callback", None)
+    owner = getattr(callback, "__self__", None)
+    if isinstance(owner, asyncio.Task):
+        coro = owner.get_coro()
+        name = getattr(coro, "__qualname__", None) or repr(coro)
+        return f"task {owner.get_name()} ({name})"
+    name = getattr(callback, "__qualname__", None)
+    if name:
+        module = getattr(callback, "__module__", None)
+        return f"{module}.{name}" if module else name
+    return repr(handle)[:200]
+
+
+def _timed_handle_run(self: asyncio.Handle) -> None:
+    global _slow_count
+    start = time.perf_counter()
+    try:
+        _original_handle_run(self)
+    finally:
+        elapsed = time.perf_counter() - start
+        if elapsed >= _threshold_s:
+            _slow_count += 1
+            callback = _describe_callback(self)
+            duration_ms = round(elapsed * 1000, 1)
+            _recent_slow.append({
+                "at": time.time(),
+                "duration_ms": duration_ms,
+                "callback": callback,
+            })
+            log("warn", "Slow event loop callback",
+                duration_ms=duration_ms, callback=callback)
+            metrics.count("ivcrush.loop.slow_callback")
+
+
+def install_slow_callback_detector(threshold_ms: Optional[float] = None) -> bool:
+    """
+    Start timing event loop callbacks. Safe to call more than once.
+
+    Args:
+        threshold_ms: Report callbacks slower than this (default 100ms)
+
+    Returns:
+        True if the detector is active, False if the running loop is not
+        the stdlib asyncio loop (e.g. uvloop).
+    """
+    global _original_handle_run, _threshold_s
+
+    if threshold_ms is not None:
+        _threshold_s = threshold_ms / 1000
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    if loop is not None and not isinstance(loop, asyncio.BaseEventLoop):
+        log("info", "Slow callback detector unavailable for event loop",
+            loop=type(loop).__name__)
+        return False
+
+    if _original_handle_run is None:
+        _original_handle_run = asyncio.Handle._run
+        asyncio.Handle._run = _timed_handle_run
+        log("info", "Slow callback detector installed",
+            threshold_ms=round(_threshold_s * 1000))
+    return True
+
+
+def uninstall_slow_callback_detector() -> None:
+    """Restore the original Handle._run (used on shutdown and in tests)."""
+    global _original_handle_run
+    if _original_handle_run is not None:
+        asyncio.Handle._run = _original_handle_run
+        _original_handle_run = None
+
+
+def slow_callback_count() -> int:
+    """Number of slow callbacks seen since process start."""
+    return _slow_count
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(pct / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+class LoopLagMonitor:
+    """
+    Heartbeat-based event loop lag monitor with stall stack sampling.
+
+    The heartbeat task sleeps for `interval` seconds and records how much
+    later than requested it woke up. A daemon watchdog thread watches the
+    heartbeat; when it falls more than `stall_threshold_ms` behind, the
+    watchdog captures the loop thread's current stack (what is blocking it)
+    and records the stall once the loop recovers.
+    """
+
+    def __init__(
+        self,
+        interval: float = LAG_SAMPLE_INTERVAL_S,
+        stall_threshold_ms: float = STALL_THRESHOLD_MS,
+        metrics_interval: float = METRICS_INTERVAL_S,
+    ):
+        self.interval = interval
+        self.stall_threshold_s = stall_threshold_ms / 1000
+        self.metrics_interval = metrics_interval
+
+        self._lags: Deque[float] = collections.deque(maxlen=LAG_WINDOW)
+        self._stalls: Deque[Dict[str, Any]] = collections.deque(maxlen=EVENT_HISTORY)
+        self._stall_count = 0
+        self._max_lag = 0.0
+
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._loop_thread_id: Optional[int] = None
+        self._last_beat = time.monotonic()
+        # Stall currently being observed by the watchdog (None when healthy)
+        self._pending_stall: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the heartbeat task and watchdog thread on the running loop."""
+        if self.running:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop.clear()
+        self._task = asyncio.get_running_loop().create_task(
+            self._heartbeat(), name="loop-lag-monitor"
+        )
+        self._watchdog = threading.Thread(
+            target=self._watch, name="loop-watchdog", daemon=True
+        )
+        self._watchdog.start()
+        log("info", "Event loop lag monitor started",
+            interval_ms=round(self.interval * 1000),
+            stall_threshold_ms=round(self.stall_threshold_s * 1000))
+
+    async def stop(self) -> None:
+        """Stop the heartbeat and watchdog."""
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=1)
+            self._watchdog = None
+
+    async def _heartbeat(self) -> None:
+        last_push = time.monotonic()
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            lag = max(0.0, now - expected)
+            self._record_lag(lag, now)
+
+            if now - last_push >= self.metrics_interval:
+                last_push = now
+                self._push_metrics()
+
+    def _record_lag(self, lag: float, now: float) -> None:
+        with self._lock:
+            self._last_beat = now
+            self._lags.append(lag)
+            if lag > self._max_lag:
+                self._max_lag = lag
+            stall = self._pending_stall
+            self._pending_stall = None
+
+        if stall is not None:
+            stall["duration_ms"] = round(lag * 1000, 1)
+            self._stalls.append(stall)
+            log("warn", "Event loop stalled",
+                duration_ms=stall["duration_ms"],
+                where=stall["stack"][-1] if stall["stack"] else "unknown")
+            metrics.count("ivcrush.loop.stall")
+
+    def _watch(self) -> None:
+        """Watchdog thread: sample the loop thread's stack during stalls."""
+        while not self._stop.wait(WATCHDOG_POLL_S):
+            with self._lock:
+                overdue = time.monotonic() - self._last_beat - self.interval
+                if overdue < self.stall_threshold_s or self._pending_stall is not None:
+                    continue
+                self._stall_count += 1
+                self._pending_stall = {
+                    "at": time.time(),
+                    "stack": self._sample_stack(),
+                }
+
+    def _sample_stack(self) -> List[str]:
+        """Innermost frames of the loop thread, formatted as 'file:line in func'."""
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is None:
+            return []
+        summary = traceback.extract_stack(frame)[-STACK_DEPTH:]
+        return [f"{f.filename}:{f.lineno} in {f.name}" for f in summary]
+
+    def _push_metrics(self) -> None:
+        stats = self.lag_stats()
+        metrics.gauge("ivcrush.loop.lag_ms_p50", stats["lag_ms_p50"])
+        metrics.gauge("ivcrush.loop.lag_ms_p99", stats["lag_ms_p99"])
+        metrics.gauge("ivcrush.loop.lag_ms_max", stats["lag_ms_window_max"])
+        metrics.gauge("ivcrush.loop.stalls", self._stall_count)
+        metrics.gauge("ivcrush.loop.slow_callbacks", _slow_count)
+
+    def lag_stats(self) -> Dict[str, Any]:
+        """Lag percentiles over the recent window (milliseconds)."""
+        with self._lock:
+            last = self._lags[-1] if self._lags else 0.0
+            lags = sorted(self._lags)
+            max_lag = self._max_lag
+        return {
+            "samples": len(lags),
+            "lag_ms_last": round(last * 1000, 2),
+            "lag_ms_p50": round(_percentile(lags, 50) * 1000, 2),
+            "lag_ms_p99": round(_percentile(lags, 99) * 1000, 2),
+            "lag_ms_window_max": round((lags[-1] if lags else 0.0) * 1000, 2),
+            "lag_ms_max": round(max_lag * 1000, 2),
+        }
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Full monitor state for the debug endpoint."""
+        return {
+            "running": self.running,
+            "interval_ms": round(self.interval * 1000),
+            "stall_threshold_ms": round(self.stall_threshold_s * 1000),
+            "lag": self.lag_stats(),
+            "stalls": self._stall_count,
+            "recent_stalls": list(self._stalls),
+            "slow_callback_detector": _original_handle_run is not None,
+            "slow_callback_threshold_ms": round(_threshold_s * 1000),
+            "slow_callbacks": _slow_count,
+            "recent_slow_callbacks": list(_recent_slow),
+        }
+
+
+# Process-wide monitor, started from the app lifespan
+_monitor: Optional[LoopLagMonitor] = None
+
+
+def get_monitor() -> Optional[LoopLagMonitor]:
+    """The running lag monitor, if one has been started."""
+    return _monitor
+
+
+def start_monitor(**kwargs: Any) -> LoopLagMonitor:
+    """Create and start the process-wide lag monitor."""
+    global _monitor
+    if _monitor is None or not _monitor.running:
+        _monitor = LoopLagMonitor(**kwargs)
+        _monitor.start()
+    return _monitor
+
+
+async def stop_monitor() -> None:
+    """Stop the process-wide lag monitor."""
+    global _monitor
+    if _monitor is not None:
+        await _monitor.stop()
+        _monitor = None
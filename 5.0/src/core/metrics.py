@@ -268,11 +268,36 @@ def budget_update(remaining_calls: int, remaining_dollars: float) -> None:
     gauge("ivcrush.budget.dollars_remaining", remaining_dollars)
 
 
+def prime_budget_update(remaining_calls: int, remaining_dollars: float) -> None:
+    """Record what a sentiment prime run left of its own per-run limits."""
+    gauge("ivcrush.prime.calls_remaining", remaining_calls)
+    gauge("ivcrush.prime.dollars_remaining", remaining_dollars)
+
+
 def tickers_qualified(count_val: int) -> None:
     """Record number of qualified tickers from a scan."""
     gauge("ivcrush.tickers.qualified", count_val)
 
 
+def db_pool_stats(db_name: str, stats: dict) -> None:
+    """Record SQLite connection pool checkout and wait-time metrics."""
+    tags = {"db": db_name}
+    gauge("ivcrush.db.pool.checkouts", stats.get("checkouts", 0), tags)
+    gauge("ivcrush.db.pool.timeouts", stats.get("checkout_timeouts", 0), tags)
+    gauge("ivcrush.db.pool.connections", stats.get("total_connections", 0), tags)
+    gauge("ivcrush.db.pool.wait_ms_avg", stats.get("wait_ms_avg", 0.0), tags)
+    gauge("ivcrush.db.pool.wait_ms_max", stats.get("wait_ms_max", 0.0), tags)
+
+
+def db_executor_stats(stats: dict) -> None:
+    """Record DB executor queue depth and wait-time metrics."""
+    gauge("ivcrush.db.executor.in_flight", stats.get("in_flight", 0))
+    gauge("ivcrush.db.executor.in_flight_max", stats.get("in_flight_max", 0))
+    gauge("ivcrush.db.executor.queue_wait_ms_avg", stats.get("queue_wait_ms_avg", 0.0))
+    gauge("ivcrush.db.executor.queue_wait_ms_max", stats.get("queue_wait_ms_max", 0.0))
+    gauge("ivcrush.db.executor.run_ms_max", stats.get("run_ms_max", 0.0))
+
+
 def shutdown() -> None:
     """
     Shutdown the metrics thread pool.
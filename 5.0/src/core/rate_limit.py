@@ -0,0 +1,245 @@
+"""
+Async token-bucket rate limiting for external APIs.
+
+Every integration client takes a token from its provider's bucket before
+each HTTP attempt, so concurrent jobs and API requests share one budget per
+provider instead of each tracking its own calls. A bucket refills
+continuously at the sustained rate and holds at most `burst` tokens: short
+bursts go out immediately, long runs settle at the provider's limit.
+
+Waiters are served in arrival order: the bucket's lock is held while a
+caller sleeps for its tokens, and asyncio.Lock wakes waiters FIFO, so a
+long job can't starve an interactive request that arrived later.
+
+When a provider answers 429 anyway (limit shared with another process, or
+tighter than documented), the client calls penalize() with the Retry-After
+value. The bucket then holds every caller until the window passes and
+restarts from zero tokens rather than a full burst.
+
+Example Usage:
+    bucket = get_bucket("tradier")
+    await bucket.acquire()
+    response = await client.get(url)
+    if response.status_code == 429:
+        bucket.penalize(parse_retry_after(response.headers.get("Retry-After"), 60))
+"""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from src.core.logging import log
+from src.core import metrics
+
+# provider -> (requests, per_seconds, burst)
+PROVIDER_LIMITS: Dict[str, Tuple[int, float, int]] = {
+    "tradier": (120, 60.0, 10),       # Brokerage API: 120 req/min
+    "perplexity": (30, 60.0, 3),      # Well under account RPM; leaves room for /analyze
+    "alphavantage": (5, 60.0, 1),     # Free tier: 5 req/min
+    "twelvedata": (8, 60.0, 1),       # Free tier: 8 req/min (one per 7.5s)
+    "finnhub": (60, 60.0, 5),         # Free tier: 60 req/min
+    "yahoo": (1, 1.0, 1),             # Unofficial; ~1 req/s avoids 429s
+    "telegram": (1, 1.0, 3),          # Bot API: ~1 msg/s per chat
+}
+
+# Longest Retry-After honoured; anything longer is a misbehaving header
+MAX_RETRY_AFTER_S = 120.0
+
+# Waits shorter than this are not worth a log line
+_LOG_WAIT_S = 1.0
+
+# Shorter delays are float rounding left after a sleep; never sleep for them
+_MIN_SLEEP_S = 1e-6
+
+
+def parse_retry_after(value: Optional[str], default: float) -> float:
+    """
+    Parse a Retry-After header (delta-seconds or HTTP-date).
+
+    Args:
+        value: Header value, or None if absent
+        default: Seconds to use when missing or unparseable
+
+    Returns:
+        Seconds to wait, clamped to [0, MAX_RETRY_AFTER_S]
+    """
+    seconds = default
+    if value:
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                when = parsedate_to_datetime(value)
+                seconds = (when - datetime.now(timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                seconds = default
+    return max(0.0, min(seconds, MAX_RETRY_AFTER_S))
+
+
+class AsyncTokenBucket:
+    """
+    Token bucket that callers await instead of sleeping on fixed intervals.
+
+    clock and sleep default to time.monotonic and asyncio.sleep; tests pass
+    a fake pair to run Retry-After waits without real time passing.
+    """
+
+    def __init__(
+        self,
+        rate: int,
+        per_seconds: float,
+        burst: int,
+        name: str = "default",
+        clock: Optional[Callable[[], float]] = None,
+        sleep: Optional[Callable[[float], Awaitable[Any]]] = None,
+    ):
+        if rate <= 0 or per_seconds <= 0 or burst <= 0:
+            raise ValueError("rate, per_seconds and burst must be positive")
+        self.name = name
+        self.rate = rate
+        self.per_seconds = per_seconds
+        self.burst = burst
+        self._clock = clock or time.monotonic
+        self._sleep = sleep
+        self._tokens = float(burst)
+        self._updated = self._clock()
+        self._blocked_until = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Stats
+        self.acquired = 0
+        self.waits = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.throttled = 0
+
+    @property
+    def tokens_per_second(self) -> float:
+        return self.rate / self.per_seconds
+
+    def _get_lock(self) -> asyncio.Lock:
+        # Buckets are module-level singletons; tests (and the scheduler's
+        # asyncio.run per job) may drive them from more than one event loop.
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    def _refill(self, now: float) -> None:
+        # No tokens accrue while blocked by a Retry-After
+        start = max(self._updated, self._blocked_until)
+        if now > start:
+            self._tokens = min(
+                float(self.burst),
+                self._tokens + (now - start) * self.tokens_per_second,
+            )
+        self._updated = max(self._updated, now)
+
+    def _delay(self, tokens: int, now: float) -> float:
+        self._refill(now)
+        if now < self._blocked_until:
+            delay = self._blocked_until - now
+        elif self._tokens >= tokens:
+            return 0.0
+        else:
+            delay = (tokens - self._tokens) / self.tokens_per_second
+        return delay if delay > _MIN_SLEEP_S else 0.0
+
+    async def acquire(self, tokens: int = 1) -> float:
+        """
+        Wait until `tokens` are available and take them.
+
+        Args:
+            tokens: Requests about to be made (capped at the burst size)
+
+        Returns:
+            Seconds spent waiting
+        """
+        tokens = min(tokens, self.burst)
+        sleep = self._sleep or asyncio.sleep
+        start = self._clock()
+        waited = 0.0
+        async with self._get_lock():
+            now = self._clock()
+            delay = self._delay(tokens, now)
+            while delay > 0:
+                await sleep(delay)
+                # The loop can wake a hair early; never re-sleep for the
+                # interval already slept
+                now = max(self._clock(), now + delay)
+                delay = self._delay(tokens, now)
+            self._tokens = max(0.0, self._tokens - tokens)
+        # Queueing behind other waiters counts, not just our own sleeps
+        elapsed = self._clock() - start
+        if elapsed >= 0.001:
+            waited = elapsed
+
+        self.acquired += tokens
+        if waited:
+            self.waits += 1
+            self.wait_total += waited
+            self.wait_max = max(self.wait_max, waited)
+            metrics.record("ivcrush.ratelimit.wait_ms", waited * 1000, {"provider": self.name})
+            if waited >= _LOG_WAIT_S:
+                log("debug", "Rate limit wait", provider=self.name, seconds=round(waited, 2))
+        return waited
+
+    def penalize(self, retry_after: float) -> None:
+        """
+        Back off after a 429: hold all callers for `retry_after` seconds,
+        then resume at the sustained rate (no burst).
+        """
+        retry_after = max(0.0, min(retry_after, MAX_RETRY_AFTER_S))
+        now = self._clock()
+        self._refill(now)
+        self._tokens = 0.0
+        self._blocked_until = max(self._blocked_until, now + retry_after)
+        self.throttled += 1
+        metrics.count("ivcrush.ratelimit.throttled", {"provider": self.name})
+        log("warn", "Provider rate limited, backing off",
+            provider=self.name, retry_after=round(retry_after, 1))
+
+    def available(self) -> float:
+        """Tokens currently available (for diagnostics)."""
+        self._refill(self._clock())
+        return self._tokens
+
+    def stats(self) -> Dict[str, Any]:
+        now = self._clock()
+        self._refill(now)
+        return {
+            "rate_per_min": round(self.tokens_per_second * 60, 2),
+            "burst": self.burst,
+            "tokens": round(self._tokens, 2),
+            "acquired": self.acquired,
+            "waits": self.waits,
+            "wait_s_total": round(self.wait_total, 3),
+            "wait_s_max": round(self.wait_max, 3),
+            "throttled": self.throttled,
+            "blocked_for_s": round(max(0.0, self._blocked_until - now), 1),
+        }
+
+
+_buckets: Dict[str, AsyncTokenBucket] = {}
+
+
+def get_bucket(provider: str) -> AsyncTokenBucket:
+    """Process-wide bucket for a provider in PROVIDER_LIMITS."""
+    bucket = _buckets.get(provider)
+    if bucket is None:
+        rate, per_seconds, burst = PROVIDER_LIMITS[provider]
+        bucket = _buckets[provider] = AsyncTokenBucket(rate, per_seconds, burst, name=provider)
+    return bucket
+
+
+def rate_limit_stats() -> Dict[str, Dict[str, Any]]:
+    """Stats for every bucket created so far (for /api/health)."""
+    return {name: bucket.stats() for name, bucket in sorted(_buckets.items())}
+
+
+def reset_buckets() -> None:
+    """Drop all buckets so the next get_bucket() starts full (tests)."""
+    _buckets.clear()
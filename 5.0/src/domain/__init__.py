@@ -3,7 +3,13 @@
 from .vrp import calculate_vrp, get_vrp_tier
 from .liquidity import classify_liquidity_tier
 from .scoring import calculate_score, apply_sentiment_modifier
-from .repositories import HistoricalMovesRepository, SentimentCacheRepository, VRPCacheRepository, is_valid_ticker
+from .repositories import (
+    AsyncRepository,
+    HistoricalMovesRepository,
+    SentimentCacheRepository,
+    VRPCacheRepository,
+    is_valid_ticker,
+)
 from .strategies import Strategy, generate_strategies
 from .position_sizing import half_kelly, calculate_position_size
 from .implied_move import (
@@ -31,6 +37,7 @@ __all__ = [
     "classify_liquidity_tier",
     "calculate_score",
     "apply_sentiment_modifier",
+    "AsyncRepository",
     "HistoricalMovesRepository",
     "SentimentCacheRepository",
     "VRPCacheRepository",
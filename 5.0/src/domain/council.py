@@ -25,6 +25,18 @@ WEIGHTS = {
     "historical_pattern": 0.118,
 }
 
+# How long each member's result is reused for the same (ticker, earnings_date).
+# Analyst trends and historical patterns barely move within a day; news and
+# the options chain go stale quickly. Failed members are never cached.
+MEMBER_TTL_MINUTES = {
+    "perplexity_research": 360,
+    "finnhub_analysts": 720,
+    "perplexity_quick": 360,
+    "finnhub_news": 30,
+    "options_skew": 10,
+    "historical_pattern": 720,
+}
+
 # Skew bias to score mapping
 SKEW_SCORE_MAP = {
     "STRONG_BULLISH": 0.7,
@@ -51,6 +63,7 @@ class CouncilMember:
     status: str = ""          # "fresh", "cached", "33 analysts", etc.
     failed: bool = False
     details: Dict[str, Any] = field(default_factory=dict)
+    cached: bool = False      # reused from the council member cache
 
 
 @dataclass
@@ -176,6 +189,42 @@ def calculate_agreement(members: List[CouncilMember]) -> tuple:
     return level, agreeing, total
 
 
+def member_to_payload(member: CouncilMember) -> str:
+    """Serialize a member result for the council member cache."""
+    return json.dumps({
+        "name": member.name,
+        "score": member.score,
+        "direction": member.direction,
+        "status": member.status,
+        "details": member.details,
+    })
+
+
+def member_from_payload(key: str, payload: str) -> CouncilMember:
+    """Restore a cached member result (weight comes from current WEIGHTS)."""
+    data = json.loads(payload)
+    return CouncilMember(
+        name=data["name"], weight=WEIGHTS[key],
+        score=data["score"], direction=data["direction"],
+        status=data.get("status", ""), details=data.get("details") or {},
+        cached=True,
+    )
+
+
+async def _load_cached_members(cache, ticker: str, earnings_date: str) -> Dict[str, CouncilMember]:
+    """Unexpired cached members by WEIGHTS key; an unreadable cache means none."""
+    try:
+        rows = await cache.get_council_members(ticker, earnings_date)
+        return {
+            key: member_from_payload(key, row["payload"])
+            for key, row in rows.items()
+            if key in WEIGHTS
+        }
+    except Exception as e:
+        log("warn", "Council member cache read failed", ticker=ticker, error=type(e).__name__)
+        return {}
+
+
 def parse_research_response(text: str) -> Dict[str, Any]:
     """Parse deep Perplexity research response."""
     result = {
@@ -228,10 +277,15 @@ async def run_council(
     tradier,  # TradierClient
     repo,  # HistoricalMovesRepository
     cache,  # SentimentCacheRepository
+    fresh: bool = False,
 ) -> CouncilResult:
     """
     Run 6-source council consensus for a ticker.
 
+    Member results are cached per (ticker, earnings_date) with a TTL per
+    member (MEMBER_TTL_MINUTES); only stale members are refetched and the
+    consensus is recomputed from the cached rest. fresh=True refetches all.
+
     Sources (renormalized from 85% to 100%):
     1. Perplexity Research (29.4%) — deep prompt
     2. Finnhub Analysts (23.5%) — recommendation trends
@@ -244,11 +298,16 @@ async def run_council(
     from src.domain.direction import get_direction
     from src.domain.scoring import apply_sentiment_modifier, calculate_score
     from src.core.config import today_et
+    from src.domain.repositories import AsyncRepository
 
     members: List[CouncilMember] = []
 
+    # Run repository queries on the DB executor, not the event loop
+    repo = AsyncRepository(repo)
+    cache = AsyncRepository(cache)
+
     # 1. Validate ticker and look up earnings
-    earnings_info = repo.get_next_earnings(ticker)
+    earnings_info = await repo.get_next_earnings(ticker)
     if not earnings_info:
         return CouncilResult(
             ticker=ticker, earnings_date="", timing="", price=0,
@@ -267,10 +326,10 @@ async def run_council(
     price = quote.get("last") or quote.get("close") or quote.get("prevclose") or 0
 
     # Get position limits for TRR
-    position_limits = repo.get_position_limits(ticker)
+    position_limits = await repo.get_position_limits(ticker)
 
     # Get historical moves
-    moves = repo.get_moves(ticker)
+    moves = await repo.get_moves(ticker)
     historical_pcts = [abs(m["intraday_move_pct"]) for m in moves if m.get("intraday_move_pct")]
 
     # Calculate tail risk
@@ -365,7 +424,7 @@ async def run_council(
 
     async def _fetch_perplexity_quick():
         # Check cache first
-        cached = cache.get_sentiment(ticker, earnings_date)
+        cached = await cache.get_sentiment(ticker, earnings_date)
         if cached:
             score = cached.get("score", 0)
             if isinstance(score, (int, float)):
@@ -378,7 +437,7 @@ async def run_council(
         try:
             sentiment = await perplexity.get_sentiment(ticker, earnings_date)
             if sentiment and not sentiment.get("error"):
-                cache.save_sentiment(ticker, earnings_date, sentiment)
+                await cache.save_sentiment(ticker, earnings_date, sentiment)
                 score = sentiment.get("score", 0)
                 return CouncilMember(
                     name="Perplexity Quick", weight=WEIGHTS["perplexity_quick"],
@@ -389,13 +448,27 @@ async def run_council(
             log("warn", "Perplexity Quick failed", ticker=ticker, error=type(e).__name__)
         return CouncilMember(name="Perplexity Quick", weight=WEIGHTS["perplexity_quick"], failed=True, status="failed")
 
+    # Reuse members whose cached result has not expired
+    cached_members = {} if fresh else await _load_cached_members(cache, ticker, earnings_date)
+    fetched_members: Dict[str, CouncilMember] = {}
+
+    async def _member(key: str, fetch) -> CouncilMember:
+        if key in cached_members:
+            metrics.count("ivcrush.council.member", {"member": key, "source": "cache"})
+            return cached_members[key]
+        metrics.count("ivcrush.council.member", {"member": key, "source": "fetch"})
+        member = await fetch()
+        if not member.failed:
+            fetched_members[key] = member
+        return member
+
     # Run Phase 1 in parallel
     phase1_results = await asyncio.gather(
-        _fetch_finnhub_analysts(),
-        _fetch_finnhub_news(),
-        _fetch_skew(),
-        _fetch_historical(),
-        _fetch_perplexity_quick(),
+        _member("finnhub_analysts", _fetch_finnhub_analysts),
+        _member("finnhub_news", _fetch_finnhub_news),
+        _member("options_skew", _fetch_skew),
+        _member("historical_pattern", _fetch_historical),
+        _member("perplexity_quick", _fetch_perplexity_quick),
         return_exceptions=True,
     )
 
@@ -407,46 +480,61 @@ async def run_council(
             members.append(result)
 
     # 4. Phase 2: Deep research
-    research_member = CouncilMember(
-        name="Perplexity Research", weight=WEIGHTS["perplexity_research"],
-        failed=True, status="skipped",
-    )
-
-    try:
-        prompt = (
-            f"For {ticker} earnings on {earnings_date}, analyze:\n"
-            f"1. Analyst consensus and recent rating changes\n"
-            f"2. EPS/revenue estimates vs whisper numbers\n"
-            f"3. Key business metric to watch\n"
-            f"4. Bull case and bear case (2 bullets each)\n"
-            f"5. Key risk\n\n"
-            f"Respond ONLY in this format:\n"
-            f"Direction: [bullish/bearish/neutral]\n"
-            f"Score: [number -1.0 to +1.0]\n"
-            f"Bull Case: [2 bullets, max 15 words each]\n"
-            f"Bear Case: [2 bullets, max 15 words each]\n"
-            f"Key Risk: [1 bullet, max 20 words]\n"
-            f"Analyst Trend: [upgrading/stable/downgrading]"
+    async def _fetch_research():
+        research_member = CouncilMember(
+            name="Perplexity Research", weight=WEIGHTS["perplexity_research"],
+            failed=True, status="skipped",
         )
-        response = await perplexity.query([
-            {"role": "system", "content": "You are a financial analyst providing pre-earnings sentiment analysis."},
-            {"role": "user", "content": prompt},
-        ])
-        if not response.get("error"):
-            text = response.get("choices", [{}])[0].get("message", {}).get("content", "")
-            if text:
-                parsed = parse_research_response(text)
-                research_member = CouncilMember(
-                    name="Perplexity Research", weight=WEIGHTS["perplexity_research"],
-                    score=parsed["score"], direction=parsed["direction"],
-                    status="fresh", details=parsed,
-                )
-    except Exception as e:
-        log("warn", "Perplexity Research failed", ticker=ticker, error=type(e).__name__)
-        research_member.status = f"error: {type(e).__name__}"
 
+        try:
+            prompt = (
+                f"For {ticker} earnings on {earnings_date}, analyze:\n"
+                f"1. Analyst consensus and recent rating changes\n"
+                f"2. EPS/revenue estimates vs whisper numbers\n"
+                f"3. Key business metric to watch\n"
+                f"4. Bull case and bear case (2 bullets each)\n"
+                f"5. Key risk\n\n"
+                f"Respond ONLY in this format:\n"
+                f"Direction: [bullish/bearish/neutral]\n"
+                f"Score: [number -1.0 to +1.0]\n"
+                f"Bull Case: [2 bullets, max 15 words each]\n"
+                f"Bear Case: [2 bullets, max 15 words each]\n"
+                f"Key Risk: [1 bullet, max 20 words]\n"
+                f"Analyst Trend: [upgrading/stable/downgrading]"
+            )
+            response = await perplexity.query([
+                {"role": "system", "content": "You are a financial analyst providing pre-earnings sentiment analysis."},
+                {"role": "user", "content": prompt},
+            ])
+            if not response.get("error"):
+                text = response.get("choices", [{}])[0].get("message", {}).get("content", "")
+                if text:
+                    parsed = parse_research_response(text)
+                    research_member = CouncilMember(
+                        name="Perplexity Research", weight=WEIGHTS["perplexity_research"],
+                        score=parsed["score"], direction=parsed["direction"],
+                        status="fresh", details=parsed,
+                    )
+        except Exception as e:
+            log("warn", "Perplexity Research failed", ticker=ticker, error=type(e).__name__)
+            research_member.status = f"error: {type(e).__name__}"
+        return research_member
+
+    research_member = await _member("perplexity_research", _fetch_research)
     members.insert(0, research_member)  # Research is first member
 
+    if fetched_members:
+        try:
+            await cache.save_council_members(
+                ticker, earnings_date,
+                {key: member_to_payload(m) for key, m in fetched_members.items()},
+                MEMBER_TTL_MINUTES,
+            )
+        except Exception as e:
+            log("warn", "Council member cache save failed", ticker=ticker, error=type(e).__name__)
+    log("debug", "Council members resolved", ticker=ticker,
+        cached=sorted(cached_members), fetched=sorted(fetched_members))
+
     # 5. Calculate weighted consensus (exclude failed, renormalize)
     active = [m for m in members if not m.failed]
     active_count = len(active)
@@ -528,7 +616,7 @@ async def run_council(
                 "agreement": agreement,
             }),
         }
-        cache.save_sentiment(ticker, earnings_date, council_data)
+        await cache.save_sentiment(ticker, earnings_date, council_data)
     except Exception as e:
         log("warn", "Council cache save failed", ticker=ticker, error=type(e).__name__)
 
@@ -16,6 +16,8 @@ Shared Helpers (used by all job handlers and endpoints):
   (calls quote, expirations, options_chain APIs - 3 calls per ticker)
 - get_implied_move_with_fallback(): Extract result or fall back to estimate
 - IMPLIED_MOVE_FALLBACK_MULTIPLIER: 1.5x fallback when real data unavailable
+- chain_liquidity(): liquidity inputs of a chain, stored with the pre-market
+  candidate snapshot
 """
 
 from typing import Dict, Any, List, Optional, Tuple, TYPE_CHECKING
@@ -153,6 +155,31 @@ def calculate_implied_move_from_chain(
     return result
 
 
+def chain_liquidity(chain: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Liquidity inputs for classify_liquidity_tier() from an options chain.
+
+    Args:
+        chain: Options chain from Tradier
+
+    Returns:
+        Dict with open_interest (chain total) and spread_pct (average
+        bid-ask spread as % of mid over quoted contracts)
+    """
+    total_oi = sum(opt.get("open_interest") or 0 for opt in chain)
+    spreads = []
+    for opt in chain:
+        bid = opt.get("bid") or 0
+        ask = opt.get("ask") or 0
+        if bid > 0 and ask > 0:
+            spreads.append((ask - bid) / ((ask + bid) / 2) * 100)
+
+    return {
+        "open_interest": total_oi,
+        "spread_pct": round(sum(spreads) / len(spreads), 2) if spreads else None,
+    }
+
+
 # Fallback multiplier when real options data unavailable
 IMPLIED_MOVE_FALLBACK_MULTIPLIER = 1.5
 
@@ -183,6 +210,7 @@ async def fetch_real_implied_move(
             - straddle_price: ATM straddle price (if real data)
             - expiration: Options expiration used (if real data)
             - price: Stock price used for calculation
+            - liquidity: open_interest / spread_pct inputs (if fetched)
             - error: Error message (if fallback used)
     """
     result = {
@@ -195,6 +223,7 @@ async def fetch_real_implied_move(
         "has_weekly_options": True,  # Default to True (permissive on error)
         "weekly_reason": "",
         "price": None,  # Stock price used for calculation
+        "liquidity": None,
         "error": None,
     }
 
@@ -239,6 +268,8 @@ async def fetch_real_implied_move(
             result["error"] = "Empty or invalid options chain"
             return result
 
+        result["liquidity"] = chain_liquidity(chain)
+
         # Calculate implied move from ATM straddle
         im_data = calculate_implied_move_from_chain(chain, price)
 
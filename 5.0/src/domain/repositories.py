@@ -3,18 +3,32 @@ Domain repositories for IV Crush 5.0.
 
 Simple repositories for historical moves and sentiment cache.
 Uses SQLite directly with connection pooling.
+
+Repositories are synchronous. Async callers (routes, job handlers) wrap them
+in AsyncRepository so queries run on the DB executor instead of the event loop.
 """
 
 import atexit
+import functools
 import re
 import sqlite3
+import sys
 import threading
+import time
+from pathlib import Path
 from queue import Queue, Empty
 from contextlib import contextmanager
 from typing import Dict, Any, List, Optional
 from datetime import date
 
-from src.core.logging import log
+# Ensure common/ is importable
+_root = str(Path(__file__).resolve().parent.parent.parent.parent)
+if _root not in sys.path:
+    sys.path.insert(0, _root)
+
+from common.db import DEFAULT_PROFILE, PoolMetrics, SQLiteProfile, connect  # noqa: E402
+from src.core.logging import log  # noqa: E402
+from src.core.db_executor import run_db  # noqa: E402
 
 # Input validation patterns - allow BRK.B, BF.A style tickers
 TICKER_PATTERN = re.compile(r'^[A-Z]{1,5}(\.[A-Z]{1,2})?$')
@@ -73,27 +87,46 @@ def validate_days(days: int) -> int:
 
 
 class ConnectionPool:
-    """Simple SQLite connection pool for better performance."""
+    """Simple SQLite connection pool for better performance.
+
+    Connections use the shared common.db profile (WAL, foreign keys, sized
+    page cache, mmap, statement cache). Checkout wait times are tracked in
+    `metrics` and reported by stats().
+    """
 
-    def __init__(self, db_path: str, max_connections: int = 15):
+    def __init__(
+        self,
+        db_path: str,
+        max_connections: int = 15,
+        profile: SQLiteProfile = DEFAULT_PROFILE,
+    ):
         self.db_path = db_path
         self._pool: Queue = Queue(maxsize=max_connections)
         self._max = max_connections
         self._created = 0
         self._lock = threading.Lock()  # Protect _created counter
+        # Bumped by close_all(); connections checked out before are closed on return
+        self._generation = 0
+        self.profile = profile
+        self.metrics = PoolMetrics()
 
     def _create_connection(self) -> sqlite3.Connection:
         """Create a new connection."""
-        conn = sqlite3.connect(self.db_path, check_same_thread=False)
-        # CRITICAL: Enable foreign key constraints
-        conn.execute('PRAGMA foreign_keys=ON')
-        conn.row_factory = sqlite3.Row
+        conn = connect(
+            self.db_path,
+            self.profile,
+            check_same_thread=False,
+            row_factory=sqlite3.Row,
+        )
+        self.metrics.record_created()
         return conn
 
     @contextmanager
     def get_connection(self):
         """Get a connection from the pool."""
         conn = None
+        generation = self._generation
+        wait_start = time.perf_counter()
         try:
             # Try to get from pool
             try:
@@ -106,7 +139,12 @@ class ConnectionPool:
                         self._created += 1
                 # If we didn't create one, wait for pool
                 if conn is None:
-                    conn = self._pool.get(timeout=30)
+                    try:
+                        conn = self._pool.get(timeout=30)
+                    except Empty:
+                        self.metrics.record_timeout()
+                        raise
+            self.metrics.record_checkout(time.perf_counter() - wait_start)
             yield conn
         finally:
             if conn:
@@ -118,14 +156,20 @@ class ConnectionPool:
                     conn.rollback()
                 except Exception:
                     pass
-                try:
-                    self._pool.put_nowait(conn)
-                except Exception:
-                    # Pool full, close this one
+                if generation != self._generation:
+                    # Pool was closed while checked out (e.g. DB file swapped)
                     conn.close()
+                else:
+                    try:
+                        self._pool.put_nowait(conn)
+                    except Exception:
+                        # Pool full, close this one
+                        conn.close()
 
     def close_all(self):
         """Close all connections in the pool."""
+        with self._lock:
+            self._generation += 1
         while not self._pool.empty():
             try:
                 conn = self._pool.get_nowait()
@@ -134,6 +178,16 @@ class ConnectionPool:
                 break
         self._created = 0
 
+    def stats(self) -> Dict[str, Any]:
+        """Pool size plus checkout/wait-time metrics."""
+        stats: Dict[str, Any] = {
+            "max_connections": self._max,
+            "total_connections": self._created,
+            "available": self._pool.qsize(),
+        }
+        stats.update(self.metrics.snapshot())
+        return stats
+
 
 # Global connection pools (one per database path)
 _pools: Dict[str, ConnectionPool] = {}
@@ -146,6 +200,11 @@ def get_pool(db_path: str) -> ConnectionPool:
     return _pools[db_path]
 
 
+def get_pool_stats() -> Dict[str, Dict[str, Any]]:
+    """Stats for every open pool, keyed by database path."""
+    return {path: pool.stats() for path, pool in list(_pools.items())}
+
+
 def cleanup_all_pools():
     """Close all connection pools. Called on process exit."""
     for path, pool in list(_pools.items()):  # Use list() to avoid mutation during iteration
@@ -162,6 +221,15 @@ def cleanup_all_pools():
 atexit.register(cleanup_all_pools)
 
 
+_SAVE_MOVE_SQL = """
+    INSERT OR REPLACE INTO historical_moves
+    (ticker, earnings_date, gap_move_pct, intraday_move_pct,
+     prev_close, earnings_open, earnings_high, earnings_low,
+     earnings_close, close_move_pct)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
 class HistoricalMovesRepository:
     """Repository for historical earnings moves."""
 
@@ -243,22 +311,25 @@ class HistoricalMovesRepository:
         placeholders = ",".join("?" for _ in validated_tickers)
 
         with self._pool.get_connection() as conn:
-            # Use window function to get top N moves per ticker
+            # Top N moves per ticker: keep rows at or after each ticker's Nth
+            # most recent date. Both lookups are served by the covering
+            # (ticker, earnings_date DESC, ...) index, so no temp B-tree sort.
+            # validate_limit() keeps limit >= 1; with 0, OFFSET -1 would act as
+            # OFFSET 0 and return each ticker's latest move.
             cursor = conn.execute(
                 f"""
-                WITH ranked AS (
-                    SELECT ticker, earnings_date, gap_move_pct, intraday_move_pct,
-                           prev_close, earnings_close,
-                           CASE WHEN gap_move_pct >= 0 THEN 'UP' ELSE 'DOWN' END as direction,
-                           ROW_NUMBER() OVER (PARTITION BY ticker ORDER BY earnings_date DESC) as rn
-                    FROM historical_moves
-                    WHERE ticker IN ({placeholders})
-                )
                 SELECT ticker, earnings_date, gap_move_pct, intraday_move_pct,
-                       prev_close, earnings_close, direction
-                FROM ranked
-                WHERE rn <= ?
-                ORDER BY ticker, earnings_date DESC
+                       prev_close, earnings_close,
+                       CASE WHEN gap_move_pct >= 0 THEN 'UP' ELSE 'DOWN' END as direction
+                FROM historical_moves AS hm
+                WHERE hm.ticker IN ({placeholders})
+                  AND hm.earnings_date >= COALESCE((
+                      SELECT earnings_date FROM historical_moves
+                      WHERE ticker = hm.ticker
+                      ORDER BY earnings_date DESC
+                      LIMIT 1 OFFSET ? - 1
+                  ), '')
+                ORDER BY hm.ticker, hm.earnings_date DESC
                 """,
                 (*validated_tickers, limit)
             )
@@ -482,36 +553,12 @@ class HistoricalMovesRepository:
             ValueError: If ticker or date is invalid
             sqlite3.Error: On database errors (except duplicates)
         """
-        ticker = _normalize_ticker(move["ticker"])
-        earnings_date = validate_date(move["earnings_date"])
+        row = self._move_row(move)
+        ticker, earnings_date = row[0], row[1]
 
         with self._pool.get_connection() as conn:
             try:
-                # Map to actual database schema columns
-                prev_close = move.get("prev_close") or move.get("close_before")
-                earnings_close = move.get("earnings_close") or move.get("close_after")
-
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO historical_moves
-                    (ticker, earnings_date, gap_move_pct, intraday_move_pct,
-                     prev_close, earnings_open, earnings_high, earnings_low,
-                     earnings_close, close_move_pct)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        ticker,
-                        earnings_date,
-                        move.get("gap_move_pct"),
-                        move.get("intraday_move_pct"),
-                        prev_close,
-                        move.get("earnings_open"),
-                        move.get("earnings_high"),
-                        move.get("earnings_low"),
-                        earnings_close,
-                        move.get("close_move_pct"),
-                    )
-                )
+                conn.execute(_SAVE_MOVE_SQL, row)
                 conn.commit()
                 log("debug", "Saved move", ticker=ticker, date=earnings_date)
                 return True
@@ -523,6 +570,53 @@ class HistoricalMovesRepository:
                 log("error", "Failed to save move", error=str(e), ticker=ticker)
                 raise  # Re-raise for caller to handle
 
+    def save_moves(self, moves: List[Dict[str, Any]]) -> int:
+        """
+        Save many historical move records in one transaction.
+
+        Args:
+            moves: Dicts with ticker, earnings_date, gap_move_pct, etc.
+
+        Returns:
+            Number of moves saved
+
+        Raises:
+            ValueError: If any ticker or date is invalid (nothing is saved)
+            sqlite3.Error: On database errors (the transaction is rolled back)
+        """
+        if not moves:
+            return 0
+        rows = [self._move_row(move) for move in moves]
+
+        with self._pool.get_connection() as conn:
+            try:
+                conn.executemany(_SAVE_MOVE_SQL, rows)
+                conn.commit()
+            except sqlite3.Error as e:
+                log("error", "Failed to save moves", error=str(e), count=len(rows))
+                raise
+        log("debug", "Saved moves", count=len(rows))
+        return len(rows)
+
+    @staticmethod
+    def _move_row(move: Dict[str, Any]) -> tuple:
+        """Validate a move dict and map it to historical_moves columns."""
+        # Map to actual database schema columns
+        prev_close = move.get("prev_close") or move.get("close_before")
+        earnings_close = move.get("earnings_close") or move.get("close_after")
+        return (
+            _normalize_ticker(move["ticker"]),
+            validate_date(move["earnings_date"]),
+            move.get("gap_move_pct"),
+            move.get("intraday_move_pct"),
+            prev_close,
+            move.get("earnings_open"),
+            move.get("earnings_high"),
+            move.get("earnings_low"),
+            earnings_close,
+            move.get("close_move_pct"),
+        )
+
     def get_position_limits(self, ticker: str) -> Optional[Dict[str, Any]]:
         """
         Get position limits and tail risk data for ticker.
@@ -595,6 +689,18 @@ class SentimentCacheRepository:
                 CREATE INDEX IF NOT EXISTS idx_sentiment_ticker_date
                 ON sentiment_cache(ticker, earnings_date)
             """)
+            # Per-member council results; each member has its own TTL
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS council_member_cache (
+                    ticker TEXT NOT NULL,
+                    earnings_date TEXT NOT NULL,
+                    member TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    expires_at TEXT NOT NULL,
+                    PRIMARY KEY (ticker, earnings_date, member)
+                )
+            """)
             conn.commit()
 
     def get_sentiment(self, ticker: str, earnings_date: str) -> Optional[Dict[str, Any]]:
@@ -686,13 +792,196 @@ class SentimentCacheRepository:
                 log("error", "Failed to cache sentiment", error=str(e), ticker=ticker)
                 raise
 
+    def get_sentiments(self, keys: List[tuple]) -> Dict[tuple, Dict[str, Any]]:
+        """
+        Get cached sentiment for many (ticker, earnings_date) pairs at once.
+
+        Args:
+            keys: (ticker, earnings_date) pairs
+
+        Returns:
+            Dict mapping (TICKER, earnings_date) -> sentiment dict, for
+            entries that are cached and not expired
+        """
+        wanted = {(_normalize_ticker(t), validate_date(d)) for t, d in keys}
+        if not wanted:
+            return {}
+        tickers = sorted({t for t, _ in wanted})
+        placeholders = ",".join("?" for _ in tickers)
+
+        with self._pool.get_connection() as conn:
+            cursor = conn.execute(
+                f"""
+                SELECT ticker, earnings_date, direction, score, tailwinds, headwinds, raw_response
+                FROM sentiment_cache
+                WHERE ticker IN ({placeholders})
+                  AND expires_at > datetime('now')
+                """,
+                tickers
+            )
+            return {
+                (row["ticker"], row["earnings_date"]): {
+                    "direction": row["direction"],
+                    "score": row["score"],
+                    "tailwinds": row["tailwinds"],
+                    "headwinds": row["headwinds"],
+                    "raw": row["raw_response"],
+                }
+                for row in cursor.fetchall()
+                if (row["ticker"], row["earnings_date"]) in wanted
+            }
+
+    def save_sentiments(
+        self,
+        entries: Dict[tuple, Dict[str, Any]],
+        ttl_hours: int = 8,
+    ) -> int:
+        """
+        Cache sentiment for many (ticker, earnings_date) pairs in one transaction.
+
+        Args:
+            entries: Dict mapping (ticker, earnings_date) -> sentiment dict
+            ttl_hours: Time-to-live in hours
+
+        Returns:
+            Number of entries saved
+
+        Raises:
+            ValueError: If a ticker, date or ttl_hours is invalid
+            sqlite3.Error: On database errors
+        """
+        if not (0 <= ttl_hours <= 168):  # Max 1 week
+            raise ValueError(f"Invalid ttl_hours: {ttl_hours} (must be 0-168)")
+        rows = [
+            (
+                _normalize_ticker(ticker),
+                validate_date(earnings_date),
+                sentiment.get("direction"),
+                sentiment.get("score"),
+                sentiment.get("tailwinds"),
+                sentiment.get("headwinds"),
+                sentiment.get("raw"),
+                ttl_hours,
+            )
+            for (ticker, earnings_date), sentiment in entries.items()
+        ]
+        if not rows:
+            return 0
+
+        with self._pool.get_connection() as conn:
+            try:
+                conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO sentiment_cache
+                    (ticker, earnings_date, direction, score, tailwinds, headwinds,
+                     raw_response, created_at, expires_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, datetime('now'), datetime('now', '+' || ? || ' hours'))
+                    """,
+                    rows
+                )
+                conn.commit()
+                log("debug", "Cached sentiments", count=len(rows), ttl_hours=ttl_hours)
+                return len(rows)
+            except sqlite3.Error as e:
+                log("error", "Failed to cache sentiments", error=str(e), count=len(rows))
+                raise
+
+    def get_council_members(self, ticker: str, earnings_date: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Get unexpired council member results for ticker.
+
+        Args:
+            ticker: Stock symbol (1-5 uppercase letters)
+            earnings_date: Earnings date (YYYY-MM-DD)
+
+        Returns:
+            Dict mapping member key -> {"payload", "created_at", "age_minutes"}
+        """
+        ticker = _normalize_ticker(ticker)
+        earnings_date = validate_date(earnings_date)
+
+        with self._pool.get_connection() as conn:
+            cursor = conn.execute(
+                """
+                SELECT member, payload, created_at,
+                       CAST((julianday('now') - julianday(created_at)) * 1440 AS INTEGER) AS age_minutes
+                FROM council_member_cache
+                WHERE ticker = ? AND earnings_date = ?
+                  AND expires_at > datetime('now')
+                """,
+                (ticker, earnings_date)
+            )
+            return {
+                row["member"]: {
+                    "payload": row["payload"],
+                    "created_at": row["created_at"],
+                    "age_minutes": row["age_minutes"],
+                }
+                for row in cursor.fetchall()
+            }
+
+    def save_council_members(
+        self,
+        ticker: str,
+        earnings_date: str,
+        members: Dict[str, str],
+        ttl_minutes: Dict[str, int],
+    ) -> int:
+        """
+        Cache council member results in one transaction.
+
+        Args:
+            ticker: Stock symbol (1-5 uppercase letters)
+            earnings_date: Earnings date (YYYY-MM-DD)
+            members: Dict mapping member key -> JSON payload
+            ttl_minutes: Dict mapping member key -> time-to-live in minutes
+
+        Returns:
+            Number of members saved
+
+        Raises:
+            ValueError: If ticker, date or a TTL is invalid
+            sqlite3.Error: On database errors
+        """
+        ticker = _normalize_ticker(ticker)
+        earnings_date = validate_date(earnings_date)
+        for member in members:
+            if not (0 <= ttl_minutes[member] <= 10080):  # Max 1 week
+                raise ValueError(f"Invalid ttl_minutes for {member}: {ttl_minutes[member]}")
+        if not members:
+            return 0
+
+        with self._pool.get_connection() as conn:
+            try:
+                conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO council_member_cache
+                    (ticker, earnings_date, member, payload, created_at, expires_at)
+                    VALUES (?, ?, ?, ?, datetime('now'), datetime('now', '+' || ? || ' minutes'))
+                    """,
+                    [
+                        (ticker, earnings_date, member, payload, ttl_minutes[member])
+                        for member, payload in members.items()
+                    ]
+                )
+                conn.commit()
+                log("debug", "Cached council members", ticker=ticker, members=sorted(members))
+                return len(members)
+            except sqlite3.Error as e:
+                log("error", "Failed to cache council members", error=str(e), ticker=ticker)
+                raise
+
     def clear_expired(self) -> int:
-        """Clear expired cache entries. Returns count deleted."""
+        """Clear expired cache entries (sentiment and council members). Returns count deleted."""
         with self._pool.get_connection() as conn:
             cursor = conn.execute(
                 "DELETE FROM sentiment_cache WHERE expires_at < datetime('now')"
             )
             count = cursor.rowcount
+            cursor = conn.execute(
+                "DELETE FROM council_member_cache WHERE expires_at < datetime('now')"
+            )
+            count += cursor.rowcount
             conn.commit()
             if count > 0:
                 log("info", "Cleared expired sentiment cache", count=count)
@@ -711,13 +1000,17 @@ class SentimentCacheRepository:
         with self._pool.get_connection() as conn:
             if ticker:
                 ticker = _normalize_ticker(ticker)
-                cursor = conn.execute(
+                count = conn.execute(
                     "DELETE FROM sentiment_cache WHERE ticker = ?",
                     (ticker,)
-                )
+                ).rowcount
+                count += conn.execute(
+                    "DELETE FROM council_member_cache WHERE ticker = ?",
+                    (ticker,)
+                ).rowcount
             else:
-                cursor = conn.execute("DELETE FROM sentiment_cache")
-            count = cursor.rowcount
+                count = conn.execute("DELETE FROM sentiment_cache").rowcount
+                count += conn.execute("DELETE FROM council_member_cache").rowcount
             conn.commit()
             return count
 
@@ -970,3 +1263,37 @@ class VRPCacheRepository:
                 "valid_entries": row[1] or 0,
                 "expired_entries": row[2] or 0,
             }
+
+
+class AsyncRepository:
+    """
+    Awaitable view of a synchronous repository.
+
+    Every method call is dispatched to the DB executor via run_db() and
+    returns the same value the sync method would:
+
+        repo = AsyncRepository(HistoricalMovesRepository(db_path))
+        moves = await repo.get_moves("AAPL")
+        batch = await repo.get_moves_batch(["AAPL", "NVDA"])
+
+    Non-callable attributes (e.g. db_path) are returned as-is.
+    """
+
+    def __init__(self, repo: Any):
+        self._repo = repo
+
+    @property
+    def sync(self) -> Any:
+        """The wrapped synchronous repository."""
+        return self._repo
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._repo, name)
+        if not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def _call(*args: Any, **kwargs: Any) -> Any:
+            return await run_db(attr, *args, **kwargs)
+
+        return _call
@@ -10,7 +10,6 @@ import sys
 from pathlib import Path
 from dataclasses import dataclass
 from typing import List, Dict, Any, Optional, Tuple
-import numpy as np
 
 # Ensure common/ is importable
 _root = str(Path(__file__).resolve().parent.parent.parent.parent)
@@ -131,6 +130,8 @@ def _fit_polynomial(
 
     ATM slope = b (first derivative at x=0)
     """
+    import numpy as np  # Deferred: only needed once an options chain is analyzed
+
     moneyness_vals, skew_vals = zip(*points)
     x = np.array(moneyness_vals)
     y = np.array(skew_vals)
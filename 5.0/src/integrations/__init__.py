@@ -6,6 +6,7 @@ from .alphavantage import AlphaVantageClient
 from .yahoo import YahooFinanceClient
 from .twelvedata import TwelveDataClient
 from .telegram import TelegramSender
+from .telegram_outbox import TelegramOutbox
 from .finnhub import FinnhubClient
 
 __all__ = [
@@ -16,5 +17,6 @@ __all__ = [
     "YahooFinanceClient",
     "TwelveDataClient",
     "TelegramSender",
+    "TelegramOutbox",
     "FinnhubClient",
 ]
@@ -4,7 +4,6 @@ Alpha Vantage API client for earnings calendar.
 Primary source for upcoming earnings dates.
 """
 
-import asyncio
 import csv
 import io
 import time
@@ -15,11 +14,11 @@ from tenacity import (
     stop_after_attempt,
     wait_exponential,
     retry_if_exception_type,
-    retry_if_result,
 )
 
 from src.core.logging import log
 from src.core import metrics
+from src.core.rate_limit import get_bucket, parse_retry_after
 
 BASE_URL = "https://www.alphavantage.co/query"
 
@@ -49,6 +48,8 @@ class AlphaVantageClient:
         params: Optional[Dict] = None
     ) -> str:
         """Make request to Alpha Vantage API with rate limit handling."""
+        bucket = get_bucket("alphavantage")
+        await bucket.acquire()
         async with httpx.AsyncClient(timeout=30) as client:
             request_params = {
                 "function": function,
@@ -60,9 +61,10 @@ class AlphaVantageClient:
             response = await client.get(BASE_URL, params=request_params)
 
             # Handle 429 explicitly
+            # Back off before the retry (and hold other callers). Capped at 15s
+            # to preserve the job timeout budget.
             if response.status_code == 429:
-                log("warn", "Alpha Vantage rate limited, waiting 15s...")
-                await asyncio.sleep(15)
+                bucket.penalize(min(parse_retry_after(response.headers.get("Retry-After"), 15), 15))
                 raise httpx.HTTPStatusError(
                     "Rate limited",
                     request=response.request,
@@ -75,7 +77,7 @@ class AlphaVantageClient:
             # Check for soft rate limit in response body
             if _is_rate_limited(text):
                 log("warn", "Alpha Vantage soft rate limit detected, waiting 10s...")
-                await asyncio.sleep(10)
+                bucket.penalize(10)
                 raise httpx.HTTPStatusError(
                     "Soft rate limit",
                     request=response.request,
@@ -12,6 +12,7 @@ import httpx
 
 from src.core.logging import log
 from src.core import metrics
+from src.core.rate_limit import get_bucket, parse_retry_after
 
 
 BASE_URL = "https://finnhub.io/api/v1"
@@ -36,15 +37,22 @@ class FinnhubClient:
         if params:
             query.update(params)
 
+        bucket = get_bucket("finnhub")
+
         for attempt in range(3):
             try:
+                await bucket.acquire()
                 response = await self._client.get(url, params=query)
 
+                if response.status_code == 429 and attempt < 2:
+                    bucket.penalize(parse_retry_after(response.headers.get("Retry-After"), 2 ** attempt))
+                    continue
+
                 if response.status_code != 200:
                     log("warn", "Finnhub API error",
                         path=path, status=response.status_code,
                         response=response.text[:200] if response.text else "empty")
-                    if response.status_code in (429, 500, 502, 503) and attempt < 2:
+                    if response.status_code in (500, 502, 503) and attempt < 2:
                         await asyncio.sleep(2 ** attempt)
                         continue
                     duration_ms = (time.time() - start_time) * 1000
@@ -13,6 +13,7 @@ from typing import Dict, Any, Optional
 
 from src.core.logging import log, get_request_id
 from src.core import metrics
+from src.core.rate_limit import get_bucket, parse_retry_after
 
 BASE_URL = "https://api.perplexity.ai"
 
@@ -81,9 +82,11 @@ class PerplexityClient:
     async def _request(self, messages: list) -> Dict[str, Any]:
         """Make request to Perplexity API with retry handling."""
         start_time = time.time()
+        bucket = get_bucket("perplexity")
 
         for attempt in range(3):
             try:
+                await bucket.acquire()
                 async with httpx.AsyncClient(timeout=60) as client:
                     response = await client.post(
                         f"{BASE_URL}/chat/completions",
@@ -98,6 +101,10 @@ class PerplexityClient:
                         }
                     )
 
+                    if response.status_code == 429 and attempt < 2:
+                        bucket.penalize(parse_retry_after(response.headers.get("Retry-After"), 10))
+                        continue
+
                     if response.status_code != 200:
                         log("warn", "Perplexity API error",
                             status=response.status_code,
@@ -167,6 +174,10 @@ class PerplexityClient:
         # Add small buffer for safety
         return max(0.001, round(input_cost + output_cost, 6))
 
+    def estimated_call_cost(self) -> float:
+        """Expected cost of one sentiment call on the current model (for budgeting)."""
+        return self._estimate_cost({})
+
     async def get_sentiment(
         self,
         ticker: str,
@@ -1,19 +1,17 @@
 """
 Telegram Bot API client for notifications.
 
-Sends alerts and daily digests to configured chat.
+Sends alerts and daily digests to configured chat. While the outbox
+(src/integrations/telegram_outbox.py) is running, sends are queued and
+delivered in the background; otherwise they go out inline.
 """
 
 import httpx
-from typing import Dict, List, Any, Optional
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type,
-)
+from typing import Any, Callable, Dict, List, Optional
 
 from src.core.logging import log
+from src.core.rate_limit import get_bucket
+from src.integrations.telegram_outbox import DeliveryResult, get_outbox
 
 BASE_URL = "https://api.telegram.org/bot"
 MAX_MESSAGE_LENGTH = 4096  # Telegram API limit
@@ -55,17 +53,14 @@ class TelegramSender:
 
         return f"{header}\n\n[...{truncated_len} chars truncated...]\n\n{footer}"
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((httpx.HTTPStatusError, httpx.TimeoutException)),
-    )
-    async def _send(self, text: str, parse_mode: str = "HTML") -> bool:
-        """Send message via Telegram API."""
-        try:
-            # Truncate to Telegram's limit if needed
-            text = self._truncate_message(text)
+    async def _post(self, text: str, parse_mode: str = "HTML") -> DeliveryResult:
+        """Make one sendMessage call and classify the outcome."""
+        # Truncate to Telegram's limit if needed
+        text = self._truncate_message(text)
 
+        bucket = get_bucket("telegram")
+        await bucket.acquire()
+        try:
             async with httpx.AsyncClient(timeout=30) as client:
                 response = await client.post(
                     f"{self.base_url}/sendMessage",
@@ -75,25 +70,73 @@ class TelegramSender:
                         "parse_mode": parse_mode,
                     },
                 )
-                response.raise_for_status()
-                data = response.json()
-                return data.get("ok", False)
+        except httpx.HTTPError as e:
+            return DeliveryResult(ok=False, retryable=True, error=f"{type(e).__name__}: {e}")
+
+        if response.status_code == 429:
+            # Bot API reports the wait in the body, not a header
+            retry_after = float(response.json().get("parameters", {}).get("retry_after", 5))
+            bucket.penalize(retry_after)
+            return DeliveryResult(ok=False, retryable=True, retry_after=retry_after, error="429")
+        if response.status_code >= 500:
+            return DeliveryResult(ok=False, retryable=True, error=f"HTTP {response.status_code}")
+        if response.status_code >= 400:
+            # Bad request (e.g. malformed HTML): resending the same text won't help
+            return DeliveryResult(ok=False, error=f"HTTP {response.status_code}")
+        data = response.json()
+        return DeliveryResult(ok=bool(data.get("ok", False)), error=data.get("description"))
+
+    async def _send(
+        self,
+        text: str,
+        parse_mode: str = "HTML",
+        await_delivery: bool = False,
+        on_settle: Optional[Callable[[bool], None]] = None,
+    ) -> bool:
+        """
+        Send message via Telegram API, or queue it when the outbox is running.
+
+        With await_delivery, a queued message is waited on until the outbox
+        has posted it, so True means delivered rather than queued. on_settle
+        is called with the delivery outcome: later for a queued message,
+        before returning for an inline send.
+        """
+        outbox = get_outbox()
+        if outbox is not None:
+            if await_delivery:
+                return await outbox.deliver(self, text, parse_mode)
+            return outbox.put(self, text, parse_mode, on_settle=on_settle)
+        try:
+            result = await self._post(text, parse_mode)
+            if not result.ok:
+                log("error", "Telegram send failed", error=result.error)
+            ok = result.ok
         except Exception as e:
             log("error", "Telegram send failed", error=str(e))
-            return False
+            ok = False
+        if on_settle is not None:
+            on_settle(ok)
+        return ok
 
-    async def send_message(self, text: str) -> bool:
+    async def send_message(
+        self,
+        text: str,
+        await_delivery: bool = False,
+        on_settle: Optional[Callable[[bool], None]] = None,
+    ) -> bool:
         """
         Send plain text message.
 
         Args:
             text: Message text
+            await_delivery: Wait for the outbox to post it (True = delivered)
+            on_settle: Called with True once delivered, False once dropped
 
         Returns:
-            True if sent successfully
+            True if sent (or queued, unless await_delivery) successfully
         """
         log("debug", "Sending Telegram message", length=len(text))
-        return await self._send(text)
+        return await self._send(text, await_delivery=await_delivery, on_settle=on_settle)
 
     def _format_alert(
         self,
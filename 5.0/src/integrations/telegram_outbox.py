@@ -0,0 +1,379 @@
+"""
+Outbound Telegram message queue with a background delivery worker.
+
+Job handlers and the webhook router used to await the Bot API inline, so a
+slow Telegram call delayed job completion and the /dispatch response, and
+messages sent back to back (a digest, then a summary) went out as separate
+posts. While the outbox is running, TelegramSender queues messages here
+and returns at once:
+
+- Messages waiting for the same chat are merged into one post, up to
+  Telegram's 4096-character limit. If Telegram rejects a merged post
+  (e.g. malformed HTML in one part), its parts are retried one by one.
+- Posts to one chat are spaced CHAT_INTERVAL_S apart. The process-wide
+  "telegram" token bucket keeps all chats under the Bot API's global limit.
+- A 429 holds the chat for the retry_after Telegram reports; timeouts and
+  5xx are retried with backoff up to MAX_ATTEMPTS.
+- The queue is bounded; on shutdown it is drained for up to DRAIN_TIMEOUT_S.
+
+Delivery latency (enqueue to delivered) and drops by reason are exported
+as metrics. Without a running outbox (scripts, tests) TelegramSender sends
+inline as before.
+
+put() only queues; an on_settle callback hears whether the message was
+later posted or dropped (jobs report and count delivery this way without
+waiting for it). Callers whose response must mean "delivered" (the alert
+webhook) use deliver(), which queues the message and waits up to
+DELIVERY_WAIT_S for the worker to post or drop it. On Cloud Run with CPU
+throttling the worker only runs while a request is in flight or during the
+shutdown drain; opt into --no-cpu-throttling (see deploy.sh) to post
+between requests.
+
+Example Usage:
+    start_outbox()
+    await telegram.send_message(text)  # queued
+    await telegram.send_message(text, await_delivery=True)  # posted or dropped
+    ...
+    await stop_outbox()                # drains, then stops
+"""
+
+import asyncio
+import collections
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from src.core.logging import log
+from src.core import metrics
+
+if TYPE_CHECKING:
+    from src.integrations.telegram import TelegramSender
+
+# Bot API: about one message per second per chat
+CHAT_INTERVAL_S = 1.0
+
+# Messages waiting across all chats; new messages are dropped beyond this
+MAX_QUEUED = 200
+
+# Delivery attempts per message before it is dropped
+MAX_ATTEMPTS = 3
+
+# Backoff after a timeout or 5xx (doubles per attempt)
+RETRY_BACKOFF_S = 2.0
+
+# Shutdown drain budget (Cloud Run allows 10s after SIGTERM)
+DRAIN_TIMEOUT_S = 8.0
+
+# Longest deliver() waits for a queued message to be posted
+DELIVERY_WAIT_S = 30.0
+
+# Joins merged messages
+MERGE_SEPARATOR = "\n\n"
+
+# (bot_token, chat_id)
+ChatKey = Tuple[str, str]
+
+
+@dataclass
+class DeliveryResult:
+    """Outcome of one sendMessage call."""
+    ok: bool
+    retryable: bool = False
+    retry_after: Optional[float] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class _Outgoing:
+    """One queued message."""
+    sender: "TelegramSender"
+    text: str
+    parse_mode: str
+    enqueued: float = field(default_factory=time.monotonic)
+    attempts: int = 0
+    mergeable: bool = True
+    # Resolved True when posted, False when dropped (deliver() only)
+    delivered: Optional["asyncio.Future[bool]"] = None
+    # Called once with the same outcome (put() only)
+    on_settle: Optional[Callable[[bool], None]] = None
+
+    def settle(self, ok: bool) -> None:
+        if self.delivered is not None and not self.delivered.done():
+            self.delivered.set_result(ok)
+        if self.on_settle is not None:
+            callback, self.on_settle = self.on_settle, None
+            try:
+                callback(ok)
+            except Exception as e:
+                log("error", "Telegram delivery callback failed", error=str(e))
+
+
+class TelegramOutbox:
+    """Per-chat message queues drained by one background worker."""
+
+    def __init__(
+        self,
+        chat_interval: float = CHAT_INTERVAL_S,
+        max_queued: int = MAX_QUEUED,
+        max_length: Optional[int] = None,
+    ):
+        from src.integrations.telegram import MAX_MESSAGE_LENGTH
+
+        self.chat_interval = chat_interval
+        self.max_queued = max_queued
+        self.max_length = max_length or MAX_MESSAGE_LENGTH
+        self._chats: Dict[ChatKey, Deque[_Outgoing]] = {}
+        self._next_send: Dict[ChatKey, float] = {}
+        self._queued = 0
+        self._wake: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        # Stats
+        self.delivered = 0
+        self.posts = 0
+        self.dropped: Dict[str, int] = collections.Counter()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the delivery worker on the running loop."""
+        if not self.running:
+            self._wake = asyncio.Event()
+            self._task = asyncio.get_running_loop().create_task(
+                self._run(), name="telegram-outbox"
+            )
+
+    def put(
+        self,
+        sender: "TelegramSender",
+        text: str,
+        parse_mode: str = "HTML",
+        on_settle: Optional[Callable[[bool], None]] = None,
+    ) -> bool:
+        """
+        Queue a message for sender's chat.
+
+        Args:
+            on_settle: Called with True once posted, False once dropped
+
+        Returns:
+            True if queued, False if dropped because the queue is full
+        """
+        return self._enqueue(_Outgoing(sender, text, parse_mode, on_settle=on_settle))
+
+    async def deliver(
+        self,
+        sender: "TelegramSender",
+        text: str,
+        parse_mode: str = "HTML",
+        timeout: float = DELIVERY_WAIT_S,
+    ) -> bool:
+        """
+        Queue a message and wait until the worker has posted it.
+
+        Returns:
+            True once posted; False if dropped, or still queued after timeout
+            (it stays queued and may yet be delivered)
+        """
+        item = _Outgoing(sender, text, parse_mode,
+                         delivered=asyncio.get_running_loop().create_future())
+        if not self._enqueue(item):
+            return False
+        try:
+            return await asyncio.wait_for(asyncio.shield(item.delivered), timeout)
+        except asyncio.TimeoutError:
+            log("warn", "Telegram delivery not confirmed in time",
+                timeout_s=timeout, pending=self._queued)
+            return False
+
+    def _enqueue(self, item: _Outgoing) -> bool:
+        if self._queued >= self.max_queued:
+            self._drop("queue_full")
+            item.settle(False)
+            return False
+        key = (item.sender.bot_token, str(item.sender.chat_id))
+        self._chats.setdefault(key, collections.deque()).append(item)
+        self._queued += 1
+        metrics.gauge("ivcrush.telegram.queue_depth", self._queued)
+        if self._wake is not None:
+            self._wake.set()
+        return True
+
+    def pending(self) -> int:
+        return self._queued
+
+    async def flush(self, timeout: float) -> bool:
+        """Wait until the queue is empty. Returns False on timeout."""
+        deadline = time.monotonic() + timeout
+        while self._queued and time.monotonic() < deadline and self.running:
+            await asyncio.sleep(0.05)
+        return self._queued == 0
+
+    async def stop(self, drain_timeout: float = DRAIN_TIMEOUT_S) -> None:
+        """Drain what can be sent within drain_timeout, then stop the worker."""
+        if self._task is None:
+            return
+        if self._queued and not await self.flush(drain_timeout):
+            log("warn", "Telegram outbox not drained at shutdown", pending=self._queued)
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        for queue in self._chats.values():
+            for item in queue:
+                self._drop("shutdown")
+                item.settle(False)
+            queue.clear()
+        self._queued = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "pending": self._queued,
+            "chats": sum(1 for q in self._chats.values() if q),
+            "delivered": self.delivered,
+            "posts": self.posts,
+            "dropped": dict(self.dropped),
+        }
+
+    # ------------------------------------------------------------------
+    # Worker
+
+    async def _run(self) -> None:
+        while True:
+            now = time.monotonic()
+            ready = [
+                key for key, queue in self._chats.items()
+                if queue and self._next_send.get(key, 0.0) <= now
+            ]
+            if not ready:
+                await self._sleep_until_due(now)
+                continue
+            # Longest-waiting chat first
+            ready.sort(key=lambda key: self._next_send.get(key, 0.0))
+            for key in ready:
+                try:
+                    await self._deliver(key)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    log("error", "Telegram outbox delivery crashed", error=str(e))
+
+    async def _sleep_until_due(self, now: float) -> None:
+        due = [
+            self._next_send.get(key, 0.0)
+            for key, queue in self._chats.items() if queue
+        ]
+        self._wake.clear()
+        timeout = max(0.0, min(due) - now) if due else None
+        try:
+            await asyncio.wait_for(self._wake.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def _take_batch(self, queue: Deque[_Outgoing]) -> List[_Outgoing]:
+        """Pop the next message plus any that can be merged into its post."""
+        batch = [queue.popleft()]
+        length = len(batch[0].text)
+        while queue and batch[0].mergeable:
+            nxt = queue[0]
+            merged_length = length + len(MERGE_SEPARATOR) + len(nxt.text)
+            if not nxt.mergeable or nxt.parse_mode != batch[0].parse_mode or merged_length > self.max_length:
+                break
+            batch.append(queue.popleft())
+            length = merged_length
+        return batch
+
+    async def _deliver(self, key: ChatKey) -> None:
+        queue = self._chats[key]
+        batch = self._take_batch(queue)
+        first = batch[0]
+        text = MERGE_SEPARATOR.join(item.text for item in batch)
+        for item in batch:
+            item.attempts += 1
+
+        try:
+            result = await first.sender._post(text, first.parse_mode)
+        except Exception as e:
+            result = DeliveryResult(ok=False, retryable=True, error=f"{type(e).__name__}: {e}")
+        now = time.monotonic()
+        self._next_send[key] = now + self.chat_interval
+        self.posts += 1
+
+        if result.ok:
+            self._queued -= len(batch)
+            self.delivered += len(batch)
+            if len(batch) > 1:
+                metrics.count("ivcrush.telegram.merged", value=len(batch) - 1)
+            for item in batch:
+                metrics.record("ivcrush.telegram.delivery_ms", (now - item.enqueued) * 1000)
+                item.settle(True)
+        elif result.retry_after is not None:
+            # Flood control: hold this chat; 429s do not use up attempts
+            for item in batch:
+                item.attempts -= 1
+            self._next_send[key] = now + result.retry_after
+            queue.extendleft(reversed(batch))
+            metrics.count("ivcrush.telegram.throttled")
+            log("warn", "Telegram flood control, holding chat",
+                retry_after=result.retry_after, pending=len(queue))
+        elif len(batch) > 1 and not result.retryable:
+            # A merged post was rejected: send its parts separately
+            for item in batch:
+                item.attempts -= 1
+                item.mergeable = False
+            queue.extendleft(reversed(batch))
+            log("warn", "Merged Telegram post rejected, splitting",
+                parts=len(batch), error=result.error)
+        elif result.retryable and first.attempts < MAX_ATTEMPTS:
+            self._next_send[key] = now + RETRY_BACKOFF_S * 2 ** (first.attempts - 1)
+            queue.extendleft(reversed(batch))
+        else:
+            reason = "retries_exhausted" if result.retryable else "rejected"
+            self._queued -= len(batch)
+            for item in batch:
+                self._drop(reason)
+                item.settle(False)
+            log("error", "Telegram message dropped", reason=reason,
+                messages=len(batch), error=result.error)
+
+        metrics.gauge("ivcrush.telegram.queue_depth", self._queued)
+
+    def _drop(self, reason: str) -> None:
+        self.dropped[reason] += 1
+        metrics.count("ivcrush.telegram.dropped", {"reason": reason})
+
+
+# Process-wide outbox, started by the app lifespan
+_outbox: Optional[TelegramOutbox] = None
+
+
+def get_outbox() -> Optional[TelegramOutbox]:
+    """The running outbox, or None when messages are sent inline."""
+    if _outbox is not None and _outbox.running:
+        return _outbox
+    return None
+
+
+def start_outbox(**kwargs: Any) -> TelegramOutbox:
+    """Create and start the process-wide outbox."""
+    global _outbox
+    _outbox = TelegramOutbox(**kwargs)
+    _outbox.start()
+    return _outbox
+
+
+async def stop_outbox(drain_timeout: float = DRAIN_TIMEOUT_S) -> None:
+    """Drain and stop the outbox; later sends go inline."""
+    global _outbox
+    if _outbox is not None:
+        await _outbox.stop(drain_timeout)
+        _outbox = None
+
+
+def outbox_stats() -> Dict[str, Any]:
+    """Queue state for health endpoints."""
+    return _outbox.stats() if _outbox is not None else {"running": False}
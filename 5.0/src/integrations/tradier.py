@@ -11,9 +11,14 @@ from typing import Dict, List, Any, Optional
 
 from src.core.logging import log, get_request_id
 from src.core import metrics
+from src.core.hedging import get_hedge_policy
+from src.core.rate_limit import get_bucket, parse_retry_after
 
 BASE_URL = "https://api.tradier.com/v1"
 
+# Symbols per multi-symbol quote request (keeps the query string short)
+MAX_QUOTE_SYMBOLS = 100
+
 
 class TradierRateLimitError(Exception):
     """Raised when Tradier returns 429 rate limit."""
@@ -23,10 +28,15 @@ class TradierRateLimitError(Exception):
 
 
 class TradierClient:
-    """Async Tradier API client with rate limit handling."""
+    """Async Tradier API client with rate limit handling.
+
+    With hedge=True, a GET that hasn't answered by Tradier's observed p95
+    is sent a second time and the first response wins (see src.core.hedging).
+    """
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, hedge: bool = False):
         self.api_key = api_key
+        self.hedge = hedge
         self.headers = {
             "Authorization": f"Bearer {api_key}",
             "Accept": "application/json",
@@ -36,7 +46,7 @@ class TradierClient:
         """Handle 429 rate limit response with retry-after."""
         if response.status_code == 429:
             # Parse Retry-After header (seconds to wait)
-            retry_after = int(response.headers.get("Retry-After", "60"))
+            retry_after = int(parse_retry_after(response.headers.get("Retry-After"), 60))
             log("warn", "Tradier rate limit hit", retry_after=retry_after)
             raise TradierRateLimitError(retry_after)
 
@@ -48,54 +58,61 @@ class TradierClient:
         """Make authenticated request to Tradier API with retry handling."""
         start_time = time.time()
         success = False
+        bucket = get_bucket("tradier")
+        url = f"{BASE_URL}/{endpoint}"
+        # Include request ID for distributed tracing
+        headers = {**self.headers, "X-Request-ID": get_request_id()}
+
+        async def send(_token: Any = None) -> httpx.Response:
+            async with httpx.AsyncClient(timeout=30) as client:
+                return await client.get(url, headers=headers, params=params)
 
         for attempt in range(3):
             try:
-                async with httpx.AsyncClient(timeout=30) as client:
-                    url = f"{BASE_URL}/{endpoint}"
-                    # Include request ID for distributed tracing
-                    headers = {**self.headers, "X-Request-ID": get_request_id()}
-                    response = await client.get(url, headers=headers, params=params)
-
-                    # Handle rate limit specially
-                    if response.status_code == 429:
-                        retry_after = int(response.headers.get("Retry-After", "60"))
-                        log("warn", "Tradier rate limit, waiting", seconds=retry_after)
-                        await asyncio.sleep(min(retry_after, 120))
-                        continue
+                if self.hedge:
+                    # Bucket waits are not latency: the hedge clock starts after acquire
+                    response = await get_hedge_policy("tradier").run(send, acquire=bucket.acquire)
+                else:
+                    await bucket.acquire()
+                    response = await send()
+
+                # Rate limited: hold every Tradier caller until the window passes
+                if response.status_code == 429:
+                    bucket.penalize(parse_retry_after(response.headers.get("Retry-After"), 60))
+                    continue
 
-                    if response.status_code != 200:
-                        log("warn", "Tradier API error",
-                            endpoint=endpoint,
-                            status=response.status_code,
-                            response=response.text[:200] if response.text else "empty")
-                        if attempt < 2:
-                            await asyncio.sleep(2 ** attempt)
-                            continue
-                        duration_ms = (time.time() - start_time) * 1000
-                        metrics.api_call("tradier", duration_ms, success=False)
-                        return {}
-
-                    # Handle empty responses gracefully
-                    if not response.content:
-                        log("warn", "Tradier returned empty response", endpoint=endpoint)
-                        duration_ms = (time.time() - start_time) * 1000
-                        metrics.api_call("tradier", duration_ms, success=False)
-                        return {}
-
-                    try:
-                        result = response.json()
-                        duration_ms = (time.time() - start_time) * 1000
-                        metrics.api_call("tradier", duration_ms, success=True)
-                        return result
-                    except ValueError:
-                        log("error", "Tradier returned invalid JSON",
-                            endpoint=endpoint,
-                            status=response.status_code,
-                            content=response.text[:200] if response.text else "empty")
-                        duration_ms = (time.time() - start_time) * 1000
-                        metrics.api_call("tradier", duration_ms, success=False)
-                        return {}
+                if response.status_code != 200:
+                    log("warn", "Tradier API error",
+                        endpoint=endpoint,
+                        status=response.status_code,
+                        response=response.text[:200] if response.text else "empty")
+                    if attempt < 2:
+                        await asyncio.sleep(2 ** attempt)
+                        continue
+                    duration_ms = (time.time() - start_time) * 1000
+                    metrics.api_call("tradier", duration_ms, success=False)
+                    return {}
+
+                # Handle empty responses gracefully
+                if not response.content:
+                    log("warn", "Tradier returned empty response", endpoint=endpoint)
+                    duration_ms = (time.time() - start_time) * 1000
+                    metrics.api_call("tradier", duration_ms, success=False)
+                    return {}
+
+                try:
+                    result = response.json()
+                    duration_ms = (time.time() - start_time) * 1000
+                    metrics.api_call("tradier", duration_ms, success=True)
+                    return result
+                except ValueError:
+                    log("error", "Tradier returned invalid JSON",
+                        endpoint=endpoint,
+                        status=response.status_code,
+                        content=response.text[:200] if response.text else "empty")
+                    duration_ms = (time.time() - start_time) * 1000
+                    metrics.api_call("tradier", duration_ms, success=False)
+                    return {}
 
             except (httpx.TimeoutException, httpx.ConnectError) as e:
                 log("warn", "Tradier request failed", endpoint=endpoint, error=str(e), attempt=attempt+1)
@@ -121,6 +138,34 @@ class TradierClient:
 
         return quote
 
+    async def get_quotes(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get quotes for several symbols, MAX_QUOTE_SYMBOLS per request.
+
+        One call (and one rate limit token) per chunk instead of per symbol.
+
+        Args:
+            symbols: Stock symbols
+
+        Returns:
+            Dict mapping symbol -> quote; symbols Tradier did not return are absent
+        """
+        symbols = list(dict.fromkeys(symbols))
+        quotes: Dict[str, Dict[str, Any]] = {}
+        for i in range(0, len(symbols), MAX_QUOTE_SYMBOLS):
+            chunk = symbols[i:i + MAX_QUOTE_SYMBOLS]
+            log("debug", "Fetching quotes", count=len(chunk))
+            data = await self._request("markets/quotes", {"symbols": ",".join(chunk)})
+
+            quote = data.get("quotes", {}).get("quote", [])
+            if not isinstance(quote, list):
+                quote = [quote] if quote else []
+            for q in quote:
+                if q.get("symbol"):
+                    quotes[q["symbol"]] = q
+
+        return quotes
+
     async def get_options_chain(
         self,
         symbol: str,
@@ -3,25 +3,28 @@ Twelve Data client for stock data.
 
 Reliable source for historical prices and current quotes.
 Free tier: 800 API calls/day, 8 calls/minute.
+
+Multi-symbol time_series requests bill one credit per symbol, so they save
+round trips rather than quota: the rate limit bucket is charged per symbol.
 """
 
 import asyncio
 import os
-import time
 from typing import Dict, Any, Optional, List
 from datetime import date, timedelta
 
 import httpx
 
 from src.core.logging import log
-
-# Rate limit protection (8 calls/min = 1 call per 7.5 seconds)
-MIN_REQUEST_INTERVAL = 7.5
+from src.core.rate_limit import get_bucket
 
 # API Configuration
 TWELVE_DATA_KEY = os.environ.get("TWELVE_DATA_KEY", "")
 BASE_URL = "https://api.twelvedata.com"
 
+# Symbols per multi-symbol time_series request (one credit each)
+MAX_BATCH_SYMBOLS = 8
+
 
 class TwelveDataClient:
     """Async client for Twelve Data API."""
@@ -29,8 +32,6 @@ class TwelveDataClient:
     def __init__(self, api_key: Optional[str] = None):
         self._api_key = api_key or TWELVE_DATA_KEY
         self._client: Optional[httpx.AsyncClient] = None
-        self._rate_lock = asyncio.Lock()
-        self._last_request_time = 0.0
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client."""
@@ -44,29 +45,31 @@ class TwelveDataClient:
             await self._client.aclose()
             self._client = None
 
-    async def _request(self, endpoint: str, params: Dict[str, Any], symbol: str = "unknown") -> Optional[Dict]:
-        """Make rate-limited API request with retry."""
+    async def _request(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        symbol: str = "unknown",
+        credits: int = 1,
+    ) -> Optional[Dict]:
+        """Make rate-limited API request with retry (credits = symbols billed)."""
         if not self._api_key:
             log("error", "TWELVE_DATA_KEY not configured")
             return None
 
-        # Thread-safe rate limit protection
-        async with self._rate_lock:
-            now = time.time()
-            wait_time = MIN_REQUEST_INTERVAL - (now - self._last_request_time)
-            if wait_time > 0:
-                await asyncio.sleep(wait_time)
-            self._last_request_time = time.time()
-
         params["apikey"] = self._api_key
         url = f"{BASE_URL}/{endpoint}"
 
         client = await self._get_client()
 
         # Retry logic
+        # Shared 8 calls/min budget (one call per 7.5s) across all callers
+        bucket = get_bucket("twelvedata")
         last_error = None
         for attempt in range(3):
             try:
+                for _ in range(credits):
+                    await bucket.acquire()
                 response = await client.get(url, params=params)
                 data = response.json()
 
@@ -77,12 +80,9 @@ class TwelveDataClient:
                         log("error", "Twelve Data API key invalid", symbol=symbol)
                         return None
                     if "rate limit" in error_msg.lower():
-                        wait = (attempt + 1) * 10
-                        log("warn", f"Twelve Data rate limited, waiting {wait}s",
+                        log("warn", "Twelve Data rate limited",
                             symbol=symbol, attempt=attempt + 1)
-                        await asyncio.sleep(wait)
-                        async with self._rate_lock:
-                            self._last_request_time = time.time()
+                        bucket.penalize((attempt + 1) * 10)
                         continue
                     log("warn", "Twelve Data API error", symbol=symbol, error=error_msg[:100])
                     return None
@@ -151,25 +151,67 @@ class TwelveDataClient:
         if not data or "values" not in data:
             return None
 
-        # Convert to yfinance-compatible format
-        values = data["values"]
-        result = {
-            "Open": {},
-            "High": {},
-            "Low": {},
-            "Close": {},
-            "Volume": {},
-        }
+        return _to_history(data["values"])
+
+    async def get_stock_history_batch(
+        self,
+        symbols: List[str],
+        start_date: str,
+        end_date: Optional[str] = None,
+        interval: str = "1d",
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get historical prices for several symbols over one date window.
+
+        Symbols are sent MAX_BATCH_SYMBOLS per multi-symbol request.
 
-        for v in values:
-            dt = v["datetime"]
-            result["Open"][dt] = float(v["open"])
-            result["High"][dt] = float(v["high"])
-            result["Low"][dt] = float(v["low"])
-            result["Close"][dt] = float(v["close"])
-            result["Volume"][dt] = int(v["volume"])
+        Args:
+            symbols: Stock symbols
+            start_date: First date (YYYY-MM-DD)
+            end_date: Last date (YYYY-MM-DD), or None for latest
+            interval: Data interval (1d, 1wk, 1mo or Twelve Data format)
+
+        Returns:
+            Dict mapping symbol -> history in get_stock_history() format;
+            symbols without data are omitted
+        """
+        interval_map = {"1d": "1day", "1wk": "1week", "1mo": "1month"}
+        td_interval = interval_map.get(interval, interval)
+        histories: Dict[str, Dict[str, Any]] = {}
+
+        for i in range(0, len(symbols), MAX_BATCH_SYMBOLS):
+            chunk = symbols[i:i + MAX_BATCH_SYMBOLS]
+            log("debug", "Fetching batch history from Twelve Data",
+                symbols=len(chunk), start_date=start_date, end_date=end_date)
+            params = {
+                "symbol": ",".join(chunk),
+                "interval": td_interval,
+                "start_date": start_date,
+                "outputsize": 5000,
+            }
+            if end_date:
+                # end_date is exclusive for daily bars
+                params["end_date"] = (
+                    date.fromisoformat(end_date) + timedelta(days=1)
+                ).isoformat()
+
+            data = await self._request(
+                "time_series", params, symbol=",".join(chunk), credits=len(chunk)
+            )
+            if not data:
+                continue
+
+            # A single symbol comes back flat, several come back keyed by symbol
+            per_symbol = {chunk[0]: data} if len(chunk) == 1 else data
+            for symbol in chunk:
+                entry = per_symbol.get(symbol)
+                if not isinstance(entry, dict) or entry.get("status") == "error":
+                    log("debug", "No batch history for symbol", symbol=symbol)
+                    continue
+                if entry.get("values"):
+                    histories[symbol] = _to_history(entry["values"])
 
-        return result
+        return histories
 
     async def get_current_price(self, symbol: str) -> Optional[float]:
         """
@@ -223,3 +265,24 @@ class TwelveDataClient:
             "change": float(data.get("change", 0)) if data.get("change") else None,
             "percent_change": float(data.get("percent_change", 0)) if data.get("percent_change") else None,
         }
+
+
+def _to_history(values: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Convert time_series values to yfinance-compatible OHLCV dicts."""
+    result: Dict[str, Dict[str, Any]] = {
+        "Open": {},
+        "High": {},
+        "Low": {},
+        "Close": {},
+        "Volume": {},
+    }
+
+    for v in values:
+        dt = v["datetime"]
+        result["Open"][dt] = float(v["open"])
+        result["High"][dt] = float(v["high"])
+        result["Low"][dt] = float(v["low"])
+        result["Close"][dt] = float(v["close"])
+        result["Volume"][dt] = int(v["volume"])
+
+    return result
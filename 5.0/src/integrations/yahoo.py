@@ -8,18 +8,17 @@ Uses yfinance library with retry handling for rate limits and transient errors.
 import asyncio
 import atexit
 import json
-import time
 from typing import Dict, Any, Optional
 from concurrent.futures import ThreadPoolExecutor
 
-import yfinance as yf
-
 from src.core.logging import log
+from src.core.rate_limit import get_bucket
+
 
-# Rate limit protection
-_last_request_time = 0
-_rate_limit_lock = asyncio.Lock()
-MIN_REQUEST_INTERVAL = 1.0  # 1 second between requests
+def _yf():
+    """Import yfinance on first use (it pulls in pandas, ~0.5s of cold start)."""
+    import yfinance
+    return yfinance
 
 # Errors that indicate transient API issues (retry-able)
 TRANSIENT_ERROR_PATTERNS = [
@@ -69,22 +68,14 @@ class YahooFinanceClient:
         if not self._executor:
             raise RuntimeError("YahooFinanceClient has been closed")
 
-        global _last_request_time
-
-        # Rate limit protection (lock prevents concurrent requests racing)
-        async with _rate_limit_lock:
-            now = time.time()
-            wait_time = MIN_REQUEST_INTERVAL - (now - _last_request_time)
-            if wait_time > 0:
-                await asyncio.sleep(wait_time)
-            _last_request_time = time.time()
-
         loop = asyncio.get_event_loop()
+        bucket = get_bucket("yahoo")
 
         # Retry logic for rate limits and transient errors
         last_error = None
         for attempt in range(3):
             try:
+                await bucket.acquire()
                 return await loop.run_in_executor(
                     self._executor,
                     lambda: func(*args, **kwargs)
@@ -95,11 +86,9 @@ class YahooFinanceClient:
 
                 # Rate limit - longer backoff
                 if "429" in error_str or "Too Many Requests" in error_str:
-                    wait = (attempt + 1) * 5  # 5, 10, 15 seconds
-                    log("warn", f"Yahoo rate limited, waiting {wait}s",
+                    log("warn", "Yahoo rate limited",
                         symbol=symbol, attempt=attempt+1)
-                    await asyncio.sleep(wait)
-                    _last_request_time = time.time()
+                    bucket.penalize((attempt + 1) * 5)  # 5, 10, 15 seconds
                     continue
 
                 # Transient errors - shorter backoff
@@ -108,7 +97,6 @@ class YahooFinanceClient:
                     log("debug", f"Yahoo transient error, retrying in {wait}s",
                         symbol=symbol, error=error_str[:100], attempt=attempt+1)
                     await asyncio.sleep(wait)
-                    _last_request_time = time.time()
                     continue
 
                 # Non-retryable error - log and return None
@@ -141,7 +129,7 @@ class YahooFinanceClient:
         log("debug", "Fetching stock history", symbol=symbol, period=period)
 
         def _fetch():
-            ticker = yf.Ticker(symbol)
+            ticker = _yf().Ticker(symbol)
             df = ticker.history(period=period, interval=interval)
             if df.empty:
                 return None
@@ -162,7 +150,7 @@ class YahooFinanceClient:
         log("debug", "Fetching current price", symbol=symbol)
 
         def _fetch():
-            ticker = yf.Ticker(symbol)
+            ticker = _yf().Ticker(symbol)
             info = ticker.info
             if not info:
                 return None
@@ -184,7 +172,7 @@ class YahooFinanceClient:
         log("debug", "Fetching earnings info", symbol=symbol)
 
         def _fetch():
-            ticker = yf.Ticker(symbol)
+            ticker = _yf().Ticker(symbol)
             result = {"symbol": symbol}
 
             # Get calendar (next earnings date)
@@ -222,7 +210,7 @@ class YahooFinanceClient:
         log("debug", "Fetching quote", symbol=symbol)
 
         def _fetch():
-            ticker = yf.Ticker(symbol)
+            ticker = _yf().Ticker(symbol)
             info = ticker.info
             if not info:
                 return None
@@ -2,5 +2,6 @@
 
 from .base import BaseJobHandler
 from .handlers import JobRunner
+from .dag import DagExecutor
 
-__all__ = ["BaseJobHandler", "JobRunner"]
+__all__ = ["BaseJobHandler", "JobRunner", "DagExecutor"]
@@ -3,24 +3,33 @@ Base class for job handlers with shared infrastructure.
 
 Extracts common patterns from individual job handlers:
 - Earnings fetch with empty-response handling
+- Run artifacts shared by the jobs of one DAG run (earnings calendar)
 - Date filtering (upcoming days or today-only)
 - Tracked ticker filtering via historical_moves whitelist
+- Pending move queue for windows beyond the TwelveData cap
+- Candidate snapshot written pre-market, reused by later jobs until stale
 - Historical move percentage extraction
 - Full VRP evaluation pipeline (historical + implied move + VRP calc)
+- Bounded-concurrency per-ticker evaluation with per-ticker error collection
 - Rate limiting between API calls
 - Timing/metrics recording
 - Result building with optional error fields
 """
 
 import asyncio
+import contextlib
+import json
 import sqlite3
-from typing import Dict, Any, List, Optional, Set, Tuple
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, TypeVar
 
 from datetime import timedelta
 
 from src.core.config import settings, now_et, today_et
 from src.core.logging import log
 from src.core import metrics
+from src.core.db_executor import run_db
 from src.domain import (
     calculate_vrp,
     HistoricalMovesRepository,
@@ -40,8 +49,13 @@ MAX_DIGEST_CANDIDATES = 40  # Max candidates to consider for digest
 MAX_BACKFILL_TICKERS = 60  # Max tickers to backfill in weekly job
 MAX_OUTCOME_TICKERS = 30  # Max tickers to record outcomes for same-day earnings
 MAX_TWELVEDATA_TICKERS = 10  # 10 × 7.5s rate limit = 75s, safely within 5-min job timeout
+MAX_PENDING_MOVE_AGE_DAYS = 14  # Queued move windows older than this are dropped unprocessed
 RATE_LIMIT_DELAY = 0.5  # Seconds between API calls
 RATE_LIMIT_BATCH_SIZE = 5  # API calls before adding delay
+JOB_CONCURRENCY = 8  # Tickers evaluated in parallel (provider buckets cap request rate)
+PRIME_CONCURRENCY = 3  # Perplexity calls in flight during sentiment prime
+PRIME_BUDGET_DOLLARS = 0.05  # Perplexity spend limit per sentiment prime
+PRIME_TTL_HOURS = 12  # How long primed sentiment stays cached
 
 # Alert thresholds
 PRE_MARKET_ALERT_THRESHOLD = 0.5  # Alert if pre-market move > 50% of historical avg
@@ -50,6 +64,38 @@ AFTER_HOURS_ALERT_THRESHOLD = 1.0  # Only track after-hours moves > 1%
 # API calls per ticker when fetching real implied move (quote + expirations + chain)
 TRADIER_CALLS_PER_TICKER = 3
 
+# Candidate snapshot reuse: a row is re-evaluated once the underlying moved
+# more than SNAPSHOT_PRICE_MOVE_PCT since it was taken, or once it is within
+# SNAPSHOT_REFRESH_MARGIN_MINUTES of SNAPSHOT_TTL_MINUTES old
+SNAPSHOT_TTL_MINUTES = 360
+SNAPSHOT_REFRESH_MARGIN_MINUTES = 30
+SNAPSHOT_PRICE_MOVE_PCT = 1.5
+
+T = TypeVar("T")
+
+# Artifacts of the current DAG run (key -> task producing it); None outside a run.
+# A ContextVar so concurrent dispatches on the shared JobRunner stay separate.
+_run_artifacts: ContextVar[Optional[Dict[Tuple[Any, ...], "asyncio.Future[Any]"]]] = ContextVar(
+    "run_artifacts", default=None
+)
+
+
+@dataclass
+class CandidateSnapshot:
+    """
+    Snapshot view for one job run (see BaseJobHandler._load_snapshot).
+
+    reusable: (ticker, earnings_date) -> stored _evaluate_vrp() result
+    stale: keys with a snapshot row that must be re-evaluated
+    prices: current price per ticker from one batched quote call
+    refreshed: (ticker, earnings_date, result) evaluated this run, to write back
+    """
+
+    reusable: Dict[Tuple[str, str], Dict[str, Any]] = field(default_factory=dict)
+    stale: Set[Tuple[str, str]] = field(default_factory=set)
+    prices: Dict[str, float] = field(default_factory=dict)
+    refreshed: List[Tuple[str, str, Dict[str, Any]]] = field(default_factory=list)
+
 
 def filter_to_tracked_tickers(
     earnings: List[Dict[str, Any]],
@@ -112,6 +158,61 @@ class BaseJobHandler:
         metrics.record("ivcrush.job.duration", duration_ms, {"job": job_name})
         return round(duration_ms)
 
+    # ------------------------------------------------------------------ #
+    #  Run Artifacts
+    # ------------------------------------------------------------------ #
+
+    @contextlib.contextmanager
+    def share_artifacts(self) -> Iterator[None]:
+        """
+        Share run artifacts between the jobs started inside this block.
+
+        Used by DagExecutor around one run; tasks created inside inherit
+        the scope. Artifacts still being produced on exit are cancelled.
+        """
+        artifacts: Dict[Tuple[Any, ...], "asyncio.Future[Any]"] = {}
+        token = _run_artifacts.set(artifacts)
+        try:
+            yield
+        finally:
+            _run_artifacts.reset(token)
+            for task in artifacts.values():
+                task.cancel()
+
+    async def _run_artifact(
+        self, key: Tuple[Any, ...], produce: Callable[[], Awaitable[T]]
+    ) -> T:
+        """
+        Produce an artifact once per run; concurrent jobs await the same fetch.
+
+        Outside share_artifacts() this is just `await produce()`. A failure
+        is shared too, as each job would have hit it on its own.
+
+        Args:
+            key: Artifact key, name first (e.g. ("earnings_calendar", "3month"))
+            produce: Coroutine function producing the artifact
+        """
+        artifacts = _run_artifacts.get()
+        if artifacts is None:
+            return await produce()
+
+        task = artifacts.get(key)
+        if task is None:
+            task = asyncio.ensure_future(produce())
+            artifacts[key] = task
+        else:
+            metrics.count("ivcrush.job.artifact_shared", {"artifact": key[0]})
+        return await asyncio.shield(task)
+
+    async def _earnings_calendar(self, horizon: str = "3month") -> List[Dict[str, Any]]:
+        """Alpha Vantage earnings calendar, fetched once per DAG run."""
+        earnings = await self._run_artifact(
+            ("earnings_calendar", horizon),
+            lambda: self.alphavantage.get_earnings_calendar(horizon=horizon),
+        )
+        # Jobs filter their own copy; never hand out the shared list
+        return list(earnings) if earnings else earnings
+
     # ------------------------------------------------------------------ #
     #  Earnings Pipeline
     # ------------------------------------------------------------------ #
@@ -132,10 +233,7 @@ class BaseJobHandler:
         Returns:
             List of earnings dicts, or None if empty/unavailable
         """
-        if horizon:
-            earnings = await self.alphavantage.get_earnings_calendar(horizon=horizon)
-        else:
-            earnings = await self.alphavantage.get_earnings_calendar()
+        earnings = await self._earnings_calendar(horizon or "3month")
 
         if not earnings:
             log("warn", "Empty earnings calendar from Alpha Vantage", job=job_name)
@@ -263,6 +361,419 @@ class BaseJobHandler:
         finally:
             conn.close()
 
+    # ------------------------------------------------------------------ #
+    #  Pending Move Queue
+    # ------------------------------------------------------------------ #
+
+    @staticmethod
+    def _queue_pending_moves(
+        db_path: str,
+        job: str,
+        items: List[Dict[str, Any]],
+        done: Iterable[Tuple[str, str]] = (),
+    ) -> int:
+        """
+        Queue move windows for the job's next run and drop finished ones.
+
+        Queued windows stay in the table until their move is saved, so a
+        failed fetch, a failed save or a crash mid-run leaves them for the
+        next run. Re-queuing keeps the original queued_at, so windows that
+        never succeed still age out after MAX_PENDING_MOVE_AGE_DAYS. Uses
+        CREATE TABLE IF NOT EXISTS so no migration is needed.
+
+        Args:
+            db_path: Path to ivcrush.db
+            job: Job name that owns the queue (e.g. "outcome_recorder")
+            items: Dicts with 'symbol' and 'earnings_date' keys to (re)queue
+            done: (ticker, earnings_date) windows to remove from the queue
+
+        Returns:
+            Number of items queued
+        """
+        conn = sqlite3.connect(db_path)
+        try:
+            with conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS pending_moves (
+                        job TEXT NOT NULL,
+                        ticker TEXT NOT NULL,
+                        earnings_date TEXT NOT NULL,
+                        payload TEXT NOT NULL,
+                        queued_at TEXT NOT NULL DEFAULT (datetime('now')),
+                        UNIQUE(job, ticker, earnings_date)
+                    )
+                """)
+                conn.executemany(
+                    "DELETE FROM pending_moves WHERE job = ? AND ticker = ? AND earnings_date = ?",
+                    [(job, ticker, earnings_date) for ticker, earnings_date in done],
+                )
+                conn.executemany(
+                    "INSERT OR IGNORE INTO pending_moves (job, ticker, earnings_date, payload) "
+                    "VALUES (?, ?, ?, ?)",
+                    [(job, i["symbol"], i["earnings_date"], json.dumps(i)) for i in items],
+                )
+            return len(items)
+        except sqlite3.Error as e:
+            log("error", "Failed to queue pending moves", job=job, error=str(e))
+            return 0
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _get_pending_moves(db_path: str, job: str) -> List[Dict[str, Any]]:
+        """
+        Return a job's queued move windows, oldest first.
+
+        Entries older than MAX_PENDING_MOVE_AGE_DAYS are dropped; the rest
+        stay queued until _save_move_records() saves them. Returns an empty
+        list if the table doesn't exist yet.
+
+        Args:
+            db_path: Path to ivcrush.db
+            job: Job name that owns the queue
+
+        Returns:
+            Item dicts as passed to _queue_pending_moves()
+        """
+        conn = sqlite3.connect(db_path)
+        try:
+            with conn:
+                conn.execute(
+                    "DELETE FROM pending_moves WHERE job = ? AND queued_at < datetime('now', ?)",
+                    (job, f"-{MAX_PENDING_MOVE_AGE_DAYS} days"),
+                )
+                rows = conn.execute(
+                    "SELECT payload FROM pending_moves WHERE job = ? "
+                    "ORDER BY queued_at, ticker",
+                    (job,),
+                ).fetchall()
+            return [json.loads(row[0]) for row in rows]
+        except sqlite3.OperationalError:
+            # Table doesn't exist yet (nothing ever queued)
+            return []
+        finally:
+            conn.close()
+
+    async def _plan_move_windows(
+        self,
+        repo: HistoricalMovesRepository,
+        db_path: str,
+        items: List[Dict[str, Any]],
+        job: str,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Pick the move windows to fetch this run.
+
+        The job's queued windows from earlier runs come first, then the new
+        ones. Windows already in historical_moves are skipped (one batch
+        query) and leave the queue, and anything beyond MAX_TWELVEDATA_TICKERS
+        is queued for the next run instead of being dropped.
+
+        Args:
+            repo: HistoricalMovesRepository instance
+            db_path: Path to ivcrush.db (pending queue)
+            items: Dicts with 'symbol' and 'earnings_date' keys
+            job: Job name for the queue, logging and metrics
+
+        Returns:
+            (items_to_fetch, skipped_duplicate)
+        """
+        pending = await run_db(self._get_pending_moves, db_path, job)
+        if pending:
+            log("info", "Resuming queued move windows", count=len(pending), job=job)
+
+        merged: List[Dict[str, Any]] = []
+        seen: Set[Tuple[str, str]] = set()
+        for item in pending + items:
+            key = (item["symbol"], item["earnings_date"])
+            if key not in seen:
+                seen.add(key)
+                merged.append(item)
+
+        existing = await run_db(repo.get_moves_batch, sorted({i["symbol"] for i in merged}))
+        recorded = {
+            (ticker, m.get("earnings_date"))
+            for ticker, moves in existing.items()
+            for m in moves
+        }
+        to_fetch = [i for i in merged if (i["symbol"], i["earnings_date"]) not in recorded]
+
+        batch, overflow = to_fetch[:MAX_TWELVEDATA_TICKERS], to_fetch[MAX_TWELVEDATA_TICKERS:]
+        already_done = [
+            (i["symbol"], i["earnings_date"]) for i in pending
+            if (i["symbol"], i["earnings_date"]) in recorded
+        ]
+        if overflow or already_done:
+            queued = await run_db(self._queue_pending_moves, db_path, job, overflow, already_done)
+            if overflow:
+                metrics.gauge("ivcrush.job.moves_queued", queued, {"job": job})
+                log("info", "Queued move windows for next run",
+                    queued=queued, processing=len(batch), job=job)
+
+        return batch, len(merged) - len(to_fetch)
+
+    async def _save_move_records(
+        self,
+        repo: HistoricalMovesRepository,
+        db_path: str,
+        to_fetch: List[Dict[str, Any]],
+        move_records: List[Dict[str, Any]],
+        job: str,
+    ) -> Tuple[int, List[str]]:
+        """
+        Save computed moves and settle the job's pending queue.
+
+        Moves are written in one transaction; if that fails they are retried
+        one by one so a single bad row does not cost the whole batch. Saved
+        windows leave the queue. Every other window in to_fetch (fetch
+        failed, no price data, save failed) is queued for the next run.
+
+        Args:
+            repo: HistoricalMovesRepository instance
+            db_path: Path to ivcrush.db (pending queue)
+            to_fetch: Windows returned by _plan_move_windows()
+            move_records: Move dicts computed from the fetched prices
+            job: Job name for the queue and logging
+
+        Returns:
+            (moves_saved, tickers whose save failed)
+        """
+        saved: List[Dict[str, Any]] = []
+        failed: List[str] = []
+        if move_records:
+            try:
+                await run_db(repo.save_moves, move_records)
+                saved = move_records
+            except Exception as ex:
+                log("warn", "Batch move save failed, saving one by one",
+                    count=len(move_records), error=str(ex), job=job)
+                for move in move_records:
+                    try:
+                        await run_db(repo.save_move, move)
+                        saved.append(move)
+                    except Exception as ex:
+                        failed.append(move["ticker"])
+                        log("warn", "Failed to save move",
+                            ticker=move["ticker"], error=str(ex), job=job)
+
+        done = {(m["ticker"], m["earnings_date"]) for m in saved}
+        retry = [i for i in to_fetch if (i["symbol"], i["earnings_date"]) not in done]
+        if to_fetch:
+            await run_db(self._queue_pending_moves, db_path, job, retry, sorted(done))
+        if retry:
+            log("info", "Move windows left queued for next run", count=len(retry), job=job)
+        return len(saved), failed
+
+    # ------------------------------------------------------------------ #
+    #  Candidate Snapshot
+    # ------------------------------------------------------------------ #
+
+    @staticmethod
+    def _save_candidate_snapshot(
+        db_path: str, rows: List[Tuple[str, str, Dict[str, Any]]]
+    ) -> int:
+        """
+        Upsert evaluated candidates into the candidate_snapshot table.
+
+        Pre-market prep writes the full set; later jobs write back the rows
+        they re-evaluated. Uses CREATE TABLE IF NOT EXISTS so no migration
+        is needed.
+
+        Args:
+            db_path: Path to ivcrush.db
+            rows: (ticker, earnings_date, _evaluate_vrp() result) tuples
+
+        Returns:
+            Number of rows written
+        """
+        conn = sqlite3.connect(db_path)
+        try:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS candidate_snapshot (
+                    ticker TEXT NOT NULL,
+                    earnings_date TEXT NOT NULL,
+                    price REAL,
+                    implied_move_pct REAL,
+                    vrp_ratio REAL,
+                    tier TEXT,
+                    used_real INTEGER NOT NULL,
+                    liquidity TEXT,
+                    payload TEXT NOT NULL,
+                    snapshot_at TEXT NOT NULL DEFAULT (datetime('now')),
+                    PRIMARY KEY (ticker, earnings_date)
+                )
+            """)
+            values = []
+            for ticker, earnings_date, result in rows:
+                im_result = result["im_result"]
+                payload = {k: v for k, v in result.items() if k != "api_calls"}
+                values.append((
+                    ticker,
+                    earnings_date,
+                    im_result.get("price"),
+                    result["implied_move_pct"],
+                    result["vrp_data"].get("vrp_ratio"),
+                    result["vrp_data"].get("tier"),
+                    int(bool(result["used_real"])),
+                    json.dumps(im_result.get("liquidity")),
+                    json.dumps(payload, default=str),
+                ))
+            conn.executemany(
+                "INSERT OR REPLACE INTO candidate_snapshot "
+                "(ticker, earnings_date, price, implied_move_pct, vrp_ratio, tier, "
+                "used_real, liquidity, payload, snapshot_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, datetime('now'))",
+                values,
+            )
+            conn.commit()
+            return len(values)
+        except sqlite3.Error as e:
+            log("error", "Failed to save candidate snapshot", error=str(e))
+            return 0
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _get_candidate_snapshot(
+        db_path: str, tickers: List[str]
+    ) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """
+        Snapshot rows younger than SNAPSHOT_TTL_MINUTES for the given tickers.
+
+        Returns an empty dict if the table doesn't exist yet.
+
+        Args:
+            db_path: Path to ivcrush.db
+            tickers: Ticker symbols to look up
+
+        Returns:
+            (ticker, earnings_date) -> stored result, plus 'snapshot_price'
+            and 'age_minutes' keys
+        """
+        if not tickers:
+            return {}
+        conn = sqlite3.connect(db_path)
+        try:
+            placeholders = ",".join("?" * len(tickers))
+            rows = conn.execute(
+                f"SELECT ticker, earnings_date, price, payload, "
+                f"(julianday('now') - julianday(snapshot_at)) * 1440 "
+                f"FROM candidate_snapshot WHERE ticker IN ({placeholders}) "
+                f"AND snapshot_at >= datetime('now', ?)",
+                (*tickers, f"-{SNAPSHOT_TTL_MINUTES} minutes"),
+            ).fetchall()
+        except sqlite3.OperationalError:
+            # Table doesn't exist yet (pre-market prep never ran)
+            return {}
+        finally:
+            conn.close()
+
+        snapshot: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for ticker, earnings_date, price, payload, age in rows:
+            entry = json.loads(payload)
+            entry["snapshot_price"] = price
+            entry["age_minutes"] = age
+            snapshot[(ticker, earnings_date)] = entry
+        return snapshot
+
+    @staticmethod
+    def _quote_price(quote: Optional[Dict[str, Any]]) -> Optional[float]:
+        """Last trade, falling back to close / previous close."""
+        if not quote:
+            return None
+        return quote.get("last") or quote.get("close") or quote.get("prevclose")
+
+    async def _fetch_prices(self, tickers: List[str]) -> Dict[str, float]:
+        """Current prices from one batched Tradier quote call (per 100 symbols)."""
+        if not tickers:
+            return {}
+        quotes = await self.tradier.get_quotes(tickers)
+        prices: Dict[str, float] = {}
+        for ticker in tickers:
+            price = self._quote_price(quotes.get(ticker))
+            if price:
+                prices[ticker] = price
+        return prices
+
+    async def _load_snapshot(
+        self, db_path: str, items: List[Dict[str, Any]], job: str
+    ) -> CandidateSnapshot:
+        """
+        Split a job's candidates into snapshot rows it can reuse and the rest.
+
+        A row is reused while it is not near expiry and the underlying has
+        not moved more than SNAPSHOT_PRICE_MOVE_PCT since it was taken; the
+        check costs one quote call for all tickers instead of the
+        TRADIER_CALLS_PER_TICKER a re-evaluation costs.
+
+        Args:
+            db_path: Path to ivcrush.db
+            items: Earnings dicts (with 'symbol' and 'report_date' keys)
+            job: Job name for logging and metrics
+
+        Returns:
+            CandidateSnapshot for this run
+        """
+        tickers = list(dict.fromkeys(e["symbol"] for e in items))
+        rows = await run_db(self._get_candidate_snapshot, db_path, tickers)
+        snapshot = CandidateSnapshot(prices=await self._fetch_prices(tickers))
+
+        for e in items:
+            key = (e["symbol"], e["report_date"])
+            row = rows.get(key)
+            if row is None:
+                continue
+            price = snapshot.prices.get(e["symbol"])
+            base = row.pop("snapshot_price")
+            age = row.pop("age_minutes")
+            moved = (
+                price is None or not base
+                or abs(price - base) / base * 100 > SNAPSHOT_PRICE_MOVE_PCT
+            )
+            if moved or age >= SNAPSHOT_TTL_MINUTES - SNAPSHOT_REFRESH_MARGIN_MINUTES:
+                snapshot.stale.add(key)
+            else:
+                snapshot.reusable[key] = row
+
+        metrics.count("ivcrush.job.snapshot_reused", {"job": job}, len(snapshot.reusable))
+        log("info", "Loaded candidate snapshot",
+            reused=len(snapshot.reusable), stale=len(snapshot.stale),
+            missing=len(items) - len(snapshot.reusable) - len(snapshot.stale), job=job)
+        return snapshot
+
+    async def _evaluate_vrp_snapshot(
+        self,
+        repo: HistoricalMovesRepository,
+        ticker: str,
+        earnings_date: str,
+        snapshot: CandidateSnapshot,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        _evaluate_vrp(), served from the snapshot when the row is reusable.
+
+        Re-evaluated results are recorded on the snapshot for _save_snapshot().
+        """
+        cached = snapshot.reusable.get((ticker, earnings_date))
+        if cached is not None:
+            return cached
+
+        result = await self._evaluate_vrp(
+            repo, ticker, earnings_date, 0, price=snapshot.prices.get(ticker)
+        )
+        if result is not None:
+            snapshot.refreshed.append((ticker, earnings_date, result))
+        return result
+
+    async def _save_snapshot(
+        self, db_path: str, snapshot: CandidateSnapshot, job: str
+    ) -> int:
+        """Write back the rows a job re-evaluated. Returns rows written."""
+        if not snapshot.refreshed:
+            return 0
+        written = await run_db(self._save_candidate_snapshot, db_path, snapshot.refreshed)
+        metrics.count("ivcrush.job.snapshot_refreshed", {"job": job}, written)
+        return written
+
     # ------------------------------------------------------------------ #
     #  Historical Data
     # ------------------------------------------------------------------ #
@@ -308,6 +819,7 @@ class BaseJobHandler:
         ticker: str,
         earnings_date: str,
         api_calls: int,
+        price: Optional[float] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Full VRP evaluation for a single ticker.
@@ -320,24 +832,24 @@ class BaseJobHandler:
             ticker: Stock symbol
             earnings_date: Earnings date string (YYYY-MM-DD)
             api_calls: Current API call counter (for rate limiting)
+            price: Current price if already quoted (saves the quote call)
 
         Returns:
             Dict with keys: vrp_data, im_result, implied_move_pct, used_real,
             historical_pcts, historical_avg, api_calls (updated counter).
             Returns None if ticker should be skipped (insufficient data).
         """
-        pcts, avg = self._get_historical_pcts(repo, ticker)
+        pcts, avg = await run_db(self._get_historical_pcts, repo, ticker)
         if pcts is None:
             return None
 
-        # Rate limiting for Tradier API calls (3 calls per ticker)
-        api_calls += TRADIER_CALLS_PER_TICKER
-        if api_calls % (RATE_LIMIT_BATCH_SIZE * TRADIER_CALLS_PER_TICKER) == 0:
-            await asyncio.sleep(RATE_LIMIT_DELAY)
+        # Tradier calls (quote + expirations + chain) wait on the shared
+        # "tradier" bucket inside TradierClient
+        api_calls += TRADIER_CALLS_PER_TICKER if price is None else TRADIER_CALLS_PER_TICKER - 1
 
         # Fetch real implied move from Tradier options chain
         im_result = await fetch_real_implied_move(
-            self.tradier, ticker, earnings_date
+            self.tradier, ticker, earnings_date, price=price
         )
         implied_move_pct, used_real = get_implied_move_with_fallback(im_result, avg)
 
@@ -356,6 +868,58 @@ class BaseJobHandler:
             "api_calls": api_calls,
         }
 
+    # ------------------------------------------------------------------ #
+    #  Concurrent Per-Ticker Execution
+    # ------------------------------------------------------------------ #
+
+    @staticmethod
+    async def _run_per_ticker(
+        items: List[Dict[str, Any]],
+        evaluate: Callable[[Dict[str, Any]], Awaitable[Optional[T]]],
+        job: str,
+        concurrency: int = JOB_CONCURRENCY,
+    ) -> Tuple[List[Tuple[Dict[str, Any], T]], List[str]]:
+        """
+        Evaluate earnings items concurrently, at most `concurrency` at a time.
+
+        Request rate is bounded by the provider token buckets the integration
+        clients acquire from (src/core/rate_limit.py), not by this helper, so
+        wall time tracks the API limits rather than the sum of round-trip
+        latencies. One ticker failing does not affect the others.
+
+        Args:
+            items: Earnings dicts (with 'symbol' key)
+            evaluate: Coroutine function returning a result, or None to skip
+            job: Job name for logging
+            concurrency: Max evaluations in flight
+
+        Returns:
+            (results, failed_tickers) - results are (item, result) pairs in
+            input order, excluding skipped items
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def run_one(item: Dict[str, Any]) -> Optional[T]:
+            async with semaphore:
+                return await evaluate(item)
+
+        outcomes = await asyncio.gather(
+            *(run_one(item) for item in items), return_exceptions=True
+        )
+
+        results: List[Tuple[Dict[str, Any], T]] = []
+        failed_tickers: List[str] = []
+        for item, outcome in zip(items, outcomes):
+            if isinstance(outcome, asyncio.CancelledError):
+                raise outcome
+            if isinstance(outcome, Exception):
+                failed_tickers.append(item["symbol"])
+                log("warn", "Failed to evaluate ticker",
+                    ticker=item["symbol"], error=str(outcome), job=job)
+            elif outcome is not None:
+                results.append((item, outcome))
+        return results, failed_tickers
+
     # ------------------------------------------------------------------ #
     #  Rate Limiting
     # ------------------------------------------------------------------ #
@@ -377,6 +941,40 @@ class BaseJobHandler:
         if api_calls > 0 and api_calls % batch_size == 0:
             await asyncio.sleep(delay)
 
+    # ------------------------------------------------------------------ #
+    #  Telegram
+    # ------------------------------------------------------------------ #
+
+    async def _notify(self, text: str, job_name: str) -> Dict[str, Optional[bool]]:
+        """
+        Send a job's Telegram message without waiting for delivery.
+
+        While the outbox runs the message is only queued; when the worker
+        posts or drops it, the outcome is counted as
+        ivcrush.telegram.job_delivery{job, status} (and logged if dropped).
+
+        Args:
+            text: Message text
+            job_name: Metric tag (e.g. "morning_digest")
+
+        Returns:
+            {"sent": queued (or sent inline), "delivered": the outcome if
+            already known (inline send), else None}
+        """
+        outcome: Dict[str, Optional[bool]] = {"delivered": None}
+
+        def settled(ok: bool) -> None:
+            outcome["delivered"] = ok
+            metrics.count(
+                "ivcrush.telegram.job_delivery",
+                {"job": job_name, "status": "delivered" if ok else "dropped"},
+            )
+            if not ok:
+                log("error", "Job Telegram message not delivered", job=job_name)
+
+        sent = await self.telegram.send_message(text, on_settle=settled)
+        return {"sent": sent, "delivered": outcome["delivered"]}
+
     # ------------------------------------------------------------------ #
     #  Result Building
     # ------------------------------------------------------------------ #
@@ -0,0 +1,179 @@
+"""
+DAG executor for the daily job schedule.
+
+/dispatch used to run exactly one job per tick, checking its dependencies
+one at a time. DagExecutor runs a set of jobs as a graph over
+JOB_DEPENDENCIES plus the ordering-only RUN_AFTER edges: each job starts as
+soon as the jobs it waits for in the same run have finished, so independent
+work (Sunday's weekly-backup and weekly-cleanup) runs concurrently.
+
+Jobs of one run share artifacts such as the earnings calendar
+(BaseJobHandler.share_artifacts), and each job's status is recorded in
+job_status together with its stage timing: run id, start time, time spent
+waiting on upstream jobs, and run time.
+"""
+
+import asyncio
+import sqlite3
+import uuid
+from typing import Any, Dict, List, Optional
+
+from src.core.config import now_et
+from src.core.logging import log
+from src.core import metrics
+from src.core.db_executor import run_db
+from src.core.job_manager import JOB_DEPENDENCIES, RUN_AFTER, JobManager
+from src.jobs.handlers import JobRunner
+
+# Jobs running at once within one DAG run
+DAG_MAX_PARALLEL = 3
+
+
+def safe_record_status(
+    manager: JobManager,
+    job: str,
+    status: str,
+    timing: Optional[Dict[str, Any]] = None,
+) -> bool:
+    """
+    Safely record job status, handling database errors gracefully.
+
+    Returns:
+        True if status was recorded successfully, False if database error occurred
+    """
+    try:
+        manager.record_status(job, status, timing)
+        return True
+    except sqlite3.Error as db_err:
+        log("error", "Failed to record job status",
+            job=job, status=status, error=str(db_err))
+        metrics.count("ivcrush.job_status.failed", {"job": job, "error": "sqlite3"})
+        return False
+
+
+def order_jobs(jobs: List[str]) -> List[str]:
+    """
+    Topologically order jobs (dependencies first), otherwise keeping input order.
+
+    Only edges between jobs in the list count; duplicates are dropped.
+    """
+    requested = list(dict.fromkeys(jobs))
+    members = set(requested)
+    ordered: List[str] = []
+    placed: set = set()
+
+    def place(job: str) -> None:
+        if job in placed:
+            return
+        placed.add(job)
+        for upstream in JOB_DEPENDENCIES.get(job, []) + RUN_AFTER.get(job, []):
+            if upstream in members:
+                place(upstream)
+        ordered.append(job)
+
+    for job in requested:
+        place(job)
+    return ordered
+
+
+class DagExecutor:
+    """Runs a set of jobs concurrently in dependency order."""
+
+    def __init__(
+        self,
+        manager: JobManager,
+        runner: JobRunner,
+        max_parallel: int = DAG_MAX_PARALLEL,
+    ):
+        self.manager = manager
+        self.runner = runner
+        self.max_parallel = max_parallel
+
+    async def run(self, jobs: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Run jobs as one DAG run.
+
+        A job whose dependencies did not succeed today (in this run or
+        earlier) is skipped and not recorded, like a skipped dispatch.
+
+        Args:
+            jobs: Job names; order only matters between independent jobs
+
+        Returns:
+            Dict mapping job -> {"status", "result" or "reason", "wait_ms",
+            "duration_ms"}, in execution order. "status_recording": "failed"
+            is added if job_status could not be written.
+        """
+        run_id = uuid.uuid4().hex[:12]
+        ordered = order_jobs(jobs)
+        members = set(ordered)
+        semaphore = asyncio.Semaphore(max(1, self.max_parallel))
+        loop = asyncio.get_running_loop()
+        run_start = loop.time()
+        tasks: Dict[str, "asyncio.Task[Dict[str, Any]]"] = {}
+
+        log("info", "Starting DAG run", run_id=run_id, jobs=ordered)
+
+        async def run_job(job: str) -> Dict[str, Any]:
+            upstream = [
+                tasks[dep]
+                for dep in JOB_DEPENDENCIES.get(job, []) + RUN_AFTER.get(job, [])
+                if dep in members
+            ]
+            if upstream:
+                await asyncio.gather(*upstream, return_exceptions=True)
+
+            # Covers upstream jobs of this run (recorded before they finish) and earlier ones
+            can_run, reason = await run_db(self.manager.check_dependencies, job)
+            if not can_run:
+                log("warn", "Job dependencies not met", job=job, reason=reason, run_id=run_id)
+                return {"status": "skipped", "reason": reason}
+
+            async with semaphore:
+                started = loop.time()
+                started_at = now_et().isoformat()
+                try:
+                    result = await self.runner.run(job)
+                except Exception as e:
+                    log("error", "Job execution failed", job=job, error=str(e), run_id=run_id)
+                    result = {"status": "error", "error": str(e)}
+                finished = loop.time()
+
+            status = "success" if result.get("status") == "success" else "failed"
+            entry: Dict[str, Any] = {
+                "status": status,
+                "result": result,
+                "wait_ms": round((started - run_start) * 1000),
+                "duration_ms": round((finished - started) * 1000),
+            }
+            timing = {
+                "run_id": run_id,
+                "started_at": started_at,
+                "wait_ms": entry["wait_ms"],
+                "duration_ms": entry["duration_ms"],
+            }
+            if not await run_db(safe_record_status, self.manager, job, status, timing):
+                entry["status_recording"] = "failed"
+            metrics.record("ivcrush.dag.job_duration", entry["duration_ms"], {"job": job})
+            metrics.record("ivcrush.dag.job_wait", entry["wait_ms"], {"job": job})
+            return entry
+
+        with self.runner.share_artifacts():
+            for job in ordered:
+                tasks[job] = asyncio.create_task(run_job(job))
+            outcomes = await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+        results: Dict[str, Dict[str, Any]] = {}
+        for job, outcome in zip(tasks, outcomes):
+            if isinstance(outcome, asyncio.CancelledError):
+                raise outcome
+            if isinstance(outcome, Exception):
+                log("error", "DAG job crashed", job=job, error=str(outcome), run_id=run_id)
+                outcome = {"status": "failed", "result": {"status": "error", "error": str(outcome)}}
+            results[job] = outcome
+
+        log("info", "DAG run complete",
+            run_id=run_id,
+            duration_ms=round((loop.time() - run_start) * 1000),
+            statuses={job: r["status"] for job, r in results.items()})
+        return results
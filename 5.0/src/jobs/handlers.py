@@ -10,19 +10,26 @@ Implied Move Calculation:
     empty chain), we fall back to historical_avg * 1.5 as a conservative estimate.
 
     See src/domain/implied_move.py for the shared helper functions.
+
+Candidate Snapshot:
+    Pre-market prep writes every evaluated candidate to candidate_snapshot.
+    The digest and intraday refresh jobs quote all their tickers in one
+    Tradier call and re-evaluate only rows whose price moved or that are near
+    expiry (see BaseJobHandler._load_snapshot).
 """
 
 import asyncio
-import shutil
+import functools
 import sqlite3
-from pathlib import Path
-from typing import Dict, Any, List
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from datetime import timedelta
 
 from src.core.config import settings, now_et, today_et, MARKET_TZ
 from src.core.logging import log
 from src.core.database import DatabaseSync, DatabaseSyncConflictError
+from src.core.changeset_sync import ChangesetSync, GCSObjectStore
 from src.core import metrics
+from src.core.db_executor import run_db
 from src.integrations import (
     AlphaVantageClient,
     TradierClient,
@@ -47,6 +54,7 @@ from src.domain.implied_move import (
 )
 from src.domain.direction import get_direction
 from src.formatters.telegram import format_digest
+from common.sentiment_prefetch import PrefetchCandidate, SentimentPrefetcher, SentimentStore
 
 # Import base class and re-export constants/utilities so existing imports still work
 from src.jobs.base import (
@@ -56,21 +64,21 @@ from src.jobs.base import (
     MAX_PRIME_CANDIDATES,
     MAX_PRIME_CALLS,
     MAX_DIGEST_CANDIDATES,
-    MAX_BACKFILL_TICKERS,
-    MAX_OUTCOME_TICKERS,
     MAX_TWELVEDATA_TICKERS,
-    RATE_LIMIT_DELAY,
-    RATE_LIMIT_BATCH_SIZE,
     PRE_MARKET_ALERT_THRESHOLD,
     AFTER_HOURS_ALERT_THRESHOLD,
     TRADIER_CALLS_PER_TICKER,
+    PRIME_CONCURRENCY,
+    PRIME_BUDGET_DOLLARS,
+    PRIME_TTL_HOURS,
 )
 
 
 async def fetch_earnings_with_db_fallback(
     alphavantage: AlphaVantageClient,
     repo: HistoricalMovesRepository,
-    days: int = 5
+    days: int = 5,
+    calendar: Optional[Callable[[], Awaitable[List[Dict[str, Any]]]]] = None,
 ) -> List[Dict[str, Any]]:
     """
     Fetch earnings calendar with database fallback.
@@ -82,23 +90,28 @@ async def fetch_earnings_with_db_fallback(
         alphavantage: Alpha Vantage API client
         repo: Repository with get_upcoming_earnings() method
         days: Number of days to look ahead (default 5)
+        calendar: Fetch to use instead of alphavantage.get_earnings_calendar
+            (job handlers pass their run-shared _earnings_calendar)
 
     Returns:
         List of earnings dicts with 'symbol', 'report_date', 'timing' keys
     """
     try:
-        earnings = await alphavantage.get_earnings_calendar()
+        if calendar is not None:
+            earnings = await calendar()
+        else:
+            earnings = await alphavantage.get_earnings_calendar()
         if earnings:
             return earnings
 
         # Alpha Vantage returned empty - fall back to DB
         log("warn", "Alpha Vantage returned empty, using DB fallback", days=days)
-        return repo.get_upcoming_earnings(today_et(), days)
+        return await run_db(repo.get_upcoming_earnings, today_et(), days)
 
     except Exception as e:
         # API error - fall back to DB
         log("error", "Alpha Vantage failed, using DB fallback", error=str(e), days=days)
-        return repo.get_upcoming_earnings(today_et(), days)
+        return await run_db(repo.get_upcoming_earnings, today_et(), days)
 
 
 def _parse_price_history(closes: dict) -> List[tuple]:
@@ -134,6 +147,61 @@ def _parse_price_history(closes: dict) -> List[tuple]:
     return price_data
 
 
+PriceWindowKey = Tuple[str, str, str]  # (symbol, window_start, window_end)
+
+
+async def fetch_price_windows(
+    twelvedata: TwelveDataClient,
+    items: List[Dict[str, Any]],
+    job: str,
+) -> Tuple[Dict[PriceWindowKey, List[tuple]], List[str]]:
+    """
+    Fetch closing prices for every item's date window in as few requests as possible.
+
+    Items sharing a (window_start, window_end) pair go out together as
+    multi-symbol time series requests, and the windows are fetched
+    concurrently; the shared "twelvedata" bucket paces the actual calls.
+
+    Args:
+        twelvedata: Twelve Data client
+        items: Dicts with 'symbol', 'window_start' and 'window_end' keys
+        job: Job name for logging
+
+    Returns:
+        (prices, failed_tickers) - prices maps (symbol, window_start, window_end)
+        to sorted (date_str, close) tuples; symbols without data are absent
+    """
+    windows: Dict[Tuple[str, str], List[str]] = {}
+    for item in items:
+        symbols = windows.setdefault((item["window_start"], item["window_end"]), [])
+        if item["symbol"] not in symbols:
+            symbols.append(item["symbol"])
+
+    keys = list(windows)
+    outcomes = await asyncio.gather(
+        *(twelvedata.get_stock_history_batch(windows[key], key[0], key[1]) for key in keys),
+        return_exceptions=True,
+    )
+
+    prices: Dict[PriceWindowKey, List[tuple]] = {}
+    failed_tickers: List[str] = []
+    for (start, end), outcome in zip(keys, outcomes):
+        if isinstance(outcome, asyncio.CancelledError):
+            raise outcome
+        if isinstance(outcome, Exception):
+            failed_tickers.extend(windows[(start, end)])
+            log("warn", "Failed to fetch price window",
+                start=start, end=end, symbols=len(windows[(start, end)]),
+                error=str(outcome), job=job)
+            continue
+        for symbol, history in outcome.items():
+            prices[(symbol, start, end)] = _parse_price_history(history.get("Close", {}))
+
+    log("debug", "Fetched price windows",
+        windows=len(keys), symbols=len(prices), job=job)
+    return prices, failed_tickers
+
+
 class JobRunner(BaseJobHandler):
     """Runs scheduled jobs with proper error handling."""
 
@@ -148,7 +216,7 @@ class JobRunner(BaseJobHandler):
     @property
     def tradier(self) -> TradierClient:
         if self._tradier is None:
-            self._tradier = TradierClient(settings.tradier_api_key)  # Use property accessor
+            self._tradier = TradierClient(settings.tradier_api_key, hedge=settings.hedge_tradier_requests)  # Use property accessor
         return self._tradier
 
     @property
@@ -240,6 +308,10 @@ class JobRunner(BaseJobHandler):
         Pre-market prep (05:30 ET).
         Fetch today's earnings and calculate VRP for each.
         Uses DB fallback if Alpha Vantage is unavailable.
+
+        Writes the candidate snapshot (implied move, VRP, liquidity inputs,
+        price) that the digest and intraday refresh jobs reuse for tickers
+        whose price has not moved.
         """
         start_time = self._start_timer()
         today = today_et()
@@ -247,7 +319,7 @@ class JobRunner(BaseJobHandler):
         # Get earnings with DB fallback (Alpha Vantage rate limits can block the whole day otherwise)
         repo_for_fallback = HistoricalMovesRepository(settings.DB_PATH)
         earnings = await fetch_earnings_with_db_fallback(
-            self.alphavantage, repo_for_fallback, days=4
+            self.alphavantage, repo_for_fallback, days=4, calendar=self._earnings_calendar
         )
         if not earnings:
             log("info", "No earnings found for pre-market prep", job="pre_market_prep")
@@ -257,56 +329,46 @@ class JobRunner(BaseJobHandler):
         upcoming, target_dates = self._upcoming_earnings(earnings, days=4)
 
         # Filter to tracked tickers only (excludes OTC/foreign stocks without VRP data)
-        upcoming, repo = self._filter_tracked(upcoming, repo=repo_for_fallback)
+        upcoming, repo = await run_db(self._filter_tracked, upcoming, repo=repo_for_fallback)
 
         # Log truncation if limit exceeded
         if len(upcoming) > MAX_PRE_MARKET_TICKERS:
             log("info", "Truncating pre-market candidates",
                 total=len(upcoming), processing=MAX_PRE_MARKET_TICKERS)
 
-        # Calculate VRP for each
-        results = []
-        failed_tickers = []
-        api_calls = 0
+        # One batched quote call for every candidate, then the full VRP
+        # evaluation (expirations + chain) per ticker
+        candidates = upcoming[:MAX_PRE_MARKET_TICKERS]
+        prices = await self._fetch_prices([e["symbol"] for e in candidates])
 
-        for e in upcoming[:MAX_PRE_MARKET_TICKERS]:
+        async def evaluate(e: Dict[str, Any]) -> Optional[Dict[str, Any]]:
             ticker = e["symbol"]
-            try:
-                # Get historical moves
-                historical = repo.get_average_move(ticker)
-                if historical is None:
-                    continue
-
-                # Rate limiting for Tradier API calls
-                api_calls += 1
-                await self._rate_limit_tick(api_calls)
-
-                # Get current price from Tradier (more reliable than Yahoo after hours)
-                quote = await self.tradier.get_quote(ticker)
-                price = quote.get("last") or quote.get("close") or quote.get("prevclose") if quote else None
-                if not price:
-                    log("debug", "No price data for ticker", ticker=ticker)
-                    continue
+            price = prices.get(ticker)
+            if not price:
+                log("debug", "No price data for ticker", ticker=ticker)
+                return None
+            return await self._evaluate_vrp(repo, ticker, e["report_date"], 0, price=price)
+
+        evaluated, failed_tickers = await self._run_per_ticker(
+            candidates, evaluate, job="pre_market_prep"
+        )
 
-                results.append({
-                    "ticker": ticker,
-                    "earnings_date": e["report_date"],
-                    "historical_avg": historical,
-                    "price": price,
-                })
-            except Exception as ex:
-                failed_tickers.append(ticker)
-                log("warn", "Failed to process ticker in pre-market prep",
-                    ticker=ticker, error=str(ex), job="pre_market_prep")
+        # Materialize the snapshot later jobs refresh incrementally
+        snapshotted = await run_db(
+            self._save_candidate_snapshot,
+            settings.DB_PATH,
+            [(e["symbol"], e["report_date"], r) for e, r in evaluated],
+        )
 
         # Record metrics
         self._record_duration(start_time, "pre_market_prep")
-        metrics.gauge("ivcrush.job.tickers_processed", len(results), {"job": "pre_market_prep"})
+        metrics.gauge("ivcrush.job.tickers_processed", len(evaluated), {"job": "pre_market_prep"})
 
         return self._build_result(
             failed_tickers=failed_tickers if failed_tickers else None,
-            tickers_found=len(results),
+            tickers_found=len(evaluated),
             earnings_dates=target_dates,
+            snapshotted=snapshotted,
         )
 
     async def _sentiment_scan(self) -> Dict[str, Any]:
@@ -317,6 +379,9 @@ class JobRunner(BaseJobHandler):
         Uses REAL implied move from Tradier options chains (ATM straddle pricing)
         to calculate accurate VRP ratios for selecting which tickers to prime.
         Falls back to estimate only if options data unavailable.
+
+        Priming goes through SentimentPrefetcher: Perplexity calls for the
+        highest-VRP candidates run concurrently, within PRIME_BUDGET_DOLLARS.
         """
         start_time = self._start_timer()
 
@@ -329,88 +394,83 @@ class JobRunner(BaseJobHandler):
         upcoming, target_dates = self._upcoming_earnings(earnings, days=4)
 
         # Filter to tracked tickers only (excludes OTC/foreign stocks without VRP data)
-        upcoming, repo = self._filter_tracked(upcoming)
+        upcoming, repo = await run_db(self._filter_tracked, upcoming)
 
         # Log truncation if limit exceeded
         if len(upcoming) > MAX_PRIME_CANDIDATES:
             log("info", "Truncating prime candidates",
                 total=len(upcoming), processing=MAX_PRIME_CANDIDATES)
 
-        # Calculate VRP and filter to candidates worth priming
+        # Skip VRP evaluation for tickers whose sentiment is already cached
         cache = SentimentCacheRepository(settings.SENTIMENT_CACHE_DB_PATH)
+        upcoming = upcoming[:MAX_PRIME_CANDIDATES]
+        try:
+            cached = await run_db(
+                cache.get_sentiments, [(e["symbol"], e["report_date"]) for e in upcoming]
+            )
+        except (ValueError, sqlite3.Error) as e:
+            log("warn", "Sentiment cache check failed", job="sentiment_scan", error=str(e))
+            cached = {}
+        upcoming = [e for e in upcoming if (e["symbol"], e["report_date"]) not in cached]
 
-        candidates = []
-        failed_tickers = []
-        api_calls = 0
-        real_implied_count = 0
-
-        for e in upcoming[:MAX_PRIME_CANDIDATES]:
-            ticker = e["symbol"]
-            earnings_date = e["report_date"]
-
-            try:
-                # Skip if already cached
-                if cache.get_sentiment(ticker, earnings_date):
-                    continue
-
-                # Evaluate VRP using base class pipeline
-                vrp_result = await self._evaluate_vrp(repo, ticker, earnings_date, api_calls)
-                if vrp_result is None:
-                    continue
-
-                api_calls = vrp_result["api_calls"]
-                if vrp_result["used_real"]:
-                    real_implied_count += 1
+        # Calculate VRP and filter to candidates worth priming
+        async def evaluate(e: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            return await self._evaluate_vrp(repo, e["symbol"], e["report_date"], 0)
 
-                # Only prime tickers with VRP >= discovery threshold
-                if vrp_result["vrp_data"].get("vrp_ratio", 0) >= settings.VRP_DISCOVERY:
-                    candidates.append({
-                        "ticker": ticker,
-                        "earnings_date": earnings_date,
-                        "vrp_ratio": vrp_result["vrp_data"]["vrp_ratio"],
-                    })
-            except Exception as ex:
-                failed_tickers.append(ticker)
-                log("warn", "Failed to evaluate ticker for prime",
-                    ticker=ticker, error=str(ex), job="sentiment_scan")
+        evaluated, failed_tickers = await self._run_per_ticker(
+            upcoming, evaluate, job="sentiment_scan"
+        )
+        api_calls = len(evaluated) * TRADIER_CALLS_PER_TICKER
+        real_implied_count = sum(1 for _, r in evaluated if r["used_real"])
+
+        # Only prime tickers with VRP >= discovery threshold
+        candidates = [
+            PrefetchCandidate(e["symbol"], e["report_date"], r["vrp_data"]["vrp_ratio"])
+            for e, r in evaluated
+            if r["vrp_data"].get("vrp_ratio", 0) >= settings.VRP_DISCOVERY
+        ]
 
         log("info", "Sentiment scan VRP analysis complete",
             real_implied_count=real_implied_count, total_evaluated=api_calls)
 
-        # Sort by VRP and prime top candidates
-        candidates.sort(key=lambda x: x["vrp_ratio"], reverse=True)
-
-        primed = 0
-        prime_failed = []
-
-        for i, c in enumerate(candidates[:MAX_PRIME_CALLS]):
-            try:
-                # Rate limiting between Perplexity API calls
-                if i > 0 and i % RATE_LIMIT_BATCH_SIZE == 0:
-                    await asyncio.sleep(RATE_LIMIT_DELAY)
-
-                sentiment = await self.perplexity.get_sentiment(c["ticker"], c["earnings_date"])
-                if sentiment and not sentiment.get("error"):
-                    cache.save_sentiment(c["ticker"], c["earnings_date"], sentiment, ttl_hours=12)
-                    primed += 1
-                    log("info", "Primed sentiment", ticker=c["ticker"], vrp=c["vrp_ratio"])
-                else:
-                    log("debug", "Empty sentiment response", ticker=c["ticker"])
-            except Exception as ex:
-                prime_failed.append(c["ticker"])
-                log("warn", "Failed to prime ticker",
-                    ticker=c["ticker"], error=str(ex), job="sentiment_scan")
+        # Prime top candidates by VRP, concurrently and within the spend limit
+        prefetcher = SentimentPrefetcher(
+            self.perplexity.get_sentiment,
+            [SentimentStore(
+                "5.0",
+                cache.get_sentiments,
+                functools.partial(cache.save_sentiments, ttl_hours=PRIME_TTL_HOURS),
+            )],
+            budget_dollars=PRIME_BUDGET_DOLLARS,
+            estimated_cost=self.perplexity.estimated_call_cost(),
+            max_calls=MAX_PRIME_CALLS,
+            max_concurrent=PRIME_CONCURRENCY,
+            run_sync=run_db,
+        )
+        prefetched = await prefetcher.prefetch(candidates)
+        primed = len(prefetched.fetched)
+        for (ticker, _), sentiment in prefetched.fetched.items():
+            log("info", "Primed sentiment", ticker=ticker, direction=sentiment.get("direction"))
+        prime_failed = [ticker for ticker, _ in prefetched.failed]
 
         # Record metrics
         self._record_duration(start_time, "sentiment_scan")
         metrics.gauge("ivcrush.job.candidates", len(candidates), {"job": "sentiment_scan"})
         metrics.gauge("ivcrush.job.primed", primed, {"job": "sentiment_scan"})
+        metrics.prime_budget_update(
+            max(0, MAX_PRIME_CALLS - prefetched.calls),
+            round(PRIME_BUDGET_DOLLARS - prefetched.spent_dollars, 4),
+        )
 
         result = {
             "status": "success",
             "candidates": len(candidates),
             "primed": primed,
+            "already_cached": len(cached) + len(prefetched.cached),
+            "spent_dollars": round(prefetched.spent_dollars, 4),
         }
+        if prefetched.skipped:
+            result["skipped"] = len(prefetched.skipped)
         if failed_tickers or prime_failed:
             result["failed_tickers"] = failed_tickers + prime_failed
 
@@ -435,16 +495,16 @@ class JobRunner(BaseJobHandler):
         # Avoids Alpha Vantage gaps that drop tickers like INTC from the digest.
         # Fallback: Alpha Vantage + tracked-ticker filter if DB window is empty.
         repo = HistoricalMovesRepository(settings.DB_PATH)
-        upcoming = repo.get_upcoming_earnings(today, days=4)
+        upcoming = await run_db(repo.get_upcoming_earnings, today, days=4)
         log("debug", "Fetched earnings from DB",
             job="morning_digest", count=len(upcoming))
 
         if not upcoming:
             log("warn", "DB earnings empty, falling back to Alpha Vantage", job="morning_digest")
-            av_earnings = await self.alphavantage.get_earnings_calendar()
+            av_earnings = await self._earnings_calendar()
             if av_earnings:
                 upcoming_raw, _ = self._upcoming_earnings(av_earnings, days=4)
-                upcoming, repo = self._filter_tracked(upcoming_raw, repo=repo)
+                upcoming, repo = await run_db(self._filter_tracked, upcoming_raw, repo=repo)
                 log("debug", "Fetched earnings from Alpha Vantage fallback",
                     job="morning_digest", count=len(upcoming))
 
@@ -470,109 +530,105 @@ class JobRunner(BaseJobHandler):
 
         # Build opportunities list with VRP and sentiment
         cache = SentimentCacheRepository(settings.SENTIMENT_CACHE_DB_PATH)
+        candidates = upcoming[:MAX_DIGEST_CANDIDATES]
+        snapshot = await self._load_snapshot(settings.DB_PATH, candidates, job="morning_digest")
 
-        opportunities: List[Dict[str, Any]] = []
-        failed_tickers = []
-        api_calls = 0  # Track API calls for rate limiting
-        real_implied_count = 0  # Track how many tickers got real options data
-
-        for e in upcoming[:MAX_DIGEST_CANDIDATES]:
+        async def evaluate(e: Dict[str, Any]) -> Optional[Dict[str, Any]]:
             ticker = e["symbol"]
             earnings_date = e["report_date"]
 
-            try:
-                # Evaluate VRP using base class pipeline
-                vrp_result = await self._evaluate_vrp(repo, ticker, earnings_date, api_calls)
-                if vrp_result is None:
-                    continue
-
-                api_calls = vrp_result["api_calls"]
-                if vrp_result["used_real"]:
-                    real_implied_count += 1
-
-                vrp_data = vrp_result["vrp_data"]
-                im_result = vrp_result["im_result"]
-                implied_move_pct = vrp_result["implied_move_pct"]
-
-                # Filter out tickers without weekly options if configured
-                if settings.require_weekly_options and not im_result.get("has_weekly_options", True):
-                    log("debug", "Skipping non-weekly ticker",
-                        ticker=ticker, reason=im_result.get("weekly_reason", ""),
-                        job="morning_digest")
-                    continue
-
-                # Apply VRP discovery threshold
-                if vrp_data.get("vrp_ratio", 0) < settings.VRP_DISCOVERY:
-                    continue
+            # Evaluate VRP from the pre-market snapshot, or afresh if it went stale
+            vrp_result = await self._evaluate_vrp_snapshot(repo, ticker, earnings_date, snapshot)
+            if vrp_result is None:
+                return None
+
+            vrp_data = vrp_result["vrp_data"]
+            im_result = vrp_result["im_result"]
+            implied_move_pct = vrp_result["implied_move_pct"]
+
+            # Filter out tickers without weekly options if configured
+            if settings.require_weekly_options and not im_result.get("has_weekly_options", True):
+                log("debug", "Skipping non-weekly ticker",
+                    ticker=ticker, reason=im_result.get("weekly_reason", ""),
+                    job="morning_digest")
+                return None
+
+            # Apply VRP discovery threshold
+            if vrp_data.get("vrp_ratio", 0) < settings.VRP_DISCOVERY:
+                return None
+
+            # Calculate score (assume GOOD liquidity for screening - see docstring)
+            score_data = calculate_score(
+                vrp_ratio=vrp_data["vrp_ratio"],
+                vrp_tier=vrp_data["tier"],
+                implied_move_pct=implied_move_pct,
+                liquidity_tier="GOOD",
+            )
 
-                # Calculate score (assume GOOD liquidity for screening - see docstring)
-                score_data = calculate_score(
-                    vrp_ratio=vrp_data["vrp_ratio"],
-                    vrp_tier=vrp_data["tier"],
+            # Get cached sentiment if available and use get_direction for consistency
+            # Note: skew analysis not available in job handlers (would require extra API calls)
+            sentiment = await run_db(cache.get_sentiment, ticker, earnings_date)
+            sentiment_score = sentiment.get("score") if sentiment else None
+            sentiment_direction = sentiment.get("direction") if sentiment else None
+            direction = get_direction(
+                skew_bias=None,  # No skew analysis in morning digest
+                sentiment_score=sentiment_score,
+                sentiment_direction=sentiment_direction,
+            )
+            tailwinds = sentiment.get("tailwinds", "") if sentiment else ""
+            headwinds = sentiment.get("headwinds", "") if sentiment else ""
+            final_score = score_data["total_score"]
+            if sentiment_score is not None:
+                final_score = apply_sentiment_modifier(score_data["total_score"], sentiment_score)
+
+            # Generate actual trading strategies
+            price = im_result.get("price")
+            expiration = im_result.get("expiration", "")
+            strategy_name = f"VRP {vrp_data['tier']}"  # Fallback
+            credit = 0
+
+            if price and implied_move_pct > 0:
+                strategies = generate_strategies(
+                    ticker=ticker,
+                    price=price,
                     implied_move_pct=implied_move_pct,
-                    liquidity_tier="GOOD",
+                    direction=direction,
+                    liquidity_tier="GOOD",  # Assumed for screening
+                    expiration=expiration,
                 )
-
-                # Get cached sentiment if available and use get_direction for consistency
-                # Note: skew analysis not available in job handlers (would require extra API calls)
-                sentiment = cache.get_sentiment(ticker, earnings_date)
-                sentiment_score = sentiment.get("score") if sentiment else None
-                sentiment_direction = sentiment.get("direction") if sentiment else None
-                direction = get_direction(
-                    skew_bias=None,  # No skew analysis in morning digest
-                    sentiment_score=sentiment_score,
-                    sentiment_direction=sentiment_direction,
-                )
-                tailwinds = sentiment.get("tailwinds", "") if sentiment else ""
-                headwinds = sentiment.get("headwinds", "") if sentiment else ""
-                final_score = score_data["total_score"]
-                if sentiment_score is not None:
-                    final_score = apply_sentiment_modifier(score_data["total_score"], sentiment_score)
-
-                # Generate actual trading strategies
-                price = im_result.get("price")
-                expiration = im_result.get("expiration", "")
-                strategy_name = f"VRP {vrp_data['tier']}"  # Fallback
-                credit = 0
-
-                if price and implied_move_pct > 0:
-                    strategies = generate_strategies(
-                        ticker=ticker,
-                        price=price,
-                        implied_move_pct=implied_move_pct,
-                        direction=direction,
-                        liquidity_tier="GOOD",  # Assumed for screening
-                        expiration=expiration,
-                    )
-                    if strategies:
-                        top_strategy = strategies[0]
-                        strategy_name = top_strategy.description
-                        credit = top_strategy.max_profit / 100  # Convert to per-contract
-
-                opportunities.append({
-                    "ticker": ticker,
-                    "earnings_date": earnings_date,
-                    "vrp_ratio": vrp_data["vrp_ratio"],
-                    "score": final_score,
-                    "direction": direction,
-                    "tailwinds": tailwinds,
-                    "headwinds": headwinds,
-                    "strategy": strategy_name,
-                    "credit": credit,
-                    "real_data": vrp_result["used_real"],  # Track if we used real options data
-                })
-
-            except Exception as ex:
-                failed_tickers.append(ticker)
-                log("warn", "Failed to evaluate ticker for digest",
-                    ticker=ticker, error=str(ex), job="morning_digest")
+                if strategies:
+                    top_strategy = strategies[0]
+                    strategy_name = top_strategy.description
+                    credit = top_strategy.max_profit / 100  # Convert to per-contract
+
+            return {
+                "ticker": ticker,
+                "earnings_date": earnings_date,
+                "vrp_ratio": vrp_data["vrp_ratio"],
+                "score": final_score,
+                "direction": direction,
+                "tailwinds": tailwinds,
+                "headwinds": headwinds,
+                "strategy": strategy_name,
+                "credit": credit,
+                "real_data": vrp_result["used_real"],  # Track if we used real options data
+            }
+
+        evaluated, failed_tickers = await self._run_per_ticker(
+            candidates, evaluate, job="morning_digest"
+        )
+        await self._save_snapshot(settings.DB_PATH, snapshot, job="morning_digest")
+        opportunities: List[Dict[str, Any]] = [o for _, o in evaluated]
+        real_implied_count = sum(1 for o in opportunities if o["real_data"])
 
         log("info", "Digest analysis complete",
-            real_implied_count=real_implied_count, total_candidates=len(upcoming[:MAX_DIGEST_CANDIDATES]))
+            real_implied_count=real_implied_count, total_candidates=len(candidates),
+            from_snapshot=len(snapshot.reusable))
 
         # Save qualified tickers for downstream jobs (after-hours check)
         if opportunities:
-            self._save_daily_candidates(
+            await run_db(
+                self._save_daily_candidates,
                 settings.DB_PATH, today,
                 [o["ticker"] for o in opportunities],
                 "morning_digest",
@@ -584,7 +640,7 @@ class JobRunner(BaseJobHandler):
         # Format and send digest (only if there are opportunities)
         log("info", "Sending digest", opportunities=len(opportunities))
 
-        sent = False
+        delivery: Dict[str, Optional[bool]] = {"sent": False, "delivered": None}
         telegram_error = None
         try:
             if opportunities:
@@ -592,7 +648,7 @@ class JobRunner(BaseJobHandler):
                     target_dates[0],
                     opportunities[:10],  # Top 10
                 )
-                sent = await self.telegram.send_message(digest_msg)
+                delivery = await self._notify(digest_msg, "morning_digest")
             else:
                 # Skip sending when no opportunities - don't spam with empty alerts
                 log("info", "Skipping digest - no opportunities", job="morning_digest")
@@ -610,7 +666,7 @@ class JobRunner(BaseJobHandler):
             telegram_error=telegram_error,
             job_name="morning_digest",
             opportunities=len(opportunities),
-            sent=sent,
+            **delivery,
         )
 
     async def _market_open_refresh(self) -> Dict[str, Any]:
@@ -618,6 +674,7 @@ class JobRunner(BaseJobHandler):
         Market open refresh (10:00 ET).
         Refresh prices for today's earnings tickers after market opens.
         Sends alert if any high-VRP ticker has significant pre-market movement.
+        Re-evaluates the candidate snapshot rows the opening move made stale.
         """
         start_time = self._start_timer()
         today = today_et()
@@ -631,28 +688,31 @@ class JobRunner(BaseJobHandler):
         todays_earnings = self._todays_earnings(earnings)
 
         # Filter to tracked tickers only (excludes OTC/foreign stocks without VRP data)
-        todays_earnings, repo = self._filter_tracked(todays_earnings)
+        todays_earnings, repo = await run_db(self._filter_tracked, todays_earnings)
 
         if not todays_earnings:
             log("info", "No earnings today", job="market_open_refresh")
             return {"status": "success", "refreshed": 0, "note": "No earnings today"}
 
+        # Current prices for all of today's tickers come from one batched
+        # Tradier quote call made while checking the snapshot
+        candidates = todays_earnings[:MAX_TWELVEDATA_TICKERS]
+        snapshot = await self._load_snapshot(settings.DB_PATH, candidates, job="market_open_refresh")
+
         # Refresh prices and check for significant moves
         refreshed = 0
         significant_moves = []
         failed_tickers = []
         api_calls = 0
 
-        for e in todays_earnings[:MAX_TWELVEDATA_TICKERS]:
+        for e in candidates:
             ticker = e["symbol"]
             try:
                 # Rate limiting
                 api_calls += 1
                 await self._rate_limit_tick(api_calls)
 
-                # Get current price from Tradier (more reliable than Yahoo)
-                quote = await self.tradier.get_quote(ticker)
-                price = quote.get("last") or quote.get("close") or quote.get("prevclose") if quote else None
+                price = snapshot.prices.get(ticker)
                 if not price:
                     log("debug", "No current price for market refresh", ticker=ticker)
                     continue
@@ -660,7 +720,7 @@ class JobRunner(BaseJobHandler):
                 refreshed += 1
 
                 # Check historical average to detect significant pre-market moves
-                pcts, historical_avg = self._get_historical_pcts(repo, ticker)
+                pcts, historical_avg = await run_db(self._get_historical_pcts, repo, ticker)
                 if pcts is not None:
                     # If we have a previous close, check pre-market move
                     history = await self.twelvedata.get_stock_history(ticker, period="5d", interval="1d")
@@ -683,6 +743,18 @@ class JobRunner(BaseJobHandler):
                 log("warn", "Failed to refresh ticker",
                     ticker=ticker, error=str(ex), job="market_open_refresh")
 
+        # Re-snapshot only the rows whose price moved or that are near expiry
+        stale = [e for e in candidates if (e["symbol"], e["report_date"]) in snapshot.stale]
+
+        async def resnapshot(e: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            return await self._evaluate_vrp_snapshot(repo, e["symbol"], e["report_date"], snapshot)
+
+        _, failed_snapshot = await self._run_per_ticker(stale, resnapshot, job="market_open_refresh")
+        failed_tickers.extend(t for t in failed_snapshot if t not in failed_tickers)
+        snapshot_refreshed = await self._save_snapshot(
+            settings.DB_PATH, snapshot, job="market_open_refresh"
+        )
+
         # Send alert if significant pre-market moves detected
         telegram_error = None
         if significant_moves:
@@ -708,6 +780,7 @@ class JobRunner(BaseJobHandler):
             job_name="market_open_refresh",
             refreshed=refreshed,
             significant_moves=len(significant_moves),
+            snapshot_refreshed=snapshot_refreshed,
         )
 
     async def _pre_trade_refresh(self) -> Dict[str, Any]:
@@ -715,6 +788,8 @@ class JobRunner(BaseJobHandler):
         Pre-trade refresh (14:30 ET).
         Final refresh before typical 2:30-3:30 PM trade window.
         Re-validates VRP with current IV and sends actionable alert.
+        Candidates whose snapshot row is fresh and whose price held are not
+        re-fetched from Tradier.
         """
         start_time = self._start_timer()
         today = today_et()
@@ -728,74 +803,74 @@ class JobRunner(BaseJobHandler):
         todays_earnings = self._todays_earnings(earnings)
 
         # Filter to tracked tickers only (excludes OTC/foreign stocks without VRP data)
-        todays_earnings, repo = self._filter_tracked(todays_earnings)
+        todays_earnings, repo = await run_db(self._filter_tracked, todays_earnings)
 
         if not todays_earnings:
             log("info", "No earnings today", job="pre_trade_refresh")
             return {"status": "success", "candidates": 0, "note": "No earnings today"}
 
-        # Re-evaluate VRP for today's tickers with current prices
+        # Re-evaluate VRP for today's tickers whose snapshot row is stale
+        # (price moved or near expiry); the rest are served from the snapshot
         cache = SentimentCacheRepository(settings.SENTIMENT_CACHE_DB_PATH)
-        candidates = []
-        failed_tickers = []
-        api_calls = 0
+        candidates = todays_earnings[:MAX_PRE_MARKET_TICKERS]
+        snapshot = await self._load_snapshot(settings.DB_PATH, candidates, job="pre_trade_refresh")
 
-        for e in todays_earnings[:MAX_PRE_MARKET_TICKERS]:
+        async def evaluate(e: Dict[str, Any]) -> Optional[Dict[str, Any]]:
             ticker = e["symbol"]
-            try:
-                # Evaluate VRP using base class pipeline
-                vrp_result = await self._evaluate_vrp(repo, ticker, today, api_calls)
-                if vrp_result is None:
-                    continue
-
-                api_calls = vrp_result["api_calls"]
-                vrp_data = vrp_result["vrp_data"]
-                im_result = vrp_result["im_result"]
-                implied_move_pct = vrp_result["implied_move_pct"]
-
-                # Filter out tickers without weekly options if configured
-                if settings.require_weekly_options and not im_result.get("has_weekly_options", True):
-                    log("debug", "Skipping non-weekly ticker",
-                        ticker=ticker, reason=im_result.get("weekly_reason", ""),
-                        job="pre_trade_refresh")
-                    continue
-
-                if vrp_data.get("vrp_ratio", 0) < settings.VRP_DISCOVERY:
-                    continue
 
-                # Get current price for context (use price from implied move result)
-                price = im_result.get("price")
-
-                # Get cached sentiment and use get_direction for consistency
-                sentiment = cache.get_sentiment(ticker, today)
-                sentiment_score = sentiment.get("score") if sentiment else None
-                sentiment_direction = sentiment.get("direction") if sentiment else None
-                direction = get_direction(
-                    skew_bias=None,  # No skew analysis in pre-trade refresh
-                    sentiment_score=sentiment_score,
-                    sentiment_direction=sentiment_direction,
-                )
-
-                candidates.append({
-                    "ticker": ticker,
-                    "vrp_ratio": round(vrp_data["vrp_ratio"], 2),
-                    "tier": vrp_data["tier"],
-                    "direction": direction,
-                    "price": round(price, 2) if price else None,
-                    "implied_move": round(implied_move_pct, 2),
-                })
+            vrp_result = await self._evaluate_vrp_snapshot(repo, ticker, today, snapshot)
+            if vrp_result is None:
+                return None
+
+            vrp_data = vrp_result["vrp_data"]
+            im_result = vrp_result["im_result"]
+            implied_move_pct = vrp_result["implied_move_pct"]
+
+            # Filter out tickers without weekly options if configured
+            if settings.require_weekly_options and not im_result.get("has_weekly_options", True):
+                log("debug", "Skipping non-weekly ticker",
+                    ticker=ticker, reason=im_result.get("weekly_reason", ""),
+                    job="pre_trade_refresh")
+                return None
+
+            if vrp_data.get("vrp_ratio", 0) < settings.VRP_DISCOVERY:
+                return None
+
+            # Get current price for context (use price from implied move result)
+            price = im_result.get("price")
+
+            # Get cached sentiment and use get_direction for consistency
+            sentiment = await run_db(cache.get_sentiment, ticker, today)
+            sentiment_score = sentiment.get("score") if sentiment else None
+            sentiment_direction = sentiment.get("direction") if sentiment else None
+            direction = get_direction(
+                skew_bias=None,  # No skew analysis in pre-trade refresh
+                sentiment_score=sentiment_score,
+                sentiment_direction=sentiment_direction,
+            )
 
-            except Exception as ex:
-                failed_tickers.append(ticker)
-                log("warn", "Failed to evaluate ticker",
-                    ticker=ticker, error=str(ex), job="pre_trade_refresh")
+            return {
+                "ticker": ticker,
+                "vrp_ratio": round(vrp_data["vrp_ratio"], 2),
+                "tier": vrp_data["tier"],
+                "direction": direction,
+                "price": round(price, 2) if price else None,
+                "implied_move": round(implied_move_pct, 2),
+            }
+
+        evaluated, failed_tickers = await self._run_per_ticker(
+            candidates, evaluate, job="pre_trade_refresh"
+        )
+        await self._save_snapshot(settings.DB_PATH, snapshot, job="pre_trade_refresh")
+        candidates = [c for _, c in evaluated]
 
         # Sort by VRP ratio
         candidates.sort(key=lambda x: x["vrp_ratio"], reverse=True)
 
         # Save qualified tickers for downstream jobs (after-hours check)
         if candidates:
-            self._save_daily_candidates(
+            await run_db(
+                self._save_daily_candidates,
                 settings.DB_PATH, today,
                 [c["ticker"] for c in candidates],
                 "pre_trade_refresh",
@@ -841,7 +916,7 @@ class JobRunner(BaseJobHandler):
         today = today_et()
 
         # Only show tickers that qualified in earlier alerts (digest / pre-trade)
-        qualified = self._get_daily_candidates(settings.DB_PATH, today)
+        qualified = await run_db(self._get_daily_candidates, settings.DB_PATH, today)
         if not qualified:
             log("info", "No qualified candidates today", job="after_hours_check")
             return {"status": "success", "checked": 0, "note": "No qualified candidates today"}
@@ -919,7 +994,7 @@ class JobRunner(BaseJobHandler):
                 ah_move_pct = ((price - regular_close) / regular_close) * 100
 
                 # Get historical avg for context
-                pcts, historical_avg = self._get_historical_pcts(repo, ticker)
+                pcts, historical_avg = await run_db(self._get_historical_pcts, repo, ticker)
 
                 # Only track if move exceeds threshold
                 if abs(ah_move_pct) > AFTER_HOURS_ALERT_THRESHOLD:
@@ -997,7 +1072,9 @@ class JobRunner(BaseJobHandler):
         repo = HistoricalMovesRepository(settings.DB_PATH)
 
         # Get earnings from DB (has timing info) with API fallback
-        earnings = await fetch_earnings_with_db_fallback(self.alphavantage, repo, days=5)
+        earnings = await fetch_earnings_with_db_fallback(
+            self.alphavantage, repo, days=5, calendar=self._earnings_calendar
+        )
 
         if not earnings:
             log("warn", "Empty earnings calendar", job="outcome_recorder")
@@ -1051,78 +1128,61 @@ class JobRunner(BaseJobHandler):
             amc_yesterday=len([e for e in earnings_to_record if e["earnings_date"] == yesterday]),
             job="outcome_recorder")
 
-        recorded = 0
-        skipped_duplicate = 0
-        skipped_amc_pending = 0
-        failed_tickers = []
-        api_calls = 0
+        # Each outcome needs closes from reference day through reaction day
+        for e in earnings_to_record:
+            e["window_start"] = e["reference_close_day"]
+            e["window_end"] = e["reaction_day"]
+
+        to_fetch, skipped_duplicate = await self._plan_move_windows(
+            repo, settings.DB_PATH, earnings_to_record, "outcome_recorder"
+        )
+        prices, failed_tickers = await fetch_price_windows(
+            self.twelvedata, to_fetch, "outcome_recorder"
+        )
 
-        for e in earnings_to_record[:MAX_TWELVEDATA_TICKERS]:
+        move_records = []
+        for e in to_fetch:
             ticker = e["symbol"]
             earnings_date = e["earnings_date"]
             reference_day = e["reference_close_day"]
             reaction_day = e["reaction_day"]
 
-            try:
-                # Check if we already have this record
-                existing = repo.get_moves(ticker)
-                if any(m.get("earnings_date") == earnings_date for m in existing):
-                    skipped_duplicate += 1
-                    continue
-
-                # Rate limiting
-                api_calls += 1
-                await self._rate_limit_tick(api_calls)
-
-                # Get historical prices
-                history = await self.twelvedata.get_stock_history(ticker, period="5d", interval="1d")
-
-                if not history or "Close" not in history:
-                    log("debug", "No history data for outcome recording", ticker=ticker)
-                    continue
-
-                # Parse price history using helper function
-                price_data = _parse_price_history(history.get("Close", {}))
-                if len(price_data) < 2:
-                    log("debug", "Insufficient price data", ticker=ticker, data_points=len(price_data))
-                    continue
-
-                # Find reference close and reaction close
-                reference_close = None
-                reaction_close = None
-
-                for date_str, price in price_data:
-                    if date_str == reference_day:
-                        reference_close = price
-                    if date_str == reaction_day:
-                        reaction_close = price
-
-                if not reference_close or not reaction_close or reference_close <= 0:
-                    log("debug", "Missing price data for outcome",
-                        ticker=ticker, reference_day=reference_day, reaction_day=reaction_day,
-                        reference_close=reference_close, reaction_close=reaction_close)
-                    continue
-
-                move_pct = ((reaction_close - reference_close) / reference_close) * 100
+            price_data = prices.get((ticker, e["window_start"], e["window_end"]))
+            if not price_data:
+                log("debug", "No history data for outcome recording", ticker=ticker)
+                continue
+            if len(price_data) < 2:
+                log("debug", "Insufficient price data", ticker=ticker, data_points=len(price_data))
+                continue
 
-                move_record = {
-                    "ticker": ticker,
-                    "earnings_date": earnings_date,
-                    "gap_move_pct": round(move_pct, 4),
-                    "intraday_move_pct": round(move_pct, 4),
-                    "prev_close": round(reference_close, 2),
-                    "earnings_close": round(reaction_close, 2),
-                }
+            # Find reference close and reaction close
+            closes = dict(price_data)
+            reference_close = closes.get(reference_day)
+            reaction_close = closes.get(reaction_day)
 
-                repo.save_move(move_record)
-                recorded += 1
-                log("debug", "Recorded outcome", ticker=ticker, date=earnings_date,
-                    move=round(move_pct, 2), reference_day=reference_day, reaction_day=reaction_day)
+            if not reference_close or not reaction_close or reference_close <= 0:
+                log("debug", "Missing price data for outcome",
+                    ticker=ticker, reference_day=reference_day, reaction_day=reaction_day,
+                    reference_close=reference_close, reaction_close=reaction_close)
+                continue
 
-            except Exception as ex:
-                failed_tickers.append(ticker)
-                log("warn", "Failed to record outcome",
-                    ticker=ticker, error=str(ex), job="outcome_recorder")
+            move_pct = ((reaction_close - reference_close) / reference_close) * 100
+
+            move_records.append({
+                "ticker": ticker,
+                "earnings_date": earnings_date,
+                "gap_move_pct": round(move_pct, 4),
+                "intraday_move_pct": round(move_pct, 4),
+                "prev_close": round(reference_close, 2),
+                "earnings_close": round(reaction_close, 2),
+            })
+            log("debug", "Computed outcome", ticker=ticker, date=earnings_date,
+                move=round(move_pct, 2), reference_day=reference_day, reaction_day=reaction_day)
+
+        recorded, save_failed = await self._save_move_records(
+            repo, settings.DB_PATH, to_fetch, move_records, "outcome_recorder"
+        )
+        failed_tickers.extend(save_failed)
 
         # Record metrics
         self._record_duration(start_time, "outcome_recorder")
@@ -1151,15 +1211,15 @@ class JobRunner(BaseJobHandler):
         today = today_et()
 
         # Check if there were any earnings today worth summarizing
-        earnings = await self.alphavantage.get_earnings_calendar()
+        earnings = await self._earnings_calendar()
         todays_earnings = [e for e in (earnings or []) if e["report_date"] == today]
 
         # Filter to tracked tickers only (excludes OTC/foreign stocks without VRP data)
         repo = HistoricalMovesRepository(settings.DB_PATH)
-        tracked_tickers = repo.get_tracked_tickers()
+        tracked_tickers = await run_db(repo.get_tracked_tickers)
         todays_earnings = filter_to_tracked_tickers(todays_earnings, tracked_tickers)
 
-        sent = False
+        delivery: Dict[str, Optional[bool]] = {"sent": False, "delivered": None}
         telegram_error = None
 
         if not todays_earnings:
@@ -1170,7 +1230,7 @@ class JobRunner(BaseJobHandler):
                 # Get outcome stats from today's recordings
                 recorded_moves = []
                 for e in todays_earnings[:10]:
-                    moves = repo.get_moves(e["symbol"])
+                    moves = await run_db(repo.get_moves, e["symbol"])
                     today_move = next((m for m in moves if m.get("earnings_date") == today), None)
                     if today_move:
                         recorded_moves.append({
@@ -1185,7 +1245,7 @@ class JobRunner(BaseJobHandler):
                         direction = "\U0001f4c8" if m["move"] > 0 else "\U0001f4c9"
                         move_str = f"+{m['move']:.1f}%" if m["move"] > 0 else f"{m['move']:.1f}%"
                         msg_lines.append(f"{direction} <b>{m['ticker']}</b>: {move_str}")
-                    sent = await self.telegram.send_message("\n".join(msg_lines))
+                    delivery = await self._notify("\n".join(msg_lines), "evening_summary")
                 else:
                     # Had earnings but no recorded outcomes yet - skip
                     log("info", "Skipping evening summary - no outcomes recorded yet", job="evening_summary")
@@ -1197,7 +1257,7 @@ class JobRunner(BaseJobHandler):
         # Record metrics
         self._record_duration(start_time, "evening_summary")
 
-        result = {"status": "success", "sent": sent, "earnings_today": len(todays_earnings)}
+        result = {"status": "success", **delivery, "earnings_today": len(todays_earnings)}
         if telegram_error:
             result["telegram_error"] = telegram_error
         return result
@@ -1217,12 +1277,11 @@ class JobRunner(BaseJobHandler):
 
         start_time = self._start_timer()
         repo = HistoricalMovesRepository(settings.DB_PATH)
-        backfilled = 0
-        skipped_duplicate = 0
-        failed_tickers = []
 
         # Get earnings from DB (has timing info) with API fallback
-        earnings = await fetch_earnings_with_db_fallback(self.alphavantage, repo, days=14)
+        earnings = await fetch_earnings_with_db_fallback(
+            self.alphavantage, repo, days=14, calendar=self._earnings_calendar
+        )
 
         # Validate API response
         if not earnings:
@@ -1249,104 +1308,89 @@ class JobRunner(BaseJobHandler):
             except Exception:
                 continue
 
-        # Log truncation if limit exceeded
-        if len(past_earnings) > MAX_BACKFILL_TICKERS:
-            log("info", "Truncating backfill candidates",
-                total=len(past_earnings), processing=MAX_BACKFILL_TICKERS)
-
         log("info", "Found past earnings to backfill", count=len(past_earnings))
 
-        api_calls = 0
-        for e in past_earnings[:MAX_TWELVEDATA_TICKERS]:
-            ticker = e["symbol"]
-            earnings_date = e["report_date"]
-            timing = e.get("timing", "").upper()
+        # A week around each earnings date covers the prev and next trading days
+        for e in past_earnings:
+            earnings_day = datetime.strptime(e["report_date"], "%Y-%m-%d").date()
+            e["earnings_date"] = e["report_date"]
+            e["window_start"] = (earnings_day - timedelta(days=7)).isoformat()
+            e["window_end"] = min(earnings_day + timedelta(days=7), today.date()).isoformat()
 
-            try:
-                # Check ALL existing moves for this ticker
-                existing = repo.get_moves(ticker)
-                if any(m.get("earnings_date") == earnings_date for m in existing):
-                    skipped_duplicate += 1
-                    continue
-
-                # Rate limiting
-                api_calls += 1
-                await self._rate_limit_tick(api_calls)
-
-                # Get historical prices around earnings
-                history = await self.twelvedata.get_stock_history(ticker, period="1mo", interval="1d")
-
-                if not history or "Close" not in history:
-                    log("debug", "No history data for backfill", ticker=ticker)
-                    continue
+        to_fetch, skipped_duplicate = await self._plan_move_windows(
+            repo, settings.DB_PATH, past_earnings, "weekly_backfill"
+        )
+        prices, failed_tickers = await fetch_price_windows(
+            self.twelvedata, to_fetch, "weekly_backfill"
+        )
 
-                price_data = _parse_price_history(history.get("Close", {}))
-                if not price_data:
-                    log("debug", "No valid price data after parsing", ticker=ticker)
-                    continue
+        move_records = []
+        for e in to_fetch:
+            ticker = e["symbol"]
+            earnings_date = e["earnings_date"]
+            timing = (e.get("timing") or "").upper()
 
-                # Build date->price lookup
-                price_by_date = {d: p for d, p in price_data}
+            price_data = prices.get((ticker, e["window_start"], e["window_end"]))
+            if not price_data:
+                log("debug", "No history data for backfill", ticker=ticker)
+                continue
 
-                # Determine reference and reaction days based on timing
-                # BMO: reaction on earnings day, reference is prev day
-                # AMC: reaction on next trading day, reference is earnings day
-                earnings_idx = None
+            # Determine reference and reaction days based on timing
+            # BMO: reaction on earnings day, reference is prev day
+            # AMC: reaction on next trading day, reference is earnings day
+            earnings_idx = None
+            for i, (date_str, _) in enumerate(price_data):
+                if date_str == earnings_date:
+                    earnings_idx = i
+                    break
+
+            if earnings_idx is None:
+                # Earnings date not in price data - find closest trading day after
                 for i, (date_str, _) in enumerate(price_data):
-                    if date_str == earnings_date:
+                    if date_str > earnings_date:
                         earnings_idx = i
                         break
 
-                if earnings_idx is None:
-                    # Earnings date not in price data - find closest trading day after
-                    for i, (date_str, _) in enumerate(price_data):
-                        if date_str > earnings_date:
-                            earnings_idx = i
-                            break
-
-                if earnings_idx is None or earnings_idx < 1:
-                    log("debug", "Cannot find earnings date in price data", ticker=ticker)
-                    continue
+            if earnings_idx is None or earnings_idx < 1:
+                log("debug", "Cannot find earnings date in price data", ticker=ticker)
+                continue
 
-                # Calculate reference and reaction closes based on timing
-                if timing == "AMC":
-                    # AMC: reference = earnings day close, reaction = next trading day
-                    if earnings_idx + 1 < len(price_data):
-                        reference_close = price_data[earnings_idx][1]  # earnings day
-                        reaction_close = price_data[earnings_idx + 1][1]  # next day
-                    else:
-                        log("debug", "No next-day data for AMC earnings", ticker=ticker)
-                        continue
+            # Calculate reference and reaction closes based on timing
+            if timing == "AMC":
+                # AMC: reference = earnings day close, reaction = next trading day
+                if earnings_idx + 1 < len(price_data):
+                    reference_close = price_data[earnings_idx][1]  # earnings day
+                    reaction_close = price_data[earnings_idx + 1][1]  # next day
                 else:
-                    # BMO or unknown: reference = prev day close, reaction = earnings day
-                    reference_close = price_data[earnings_idx - 1][1]  # prev day
-                    reaction_close = price_data[earnings_idx][1]  # earnings day
-
-                if not reference_close or not reaction_close or reference_close <= 0:
-                    log("debug", "Invalid price data for backfill",
-                        ticker=ticker, reference=reference_close, reaction=reaction_close)
+                    log("debug", "No next-day data for AMC earnings", ticker=ticker)
                     continue
+            else:
+                # BMO or unknown: reference = prev day close, reaction = earnings day
+                reference_close = price_data[earnings_idx - 1][1]  # prev day
+                reaction_close = price_data[earnings_idx][1]  # earnings day
 
-                move_pct = ((reaction_close - reference_close) / reference_close) * 100
-
-                move_record = {
-                    "ticker": ticker,
-                    "earnings_date": earnings_date,
-                    "gap_move_pct": round(move_pct, 4),
-                    "intraday_move_pct": round(move_pct, 4),
-                    "prev_close": round(reference_close, 2),
-                    "earnings_close": round(reaction_close, 2),
-                }
-
-                repo.save_move(move_record)
-                backfilled += 1
-                log("debug", "Backfilled move", ticker=ticker, date=earnings_date,
-                    timing=timing or "UNKNOWN", move=round(move_pct, 2))
+            if not reference_close or not reaction_close or reference_close <= 0:
+                log("debug", "Invalid price data for backfill",
+                    ticker=ticker, reference=reference_close, reaction=reaction_close)
+                continue
 
-            except Exception as ex:
-                failed_tickers.append(ticker)
-                log("warn", "Failed to backfill ticker",
-                    ticker=ticker, earnings_date=earnings_date, error=str(ex), job="weekly_backfill")
+            move_pct = ((reaction_close - reference_close) / reference_close) * 100
+
+            move_records.append({
+                "ticker": ticker,
+                "earnings_date": earnings_date,
+                "gap_move_pct": round(move_pct, 4),
+                "intraday_move_pct": round(move_pct, 4),
+                "prev_close": round(reference_close, 2),
+                "earnings_close": round(reaction_close, 2),
+            })
+            log("debug", "Computed backfill move", ticker=ticker, date=earnings_date,
+                timing=timing or "UNKNOWN", move=round(move_pct, 2))
+
+        backfilled, save_failed = await self._save_move_records(
+            repo, settings.DB_PATH, to_fetch, move_records, "weekly_backfill"
+        )
+        failed_tickers.extend(save_failed)
 
         # Record metrics
         self._record_duration(start_time, "weekly_backfill")
@@ -1386,11 +1430,16 @@ class JobRunner(BaseJobHandler):
 
             # Run database integrity check before backup
             integrity_ok = False
-            try:
+            def _integrity_check():
                 conn = sqlite3.connect(str(db_path))
-                cursor = conn.execute("PRAGMA integrity_check")
-                result = cursor.fetchone()
-                conn.close()
+                try:
+                    return conn.execute("PRAGMA integrity_check").fetchone()
+                finally:
+                    conn.close()
+
+            try:
+                # Full-file scan - keep it off the event loop
+                result = await run_db(_integrity_check)
 
                 integrity_ok = result and result[0] == "ok"
                 if not integrity_ok:
@@ -1472,16 +1521,16 @@ class JobRunner(BaseJobHandler):
 
             # Actually store the earnings to the database
             repo = HistoricalMovesRepository(settings.DB_PATH)
-            upserted = repo.upsert_earnings_calendar(earnings)
+            upserted = await run_db(repo.upsert_earnings_calendar, earnings)
 
             # Upload updated database to GCS for persistence across Cloud Run instances
             gcs_uploaded = False
             if settings.gcs_bucket:
                 try:
-                    sync = DatabaseSync(bucket_name=settings.gcs_bucket)
-                    db_path = Path(settings.DB_PATH)
-                    shutil.copy(str(db_path), str(sync.local_path))
-                    sync.upload()
+                    sync = ChangesetSync(GCSObjectStore(settings.gcs_bucket))
+                    await asyncio.get_running_loop().run_in_executor(
+                        None, sync.push, settings.DB_PATH
+                    )
                     gcs_uploaded = True
                     log("info", "Calendar sync uploaded to GCS", bucket=settings.gcs_bucket)
                 except Exception as gcs_err:
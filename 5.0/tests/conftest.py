@@ -0,0 +1,31 @@
+# 5.0/tests/conftest.py
+"""Shared fixtures for the 5.0 test suite."""
+
+import pytest
+
+from src.api.snapshots import scan_snapshots
+from src.core import hedging, rate_limit
+
+
+@pytest.fixture(autouse=True)
+def unthrottled_providers(monkeypatch):
+    """
+    Give every test fresh, effectively unlimited provider buckets.
+
+    The real limits (e.g. Twelve Data's one call per 7.5s) would make client
+    tests sleep, and buckets are process-wide so state would leak between
+    tests. Tests of the limiter itself build their own AsyncTokenBucket.
+
+    Hedge policies and the /api/scan and /api/whisper response snapshots are
+    process-wide too, so they are reset around every test as well.
+    """
+    monkeypatch.setattr(rate_limit, "PROVIDER_LIMITS", {
+        name: (100_000, 1.0, 1_000) for name in rate_limit.PROVIDER_LIMITS
+    })
+    rate_limit.reset_buckets()
+    hedging.reset_hedge_policies()
+    scan_snapshots.clear()
+    yield
+    rate_limit.reset_buckets()
+    hedging.reset_hedge_policies()
+    scan_snapshots.clear()
@@ -0,0 +1,63 @@
+"""
+Tests for the per-IP API rate limiter (src/api/state.py).
+"""
+
+import pytest
+
+from src.api.state import InMemoryRateLimiter
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_limits_within_a_window():
+    clock = FakeClock()
+    limiter = InMemoryRateLimiter(max_requests=3, window_seconds=60, clock=clock)
+
+    assert [limiter.check("1.2.3.4") for _ in range(4)] == [True, True, True, False]
+    # Other IPs have their own counts
+    assert limiter.check("5.6.7.8") is True
+    assert limiter.stats()["rejections"] == 1
+
+
+def test_previous_window_weighs_in_until_it_slides_out():
+    """Requests from the previous window count in proportion to their overlap."""
+    clock = FakeClock(now=0.0)
+    limiter = InMemoryRateLimiter(max_requests=10, window_seconds=60, clock=clock)
+    for _ in range(10):
+        assert limiter.check("ip")
+
+    # 30s into the next window half of the previous 10 still count
+    clock.now = 90.0
+    assert sum(limiter.check("ip") for _ in range(10)) == 5
+
+    # Two windows later nothing carries over
+    clock.now = 240.0
+    assert sum(limiter.check("ip") for _ in range(12)) == 10
+
+
+def test_key_count_bounded_with_lru_eviction():
+    """Beyond max_keys the least recently seen IP is dropped."""
+    clock = FakeClock()
+    limiter = InMemoryRateLimiter(max_requests=1, window_seconds=60, max_keys=2, clock=clock)
+
+    assert limiter.check("a") and limiter.check("b")
+    assert limiter.check("a") is False  # "a" is now most recently seen
+    assert limiter.check("c") is True   # evicts "b"
+
+    assert limiter.stats()["keys"] == 2
+    assert limiter.stats()["evictions"] == 1
+    assert limiter.check("a") is False
+    assert limiter.check("b") is True   # forgotten, so counted afresh
+
+
+@pytest.mark.asyncio
+async def test_is_allowed_matches_check():
+    limiter = InMemoryRateLimiter(max_requests=1, window_seconds=60)
+    assert await limiter.is_allowed("ip") is True
+    assert await limiter.is_allowed("ip") is False
@@ -0,0 +1,324 @@
+# 5.0/tests/test_changeset_sync.py
+"""Tests for incremental changeset sync against a local object store."""
+
+import sqlite3
+
+import pytest
+
+from src.core.changeset_sync import ChangesetSync, LocalObjectStore
+from src.core.database import DatabaseSyncConflictError
+
+from common import changesets
+
+
+def _make_db(path):
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE job_status (
+            job_name TEXT NOT NULL,
+            run_date TEXT NOT NULL,
+            status TEXT NOT NULL,
+            PRIMARY KEY (job_name, run_date)
+        );
+        CREATE TABLE historical_moves (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            ticker TEXT NOT NULL,
+            earnings_date TEXT NOT NULL,
+            close_move_pct REAL,
+            UNIQUE(ticker, earnings_date)
+        );
+        CREATE TABLE cache (key TEXT UNIQUE, value BLOB);
+        CREATE TABLE notes (body TEXT);
+    """)
+    conn.execute("INSERT INTO historical_moves (ticker, earnings_date, close_move_pct) VALUES ('AAPL', '2025-01-30', 2.5)")
+    conn.commit()
+    conn.close()
+
+
+def _rows(path, sql):
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute(sql).fetchall()
+    finally:
+        conn.close()
+
+
+def _write(path, *statements):
+    conn = sqlite3.connect(path)
+    try:
+        for sql in statements:
+            conn.execute(sql)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+@pytest.fixture
+def store(tmp_path):
+    return LocalObjectStore(str(tmp_path / "bucket"))
+
+
+@pytest.fixture
+def seeded(tmp_path, store):
+    """A bucket holding a snapshot published by instance A."""
+    db_a = str(tmp_path / "a.db")
+    _make_db(db_a)
+    sync = ChangesetSync(store)
+    sync.compact(db_a)
+    return sync, db_a
+
+
+class TestLocalObjectStore:
+
+    def test_generation_preconditions(self, store):
+        gen = store.write("x", b"1", if_generation_match=0)
+        assert store.read("x") == (b"1", gen)
+
+        with pytest.raises(DatabaseSyncConflictError):
+            store.write("x", b"2", if_generation_match=0)
+        with pytest.raises(DatabaseSyncConflictError):
+            store.write("x", b"2", if_generation_match=gen + 1)
+
+        new_gen = store.write("x", b"2", if_generation_match=gen)
+        assert new_gen > gen
+        assert store.list("") == ["x"]
+        store.delete("x")
+        assert store.stat("x") is None
+
+
+class TestChangeCapture:
+
+    def test_triggers_record_row_changes(self, tmp_path):
+        db = str(tmp_path / "t.db")
+        _make_db(db)
+        conn = sqlite3.connect(db)
+        changesets.install_tracking(conn)
+        conn.execute("INSERT INTO job_status VALUES ('pre_market', '2025-01-30', 'success')")
+        conn.execute("UPDATE historical_moves SET close_move_pct = 3.0 WHERE ticker = 'AAPL'")
+        conn.execute("INSERT INTO cache VALUES ('k', x'00ff')")
+        conn.execute("DELETE FROM notes")
+        conn.commit()
+
+        changeset, last_seq = changesets.collect_changes(conn)
+        conn.close()
+
+        ops = [(c[0], c[1]) for c in changeset["changes"]]
+        assert ops == [("job_status", "U"), ("historical_moves", "U"), ("cache", "U")]
+        assert changeset["tables"]["job_status"]["key"] == ["job_name", "run_date"]
+        assert changeset["tables"]["cache"]["key"] == ["key"]
+        assert last_seq == 3
+
+    def test_apply_is_idempotent_and_not_recaptured(self, tmp_path):
+        src, dst = str(tmp_path / "src.db"), str(tmp_path / "dst.db")
+        _make_db(src)
+        _make_db(dst)
+        conn = sqlite3.connect(src)
+        changesets.install_tracking(conn)
+        conn.execute("INSERT INTO cache VALUES ('k', x'00ff')")
+        conn.execute("INSERT INTO notes VALUES ('hello')")
+        conn.execute("DELETE FROM historical_moves")
+        conn.commit()
+        changeset, _ = changesets.collect_changes(conn)
+        conn.close()
+
+        target = sqlite3.connect(dst)
+        changesets.install_tracking(target)
+        changesets.apply_changeset(target, changeset)
+        changesets.apply_changeset(target, changeset)
+        target.commit()
+        assert changesets.pending_count(target) == 0
+        target.close()
+
+        assert _rows(dst, "SELECT key, value FROM cache") == [("k", b"\x00\xff")]
+        assert _rows(dst, "SELECT body FROM notes") == [("hello",)]
+        assert _rows(dst, "SELECT * FROM historical_moves") == []
+
+    def test_new_table_is_seeded(self, tmp_path):
+        db = str(tmp_path / "t.db")
+        _make_db(db)
+        conn = sqlite3.connect(db)
+        changesets.install_tracking(conn)
+        conn.execute("CREATE TABLE daily_candidates (ticker TEXT PRIMARY KEY)")
+        conn.execute("INSERT INTO daily_candidates VALUES ('NVDA')")
+        conn.commit()
+
+        assert changesets.install_tracking(conn) == ["daily_candidates"]
+        changeset, _ = changesets.collect_changes(conn)
+        conn.close()
+        assert changeset["changes"][0][:3] == ["daily_candidates", "U", ["NVDA"]]
+
+
+class TestChangesetSync:
+
+    def test_push_uploads_only_deltas(self, tmp_path, store, seeded):
+        sync, db_a = seeded
+        snapshot_gen = store.stat("ivcrush.db")
+
+        _write(db_a, "INSERT INTO job_status VALUES ('pre_market', '2025-01-30', 'success')")
+        assert sync.push(db_a) == 1
+        assert sync.push(db_a) is None  # Nothing pending
+
+        # Snapshot untouched; one small changeset uploaded
+        assert store.stat("ivcrush.db") == snapshot_gen
+        assert store.list("ivcrush.db.changes/") == ["ivcrush.db.changes/0000000001.json.gz"]
+
+    def test_cold_pull_applies_snapshot_and_changesets(self, tmp_path, store, seeded):
+        sync, db_a = seeded
+        _write(db_a, "INSERT INTO job_status VALUES ('pre_market', '2025-01-30', 'success')")
+        sync.push(db_a)
+
+        db_b = str(tmp_path / "b.db")
+        result = sync.pull(db_b)
+
+        assert result == {"mode": "snapshot", "head": 1, "applied": 1}
+        assert _rows(db_b, "SELECT status FROM job_status") == [("success",)]
+
+    def test_before_swap_runs_while_old_file_is_in_place(self, tmp_path, store, seeded):
+        sync, _ = seeded
+        db_b = str(tmp_path / "b.db")
+        _write(db_b, "CREATE TABLE bundled (x)")
+        tables = "SELECT name FROM sqlite_master WHERE name = 'bundled'"
+        seen = []
+
+        def before_swap():
+            # Still the bundled file: the snapshot has not replaced it yet
+            seen.append(_rows(db_b, tables))
+
+        assert sync.pull(db_b, before_swap=before_swap)["mode"] == "snapshot"
+        assert seen == [[("bundled",)]]
+        assert _rows(db_b, tables) == []
+
+    def test_warm_pull_is_incremental(self, tmp_path, store, seeded):
+        sync, db_a = seeded
+        db_b = str(tmp_path / "b.db")
+        sync.pull(db_b)
+
+        _write(db_a, "UPDATE historical_moves SET close_move_pct = 9.9")
+        sync.push(db_a)
+
+        result = sync.pull(db_b)
+        assert result["mode"] == "incremental"
+        assert result["applied"] == 1
+        assert _rows(db_b, "SELECT close_move_pct FROM historical_moves") == [(9.9,)]
+
+    def test_concurrent_push_rebases(self, tmp_path, store, seeded):
+        sync, db_a = seeded
+        db_b = str(tmp_path / "b.db")
+        sync.pull(db_b)
+
+        _write(db_a, "INSERT INTO job_status VALUES ('a_job', '2025-01-30', 'success')")
+        _write(db_b, "INSERT INTO job_status VALUES ('b_job', '2025-01-30', 'failed')")
+        assert sync.push(db_a) == 1
+        assert sync.push(db_b) == 2  # seq 1 taken: B replays A's change and retries
+
+        expected = [("a_job",), ("b_job",)]
+        assert _rows(db_b, "SELECT job_name FROM job_status ORDER BY job_name") == expected
+        sync.pull(db_a)
+        assert _rows(db_a, "SELECT job_name FROM job_status ORDER BY job_name") == expected
+
+    def test_concurrent_inserts_with_same_surrogate_id(self, tmp_path, store, seeded):
+        """Rows are replayed by natural key, so equal AUTOINCREMENT ids don't collide."""
+        sync, db_a = seeded
+        db_b = str(tmp_path / "b.db")
+        sync.pull(db_b)
+
+        _write(db_a, "INSERT INTO historical_moves (ticker, earnings_date, close_move_pct) VALUES ('NVDA', '2025-02-26', 8.1)")
+        _write(db_b, "INSERT INTO historical_moves (ticker, earnings_date, close_move_pct) VALUES ('MSFT', '2025-01-29', -6.2)")
+        # Both instances assigned the same id to different rows
+        assert _rows(db_a, "SELECT id FROM historical_moves WHERE ticker = 'NVDA'") == \
+            _rows(db_b, "SELECT id FROM historical_moves WHERE ticker = 'MSFT'")
+
+        sync.push(db_a)
+        sync.push(db_b)
+        sync.pull(db_a)
+
+        expected = [("AAPL",), ("MSFT",), ("NVDA",)]
+        for db in (db_a, db_b):
+            assert _rows(db, "SELECT ticker FROM historical_moves ORDER BY ticker") == expected
+
+    def test_push_gives_up_when_sequence_always_taken(self, tmp_path, store, seeded, monkeypatch):
+        sync, db_a = seeded
+        _write(db_a, "INSERT INTO notes VALUES ('x')")
+
+        def always_taken(name, data, if_generation_match=None):
+            raise DatabaseSyncConflictError(name)
+
+        monkeypatch.setattr(store, "write", always_taken)
+        with pytest.raises(DatabaseSyncConflictError):
+            sync.push(db_a)
+        assert _rows(db_a, f"SELECT COUNT(*) FROM {changesets.CHANGELOG_TABLE}") == [(1,)]
+
+    def test_compaction_folds_changesets(self, tmp_path, store):
+        db_a = str(tmp_path / "a.db")
+        _make_db(db_a)
+        sync = ChangesetSync(store, compact_every=2)
+        sync.compact(db_a)
+
+        for i in range(2):
+            _write(db_a, f"INSERT INTO notes VALUES ('n{i}')")
+            sync.push(db_a)
+
+        assert store.list("ivcrush.db.changes/") == []
+        db_b = str(tmp_path / "b.db")
+        assert sync.pull(db_b) == {"mode": "snapshot", "head": 2, "applied": 0}
+        assert _rows(db_b, "SELECT body FROM notes ORDER BY body") == [("n0",), ("n1",)]
+
+    def test_stale_instance_rebases_on_compacted_snapshot(self, tmp_path, store):
+        """An instance behind a compaction must not publish over the rows it missed."""
+        db_a = str(tmp_path / "a.db")
+        _make_db(db_a)
+        sync = ChangesetSync(store, compact_every=3)
+        sync.compact(db_a)
+        db_b = str(tmp_path / "b.db")
+        sync.pull(db_b)
+
+        # B pushes three changesets; the third compacts them into the snapshot
+        for i in range(3):
+            _write(db_b, f"INSERT INTO job_status VALUES ('b{i}', '2025-01-30', 'success')")
+            sync.push(db_b)
+        assert store.list("ivcrush.db.changes/") == []
+
+        # A still sits at head 0 and keeps writing
+        for i in range(3):
+            _write(db_a, f"INSERT INTO job_status VALUES ('a{i}', '2025-01-30', 'success')")
+            sync.push(db_a)
+
+        query = "SELECT job_name FROM job_status ORDER BY job_name"
+        expected = [("a0",), ("a1",), ("a2",), ("b0",), ("b1",), ("b2",)]
+        assert _rows(db_a, query) == expected
+        fresh = str(tmp_path / "fresh.db")
+        sync.pull(fresh)
+        assert _rows(fresh, query) == expected
+
+    def test_compact_refuses_a_copy_behind_the_snapshot(self, tmp_path, store, seeded):
+        sync, db_a = seeded
+        db_b = str(tmp_path / "b.db")
+        sync.pull(db_b)
+        _write(db_a, "INSERT INTO notes VALUES ('a')")
+        sync.push(db_a)
+        sync.compact(db_a)
+
+        with pytest.raises(DatabaseSyncConflictError):
+            sync.compact(db_b)
+
+    def test_external_snapshot_is_adopted(self, tmp_path, store, seeded):
+        sync, db_a = seeded
+        _write(db_a, "INSERT INTO notes VALUES ('stale')")
+        sync.push(db_a)
+
+        # deploy.sh / sync_databases.py overwrite the blob directly
+        external = str(tmp_path / "external.db")
+        _make_db(external)
+        _write(external, "INSERT INTO notes VALUES ('from laptop')")
+        store.upload("ivcrush.db", external)
+
+        db_b = str(tmp_path / "b.db")
+        result = sync.pull(db_b)
+        assert result["mode"] == "snapshot"
+        assert _rows(db_b, "SELECT body FROM notes") == [("from laptop",)]
+
+        # The manifest now points at the external blob; the next pull is incremental
+        assert sync.pull(db_b)["mode"] == "incremental"
+
+    def test_pull_without_remote_database(self, tmp_path, store):
+        assert ChangesetSync(store).pull(str(tmp_path / "x.db")) is None
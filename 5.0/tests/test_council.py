@@ -422,3 +422,69 @@ async def test_run_council_deep_research():
     assert research.direction == "bullish"
 
     perplexity.query.assert_called_once()
+
+
+def _council_clients(analyst_score_calls, research_calls):
+    """Finnhub/Tradier/Perplexity mocks for a full council; counts paid calls."""
+    finnhub = AsyncMock()
+    finnhub.get_recommendations.side_effect = lambda ticker: (
+        analyst_score_calls.append(ticker) or {"strongBuy": 10, "buy": 15, "hold": 5, "sell": 2, "strongSell": 1}
+    )
+    finnhub.get_company_news.return_value = [
+        {"headline": "Strong earnings beat expectations", "summary": "Growth accelerating"},
+    ]
+
+    tradier = AsyncMock()
+    tradier.get_quote.return_value = {"last": 150.0}
+    tradier.get_expirations.return_value = ["2026-03-07"]
+    tradier.get_options_chain.return_value = []
+
+    async def query(messages):
+        research_calls.append(messages)
+        return {"choices": [{"message": {"content": "Direction: bullish\nScore: +0.6"}}]}
+
+    perplexity = MagicMock()
+    perplexity.query = query
+    perplexity.get_sentiment = AsyncMock(return_value={"score": 0.4, "direction": "bullish"})
+    return finnhub, tradier, perplexity
+
+
+@pytest.mark.asyncio
+async def test_run_council_refetches_only_stale_members(tmp_path):
+    """A second council reuses cached members and refetches expired ones."""
+    import sqlite3
+    from src.domain.repositories import SentimentCacheRepository
+
+    repo = MagicMock()
+    repo.get_next_earnings.return_value = {"earnings_date": "2026-03-01", "timing": "AMC"}
+    repo.get_position_limits.return_value = None
+    repo.get_moves.return_value = [{"intraday_move_pct": 5.0}] * 8
+    db_path = str(tmp_path / "sentiment.db")
+    cache = SentimentCacheRepository(db_path)
+
+    analyst_calls, research_calls = [], []
+    finnhub, tradier, perplexity = _council_clients(analyst_calls, research_calls)
+
+    first = await run_council("NVDA", finnhub, perplexity, tradier, repo, cache)
+    assert not any(m.cached for m in first.members)
+
+    # News has gone stale; everything else is still within its TTL
+    conn = sqlite3.connect(db_path)
+    conn.execute("UPDATE council_member_cache SET expires_at = datetime('now', '-1 minute') "
+                 "WHERE member = 'finnhub_news'")
+    conn.commit()
+    conn.close()
+
+    second = await run_council("NVDA", finnhub, perplexity, tradier, repo, cache)
+
+    assert len(analyst_calls) == 1
+    assert len(research_calls) == 1
+    assert finnhub.get_company_news.await_count == 2
+    cached = {m.name for m in second.members if m.cached}
+    assert cached == {"Perplexity Research", "Finnhub Analysts", "Perplexity Quick", "Historical Pattern"}
+    assert second.consensus_score == first.consensus_score
+
+    # fresh=True refetches every member
+    await run_council("NVDA", finnhub, perplexity, tradier, repo, cache, fresh=True)
+    assert len(analyst_calls) == 2
+    assert len(research_calls) == 2
@@ -0,0 +1,114 @@
+"""
+Tests for the DAG executor (src/jobs/dag.py) and run-shared artifacts.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.core.job_manager import JobManager
+from src.jobs.dag import DagExecutor, order_jobs
+from src.jobs.handlers import JobRunner
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return JobManager(db_path=str(tmp_path / "ivcrush.db"))
+
+
+@pytest.fixture
+def runner():
+    jr = JobRunner()
+    jr._alphavantage = AsyncMock()
+    return jr
+
+
+def test_order_jobs_puts_upstream_first():
+    """Dependencies and ordering-only edges come first; other order is kept."""
+    assert order_jobs(["morning-digest", "pre-market-prep", "morning-digest"]) == [
+        "pre-market-prep", "morning-digest",
+    ]
+    assert order_jobs(["calendar-sync", "weekly-cleanup", "weekly-backup"]) == [
+        "weekly-backup", "calendar-sync", "weekly-cleanup",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_independent_jobs_run_concurrently(manager, runner):
+    """weekly-backup and weekly-cleanup overlap; each waits for the other to start."""
+    started = {"weekly-backup": asyncio.Event(), "weekly-cleanup": asyncio.Event()}
+
+    async def run(job):
+        started[job].set()
+        other = "weekly-cleanup" if job == "weekly-backup" else "weekly-backup"
+        await asyncio.wait_for(started[other].wait(), timeout=2)
+        return {"status": "success"}
+
+    runner.run = run
+    results = await DagExecutor(manager, runner).run(["weekly-backup", "weekly-cleanup"])
+
+    assert {job: r["status"] for job, r in results.items()} == {
+        "weekly-backup": "success", "weekly-cleanup": "success",
+    }
+
+
+@pytest.mark.asyncio
+async def test_failed_dependency_skips_dependents(manager, runner):
+    """A failed upstream job is recorded; its dependents are skipped, not recorded."""
+    ran = []
+
+    async def run(job):
+        ran.append(job)
+        return {"status": "error" if job == "pre-market-prep" else "success"}
+
+    runner.run = run
+    results = await DagExecutor(manager, runner).run(["morning-digest", "pre-market-prep"])
+
+    assert ran == ["pre-market-prep"]
+    assert results["morning-digest"]["status"] == "skipped"
+    assert "pre-market-prep" in results["morning-digest"]["reason"]
+    assert manager.get_day_summary() == {"pre-market-prep": "failed"}
+
+
+@pytest.mark.asyncio
+async def test_stage_timings_recorded(manager, runner):
+    """Each job's run id, wait and duration land in job_status."""
+    async def run(job):
+        await asyncio.sleep(0.02)
+        return {"status": "success"}
+
+    runner.run = run
+    await DagExecutor(manager, runner).run(["pre-market-prep", "sentiment-scan"])
+
+    timings = manager.get_stage_timings()
+    assert set(timings) == {"pre-market-prep", "sentiment-scan"}
+    assert timings["pre-market-prep"]["run_id"] == timings["sentiment-scan"]["run_id"]
+    assert timings["pre-market-prep"]["duration_ms"] >= 15
+    # sentiment-scan started only after pre-market-prep finished
+    assert timings["sentiment-scan"]["wait_ms"] >= timings["pre-market-prep"]["duration_ms"]
+
+
+@pytest.mark.asyncio
+async def test_earnings_calendar_fetched_once_per_run(manager, runner):
+    """Jobs in one run share a single Alpha Vantage calendar fetch."""
+    async def slow_calendar(**kwargs):
+        await asyncio.sleep(0.01)
+        return [{"symbol": "AAPL", "report_date": "2026-02-09"}]
+
+    runner._alphavantage.get_earnings_calendar.side_effect = slow_calendar
+
+    async def run(job):
+        earnings = await runner._earnings_calendar()
+        earnings.append({"symbol": "MUTATED"})  # Each job gets its own copy
+        return {"status": "success", "count": len(earnings)}
+
+    runner.run = run
+    results = await DagExecutor(manager, runner).run(["weekly-backup", "weekly-cleanup"])
+
+    assert runner._alphavantage.get_earnings_calendar.await_count == 1
+    assert [r["result"]["count"] for r in results.values()] == [2, 2]
+
+    # Outside a run nothing is shared
+    await runner._earnings_calendar()
+    assert runner._alphavantage.get_earnings_calendar.await_count == 2
@@ -0,0 +1,150 @@
+# 5.0/tests/test_db_executor.py
+"""Tests for the DB executor, AsyncRepository and slow callback detector."""
+import asyncio
+import sqlite3
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.core import db_executor
+from src.core.db_executor import run_db, executor_stats
+from src.core import loop_monitor
+from src.domain.repositories import AsyncRepository, HistoricalMovesRepository
+
+
+class TestRunDb:
+    """run_db() moves blocking calls off the event loop."""
+
+    @pytest.mark.asyncio
+    async def test_returns_value(self):
+        assert await run_db(lambda a, b=0: a + b, 2, b=3) == 5
+
+    @pytest.mark.asyncio
+    async def test_runs_on_db_thread(self):
+        name = await run_db(lambda: threading.current_thread().name)
+        assert name.startswith("db")
+        assert name != threading.current_thread().name
+
+    @pytest.mark.asyncio
+    async def test_propagates_exceptions(self):
+        def fail():
+            raise sqlite3.OperationalError("database is locked")
+
+        with pytest.raises(sqlite3.OperationalError, match="locked"):
+            await run_db(fail)
+
+    @pytest.mark.asyncio
+    async def test_event_loop_not_blocked(self):
+        """Other coroutines keep running while a slow query is in progress."""
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        await run_db(time.sleep, 0.2)
+        task.cancel()
+        assert ticks >= 5
+
+    @pytest.mark.asyncio
+    async def test_stats_track_calls(self):
+        before = executor_stats()["calls"]
+        await run_db(lambda: None)
+        stats = executor_stats()
+        assert stats["calls"] == before + 1
+        assert stats["in_flight"] == 0
+        assert stats["workers"] == db_executor.DB_EXECUTOR_WORKERS
+
+    @pytest.mark.asyncio
+    async def test_recreated_after_shutdown(self):
+        db_executor.shutdown()
+        assert await run_db(lambda: "ok") == "ok"
+
+
+class TestAsyncRepository:
+    """AsyncRepository preserves sync return types."""
+
+    @pytest.mark.asyncio
+    async def test_wraps_real_repository(self, tmp_path):
+        db_path = str(tmp_path / "test.db")
+        conn = sqlite3.connect(db_path)
+        conn.execute("""
+            CREATE TABLE historical_moves (
+                ticker TEXT, earnings_date TEXT, intraday_move_pct REAL,
+                gap_move_pct REAL, close_move_pct REAL, prev_close REAL,
+                earnings_close REAL
+            )
+        """)
+        conn.execute(
+            "INSERT INTO historical_moves VALUES ('AAPL', '2025-01-30', 3.0, 1.0, 2.0, 100, 102)"
+        )
+        conn.commit()
+        conn.close()
+
+        sync_repo = HistoricalMovesRepository(db_path)
+        repo = AsyncRepository(sync_repo)
+
+        assert await repo.get_moves("AAPL") == sync_repo.get_moves("AAPL")
+        assert await repo.get_moves_batch(["AAPL"]) == sync_repo.get_moves_batch(["AAPL"])
+        assert repo.db_path == db_path
+        assert repo.sync is sync_repo
+
+    @pytest.mark.asyncio
+    async def test_wraps_mock_repository(self):
+        mock_repo = MagicMock()
+        mock_repo.get_vrp.return_value = {"vrp_ratio": 2.1}
+
+        result = await AsyncRepository(mock_repo).get_vrp("AAPL", "2025-01-30")
+
+        assert result == {"vrp_ratio": 2.1}
+        mock_repo.get_vrp.assert_called_once_with("AAPL", "2025-01-30")
+
+
+class TestSlowCallbackDetector:
+    """Blocking callbacks on the loop are logged."""
+
+    @pytest.fixture(autouse=True)
+    def _uninstall(self):
+        yield
+        loop_monitor.uninstall_slow_callback_detector()
+
+    @pytest.mark.asyncio
+    async def test_logs_blocking_callback(self):
+        assert loop_monitor.install_slow_callback_detector(threshold_ms=20)
+        before = loop_monitor.slow_callback_count()
+
+        async def blocking_handler():
+            time.sleep(0.05)  # Sync work on the loop
+
+        with patch.object(loop_monitor, "log") as mock_log, \
+             patch.object(loop_monitor, "metrics"):
+            await asyncio.create_task(blocking_handler())
+
+        assert loop_monitor.slow_callback_count() > before
+        messages = [c.args[1] for c in mock_log.call_args_list]
+        assert "Slow event loop callback" in messages
+        call = next(c for c in mock_log.call_args_list if c.args[1] == "Slow event loop callback")
+        assert "blocking_handler" in call.kwargs["callback"]
+        assert call.kwargs["duration_ms"] >= 20
+
+    @pytest.mark.asyncio
+    async def test_ignores_fast_callbacks(self):
+        loop_monitor.install_slow_callback_detector(threshold_ms=500)
+        before = loop_monitor.slow_callback_count()
+
+        await asyncio.sleep(0)
+        await run_db(time.sleep, 0.05)  # Blocking work off-loop is fine
+
+        assert loop_monitor.slow_callback_count() == before
+
+    def test_uninstall_restores_handle(self):
+        original = asyncio.Handle._run
+        loop_monitor.install_slow_callback_detector()
+        assert asyncio.Handle._run is not original
+        loop_monitor.uninstall_slow_callback_detector()
+        assert asyncio.Handle._run is original
@@ -5,20 +5,22 @@ Tests the actual business logic inside each handler, not just that mocks are cal
 Covers:
 - fetch_earnings_with_db_fallback (API success, API failure, both fail)
 - _parse_price_history helper
-- _pre_market_prep (earnings pipeline, VRP evaluation, rate limiting)
+- _pre_market_prep (earnings pipeline, batched quotes, VRP evaluation, snapshot write)
+- Candidate snapshot reuse (price-move and near-expiry staleness)
 - _sentiment_scan (priming flow)
 - _morning_digest (empty calendar, opportunities, Telegram sending)
 - _outcome_recorder (BMO/AMC timing, duplicate skipping)
-- _weekly_backfill (timing-aware backfill, duplicate detection)
+- _weekly_backfill (timing-aware backfill, duplicate detection, batched windows, overflow queue)
 - _weekly_backup (integrity check, GCS upload)
 - _weekly_cleanup (cache clearing)
 - _calendar_sync (upsert + GCS upload)
-- BaseJobHandler shared methods (_build_result, _rate_limit_tick, _get_historical_pcts)
+- BaseJobHandler shared methods (_build_result, _rate_limit_tick, _run_per_ticker, _get_historical_pcts)
 """
 
 import asyncio
 import tempfile
 import os
+import sqlite3
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch, PropertyMock
 from typing import Dict, Any, List
@@ -60,8 +62,10 @@ def runner(mock_settings):
 
     # Mock all lazy-initialized clients
     jr._tradier = AsyncMock()
+    jr._tradier.get_quotes.return_value = {}
     jr._alphavantage = AsyncMock()
     jr._perplexity = AsyncMock()
+    jr._perplexity.estimated_call_cost = MagicMock(return_value=0.001)
     jr._telegram = AsyncMock()
     jr._yahoo = AsyncMock()
     jr._twelvedata = AsyncMock()
@@ -366,6 +370,36 @@ class TestBaseJobHandler:
             await BaseJobHandler._rate_limit_tick(0, batch_size=5, delay=0.5)
             mock_sleep.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_run_per_ticker_bounds_concurrency_and_collects_errors(self):
+        """Per-ticker work runs in parallel up to the limit; failures don't stop the batch."""
+        from src.jobs.base import BaseJobHandler
+
+        in_flight = 0
+        peak = 0
+
+        async def evaluate(e):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if e["symbol"] == "BAD":
+                raise RuntimeError("chain unavailable")
+            if e["symbol"] == "SKIP":
+                return None
+            return e["symbol"].lower()
+
+        items = [{"symbol": s} for s in ["AAPL", "BAD", "SKIP", "MSFT", "NVDA", "AMD"]]
+        results, failed = await BaseJobHandler._run_per_ticker(
+            items, evaluate, job="test", concurrency=2
+        )
+
+        assert peak == 2
+        assert [r for _, r in results] == ["aapl", "msft", "nvda", "amd"]
+        assert results[0][0] is items[0]
+        assert failed == ["BAD"]
+
     def test_get_historical_pcts_with_data(self):
         """Returns historical percentages and average when sufficient data."""
         from src.jobs.base import BaseJobHandler
@@ -494,6 +528,33 @@ def test_job_runner_accepts_twelvedata_client():
 class TestPreMarketPrep:
     """Tests for the _pre_market_prep handler."""
 
+    FOUR_MOVES = [
+        {"intraday_move_pct": 3.0},
+        {"intraday_move_pct": 5.0},
+        {"intraday_move_pct": 4.0},
+        {"intraday_move_pct": 2.0},
+    ]
+    IM_RESULT = {
+        "implied_move_pct": 8.0,
+        "used_real_data": True,
+        "price": 180.0,
+        "has_weekly_options": True,
+        "expiration": "2026-02-13",
+        "liquidity": {"open_interest": 5000, "spread_pct": 4.2},
+    }
+
+    async def _run(self, runner, mock_settings, earnings, mock_repo, im_mock):
+        today = "2026-02-09"
+        with patch("src.jobs.handlers.fetch_earnings_with_db_fallback", new_callable=AsyncMock, return_value=earnings), \
+             patch("src.jobs.handlers.HistoricalMovesRepository", return_value=mock_repo), \
+             patch("src.jobs.handlers.today_et", return_value=today), \
+             patch("src.jobs.base.HistoricalMovesRepository", return_value=mock_repo), \
+             patch("src.jobs.base.today_et", return_value=today), \
+             patch("src.jobs.base.now_et", return_value=ET.localize(datetime(2026, 2, 9, 5, 30, 0))), \
+             patch("src.jobs.base.settings", mock_settings), \
+             patch("src.jobs.base.fetch_real_implied_move", im_mock):
+            return await runner._pre_market_prep()
+
     @pytest.mark.asyncio
     async def test_empty_calendar_returns_success(self, runner, mock_settings):
         """Empty earnings calendar returns success (not warning) — warning blocks all downstream jobs."""
@@ -507,119 +568,182 @@ class TestPreMarketPrep:
 
     @pytest.mark.asyncio
     async def test_processes_tracked_tickers_only(self, runner, mock_settings):
-        """Only tickers present in historical_moves are processed."""
-        today = "2026-02-09"
-        earnings = _make_earnings(["AAPL", "CUIRF", "NVDA"], report_date=today)
+        """Only tickers present in historical_moves are processed, quoted in one call."""
+        earnings = _make_earnings(["AAPL", "CUIRF", "NVDA"], report_date="2026-02-09")
 
         mock_repo = MagicMock()
         mock_repo.get_tracked_tickers.return_value = {"AAPL", "NVDA"}
-        mock_repo.get_average_move.return_value = 4.5
+        mock_repo.get_moves.return_value = self.FOUR_MOVES
 
-        runner._tradier.get_quote.return_value = {"last": 180.0}
-
-        with patch("src.jobs.handlers.fetch_earnings_with_db_fallback", new_callable=AsyncMock, return_value=earnings), \
-             patch("src.jobs.handlers.HistoricalMovesRepository", return_value=mock_repo), \
-             patch("src.jobs.handlers.today_et", return_value=today), \
-             patch("src.jobs.handlers.now_et") as mock_now, \
-             patch("src.jobs.base.HistoricalMovesRepository", return_value=mock_repo), \
-             patch("src.jobs.base.today_et", return_value=today), \
-             patch("src.jobs.base.now_et") as mock_base_now, \
-             patch("src.jobs.base.settings", mock_settings):
-            mock_now.return_value = MagicMock(strftime=MagicMock(return_value=today))
-            mock_base_now.return_value = ET.localize(datetime(2026, 2, 9, 10, 0, 0))
+        runner._tradier.get_quotes.return_value = {"AAPL": {"last": 180.0}, "NVDA": {"last": 900.0}}
+        im_mock = AsyncMock(return_value=self.IM_RESULT)
 
-            result = await runner._pre_market_prep()
+        result = await self._run(runner, mock_settings, earnings, mock_repo, im_mock)
 
         assert result["status"] == "success"
         # CUIRF should be filtered out
         assert result["tickers_found"] == 2
+        runner._tradier.get_quotes.assert_awaited_once_with(["AAPL", "NVDA"])
+        runner._tradier.get_quote.assert_not_called()
+        # Batched price is passed through so the per-ticker quote call is skipped
+        assert {c.kwargs["price"] for c in im_mock.await_args_list} == {180.0, 900.0}
 
     @pytest.mark.asyncio
     async def test_no_price_skips_ticker(self, runner, mock_settings):
         """Tickers without price data are skipped."""
-        today = "2026-02-09"
-        earnings = _make_earnings(["AAPL"], report_date=today)
+        earnings = _make_earnings(["AAPL"], report_date="2026-02-09")
 
         mock_repo = MagicMock()
         mock_repo.get_tracked_tickers.return_value = {"AAPL"}
-        mock_repo.get_average_move.return_value = 4.5
-
-        # Return None price
-        runner._tradier.get_quote.return_value = {"last": None, "close": None, "prevclose": None}
+        mock_repo.get_moves.return_value = self.FOUR_MOVES
 
-        with patch("src.jobs.handlers.fetch_earnings_with_db_fallback", new_callable=AsyncMock, return_value=earnings), \
-             patch("src.jobs.handlers.HistoricalMovesRepository", return_value=mock_repo), \
-             patch("src.jobs.handlers.today_et", return_value=today), \
-             patch("src.jobs.handlers.now_et") as mock_now, \
-             patch("src.jobs.base.HistoricalMovesRepository", return_value=mock_repo), \
-             patch("src.jobs.base.today_et", return_value=today), \
-             patch("src.jobs.base.now_et") as mock_base_now, \
-             patch("src.jobs.base.settings", mock_settings):
-            mock_now.return_value = MagicMock(strftime=MagicMock(return_value=today))
-            mock_base_now.return_value = ET.localize(datetime(2026, 2, 9, 10, 0, 0))
+        runner._tradier.get_quotes.return_value = {
+            "AAPL": {"last": None, "close": None, "prevclose": None}
+        }
+        im_mock = AsyncMock(return_value=self.IM_RESULT)
 
-            result = await runner._pre_market_prep()
+        result = await self._run(runner, mock_settings, earnings, mock_repo, im_mock)
 
         assert result["tickers_found"] == 0
+        im_mock.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_no_historical_skips_ticker(self, runner, mock_settings):
-        """Tickers without historical average move are skipped."""
-        today = "2026-02-09"
-        earnings = _make_earnings(["AAPL"], report_date=today)
+        """Tickers without enough historical moves are skipped before any options call."""
+        earnings = _make_earnings(["AAPL"], report_date="2026-02-09")
 
         mock_repo = MagicMock()
         mock_repo.get_tracked_tickers.return_value = {"AAPL"}
-        mock_repo.get_average_move.return_value = None  # No historical data
+        mock_repo.get_moves.return_value = []  # No historical data
 
-        with patch("src.jobs.handlers.fetch_earnings_with_db_fallback", new_callable=AsyncMock, return_value=earnings), \
-             patch("src.jobs.handlers.HistoricalMovesRepository", return_value=mock_repo), \
-             patch("src.jobs.handlers.today_et", return_value=today), \
-             patch("src.jobs.handlers.now_et") as mock_now, \
-             patch("src.jobs.base.HistoricalMovesRepository", return_value=mock_repo), \
-             patch("src.jobs.base.today_et", return_value=today), \
-             patch("src.jobs.base.now_et") as mock_base_now, \
-             patch("src.jobs.base.settings", mock_settings):
-            mock_now.return_value = MagicMock(strftime=MagicMock(return_value=today))
-            mock_base_now.return_value = ET.localize(datetime(2026, 2, 9, 10, 0, 0))
+        runner._tradier.get_quotes.return_value = {"AAPL": {"last": 180.0}}
+        im_mock = AsyncMock(return_value=self.IM_RESULT)
 
-            result = await runner._pre_market_prep()
+        result = await self._run(runner, mock_settings, earnings, mock_repo, im_mock)
 
         assert result["tickers_found"] == 0
-        runner._tradier.get_quote.assert_not_called()
+        im_mock.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_ticker_exception_tracked_as_failure(self, runner, mock_settings):
         """When a ticker raises an exception, it's tracked in failed_tickers."""
-        today = "2026-02-09"
-        earnings = _make_earnings(["AAPL", "NVDA"], report_date=today)
+        earnings = _make_earnings(["AAPL", "NVDA"], report_date="2026-02-09")
 
         mock_repo = MagicMock()
         mock_repo.get_tracked_tickers.return_value = {"AAPL", "NVDA"}
-        mock_repo.get_average_move.return_value = 4.5
+        mock_repo.get_moves.return_value = self.FOUR_MOVES
 
-        # First ticker succeeds, second raises
-        runner._tradier.get_quote.side_effect = [
-            {"last": 180.0},
-            Exception("Tradier timeout"),
-        ]
+        runner._tradier.get_quotes.return_value = {"AAPL": {"last": 180.0}, "NVDA": {"last": 900.0}}
 
-        with patch("src.jobs.handlers.fetch_earnings_with_db_fallback", new_callable=AsyncMock, return_value=earnings), \
-             patch("src.jobs.handlers.HistoricalMovesRepository", return_value=mock_repo), \
-             patch("src.jobs.handlers.today_et", return_value=today), \
-             patch("src.jobs.handlers.now_et") as mock_now, \
-             patch("src.jobs.base.HistoricalMovesRepository", return_value=mock_repo), \
-             patch("src.jobs.base.today_et", return_value=today), \
-             patch("src.jobs.base.now_et") as mock_base_now, \
-             patch("src.jobs.base.settings", mock_settings):
-            mock_now.return_value = MagicMock(strftime=MagicMock(return_value=today))
-            mock_base_now.return_value = ET.localize(datetime(2026, 2, 9, 10, 0, 0))
+        async def fetch(tradier, ticker, earnings_date, price=None):
+            if ticker == "NVDA":
+                raise Exception("Tradier timeout")
+            return self.IM_RESULT
 
-            result = await runner._pre_market_prep()
+        result = await self._run(runner, mock_settings, earnings, mock_repo, AsyncMock(side_effect=fetch))
 
         assert result["tickers_found"] == 1
         assert "NVDA" in result.get("failed_tickers", [])
 
+    @pytest.mark.asyncio
+    async def test_writes_candidate_snapshot(self, runner, mock_settings, tmp_path):
+        """Every evaluated ticker lands in candidate_snapshot for later jobs."""
+        from src.jobs.base import BaseJobHandler
+
+        mock_settings.DB_PATH = str(tmp_path / "ivcrush.db")
+        earnings = _make_earnings(["AAPL"], report_date="2026-02-09")
+
+        mock_repo = MagicMock()
+        mock_repo.get_tracked_tickers.return_value = {"AAPL"}
+        mock_repo.get_moves.return_value = self.FOUR_MOVES
+
+        runner._tradier.get_quotes.return_value = {"AAPL": {"last": 180.0}}
+
+        result = await self._run(
+            runner, mock_settings, earnings, mock_repo, AsyncMock(return_value=self.IM_RESULT)
+        )
+
+        assert result["snapshotted"] == 1
+        rows = BaseJobHandler._get_candidate_snapshot(mock_settings.DB_PATH, ["AAPL"])
+        row = rows[("AAPL", "2026-02-09")]
+        assert row["implied_move_pct"] == 8.0
+        assert row["im_result"]["expiration"] == "2026-02-13"
+        assert row["im_result"]["liquidity"]["open_interest"] == 5000
+        assert row["snapshot_price"] == 180.0
+
+
+class TestCandidateSnapshot:
+    """Tests for snapshot reuse in BaseJobHandler (_load_snapshot / _evaluate_vrp_snapshot)."""
+
+    @staticmethod
+    def _result(price: float) -> Dict[str, Any]:
+        return {
+            "vrp_data": {"vrp_ratio": 2.2, "tier": "EXCELLENT"},
+            "im_result": {"price": price, "liquidity": None},
+            "implied_move_pct": 8.0,
+            "used_real": True,
+            "historical_pcts": [3.0, 5.0, 4.0, 2.0],
+            "historical_avg": 3.5,
+            "api_calls": 3,
+        }
+
+    @pytest.fixture
+    def snapshot_db(self, tmp_path):
+        from src.jobs.base import BaseJobHandler
+
+        db_path = str(tmp_path / "ivcrush.db")
+        BaseJobHandler._save_candidate_snapshot(db_path, [
+            ("AAPL", "2026-02-09", self._result(100.0)),
+            ("NVDA", "2026-02-09", self._result(100.0)),
+        ])
+        return db_path
+
+    @pytest.mark.asyncio
+    async def test_only_moved_and_missing_tickers_reevaluated(self, runner, snapshot_db):
+        """Unmoved rows are reused; a moved row and a missing ticker are re-evaluated."""
+        items = _make_earnings(["AAPL", "NVDA", "MSFT"], report_date="2026-02-09")
+        runner._tradier.get_quotes.return_value = {
+            "AAPL": {"last": 100.5},  # 0.5% - within threshold
+            "NVDA": {"last": 104.0},  # 4% - stale
+            "MSFT": {"last": 400.0},  # no snapshot row
+        }
+
+        snapshot = await runner._load_snapshot(snapshot_db, items, job="test")
+        assert set(snapshot.reusable) == {("AAPL", "2026-02-09")}
+        assert snapshot.stale == {("NVDA", "2026-02-09")}
+
+        fresh = {**self._result(104.0), "api_calls": 2}
+        with patch.object(runner, "_evaluate_vrp", new_callable=AsyncMock, return_value=fresh) as ev:
+            for item in items:
+                await runner._evaluate_vrp_snapshot(MagicMock(), item["symbol"], item["report_date"], snapshot)
+            written = await runner._save_snapshot(snapshot_db, snapshot, job="test")
+
+        # Re-evaluations reuse the batched quote instead of fetching one each
+        assert {c.args[1]: c.kwargs["price"] for c in ev.await_args_list} == {
+            "NVDA": 104.0, "MSFT": 400.0,
+        }
+        assert written == 2
+
+    @pytest.mark.asyncio
+    async def test_near_expiry_row_is_stale(self, runner, snapshot_db):
+        """A row within the refresh margin of its TTL is re-evaluated even if the price held."""
+        import sqlite3
+        from src.jobs.base import SNAPSHOT_TTL_MINUTES
+
+        with sqlite3.connect(snapshot_db) as conn:
+            conn.execute(
+                "UPDATE candidate_snapshot SET snapshot_at = datetime('now', ?) WHERE ticker = 'AAPL'",
+                (f"-{SNAPSHOT_TTL_MINUTES - 10} minutes",),
+            )
+        runner._tradier.get_quotes.return_value = {"AAPL": {"last": 100.0}}
+
+        snapshot = await runner._load_snapshot(
+            snapshot_db, _make_earnings(["AAPL"], report_date="2026-02-09"), job="test"
+        )
+
+        assert snapshot.reusable == {}
+        assert snapshot.stale == {("AAPL", "2026-02-09")}
+
 
 # ---------------------------------------------------------------------------
 # _sentiment_scan
@@ -652,7 +776,7 @@ class TestSentimentScan:
 
         mock_cache = MagicMock()
         # Already cached
-        mock_cache.get_sentiment.return_value = {"score": 0.6, "direction": "NEUTRAL"}
+        mock_cache.get_sentiments.return_value = {("AAPL", today): {"score": 0.6, "direction": "NEUTRAL"}}
 
         with patch("src.jobs.handlers.today_et", return_value=today), \
              patch("src.jobs.handlers.now_et") as mock_now, \
@@ -688,7 +812,7 @@ class TestSentimentScan:
         ]
 
         mock_cache = MagicMock()
-        mock_cache.get_sentiment.return_value = None
+        mock_cache.get_sentiments.return_value = {}
 
         # VRP below discovery threshold (1.8)
         mock_im_result = {
@@ -719,6 +843,52 @@ class TestSentimentScan:
         assert result["candidates"] == 0
         assert result["primed"] == 0
 
+    @pytest.mark.asyncio
+    async def test_primes_highest_vrp_within_budget(self, runner, mock_settings, tmp_path):
+        """Candidates are primed in VRP order until the spend limit, then cached in bulk."""
+        from src.domain.repositories import SentimentCacheRepository
+
+        today = "2026-02-09"
+        runner._alphavantage.get_earnings_calendar.return_value = _make_earnings(
+            ["AAPL", "MSFT", "NVDA"], report_date=today
+        )
+        mock_repo = MagicMock()
+        mock_repo.get_tracked_tickers.return_value = {"AAPL", "MSFT", "NVDA"}
+        cache = SentimentCacheRepository(str(tmp_path / "sentiment.db"))
+        cache.save_sentiment("MSFT", today, {"direction": "bullish", "score": 0.5})
+
+        vrp = {"AAPL": 2.0, "NVDA": 3.0}
+
+        async def evaluate(repo, ticker, earnings_date, index):
+            return {"vrp_data": {"vrp_ratio": vrp[ticker]}, "used_real": True}
+
+        async def get_sentiment(ticker, earnings_date):
+            return {"direction": "bullish", "score": 0.4, "api_cost": 0.001}
+
+        runner._evaluate_vrp = evaluate
+        runner._perplexity.get_sentiment.side_effect = get_sentiment
+
+        with patch("src.jobs.handlers.today_et", return_value=today), \
+             patch("src.jobs.handlers.now_et") as mock_now, \
+             patch("src.jobs.base.HistoricalMovesRepository", return_value=mock_repo), \
+             patch("src.jobs.handlers.SentimentCacheRepository", return_value=cache), \
+             patch("src.jobs.handlers.PRIME_BUDGET_DOLLARS", 0.0015), \
+             patch("src.jobs.base.today_et", return_value=today), \
+             patch("src.jobs.base.now_et") as mock_base_now, \
+             patch("src.jobs.base.settings", mock_settings):
+            mock_now.return_value = MagicMock(strftime=MagicMock(return_value=today))
+            mock_base_now.return_value = ET.localize(datetime(2026, 2, 9, 10, 0, 0))
+
+            result = await runner._sentiment_scan()
+
+        # MSFT was cached; the budget covers one call, which goes to NVDA (higher VRP)
+        assert result["candidates"] == 2
+        assert result["primed"] == 1
+        assert result["already_cached"] == 1
+        assert result["skipped"] == 1
+        runner._perplexity.get_sentiment.assert_awaited_once_with("NVDA", today)
+        assert set(cache.get_sentiments([("NVDA", today), ("AAPL", today)])) == {("NVDA", today)}
+
 
 # ---------------------------------------------------------------------------
 # _morning_digest
@@ -963,16 +1133,16 @@ class TestOutcomeRecorder:
 
         mock_repo = MagicMock()
         mock_repo.get_upcoming_earnings.return_value = []
-        mock_repo.get_moves.return_value = []  # No existing record
+        mock_repo.get_moves_batch.return_value = {}  # No existing record
 
         # TwelveData returns price history
-        runner._twelvedata.get_stock_history.return_value = {
+        runner._twelvedata.get_stock_history_batch.return_value = {"AAPL": {
             "Close": {
                 "2026-02-07": 148.0,
                 "2026-02-08": 150.0,   # yesterday (reference for BMO)
                 "2026-02-09": 155.0,   # today (reaction)
             }
-        }
+        }}
 
         real_now = ET.localize(datetime(2026, 2, 9, 19, 0, 0))
 
@@ -986,7 +1156,7 @@ class TestOutcomeRecorder:
         assert result["recorded"] == 1
 
         # Verify save_move was called with correct data
-        save_call = mock_repo.save_move.call_args[0][0]
+        save_call = mock_repo.save_moves.call_args[0][0][0]
         assert save_call["ticker"] == "AAPL"
         assert save_call["earnings_date"] == today
         # Move = (155 - 150) / 150 * 100 = 3.3333
@@ -1004,9 +1174,9 @@ class TestOutcomeRecorder:
         mock_repo = MagicMock()
         mock_repo.get_upcoming_earnings.return_value = []
         # Already has this earnings recorded
-        mock_repo.get_moves.return_value = [
-            {"earnings_date": today, "intraday_move_pct": 3.5},
-        ]
+        mock_repo.get_moves_batch.return_value = {
+            "AAPL": [{"earnings_date": today, "intraday_move_pct": 3.5}],
+        }
 
         real_now = ET.localize(datetime(2026, 2, 9, 19, 0, 0))
 
@@ -1018,7 +1188,7 @@ class TestOutcomeRecorder:
 
         assert result["recorded"] == 0
         assert result["skipped_duplicate"] == 1
-        mock_repo.save_move.assert_not_called()
+        mock_repo.save_moves.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_amc_yesterday_recorded_today(self, runner, mock_settings):
@@ -1032,15 +1202,15 @@ class TestOutcomeRecorder:
 
         mock_repo = MagicMock()
         mock_repo.get_upcoming_earnings.return_value = []
-        mock_repo.get_moves.return_value = []
+        mock_repo.get_moves_batch.return_value = {}
 
-        runner._twelvedata.get_stock_history.return_value = {
+        runner._twelvedata.get_stock_history_batch.return_value = {"MSFT": {
             "Close": {
                 "2026-02-07": 400.0,
                 "2026-02-08": 405.0,   # yesterday (reference for AMC)
                 "2026-02-09": 410.0,   # today (reaction)
             }
-        }
+        }}
 
         real_now = ET.localize(datetime(2026, 2, 9, 19, 0, 0))
 
@@ -1052,7 +1222,7 @@ class TestOutcomeRecorder:
 
         assert result["recorded"] == 1
 
-        save_call = mock_repo.save_move.call_args[0][0]
+        save_call = mock_repo.save_moves.call_args[0][0][0]
         assert save_call["ticker"] == "MSFT"
         assert save_call["earnings_date"] == yesterday
         # Move = (410 - 405) / 405 * 100 = 1.2346
@@ -1080,7 +1250,7 @@ class TestOutcomeRecorder:
             result = await runner._outcome_recorder()
 
         assert result["recorded"] == 0
-        mock_repo.save_move.assert_not_called()
+        mock_repo.save_moves.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_insufficient_price_data_skipped(self, runner, mock_settings):
@@ -1093,12 +1263,12 @@ class TestOutcomeRecorder:
 
         mock_repo = MagicMock()
         mock_repo.get_upcoming_earnings.return_value = []
-        mock_repo.get_moves.return_value = []
+        mock_repo.get_moves_batch.return_value = {}
 
         # Only one data point
-        runner._twelvedata.get_stock_history.return_value = {
+        runner._twelvedata.get_stock_history_batch.return_value = {"AAPL": {
             "Close": {"2026-02-09": 155.0}
-        }
+        }}
 
         real_now = ET.localize(datetime(2026, 2, 9, 19, 0, 0))
 
@@ -1118,9 +1288,10 @@ class TestOutcomeRecorder:
 class TestWeeklyBackup:
     """Tests for the _weekly_backup handler.
 
-    Note: _weekly_backup uses local imports (from pathlib import Path) inside the
-    method body, so patching src.jobs.handlers.Path does NOT work. We must use real
-    temp files and mock sqlite3 at the module level for integrity check interception.
+    Note: _weekly_backup uses local imports (shutil, pathlib.Path) inside the
+    method body, so they can't be patched on src.jobs.handlers. We use real temp
+    files, patch shutil.copy itself, and mock sqlite3 at the module level for
+    integrity check interception.
     """
 
     @pytest.mark.asyncio
@@ -1171,7 +1342,7 @@ class TestWeeklyBackup:
             with patch("src.jobs.handlers.sqlite3") as mock_sqlite, \
                  patch("src.jobs.handlers.now_et", return_value=real_now), \
                  patch("src.jobs.handlers.DatabaseSync") as mock_sync_cls, \
-                 patch("src.jobs.handlers.shutil"):
+                 patch("shutil.copy"):
                 # Integrity passes
                 mock_conn = MagicMock()
                 mock_cursor = MagicMock()
@@ -1210,7 +1381,7 @@ class TestWeeklyBackup:
             with patch("src.jobs.handlers.sqlite3") as mock_sqlite, \
                  patch("src.jobs.handlers.now_et", return_value=real_now), \
                  patch("src.jobs.handlers.DatabaseSync") as mock_sync_cls, \
-                 patch("src.jobs.handlers.shutil"):
+                 patch("shutil.copy"):
                 mock_conn = MagicMock()
                 mock_cursor = MagicMock()
                 mock_cursor.fetchone.return_value = ("ok",)
@@ -1291,13 +1462,11 @@ class TestCalendarSync:
         mock_repo.upsert_earnings_calendar.return_value = 3
 
         mock_sync = MagicMock()
-        mock_sync.upload.return_value = True
-        mock_sync.local_path = "/tmp/sync_path"
+        mock_sync.push.return_value = 7
 
         with patch("src.jobs.handlers.HistoricalMovesRepository", return_value=mock_repo), \
-             patch("src.jobs.handlers.DatabaseSync", return_value=mock_sync), \
-             patch("src.jobs.handlers.shutil"), \
-             patch("src.jobs.handlers.Path"), \
+             patch("src.jobs.handlers.GCSObjectStore"), \
+             patch("src.jobs.handlers.ChangesetSync", return_value=mock_sync), \
              patch("src.jobs.base.settings", mock_settings):
 
             result = await runner._calendar_sync()
@@ -1306,6 +1475,7 @@ class TestCalendarSync:
         assert result["fetched"] == 3
         assert result["synced"] == 3
         assert result["gcs_uploaded"] is True
+        mock_sync.push.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_gcs_upload_failure_still_succeeds(self, runner, mock_settings):
@@ -1317,9 +1487,7 @@ class TestCalendarSync:
         mock_repo.upsert_earnings_calendar.return_value = 1
 
         with patch("src.jobs.handlers.HistoricalMovesRepository", return_value=mock_repo), \
-             patch("src.jobs.handlers.DatabaseSync", side_effect=Exception("GCS error")), \
-             patch("src.jobs.handlers.Path"), \
-             patch("src.jobs.handlers.shutil"), \
+             patch("src.jobs.handlers.GCSObjectStore", side_effect=Exception("GCS error")), \
              patch("src.jobs.base.settings", mock_settings):
 
             result = await runner._calendar_sync()
@@ -1431,16 +1599,16 @@ class TestWeeklyBackfill:
 
         mock_repo = MagicMock()
         mock_repo.get_upcoming_earnings.return_value = []
-        mock_repo.get_moves.return_value = []  # No existing record
+        mock_repo.get_moves_batch.return_value = {}  # No existing record
 
         # Price data around earnings
-        runner._twelvedata.get_stock_history.return_value = {
+        runner._twelvedata.get_stock_history_batch.return_value = {"AAPL": {
             "Close": {
                 "2026-02-05": 148.0,  # prev day (reference for BMO)
                 "2026-02-06": 155.0,  # earnings day (reaction)
                 "2026-02-07": 154.0,
             }
-        }
+        }}
 
         # now_et() returns Feb 9 (3 days after earnings)
         mock_now_val = ET.localize(datetime(2026, 2, 9, 19, 0, 0))
@@ -1453,7 +1621,7 @@ class TestWeeklyBackfill:
 
         assert result["backfilled"] == 1
 
-        save_call = mock_repo.save_move.call_args[0][0]
+        save_call = mock_repo.save_moves.call_args[0][0][0]
         # BMO: reference = prev day (148), reaction = earnings day (155)
         # Move = (155 - 148) / 148 * 100 = 4.7297
         assert abs(save_call["gap_move_pct"] - 4.7297) < 0.01
@@ -1468,15 +1636,15 @@ class TestWeeklyBackfill:
 
         mock_repo = MagicMock()
         mock_repo.get_upcoming_earnings.return_value = []
-        mock_repo.get_moves.return_value = []
+        mock_repo.get_moves_batch.return_value = {}
 
-        runner._twelvedata.get_stock_history.return_value = {
+        runner._twelvedata.get_stock_history_batch.return_value = {"MSFT": {
             "Close": {
                 "2026-02-05": 400.0,
                 "2026-02-06": 405.0,  # earnings day (reference for AMC)
                 "2026-02-07": 415.0,  # next day (reaction)
             }
-        }
+        }}
 
         mock_now_val = ET.localize(datetime(2026, 2, 9, 4, 0, 0))
 
@@ -1488,7 +1656,7 @@ class TestWeeklyBackfill:
 
         assert result["backfilled"] == 1
 
-        save_call = mock_repo.save_move.call_args[0][0]
+        save_call = mock_repo.save_moves.call_args[0][0][0]
         # AMC: reference = earnings day (405), reaction = next day (415)
         # Move = (415 - 405) / 405 * 100 = 2.4691
         assert abs(save_call["gap_move_pct"] - 2.4691) < 0.01
@@ -1504,9 +1672,9 @@ class TestWeeklyBackfill:
         mock_repo = MagicMock()
         mock_repo.get_upcoming_earnings.return_value = []
         # Already has this earnings date
-        mock_repo.get_moves.return_value = [
-            {"earnings_date": earnings_date, "intraday_move_pct": 4.5},
-        ]
+        mock_repo.get_moves_batch.return_value = {
+            "AAPL": [{"earnings_date": earnings_date, "intraday_move_pct": 4.5}],
+        }
 
         mock_now_val = ET.localize(datetime(2026, 2, 9, 4, 0, 0))
 
@@ -1519,6 +1687,120 @@ class TestWeeklyBackfill:
         assert result["backfilled"] == 0
         assert result["skipped_duplicate"] == 1
 
+    @pytest.mark.asyncio
+    async def test_same_window_fetched_in_one_batch(self, runner, mock_settings):
+        """Tickers with the same earnings date share one multi-symbol request."""
+        earnings_date = "2026-02-06"
+        runner._alphavantage.get_earnings_calendar.return_value = _make_earnings(
+            ["AAPL", "MSFT"], report_date=earnings_date, timing="BMO"
+        )
+
+        mock_repo = MagicMock()
+        mock_repo.get_upcoming_earnings.return_value = []
+        mock_repo.get_moves_batch.return_value = {}
+
+        closes = {"Close": {"2026-02-05": 100.0, "2026-02-06": 110.0}}
+        runner._twelvedata.get_stock_history_batch.return_value = {
+            "AAPL": closes, "MSFT": closes,
+        }
+
+        mock_now_val = ET.localize(datetime(2026, 2, 9, 4, 0, 0))
+
+        with patch("src.jobs.handlers.HistoricalMovesRepository", return_value=mock_repo), \
+             patch("src.jobs.handlers.now_et", return_value=mock_now_val), \
+             patch("src.jobs.handlers.MARKET_TZ", ET), \
+             patch("src.jobs.handlers.today_et", return_value="2026-02-09"):
+            result = await runner._weekly_backfill()
+
+        assert result["backfilled"] == 2
+        runner._twelvedata.get_stock_history_batch.assert_awaited_once_with(
+            ["AAPL", "MSFT"], "2026-01-30", "2026-02-09"
+        )
+        # Both moves written in one transaction
+        mock_repo.save_moves.assert_called_once()
+        assert len(mock_repo.save_moves.call_args[0][0]) == 2
+
+    @pytest.mark.asyncio
+    async def test_overflow_queued_for_next_run(self, runner, mock_settings, tmp_path):
+        """Windows beyond the TwelveData cap are queued and taken first next run."""
+        mock_settings.DB_PATH = str(tmp_path / "ivcrush.db")
+        earnings_date = "2026-02-06"
+        runner._alphavantage.get_earnings_calendar.return_value = _make_earnings(
+            ["AAPL", "MSFT"], report_date=earnings_date, timing="BMO"
+        )
+
+        mock_repo = MagicMock()
+        mock_repo.get_upcoming_earnings.return_value = []
+        mock_repo.get_moves_batch.return_value = {}
+
+        async def history(symbols, start, end):
+            return {s: {"Close": {"2026-02-05": 100.0, "2026-02-06": 110.0}} for s in symbols}
+
+        runner._twelvedata.get_stock_history_batch.side_effect = history
+
+        mock_now_val = ET.localize(datetime(2026, 2, 9, 4, 0, 0))
+
+        with patch("src.jobs.handlers.HistoricalMovesRepository", return_value=mock_repo), \
+             patch("src.jobs.handlers.now_et", return_value=mock_now_val), \
+             patch("src.jobs.handlers.MARKET_TZ", ET), \
+             patch("src.jobs.handlers.today_et", return_value="2026-02-09"), \
+             patch("src.jobs.base.MAX_TWELVEDATA_TICKERS", 1):
+            first = await runner._weekly_backfill()
+            # Next run: AAPL is now recorded, MSFT comes from the queue
+            mock_repo.get_moves_batch.return_value = {
+                "AAPL": [{"earnings_date": earnings_date}],
+            }
+            second = await runner._weekly_backfill()
+
+        assert first["backfilled"] == 1
+        assert mock_repo.save_moves.call_args_list[0][0][0][0]["ticker"] == "AAPL"
+        assert second["backfilled"] == 1
+        assert second["skipped_duplicate"] == 1
+        assert mock_repo.save_moves.call_args_list[1][0][0][0]["ticker"] == "MSFT"
+
+    @pytest.mark.asyncio
+    async def test_unsaved_windows_stay_queued(self, runner, mock_settings, tmp_path):
+        """A bad row is saved alone; windows that failed stay queued for the next run."""
+        mock_settings.DB_PATH = str(tmp_path / "ivcrush.db")
+        earnings_date = "2026-02-06"
+        runner._alphavantage.get_earnings_calendar.return_value = _make_earnings(
+            ["AAPL", "MSFT", "NVDA"], report_date=earnings_date, timing="BMO"
+        )
+
+        mock_repo = MagicMock()
+        mock_repo.get_upcoming_earnings.return_value = []
+        mock_repo.get_moves_batch.return_value = {}
+        mock_repo.save_moves.side_effect = sqlite3.OperationalError("database is locked")
+
+        def save_move(move):
+            if move["ticker"] == "MSFT":
+                raise sqlite3.IntegrityError("CHECK constraint failed")
+            return True
+
+        mock_repo.save_move.side_effect = save_move
+
+        async def history(symbols, start, end):
+            # No price data for NVDA
+            return {
+                s: {"Close": {"2026-02-05": 100.0, "2026-02-06": 110.0}}
+                for s in symbols if s != "NVDA"
+            }
+
+        runner._twelvedata.get_stock_history_batch.side_effect = history
+
+        mock_now_val = ET.localize(datetime(2026, 2, 9, 4, 0, 0))
+
+        with patch("src.jobs.handlers.HistoricalMovesRepository", return_value=mock_repo), \
+             patch("src.jobs.handlers.now_et", return_value=mock_now_val), \
+             patch("src.jobs.handlers.MARKET_TZ", ET), \
+             patch("src.jobs.handlers.today_et", return_value="2026-02-09"):
+            result = await runner._weekly_backfill()
+
+        assert result["backfilled"] == 1
+        assert result["failed_tickers"] == ["MSFT"]
+        queued = runner._get_pending_moves(mock_settings.DB_PATH, "weekly_backfill")
+        assert sorted(i["symbol"] for i in queued) == ["MSFT", "NVDA"]
+
 
 # ---------------------------------------------------------------------------
 # _evening_summary
@@ -1578,8 +1860,10 @@ class TestEveningSummary:
 
         assert result["status"] == "success"
         assert result["sent"] is True
+        assert result["delivered"] is None  # Queued: the job doesn't wait for delivery
         assert result["earnings_today"] == 2
         runner._telegram.send_message.assert_called_once()
+        assert "await_delivery" not in runner._telegram.send_message.call_args.kwargs
 
     @pytest.mark.asyncio
     async def test_earnings_no_outcomes_yet_skips_summary(self, runner, mock_settings):
@@ -0,0 +1,157 @@
+# 5.0/tests/test_hedging.py
+"""Tests for hedged provider requests."""
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from src.core import hedging
+from src.core.hedging import HedgePolicy
+
+
+@pytest.fixture(autouse=True)
+def quiet_metrics():
+    with patch.object(hedging, "metrics"):
+        yield
+
+
+def warmed(latency: float = 0.01, samples: int = 20, **kwargs) -> HedgePolicy:
+    policy = HedgePolicy("test", min_samples=samples, min_delay=0.0, **kwargs)
+    policy._latencies.extend([latency] * samples)
+    policy.requests = 100  # History of unhedged traffic funds the budget
+    return policy
+
+
+class TestHedgePolicy:
+
+    @pytest.mark.asyncio
+    async def test_no_hedge_while_warming_up(self):
+        policy = HedgePolicy("test", min_samples=5)
+        calls = 0
+
+        async def attempt():
+            nonlocal calls
+            calls += 1
+            return "ok"
+
+        assert policy.hedge_delay() is None
+        assert await policy.run(attempt) == "ok"
+        assert calls == 1 and policy.hedged == 0
+        assert len(policy._latencies) == 1
+
+    def test_delay_is_p95(self):
+        policy = HedgePolicy("test", min_samples=20, min_delay=0.0)
+        policy._latencies.extend([0.1] * 19 + [5.0])
+        assert policy.hedge_delay() == pytest.approx(0.1)
+        policy._latencies.extend([5.0])
+        assert policy.hedge_delay() == pytest.approx(5.0)
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_loses_to_hedge_and_is_cancelled(self):
+        policy = warmed()
+        cancelled = asyncio.Event()
+        calls = 0
+
+        async def attempt():
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                try:
+                    await asyncio.sleep(5)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+                return "slow"
+            return "fast"
+
+        assert await asyncio.wait_for(policy.run(attempt), timeout=1) == "fast"
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+        assert policy.hedged == 1 and policy.hedge_wins == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_copy_falls_back_to_other(self):
+        policy = warmed()
+        calls = 0
+
+        async def attempt():
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                await asyncio.sleep(0.05)
+                return "primary"
+            raise ConnectionError("hedge failed")
+
+        assert await policy.run(attempt) == "primary"
+        assert policy.hedge_wins == 0
+
+    @pytest.mark.asyncio
+    async def test_both_fail_raises_primary_error(self):
+        policy = warmed()
+        calls = 0
+
+        async def attempt():
+            nonlocal calls
+            calls += 1
+            n = calls
+            await asyncio.sleep(0.02 if n == 1 else 0)
+            raise ValueError(f"attempt {n}")
+
+        with pytest.raises(ValueError, match="attempt 1"):
+            await policy.run(attempt)
+
+    @pytest.mark.asyncio
+    async def test_budget_caps_hedges(self):
+        policy = HedgePolicy("test", budget=0.05)
+        policy.hedge_delay = lambda: 0.005  # Every request is slow
+        calls = 0
+
+        async def attempt():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.02)
+            return "ok"
+
+        for _ in range(40):
+            await policy.run(attempt)
+
+        # 5% of 40 requests
+        assert policy.hedged == 2
+        assert calls == 42
+
+    @pytest.mark.asyncio
+    async def test_limiter_wait_is_not_latency(self):
+        """Time spent acquiring a token neither counts as latency nor starts the hedge timer."""
+        policy = warmed(latency=0.05)
+        calls = 0
+
+        async def acquire():
+            await asyncio.sleep(0.2)
+            return "token"
+
+        async def attempt(token):
+            nonlocal calls
+            calls += 1
+            assert token == "token"
+            return "ok"
+
+        assert await policy.run(attempt, acquire=acquire) == "ok"
+        assert calls == 1 and policy.hedged == 0
+        assert policy._latencies[-1] < 0.1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_loser_recorded_at_elapsed_time(self):
+        policy = warmed(latency=0.02)
+        calls = 0
+
+        async def attempt():
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                await asyncio.sleep(5)
+            return "fast"
+
+        assert await policy.run(attempt) == "fast"
+        await asyncio.sleep(0)  # Let the cancelled primary unwind
+        # Window: 20 warm-up samples, the hedge winner, the censored primary
+        assert len(policy._latencies) == 22
+        assert policy._latencies[-1] >= 0.02
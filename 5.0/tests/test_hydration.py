@@ -0,0 +1,132 @@
+# 5.0/tests/test_hydration.py
+"""Tests for background DB hydration and lazy cold-start imports."""
+import asyncio
+import subprocess
+import sys
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from src.core import hydration
+from src.core.hydration import DatabaseHydrator
+
+
+@pytest.fixture(autouse=True)
+def quiet_metrics():
+    with patch.object(hydration, "metrics"):
+        yield
+
+
+@pytest.fixture
+def reset_hydrator():
+    yield
+    hydration._hydrator = None
+
+
+class TestDatabaseHydrator:
+
+    @pytest.mark.asyncio
+    async def test_pull_runs_off_loop_then_ready(self):
+        threads = []
+
+        def pull(path):
+            threads.append(threading.current_thread().name)
+            return {"mode": "snapshot", "head": 3, "applied": 1}
+
+        ready_calls = []
+        hydrator = DatabaseHydrator("/tmp/x.db", pull, on_ready=lambda: ready_calls.append(1))
+        hydrator.start()
+        assert await hydrator.wait(timeout=5)
+
+        assert hydrator.state == "ready"
+        assert threads[0] != threading.current_thread().name
+        assert ready_calls == [1]
+        status = hydrator.status()
+        assert status["mode"] == "snapshot" and status["head"] == 3
+        assert status["duration_ms"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_before_swap_is_passed_to_pull(self):
+        calls = []
+
+        def pull(path, before_swap):
+            before_swap()
+            calls.append("swap")
+
+        hydrator = DatabaseHydrator("/tmp/x.db", pull, on_ready=lambda: calls.append("ready"),
+                                    before_swap=lambda: calls.append("close"))
+        hydrator.start()
+        assert await hydrator.wait(timeout=5)
+        assert calls == ["close", "swap", "ready"]
+
+    @pytest.mark.asyncio
+    async def test_failed_pull_falls_back(self):
+        def pull(path):
+            raise ConnectionError("gcs down")
+
+        hydrator = DatabaseHydrator("/tmp/x.db", pull)
+        hydrator.start()
+        assert await hydrator.wait(timeout=5)
+        assert hydrator.status() == {
+            "state": "failed", "duration_ms": hydrator.duration_ms, "error": "ConnectionError",
+        }
+
+    @pytest.mark.asyncio
+    async def test_wait_for_database_times_out(self, reset_hydrator):
+        release = threading.Event()
+        hydration.start_hydration("/tmp/x.db", lambda path: release.wait(5))
+        try:
+            assert hydration.hydration_status()["state"] == "hydrating"
+            assert await hydration.wait_for_database(timeout=0.05) is False
+        finally:
+            release.set()
+            await hydration.get_hydrator().wait(timeout=5)
+        assert await hydration.wait_for_database(timeout=0.05) is True
+
+    @pytest.mark.asyncio
+    async def test_eager_mode_never_waits(self):
+        assert hydration.get_hydrator() is None
+        assert await hydration.wait_for_database(timeout=0) is True
+        assert hydration.hydration_status() == {"state": "eager"}
+
+
+class TestHydrationGate:
+
+    def test_root_served_while_other_paths_wait(self, reset_hydrator):
+        from fastapi.testclient import TestClient
+        from src.main import app
+
+        release = threading.Event()
+
+        async def slow_hydration():
+            hydration.start_hydration("/tmp/x.db", lambda path: release.wait(5))
+
+        with TestClient(app) as client, \
+             patch("src.api.middleware.wait_for_database", return_value=False) as gate:
+            client.portal.call(slow_hydration)
+            try:
+                root = client.get("/")
+                assert root.status_code == 200
+                assert root.json()["database"] == "hydrating"
+
+                blocked = client.get("/api/health", headers={"X-API-Key": "x"})
+                assert blocked.status_code == 503
+                assert blocked.headers["Retry-After"] == "5"
+                gate.assert_called_once()
+            finally:
+                release.set()
+
+
+def test_heavy_modules_not_imported_at_startup():
+    """Importing the app must not pull in GCS, yfinance, pandas or numpy."""
+    code = (
+        "import sys, src.main; "
+        "print(','.join(m for m in ('google.cloud.storage', 'yfinance', 'pandas', 'numpy') "
+        "if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+        env={"ENV": "development", "SECRETS": "{}", "PATH": ""},
+    )
+    assert result.stdout.strip() == ""
@@ -6,6 +6,7 @@ from src.domain.implied_move import (
     find_atm_straddle,
     fetch_real_implied_move,
     get_implied_move_with_fallback,
+    chain_liquidity,
     IMPLIED_MOVE_FALLBACK_MULTIPLIER,
 )
 
@@ -97,6 +98,7 @@ async def test_fetch_real_implied_move_success(mock_tradier, sample_options_chai
     assert result["expiration"] == "2025-01-17"
     assert result["price"] == 100.0
     assert result["error"] is None
+    assert result["liquidity"]["spread_pct"] is not None
 
 
 @pytest.mark.asyncio
@@ -252,3 +254,14 @@ def test_get_implied_move_with_fallback_none_implied_move():
 def test_fallback_multiplier_value():
     """Verify fallback multiplier constant."""
     assert IMPLIED_MOVE_FALLBACK_MULTIPLIER == 1.5
+
+
+def test_chain_liquidity_inputs():
+    """Total open interest and average spread over quoted contracts."""
+    chain = [
+        {"strike": 100.0, "option_type": "call", "bid": 4.5, "ask": 5.5, "open_interest": 300},
+        {"strike": 100.0, "option_type": "put", "bid": 0, "ask": 1.0, "open_interest": 200},
+    ]
+
+    assert chain_liquidity(chain) == {"open_interest": 500, "spread_pct": 20.0}
+    assert chain_liquidity([]) == {"open_interest": 0, "spread_pct": None}
@@ -140,3 +140,63 @@ def test_job_manager_uses_ivcrush_db_path(tmp_path):
         assert "ivcrush" in manager.db_path or manager.db_path == str(tmp_path / "ivcrush.db")
     finally:
         del os.environ['DB_PATH']
+
+
+def _at(year, month, day, hour, minute):
+    import pytz
+    from datetime import datetime
+    return pytz.timezone("America/New_York").localize(datetime(year, month, day, hour, minute))
+
+
+def test_due_jobs_sunday_pulls_maintenance_forward(db_path):
+    """Sunday 03:00 runs backup, cleanup and calendar-sync in one DAG run."""
+    from unittest.mock import patch
+    with patch("src.core.job_manager.now_et", return_value=_at(2026, 3, 29, 3, 0)), \
+         patch("src.core.job_manager.today_et", return_value="2026-03-29"):
+        manager = JobManager(db_path=db_path)
+        assert manager.get_due_jobs() == ["weekly-backup", "weekly-cleanup", "calendar-sync"]
+
+        manager.record_status("weekly-backup", "success")
+        manager.record_status("weekly-cleanup", "success")
+        manager.record_status("calendar-sync", "failed")
+    # Their own 03:30 / 04:00 ticks find nothing left to do
+    with patch("src.core.job_manager.now_et", return_value=_at(2026, 3, 29, 3, 30)), \
+         patch("src.core.job_manager.today_et", return_value="2026-03-29"):
+        assert manager.get_due_jobs() == []
+
+
+def test_due_jobs_include_never_attempted_dependencies(db_path):
+    """A missed pre-market-prep runs ahead of the digest; a failed one is not retried."""
+    from unittest.mock import patch
+    with patch("src.core.job_manager.now_et", return_value=_at(2026, 3, 30, 7, 30)), \
+         patch("src.core.job_manager.today_et", return_value="2026-03-30"):
+        manager = JobManager(db_path=db_path)
+        assert manager.get_due_jobs() == ["pre-market-prep", "morning-digest"]
+
+        manager.record_status("pre-market-prep", "failed")
+        assert manager.get_due_jobs() == ["morning-digest"]
+
+
+def test_timing_columns_added_to_existing_table(db_path):
+    """A job_status table from before stage timings gains the new columns."""
+    import sqlite3
+    conn = sqlite3.connect(db_path)
+    conn.execute("""
+        CREATE TABLE job_status (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            date TEXT NOT NULL,
+            job_name TEXT NOT NULL,
+            status TEXT NOT NULL,
+            updated_at TEXT NOT NULL,
+            UNIQUE(date, job_name)
+        )
+    """)
+    conn.commit()
+    conn.close()
+
+    manager = JobManager(db_path=db_path)
+    manager.record_status("pre-market-prep", "success", {"run_id": "abc", "duration_ms": 1200})
+
+    timings = manager.get_stage_timings()
+    assert timings["pre-market-prep"]["run_id"] == "abc"
+    assert timings["pre-market-prep"]["duration_ms"] == 1200
@@ -253,15 +253,24 @@ async def test_all_jobs_registered():
 async def test_alphavantage_429_sleep_is_bounded():
     """429 response must sleep at most 15s, not 60s — to preserve job timeout budget."""
     from unittest.mock import AsyncMock, MagicMock, patch
+    from src.core.rate_limit import PROVIDER_LIMITS, AsyncTokenBucket
     from src.integrations.alphavantage import AlphaVantageClient
 
     client = AlphaVantageClient(api_key="test")
     sleep_times = []
+    clock = {"now": 1000.0}
 
     async def mock_sleep(t):
         sleep_times.append(t)
-
-    with patch("src.integrations.alphavantage.asyncio.sleep", side_effect=mock_sleep):
+        clock["now"] += t
+
+    # Fake clock: the Retry-After penalty passes without real time passing
+    bucket = AsyncTokenBucket(
+        *PROVIDER_LIMITS["alphavantage"], name="alphavantage",
+        clock=lambda: clock["now"], sleep=mock_sleep,
+    )
+    with patch("src.integrations.alphavantage.get_bucket", return_value=bucket), \
+         patch("asyncio.sleep", side_effect=mock_sleep):
         mock_response = MagicMock()
         mock_response.status_code = 429
         mock_response.request = MagicMock()
@@ -0,0 +1,126 @@
+# 5.0/tests/test_loop_monitor.py
+"""Tests for the event loop lag monitor and /api/debug/loop."""
+import asyncio
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.core import loop_monitor
+from src.core.loop_monitor import LoopLagMonitor, _percentile
+
+TEST_API_KEY = "test-api-key-for-unit-tests"
+
+
+@pytest.fixture(autouse=True)
+def quiet_metrics():
+    """Keep gauge/count pushes local (no Grafana config lookup)."""
+    with patch.object(loop_monitor, "metrics"):
+        yield
+
+
+def _blocking_work():
+    time.sleep(0.3)  # Sync call holding the loop
+
+
+class TestPercentile:
+
+    def test_empty(self):
+        assert _percentile([], 99) == 0.0
+
+    def test_nearest_rank(self):
+        values = [float(i) for i in range(1, 101)]
+        assert _percentile(values, 50) == 50.0
+        assert _percentile(values, 99) == 99.0
+        assert _percentile(values, 100) == 100.0
+
+
+class TestLoopLagMonitor:
+
+    @pytest.mark.asyncio
+    async def test_records_lag_samples(self):
+        monitor = LoopLagMonitor(interval=0.01)
+        monitor.start()
+        try:
+            await asyncio.sleep(0.1)
+        finally:
+            await monitor.stop()
+
+        stats = monitor.lag_stats()
+        assert stats["samples"] >= 3
+        assert stats["lag_ms_p99"] >= stats["lag_ms_p50"] >= 0
+        assert not monitor.running
+
+    @pytest.mark.asyncio
+    async def test_stall_captures_blocking_stack(self):
+        monitor = LoopLagMonitor(interval=0.02, stall_threshold_ms=100)
+        monitor.start()
+        try:
+            await asyncio.sleep(0.05)
+            _blocking_work()
+            await asyncio.sleep(0.05)  # Let the heartbeat observe recovery
+        finally:
+            await monitor.stop()
+
+        snapshot = monitor.snapshot()
+        assert snapshot["stalls"] == 1
+        stall = snapshot["recent_stalls"][0]
+        assert stall["duration_ms"] >= 100
+        assert any("_blocking_work" in frame for frame in stall["stack"])
+        assert snapshot["lag"]["lag_ms_max"] >= 100
+
+    @pytest.mark.asyncio
+    async def test_pushes_metrics(self):
+        monitor = LoopLagMonitor(interval=0.01, metrics_interval=0.02)
+        monitor.start()
+        try:
+            await asyncio.sleep(0.1)
+        finally:
+            await monitor.stop()
+
+        gauges = [c.args[0] for c in loop_monitor.metrics.gauge.call_args_list]
+        assert "ivcrush.loop.lag_ms_p99" in gauges
+        assert "ivcrush.loop.stalls" in gauges
+
+    @pytest.mark.asyncio
+    async def test_start_monitor_is_idempotent(self):
+        first = loop_monitor.start_monitor(interval=0.01)
+        try:
+            assert loop_monitor.start_monitor() is first
+            assert loop_monitor.get_monitor() is first
+        finally:
+            await loop_monitor.stop_monitor()
+        assert loop_monitor.get_monitor() is None
+
+
+class TestDebugEndpoint:
+
+    @pytest.fixture(autouse=True)
+    def set_test_api_key(self):
+        original = os.environ.get("API_KEY")
+        os.environ["API_KEY"] = TEST_API_KEY
+        yield
+        if original is not None:
+            os.environ["API_KEY"] = original
+        else:
+            os.environ.pop("API_KEY", None)
+
+    def test_requires_auth(self):
+        from src.main import app
+        response = TestClient(app).get("/api/debug/loop")
+        assert response.status_code == 401
+
+    def test_reports_monitor_snapshot(self):
+        from src.main import app
+        with TestClient(app) as client:
+            response = client.get(
+                "/api/debug/loop", headers={"X-API-Key": TEST_API_KEY}
+            )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["running"] is True
+        assert "lag" in data
+        assert "recent_stalls" in data
+        assert "recent_slow_callbacks" in data
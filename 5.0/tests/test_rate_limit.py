@@ -0,0 +1,104 @@
+# 5.0/tests/test_rate_limit.py
+"""Tests for the async token-bucket rate limiter."""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.core import rate_limit
+from src.core.rate_limit import AsyncTokenBucket, get_bucket, parse_retry_after, rate_limit_stats
+
+
+@pytest.fixture(autouse=True)
+def quiet_metrics():
+    with patch.object(rate_limit, "metrics"):
+        yield
+
+
+class TestAsyncTokenBucket:
+
+    @pytest.mark.asyncio
+    async def test_burst_is_immediate(self):
+        bucket = AsyncTokenBucket(rate=1, per_seconds=60, burst=5)
+        start = time.monotonic()
+        for _ in range(5):
+            assert await bucket.acquire() == 0
+        assert time.monotonic() - start < 0.05
+
+    @pytest.mark.asyncio
+    async def test_waits_for_sustained_rate(self):
+        bucket = AsyncTokenBucket(rate=100, per_seconds=1, burst=2)
+        await bucket.acquire(2)
+        start = time.monotonic()
+        waited = await bucket.acquire(3)  # Capped at burst: needs 2 tokens = 20ms
+        elapsed = time.monotonic() - start
+        assert 0.015 <= elapsed < 0.5
+        assert waited == pytest.approx(0.02, abs=0.01)
+
+    @pytest.mark.asyncio
+    async def test_waiters_served_in_arrival_order(self):
+        bucket = AsyncTokenBucket(rate=200, per_seconds=1, burst=1)
+        await bucket.acquire()
+        order = []
+
+        async def caller(i):
+            await bucket.acquire()
+            order.append(i)
+
+        await asyncio.gather(*(caller(i) for i in range(5)))
+        assert order == [0, 1, 2, 3, 4]
+
+    def test_usable_from_successive_event_loops(self):
+        bucket = AsyncTokenBucket(rate=1000, per_seconds=1, burst=1)
+
+        async def contend():
+            await asyncio.wait_for(asyncio.gather(bucket.acquire(), bucket.acquire()), timeout=1)
+
+        asyncio.run(contend())
+        asyncio.run(contend())
+
+    @pytest.mark.asyncio
+    async def test_penalize_holds_callers_then_resumes_without_burst(self):
+        bucket = AsyncTokenBucket(rate=1000, per_seconds=1, burst=50)
+        bucket.penalize(0.05)
+        assert bucket.available() == 0
+
+        start = time.monotonic()
+        await bucket.acquire()
+        assert time.monotonic() - start >= 0.045
+        assert bucket.available() < 5  # Refilled from zero, not back to full burst
+        assert bucket.stats()["throttled"] == 1
+
+    def test_rejects_non_positive_limits(self):
+        with pytest.raises(ValueError):
+            AsyncTokenBucket(rate=0, per_seconds=1, burst=1)
+
+
+class TestParseRetryAfter:
+
+    def test_seconds(self):
+        assert parse_retry_after("7", default=60) == 7
+
+    def test_http_date(self):
+        from email.utils import format_datetime
+        from datetime import datetime, timedelta, timezone
+        when = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+        assert 25 <= parse_retry_after(when, default=60) <= 30
+
+    def test_missing_or_garbage_uses_default(self):
+        assert parse_retry_after(None, default=60) == 60
+        assert parse_retry_after("soon", default=5) == 5
+
+    def test_clamped(self):
+        assert parse_retry_after("86400", default=60) == rate_limit.MAX_RETRY_AFTER_S
+        assert parse_retry_after("-3", default=60) == 0
+
+
+def test_get_bucket_is_shared_per_provider():
+    assert get_bucket("tradier") is get_bucket("tradier")
+    assert get_bucket("tradier") is not get_bucket("perplexity")
+    with pytest.raises(KeyError):
+        get_bucket("unknown")
+    assert set(rate_limit_stats()) == {"perplexity", "tradier"}
@@ -244,6 +244,32 @@ def test_sentiment_cache_clear_all(db_path):
     assert repo.get_sentiment("B", "2025-01-15") is None
 
 
+def test_council_member_cache_per_member_ttl(db_path):
+    """Each member expires on its own TTL; clear_expired removes stale members."""
+    repo = SentimentCacheRepository(db_path=db_path)
+
+    saved = repo.save_council_members(
+        "NVDA", "2025-01-15",
+        {"finnhub_analysts": '{"score": 0.4}', "options_skew": '{"score": -0.3}'},
+        {"finnhub_analysts": 720, "options_skew": 0},
+    )
+    assert saved == 2
+
+    cached = repo.get_council_members("NVDA", "2025-01-15")
+    assert set(cached) == {"finnhub_analysts"}
+    assert cached["finnhub_analysts"]["payload"] == '{"score": 0.4}'
+    assert cached["finnhub_analysts"]["age_minutes"] == 0
+
+    conn = sqlite3.connect(db_path)
+    conn.execute("UPDATE council_member_cache SET expires_at = datetime('now', '-1 minute') "
+                 "WHERE member = 'options_skew'")
+    conn.commit()
+    conn.close()
+
+    assert repo.clear_expired() == 1
+    assert repo.clear_all("NVDA") == 1
+
+
 # Position Limits Tests (TRR Feature)
 
 @pytest.fixture
@@ -424,6 +450,114 @@ def test_get_moves_batch_respects_limit(db_path):
     result = repo.get_moves_batch(["AAPL"], limit=3)
 
     assert len(result["AAPL"]) == 3
+    # Most recent first
+    assert [m["earnings_date"] for m in result["AAPL"]] == [
+        "2025-05-15", "2025-04-15", "2025-03-15"
+    ]
+
+
+def test_get_moves_batch_rejects_zero_limit(db_path):
+    """limit=0 is rejected rather than returning each ticker's latest move."""
+    repo = HistoricalMovesRepository(db_path=db_path)
+    repo.save_move({"ticker": "AAPL", "earnings_date": "2025-01-15", "gap_move_pct": 1.0})
+
+    with pytest.raises(ValueError):
+        repo.get_moves_batch(["AAPL"], limit=0)
+
+
+@pytest.fixture
+def indexed_db_path(db_path):
+    """db_path with production historical_moves indices (2.0 migration 009)."""
+    conn = sqlite3.connect(db_path)
+    conn.execute("""
+        CREATE INDEX idx_moves_ticker_date_cover
+        ON historical_moves(
+            ticker, earnings_date DESC,
+            intraday_move_pct, gap_move_pct, close_move_pct,
+            prev_close, earnings_close
+        )
+    """)
+    conn.execute("""
+        CREATE INDEX idx_moves_date_ticker_cover
+        ON historical_moves(earnings_date, ticker, close_move_pct)
+    """)
+    conn.executemany(
+        "INSERT INTO historical_moves (ticker, earnings_date, gap_move_pct, "
+        "intraday_move_pct, prev_close, earnings_close) VALUES (?, ?, ?, ?, ?, ?)",
+        [
+            ("T" + chr(65 + t // 26) + chr(65 + t % 26),
+             f"{2015 + q // 4}-{(q % 4) * 3 + 1:02d}-15",
+             1.0, 2.0, 100.0, 101.0)
+            for t in range(40) for q in range(20)
+        ],
+    )
+    conn.execute("ANALYZE")
+    conn.commit()
+    conn.close()
+    return db_path
+
+
+def _captured_plan(db_path, repo_call):
+    """Run repo_call with SQL tracing and EXPLAIN the historical_moves SELECT."""
+    statements = []
+    repo = HistoricalMovesRepository(db_path=db_path)
+    with repo._pool.get_connection() as conn:
+        conn.set_trace_callback(statements.append)
+    try:
+        repo_call(repo)
+    finally:
+        with repo._pool.get_connection() as conn:
+            conn.set_trace_callback(None)
+
+    selects = [s for s in statements if "FROM historical_moves" in s]
+    assert len(selects) == 1, selects
+    conn = sqlite3.connect(db_path)
+    plan = [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {selects[0]}")]
+    conn.close()
+    return plan
+
+
+@pytest.mark.parametrize("repo_call", [
+    lambda repo: repo.get_moves("TAB", limit=12),
+    lambda repo: repo.get_moves_batch(["TAB", "TBB", "TAA"], limit=12),
+], ids=["get_moves", "get_moves_batch"])
+def test_historical_moves_hot_query_plans(indexed_db_path, repo_call):
+    """Hot per-ticker reads use the covering index with no scan or sort."""
+    plan = _captured_plan(indexed_db_path, repo_call)
+
+    assert any("COVERING INDEX idx_moves_ticker_date_cover" in d for d in plan), plan
+    assert not any(d.startswith("SCAN historical_moves") for d in plan), plan
+    assert not any("TEMP B-TREE" in d for d in plan), plan
+
+
+def test_pool_connections_use_shared_profile(db_path):
+    """Pooled connections get the common.db PRAGMA profile and report metrics."""
+    from src.domain.repositories import get_pool, get_pool_stats
+
+    repo = HistoricalMovesRepository(db_path)
+    repo.get_moves("AAPL")
+    repo.get_moves("MSFT")
+
+    with get_pool(db_path).get_connection() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+
+    stats = get_pool_stats()[db_path]
+    assert stats["checkouts"] >= 3
+    assert stats["checkout_timeouts"] == 0
+    assert stats["connections_created"] >= 1
+
+
+def test_connection_checked_out_across_close_is_not_reused(db_path):
+    """A connection held while the pool is closed (DB swap) is closed on return."""
+    from src.domain.repositories import ConnectionPool
+
+    pool = ConnectionPool(db_path)
+    with pool.get_connection() as held:
+        pool.close_all()
+    with pytest.raises(sqlite3.ProgrammingError):
+        held.execute("SELECT 1")
+    assert pool.stats()["available"] == 0
 
 
 # VRP Cache Tests (Performance Optimization)
@@ -1091,3 +1225,29 @@ class TestGetUpcomingEarnings:
         assert result[0]["symbol"] == "AAPL"
         assert result[1]["symbol"] == "NVDA"
         assert result[2]["symbol"] == "MSFT"
+
+
+def test_save_moves_batch(db_path):
+    """save_moves writes every move in one call."""
+    repo = HistoricalMovesRepository(db_path=db_path)
+    saved = repo.save_moves([
+        {"ticker": "AAPL", "earnings_date": "2025-01-15", "gap_move_pct": 5.0},
+        {"ticker": "NVDA", "earnings_date": "2025-01-15", "gap_move_pct": 8.0,
+         "close_before": 500.0},
+    ])
+
+    assert saved == 2
+    assert repo.get_tracked_tickers() == {"AAPL", "NVDA"}
+    assert repo.get_moves("NVDA")[0]["close_before"] == 500.0
+
+
+def test_save_moves_invalid_move_saves_nothing(db_path):
+    """One invalid move rejects the whole batch."""
+    repo = HistoricalMovesRepository(db_path=db_path)
+    with pytest.raises(ValueError):
+        repo.save_moves([
+            {"ticker": "AAPL", "earnings_date": "2025-01-15", "gap_move_pct": 5.0},
+            {"ticker": "AAPL", "earnings_date": "not-a-date", "gap_move_pct": 1.0},
+        ])
+
+    assert repo.get_tracked_tickers() == set()
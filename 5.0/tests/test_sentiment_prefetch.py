@@ -0,0 +1,182 @@
+"""
+Tests for the shared sentiment prefetcher (common/sentiment_prefetch.py).
+"""
+
+import asyncio
+
+import pytest
+
+from common.sentiment_prefetch import (
+    PrefetchCandidate,
+    SentimentPrefetcher,
+    SentimentStore,
+)
+
+
+def _sentiment(score=0.5):
+    return {"direction": "bullish", "score": score, "tailwinds": "AI demand", "headwinds": "Valuation"}
+
+
+class DictStore:
+    """In-memory SentimentStore backend."""
+
+    def __init__(self, name, entries=None):
+        self.entries = dict(entries or {})
+        self.saves = []
+        self.store = SentimentStore(name, self.get_many, self.save_many)
+
+    def get_many(self, keys):
+        return {k: self.entries[k] for k in keys if k in self.entries}
+
+    def save_many(self, entries):
+        self.saves.append(dict(entries))
+        self.entries.update(entries)
+        return len(entries)
+
+
+class FakeFetch:
+    def __init__(self, delay=0.0, fail=()):
+        self.calls = []
+        self.delay = delay
+        self.fail = set(fail)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, ticker, earnings_date):
+        self.calls.append(ticker)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        if ticker in self.fail:
+            return {"success": False, "error": "rate limited"}
+        return {**_sentiment(), "api_cost": 0.002}
+
+
+@pytest.mark.asyncio
+async def test_highest_vrp_fetched_first_within_budget():
+    """Budget goes to the highest-VRP tickers; the rest are skipped."""
+    store = DictStore("a")
+    fetch = FakeFetch()
+    prefetcher = SentimentPrefetcher(
+        fetch, [store.store], budget_dollars=0.005, estimated_cost=0.002, max_concurrent=1,
+    )
+
+    result = await prefetcher.prefetch([
+        PrefetchCandidate("AAPL", "2026-02-05", 1.5),
+        PrefetchCandidate("NVDA", "2026-02-05", 3.0),
+        PrefetchCandidate("MSFT", "2026-02-05", 2.0),
+    ])
+
+    assert fetch.calls == ["NVDA", "MSFT"]
+    assert result.skipped == [("AAPL", "2026-02-05")]
+    assert result.calls == 2
+    assert result.spent_dollars == pytest.approx(0.004)
+    # One bulk write with both results
+    assert store.saves == [dict(result.fetched)]
+
+
+@pytest.mark.asyncio
+async def test_hit_in_one_cache_backfills_the_others():
+    """A ticker cached anywhere is not paid for again and is copied to the other caches."""
+    cached = {("NVDA", "2026-02-05"): _sentiment(0.8)}
+    first, second = DictStore("4.0", cached), DictStore("5.0")
+    fetch = FakeFetch()
+    prefetcher = SentimentPrefetcher(
+        fetch, [first.store, second.store], budget_dollars=1.0, estimated_cost=0.002,
+    )
+
+    result = await prefetcher.prefetch([
+        PrefetchCandidate("nvda", "2026-02-05", 2.0),
+        PrefetchCandidate("NVDA", "2026-02-05", 1.0),  # duplicate
+        PrefetchCandidate("AMD", "2026-02-05", 1.8),
+    ])
+
+    assert fetch.calls == ["AMD"]
+    assert result.cached == [("NVDA", "2026-02-05")]
+    assert result.backfilled == {"5.0": 1}
+    assert second.entries[("NVDA", "2026-02-05")]["score"] == 0.8
+    assert ("AMD", "2026-02-05") in first.entries and ("AMD", "2026-02-05") in second.entries
+
+
+@pytest.mark.asyncio
+async def test_error_entry_is_a_miss_not_a_hit():
+    """A cached error is refetched, and the good result replaces it in that store."""
+    key = ("NVDA", "2026-02-05")
+    broken = DictStore("4.0", {key: {"error": "rate limited"}})
+    good = DictStore("5.0", {key: _sentiment(0.8)})
+    empty = DictStore("2.0", {("AMD", "2026-02-05"): {}})
+    fetch = FakeFetch()
+    prefetcher = SentimentPrefetcher(
+        fetch, [broken.store, good.store, empty.store], budget_dollars=1.0, estimated_cost=0.002,
+    )
+
+    result = await prefetcher.prefetch([
+        PrefetchCandidate("NVDA", "2026-02-05", 2.0),
+        PrefetchCandidate("AMD", "2026-02-05", 1.8),
+    ])
+
+    assert result.cached == [key]
+    assert fetch.calls == ["AMD"]
+    assert broken.entries[key]["score"] == 0.8
+    assert empty.entries[("AMD", "2026-02-05")]["score"] == 0.5
+
+
+@pytest.mark.asyncio
+async def test_concurrency_cap_and_failures():
+    """At most max_concurrent calls run at once; failed results are not cached."""
+    store = DictStore("a")
+    fetch = FakeFetch(delay=0.01, fail={"T2"})
+    prefetcher = SentimentPrefetcher(
+        fetch, [store.store], budget_dollars=1.0, estimated_cost=0.001, max_concurrent=2,
+    )
+
+    result = await prefetcher.prefetch(
+        [PrefetchCandidate(f"T{i}", "2026-02-05", 1.0) for i in range(6)]
+    )
+
+    assert fetch.max_in_flight == 2
+    assert result.failed == {("T2", "2026-02-05"): "rate limited"}
+    assert len(result.fetched) == 5
+    assert ("T2", "2026-02-05") not in store.entries
+
+
+@pytest.mark.asyncio
+async def test_timeout_skips_unfinished_and_keeps_finished():
+    """Fetches cut off by the timeout are skipped; finished ones are still saved."""
+    store = DictStore("a")
+
+    async def fetch(ticker, earnings_date):
+        await asyncio.sleep(0 if ticker == "FAST" else 5)
+        return _sentiment()
+
+    prefetcher = SentimentPrefetcher(fetch, [store.store], budget_dollars=1.0, estimated_cost=0.001)
+    result = await prefetcher.prefetch(
+        [PrefetchCandidate("SLOW", "2026-02-05", 2.0), PrefetchCandidate("FAST", "2026-02-05", 1.0)],
+        timeout=0.05,
+    )
+
+    assert result.skipped == [("SLOW", "2026-02-05")]
+    assert list(store.entries) == [("FAST", "2026-02-05")]
+
+
+@pytest.mark.asyncio
+async def test_unreadable_store_only_costs_a_refetch():
+    """A store that fails to read is treated as empty."""
+    def broken(keys):
+        raise OSError("disk gone")
+
+    good = DictStore("good")
+    fetch = FakeFetch()
+    prefetcher = SentimentPrefetcher(
+        fetch,
+        [SentimentStore("broken", broken, lambda entries: 0), good.store],
+        budget_dollars=1.0, estimated_cost=0.001,
+    )
+
+    result = await prefetcher.prefetch([PrefetchCandidate("NVDA", "2026-02-05")])
+
+    assert fetch.calls == ["NVDA"]
+    assert result.saved == {"broken": 0, "good": 1}
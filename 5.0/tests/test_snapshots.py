@@ -0,0 +1,170 @@
+"""Tests for single-flight /api/scan and /api/whisper with response snapshots."""
+
+import asyncio
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api import snapshots
+from src.api.routers import analysis
+from src.api.snapshots import ScanSnapshots
+from src.main import app
+from tests.test_streaming_scan import FakeAsyncRepository, TEST_API_KEY, qualified
+
+
+@pytest.fixture(autouse=True)
+def set_test_api_key():
+    original = os.environ.get('API_KEY')
+    os.environ['API_KEY'] = TEST_API_KEY
+    yield
+    if original is not None:
+        os.environ['API_KEY'] = original
+    elif 'API_KEY' in os.environ:
+        del os.environ['API_KEY']
+
+
+@pytest.fixture
+def scans(monkeypatch):
+    """Counts whisper scans; SLOW makes each scan take a moment."""
+    calls = []
+
+    async def scan_tickers(upcoming, repo, tradier, fresh=False, partial_results=None):
+        calls.append(fresh)
+        await asyncio.sleep(0.05)
+        return [qualified("SLOW", 80), qualified("FAST", 60)], 0
+
+    monkeypatch.setattr(analysis, "AsyncRepository", FakeAsyncRepository)
+    monkeypatch.setattr(analysis, "get_historical_repo", lambda: object())
+    monkeypatch.setattr(analysis, "get_tradier", lambda: object())
+    monkeypatch.setattr(analysis, "today_et", lambda: "2026-02-03")
+    monkeypatch.setattr(analysis, "_scan_tickers_for_whisper", scan_tickers)
+    monkeypatch.setattr(analysis, "_refresh_whisper_sentiment", lambda results: asyncio.sleep(0))
+    return calls
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+@pytest.fixture
+def auth_headers():
+    return {"X-API-Key": TEST_API_KEY}
+
+
+class TestScanSnapshots:
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_scan(self):
+        calls = []
+
+        async def produce():
+            calls.append(1)
+            await asyncio.sleep(0.02)
+            return {"n": len(calls)}, True
+
+        store = ScanSnapshots()
+        results = await asyncio.gather(*(store.get(("whisper", "d"), produce) for _ in range(5)))
+
+        assert calls == [1]
+        assert all(r is results[0] for r in results)
+        # Later requests hit the snapshot
+        assert await store.get(("whisper", "d"), produce) is results[0]
+        assert calls == [1]
+
+    @pytest.mark.asyncio
+    async def test_incomplete_and_expired_are_not_served(self):
+        calls = []
+
+        async def produce():
+            calls.append(1)
+            return {"n": len(calls)}, len(calls) > 1
+
+        store = ScanSnapshots(ttl_seconds=0.05)
+        assert (await store.get("k", produce)).payload == {"n": 1}  # incomplete: not kept
+        assert (await store.get("k", produce)).payload == {"n": 2}
+        assert (await store.get("k", produce)).payload == {"n": 2}
+        assert (await store.get("k", produce, fresh=True)).payload == {"n": 3}
+        assert (await store.get("k", produce)).payload == {"n": 3}  # fresh result replaces it
+        await asyncio.sleep(0.06)
+        assert (await store.get("k", produce)).payload == {"n": 4}
+
+    @pytest.mark.asyncio
+    async def test_failure_reaches_every_waiter_and_is_not_kept(self):
+        calls = []
+
+        async def produce():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            if len(calls) == 1:
+                raise RuntimeError("boom")
+            return {"ok": True}, True
+
+        store = ScanSnapshots()
+        outcomes = await asyncio.gather(store.get("k", produce), store.get("k", produce),
+                                        return_exceptions=True)
+        assert all(isinstance(o, RuntimeError) for o in outcomes)
+        assert (await store.get("k", produce)).payload == {"ok": True}
+
+
+class TestWhisperSnapshots:
+
+    def test_snapshot_etag_and_304(self, client, auth_headers, scans):
+        first = client.get("/api/whisper?date=2026-02-03", headers=auth_headers)
+        second = client.get("/api/whisper?date=2026-02-03", headers=auth_headers)
+
+        assert first.status_code == second.status_code == 200
+        assert scans == [False]
+        assert first.json() == second.json()
+        assert [t["ticker"] for t in first.json()["tickers"]] == ["SLOW", "FAST"]
+        etag = first.headers["etag"]
+        assert etag == second.headers["etag"]
+
+        not_modified = client.get("/api/whisper?date=2026-02-03",
+                                  headers={**auth_headers, "If-None-Match": etag})
+        assert not_modified.status_code == 304
+        assert not_modified.content == b""
+
+    def test_fresh_bypasses_snapshot(self, client, auth_headers, scans):
+        client.get("/api/whisper?date=2026-02-03", headers=auth_headers)
+        client.get("/api/whisper?date=2026-02-03&fresh=true", headers=auth_headers)
+        client.get("/api/whisper?date=2026-02-03", headers=auth_headers)
+
+        assert scans == [False, True]
+
+    def test_success_recorded_per_request(self, client, auth_headers, scans, monkeypatch):
+        recorded = []
+        monkeypatch.setattr(analysis.metrics, "request_success",
+                            lambda endpoint, duration_ms: recorded.append(endpoint))
+
+        for _ in range(3):
+            client.get("/api/whisper?date=2026-02-03", headers=auth_headers)
+
+        assert scans == [False]
+        assert recorded == ["whisper"] * 3
+
+    def test_cli_format_rendered_from_same_snapshot(self, client, auth_headers, scans):
+        as_json = client.get("/api/whisper?date=2026-02-03", headers=auth_headers)
+        as_cli = client.get("/api/whisper?date=2026-02-03&format=cli", headers=auth_headers)
+
+        assert scans == [False]
+        assert "SLOW" in as_cli.json()["output"]
+        assert as_cli.headers["etag"] != as_json.headers["etag"]
+
+    def test_gzip_for_large_bodies(self, client, auth_headers, scans, monkeypatch):
+        monkeypatch.setattr(snapshots, "GZIP_MIN_BYTES", 0)
+
+        response = client.get("/api/whisper?date=2026-02-03",
+                              headers={**auth_headers, "Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.json()["qualified_count"] == 2  # Decoded by the client
+
+    @pytest.mark.asyncio
+    async def test_direct_call_returns_payload(self, scans):
+        """The Telegram /whisper command calls the endpoint function directly."""
+        result = await analysis.whisper(format="json", fresh=True)
+
+        assert result["status"] == "success"
+        assert scans == [True]
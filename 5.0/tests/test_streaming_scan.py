@@ -0,0 +1,174 @@
+# 5.0/tests/test_streaming_scan.py
+"""Tests for streamed /api/scan and /api/whisper responses (NDJSON and SSE)."""
+
+import asyncio
+import json
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api.routers import analysis
+from src.main import app
+
+TEST_API_KEY = "test-api-key-for-unit-tests"
+
+EARNINGS = [
+    {"symbol": "SLOW", "report_date": "2026-02-03", "name": "Slow Inc", "timing": "AMC"},
+    {"symbol": "FAST", "report_date": "2026-02-03", "name": "Fast Inc", "timing": "BMO"},
+    {"symbol": "SKIP", "report_date": "2026-02-03", "name": "Skip Inc", "timing": "AMC"},
+]
+
+
+class FakeAsyncRepository:
+    """Stands in for AsyncRepository; returns canned earnings and no moves."""
+
+    def __init__(self, repo):
+        pass
+
+    async def get_earnings_by_date(self, date):
+        return list(EARNINGS)
+
+    async def get_upcoming_earnings(self, start_date, days=5):
+        return list(EARNINGS)
+
+    async def get_moves_batch(self, tickers, limit=12):
+        return {t: [] for t in tickers}
+
+
+def qualified(ticker, score):
+    return {
+        "ticker": ticker,
+        "earnings_date": "2026-02-03",
+        "vrp_ratio": 2.0,
+        "vrp_tier": "EXCELLENT",
+        "score": score,
+        "liquidity_tier": "GOOD",
+    }
+
+
+@pytest.fixture(autouse=True)
+def set_test_api_key():
+    original = os.environ.get('API_KEY')
+    os.environ['API_KEY'] = TEST_API_KEY
+    yield
+    if original is not None:
+        os.environ['API_KEY'] = original
+    elif 'API_KEY' in os.environ:
+        del os.environ['API_KEY']
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(analysis, "AsyncRepository", FakeAsyncRepository)
+    monkeypatch.setattr(analysis, "get_historical_repo", lambda: object())
+    monkeypatch.setattr(analysis, "get_tradier", lambda: object())
+    monkeypatch.setattr(analysis, "get_sentiment_cache", lambda: object())
+    monkeypatch.setattr(analysis, "get_vrp_cache", lambda: object())
+    monkeypatch.setattr(analysis, "today_et", lambda: "2026-02-03")
+    return TestClient(app)
+
+
+@pytest.fixture
+def auth_headers():
+    return {"X-API-Key": TEST_API_KEY}
+
+
+@pytest.fixture
+def fake_scan_entry(monkeypatch):
+    """SLOW qualifies after FAST; SKIP is filtered."""
+    async def scan_entry(e, moves, tradier):
+        if e["symbol"] == "SLOW":
+            await asyncio.sleep(0.05)
+            return "qualified", qualified("SLOW", 80)
+        if e["symbol"] == "FAST":
+            return "qualified", qualified("FAST", 60)
+        return "filtered", {"ticker": e["symbol"], "reason": "No historical data"}
+
+    monkeypatch.setattr(analysis, "_scan_earnings_entry", scan_entry)
+
+
+@pytest.fixture
+def fake_whisper_analysis(monkeypatch):
+    async def analyze(ticker, **kwargs):
+        if ticker == "SLOW":
+            await asyncio.sleep(0.05)
+            return qualified("SLOW", 80)
+        if ticker == "FAST":
+            return qualified("FAST", 60)
+        return None
+
+    monkeypatch.setattr(analysis, "_analyze_single_ticker", analyze)
+
+
+def parse_ndjson(text):
+    return [json.loads(line) for line in text.splitlines() if line]
+
+
+def parse_sse(text):
+    events = []
+    for block in text.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+class TestScanStreaming:
+
+    def test_ndjson_emits_completion_order_then_summary(self, client, auth_headers, fake_scan_entry):
+        response = client.get("/api/scan?date=2026-02-03&stream=ndjson", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        events = parse_ndjson(response.text)
+        assert [e["event"] for e in events] == ["qualified", "filtered", "qualified", "summary"]
+        assert events[0]["ticker"] == "FAST"
+        summary = events[-1]
+        assert summary["qualified_count"] == 2
+        assert summary["filtered_count"] == 1
+        # Summary is ranked like the buffered response
+        assert [t["ticker"] for t in summary["qualified"]] == ["SLOW", "FAST"]
+
+    def test_sse_format(self, client, auth_headers, fake_scan_entry):
+        response = client.get("/api/scan?date=2026-02-03&stream=sse", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = parse_sse(response.text)
+        assert events[-1][0] == "summary"
+        assert {name for name, _ in events[:-1]} == {"qualified", "filtered"}
+
+    def test_buffered_json_unchanged(self, client, auth_headers, fake_scan_entry):
+        response = client.get("/api/scan?date=2026-02-03", headers=auth_headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_found"] == 3
+        assert [t["ticker"] for t in data["qualified"]] == ["SLOW", "FAST"]
+
+    def test_unknown_stream_format_rejected(self, client, auth_headers):
+        response = client.get("/api/scan?date=2026-02-03&stream=xml", headers=auth_headers)
+        assert response.status_code == 400
+
+
+class TestWhisperStreaming:
+
+    def test_ndjson_results_then_summary(self, client, auth_headers, fake_whisper_analysis):
+        response = client.get("/api/whisper?date=2026-02-03&stream=ndjson", headers=auth_headers)
+
+        assert response.status_code == 200
+        events = parse_ndjson(response.text)
+        assert [e["event"] for e in events] == ["result", "result", "summary"]
+        assert events[0]["ticker"] == "FAST"
+        summary = events[-1]
+        assert summary["qualified_count"] == 2
+        assert [t["ticker"] for t in summary["tickers"]] == ["SLOW", "FAST"]
+
+    def test_stream_stops_at_scan_deadline(self, client, auth_headers, fake_whisper_analysis, monkeypatch):
+        monkeypatch.setattr(analysis, "MAX_SCAN_TIME_SECONDS", 0.02)
+
+        response = client.get("/api/whisper?date=2026-02-03&stream=ndjson", headers=auth_headers)
+
+        events = parse_ndjson(response.text)
+        assert events[-1]["event"] == "summary"
+        assert [t["ticker"] for t in events[-1]["tickers"]] == ["FAST"]
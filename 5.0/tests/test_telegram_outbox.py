@@ -0,0 +1,181 @@
+"""
+Tests for the outbound Telegram queue (src/integrations/telegram_outbox.py).
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.integrations import telegram_outbox
+from src.integrations.telegram import TelegramSender
+from src.integrations.telegram_outbox import (
+    MERGE_SEPARATOR,
+    DeliveryResult,
+    TelegramOutbox,
+    get_outbox,
+    start_outbox,
+    stop_outbox,
+)
+
+
+@pytest.fixture(autouse=True)
+def quiet_metrics():
+    with patch.object(telegram_outbox, "metrics"):
+        yield
+
+
+@pytest.fixture
+def sender():
+    s = TelegramSender(bot_token="test_token", chat_id="123456")
+    s._post = AsyncMock(return_value=DeliveryResult(ok=True))
+    return s
+
+
+@pytest.mark.asyncio
+async def test_send_message_queues_and_merges(sender):
+    """Sends return at once; messages waiting for one chat go out as one post."""
+    outbox = start_outbox(chat_interval=0)
+    try:
+        assert get_outbox() is outbox
+        assert await sender.send_message("digest") is True
+        assert await sender.send_message("summary") is True
+        sender._post.assert_not_awaited()
+
+        assert await outbox.flush(timeout=1)
+        sender._post.assert_awaited_once_with(f"digest{MERGE_SEPARATOR}summary", "HTML")
+        assert outbox.stats()["delivered"] == 2
+        assert outbox.stats()["posts"] == 1
+    finally:
+        await stop_outbox()
+    assert get_outbox() is None
+
+
+@pytest.mark.asyncio
+async def test_retry_after_holds_the_chat(sender):
+    """A 429 re-queues the post and waits the reported retry_after."""
+    sender._post.side_effect = [
+        DeliveryResult(ok=False, retryable=True, retry_after=0.1, error="429"),
+        DeliveryResult(ok=True),
+    ]
+    outbox = TelegramOutbox(chat_interval=0)
+    outbox.start()
+    start = time.monotonic()
+    outbox.put(sender, "alert")
+
+    assert await outbox.flush(timeout=2)
+    assert time.monotonic() - start >= 0.09
+    assert sender._post.await_count == 2
+    assert outbox.stats()["dropped"] == {}
+    await outbox.stop()
+
+
+@pytest.mark.asyncio
+async def test_rejected_merged_post_is_split(sender):
+    """If a merged post is rejected, its parts are sent alone; a bad part is dropped."""
+    async def post(text, parse_mode):
+        return DeliveryResult(ok="<bad" not in text, error="HTTP 400")
+
+    sender._post.side_effect = post
+    outbox = TelegramOutbox(chat_interval=0)
+    outbox.start()
+    for text in ("one", "<bad", "three"):
+        outbox.put(sender, text)
+
+    assert await outbox.flush(timeout=1)
+    sent = [c.args[0] for c in sender._post.await_args_list]
+    assert sent == [f"one{MERGE_SEPARATOR}<bad{MERGE_SEPARATOR}three", "one", "<bad", "three"]
+    assert outbox.stats()["delivered"] == 2
+    assert outbox.stats()["dropped"] == {"rejected": 1}
+    await outbox.stop()
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_and_stop_drains(sender):
+    """Beyond max_queued new messages are dropped; stop() delivers what is queued."""
+    gate = asyncio.Event()
+
+    async def post(text, parse_mode):
+        await gate.wait()
+        return DeliveryResult(ok=True)
+
+    sender._post.side_effect = post
+    outbox = TelegramOutbox(chat_interval=0, max_queued=2, max_length=5)
+    outbox.start()
+    assert outbox.put(sender, "aaaa") and outbox.put(sender, "bbbb")
+    assert outbox.put(sender, "cccc") is False
+    assert outbox.stats()["dropped"] == {"queue_full": 1}
+
+    gate.set()
+    await outbox.stop(drain_timeout=1)
+    assert outbox.stats()["delivered"] == 2
+    assert sender._post.await_count == 2  # Too long to merge under max_length
+
+
+@pytest.mark.asyncio
+async def test_sends_inline_without_outbox(sender):
+    assert get_outbox() is None
+    assert await sender.send_message("hello") is True
+    sender._post.assert_awaited_once_with("hello", "HTML")
+
+
+@pytest.mark.asyncio
+async def test_await_delivery_confirms_post(sender):
+    """await_delivery returns only once the outbox has posted (or dropped) the message."""
+    async def post(text, parse_mode):
+        await asyncio.sleep(0.05)
+        return DeliveryResult(ok="<bad" not in text, error="HTTP 400")
+
+    sender._post.side_effect = post
+    start_outbox(chat_interval=0)
+    try:
+        assert await sender.send_message("alert", await_delivery=True) is True
+        sender._post.assert_awaited_once_with("alert", "HTML")
+        assert await sender.send_message("<bad", await_delivery=True) is False
+    finally:
+        await stop_outbox()
+
+
+@pytest.mark.asyncio
+async def test_on_settle_reports_outcome_after_queueing(sender):
+    """A queued send returns at once; on_settle hears the delivery outcome later."""
+    gate = asyncio.Event()
+
+    async def post(text, parse_mode):
+        await gate.wait()
+        return DeliveryResult(ok="<bad" not in text, error="HTTP 400")
+
+    sender._post.side_effect = post
+    outcomes = []
+    start_outbox(chat_interval=0)
+    try:
+        assert await sender.send_message("digest", on_settle=outcomes.append) is True
+        assert outcomes == []  # Queued, not yet posted
+        gate.set()
+        assert await get_outbox().flush(timeout=1)
+        assert outcomes == [True]
+    finally:
+        await stop_outbox()
+
+    # Inline sends settle before returning
+    assert await sender.send_message("<bad", on_settle=outcomes.append) is False
+    assert outcomes == [True, False]
+
+
+@pytest.mark.asyncio
+async def test_deliver_times_out_but_stays_queued(sender):
+    gate = asyncio.Event()
+
+    async def post(text, parse_mode):
+        await gate.wait()
+        return DeliveryResult(ok=True)
+
+    sender._post.side_effect = post
+    outbox = TelegramOutbox(chat_interval=0)
+    outbox.start()
+    assert await outbox.deliver(sender, "slow", timeout=0.05) is False
+    gate.set()
+    assert await outbox.flush(timeout=1)
+    assert outbox.stats()["delivered"] == 1
+    await outbox.stop()
@@ -28,6 +28,26 @@ async def test_get_quote(tradier):
         assert result["symbol"] == "NVDA"
         assert result["last"] == 135.50
 
+@pytest.mark.asyncio
+async def test_get_quotes_batches_symbols(tradier):
+    """get_quotes fetches several symbols in one request and keys them by symbol."""
+    mock_response = {
+        "quotes": {
+            "quote": [
+                {"symbol": "NVDA", "last": 135.50},
+                {"symbol": "AAPL", "last": 180.25},
+            ]
+        }
+    }
+
+    with patch.object(tradier, '_request', new_callable=AsyncMock) as mock:
+        mock.return_value = mock_response
+        result = await tradier.get_quotes(["NVDA", "AAPL", "NVDA"])
+
+        mock.assert_awaited_once_with("markets/quotes", {"symbols": "NVDA,AAPL"})
+        assert result["AAPL"]["last"] == 180.25
+        assert set(result) == {"NVDA", "AAPL"}
+
 @pytest.mark.asyncio
 async def test_get_options_chain(tradier):
     """get_options_chain returns options data."""
@@ -53,3 +73,69 @@ async def test_get_options_chain(tradier):
 
         assert len(result) == 1
         assert result[0]["strike"] == 140.0
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_request_backs_off_shared_bucket(tradier):
+    """A 429 penalizes the shared Tradier bucket with Retry-After, then retries."""
+    from unittest.mock import MagicMock
+    from src.core.rate_limit import get_bucket
+
+    limited = MagicMock(status_code=429, headers={"Retry-After": "2"})
+    ok = MagicMock(status_code=200, content=b"{}", text="{}")
+    ok.json.return_value = {"quotes": {}}
+
+    with patch("httpx.AsyncClient") as mock_client_class, \
+         patch("src.integrations.tradier.metrics"), \
+         patch("src.core.rate_limit.metrics"), \
+         patch("src.core.rate_limit.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        mock_ctx = AsyncMock()
+        mock_ctx.__aenter__ = AsyncMock(return_value=mock_ctx)
+        mock_ctx.__aexit__ = AsyncMock(return_value=False)
+        mock_ctx.get = AsyncMock(side_effect=[limited, ok])
+        mock_client_class.return_value = mock_ctx
+
+        result = await tradier._request("markets/quotes", {"symbols": "NVDA"})
+
+    assert result == {"quotes": {}}
+    assert get_bucket("tradier").throttled == 1
+    assert mock_sleep.await_args_list[0].args[0] == pytest.approx(2, abs=0.1)
+
+
+@pytest.mark.asyncio
+async def test_hedged_request_returns_first_response():
+    """With hedging on, a request stuck past p95 is re-sent and the fast copy wins."""
+    import asyncio
+    from unittest.mock import MagicMock
+    from src.core.hedging import get_hedge_policy
+
+    policy = get_hedge_policy("tradier")
+    policy._latencies.extend([0.01] * policy.min_samples)
+    policy.requests = 100
+
+    ok = MagicMock(status_code=200, content=b"{}", text="{}")
+    ok.json.return_value = {"quotes": {"quote": {"symbol": "NVDA"}}}
+    calls = 0
+
+    async def get(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.sleep(5)
+        return ok
+
+    with patch("httpx.AsyncClient") as mock_client_class, \
+         patch("src.integrations.tradier.metrics"), \
+         patch("src.core.hedging.metrics"):
+        mock_ctx = AsyncMock()
+        mock_ctx.__aenter__ = AsyncMock(return_value=mock_ctx)
+        mock_ctx.__aexit__ = AsyncMock(return_value=False)
+        mock_ctx.get = get
+        mock_client_class.return_value = mock_ctx
+
+        client = TradierClient(api_key="test-key", hedge=True)
+        result = await asyncio.wait_for(client._request("markets/quotes"), timeout=2)
+
+    assert result == {"quotes": {"quote": {"symbol": "NVDA"}}}
+    assert calls == 2
+    assert policy.hedge_wins == 1
@@ -149,3 +149,32 @@ async def test_close_client(client):
 
     mock_client.aclose.assert_called_once()
     assert client._client is None
+
+
+@pytest.mark.asyncio
+async def test_get_stock_history_batch(client):
+    """Multi-symbol request returns per-symbol histories and bills one credit each."""
+    mock_response = MagicMock()
+    mock_response.json.return_value = {
+        "AAPL": {"status": "ok", "values": [
+            {"datetime": "2025-01-15", "open": "150.0", "high": "152.0",
+             "low": "149.0", "close": "151.0", "volume": "1000000"},
+        ]},
+        "BAD": {"status": "error", "message": "symbol not found"},
+    }
+
+    mock_client = AsyncMock()
+    mock_client.get.return_value = mock_response
+
+    with patch.object(client, "_get_client", return_value=mock_client), \
+            patch("src.integrations.twelvedata.get_bucket") as get_bucket:
+        get_bucket.return_value.acquire = AsyncMock()
+        result = await client.get_stock_history_batch(
+            ["AAPL", "BAD"], "2025-01-10", "2025-01-15"
+        )
+
+    assert set(result) == {"AAPL"}
+    assert result["AAPL"]["Close"]["2025-01-15"] == 151.0
+    params = mock_client.get.call_args.kwargs["params"]
+    assert params["symbol"] == "AAPL,BAD"
+    assert get_bucket.return_value.acquire.await_count == 2
@@ -9,7 +9,7 @@ import asyncio
 from typing import Dict, Any, Optional
 from pydantic import ValidationError
 
-from ..integration.cache_4_0 import Cache4_0
+from ..integration.cache_4_0 import Cache4_0, to_cached_sentiment
 from ..integration.perplexity_5_0 import Perplexity5_0
 from ..utils.schemas import SentimentFetchResponse
 from .base import BaseAgent
@@ -150,20 +150,7 @@ class SentimentFetchAgent:
                     raise Exception(result.get('error', 'Unknown API error'))
 
                 # Convert API response to sentiment data format
-                sentiment_data = {
-                    'ticker': ticker,
-                    'direction': result['direction'],
-                    'score': result['score'],
-                    'catalysts': result.get('tailwinds', '').split('\n') if result.get('tailwinds') else [],
-                    'risks': result.get('headwinds', '').split('\n') if result.get('headwinds') else [],
-                    'error': None
-                }
-
-                # Clean up lists (remove empty strings)
-                sentiment_data['catalysts'] = [c.strip() for c in sentiment_data['catalysts'] if c.strip()]
-                sentiment_data['risks'] = [r.strip() for r in sentiment_data['risks'] if r.strip()]
-
-                return sentiment_data
+                return to_cached_sentiment(ticker, result)
 
             except Exception as e:
                 last_error = e
@@ -6,7 +6,7 @@ Provides access to sentiment cache without duplication.
 import logging
 import sys
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime, timezone
 
 logger = logging.getLogger(__name__)
@@ -34,6 +34,35 @@ sys.path.insert(1, _4_0_src_str)  # Position 1 (2.0/ should be at 0)
 from cache.sentiment_cache import SentimentCache
 
 
+def to_cached_sentiment(ticker: str, sentiment: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert a Perplexity sentiment result (tailwinds/headwinds as newline
+    text) to the 6.0 cache format (catalysts/risks lists).
+    """
+    def bullets(text: Optional[str]) -> List[str]:
+        return [line.strip() for line in (text or '').split('\n') if line.strip()]
+
+    return {
+        'ticker': ticker,
+        'direction': sentiment['direction'],
+        'score': sentiment['score'],
+        'catalysts': bullets(sentiment.get('tailwinds')),
+        'risks': bullets(sentiment.get('headwinds')),
+        'error': None
+    }
+
+
+def from_cached_sentiment(cached: Dict[str, Any]) -> Dict[str, Any]:
+    """Inverse of to_cached_sentiment, for sharing entries with other caches."""
+    return {
+        'direction': cached.get('direction'),
+        'score': cached.get('score'),
+        'tailwinds': '\n'.join(cached.get('catalysts') or []),
+        'headwinds': '\n'.join(cached.get('risks') or []),
+        'error': cached.get('error'),
+    }
+
+
 class Cache4_0:
     """
     Wrapper for 4.0's caching.
@@ -99,6 +128,53 @@ class Cache4_0:
         # Store with source='perplexity'
         self.sentiment_cache.set(ticker, earnings_date, 'perplexity', sentiment_str)
 
+    def get_sentiments(
+        self,
+        keys: List[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """
+        Bulk cache lookup for the shared sentiment prefetcher.
+
+        Args:
+            keys: (ticker, earnings_date) pairs
+
+        Returns:
+            Dict mapping (TICKER, earnings_date) -> sentiment in
+            Perplexity format (direction, score, tailwinds, headwinds);
+            missing, expired and unreadable entries are left out
+        """
+        import json
+
+        found = {}
+        for key, cached in self.sentiment_cache.get_many(keys).items():
+            try:
+                found[key] = from_cached_sentiment(json.loads(cached.sentiment))
+            except (json.JSONDecodeError, AttributeError):
+                continue
+        return found
+
+    def save_sentiments(
+        self,
+        entries: Dict[Tuple[str, str], Dict[str, Any]]
+    ) -> int:
+        """
+        Bulk cache write for the shared sentiment prefetcher.
+
+        Args:
+            entries: Dict mapping (ticker, earnings_date) -> sentiment in
+                Perplexity format
+
+        Returns:
+            Number of entries stored
+        """
+        import json
+
+        rows = {
+            (ticker, earnings_date): json.dumps(to_cached_sentiment(ticker.upper(), sentiment))
+            for (ticker, earnings_date), sentiment in entries.items()
+        }
+        return self.sentiment_cache.set_many(rows, 'perplexity')
+
     def get_cache_statistics(self) -> Dict[str, Any]:
         """
         Get cache statistics for monitoring.
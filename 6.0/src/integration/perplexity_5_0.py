@@ -96,6 +96,10 @@ class Perplexity5_0:
                     if p not in sys.path:
                         sys.path.append(p)
 
+    def estimated_call_cost(self) -> float:
+        """Expected cost of one sentiment call, for budgeting."""
+        return self.client.estimated_call_cost()
+
     async def get_sentiment(
         self,
         ticker: str,
@@ -151,7 +155,8 @@ class Perplexity5_0:
                 'score': sentiment['score'],
                 'tailwinds': sentiment['tailwinds'],
                 'headwinds': sentiment['headwinds'],
-                'raw': sentiment['raw']
+                'raw': sentiment['raw'],
+                'api_cost': self.client._estimate_cost(response)
             }
 
         except Exception as e:
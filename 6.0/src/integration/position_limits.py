@@ -5,9 +5,17 @@ calculations for each ticker.
 """
 
 import sqlite3
+import sys
+from pathlib import Path
 from typing import Dict, Any, Optional
 
-from .container_2_0 import Container2_0
+# Ensure common/ is importable
+_root = str(Path(__file__).resolve().parent.parent.parent.parent)
+if _root not in sys.path:
+    sys.path.insert(0, _root)
+
+from common.db import connect  # noqa: E402
+from .container_2_0 import Container2_0  # noqa: E402
 
 
 class PositionLimitsRepository:
@@ -43,7 +51,7 @@ class PositionLimitsRepository:
             # }
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with connect(self.db_path) as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
 
@@ -67,7 +75,7 @@ class PositionLimitsRepository:
     def get_all_high_risk(self) -> list:
         """Get all tickers with HIGH tail risk."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with connect(self.db_path) as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
 
@@ -6,10 +6,18 @@ sector correlation analysis.
 
 import logging
 import sqlite3
+import sys
+from pathlib import Path
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 
-from .container_2_0 import Container2_0
+# Ensure common/ is importable
+_root = str(Path(__file__).resolve().parent.parent.parent.parent)
+if _root not in sys.path:
+    sys.path.insert(0, _root)
+
+from common.db import connect  # noqa: E402
+from .container_2_0 import Container2_0  # noqa: E402
 
 logger = logging.getLogger(__name__)
 
@@ -53,7 +61,7 @@ class TickerMetadataRepository:
     def get_metadata(self, ticker: str) -> Optional[Dict[str, Any]]:
         """Get metadata for a ticker."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with connect(self.db_path) as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
 
@@ -93,7 +101,7 @@ class TickerMetadataRepository:
     ) -> bool:
         """Save or update ticker metadata."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with connect(self.db_path) as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
 
@@ -120,7 +128,7 @@ class TickerMetadataRepository:
     def delete_metadata(self, ticker: str) -> bool:
         """Delete ticker metadata (for testing)."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with connect(self.db_path) as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
                 cursor.execute("DELETE FROM ticker_metadata WHERE ticker = ?", (ticker.upper(),))
@@ -133,7 +141,7 @@ class TickerMetadataRepository:
     def get_by_sector(self, sector: str) -> List[Dict[str, Any]]:
         """Get all tickers in a sector."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with connect(self.db_path) as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
 
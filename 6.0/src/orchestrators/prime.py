@@ -6,7 +6,6 @@ Coordinates parallel sentiment fetching to pre-populate cache before
 Target: 30 tickers in ~10 seconds (vs 90 seconds sequential).
 """
 
-import asyncio
 import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
@@ -14,9 +13,24 @@ from datetime import datetime, timedelta
 from .base import BaseOrchestrator
 from ..agents.sentiment_fetch import SentimentFetchAgent
 from ..agents.health import HealthCheckAgent
+from ..utils.paths import MAIN_REPO  # noqa: F401 - puts repo root on sys.path for common/
+
+from common.sentiment_prefetch import (  # noqa: E402
+    PrefetchCandidate,
+    PrefetchResult,
+    SentimentPrefetcher,
+    SentimentStore,
+)
 
 logger = logging.getLogger(__name__)
 
+# Perplexity calls in flight at once, and minimum spacing between call starts
+PRIME_CONCURRENCY = 2
+PRIME_MIN_INTERVAL_SECONDS = 0.5
+
+# Default Perplexity spend limit per /prime run (~40 sonar-pro calls)
+PRIME_BUDGET_DOLLARS = 0.10
+
 
 class PrimeOrchestrator(BaseOrchestrator):
     """
@@ -25,9 +39,9 @@ class PrimeOrchestrator(BaseOrchestrator):
     Workflow:
     1. Run health check (verify system is operational)
     2. Fetch earnings calendar for date range
-    3. Filter tickers already cached (< 3 hours old)
-    4. Spawn N SentimentFetchAgents in parallel
-    5. Cache all results
+    3. Bulk-check the sentiment cache (< 3 hours old)
+    4. Fetch the rest in parallel within the rate limit and dollar budget
+       (common.sentiment_prefetch), caching results in one write
     6. Return summary (tickers cached, API calls made)
 
     Example:
@@ -42,6 +56,7 @@ class PrimeOrchestrator(BaseOrchestrator):
         """Initialize PrimeOrchestrator."""
         super().__init__(config)
         self.timeout = self.config.get('timeout', 60)
+        self.budget_dollars = self.config.get('budget_dollars', PRIME_BUDGET_DOLLARS)
 
     async def orchestrate(
         self,
@@ -94,27 +109,30 @@ class PrimeOrchestrator(BaseOrchestrator):
 
         logger.info(f"Found {len(earnings)} earnings")
 
-        # Step 3: Filter already cached
+        # Step 3-4: Bulk cache check, then budgeted parallel fetch
         logger.info("[3/5] Checking cache status...")
         sentiment_agent = SentimentFetchAgent()
-        to_fetch = []
-        already_cached = []
-
-        for earning in earnings:
-            ticker = earning.get('ticker')
-            earnings_date = earning.get('date')
+        candidates = [
+            PrefetchCandidate(earning['ticker'], earning['date'])
+            for earning in earnings
+            if earning.get('ticker') and earning.get('date')
+        ]
 
-            if ticker and earnings_date:
-                cached = sentiment_agent.get_cached_sentiment(ticker, earnings_date)
-                if cached:
-                    already_cached.append(ticker)
-                else:
-                    to_fetch.append((ticker, earnings_date))
+        logger.info(f"[4/5] Fetching uncached sentiment (budget ${self.budget_dollars:.2f})...")
+        prefetch = await self._prefetch_sentiment(sentiment_agent, candidates)
 
+        already_cached = [ticker for ticker, _ in prefetch.cached]
         logger.info(f"Already cached: {len(already_cached)} tickers")
-        logger.info(f"Need to fetch: {len(to_fetch)} tickers")
+        logger.info(f"Successful: {len(prefetch.fetched)}")
+        if prefetch.failed:
+            logger.warning(f"Failed: {len(prefetch.failed)}")
+            # Log first few failures for debugging
+            for i, ((ticker, _), error) in enumerate(list(prefetch.failed.items())[:3]):
+                logger.warning(f"  [{i+1}] {ticker}: {error}")
+        if prefetch.skipped:
+            logger.warning(f"Skipped (budget or timeout): {len(prefetch.skipped)}")
 
-        if not to_fetch:
+        if not prefetch.calls and not prefetch.skipped:
             logger.info(f"All {len(already_cached)} tickers already cached")
             return {
                 'success': True,
@@ -124,79 +142,49 @@ class PrimeOrchestrator(BaseOrchestrator):
                 'message': f'All {len(already_cached)} tickers already cached'
             }
 
-        # Step 4: Parallel sentiment fetching
-        logger.info(f"[4/5] Fetching sentiment for {len(to_fetch)} tickers in parallel...")
-        results = await self._parallel_sentiment_fetch(to_fetch)
-
-        # Count successes
-        successful = self.filter_successful_results(results)
-        failed_results = [r for r in results if not r.get('success', False)]
-        failed = len(failed_results)
-
-        logger.info(f"Successful: {len(successful)}")
-        if failed > 0:
-            logger.warning(f"Failed: {failed}")
-            # Log first few failures for debugging
-            for i, result in enumerate(failed_results[:3]):
-                ticker = result.get('ticker', 'unknown')
-                error = result.get('error', 'unknown error')
-                logger.warning(f"  [{i+1}] {ticker}: {error}")
-
         # Step 5: Summary
         logger.info("[5/5] Caching complete")
 
         return {
             'success': True,
-            'tickers_cached': len(already_cached) + len(successful),
-            'api_calls_made': len(to_fetch),
+            'tickers_cached': len(already_cached) + len(prefetch.fetched),
+            'api_calls_made': prefetch.calls,
             'already_cached_count': len(already_cached),
-            'newly_cached_count': len(successful),
-            'failed_count': failed,
+            'newly_cached_count': len(prefetch.fetched),
+            'failed_count': len(prefetch.failed),
+            'skipped_count': len(prefetch.skipped),
+            'spent_dollars': round(prefetch.spent_dollars, 4),
             'summary': self.get_orchestration_summary()
         }
 
-    async def _parallel_sentiment_fetch(
+    async def _prefetch_sentiment(
         self,
-        tickers_to_fetch: List[tuple]
-    ) -> List[Dict[str, Any]]:
+        sentiment_agent: SentimentFetchAgent,
+        candidates: List[PrefetchCandidate]
+    ) -> PrefetchResult:
         """
-        Fetch sentiment for all tickers with rate limiting.
+        Prime 4.0's sentiment cache through the shared prefetcher.
 
-        Rate limit: Max 2 concurrent requests to avoid API throttling (429 errors).
+        Rate limit: Max 2 concurrent requests, starts spaced 0.5s apart, to
+        avoid API throttling (429 errors).
         """
-        # Create sentiment fetch agents
-        sentiment_agent = SentimentFetchAgent()
-
-        # Semaphore to limit concurrent requests (prevent 429 rate limit errors)
-        semaphore = asyncio.Semaphore(2)
-
-        async def fetch_with_rate_limit(ticker, earnings_date):
-            """Fetch with semaphore to control concurrency."""
-            async with semaphore:
-                # Small delay to spread requests over time
-                await asyncio.sleep(0.5)
-                # Call async fetch_sentiment directly
-                return await sentiment_agent.fetch_sentiment(ticker, earnings_date)
-
-        # Build fetch tasks with rate limiting
-        tasks = []
-        for ticker, earnings_date in tickers_to_fetch:
-            task = asyncio.create_task(
-                fetch_with_rate_limit(ticker, earnings_date)
-            )
-            tasks.append(task)
-
-        # Wait for all with timeout
-        if tasks:
-            try:
-                results = await self.gather_with_timeout(tasks, timeout=self.timeout)
-                return results
-            except Exception as e:
-                logger.error(f"Error during parallel fetch: {e}")
-                # Return empty list on catastrophic failure
-                return []
-
-        return []
+        perplexity = sentiment_agent.perplexity
+
+        async def fetch(ticker: str, earnings_date: str) -> Dict[str, Any]:
+            if perplexity is None:
+                return {'error': 'Perplexity client not initialized (check PERPLEXITY_API_KEY)'}
+            return await perplexity.get_sentiment(ticker, earnings_date)
+
+        cache = sentiment_agent.cache
+        prefetcher = SentimentPrefetcher(
+            fetch,
+            [SentimentStore("4.0", cache.get_sentiments, cache.save_sentiments)],
+            budget_dollars=self.budget_dollars,
+            estimated_cost=perplexity.estimated_call_cost() if perplexity else 0.0,
+            max_concurrent=PRIME_CONCURRENCY,
+            min_interval_seconds=PRIME_MIN_INTERVAL_SECONDS,
+        )
+        return await prefetcher.prefetch(candidates, timeout=self.timeout)
 
     def format_results(self, result: Dict[str, Any]) -> str:
         """Format orchestration results as summary."""
@@ -208,6 +196,7 @@ class PrimeOrchestrator(BaseOrchestrator):
         already_cached = result.get('already_cached_count', 0)
         newly_cached = result.get('newly_cached_count', 0)
         failed = result.get('failed_count', 0)
+        skipped = result.get('skipped_count', 0)
 
         lines = [
             "=" * 60,
@@ -217,6 +206,7 @@ class PrimeOrchestrator(BaseOrchestrator):
             f"  - Already cached: {already_cached}",
             f"  - Newly cached: {newly_cached}",
             f"  - Failed: {failed}",
+            f"  - Skipped (budget/timeout): {skipped}",
             "",
             f"API calls made: {api_calls}",
             "=" * 60
@@ -0,0 +1,398 @@
+"""Row-level change capture for ivcrush.db.
+
+Cloud Run instances and the local sync tooling used to exchange ivcrush.db
+as a whole file. This module records row-level changes instead, so only the
+rows a job touched need to move:
+
+- install_tracking() adds AFTER INSERT/UPDATE/DELETE triggers to every user
+  table. Each write appends the affected row (or key, for deletes) to the
+  _sync_changelog table.
+- collect_changes() turns pending changelog rows into a changeset dict.
+- apply_changeset() replays a changeset onto another copy of the database
+  with INSERT OR REPLACE / DELETE by row key. Replays are idempotent.
+- restore_pending() replays unpushed changes onto a newer snapshot and keeps
+  them pending, so they are still pushed.
+
+Rows are keyed by PRIMARY KEY, else the first UNIQUE index, else rowid.
+Tables with a surrogate `id INTEGER PRIMARY KEY` and a UNIQUE constraint
+are keyed by the UNIQUE columns, and the id is not replicated: ids are
+assigned per instance and collide when two instances insert at once.
+While a changeset is being applied, _sync_state.applying is set inside the
+same transaction, so the triggers don't re-capture replicated rows.
+
+Everything here is plain sqlite3; transport (GCS, a local directory) is the
+caller's job.
+"""
+
+import gzip
+import json
+import sqlite3
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+CHANGESET_VERSION = 1
+
+CHANGELOG_TABLE = "_sync_changelog"
+STATE_TABLE = "_sync_state"
+TABLES_TABLE = "_sync_tables"
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS {CHANGELOG_TABLE} (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    tbl TEXT NOT NULL,
+    op TEXT NOT NULL,
+    key TEXT NOT NULL,
+    vals TEXT,
+    blobs TEXT
+);
+CREATE TABLE IF NOT EXISTS {STATE_TABLE} (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    epoch TEXT NOT NULL DEFAULT '',
+    head INTEGER NOT NULL DEFAULT 0,
+    applying INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS {TABLES_TABLE} (
+    name TEXT PRIMARY KEY,
+    signature TEXT NOT NULL
+);
+"""
+
+# Upsert / delete operations stored in the changelog
+OP_UPSERT = "U"
+OP_DELETE = "D"
+
+
+def _ident(name: str) -> str:
+    """Quote an SQL identifier."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _literal(value: str) -> str:
+    """Quote an SQL string literal."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _tracked_tables(conn: sqlite3.Connection) -> List[str]:
+    """User tables eligible for tracking (skips internal, virtual and FTS shadow tables)."""
+    rows = conn.execute(
+        "SELECT name, sql FROM sqlite_master WHERE type = 'table' ORDER BY name"
+    ).fetchall()
+    virtual = [name for name, sql in rows if (sql or "").upper().startswith("CREATE VIRTUAL")]
+    tables = []
+    for name, sql in rows:
+        if name.startswith("sqlite_") or name.startswith("_sync_") or name in virtual:
+            continue
+        if any(name.startswith(v + "_") for v in virtual):
+            continue
+        tables.append(name)
+    return tables
+
+
+def _unique_key(conn: sqlite3.Connection, table: str) -> Optional[List[str]]:
+    """Columns of the table's first full (non-partial) UNIQUE index, if any."""
+    for index in conn.execute(f"PRAGMA index_list({_ident(table)})").fetchall():
+        # index_list: seq, name, unique, origin, partial
+        if index[2] and index[3] != "pk" and not index[4]:
+            key = [
+                row[2] for row in
+                conn.execute(f"PRAGMA index_info({_ident(index[1])})").fetchall()
+            ]
+            if key and all(key):
+                return key
+    return None
+
+
+def table_layout(conn: sqlite3.Connection, table: str) -> Tuple[List[str], List[str]]:
+    """
+    Columns and row-key columns for a table.
+
+    A surrogate `id INTEGER PRIMARY KEY` is assigned locally by each
+    instance, so two instances inserting at once both create the same id
+    for different rows. When such a table also has a UNIQUE constraint
+    (job_status, historical_moves, sentiment_cache, vrp_cache), rows are
+    keyed by that natural key instead and the id column is left out of
+    the replicated columns; each copy keeps its own ids.
+
+    Returns:
+        (columns, key) where key is the natural UNIQUE key for surrogate-id
+        tables, else the PRIMARY KEY columns, else the first UNIQUE index's
+        columns, else ["rowid"].
+    """
+    info = conn.execute(f"PRAGMA table_info({_ident(table)})").fetchall()
+    columns = [row[1] for row in info]
+    pk = [row for row in sorted((r for r in info if r[5] > 0), key=lambda r: r[5])]
+
+    # table_info: cid, name, type, notnull, dflt_value, pk
+    surrogate = len(pk) == 1 and pk[0][2].upper() == "INTEGER"
+    if pk and not surrogate:
+        return columns, [row[1] for row in pk]
+
+    unique = _unique_key(conn, table)
+    if unique:
+        if surrogate:
+            columns = [c for c in columns if c != pk[0][1]]
+        return columns, unique
+    if pk:
+        return columns, [pk[0][1]]
+    return columns, ["rowid"]
+
+
+def _json_array(ref: str, columns: List[str], blob_safe: bool = True) -> str:
+    """json_array() of a row's columns; BLOBs are hex-encoded (JSON can't hold them)."""
+    parts = []
+    for col in columns:
+        expr = f"{ref}{_ident(col)}" if col != "rowid" else f"{ref}rowid"
+        if blob_safe:
+            expr = f"CASE WHEN typeof({expr}) = 'blob' THEN hex({expr}) ELSE {expr} END"
+        parts.append(expr)
+    return "json_array(" + ", ".join(parts) + ")"
+
+
+def _blob_flags(ref: str, columns: List[str]) -> str:
+    return "json_array(" + ", ".join(
+        f"typeof({ref}{_ident(col)}) = 'blob'" for col in columns
+    ) + ")"
+
+
+def _create_triggers(conn: sqlite3.Connection, table: str, columns: List[str], key: List[str]) -> None:
+    tbl = _literal(table)
+    quoted = _ident(table)
+    guard = f"WHEN (SELECT applying FROM {STATE_TABLE} WHERE id = 1) = 0"
+
+    def upsert(ref: str) -> str:
+        return (
+            f"INSERT INTO {CHANGELOG_TABLE} (tbl, op, key, vals, blobs) VALUES ("
+            f"{tbl}, '{OP_UPSERT}', {_json_array(ref, key)}, "
+            f"{_json_array(ref, columns)}, {_blob_flags(ref, columns)});"
+        )
+
+    def delete(ref: str) -> str:
+        return (
+            f"INSERT INTO {CHANGELOG_TABLE} (tbl, op, key) VALUES ("
+            f"{tbl}, '{OP_DELETE}', {_json_array(ref, key)});"
+        )
+
+    for suffix in ("ai", "au", "ad"):
+        conn.execute(f"DROP TRIGGER IF EXISTS {_ident(f'_sync_{table}_{suffix}')}")
+
+    conn.execute(
+        f"CREATE TRIGGER {_ident(f'_sync_{table}_ai')} AFTER INSERT ON {quoted} {guard} "
+        f"BEGIN {upsert('NEW.')} END"
+    )
+    # A key change is a delete of the old row plus an upsert of the new one
+    conn.execute(
+        f"CREATE TRIGGER {_ident(f'_sync_{table}_au')} AFTER UPDATE ON {quoted} {guard} "
+        f"BEGIN "
+        f"INSERT INTO {CHANGELOG_TABLE} (tbl, op, key) SELECT {tbl}, '{OP_DELETE}', "
+        f"{_json_array('OLD.', key)} WHERE {_json_array('OLD.', key)} IS NOT {_json_array('NEW.', key)}; "
+        f"{upsert('NEW.')} END"
+    )
+    conn.execute(
+        f"CREATE TRIGGER {_ident(f'_sync_{table}_ad')} AFTER DELETE ON {quoted} {guard} "
+        f"BEGIN {delete('OLD.')} END"
+    )
+
+
+def install_tracking(conn: sqlite3.Connection) -> List[str]:
+    """
+    Create the changelog tables and (re)create triggers on every user table.
+
+    Idempotent and cheap when nothing changed. Triggers are rebuilt when a
+    table's columns change. Tables that appear after tracking was first
+    installed (created at runtime, e.g. daily_candidates) are seeded into the
+    changelog with all their existing rows, since those rows were written
+    before any trigger existed. A table whose layout changed is re-seeded
+    the same way, replacing its pending changes (recorded with the old
+    layout).
+
+    Args:
+        conn: Connection to the database (committed on return)
+
+    Returns:
+        Names of tables whose triggers were (re)created
+    """
+    conn.executescript(_SCHEMA)
+    conn.execute(f"INSERT OR IGNORE INTO {STATE_TABLE} (id) VALUES (1)")
+    known = dict(conn.execute(f"SELECT name, signature FROM {TABLES_TABLE}").fetchall())
+    first_install = not known
+
+    changed = []
+    for table in _tracked_tables(conn):
+        columns, key = table_layout(conn, table)
+        signature = json.dumps([columns, key])
+        if known.get(table) == signature:
+            continue
+        _create_triggers(conn, table, columns, key)
+        conn.execute(
+            f"INSERT OR REPLACE INTO {TABLES_TABLE} (name, signature) VALUES (?, ?)",
+            (table, signature),
+        )
+        if table in known:
+            # Pending rows were recorded with the old column layout
+            conn.execute(f"DELETE FROM {CHANGELOG_TABLE} WHERE tbl = ?", (table,))
+        if not first_install:
+            conn.execute(
+                f"INSERT INTO {CHANGELOG_TABLE} (tbl, op, key, vals, blobs) "
+                f"SELECT {_literal(table)}, '{OP_UPSERT}', {_json_array('', key)}, "
+                f"{_json_array('', columns)}, {_blob_flags('', columns)} FROM {_ident(table)}"
+            )
+        changed.append(table)
+    conn.commit()
+    return changed
+
+
+def get_state(conn: sqlite3.Connection) -> Optional[Dict[str, Any]]:
+    """Sync state ({epoch, head}) or None if tracking was never installed."""
+    try:
+        row = conn.execute(f"SELECT epoch, head FROM {STATE_TABLE} WHERE id = 1").fetchone()
+    except sqlite3.OperationalError:
+        return None
+    if row is None:
+        return None
+    return {"epoch": row[0], "head": row[1]}
+
+
+def set_state(conn: sqlite3.Connection, epoch: Optional[str] = None, head: Optional[int] = None) -> None:
+    """Update the sync state (caller commits)."""
+    if epoch is not None:
+        conn.execute(f"UPDATE {STATE_TABLE} SET epoch = ? WHERE id = 1", (epoch,))
+    if head is not None:
+        conn.execute(f"UPDATE {STATE_TABLE} SET head = ? WHERE id = 1", (head,))
+
+
+def pending_count(conn: sqlite3.Connection) -> int:
+    """Number of changelog rows not yet pushed."""
+    return conn.execute(f"SELECT COUNT(*) FROM {CHANGELOG_TABLE}").fetchone()[0]
+
+
+def collect_changes(conn: sqlite3.Connection) -> Tuple[Optional[Dict[str, Any]], int]:
+    """
+    Build a changeset from the pending changelog.
+
+    Returns:
+        (changeset, last_seq). changeset is None when nothing is pending.
+        Pass last_seq to clear_changes() once the changeset is stored.
+    """
+    rows = conn.execute(
+        f"SELECT seq, tbl, op, key, vals, blobs FROM {CHANGELOG_TABLE} ORDER BY seq"
+    ).fetchall()
+    if not rows:
+        return None, 0
+
+    tables: Dict[str, Dict[str, List[str]]] = {}
+    changes = []
+    for _seq, tbl, op, key, vals, blobs in rows:
+        if tbl not in tables:
+            columns, key_cols = table_layout(conn, tbl)
+            tables[tbl] = {"columns": columns, "key": key_cols}
+        changes.append([
+            tbl, op, json.loads(key),
+            json.loads(vals) if vals is not None else None,
+            json.loads(blobs) if blobs is not None else None,
+        ])
+
+    changeset = {
+        "version": CHANGESET_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "tables": tables,
+        "changes": changes,
+    }
+    return changeset, rows[-1][0]
+
+
+def clear_changes(conn: sqlite3.Connection, through_seq: int) -> None:
+    """Drop changelog rows up to and including through_seq (caller commits)."""
+    conn.execute(f"DELETE FROM {CHANGELOG_TABLE} WHERE seq <= ?", (through_seq,))
+
+
+def apply_changeset(conn: sqlite3.Connection, changeset: Dict[str, Any]) -> int:
+    """
+    Replay a changeset onto this database without re-capturing it.
+
+    Columns missing locally are ignored; tables missing locally are skipped.
+    Runs inside the caller's transaction (caller commits).
+
+    Returns:
+        Number of changes applied
+    """
+    if changeset.get("version") != CHANGESET_VERSION:
+        raise ValueError(f"Unsupported changeset version: {changeset.get('version')}")
+
+    conn.execute(f"UPDATE {STATE_TABLE} SET applying = 1 WHERE id = 1")
+    try:
+        local_layouts: Dict[str, Optional[List[str]]] = {}
+        applied = 0
+        for tbl, op, key, vals, blobs in changeset["changes"]:
+            layout = changeset["tables"][tbl]
+            if tbl not in local_layouts:
+                exists = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (tbl,)
+                ).fetchone()
+                local_layouts[tbl] = table_layout(conn, tbl)[0] if exists else None
+            local_columns = local_layouts[tbl]
+            if local_columns is None:
+                continue
+
+            key_cols = layout["key"]
+            if op == OP_DELETE:
+                where = " AND ".join(
+                    f"{'rowid' if c == 'rowid' else _ident(c)} IS ?" for c in key_cols
+                )
+                conn.execute(f"DELETE FROM {_ident(tbl)} WHERE {where}", key)
+            else:
+                if blobs:
+                    vals = [
+                        bytes.fromhex(v) if is_blob and v is not None else v
+                        for v, is_blob in zip(vals, blobs)
+                    ]
+                pairs = [
+                    (c, v) for c, v in zip(layout["columns"], vals) if c in local_columns
+                ]
+                if key_cols == ["rowid"]:
+                    pairs.insert(0, ("rowid", key[0]))
+                cols = ", ".join("rowid" if c == "rowid" else _ident(c) for c, _ in pairs)
+                marks = ", ".join("?" for _ in pairs)
+                conn.execute(
+                    f"INSERT OR REPLACE INTO {_ident(tbl)} ({cols}) VALUES ({marks})",
+                    [v for _, v in pairs],
+                )
+            applied += 1
+        return applied
+    finally:
+        conn.execute(f"UPDATE {STATE_TABLE} SET applying = 0 WHERE id = 1")
+
+
+def restore_pending(conn: sqlite3.Connection, changeset: Dict[str, Any]) -> int:
+    """
+    Apply a collected changeset and keep it pending in this database.
+
+    Used when a copy with unpushed changes is replaced by a newer snapshot:
+    the rows land on top of the snapshot and are still pushed afterwards.
+    Runs inside the caller's transaction (caller commits).
+
+    Returns:
+        Number of changes applied
+    """
+    applied = apply_changeset(conn, changeset)
+    conn.executemany(
+        f"INSERT INTO {CHANGELOG_TABLE} (tbl, op, key, vals, blobs) VALUES (?, ?, ?, ?, ?)",
+        [
+            (
+                tbl, op, json.dumps(key),
+                json.dumps(vals) if vals is not None else None,
+                json.dumps(blobs) if blobs is not None else None,
+            )
+            for tbl, op, key, vals, blobs in changeset["changes"]
+        ],
+    )
+    return applied
+
+
+def encode_changeset(changeset: Dict[str, Any]) -> bytes:
+    """Serialize a changeset as gzipped JSON."""
+    return gzip.compress(json.dumps(changeset, separators=(",", ":")).encode("utf-8"))
+
+
+def decode_changeset(data: bytes) -> Dict[str, Any]:
+    """Inverse of encode_changeset()."""
+    return json.loads(gzip.decompress(data).decode("utf-8"))
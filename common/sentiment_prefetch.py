@@ -0,0 +1,271 @@
+"""Budget-aware sentiment prefetch shared by 4.0, 5.0 and 6.0.
+
+Sentiment priming used to happen separately in 5.0's sentiment-scan job and
+6.0's PrimeOrchestrator (which backs /prime and 4.0's cache), each checking
+only its own cache. SentimentPrefetcher does it once for any set of caches:
+
+1. Candidates are deduplicated by (ticker, earnings_date) and ranked by VRP.
+2. Every cache is checked in bulk. A hit in one cache is copied into the
+   caches that miss it, for free.
+3. The remaining tickers are fetched concurrently. At most max_concurrent
+   calls are in flight, and call starts are spaced min_interval_seconds
+   apart. Each call reserves its estimated cost against budget_dollars
+   before it starts, so the highest-VRP tickers get the money first.
+4. The results are written back to every cache, in one bulk write per cache.
+
+Caches are plugged in as SentimentStore (bulk get/save callables). Sentiment
+dicts use 5.0's PerplexityClient.get_sentiment shape: direction, score,
+tailwinds, headwinds (and optionally raw, api_cost). Plain asyncio; cache
+I/O runs through run_sync (asyncio.to_thread unless the caller has its own
+DB executor).
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (TICKER, YYYY-MM-DD earnings date)
+SentimentKey = Tuple[str, str]
+
+DEFAULT_MAX_CONCURRENT = 3
+DEFAULT_MIN_INTERVAL_SECONDS = 0.0
+
+
+@dataclass
+class PrefetchCandidate:
+    """A ticker worth priming; higher vrp_ratio is fetched first."""
+    ticker: str
+    earnings_date: str
+    vrp_ratio: float = 0.0
+
+    @property
+    def key(self) -> SentimentKey:
+        return (self.ticker.upper(), self.earnings_date)
+
+
+@dataclass
+class SentimentStore:
+    """
+    One sentiment cache.
+
+    get_many(keys) returns {key: sentiment} for unexpired entries;
+    save_many({key: sentiment}) writes entries and returns the count saved.
+    Both are synchronous and are called through the prefetcher's run_sync.
+    """
+    name: str
+    get_many: Callable[[List[SentimentKey]], Dict[SentimentKey, Dict[str, Any]]]
+    save_many: Callable[[Dict[SentimentKey, Dict[str, Any]]], int]
+
+
+@dataclass
+class PrefetchResult:
+    """Outcome of one prefetch run."""
+    cached: List[SentimentKey] = field(default_factory=list)
+    fetched: Dict[SentimentKey, Dict[str, Any]] = field(default_factory=dict)
+    failed: Dict[SentimentKey, str] = field(default_factory=dict)
+    skipped: List[SentimentKey] = field(default_factory=list)  # budget, call limit or timeout
+    backfilled: Dict[str, int] = field(default_factory=dict)   # store name -> hits copied in
+    saved: Dict[str, int] = field(default_factory=dict)        # store name -> fetched written
+    calls: int = 0
+    spent_dollars: float = 0.0
+
+
+def is_usable(sentiment: Optional[Dict[str, Any]]) -> bool:
+    """True for a successful sentiment result (has a score, no error)."""
+    return bool(sentiment) and not sentiment.get("error") and isinstance(
+        sentiment.get("score"), (int, float)
+    )
+
+
+class SentimentPrefetcher:
+    """
+    Prime sentiment for ranked candidates across several caches.
+
+    Example:
+        prefetcher = SentimentPrefetcher(
+            perplexity.get_sentiment, [store],
+            budget_dollars=0.05, estimated_cost=0.001,
+        )
+        result = await prefetcher.prefetch(candidates)
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str, str], Awaitable[Dict[str, Any]]],
+        stores: List[SentimentStore],
+        budget_dollars: float,
+        estimated_cost: float,
+        max_calls: Optional[int] = None,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+        min_interval_seconds: float = DEFAULT_MIN_INTERVAL_SECONDS,
+        run_sync: Optional[Callable[..., Awaitable[Any]]] = None,
+    ):
+        """
+        Args:
+            fetch: async (ticker, earnings_date) -> sentiment dict
+            stores: Caches to check and write back to
+            budget_dollars: Spend limit for this run
+            estimated_cost: Dollars reserved per call (settled to the
+                result's api_cost when it reports one)
+            max_calls: Optional cap on calls per run
+            max_concurrent: Calls in flight at once
+            min_interval_seconds: Minimum spacing between call starts
+            run_sync: async (fn, *args) runner for store I/O
+        """
+        self.fetch = fetch
+        self.stores = stores
+        self.budget_dollars = budget_dollars
+        self.estimated_cost = estimated_cost
+        self.max_calls = max_calls
+        self.max_concurrent = max(1, max_concurrent)
+        self.min_interval_seconds = min_interval_seconds
+        self.run_sync = run_sync or asyncio.to_thread
+
+    async def prefetch(
+        self,
+        candidates: List[PrefetchCandidate],
+        timeout: Optional[float] = None,
+    ) -> PrefetchResult:
+        """
+        Prime sentiment for candidates (any order; ranked by vrp_ratio here).
+
+        Args:
+            candidates: Tickers to prime
+            timeout: Seconds to wait for fetches; unfinished ones are
+                cancelled and reported as skipped
+
+        Returns:
+            PrefetchResult
+        """
+        result = PrefetchResult()
+        ranked: Dict[SentimentKey, PrefetchCandidate] = {}
+        for c in sorted(candidates, key=lambda c: c.vrp_ratio, reverse=True):
+            ranked.setdefault(c.key, c)
+        keys = list(ranked)
+        if not keys:
+            return result
+
+        hits = await self._check_stores(keys, result)
+        result.cached = [k for k in keys if k in hits]
+        to_fetch = [k for k in keys if k not in hits]
+
+        if to_fetch:
+            await self._fetch_all(to_fetch, result, timeout)
+
+        if result.fetched:
+            for store in self.stores:
+                try:
+                    result.saved[store.name] = await self.run_sync(store.save_many, dict(result.fetched))
+                except Exception as e:
+                    logger.warning(f"Sentiment prefetch: saving to {store.name} failed: {e}")
+                    result.saved[store.name] = 0
+
+        logger.info(
+            f"Sentiment prefetch: {len(result.cached)} cached, {len(result.fetched)} fetched, "
+            f"{len(result.failed)} failed, {len(result.skipped)} skipped, "
+            f"${result.spent_dollars:.4f} of ${self.budget_dollars:.4f}"
+        )
+        return result
+
+    async def _check_stores(
+        self, keys: List[SentimentKey], result: PrefetchResult
+    ) -> Dict[SentimentKey, Dict[str, Any]]:
+        """Bulk-check every store; copy hits into the stores that miss them."""
+        async def lookup(store: SentimentStore) -> Dict[SentimentKey, Dict[str, Any]]:
+            try:
+                return await self.run_sync(store.get_many, keys)
+            except Exception as e:
+                # An unreadable cache only costs a refetch
+                logger.warning(f"Sentiment prefetch: reading {store.name} failed: {e}")
+                return {}
+
+        per_store = await asyncio.gather(*(lookup(store) for store in self.stores))
+
+        # Error or empty entries are misses: they are refetched, not reused
+        hits: Dict[SentimentKey, Dict[str, Any]] = {}
+        for found in per_store:
+            for key, sentiment in found.items():
+                if is_usable(sentiment):
+                    hits.setdefault(key, sentiment)
+
+        for store, found in zip(self.stores, per_store):
+            missing = {
+                key: sentiment for key, sentiment in hits.items()
+                if not is_usable(found.get(key))
+            }
+            if not missing:
+                continue
+            try:
+                result.backfilled[store.name] = await self.run_sync(store.save_many, missing)
+            except Exception as e:
+                logger.warning(f"Sentiment prefetch: backfilling {store.name} failed: {e}")
+        return hits
+
+    async def _fetch_all(
+        self,
+        keys: List[SentimentKey],
+        result: PrefetchResult,
+        timeout: Optional[float],
+    ) -> None:
+        """Fetch keys in rank order within the concurrency, spacing and budget limits."""
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+        budget_lock = asyncio.Lock()
+        reserved = 0.0
+        next_start = time.monotonic()
+
+        async def reserve() -> bool:
+            nonlocal reserved, next_start
+            async with budget_lock:
+                if self.max_calls is not None and result.calls >= self.max_calls:
+                    return False
+                if result.spent_dollars + reserved + self.estimated_cost > self.budget_dollars + 1e-9:
+                    return False
+                reserved += self.estimated_cost
+                result.calls += 1
+                wait = next_start - time.monotonic()
+                next_start = max(next_start, time.monotonic()) + self.min_interval_seconds
+            if wait > 0:
+                await asyncio.sleep(wait)
+            return True
+
+        async def settle(cost: float) -> None:
+            nonlocal reserved
+            async with budget_lock:
+                reserved -= self.estimated_cost
+                result.spent_dollars += cost
+
+        async def fetch_one(key: SentimentKey) -> None:
+            # Semaphore waiters are served FIFO, so budget goes in rank order
+            async with semaphore:
+                if not await reserve():
+                    result.skipped.append(key)
+                    return
+                cost = self.estimated_cost
+                try:
+                    sentiment = await self.fetch(*key)
+                    if isinstance(sentiment, dict) and isinstance(sentiment.get("api_cost"), (int, float)):
+                        cost = sentiment["api_cost"]
+                    if is_usable(sentiment):
+                        result.fetched[key] = sentiment
+                    else:
+                        result.failed[key] = (sentiment or {}).get("error") or "empty response"
+                except Exception as e:
+                    result.failed[key] = f"{type(e).__name__}: {e}"
+                finally:
+                    await settle(cost)
+
+        tasks = {asyncio.ensure_future(fetch_one(key)): key for key in keys}
+        done, pending = await asyncio.wait(tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+            result.skipped.extend(tasks[task] for task in pending)
+            logger.warning(f"Sentiment prefetch: {len(pending)} fetches cut off by the {timeout}s timeout")
+        for task in done:
+            if not task.cancelled() and task.exception() is not None:
+                result.failed[tasks[task]] = str(task.exception())
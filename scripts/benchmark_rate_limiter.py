@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Benchmark the 5.0 API rate limiter under a 10k requests/second burst.
+
+Replays a simulated burst through the sliding-window counter limiter
+(src/api/state.InMemoryRateLimiter) and through the previous design
+(a deque of timestamps per IP behind one asyncio.Lock, kept here as
+DequeRateLimiter). By default the burst is 10,000 requests per simulated
+second for 10 seconds. Requests come from a mix of a few heavy IPs and a
+long tail of one-off IPs. Requests are issued as concurrent coroutines,
+100 at a time, the way the middleware sees them, and the clock advances
+1/rate seconds per request.
+
+Reports per-check cost, the request rate one event loop can sustain, keys
+tracked, and memory held by the limiter.
+
+Usage:
+    python scripts/benchmark_rate_limiter.py
+    python scripts/benchmark_rate_limiter.py --rate 10000 --seconds 30 --unique-ips 50000
+"""
+
+import argparse
+import asyncio
+import collections
+import random
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "5.0"))
+
+from src.api.state import InMemoryRateLimiter  # noqa: E402
+
+CONCURRENCY = 100
+
+
+class SimulatedClock:
+    """Monotonic clock advanced by the benchmark, not by wall time."""
+
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class DequeRateLimiter:
+    """The previous limiter: timestamps per IP, one global lock, no key bound."""
+
+    def __init__(self, max_requests: int, window_seconds: int, clock):
+        self.max_requests = max_requests
+        self.window_seconds = window_seconds
+        self._clock = clock
+        self._requests: Dict[str, collections.deque] = {}
+        self._lock = asyncio.Lock()
+
+    async def is_allowed(self, client_ip: str) -> bool:
+        now = self._clock()
+        cutoff = now - self.window_seconds
+        async with self._lock:
+            dq = self._requests.setdefault(client_ip, collections.deque())
+            while dq and dq[0] < cutoff:
+                dq.popleft()
+            if len(dq) >= self.max_requests:
+                return False
+            dq.append(now)
+            return True
+
+    def stats(self) -> Dict[str, int]:
+        return {"keys": len(self._requests)}
+
+
+@dataclass
+class BenchmarkResult:
+    """Container for benchmark results."""
+    name: str
+    requests: int
+    allowed: int
+    elapsed_s: float
+    keys: int
+    memory_kb: float
+
+    def __str__(self):
+        per_check_us = self.elapsed_s / self.requests * 1e6
+        return (
+            f"{self.name:<16} {per_check_us:7.2f}us/check  "
+            f"{self.requests / self.elapsed_s:>10,.0f} req/s sustained  "
+            f"allowed={self.allowed:<7} keys={self.keys:<7} memory={self.memory_kb:9.1f}KB"
+        )
+
+
+def make_traffic(total: int, unique_ips: int, seed: int) -> List[str]:
+    """Half the requests from 20 heavy IPs, the rest spread over unique_ips."""
+    rng = random.Random(seed)
+    heavy = [f"10.0.0.{i}" for i in range(20)]
+    return [
+        rng.choice(heavy) if rng.random() < 0.5 else f"ip-{rng.randrange(unique_ips)}"
+        for _ in range(total)
+    ]
+
+
+async def replay(limiter, clock: SimulatedClock, traffic: List[str], rate: float) -> int:
+    step = 1.0 / rate
+    allowed = 0
+
+    async def one(ip: str) -> bool:
+        return await limiter.is_allowed(ip)
+
+    for start in range(0, len(traffic), CONCURRENCY):
+        batch = traffic[start:start + CONCURRENCY]
+        clock.now += step * len(batch)
+        allowed += sum(await asyncio.gather(*(one(ip) for ip in batch)))
+    return allowed
+
+
+def run(name: str, factory, traffic: List[str], rate: float) -> BenchmarkResult:
+    # Timed pass
+    clock = SimulatedClock()
+    limiter = factory(clock)
+    start = time.perf_counter()
+    allowed = asyncio.run(replay(limiter, clock, traffic, rate))
+    elapsed = time.perf_counter() - start
+
+    # Memory pass (tracemalloc slows the replay, so it is not timed)
+    clock = SimulatedClock()
+    tracemalloc.start()
+    limiter = factory(clock)
+    asyncio.run(replay(limiter, clock, traffic, rate))
+    memory, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return BenchmarkResult(name, len(traffic), allowed, elapsed, limiter.stats()["keys"], memory / 1024)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--rate", type=float, default=10_000, help="Simulated requests per second")
+    parser.add_argument("--seconds", type=float, default=10, help="Simulated burst length")
+    parser.add_argument("--unique-ips", type=int, default=20_000, help="Size of the one-off IP pool")
+    parser.add_argument("--max-keys", type=int, default=10_000, help="Key bound for the new limiter")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    traffic = make_traffic(int(args.rate * args.seconds), args.unique_ips, args.seed)
+    print(f"{len(traffic):,} requests at {args.rate:,.0f}/s simulated, 60 per minute per IP\n")
+
+    results = [
+        run("deque + lock", lambda clock: DequeRateLimiter(60, 60, clock), traffic, args.rate),
+        run("sliding counter", lambda clock: InMemoryRateLimiter(60, 60, args.max_keys, clock), traffic, args.rate),
+    ]
+    for result in results:
+        print(result)
+
+
+if __name__ == "__main__":
+    main()
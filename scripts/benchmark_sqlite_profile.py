@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Benchmark the shared SQLite profile (common/db.py) against sqlite3 defaults.
+
+Runs the hot historical_moves reads (per-ticker lookup and multi-ticker batch)
+plus a small write burst against a copy of the database, once with
+BASELINE_PROFILE (plain sqlite3.connect settings) and once with
+DEFAULT_PROFILE, then prints latency per operation.
+
+Usage:
+    python scripts/benchmark_sqlite_profile.py
+    python scripts/benchmark_sqlite_profile.py --db 2.0/data/ivcrush.db --iterations 200
+"""
+
+import argparse
+import random
+import shutil
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from common.db import BASELINE_PROFILE, DEFAULT_PROFILE, SQLiteProfile, connect  # noqa: E402
+
+DEFAULT_DB = Path(__file__).parent.parent / "2.0" / "data" / "ivcrush.db"
+
+MOVES_SQL = """
+    SELECT earnings_date, intraday_move_pct, gap_move_pct, close_move_pct
+    FROM historical_moves
+    WHERE ticker = ?
+    ORDER BY earnings_date DESC
+    LIMIT 12
+"""
+
+
+@dataclass
+class BenchmarkResult:
+    """Container for benchmark results."""
+    name: str
+    iterations: int
+    mean_ms: float
+    p95_ms: float
+    min_ms: float
+    max_ms: float
+
+    def __str__(self):
+        return (
+            f"{self.name:<28} {self.mean_ms:8.3f}ms  p95={self.p95_ms:8.3f}ms  "
+            f"(min={self.min_ms:.3f}, max={self.max_ms:.3f})"
+        )
+
+
+def time_operation(name: str, func: Callable[[], None], iterations: int) -> BenchmarkResult:
+    """Time an operation over multiple iterations."""
+    times = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+
+    times.sort()
+    return BenchmarkResult(
+        name=name,
+        iterations=iterations,
+        mean_ms=statistics.mean(times),
+        p95_ms=times[int(len(times) * 0.95) - 1] if len(times) >= 20 else times[-1],
+        min_ms=times[0],
+        max_ms=times[-1],
+    )
+
+
+def seed_synthetic(db_path: Path, tickers: int = 500, quarters: int = 24) -> None:
+    """Create a synthetic historical_moves table when no real DB is available."""
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("""
+            CREATE TABLE historical_moves (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                ticker TEXT NOT NULL,
+                earnings_date DATE NOT NULL,
+                prev_close REAL NOT NULL,
+                earnings_close REAL NOT NULL,
+                intraday_move_pct REAL NOT NULL,
+                gap_move_pct REAL NOT NULL,
+                close_move_pct REAL NOT NULL,
+                UNIQUE(ticker, earnings_date)
+            )
+        """)
+        conn.execute("""
+            CREATE INDEX idx_moves_ticker_date_cover
+            ON historical_moves(
+                ticker, earnings_date DESC,
+                intraday_move_pct, gap_move_pct, close_move_pct,
+                prev_close, earnings_close
+            )
+        """)
+        rng = random.Random(42)
+        rows = [
+            (
+                f"T{t:04d}", f"{2019 + q // 4}-{(q % 4) * 3 + 1:02d}-15",
+                100.0, 100.0 + rng.uniform(-10, 10),
+                rng.uniform(0, 12), rng.uniform(-8, 8), rng.uniform(-10, 10),
+            )
+            for t in range(tickers)
+            for q in range(quarters)
+        ]
+        conn.executemany(
+            "INSERT INTO historical_moves (ticker, earnings_date, prev_close, earnings_close, "
+            "intraday_move_pct, gap_move_pct, close_move_pct) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        conn.execute("ANALYZE")
+
+
+def run_profile(db_path: Path, profile: SQLiteProfile, tickers: List[str], iterations: int) -> List[BenchmarkResult]:
+    """Benchmark hot queries on a fresh connection using the given profile."""
+    conn = connect(db_path, profile)
+    rng = random.Random(7)
+    results = []
+
+    try:
+        results.append(time_operation(
+            "moves by ticker",
+            lambda: conn.execute(MOVES_SQL, (rng.choice(tickers),)).fetchall(),
+            iterations,
+        ))
+
+        def batch():
+            sample = rng.sample(tickers, min(50, len(tickers)))
+            for ticker in sample:
+                conn.execute(MOVES_SQL, (ticker,)).fetchall()
+
+        results.append(time_operation("moves batch (50 tickers)", batch, max(iterations // 10, 5)))
+
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS bench_writes_main (k TEXT PRIMARY KEY, v REAL)"
+        )
+        counter = iter(range(10**9))
+
+        def write():
+            conn.execute(
+                "INSERT INTO bench_writes_main (k, v) VALUES (?, ?)",
+                (f"k{next(counter)}", rng.random()),
+            )
+            conn.commit()
+
+        results.append(time_operation("single-row commit", write, max(iterations // 4, 10)))
+
+        results.append(time_operation(
+            "grouped aggregate",
+            lambda: conn.execute(
+                "SELECT ticker, AVG(ABS(close_move_pct)) FROM historical_moves "
+                "GROUP BY ticker ORDER BY 2 DESC LIMIT 20"
+            ).fetchall(),
+            max(iterations // 10, 5),
+        ))
+        conn.execute("DROP TABLE IF EXISTS bench_writes_main")
+        conn.commit()
+    finally:
+        conn.close()
+
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--db", type=Path, default=DEFAULT_DB, help="Source database (copied, never modified)")
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        work_db = Path(tmp) / "bench.db"
+        if args.db.exists():
+            shutil.copy(args.db, work_db)
+            print(f"Source: {args.db}")
+        else:
+            seed_synthetic(work_db)
+            print(f"Source: synthetic data ({args.db} not found)")
+
+        with sqlite3.connect(work_db) as conn:
+            tickers = [r[0] for r in conn.execute("SELECT DISTINCT ticker FROM historical_moves")]
+        if not tickers:
+            print("historical_moves is empty - nothing to benchmark")
+            return 1
+
+        summary = {}
+        for label, profile in (("baseline", BASELINE_PROFILE), ("tuned", DEFAULT_PROFILE)):
+            print("\n" + "=" * 60)
+            print(f"{label.upper()} PROFILE")
+            print("=" * 60)
+            for pragma in profile.pragmas():
+                print(f"  {pragma}")
+            results = run_profile(work_db, profile, tickers, args.iterations)
+            for result in results:
+                print(f"  {result}")
+            summary[label] = {r.name: r.mean_ms for r in results}
+
+        print("\n" + "=" * 60)
+        print("SPEEDUP (baseline mean / tuned mean)")
+        print("=" * 60)
+        for name, base_ms in summary["baseline"].items():
+            tuned_ms = summary["tuned"][name]
+            print(f"  {name:<28} {base_ms / tuned_ms if tuned_ms else float('inf'):6.2f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
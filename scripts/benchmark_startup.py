@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark 5.0 cold start: import time by module and time to first response.
+
+Each run starts a fresh interpreter (like a Cloud Run cold start) and:
+
+1. Imports src.main under `python -X importtime`, then reports the slowest
+   modules by cumulative import time and totals per top-level package.
+2. Times app startup end to end: import, lifespan startup, and the first
+   GET / served through a TestClient.
+
+Runs in development mode (no GCS pull), so it measures the work the
+container does before it can answer its startup probe.
+
+Usage:
+    python scripts/benchmark_startup.py
+    python scripts/benchmark_startup.py --runs 5 --top 30
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+APP_DIR = Path(__file__).parent.parent / "5.0"
+
+STARTUP_PROBE = """
+import json, time
+t0 = time.perf_counter()
+from src.main import app
+t1 = time.perf_counter()
+from fastapi.testclient import TestClient
+with TestClient(app) as client:
+    t2 = time.perf_counter()
+    client.get("/")
+    t3 = time.perf_counter()
+print(json.dumps({"import_ms": (t1 - t0) * 1000, "lifespan_ms": (t2 - t1) * 1000,
+                  "first_request_ms": (t3 - t2) * 1000, "total_ms": (t3 - t0) * 1000}))
+"""
+
+
+def _env() -> Dict[str, str]:
+    env = dict(os.environ)
+    env.setdefault("ENV", "development")
+    env.setdefault("SECRETS", "{}")  # Don't wait on Secret Manager
+    env["PYTHONDONTWRITEBYTECODE"] = "1"
+    return env
+
+
+def import_profile() -> List[Tuple[str, int, int]]:
+    """(module, self_us, cumulative_us) for one fresh `import src.main`."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import src.main"],
+        cwd=APP_DIR, env=_env(), capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def startup_timings() -> Dict[str, float]:
+    proc = subprocess.run(
+        [sys.executable, "-c", STARTUP_PROBE],
+        cwd=APP_DIR, env=_env(), capture_output=True, text=True, check=True,
+    )
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--runs", type=int, default=3, help="Fresh interpreters per measurement")
+    parser.add_argument("--top", type=int, default=20, help="Modules to list")
+    args = parser.parse_args()
+
+    # Median per module across runs (the first run also warms the OS file cache)
+    cumulative: Dict[str, List[int]] = defaultdict(list)
+    packages: Dict[str, List[int]] = defaultdict(list)
+    for _ in range(args.runs):
+        per_package: Dict[str, int] = defaultdict(int)
+        for name, self_us, cum_us in import_profile():
+            cumulative[name].append(cum_us)
+            per_package[name.split(".")[0]] += self_us
+        for package, total in per_package.items():
+            packages[package].append(total)
+
+    print(f"Slowest modules (cumulative import time, median of {args.runs} runs)")
+    ranked = sorted(cumulative.items(), key=lambda kv: statistics.median(kv[1]), reverse=True)
+    for name, values in ranked[:args.top]:
+        print(f"  {statistics.median(values) / 1000:9.1f} ms  {name}")
+
+    print("\nImport time by top-level package (self time)")
+    ranked = sorted(packages.items(), key=lambda kv: statistics.median(kv[1]), reverse=True)
+    for package, values in ranked[:args.top]:
+        print(f"  {statistics.median(values) / 1000:9.1f} ms  {package}")
+
+    print("\nStartup to first response")
+    runs = [startup_timings() for _ in range(args.runs)]
+    for key in ("import_ms", "lifespan_ms", "first_request_ms", "total_ms"):
+        print(f"  {key:<18} {statistics.median(r[key] for r in runs):9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
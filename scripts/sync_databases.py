@@ -7,9 +7,14 @@ Bidirectional sync strategy:
 - earnings_calendar: Newest updated_at wins
 - trade_journal: Union (UNIQUE constraint prevents dupes)
 
+The cloud copy is downloaded at one GCS generation and uploaded only if the
+blob is still at that generation, so a concurrent 5.0 compaction is never
+overwritten. The 5.0 changeset manifest is then pointed at the new upload.
+
 Also backs up local DB to Google Drive weekly.
 """
 
+import json
 import os
 import re
 import sys
@@ -19,6 +24,8 @@ import subprocess
 from datetime import datetime
 from pathlib import Path
 import tempfile
+import uuid
+from typing import Optional, Tuple
 
 # Paths
 SCRIPT_DIR = Path(__file__).parent
@@ -26,6 +33,13 @@ PROJECT_ROOT = SCRIPT_DIR.parent
 LOCAL_DB = PROJECT_ROOT / "2.0" / "data" / "ivcrush.db"
 GCS_BUCKET = os.environ.get("GCS_BUCKET", "your-gcs-bucket")
 GCS_BLOB = "ivcrush.db"
+# 5.0 pushes row-level changesets on top of the compacted ivcrush.db snapshot
+GCS_MANIFEST = f"{GCS_BLOB}.manifest.json"
+GCS_CHANGES_PREFIX = f"{GCS_BLOB}.changes/"
+
+sys.path.insert(0, str(PROJECT_ROOT))
+from common import changesets  # noqa: E402
+
 # Google Drive backup path - auto-detect or use environment variable
 def _find_gdrive_backup_dir() -> Path:
     """Find Google Drive backup directory, handling email-suffixed mount points."""
@@ -76,15 +90,25 @@ def run_gsutil(args: list, check: bool = True) -> subprocess.CompletedProcess:
     return subprocess.run(cmd, capture_output=True, text=True, check=check)
 
 
-def download_cloud_db(dest: Path, max_retries: int = 3) -> bool:
+def gcs_generation(name: str) -> Optional[int]:
+    """Live generation of gs://GCS_BUCKET/<name>, or None if it doesn't exist."""
+    result = run_gsutil(["stat", f"gs://{GCS_BUCKET}/{name}"], check=False)
+    match = re.search(r"Generation:\s+(\d+)", result.stdout)
+    return int(match.group(1)) if result.returncode == 0 and match else None
+
+
+def download_cloud_db(dest: Path, max_retries: int = 3) -> Optional[int]:
     """Download cloud DB from GCS with retry logic.
 
+    The copy is pinned to one generation, so the changeset check and the
+    conditional upload refer to exactly the bytes that were downloaded.
+
     Args:
         dest: Destination path for downloaded database
         max_retries: Maximum number of retry attempts (default 3)
 
     Returns:
-        True if download succeeded, False otherwise
+        Generation of the downloaded copy, or None if the download failed
     """
     import time
 
@@ -92,10 +116,17 @@ def download_cloud_db(dest: Path, max_retries: int = 3) -> bool:
 
     for attempt in range(max_retries):
         try:
-            result = run_gsutil(["cp", f"gs://{GCS_BUCKET}/{GCS_BLOB}", str(dest)])
+            generation = gcs_generation(GCS_BLOB)
+            if generation is None:
+                result = subprocess.CompletedProcess([], 1, stderr="Cloud DB not found")
+            else:
+                # Fails if the blob is replaced mid-download; the retry re-stats it
+                result = run_gsutil(
+                    ["cp", f"gs://{GCS_BUCKET}/{GCS_BLOB}#{generation}", str(dest)], check=False
+                )
             if result.returncode == 0:
-                log(f"Downloaded cloud DB ({dest.stat().st_size / 1024 / 1024:.2f} MB)")
-                return True
+                log(f"Downloaded cloud DB ({dest.stat().st_size / 1024 / 1024:.2f} MB, generation {generation})")
+                return generation
 
             error_msg = result.stderr.strip() if result.stderr else "Unknown error"
 
@@ -114,21 +145,128 @@ def download_cloud_db(dest: Path, max_retries: int = 3) -> bool:
             else:
                 log(f"Download error after {max_retries} attempts: {e}", "error")
 
-    return False
+    return None
+
+
+def _gsutil_bytes(uri: str) -> bytes:
+    """Fetch an object's raw bytes (gzip changesets can't go through text mode)."""
+    return subprocess.run(["gsutil", "cat", uri], capture_output=True, check=True).stdout
+
+
+def read_manifest() -> Tuple[Optional[dict], int]:
+    """(manifest, generation) of the 5.0 changeset manifest; (None, 0) if there is none."""
+    generation = gcs_generation(GCS_MANIFEST)
+    if generation is None:
+        return None, 0  # No manifest: the blob is a plain whole-file copy
+    result = run_gsutil(["cat", f"gs://{GCS_BUCKET}/{GCS_MANIFEST}#{generation}"])
+    return json.loads(result.stdout), generation
+
+
+def apply_cloud_changesets(db_path: Path, generation: int, manifest: dict) -> Tuple[int, int]:
+    """Replay changesets pushed by 5.0 since the last compacted snapshot.
+
+    The ivcrush.db blob is only as fresh as the last compaction; recent job
+    writes live in ivcrush.db.changes/. Without this step the merge (and the
+    upload that follows) would miss them.
+
+    Args:
+        db_path: Downloaded copy of the blob
+        generation: Generation of that copy (see download_cloud_db)
+        manifest: Changeset manifest (see read_manifest)
+
+    Returns:
+        (changesets applied, sequence number the copy is current to)
+
+    Raises:
+        RuntimeError: A changeset was folded into a newer snapshot mid-sync
+    """
+    listing = run_gsutil(["ls", f"gs://{GCS_BUCKET}/{GCS_CHANGES_PREFIX}"], check=False)
+    seqs = {}
+    for uri in listing.stdout.split():
+        stem = uri.rsplit("/", 1)[-1].split(".", 1)[0]
+        if stem.isdigit():
+            seqs[int(stem)] = uri
+
+    if generation != manifest["snapshot_generation"]:
+        # Replaced outside the protocol: like a 5.0 pull, adopt it as the new
+        # base and treat every existing changeset as superseded
+        log("Snapshot replaced since last compaction - skipping changesets", "warn")
+        return 0, max([manifest["snapshot_seq"]] + list(seqs))
+
+    head = manifest["snapshot_seq"]
+    conn = sqlite3.connect(str(db_path))
+    try:
+        changesets.install_tracking(conn)
+        for seq in sorted(s for s in seqs if s > head):
+            if seq != head + 1:
+                raise RuntimeError(f"Changeset {head + 1} missing (compacted mid-sync?) - rerun")
+            try:
+                data = _gsutil_bytes(seqs[seq])
+            except subprocess.CalledProcessError as e:
+                raise RuntimeError(f"Changeset {seq} unreadable (compacted mid-sync?) - rerun") from e
+            changesets.apply_changeset(conn, changesets.decode_changeset(data))
+            head = seq
+        conn.commit()
+    finally:
+        conn.close()
+    return head - manifest["snapshot_seq"], head
+
+
+def _upload_if_generation(src: Path, name: str, generation: int) -> subprocess.CompletedProcess:
+    """Upload src to gs://GCS_BUCKET/<name> only if it is still at `generation` (0 = absent)."""
+    return run_gsutil(
+        ["-h", f"x-goog-if-generation-match:{generation}", "cp", str(src), f"gs://{GCS_BUCKET}/{name}"],
+        check=False,
+    )
 
 
-def upload_cloud_db(src: Path) -> bool:
-    """Upload DB to GCS."""
+def upload_cloud_db(src: Path, generation: int) -> Optional[int]:
+    """Upload DB to GCS unless the blob changed since it was downloaded.
+
+    Args:
+        src: Merged copy to upload
+        generation: Generation the copy was downloaded at
+
+    Returns:
+        The new generation, or None if nothing was uploaded
+    """
     try:
-        result = run_gsutil(["cp", str(src), f"gs://{GCS_BUCKET}/{GCS_BLOB}"])
+        result = _upload_if_generation(src, GCS_BLOB, generation)
         if result.returncode == 0:
             log(f"Uploaded to GCS ({src.stat().st_size / 1024 / 1024:.2f} MB)")
-            return True
-        log(f"Failed to upload: {result.stderr}", "error")
-        return False
+            return gcs_generation(GCS_BLOB)
+        if "412" in result.stderr or "Precondition" in result.stderr:
+            log("Cloud DB changed during sync - not uploaded; rerun to merge the newer copy", "error")
+        else:
+            log(f"Failed to upload: {result.stderr}", "error")
+        return None
     except Exception as e:
         log(f"Upload error: {e}", "error")
+        return None
+
+
+def write_manifest(snapshot_generation: int, snapshot_seq: int, if_generation_match: int) -> bool:
+    """Point the changeset manifest at an uploaded snapshot under a fresh epoch.
+
+    5.0 replicas on the old epoch then re-pull the snapshot instead of
+    treating their copy (which lacks the merged local rows) as current.
+    """
+    manifest = {
+        "epoch": uuid.uuid4().hex,
+        "snapshot_generation": snapshot_generation,
+        "snapshot_seq": snapshot_seq,
+    }
+    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as tmp:
+        json.dump(manifest, tmp, sort_keys=True)
+    try:
+        result = _upload_if_generation(Path(tmp.name), GCS_MANIFEST, if_generation_match)
+    finally:
+        os.unlink(tmp.name)
+    if result.returncode != 0:
+        # A 5.0 pull adopted the new blob first; its manifest is equivalent
+        log(f"Manifest not updated: {result.stderr.strip()}", "warn")
         return False
+    return True
 
 
 def sync_historical_moves(local_conn: sqlite3.Connection, cloud_conn: sqlite3.Connection) -> dict:
@@ -544,7 +682,8 @@ def main():
     try:
         # Download cloud DB
         log("Downloading cloud DB from GCS...")
-        if not download_cloud_db(cloud_db_path):
+        generation = download_cloud_db(cloud_db_path)
+        if generation is None:
             # SAFETY: Don't overwrite cloud with local on download failure
             # Cloud may have data we can't download due to transient error
             log("Cannot download cloud DB - aborting to prevent data loss", "error")
@@ -552,6 +691,16 @@ def main():
             log(f"  gsutil rm gs://{GCS_BUCKET}/{GCS_BLOB}", "info")
             sys.exit(1)
 
+        manifest, manifest_gen = read_manifest()
+        if manifest is not None:
+            try:
+                applied, head = apply_cloud_changesets(cloud_db_path, generation, manifest)
+            except RuntimeError as e:
+                log(f"Cannot replay cloud changesets: {e}", "error")
+                sys.exit(1)
+            if applied:
+                log(f"Applied {applied} cloud changesets")
+
         # Open both databases
         local_conn = sqlite3.connect(str(LOCAL_DB))
         cloud_conn = sqlite3.connect(str(cloud_db_path))
@@ -607,7 +756,10 @@ def main():
 
         # Upload synced cloud DB back to GCS
         log("Uploading synced DB to GCS...")
-        if upload_cloud_db(cloud_db_path):
+        new_generation = upload_cloud_db(cloud_db_path, generation)
+        if new_generation is not None:
+            if manifest is not None:
+                write_manifest(new_generation, head, manifest_gen)
             log("Cloud DB updated", "success")
 
         # Backup local DB to Google Drive